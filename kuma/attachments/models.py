@@ -4,7 +4,10 @@ from django.conf import settings
 from django.db import models
 from django.template.loader import select_template
 
-from .utils import attachment_upload_to, full_attachment_url
+from kuma.core.cache import memcache
+
+from .utils import (attachment_metadata_key, attachment_upload_to,
+                    full_attachment_url)
 
 
 class Attachment(models.Model):
@@ -120,6 +123,7 @@ class AttachmentRevision(models.Model):
 
     def save(self, *args, **kwargs):
         super(AttachmentRevision, self).save(*args, **kwargs)
+        memcache.delete(attachment_metadata_key(self.id))
         if self.is_approved and (
                 not self.attachment.current_revision or
                 self.attachment.current_revision.id < self.id):
@@ -131,6 +135,8 @@ class AttachmentRevision(models.Model):
         self.attachment.slug = self.slug
         self.attachment.current_revision = self
         self.attachment.save()
+        # The metadata of the revision includes the attachment title.
+        memcache.delete(attachment_metadata_key(self.id))
 
     def get_previous(self):
         previous_revisions = self.attachment.revisions.filter(
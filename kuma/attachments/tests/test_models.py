@@ -1,11 +1,16 @@
-from nose.tools import ok_
+from nose.tools import eq_, ok_
 
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
 
+from kuma.core.cache import memcache
 from kuma.core.tests import KumaTestCase
-from kuma.users.tests import user
-from ..utils import allow_add_attachment_by
+from kuma.users.tests import UserTestCase, user
+from kuma.wiki.tests import document
+
+from ..models import Attachment, AttachmentRevision
+from ..utils import allow_add_attachment_by, attachments_metadata
 
 
 class AttachmentTests(KumaTestCase):
@@ -70,3 +75,56 @@ class AttachmentTests(KumaTestCase):
         u7.user_permissions.add(p2)
         u7.save()
         ok_(allow_add_attachment_by(u7))
+
+
+class AttachmentMetadataTests(UserTestCase):
+
+    def setUp(self):
+        super(AttachmentMetadataTests, self).setUp()
+        memcache.clear()
+        self.attachment = Attachment.objects.create(title='Test',
+                                                    slug='test')
+        self.revision = self.create_revision('First revision')
+        self.doc = document(html='<img src="/files/%s/test.txt">' %
+                            self.attachment.id, save=True)
+
+    def create_revision(self, title):
+        revision = AttachmentRevision(
+            attachment=self.attachment,
+            mime_type='text/plain',
+            title=title,
+            slug='test',
+            description='A test file',
+            creator=self.user_model.objects.get(username='testuser'),
+            is_approved=True)
+        revision.file.save('test.txt', ContentFile('A test file'),
+                           save=False)
+        revision.save()
+        return revision
+
+    def test_metadata(self):
+        """The metadata should be built with a single query, then cached"""
+        with self.assertNumQueries(2):
+            metadata = attachments_metadata(self.doc.attachments)
+        eq_(1, len(metadata))
+        eq_('First revision', metadata[0]['title'])
+        eq_('testuser', metadata[0]['author'])
+        eq_(len('A test file'), metadata[0]['size'])
+        ok_(metadata[0]['url'].endswith('/files/%s/test.txt' %
+                                        self.attachment.id))
+
+        with self.assertNumQueries(1):
+            eq_(metadata, attachments_metadata(self.doc.attachments))
+
+    def test_new_revision(self):
+        """A new current revision should replace the cached metadata"""
+        attachments_metadata(self.doc.attachments)
+        self.create_revision('Second revision')
+        metadata = attachments_metadata(self.doc.attachments)
+        eq_('Second revision', metadata[0]['title'])
+
+        # The cached metadata of a revision made current again is refreshed.
+        self.revision.title = 'First revision, again'
+        self.revision.make_current()
+        metadata = attachments_metadata(self.doc.attachments)
+        eq_('First revision, again', metadata[0]['title'])
@@ -9,9 +9,13 @@ from django.utils import timezone
 from django.utils.http import http_date
 from django.utils.safestring import mark_safe
 
+from kuma.core.cache import memcache
 from kuma.core.urlresolvers import reverse
 
 
+METADATA_KEY_TMPL = 'kuma:attachments:metadata:%s'
+
+
 def allow_add_attachment_by(user):
     """Returns whether the `user` is allowed to upload attachments.
 
@@ -112,6 +116,65 @@ def attachments_payload(attachments):
     return attachments_list
 
 
+def attachment_metadata_key(revision_id):
+    return METADATA_KEY_TMPL % revision_id
+
+
+def attachments_metadata(attachments):
+    """
+    Given a queryset of Attachments (e.g., from a Document), return the
+    metadata of their current revisions passed to kumascript.
+
+    The metadata is cached by revision, the metadata missing from the cache
+    being looked up with a single query.
+    """
+    revision_ids = list(attachments.exclude(current_revision=None)
+                                   .values_list('current_revision_id',
+                                                flat=True))
+    if not revision_ids:
+        return []
+    cached = memcache.get_many([attachment_metadata_key(revision_id)
+                                for revision_id in revision_ids])
+    metadata = dict((revision_id, cached[attachment_metadata_key(revision_id)])
+                    for revision_id in revision_ids
+                    if attachment_metadata_key(revision_id) in cached)
+
+    missing = [revision_id for revision_id in revision_ids
+               if revision_id not in metadata]
+    if missing:
+        from .models import AttachmentRevision
+        revisions = (AttachmentRevision.objects
+                                       .filter(id__in=missing)
+                                       .select_related('attachment',
+                                                       'creator'))
+        for revision in revisions:
+            attachment = revision.attachment
+            # The attachment's current revision is this one.
+            attachment.current_revision = revision
+            filesize = None
+            try:
+                filesize = revision.file.size
+            except OSError:
+                pass
+            metadata[revision.id] = {
+                'title': attachment.title,
+                'description': revision.description,
+                'filename': revision.filename(),
+                'size': filesize or 0,
+                'author': revision.creator.username,
+                'mime': revision.mime_type,
+                'url': attachment.get_file_url(),
+            }
+            if filesize is not None:
+                # Don't keep the size of a file which couldn't be found.
+                memcache.set(attachment_metadata_key(revision.id),
+                             metadata[revision.id],
+                             timeout=settings.ATTACHMENT_METADATA_TIMEOUT)
+
+    return [metadata[revision_id] for revision_id in revision_ids
+            if revision_id in metadata]
+
+
 def make_test_file(content=None):
     """Create a fake file for testing purposes."""
     if content is None:
@@ -1,8 +1,12 @@
+import threading
+import time
+
 from django.test import TestCase
 
 from nose.tools import eq_
 
-from ..utils import smart_int
+from ..cache import memcache
+from ..utils import single_flight, smart_int
 
 
 class SmartIntTestCase(TestCase):
@@ -22,3 +26,42 @@ class SmartIntTestCase(TestCase):
     def test_wrong_type(self):
         eq_(0, smart_int(None))
         eq_(10, smart_int([], 10))
+
+
+class SingleFlightTests(TestCase):
+    def setUp(self):
+        memcache.clear()
+        self.calls = []
+
+    def call(self, result):
+        self.calls.append(result)
+        time.sleep(0.2)
+        return result
+
+    def test_coalescing(self):
+        """Concurrent calls should share a single call, and its result be
+        cached"""
+        results = []
+
+        def run():
+            results.append(single_flight('test', lambda: self.call('a'),
+                                         5, 60))
+
+        threads = [threading.Thread(target=run) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        eq_(['a'] * 4, results)
+        eq_(['a'], self.calls)
+
+        eq_('a', single_flight('test', lambda: self.call('b'), 5, 60))
+        eq_(['a'], self.calls)
+
+    def test_not_cacheable(self):
+        """Results which aren't cacheable shouldn't be shared"""
+        eq_('a', single_flight('test', lambda: self.call('a'), 5, 60,
+                               cacheable=lambda result: False))
+        eq_('b', single_flight('test', lambda: self.call('b'), 5, 60,
+                               cacheable=lambda result: False))
+        eq_(['a', 'b'], self.calls)
@@ -174,6 +174,47 @@ def memcache_lock(prefix, expires=60 * 60):
     return decorator
 
 
+SINGLE_FLIGHT_KEY_TMPL = 'kuma:single_flight:%s:%s'
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+
+def single_flight(key, func, timeout, cache_timeout, cacheable=None):
+    """
+    Return the result of func, cached in memcache for cache_timeout seconds.
+
+    While func is being called for the same key by another thread or
+    process, wait for up to timeout seconds for its result rather than
+    calling it again. Results for which cacheable returns False aren't
+    cached nor shared with waiting callers, which then call func themselves.
+    """
+    result_key = SINGLE_FLIGHT_KEY_TMPL % ('result', key)
+    lock_key = SINGLE_FLIGHT_KEY_TMPL % ('lock', key)
+    result = memcache.get(result_key)
+    if result is not None:
+        return result
+
+    leader = memcache.add(lock_key, 1, timeout=int(timeout) + 1)
+    if not leader:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+            cached = memcache.get_many([result_key, lock_key])
+            if result_key in cached:
+                return cached[result_key]
+            if lock_key not in cached:
+                # The call in flight failed, or its result isn't cacheable
+                break
+
+    try:
+        result = func()
+        if cacheable is None or cacheable(result):
+            memcache.set(result_key, result, timeout=cache_timeout)
+    finally:
+        if leader:
+            memcache.delete(lock_key)
+    return result
+
+
 def get_object_or_none(klass, *args, **kwargs):
     """
     A tool like Django's get_object_or_404 but returns None in case
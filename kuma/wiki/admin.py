@@ -14,9 +14,11 @@ from kuma.core.urlresolvers import reverse
 
 from .decorators import check_readonly
 from .forms import RevisionAkismetSubmissionAdminForm
-from .models import (Document, DocumentSpamAttempt, DocumentTag, DocumentZone,
-                     EditorToolbar, Revision, RevisionAkismetSubmission,
-                     RevisionIP)
+from .models import (Document, DocumentRenderJob, DocumentRenderJobChunk,
+                     DocumentRenderTiming, DocumentSpamAttempt, DocumentTag,
+                     DocumentZone, EditorToolbar, Revision,
+                     RevisionAkismetSubmission, RevisionIP)
+from .render_timing import PHASES
 
 
 def dump_selected_documents(self, request, queryset):
@@ -321,6 +323,73 @@ class DocumentZoneAdmin(admin.ModelAdmin):
     raw_id_fields = ('document',)
 
 
+class DocumentRenderTimingAdmin(admin.ModelAdmin):
+    """The render timings of the documents, the slowest first"""
+    list_display = ('document', 'median_duration', 'last_duration',
+                    'phase_medians', 'histogram', 'deferred', 'modified')
+    list_filter = ('document__defer_rendering', 'document__locale')
+    list_select_related = ('document',)
+    ordering = ('-median_duration',)
+    raw_id_fields = ('document',)
+    readonly_fields = ('renders', 'median_duration', 'last_duration')
+    search_fields = ('document__slug', 'document__title')
+
+    def phase_medians(self, obj):
+        medians = obj.get_phase_medians()
+        return ', '.join('%s: %.2fs' % (phase, medians[phase])
+                         for phase in PHASES)
+    phase_medians.short_description = 'Median phase durations'
+
+    def histogram(self, obj):
+        return ', '.join('%s: %s' % bucket for bucket in obj.get_histogram()
+                         if bucket[1])
+    histogram.short_description = 'Durations'
+
+    def deferred(self, obj):
+        return obj.document.defer_rendering
+    deferred.boolean = True
+    deferred.admin_order_field = 'document__defer_rendering'
+
+
+def resume_render_jobs(self, request, queryset):
+    from .tasks import run_render_job
+    for job in queryset:
+        job.resume()
+        run_render_job.delay(job.pk)
+    self.message_user(request, "Resumed %s render jobs." % queryset.count())
+resume_render_jobs.short_description = (
+    "Resume selected render jobs, rendering again their running and failed "
+    "chunks")
+
+
+class DocumentRenderJobChunkInline(admin.TabularInline):
+    model = DocumentRenderJobChunk
+    extra = 0
+    can_delete = False
+    fields = ('index', 'status', 'started_at', 'finished_at', 'failures')
+    readonly_fields = fields
+
+
+class DocumentRenderJobAdmin(admin.ModelAdmin):
+    """The render jobs of render_document --all, and their progress"""
+    actions = (resume_render_jobs,)
+    inlines = (DocumentRenderJobChunkInline,)
+    list_display = ('id', 'created', 'finished_at', 'progress', 'failures')
+    ordering = ('-created',)
+    readonly_fields = ('finished_at', 'cache_control', 'base_url', 'force')
+
+    def progress(self, obj):
+        progress = obj.get_progress()
+        return ', '.join('%s: %s' % (label, progress[status])
+                         for status, label
+                         in DocumentRenderJobChunk.STATUS_CHOICES)
+    progress.short_description = 'Chunks'
+
+    def failures(self, obj):
+        return len(obj.get_progress()['failures'])
+    failures.short_description = 'Failed documents'
+
+
 class DocumentSpamAttemptAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'slug', 'document', 'created', 'user']
     list_display_links = ['id', 'title', 'slug']
@@ -400,6 +469,8 @@ class RevisionAkismetSubmissionAdmin(DisabledDeletionMixin, admin.ModelAdmin):
         return AdminFormWithRequest
 
 admin.site.register(Document, DocumentAdmin)
+admin.site.register(DocumentRenderJob, DocumentRenderJobAdmin)
+admin.site.register(DocumentRenderTiming, DocumentRenderTimingAdmin)
 admin.site.register(DocumentSpamAttempt, DocumentSpamAttemptAdmin)
 admin.site.register(DocumentTag, DocumentTagAdmin)
 admin.site.register(DocumentZone, DocumentZoneAdmin)
@@ -11,6 +11,7 @@ from elasticsearch_dsl.connections import connections as es_connections
 from .jobs import (DocumentContributorsJob, DocumentZoneStackJob,
                    DocumentZoneURLRemapsJob)
 from .signals import render_done
+from .slug_index import record_slug_change
 
 
 def invalidate_zone_stack_cache(document, async=False):
@@ -74,6 +75,12 @@ class WikiConfig(AppConfig):
         signals.post_save.connect(self.on_document_save,
                                   sender=Document,
                                   dispatch_uid='wiki.document.post_save')
+        signals.post_save.connect(self.on_document_slug_change,
+                                  sender=Document,
+                                  dispatch_uid='wiki.document.slug.post_save')
+        signals.post_delete.connect(self.on_document_slug_change,
+                                    sender=Document,
+                                    dispatch_uid='wiki.document.slug.post_delete')
         render_done.connect(self.on_render_done,
                             dispatch_uid='wiki.document.render_done')
 
@@ -107,6 +114,16 @@ class WikiConfig(AppConfig):
         invalidate_zone_stack_cache(instance, async=async)
         DocumentContributorsJob().invalidate(instance.pk)
 
+    def on_document_slug_change(self, sender, instance, **kwargs):
+        """
+        A signal handler to record whether a document still exists with the
+        slug of a saved or deleted document, for the slug index, and to update
+        the links to created or deleted documents.
+        """
+        record_slug_change(instance.locale, instance.slug)
+        if kwargs.get('created') or kwargs.get('signal') is signals.post_delete:
+            instance.update_linking_documents()
+
     def on_zone_save(self, sender, instance, **kwargs):
         """
         A signal handler to trigger the cache invalidation of both the zone
@@ -0,0 +1,198 @@
+"""
+Stores of the last response of KumaScript for each document path, used to
+make conditional GET requests and to serve the body of a 304 response.
+
+The ETag, Last-Modified, body and errors of a response are stored and looked
+up together, so that a conditional GET is only made when there is a body to
+serve if KumaScript answers with a 304. The hash of the body as sent by
+KumaScript is stored too, so that the same body isn't cleaned again when it
+is sent in full.
+
+The store is picked by the KUMASCRIPT_BODY_STORE setting:
+
+- "memcache", the default, keeps each response in a single memcache entry
+  for KUMASCRIPT_MAX_AGE seconds. Responses larger than the memcache item
+  size limit aren't stored, and are always requested in full.
+
+- "filesystem" keeps the bodies under KUMASCRIPT_BODY_STORE_ROOT, as blobs
+  named by the hash of their content so that identical bodies are only
+  stored once, next to small index files mapping each path to the
+  validators, errors and blob of its last response. The store is local to
+  each host, and nothing is evicted from it while rendering: the
+  prune_kumascript_bodies command has to be run periodically on every host
+  to evict the least recently used blobs over
+  KUMASCRIPT_BODY_STORE_MAX_SIZE bytes.
+"""
+import errno
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from django.conf import settings
+from django.utils.encoding import force_bytes
+
+from constance import config
+
+from kuma.core.cache import memcache
+
+
+log = logging.getLogger('kuma.wiki.body_store')
+
+MEMCACHE_KEY_TMPL = 'kumascript:%s:response'
+
+
+def path_key(document_locale, document_slug):
+    """The key of the responses for the path of a document"""
+    path = u'%s/%s' % (document_locale, document_slug)
+    return hashlib.md5(force_bytes(path)).hexdigest()
+
+
+class MemcacheBodyStore(object):
+
+    def get(self, key):
+        """
+        Return the last response stored for a key, as a dict of its etag,
+        modified, body, errors and source_hash, or None.
+        """
+        return memcache.get(MEMCACHE_KEY_TMPL % key)
+
+    def set(self, key, etag, modified, body, errors, source_hash=None):
+        """
+        Store the response for a key, the source_hash being the hash of the
+        body as sent by kumascript, before it was cleaned.
+        """
+        memcache.set(MEMCACHE_KEY_TMPL % key,
+                     dict(etag=etag, modified=modified, body=body,
+                          errors=errors or None, source_hash=source_hash),
+                     timeout=config.KUMASCRIPT_MAX_AGE)
+
+    def delete(self, key):
+        memcache.delete(MEMCACHE_KEY_TMPL % key)
+
+
+class FilesystemBodyStore(object):
+
+    def __init__(self, root=None):
+        self.root = root or settings.KUMASCRIPT_BODY_STORE_ROOT
+
+    def index_path(self, key):
+        return os.path.join(self.root, 'index', key[:2], '%s.json' % key)
+
+    def blob_path(self, blob):
+        return os.path.join(self.root, 'blobs', blob[:2], blob)
+
+    def get(self, key):
+        index_path = self.index_path(key)
+        try:
+            with open(index_path, 'rb') as index_file:
+                entry = json.load(index_file)
+            blob_path = self.blob_path(entry.pop('blob'))
+            with open(blob_path, 'rb') as blob_file:
+                entry['body'] = blob_file.read().decode('utf-8')
+            # Mark the blob as used for the eviction of the least recently
+            # used ones.
+            os.utime(blob_path, None)
+        except (IOError, OSError, ValueError, KeyError):
+            # A missing path, or a blob evicted since it was stored
+            return None
+        return entry
+
+    def set(self, key, etag, modified, body, errors, source_hash=None):
+        data = body.encode('utf-8')
+        blob = hashlib.sha1(data).hexdigest()
+        blob_path = self.blob_path(blob)
+        if os.path.exists(blob_path):
+            os.utime(blob_path, None)
+        else:
+            write_atomically(blob_path, data)
+        write_atomically(self.index_path(key),
+                         json.dumps(dict(etag=etag, modified=modified,
+                                         blob=blob, errors=errors or None,
+                                         source_hash=source_hash)))
+
+    def delete(self, key):
+        try:
+            os.remove(self.index_path(key))
+        except OSError as exc:
+            if exc.errno != errno.ENOENT:
+                raise
+
+    def blobs(self):
+        """Yield the mtime, size and path of each blob"""
+        for path in walk_files(os.path.join(self.root, 'blobs')):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield stat.st_mtime, stat.st_size, path
+
+    def prune(self, max_size):
+        """
+        Evict the least recently used blobs until the blobs fit in max_size
+        bytes, and remove the index files of the evicted blobs.
+
+        Returns the number of blobs evicted and their total size.
+        """
+        blobs = list(self.blobs())
+        total_size = sum(size for mtime, size, path in blobs)
+
+        evicted, evicted_size = 0, 0
+        for mtime, size, path in sorted(blobs):
+            if total_size - evicted_size <= max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            evicted += 1
+            evicted_size += size
+
+        if evicted:
+            for path in walk_files(os.path.join(self.root, 'index')):
+                try:
+                    with open(path, 'rb') as index_file:
+                        blob = json.load(index_file)['blob']
+                    if not os.path.exists(self.blob_path(blob)):
+                        os.remove(path)
+                except (IOError, OSError, ValueError, KeyError):
+                    continue
+        log.info('Evicted %s KumaScript bodies of %s bytes' %
+                 (evicted, evicted_size))
+        return evicted, evicted_size
+
+
+def write_atomically(path, data):
+    """
+    Write a file through a temporary file, so that readers never see it
+    partially written.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, 'wb') as tmp_file:
+        tmp_file.write(data)
+    os.chmod(tmp_path, 0644)
+    os.rename(tmp_path, path)
+
+
+def walk_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            yield os.path.join(dirpath, filename)
+
+
+BODY_STORES = {
+    'memcache': MemcacheBodyStore,
+    'filesystem': FilesystemBodyStore,
+}
+
+
+def get_body_store():
+    """Return the body store picked by the KUMASCRIPT_BODY_STORE setting"""
+    return BODY_STORES[settings.KUMASCRIPT_BODY_STORE]()
@@ -0,0 +1,127 @@
+"""
+A circuit breaker around a service, shared by all processes through
+memcache, so that a slow or failing service makes requests to it fail fast
+rather than tie up every worker until they time out.
+
+While the circuit is closed, the requests made to the service in windows of
+<prefix>_WINDOW seconds are counted, along with those which failed and those
+which took longer than <prefix>_SLOW_DURATION seconds. Once at least
+<prefix>_MIN_REQUESTS requests were made in a window, the circuit opens if
+the rate of failed requests reaches <prefix>_MAX_ERROR_RATE, or the rate of
+slow requests <prefix>_MAX_SLOW_RATE.
+
+While the circuit is open, requests are refused for <prefix>_OPEN_DURATION
+seconds. It's then half-open, letting a single request through at a time to
+probe the service: the circuit closes if it succeeds in time, and opens
+again otherwise.
+"""
+import logging
+import time
+
+from django.conf import settings
+
+from kuma.core.cache import memcache
+
+
+log = logging.getLogger('kuma.wiki.circuit_breaker')
+
+KEY_TMPL = 'kuma:wiki:circuit_breaker:%s:%s'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+
+    def __init__(self, name, settings_prefix):
+        self.name = name
+        self.settings_prefix = settings_prefix
+
+    def setting(self, name):
+        return getattr(settings, '%s_%s' % (self.settings_prefix, name))
+
+    def key(self, name):
+        return KEY_TMPL % (self.name, name)
+
+    def window_keys(self):
+        window = int(time.time() // self.setting('WINDOW'))
+        return dict((stat, self.key('%s:%s' % (stat, window)))
+                    for stat in ('requests', 'failures', 'slow'))
+
+    def get_state(self):
+        open_until = memcache.get(self.key('open_until'))
+        if open_until is None:
+            return CLOSED
+        if time.time() < open_until:
+            return OPEN
+        return HALF_OPEN
+
+    def is_open(self):
+        """Return whether requests are refused, without probing"""
+        return self.get_state() == OPEN
+
+    def allow_request(self):
+        """Return whether a request to the service may be made"""
+        state = self.get_state()
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        # Only let the first request through to probe the service.
+        return memcache.add(self.key('probe'), 1,
+                            timeout=self.setting('OPEN_DURATION'))
+
+    def record(self, success, duration):
+        """Record the result of a request to the service"""
+        slow = duration >= self.setting('SLOW_DURATION')
+        state = self.get_state()
+        if state == HALF_OPEN:
+            # The result of the probe
+            if success and not slow:
+                self.close()
+            else:
+                self.open()
+            return
+        if state == OPEN:
+            # A request made before the circuit opened
+            return
+
+        keys = self.window_keys()
+        timeout = 2 * self.setting('WINDOW')
+        increment(keys['requests'], timeout)
+        if success and not slow:
+            return
+        if not success:
+            increment(keys['failures'], timeout)
+        if slow:
+            increment(keys['slow'], timeout)
+
+        counts = memcache.get_many(keys.values())
+        requests = counts.get(keys['requests'], 0)
+        if requests < self.setting('MIN_REQUESTS'):
+            return
+        error_rate = float(counts.get(keys['failures'], 0)) / requests
+        slow_rate = float(counts.get(keys['slow'], 0)) / requests
+        if (error_rate >= self.setting('MAX_ERROR_RATE') or
+                slow_rate >= self.setting('MAX_SLOW_RATE')):
+            self.open()
+
+    def open(self):
+        log.warning('Opening the circuit breaker of %s' % self.name)
+        memcache.set(self.key('open_until'),
+                     time.time() + self.setting('OPEN_DURATION'),
+                     timeout=None)
+        memcache.delete(self.key('probe'))
+
+    def close(self):
+        log.warning('Closing the circuit breaker of %s' % self.name)
+        memcache.delete_many([self.key('open_until'), self.key('probe')] +
+                             self.window_keys().values())
+
+
+def increment(key, timeout):
+    try:
+        memcache.incr(key)
+    except ValueError:
+        memcache.set(key, 1, timeout=timeout)
@@ -0,0 +1,98 @@
+"""
+Compiled bleach cleaners of document content.
+
+bleach.clean builds a sanitizer class and an html5lib parser on every call.
+A Cleaner builds the sanitizer class once for its whitelists, and keeps an
+html5lib parser per thread, while producing the same output as bleach.clean.
+Cleaners are cached by the version of their whitelists, so that changing the
+constance whitelists compiles a new one.
+"""
+import hashlib
+import json
+import threading
+
+import bleach
+import html5lib
+from bleach import BleachSanitizer, _render
+from bleach.encoding import force_unicode
+from constance import config
+
+from .constants import ALLOWED_ATTRIBUTES, ALLOWED_STYLES, ALLOWED_TAGS
+
+
+# The number of cleaners kept, which only grows when the constance
+# whitelists change.
+MAX_CLEANERS = 8
+
+_cleaners = {}
+_default_version = []
+
+
+class Cleaner(object):
+
+    def __init__(self, tags, attributes, styles):
+        class Sanitizer(BleachSanitizer):
+            allowed_elements = tags
+            allowed_attributes = attributes
+            allowed_css_properties = styles
+            strip_disallowed_elements = False
+            strip_html_comments = True
+
+        self.sanitizer = Sanitizer
+        self.local = threading.local()
+
+    def clean(self, text):
+        """Clean an HTML fragment like bleach.clean"""
+        if not text:
+            return ''
+        parser = getattr(self.local, 'parser', None)
+        if parser is None:
+            parser = self.local.parser = html5lib.HTMLParser(
+                tokenizer=self.sanitizer)
+        return _render(parser.parseFragment(force_unicode(text)))
+
+
+def get_whitelists(use_constance_bleach_whitelists=False):
+    """Return the tags, attributes and styles allowed in content"""
+    if use_constance_bleach_whitelists:
+        return (config.BLEACH_ALLOWED_TAGS,
+                config.BLEACH_ALLOWED_ATTRIBUTES,
+                config.BLEACH_ALLOWED_STYLES)
+    return ALLOWED_TAGS, ALLOWED_ATTRIBUTES, ALLOWED_STYLES
+
+
+def whitelists_version(whitelists):
+    return hashlib.sha1(json.dumps([bleach.__version__, whitelists],
+                                   sort_keys=True)).hexdigest()
+
+
+def get_cleaner(use_constance_bleach_whitelists=False):
+    """Return the compiled cleaner of the current whitelists"""
+    whitelists = get_whitelists(use_constance_bleach_whitelists)
+    version = whitelists_version(whitelists)
+    cleaner = _cleaners.get(version)
+    if cleaner is None:
+        if len(_cleaners) >= MAX_CLEANERS:
+            _cleaners.clear()
+        cleaner = _cleaners[version] = Cleaner(*whitelists)
+    return cleaner
+
+
+def cleaning_version(use_constance_bleach_whitelists=False):
+    """
+    Return a hash of everything Document.objects.clean_content depends on
+    besides the content, i.e. the whitelists, the iframe hosts and the
+    blocked protocols.
+    """
+    if use_constance_bleach_whitelists:
+        whitelists_hash = whitelists_version(get_whitelists(True))
+    else:
+        # The default whitelists never change.
+        if not _default_version:
+            _default_version.append(whitelists_version(get_whitelists()))
+        whitelists_hash = _default_version[0]
+    return hashlib.sha1(json.dumps([
+        whitelists_hash,
+        config.KUMA_WIKI_IFRAME_ALLOWED_HOSTS,
+        config.KUMA_WIKI_HREF_BLOCKED_PROTOCOLS,
+    ])).hexdigest()
@@ -200,6 +200,12 @@ KUMASCRIPT_TIMEOUT_ERROR = [
      "args": ["TimeoutError"]}
 ]
 
+KUMASCRIPT_UNAVAILABLE_ERROR = [
+    {"level": "error",
+     "message": "Kumascript service is unavailable",
+     "args": ["UnavailableError"]}
+]
+
 # TODO: Put this under the control of Constance / Waffle?
 # Flags used to signify revisions in need of review
 REVIEW_FLAG_TAGS = (
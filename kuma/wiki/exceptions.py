@@ -33,6 +33,13 @@ class DocumentRenderedContentNotAvailable(Exception):
     """
 
 
+class KumascriptUnavailable(Exception):
+    """
+    A request to kumascript was refused by its circuit breaker, as the
+    service has been failing or slow.
+    """
+
+
 class PageMoveError(Exception):
     """
     Exception raised by most failures during page move.
@@ -2,18 +2,249 @@ import base64
 from collections import defaultdict
 import json
 import hashlib
+import os
+import threading
 import time
+import zlib
+from multiprocessing.pool import ThreadPool
 from urlparse import urljoin
 
 from django.conf import settings
 from django.contrib.sites.models import Site
 
+import waffle
 from constance import config
-import requests
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from requests.packages.urllib3.util import Retry
 
+from kuma.attachments.utils import attachments_metadata
 from kuma.core.cache import memcache
+from kuma.core.utils import single_flight
 
-from .constants import KUMASCRIPT_TIMEOUT_ERROR, TEMPLATE_TITLE_PREFIX
+from .body_store import get_body_store, path_key
+from .circuit_breaker import CircuitBreaker
+from .cleaner import cleaning_version
+from .constants import (KUMASCRIPT_TIMEOUT_ERROR, KUMASCRIPT_UNAVAILABLE_ERROR,
+                        TEMPLATE_TITLE_PREFIX)
+from .exceptions import KumascriptUnavailable
+from .render_timing import timed
+
+
+# The header of the env vars in the compact encoding, which mustn't start
+# with the x-kumascript-env- prefix of the headers of the other encoding.
+COMPACT_ENV_HEADER = 'x-kumascript-env'
+COMPACT_ENV_VERSION = '2'
+
+DURATION_KEY_TMPL = 'kuma:wiki:kumascript:duration:%s'
+DURATION_DECAY = 0.9
+# The cache controls of the requests kumascript renders in full, rather than
+# serving from its cache, which are the only ones timed for get_timeout.
+FULL_RENDER_CACHE_CONTROLS = ('max-age=0', 'no-cache')
+# The exceptions of requests failing for lack of a response from kumascript
+UNAVAILABLE_EXCEPTIONS = (KumascriptUnavailable, Timeout, ConnectionError)
+
+CONNECTION_STAT_KEY_TMPL = 'kuma:wiki:kumascript:connections:%s'
+CONNECTION_STATS = ('requests', 'new_connections')
+
+
+def record_connection_stat(stat, count=1):
+    """Count requests or connections in memcache, shared by all processes"""
+    key = CONNECTION_STAT_KEY_TMPL % stat
+    try:
+        memcache.incr(key, count)
+    except ValueError:
+        memcache.set(key, count, timeout=None)
+
+
+def get_connection_stats():
+    """
+    Return the number of requests made to KumaScript and of connections
+    opened for them, and the rate of requests reusing a connection.
+    """
+    counts = memcache.get_many([CONNECTION_STAT_KEY_TMPL % stat
+                                for stat in CONNECTION_STATS])
+    stats = dict((stat, counts.get(CONNECTION_STAT_KEY_TMPL % stat, 0))
+                 for stat in CONNECTION_STATS)
+    total = stats['requests']
+    stats['reuse_rate'] = (total and
+                           float(total - stats['new_connections']) / total or
+                           0.0)
+    return stats
+
+
+def reset_connection_stats():
+    memcache.delete_many([CONNECTION_STAT_KEY_TMPL % stat
+                          for stat in CONNECTION_STATS])
+
+
+class KumascriptClient(object):
+    """
+    The HTTP client of a process for the KumaScript service, which keeps
+    a pool of connections alive between requests instead of opening one for
+    every render.
+
+    The session is replaced in forked processes, e.g. celery workers, so
+    that they don't share connections with their parent, and once it's been
+    idle for longer than KUMASCRIPT_KEEPALIVE_TIMEOUT, since the service
+    may have closed its connections by then.
+
+    The client can be shared by threads, see get_many.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.session = None
+        self.adapter = None
+        self.pid = None
+        self.last_used = 0
+        self.connections_counted = 0
+
+    def get_session(self):
+        with self.lock:
+            return self._get_session()
+
+    def _get_session(self):
+        now = time.time()
+        if self.session is not None and (
+                self.pid != os.getpid() or
+                now - self.last_used > settings.KUMASCRIPT_KEEPALIVE_TIMEOUT):
+            if self.pid == os.getpid():
+                self.session.close()
+            self.session = None
+        if self.session is None:
+            self.session = Session()
+            self.adapter = HTTPAdapter(
+                pool_maxsize=settings.KUMASCRIPT_POOL_MAXSIZE,
+                max_retries=Retry(
+                    # retry twice in case we can't connect to KumaScript,
+                    # which is safe for any request
+                    total=2,
+                    connect=2,
+                    # but don't retry a render which has already started,
+                    # it could take as long again
+                    read=False,
+                    backoff_factor=0.1)
+            )
+            self.session.mount('http://', self.adapter)
+            self.session.mount('https://', self.adapter)
+            self.pid = os.getpid()
+            self.connections_counted = 0
+        self.last_used = now
+        return self.session
+
+    def count_connections(self):
+        """Count the connections opened by the session so far"""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def request(self, method, url, breaker=None, **kwargs):
+        """
+        Make a request with the session, through the given circuit breaker,
+        if any, raising KumascriptUnavailable if it refuses the request.
+        """
+        if breaker is not None and not breaker.allow_request():
+            raise KumascriptUnavailable
+        session = self.get_session()
+        start = time.time()
+        success = False
+        try:
+            response = session.request(method, url, **kwargs)
+            success = response.status_code < 500
+            return response
+        finally:
+            if breaker is not None:
+                breaker.record(success, time.time() - start)
+            with self.lock:
+                self.last_used = time.time()
+                connections = self.count_connections()
+                new_connections = connections - self.connections_counted
+                self.connections_counted = connections
+            record_connection_stat('requests')
+            if new_connections > 0:
+                record_connection_stat('new_connections', new_connections)
+
+
+client = KumascriptClient()
+breaker = CircuitBreaker('kumascript', 'KUMASCRIPT_BREAKER')
+
+
+def get_breaker():
+    """
+    Return the circuit breaker of kumascript requests, if the
+    wiki_kumascript_circuit_breaker switch is active.
+    """
+    if waffle.switch_is_active('wiki_kumascript_circuit_breaker'):
+        return breaker
+    return None
+
+
+def get_timeout(document):
+    """
+    Return the timeout of the kumascript requests of a document.
+
+    That's KUMASCRIPT_TIMEOUT, unless the wiki_kumascript_adaptive_timeout
+    switch is active and the document was rendered in full recently, in
+    which case it's a multiple of the longest recent duration of those
+    renders, so that documents usually rendered quickly fail fast when
+    kumascript slows down.
+    """
+    timeout = config.KUMASCRIPT_TIMEOUT
+    if (document.pk and
+            waffle.switch_is_active('wiki_kumascript_adaptive_timeout')):
+        duration = memcache.get(DURATION_KEY_TMPL % document.pk)
+        if duration is not None:
+            adaptive_timeout = max(
+                duration * settings.KUMASCRIPT_ADAPTIVE_TIMEOUT_FACTOR,
+                settings.KUMASCRIPT_ADAPTIVE_TIMEOUT_MIN)
+            timeout = min(timeout, adaptive_timeout)
+    return timeout
+
+
+def record_duration(document, cache_control, response, duration):
+    """
+    Record the duration of a kumascript request of a document for
+    get_timeout, if it was rendered in full, as the longest duration of its
+    recent full renders, decayed over time so that the document can get
+    faster too. Responses from the cache of kumascript, or 304 responses to
+    conditional GETs, don't tell how long a full render takes.
+
+    If the request timed out, the durations are forgotten instead, so the
+    next request of the document gets the whole of KUMASCRIPT_TIMEOUT, e.g.
+    when a template it uses got slower.
+    """
+    if (not document.pk or
+            not waffle.switch_is_active('wiki_kumascript_adaptive_timeout')):
+        return
+    key = DURATION_KEY_TMPL % document.pk
+    if isinstance(response, Exception):
+        if isinstance(response, Timeout):
+            memcache.delete(key)
+        return
+    if response.status_code is None:
+        # Timed out
+        memcache.delete(key)
+        return
+    if (cache_control not in FULL_RENDER_CACHE_CONTROLS or
+            response.status_code != 200):
+        return
+    previous = memcache.get(key)
+    if previous is not None:
+        duration = max(duration, previous * DURATION_DECAY)
+    memcache.set(key, duration, timeout=settings.KUMASCRIPT_DURATION_TIMEOUT)
+
+
+def is_unavailable(response):
+    """
+    Whether a kumascript request failed for lack of a response from the
+    service: it was refused by the circuit breaker, timed out or couldn't
+    connect, or kumascript answered with a server error. Rendering a
+    document is then given up, keeping its last rendering, see
+    Document.abort_rendering.
+    """
+    if isinstance(response, Exception):
+        return isinstance(response, UNAVAILABLE_EXCEPTIONS)
+    return response.status_code is None or response.status_code >= 500
 
 
 def should_use_rendered(doc, params, html=None):
@@ -42,19 +273,53 @@ def should_use_rendered(doc, params, html=None):
 
 def post(request, content, locale=settings.LANGUAGE_CODE,
          use_constance_bleach_whitelists=False):
-    url = settings.KUMASCRIPT_URL_TEMPLATE.format(path='')
-    headers = {
-        'X-FireLogger': '1.2',
-    }
+    """
+    Render content with kumascript, e.g. for a preview.
+
+    If the wiki_preview_coalescing switch is active, the results are cached
+    for KUMASCRIPT_PREVIEW_CACHE_TIMEOUT seconds, and identical requests
+    made at the same time share a single kumascript request.
+    """
     env_vars = {
         'url': request.build_absolute_uri('/'),
         'locale': locale,
     }
+
+    def send():
+        return post_content(content, env_vars,
+                            use_constance_bleach_whitelists)
+
+    if not waffle.switch_is_active('wiki_preview_coalescing'):
+        return send()
+    key = hashlib.sha1(json.dumps([content, env_vars,
+                                   use_constance_bleach_whitelists],
+                                  sort_keys=True)).hexdigest()
+    return single_flight('kumascript:preview:%s' % key, send,
+                         config.KUMASCRIPT_TIMEOUT,
+                         settings.KUMASCRIPT_PREVIEW_CACHE_TIMEOUT,
+                         cacheable=is_complete_preview)
+
+
+def is_complete_preview(result):
+    """Whether a preview didn't fail because of kumascript's availability"""
+    body, errors = result
+    return errors not in (KUMASCRIPT_TIMEOUT_ERROR,
+                          KUMASCRIPT_UNAVAILABLE_ERROR)
+
+
+def post_content(content, env_vars, use_constance_bleach_whitelists=False):
+    url = settings.KUMASCRIPT_URL_TEMPLATE.format(path='')
+    headers = {
+        'X-FireLogger': '1.2',
+    }
     add_env_headers(headers, env_vars)
-    response = requests.post(url,
-                             timeout=config.KUMASCRIPT_TIMEOUT,
-                             data=content.encode('utf8'),
-                             headers=headers)
+    try:
+        response = client.request('post', url, breaker=get_breaker(),
+                                  timeout=config.KUMASCRIPT_TIMEOUT,
+                                  data=content.encode('utf8'),
+                                  headers=headers)
+    except KumascriptUnavailable:
+        return content, KUMASCRIPT_UNAVAILABLE_ERROR
     if response:
         body = process_body(response, use_constance_bleach_whitelists)
         errors = process_errors(response)
@@ -64,23 +329,6 @@ def post(request, content, locale=settings.LANGUAGE_CODE,
         return content, errors
 
 
-def _get_attachment_metadata_dict(attachment):
-    filesize = 0
-    try:
-        filesize = attachment.current_revision.file.size
-    except OSError:
-        pass
-    return {
-        'title': attachment.title,
-        'description': attachment.current_revision.description,
-        'filename': attachment.current_revision.filename(),
-        'size': filesize,
-        'author': attachment.current_revision.creator.username,
-        'mime': attachment.current_revision.mime_type,
-        'url': attachment.get_file_url(),
-    }
-
-
 def _format_slug_for_request(slug):
     """Formats a document slug which will play nice with kumascript caching"""
     # http://bugzil.la/1063580
@@ -90,8 +338,12 @@ def _format_slug_for_request(slug):
     return slug
 
 
-def get(document, cache_control, base_url, timeout=None):
-    """Perform a kumascript GET request for a document locale and slug."""
+def build_get_request(document, cache_control, base_url):
+    """
+    Build the URL and headers of the kumascript GET request for a document
+    locale and slug, along with the key and the last response stored in the
+    body store for it.
+    """
     if not cache_control:
         # Default to the configured max-age for cache control.
         max_age = config.KUMASCRIPT_MAX_AGE
@@ -101,12 +353,8 @@ def get(document, cache_control, base_url, timeout=None):
         site = Site.objects.get_current()
         base_url = 'http://%s' % site.domain
 
-    if not timeout:
-        timeout = config.KUMASCRIPT_TIMEOUT
-
     document_locale = document.locale
     document_slug = document.slug
-    max_age = config.KUMASCRIPT_MAX_AGE
 
     # 1063580 - Kumascript converts template name calls to lower case and bases
     # caching keys off of that.
@@ -114,79 +362,225 @@ def get(document, cache_control, base_url, timeout=None):
     if document.is_template:
         document_slug_for_kumascript = _format_slug_for_request(document_slug)
 
+    url_tmpl = settings.KUMASCRIPT_URL_TEMPLATE
+    url = unicode(url_tmpl).format(path=u'%s/%s' %
+                                   (document_locale,
+                                    document_slug_for_kumascript))
+
+    headers = {
+        'X-FireLogger': '1.2',
+        'Cache-Control': cache_control,
+    }
+
+    add_env_headers(headers,
+                    get_document_env_vars(document, base_url, cache_control))
+
+    # Set up for conditional GET, if we have the last response stored.
+    key = path_key(document_locale, document_slug)
+    stored = get_body_store().get(key)
+    if stored is not None:
+        if stored['etag']:
+            headers['If-None-Match'] = stored['etag']
+        if stored['modified']:
+            headers['If-Modified-Since'] = stored['modified']
+
+    return url, headers, (key, stored)
+
+
+def process_get_response(response, stored, timer=None):
+    """
+    Return the body and errors of the response to a kumascript GET request,
+    from the body store if it was a conditional GET hit.
+    """
     body, errors = None, None
+    key, stored_response = stored
+
+    if response.status_code == 304 and stored_response is not None:
+        # Conditional GET was a pass, so use the stored content.
+        body = stored_response['body']
+        errors = stored_response['errors']
+
+    elif response.status_code == 200:
+        source_hash = hashlib.sha1(
+            cleaning_version() + response.text.encode('utf-8')).hexdigest()
+        if (stored_response is not None and
+                stored_response.get('source_hash') == source_hash):
+            # The same body as the last time, so skip cleaning it again.
+            body = stored_response['body']
+        else:
+            with timed(timer, 'bleach'):
+                body = process_body(response)
+        errors = process_errors(response)
+
+        # Store the response for conditional GET, and the next response.
+        headers = response.headers
+        get_body_store().set(key, headers.get('etag'),
+                             headers.get('last-modified'), body, errors,
+                             source_hash=source_hash)
+
+    elif response.status_code is None:
+        errors = KUMASCRIPT_TIMEOUT_ERROR
+
+    else:
+        errors = [
+            {
+                "level": "error",
+                "message": "Unexpected response from Kumascript service: %s" %
+                           response.status_code,
+                "args": ["UnknownError"],
+            },
+        ]
+    return body, errors
+
+
+def get_failure_errors(exc):
+    """The errors to report when a kumascript request raised an exception"""
+    return [
+        {
+            "level": "error",
+            "message": "Kumascript service failed unexpectedly: %s" % exc,
+            "args": ["UnknownError"],
+        },
+    ]
+
+
+def get(document, cache_control, base_url, timeout=None):
+    """Perform a kumascript GET request for a document locale and slug."""
+    if not timeout:
+        timeout = get_timeout(document)
 
     try:
-        url_tmpl = settings.KUMASCRIPT_URL_TEMPLATE
-        url = unicode(url_tmpl).format(path=u'%s/%s' %
-                                       (document_locale,
-                                        document_slug_for_kumascript))
-
-        cache_keys = build_cache_keys(document_slug, document_locale)
-        etag_key, modified_key, body_key, errors_key = cache_keys
-
-        headers = {
-            'X-FireLogger': '1.2',
-            'Cache-Control': cache_control,
-        }
-
-        # Create the file interface
-        files = []
-        for attachment in document.attachments.all():
-            files.append(_get_attachment_metadata_dict(attachment))
-
-        # Assemble some KumaScript env vars
-        # TODO: See dekiscript vars for future inspiration
-        # http://developer.mindtouch.com/en/docs/DekiScript/Reference/
-        #   Wiki_Functions_and_Variables
-        path = document.get_absolute_url()
-        # TODO: Someday merge with _get_document_for_json in views.py
-        # where most of this is duplicated code.
-        env_vars = dict(
-            path=path,
-            url=urljoin(base_url, path),
-            id=document.pk,
-            revision_id=document.current_revision.pk,
-            locale=document.locale,
-            title=document.title,
-            files=files,
-            attachments=files,  # Just for sake of verbiage?
-            slug=document.slug,
-            tags=list(document.tags.names()),
-            review_tags=list(document.current_revision.review_tags.names()),
-            modified=time.mktime(document.modified.timetuple()),
-            cache_control=cache_control,
-        )
-        add_env_headers(headers, env_vars)
-
-        # Set up for conditional GET, if we have the details cached.
-        cached_meta = memcache.get_many([etag_key, modified_key])
-        if etag_key in cached_meta:
-            headers['If-None-Match'] = cached_meta[etag_key]
-        if modified_key in cached_meta:
-            headers['If-Modified-Since'] = cached_meta[modified_key]
-
-        # Finally, fire off the request.
-        response = requests.get(url, headers=headers, timeout=timeout)
-
-        if response.status_code == 304:
-            # Conditional GET was a pass, so use the cached content.
-            result = memcache.get_many([body_key, errors_key])
-            body = result.get(body_key, '').decode('utf-8')
-            errors = result.get(errors_key, None)
-
-        elif response.status_code == 200:
-            body = process_body(response)
-            errors = process_errors(response)
+        breaker = get_breaker()
+        if breaker is not None and breaker.is_open():
+            raise KumascriptUnavailable
+
+        with timed(document.render_timer, 'kumascript'):
+            url, headers, stored = build_get_request(document, cache_control,
+                                                     base_url)
+
+            # Finally, fire off the request.
+            start = time.time()
+            try:
+                response = client.request('get', url, breaker=breaker,
+                                          headers=headers, timeout=timeout)
+            except Timeout as exc:
+                record_duration(document, cache_control, exc, None)
+                raise
+            record_duration(document, cache_control, response,
+                            time.time() - start)
+
+        if is_unavailable(response):
+            return None, KUMASCRIPT_UNAVAILABLE_ERROR
+        return process_get_response(response, stored, document.render_timer)
+
+    except UNAVAILABLE_EXCEPTIONS:
+        return None, KUMASCRIPT_UNAVAILABLE_ERROR
+
+    except Exception as exc:
+        # Last resort: Something went really haywire. Kumascript server died
+        # mid-request, or something. Try to report at least some hint.
+        return None, get_failure_errors(exc)
 
-            # Cache the request for conditional GET, but use the max_age for
-            # the cache timeout here too.
-            headers = response.headers
-            memcache.set(etag_key, headers.get('etag'), timeout=max_age)
-            memcache.set(modified_key, headers.get('last-modified'), timeout=max_age)
-            memcache.set(body_key, body.encode('utf-8'), timeout=max_age)
-            if errors:
-                memcache.set(errors_key, errors, timeout=max_age)
+
+def get_many(documents, cache_control, base_url, timeout=None):
+    """
+    Perform the kumascript GET requests for many documents concurrently,
+    up to KUMASCRIPT_BATCH_CONCURRENCY at a time, returning a list of
+    (body, errors) tuples in the order of the documents.
+
+    Only the HTTP requests are made in other threads, the env vars are
+    looked up and the responses processed in the calling thread.
+    """
+    breaker = get_breaker()
+    if breaker is not None and breaker.is_open():
+        return [(None, KUMASCRIPT_UNAVAILABLE_ERROR)] * len(documents)
+
+    results = [None] * len(documents)
+    pending = []
+    for index, document in enumerate(documents):
+        try:
+            with timed(document.render_timer, 'kumascript'):
+                url, headers, stored = build_get_request(document,
+                                                         cache_control,
+                                                         base_url)
+        except Exception as exc:
+            results[index] = None, get_failure_errors(exc)
+        else:
+            pending.append((index, url, headers, stored,
+                            timeout or get_timeout(document)))
+
+    def send(request):
+        index, url, headers, stored, timeout = request
+        start = time.time()
+        try:
+            response = client.request('get', url, breaker=breaker,
+                                      headers=headers, timeout=timeout)
+        except Exception as exc:
+            response = exc
+        return response, time.time() - start
+
+    if pending:
+        pool = ThreadPool(min(len(pending),
+                              settings.KUMASCRIPT_BATCH_CONCURRENCY))
+        try:
+            responses = pool.map(send, pending)
+        finally:
+            pool.close()
+        for request, (response, duration) in zip(pending, responses):
+            index, stored = request[0], request[3]
+            record_duration(documents[index], cache_control, response,
+                            duration)
+            if is_unavailable(response):
+                results[index] = None, KUMASCRIPT_UNAVAILABLE_ERROR
+                continue
+            if isinstance(response, Exception):
+                results[index] = None, get_failure_errors(response)
+                continue
+            timer = documents[index].render_timer
+            if timer is not None:
+                timer.add('kumascript', duration)
+            try:
+                results[index] = process_get_response(response, stored,
+                                                      timer)
+            except Exception as exc:
+                results[index] = None, get_failure_errors(exc)
+    return results
+
+
+def post_document_content(document, content, cache_control, base_url,
+                          timeout=None):
+    """
+    Perform a kumascript POST request to render some content of a document,
+    e.g. a single section of it, with the env vars of the document.
+    """
+    if not timeout:
+        timeout = get_timeout(document)
+
+    body, errors = None, None
+
+    try:
+        breaker = get_breaker()
+        if breaker is not None and breaker.is_open():
+            raise KumascriptUnavailable
+
+        with timed(document.render_timer, 'kumascript'):
+            url = settings.KUMASCRIPT_URL_TEMPLATE.format(path='')
+            headers = {
+                'X-FireLogger': '1.2',
+                'Cache-Control': cache_control,
+            }
+            add_env_headers(headers,
+                            get_document_env_vars(document, base_url,
+                                                  cache_control))
+            response = client.request('post', url, breaker=breaker,
+                                      data=content.encode('utf8'),
+                                      headers=headers,
+                                      timeout=timeout)
+
+        if response.status_code == 200:
+            with timed(document.render_timer, 'bleach'):
+                body = process_body(response)
+            errors = process_errors(response)
 
         elif response.status_code is None:
             errors = KUMASCRIPT_TIMEOUT_ERROR
@@ -201,9 +595,10 @@ def get(document, cache_control, base_url, timeout=None):
                 },
             ]
 
+    except KumascriptUnavailable:
+        errors = KUMASCRIPT_UNAVAILABLE_ERROR
+
     except Exception as exc:
-        # Last resort: Something went really haywire. Kumascript server died
-        # mid-request, or something. Try to report at least some hint.
         errors = [
             {
                 "level": "error",
@@ -214,8 +609,42 @@ def get(document, cache_control, base_url, timeout=None):
     return (body, errors)
 
 
+def get_document_env_vars(document, base_url, cache_control):
+    """Assemble the KumaScript env vars to render a document with."""
+    # Create the file interface
+    files = attachments_metadata(document.attachments)
+
+    # TODO: See dekiscript vars for future inspiration
+    # http://developer.mindtouch.com/en/docs/DekiScript/Reference/
+    #   Wiki_Functions_and_Variables
+    path = document.get_absolute_url()
+    # TODO: Someday merge with _get_document_for_json in views.py
+    # where most of this is duplicated code.
+    return dict(
+        path=path,
+        url=urljoin(base_url, path),
+        id=document.pk,
+        revision_id=document.current_revision.pk,
+        locale=document.locale,
+        title=document.title,
+        files=files,
+        attachments=files,  # Just for sake of verbiage?
+        slug=document.slug,
+        tags=list(document.tags.names()),
+        review_tags=list(document.current_revision.review_tags.names()),
+        modified=time.mktime(document.modified.timetuple()),
+        cache_control=cache_control,
+    )
+
+
 def add_env_headers(headers, env_vars):
-    """Encode env_vars as kumascript headers, as base64 JSON-encoded values."""
+    """
+    Encode env_vars as kumascript headers, as base64 JSON-encoded values, or
+    as a single compact header if KUMASCRIPT_ENV_ENCODING says so.
+    """
+    if config.KUMASCRIPT_ENV_ENCODING == 'compact':
+        headers[COMPACT_ENV_HEADER] = encode_compact_env(env_vars)
+        return headers
     headers.update(dict(
         ('x-kumascript-env-%s' % k, base64.b64encode(json.dumps(v)))
         for k, v in env_vars.items()
@@ -223,6 +652,55 @@ def add_env_headers(headers, env_vars):
     return headers
 
 
+def encode_compact_env(env_vars):
+    """
+    Encode env_vars as the value of a single header, in the format:
+
+        <version>;<compression>;<base64 payload>
+
+    where the payload is the JSON of a {"env": ..., "aliases": ...} object,
+    compressed with zlib if the compression is "deflate". Env vars whose
+    value is the same list or dict as another's, e.g. files and attachments,
+    are only sent once, "aliases" mapping their names to the name of the
+    env var sent in their place.
+    """
+    env, aliases, names_by_value = {}, {}, {}
+    for name in sorted(env_vars):
+        value = env_vars[name]
+        if isinstance(value, (list, dict)):
+            if id(value) in names_by_value:
+                aliases[name] = names_by_value[id(value)]
+                continue
+            names_by_value[id(value)] = name
+        env[name] = value
+    payload = json.dumps({'env': env, 'aliases': aliases},
+                         separators=(',', ':'))
+    compression = 'identity'
+    if len(payload) >= settings.KUMASCRIPT_ENV_COMPRESS_MIN_SIZE:
+        compressed = zlib.compress(payload)
+        if len(compressed) < len(payload):
+            payload, compression = compressed, 'deflate'
+    return '%s;%s;%s' % (COMPACT_ENV_VERSION, compression,
+                         base64.b64encode(payload))
+
+
+def decode_compact_env(value):
+    """Decode env vars encoded by encode_compact_env, like kumascript does"""
+    version, compression, payload = value.split(';', 2)
+    if version != COMPACT_ENV_VERSION:
+        raise ValueError('Unknown env encoding version: %s' % version)
+    payload = base64.b64decode(payload)
+    if compression == 'deflate':
+        payload = zlib.decompress(payload)
+    elif compression != 'identity':
+        raise ValueError('Unknown env compression: %s' % compression)
+    data = json.loads(payload)
+    env = data['env']
+    for name, original in data['aliases'].items():
+        env[name] = env[original]
+    return env
+
+
 def process_body(response, use_constance_bleach_whitelists=False):
     # We defer bleach sanitation of kumascript content all the way
     # through editing, source display, and raw output. But, we still
@@ -269,15 +747,3 @@ def process_errors(response):
             },
         ]
     return errors
-
-
-def build_cache_keys(document_locale, document_slug):
-    """Build the cache keys used for Kumascript"""
-    path_hash = hashlib.md5((u'%s/%s' % (document_locale, document_slug))
-                            .encode('utf8'))
-    base_key = 'kumascript:%s:%%s' % path_hash.hexdigest()
-    etag_key = base_key % 'etag'
-    modified_key = base_key % 'modified'
-    body_key = base_key % 'body'
-    errors_key = base_key % 'errors'
-    return (etag_key, modified_key, body_key, errors_key)
@@ -0,0 +1,60 @@
+"""
+Compare the documents per second of building the cached content fields of
+rendered documents in this process and in render pools of more workers, to
+pick WIKI_RENDER_POOL_WORKERS.
+"""
+import time
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from kuma.wiki import render_pool
+from kuma.wiki.models import Document
+
+
+class Command(NoArgsCommand):
+    help = 'Benchmark the render pool against building in this process'
+    option_list = NoArgsCommand.option_list + (
+        make_option('--workers', dest='workers', default='2,4',
+                    help='Comma separated numbers of pool workers to '
+                         'compare with a single process'),
+        make_option('--limit', dest='limit', type='int', default=200,
+                    help='Number of most recently rendered documents to '
+                         'build'),
+        make_option('--locale', dest='locale', default=None,
+                    help='Only build documents of this locale'),
+    )
+
+    def handle_noargs(self, **options):
+        docs = (Document.objects.filter(is_redirect=False,
+                                        rendered_html__isnull=False)
+                                .select_related('current_revision')
+                                .order_by('-last_rendered_at'))
+        if options['locale']:
+            docs = docs.filter(locale=options['locale'])
+        args = [doc.get_render_artifacts_args()
+                for doc in docs[:options['limit']]]
+        if not args:
+            self.stdout.write(u'No rendered documents to build')
+            return
+
+        counts = [1] + [int(count)
+                        for count in options['workers'].split(',')]
+        baseline = None
+        for workers in counts:
+            if workers > 1:
+                # Don't count forking the pool
+                render_pool.get_pool(workers)
+            start = time.time()
+            artifacts = render_pool.build_many(args, workers)
+            duration = time.time() - start
+            if baseline is None:
+                baseline = artifacts
+            elif artifacts != baseline:
+                self.stdout.write(u'%s workers built different artifacts' %
+                                  workers)
+            self.stdout.write(u'%s workers: %s documents in %.2fs, '
+                              u'%.1f documents/s' %
+                              (workers, len(args), duration,
+                               len(args) / duration))
+        render_pool.close_pool()
@@ -0,0 +1,18 @@
+"""
+Build the per-locale indexes of document slugs used for link annotation.
+
+Run this on every host more often than WIKI_SLUG_INDEX_MAX_AGE, otherwise
+link annotation falls back to querying the database.
+"""
+from django.core.management.base import NoArgsCommand
+
+from kuma.wiki.slug_index import build_slug_indexes
+
+
+class Command(NoArgsCommand):
+    help = 'Build the per-locale indexes of document slugs'
+
+    def handle_noargs(self, **options):
+        counts = build_slug_indexes()
+        for locale, count in sorted(counts.items()):
+            self.stdout.write('%s: %s slugs' % (locale, count))
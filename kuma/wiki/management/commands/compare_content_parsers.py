@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the output of the content parser backends over the current revisions
+of wiki documents, to vet a backend before switching WIKI_CONTENT_PARSER
+"""
+import time
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kuma.wiki.content import CONTENT_PARSERS, compare_parsers, parse
+from kuma.wiki.models import Document
+
+
+class Command(BaseCommand):
+    args = '<document_path document_path ...>'
+    help = 'Report divergences between the content parser backends'
+    option_list = BaseCommand.option_list + (
+        make_option('--limit', dest='limit', type='int', default=100,
+                    help='Number of most recently modified documents to '
+                         'compare, when no document paths are given'),
+        make_option('--locale', dest='locale', default=None,
+                    help='Only compare documents of this locale'),
+        make_option('--rendered', dest='rendered', default=False,
+                    action='store_true',
+                    help='Compare the rendered HTML instead of the source'),
+        make_option('--verbose-diff', dest='verbose_diff', default=False,
+                    action='store_true',
+                    help='Print the diverging outputs'),
+    )
+
+    def handle(self, *args, **options):
+        if args:
+            docs = [self.get_document(path) for path in args]
+        else:
+            docs = Document.objects.filter(is_redirect=False)
+            if options['locale']:
+                docs = docs.filter(locale=options['locale'])
+            docs = docs.order_by('-modified')[:options['limit']]
+
+        parsers = sorted(CONTENT_PARSERS)
+        timings = dict((parser, 0.0) for parser in parsers)
+        compared = diverged = 0
+        for doc in docs:
+            if options['rendered']:
+                content = doc.rendered_html
+            else:
+                content = doc.html
+            if not content:
+                continue
+            compared += 1
+
+            for parser in parsers:
+                start = time.time()
+                parse(content, parser=parser).serialize()
+                timings[parser] += time.time() - start
+
+            divergences = compare_parsers(content, parsers)
+            if not divergences:
+                continue
+            diverged += 1
+            self.stdout.write(u'%s/%s: %s' % (doc.locale, doc.slug,
+                                              u', '.join(sorted(divergences))))
+            if options['verbose_diff']:
+                for operation, outputs in sorted(divergences.items()):
+                    for parser in parsers:
+                        self.stdout.write(u'  %s [%s]:\n%s' %
+                                          (operation, parser, outputs[parser]))
+
+        self.stdout.write(u'%s of %s documents diverged' % (diverged, compared))
+        for parser in parsers:
+            self.stdout.write(u'%s: %.2fs parsing and serializing' %
+                              (parser, timings[parser]))
+
+    def get_document(self, path):
+        # Accept the same document paths as the render_document command
+        if path.startswith('/'):
+            path = path[1:]
+        locale, sep, slug = path.partition('/')
+        head, sep, tail = slug.partition('/')
+        if head == 'docs':
+            slug = tail
+        try:
+            return Document.objects.get(locale=locale, slug=slug)
+        except Document.DoesNotExist:
+            raise CommandError('Document not found: %s' % path)
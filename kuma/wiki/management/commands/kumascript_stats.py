@@ -0,0 +1,28 @@
+"""
+Show how often requests to KumaScript reuse a pooled connection, and the
+state of the KumaScript circuit breaker.
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from kuma.wiki import kumascript
+
+
+class Command(BaseCommand):
+    help = "Show the connection stats of the KumaScript client"
+    option_list = BaseCommand.option_list + (
+        make_option('--reset', dest='reset', default=False,
+                    action='store_true',
+                    help='Reset the stats after showing them'),
+    )
+
+    def handle(self, *args, **options):
+        stats = kumascript.get_connection_stats()
+        for stat in kumascript.CONNECTION_STATS:
+            self.stdout.write('%s: %s' % (stat, stats[stat]))
+        self.stdout.write('reuse rate: %.1f%%' % (stats['reuse_rate'] * 100))
+        self.stdout.write('circuit breaker: %s' %
+                          kumascript.breaker.get_state())
+        if options['reset']:
+            kumascript.reset_connection_stats()
@@ -0,0 +1,28 @@
+"""
+Evict the least recently used KumaScript bodies from the filesystem body
+store, until it fits in KUMASCRIPT_BODY_STORE_MAX_SIZE bytes.
+
+The store is local to each host and isn't pruned while rendering, so run this
+periodically on every host when KUMASCRIPT_BODY_STORE is 'filesystem'.
+"""
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import NoArgsCommand
+
+from kuma.wiki.body_store import FilesystemBodyStore
+
+
+class Command(NoArgsCommand):
+    help = 'Evict the least recently used bodies of the KumaScript body store'
+    option_list = NoArgsCommand.option_list + (
+        make_option('--max-size', type='int',
+                    default=settings.KUMASCRIPT_BODY_STORE_MAX_SIZE,
+                    help='The size in bytes to prune the store to'),
+    )
+
+    def handle_noargs(self, **options):
+        evicted, evicted_size = FilesystemBodyStore().prune(
+            options['max_size'])
+        self.stdout.write('Evicted %s bodies, %s bytes' %
+                          (evicted, evicted_size))
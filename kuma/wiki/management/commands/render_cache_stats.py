@@ -0,0 +1,25 @@
+"""
+Show the hit/miss stats of the content-keyed cache of KumaScript results.
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from kuma.wiki import render_cache
+
+
+class Command(BaseCommand):
+    help = "Show the stats of the KumaScript render cache"
+    option_list = BaseCommand.option_list + (
+        make_option('--reset', dest='reset', default=False,
+                    action='store_true',
+                    help='Reset the stats after showing them'),
+    )
+
+    def handle(self, *args, **options):
+        stats = render_cache.get_stats()
+        for stat in render_cache.STATS:
+            self.stdout.write('%s: %s' % (stat, stats[stat]))
+        self.stdout.write('hit rate: %.1f%%' % (stats['hit_rate'] * 100))
+        if options['reset']:
+            render_cache.reset_stats()
@@ -2,22 +2,18 @@
 """
 Manually schedule the rendering of a document
 """
-from __future__ import division
-
 import datetime
 import logging
-from math import ceil
 from optparse import make_option
 
-from celery import chain
-
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from django.db.models import Q
 
-from kuma.core.utils import chunked
-from kuma.wiki.models import Document, DocumentRenderingInProgress
-from kuma.wiki.tasks import (email_render_document_progress, render_document,
-                             render_document_chunk)
+from kuma.wiki import render_queue
+from kuma.wiki.models import (Document, DocumentRenderingInProgress,
+                              DocumentRenderJob)
+from kuma.wiki.tasks import render_document, run_render_job
 from kuma.wiki.templatetags.jinja_helpers import absolutify
 
 
@@ -45,6 +41,22 @@ class Command(BaseCommand):
         make_option('--defer', action='store_true', dest='defer',
                     default=False,
                     help='Defer rendering by chaining tasks via celery'),
+        make_option('--queue', action='store_true', dest='queue',
+                    default=False,
+                    help='With --all, render the documents through the '
+                         'render queue, by order of priority'),
+        make_option('--chunk-size', dest='chunk_size', type='int',
+                    default=settings.WIKI_RENDER_JOB_CHUNK_SIZE,
+                    help='With --all, the number of documents rendered by '
+                         'each task of the render job'),
+        make_option('--parallelism', dest='parallelism', type='int',
+                    default=settings.WIKI_RENDER_JOB_PARALLELISM,
+                    help='With --all, the number of tasks of the render job '
+                         'running at a time'),
+        make_option('--resume', dest='resume', type='int', default=None,
+                    help='Resume the render job with this id after its '
+                         'workers died, rendering again the chunks which '
+                         'were running or failed'),
     )
 
     def handle(self, *args, **options):
@@ -55,7 +67,16 @@ class Command(BaseCommand):
         else:
             self.cache_control = 'max-age=0'
 
-        if options['all']:
+        if options['resume']:
+            try:
+                job = DocumentRenderJob.objects.get(pk=options['resume'])
+            except DocumentRenderJob.DoesNotExist:
+                raise CommandError('No render job %s' % options['resume'])
+            job.resume()
+            log.info(u'Resuming render job %s' % job.pk)
+            run_render_job.delay(job.pk)
+
+        elif options['all']:
             # Query all documents, excluding those whose `last_rendered_at` is
             # within `min_render_age` or NULL.
             min_render_age = (
@@ -67,7 +88,12 @@ class Command(BaseCommand):
             docs = docs.order_by('-modified')
             docs = docs.values_list('id', flat=True)
 
-            self.chain_render_docs(docs)
+            if self.options['queue']:
+                count = render_queue.enqueue(docs)
+                render_queue.start_workers()
+                log.info(u'Queued the rendering of %s documents' % count)
+            else:
+                self.start_render_job(docs)
 
         else:
             if not len(args) == 1:
@@ -92,21 +118,13 @@ class Command(BaseCommand):
                     log.error(
                         u'Rendering is already in progress for this document.')
 
-    def chain_render_docs(self, docs):
-        tasks = []
-        count = 0
-        total = len(docs)
-        n = int(ceil(total / 5))
-        chunks = chunked(docs, n)
-
-        for chunk in chunks:
-            count += len(chunk)
-            tasks.append(
-                render_document_chunk.si(chunk, self.cache_control,
-                                         self.base_url, self.options['force']))
-            percent_complete = int(ceil((count / total) * 100))
-            tasks.append(
-                email_render_document_progress.si(percent_complete, total))
-
-        # Make it so.
-        chain(*tasks).apply_async()
+    def start_render_job(self, docs):
+        docs = list(docs)
+        job = DocumentRenderJob.create_for(
+            docs, self.options['chunk_size'],
+            cache_control=self.cache_control, base_url=self.base_url,
+            force=self.options['force'],
+            parallelism=self.options['parallelism'])
+        log.info(u'Started render job %s of %s documents, resume it with '
+                 u'--resume=%s' % (job.pk, len(docs), job.pk))
+        run_render_job.delay(job.pk)
@@ -0,0 +1,28 @@
+"""
+Show how often the requests for documents without rendered HTML took the
+render lease, waited for it or fell back to the raw HTML.
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from kuma.wiki import render_lease
+
+
+class Command(BaseCommand):
+    help = "Show the stats of the render leases"
+    option_list = BaseCommand.option_list + (
+        make_option('--reset', dest='reset', default=False,
+                    action='store_true',
+                    help='Reset the stats after showing them'),
+    )
+
+    def handle(self, *args, **options):
+        stats = render_lease.get_stats()
+        total = sum(stats.values())
+        for stat in render_lease.STATS:
+            self.stdout.write('%s: %s (%.1f%%)' %
+                              (stat, stats[stat],
+                               total and stats[stat] * 100.0 / total))
+        if options['reset']:
+            render_lease.reset_stats()
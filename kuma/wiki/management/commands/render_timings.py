@@ -0,0 +1,34 @@
+"""
+Show the render timings of the slowest documents, recorded while the
+wiki_render_timing switch is active.
+"""
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from kuma.wiki.models import DocumentRenderTiming
+from kuma.wiki.render_timing import PHASES
+
+
+class Command(NoArgsCommand):
+    help = 'Show the render timings of the slowest documents'
+    option_list = NoArgsCommand.option_list + (
+        make_option('--limit', type='int', default=20,
+                    help='The number of documents to show'),
+    )
+
+    def handle_noargs(self, **options):
+        timings = (DocumentRenderTiming.objects.select_related('document')
+                                               .order_by('-median_duration'))
+        for timing in timings[:options['limit']]:
+            document = timing.document
+            self.stdout.write(u'%s/%s%s' % (
+                document.locale, document.slug,
+                document.defer_rendering and ' (deferred)' or ''))
+            self.stdout.write('  median: %.2fs, last: %.2fs' %
+                              (timing.median_duration, timing.last_duration))
+            medians = timing.get_phase_medians()
+            self.stdout.write('  phases: %s' % ', '.join(
+                '%s %.2fs' % (phase, medians[phase]) for phase in PHASES))
+            self.stdout.write('  durations: %s' % ', '.join(
+                '%s %s' % bucket for bucket in timing.get_histogram()))
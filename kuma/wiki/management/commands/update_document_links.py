@@ -0,0 +1,37 @@
+"""
+Record the documents linked to by every document, see DocumentLink.
+
+The links of a document are recorded when it's rendered, so run this once
+for the documents rendered before, for the red links to a document to be
+refreshed when it's created or deleted.
+"""
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from kuma.core.utils import chunked
+from kuma.wiki.models import Document
+
+
+class Command(NoArgsCommand):
+    help = 'Record the documents linked to by every document'
+    option_list = NoArgsCommand.option_list + (
+        make_option('--locale', dest='locale', default=None,
+                    help='Only record the links of documents of this locale'),
+        make_option('--chunk-size', dest='chunk_size', type='int',
+                    default=100,
+                    help='Number of documents to load at once'),
+    )
+
+    def handle_noargs(self, **options):
+        docs = Document.objects.order_by('pk')
+        if options['locale']:
+            docs = docs.filter(locale=options['locale'])
+        pks = list(docs.values_list('pk', flat=True))
+        for index, chunk in enumerate(chunked(pks, options['chunk_size'])):
+            for doc in (Document.objects.filter(pk__in=chunk)
+                                        .only('pk', 'html', 'rendered_html')):
+                doc.update_links(doc.get_doc_links())
+            self.stdout.write(u'%s/%s documents' %
+                              (min((index + 1) * options['chunk_size'],
+                                   len(pks)), len(pks)))
@@ -0,0 +1,40 @@
+"""
+Record the macros called by every document, and the templates called by
+every template, see DocumentMacro.
+
+The macros of a document are recorded when it's rendered, and those of a
+template when it's saved, so run this once for the documents rendered and
+templates saved before, for the documents depending on a template to be
+rendered again when it's changed.
+"""
+from optparse import make_option
+
+from django.core.management.base import NoArgsCommand
+
+from kuma.core.utils import chunked
+from kuma.wiki.models import Document
+
+
+class Command(NoArgsCommand):
+    help = 'Record the macros called by every document'
+    option_list = NoArgsCommand.option_list + (
+        make_option('--locale', dest='locale', default=None,
+                    help='Only record the macros of documents of this '
+                         'locale'),
+        make_option('--chunk-size', dest='chunk_size', type='int',
+                    default=100,
+                    help='Number of documents to load at once'),
+    )
+
+    def handle_noargs(self, **options):
+        docs = Document.objects.order_by('pk')
+        if options['locale']:
+            docs = docs.filter(locale=options['locale'])
+        pks = list(docs.values_list('pk', flat=True))
+        for index, chunk in enumerate(chunked(pks, options['chunk_size'])):
+            for doc in (Document.objects.filter(pk__in=chunk)
+                                        .only('pk', 'html', 'is_template')):
+                doc.update_macros(doc.get_macro_names())
+            self.stdout.write(u'%s/%s documents' %
+                              (min((index + 1) * options['chunk_size'],
+                                   len(pks)), len(pks)))
@@ -1,17 +1,26 @@
+import logging
+import time
 from datetime import date, datetime, timedelta
 
+from django.conf import settings
 from django.core import serializers
-from django.db import models
+from django.db import connections, models
 
-import bleach
+import waffle
 from constance import config
 
-from .constants import (ALLOWED_TAGS, ALLOWED_ATTRIBUTES, ALLOWED_STYLES,
-                        TEMPLATE_TITLE_PREFIX)
+from kuma.core.cache import memcache
+from kuma.core.utils import chunked
+
+from .cleaner import get_cleaner
+from .constants import TEMPLATE_TITLE_PREFIX
 from .content import parse as parse_content
 from .queries import TransformQuerySet
 
 
+log = logging.getLogger('kuma.wiki.managers')
+
+
 class TransformManager(models.Manager):
 
     def get_queryset(self):
@@ -28,22 +37,156 @@ class BaseDocumentManager(models.Manager):
                .filterAHrefProtocols(blocked_protocols)
                .serialize())
 
-        if use_constance_bleach_whitelists:
-            tags = config.BLEACH_ALLOWED_TAGS
-            attributes = config.BLEACH_ALLOWED_ATTRIBUTES
-            styles = config.BLEACH_ALLOWED_STYLES
-        else:
-            tags = ALLOWED_TAGS
-            attributes = ALLOWED_ATTRIBUTES
-            styles = ALLOWED_STYLES
-
-        out = bleach.clean(out, attributes=attributes, tags=tags,
-                           styles=styles)
-        return out
+        return get_cleaner(use_constance_bleach_whitelists).clean(out)
 
     def get_by_natural_key(self, locale, slug):
         return self.get(locale=locale, slug=slug)
 
+    def render_documents(self, documents, cache_control=None, base_url=None,
+                         timeout=None, workers=None):
+        """
+        Render documents like Document.render, but making the kumascript
+        requests of all of them concurrently with kumascript.get_many, and
+        noting when their rendering started with a single query. The cached
+        content fields are built by up to workers processes, see
+        render_pool, WIKI_RENDER_POOL_WORKERS by default.
+
+        Returns a list of (document, exception) tuples for the documents
+        rendered, with the exception raised while saving the document, if
+        any. Documents which were already being rendered are left out, as
+        are those left alone while kumascript is unavailable.
+        """
+        from . import kumascript, render_cache, render_pool
+        from .render_timing import RenderTimer
+
+        if not base_url:
+            base_url = settings.SITE_URL
+
+        documents = [document for document in documents
+                     if not document.is_rendering_in_progress]
+        if not documents:
+            return []
+
+        now = datetime.now()
+        (self.filter(pk__in=[document.pk for document in documents])
+             .update(render_started_at=now))
+        for document in documents:
+            document.render_started_at = now
+            document.render_timer = RenderTimer()
+
+        pending = [document for document in documents
+                   if not document.render_without_kumascript_get(
+                       cache_control, base_url, timeout=timeout)]
+        if pending:
+            if waffle.switch_is_active('wiki_render_cache'):
+                get_many = render_cache.render_many
+            else:
+                get_many = kumascript.get_many
+            results = get_many(pending, cache_control, base_url,
+                               timeout=timeout)
+            for document, (rendered_html, errors) in zip(pending, results):
+                if document.should_abort_rendering(errors):
+                    document.abort_rendering()
+                    documents.remove(document)
+                else:
+                    document.set_rendered(rendered_html, errors)
+
+        if workers is None:
+            workers = settings.WIKI_RENDER_POOL_WORKERS
+        artifacts = [None] * len(documents)
+        if workers > 1 and len(documents) > 1:
+            start = time.time()
+            try:
+                artifacts = render_pool.build_many(
+                    [document.get_render_artifacts_args()
+                     for document in documents], workers)
+            except Exception:
+                # Build them again one by one, to fail only the documents
+                # at fault.
+                log.exception('Failed to build render artifacts in the '
+                              'render pool')
+            duration = (time.time() - start) / len(documents)
+            for document in documents:
+                document.render_timer.add('parse', duration)
+
+        rendered = []
+        if not waffle.switch_is_active('wiki_render_only_save'):
+            for document, built in zip(documents, artifacts):
+                try:
+                    document.finish_rendering(artifacts=built)
+                except Exception as exc:
+                    rendered.append((document, exc))
+                else:
+                    rendered.append((document, None))
+            return rendered
+
+        # Save the renderings of the whole batch at once
+        finished = []
+        for document, built in zip(documents, artifacts):
+            try:
+                document.finish_rendering(save=False, artifacts=built)
+            except Exception as exc:
+                rendered.append((document, exc))
+            else:
+                finished.append(document)
+        try:
+            self.save_renderings(finished)
+        except Exception as exc:
+            rendered.extend((document, exc) for document in finished)
+            return rendered
+        for document in finished:
+            try:
+                document.rendering_saved()
+            except Exception as exc:
+                rendered.append((document, exc))
+            else:
+                rendered.append((document, None))
+        return rendered
+
+    def save_renderings(self, documents):
+        """
+        Save the renderings of documents like Document.save_rendering, but
+        with a single UPDATE query for up to WIKI_RENDER_SAVE_BATCH_SIZE
+        documents, setting each field with a CASE on the pk.
+
+        The query is built by hand, since building the equivalent Case
+        expressions with the ORM costs more than the queries it saves.
+        """
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        fields = [self.model._meta.get_field(name)
+                  for name in self.model.RENDER_FIELDS]
+        pk_column = quote_name(self.model._meta.pk.column)
+        now = datetime.now()
+        for chunk in chunked(documents, settings.WIKI_RENDER_SAVE_BATCH_SIZE):
+            start = time.time()
+            for document in chunk:
+                document.modified = now
+            assignments, params = [], []
+            for field in fields:
+                assignments.append('%s = CASE %s %s END' % (
+                    quote_name(field.column), pk_column,
+                    ' '.join(['WHEN %s THEN %s'] * len(chunk))))
+                for document in chunk:
+                    params.extend((document.pk, field.get_db_prep_save(
+                        getattr(document, field.attname),
+                        connection=connection)))
+            params.extend(document.pk for document in chunk)
+            sql = 'UPDATE %s SET %s WHERE %s IN (%s)' % (
+                quote_name(self.model._meta.db_table),
+                ', '.join(assignments), pk_column,
+                ', '.join(['%s'] * len(chunk)))
+            connection.cursor().execute(sql, params)
+
+            memcache.set_many(dict(
+                (document.last_modified_cache_key,
+                 document.modified.strftime('%s'))
+                for document in chunk))
+            duration = (time.time() - start) / len(chunk)
+            for document in chunk:
+                if document.render_timer is not None:
+                    document.render_timer.add('save', duration)
+
     def get_by_stale_rendering(self):
         """Find documents whose renderings have gone stale"""
         return (self.exclude(render_expires__isnull=True)
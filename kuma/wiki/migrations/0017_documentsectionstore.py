@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0016_extend_revision_ip'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentSectionStore',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('source_hash', models.CharField(max_length=40)),
+                ('source_index', models.TextField()),
+                ('rendered_hash', models.CharField(max_length=40)),
+                ('raw_html', models.TextField()),
+                ('raw_sections', models.TextField()),
+                ('document', models.OneToOneField(related_name='section_store', to='wiki.Document')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+    ]
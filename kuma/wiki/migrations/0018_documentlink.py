@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0017_documentsectionstore'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentLink',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('locale', models.CharField(max_length=7)),
+                ('slug', models.CharField(max_length=255)),
+                ('document', models.ForeignKey(related_name='links', to='wiki.Document')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='documentlink',
+            unique_together=set([('document', 'locale', 'slug')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='documentlink',
+            index_together=set([('locale', 'slug')]),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0018_documentlink'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='rendered_source_hash',
+            field=models.CharField(max_length=40, null=True, editable=False, blank=True),
+            preserve_default=True,
+        ),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0020_documentmacro'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentRenderTiming',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('renders', models.TextField(default=b'[]')),
+                ('median_duration', models.FloatField(default=0, db_index=True)),
+                ('last_duration', models.FloatField(default=0)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('document', models.OneToOneField(related_name='render_timing', to='wiki.Document')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0021_documentrendertiming'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentRenderQueueItem',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('priority', models.FloatField(db_index=True)),
+                ('queued_at', models.DateTimeField(auto_now_add=True)),
+                ('claim', models.CharField(max_length=32, null=True, db_index=True)),
+                ('claimed_at', models.DateTimeField(null=True)),
+                ('document', models.ForeignKey(related_name='render_queue_items', to='wiki.Document')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wiki', '0022_documentrenderqueueitem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentRenderJob',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(null=True, blank=True)),
+                ('cache_control', models.CharField(max_length=64, blank=True)),
+                ('base_url', models.CharField(max_length=255, blank=True)),
+                ('force', models.BooleanField(default=False)),
+                ('parallelism', models.PositiveSmallIntegerField(default=4)),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.CreateModel(
+            name='DocumentRenderJobChunk',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('index', models.PositiveIntegerField()),
+                ('pks', models.TextField()),
+                ('status', models.CharField(default=b'pending', max_length=16, db_index=True, choices=[(b'pending', b'Pending'), (b'running', b'Running'), (b'done', b'Done'), (b'failed', b'Failed')])),
+                ('started_at', models.DateTimeField(null=True, blank=True)),
+                ('finished_at', models.DateTimeField(null=True, blank=True)),
+                ('failures', models.TextField(default=b'{}')),
+                ('job', models.ForeignKey(related_name='chunks', to='wiki.DocumentRenderJob')),
+            ],
+            options={
+                'ordering': ('job', 'index'),
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='documentrenderjobchunk',
+            unique_together=set([('job', 'index')]),
+        ),
+    ]
@@ -25,20 +25,24 @@ from tidings.models import NotificationsMixin
 from kuma.attachments.models import Attachment
 from kuma.core.cache import memcache
 from kuma.core.exceptions import ProgrammingError
+from kuma.core.utils import chunked
 from kuma.core.i18n import get_language_mapping
 from kuma.core.urlresolvers import reverse
 from kuma.search.decorators import register_live_index
 from kuma.spam.models import AkismetSubmission, SpamAttempt
 
-from . import kumascript
+from . import kumascript, pending_renders, render_cache, render_lease
 from .constants import (DEKI_FILE_URL, DOCUMENT_LAST_MODIFIED_CACHE_KEY_TMPL,
-                        KUMA_FILE_URL, REDIRECT_CONTENT, REDIRECT_HTML,
+                        KUMA_FILE_URL, KUMASCRIPT_UNAVAILABLE_ERROR,
+                        REDIRECT_CONTENT, REDIRECT_HTML,
                         TEMPLATE_TITLE_PREFIX)
 from .content import parse as parse_content
-from .content import (H2TOCFilter, H3TOCFilter, SectionTOCFilter,
+from .content import (MACRO_RE, TEMPLATE_CALL_RE, H2TOCFilter, H3TOCFilter, SectionTOCFilter,
+                      build_render_artifacts, compact_section_index,
                       extract_code_sample, extract_css_classnames,
                       extract_html_attributes, extract_kumascript_macro_names,
-                      get_content_sections, get_seo_description)
+                      find_changed_sections, get_content_sections,
+                      get_seo_description, splice_sections)
 from .exceptions import (DocumentRenderedContentNotAvailable,
                          DocumentRenderingInProgress, PageMoveError,
                          SlugCollision, UniqueCollision)
@@ -46,6 +50,7 @@ from .jobs import DocumentContributorsJob, DocumentZoneStackJob
 from .managers import (DeletedDocumentManager, DocumentAdminManager,
                        DocumentManager, RevisionIPManager,
                        TaggedDocumentManager, TransformManager)
+from .render_timing import PHASES, RenderTimer, histogram, median
 from .search import WikiDocumentType
 from .signals import render_done
 from .templatetags.jinja_helpers import absolutify
@@ -79,6 +84,11 @@ def cache_with_field(field_name):
     return decorator
 
 
+def content_hash(content):
+    """Return the SHA1 hexdigest of some content, as used for ETags"""
+    return hashlib.sha1(content.encode('utf8')).hexdigest()
+
+
 def _inherited(parent_attr, direct_attr):
     """Return a descriptor delegating to an attr of the original document.
 
@@ -250,6 +260,10 @@ class Document(NotificationsMixin, models.Model):
     # Timestamp when this document was last rendered
     last_rendered_at = models.DateTimeField(null=True, db_index=True)
 
+    # SHA1 of the raw HTML this document was last rendered from
+    rendered_source_hash = models.CharField(max_length=40, editable=False,
+                                            blank=True, null=True)
+
     # Maximum age (in seconds) before this document needs re-rendering
     render_max_age = models.IntegerField(blank=True, null=True)
 
@@ -294,6 +308,21 @@ class Document(NotificationsMixin, models.Model):
     deleted_objects = DeletedDocumentManager()
     admin_objects = DocumentAdminManager()
 
+    # The RenderTimer of the rendering in progress, see render_timing
+    render_timer = None
+    # The DocumentRenderTiming recording the rendering once it's saved
+    pending_render_timing = None
+    # The SHA1 of the raw HTML and the compacted index of its sections, when
+    # parsed by render_changed_sections, see update_section_store
+    source_section_index = None
+
+    # The fields set by a rendering, saved by save_rendering
+    RENDER_FIELDS = ('rendered_html', 'rendered_errors', 'rendered_source_hash',
+                     'body_html', 'quick_links_html', 'zone_subnav_local_html',
+                     'toc_html', 'summary_html', 'summary_text',
+                     'last_rendered_at', 'defer_rendering', 'render_expires',
+                     'modified')
+
     def __unicode__(self):
         return u'%s (%s)' % (self.get_absolute_url(), self.title)
 
@@ -337,16 +366,133 @@ class Document(NotificationsMixin, models.Model):
     def get_summary_text(self, *args, **kwargs):
         return self.get_summary(strip_markup=True)
 
-    def regenerate_cache_with_fields(self):
-        """Regenerate fresh content for all the cached fields"""
-        # TODO: Maybe @cache_with_field can build a registry over which this
-        # method can iterate?
-        self.get_body_html(force_fresh=True)
-        self.get_quick_links_html(force_fresh=True)
-        self.get_zone_subnav_local_html(force_fresh=True)
-        self.get_toc_html(force_fresh=True)
-        self.get_summary_html(force_fresh=True)
-        self.get_summary_text(force_fresh=True)
+    def get_render_artifacts_args(self):
+        """
+        Return the arguments of build_render_artifacts for the cached fields
+        of this document, as a (src, base_url, locale, toc_filter) tuple.
+        """
+        html = self.rendered_html and self.rendered_html or self.html
+        toc_filter = None
+        if self.current_revision and self.current_revision.toc_depth:
+            toc_filter = self.TOC_FILTERS[self.current_revision.toc_depth]
+        return html, settings.SITE_URL, self.locale, toc_filter
+
+    def regenerate_cache_with_fields(self, artifacts=None):
+        """
+        Regenerate fresh content for all the cached fields
+
+        This produces the same content as calling each of the @cache_with_field
+        methods with force_fresh=True, but parses the HTML only once. The
+        documents linked to are recorded along the way. The result of
+        build_render_artifacts can be passed in when it was built elsewhere,
+        see render_pool.
+
+        Returns the names of the fields set.
+        """
+        html, base_url, locale, toc_filter = self.get_render_artifacts_args()
+        if artifacts is None:
+            artifacts = build_render_artifacts(html, base_url=base_url,
+                                               locale=locale,
+                                               toc_filter=toc_filter)
+        artifacts = dict(artifacts)
+        self.update_section_store(html, artifacts.pop('sections'))
+        doc_links = artifacts.pop('doc_links')
+        if self.pk:
+            self.update_links(doc_links)
+        for field_name, value in artifacts.items():
+            setattr(self, field_name, value)
+        return artifacts.keys()
+
+    def refresh_cache_with_fields(self):
+        """
+        Regenerate the cached fields and write them straight to the database,
+        e.g. when the documents linked to have been created or deleted.
+
+        Unlike save(), this leaves the modification time and everything else
+        about the document alone.
+        """
+        field_names = self.regenerate_cache_with_fields()
+        Document.objects.filter(pk=self.pk).update(
+            **dict((name, getattr(self, name)) for name in field_names))
+
+    def get_doc_links(self):
+        """
+        Return the set of the lower-cased (locale, slug) of the documents
+        linked to in the rendered (or raw) HTML of this document, as recorded
+        by update_links when it's rendered.
+        """
+        html = self.rendered_html and self.rendered_html or self.html
+        doc_links = set()
+        if html:
+            (parse_content(html).annotateLinks(base_url=settings.SITE_URL,
+                                               doc_links=doc_links)
+                                .serialize())
+        return doc_links
+
+    def update_links(self, doc_links):
+        """
+        Replace the recorded links of this document with the given set of
+        lower-cased (locale, slug) of the documents linked to.
+        """
+        locale_length = DocumentLink._meta.get_field('locale').max_length
+        slug_length = DocumentLink._meta.get_field('slug').max_length
+        doc_links = set((locale, slug) for locale, slug in doc_links
+                        if len(locale) <= locale_length and
+                        len(slug) <= slug_length)
+        existing = dict(((locale, slug), pk) for pk, locale, slug in
+                        self.links.values_list('pk', 'locale', 'slug'))
+        stale = [pk for link, pk in existing.items()
+                 if link not in doc_links]
+        if stale:
+            DocumentLink.objects.filter(pk__in=stale).delete()
+        DocumentLink.objects.bulk_create(
+            DocumentLink(document=self, locale=locale, slug=slug)
+            for locale, slug in doc_links - set(existing))
+
+    def get_macro_names(self):
+        """
+        Return the set of the lower-cased names of the macros called in this
+        document, or of the templates called by this template.
+        """
+        if not self.html:
+            return set()
+        regex = self.is_template and TEMPLATE_CALL_RE or MACRO_RE
+        return set(name.lower() for name in regex.findall(self.html))
+
+    def update_macros(self, names):
+        """
+        Replace the recorded macros of this document with the given set of
+        lower-cased macro names.
+        """
+        max_length = DocumentMacro._meta.get_field('name').max_length
+        names = set(name for name in names if len(name) <= max_length)
+        existing = dict((name, pk) for pk, name in
+                        self.macros.values_list('pk', 'name'))
+        stale = [pk for name, pk in existing.items() if name not in names]
+        if stale:
+            DocumentMacro.objects.filter(pk__in=stale).delete()
+        DocumentMacro.objects.bulk_create(
+            DocumentMacro(document=self, name=name)
+            for name in names - set(existing))
+
+    def get_template_dependents(self):
+        """
+        Return the documents calling this template, directly or through
+        other templates.
+        """
+        names = set([self.slug[len(TEMPLATE_TITLE_PREFIX):].lower()])
+        callees = names
+        while callees:
+            callers = (DocumentMacro.objects
+                                    .filter(name__in=callees,
+                                            document__is_template=True)
+                                    .values_list('document__slug', flat=True))
+            callees = set(slug[len(TEMPLATE_TITLE_PREFIX):].lower()
+                          for slug in callers) - names
+            names.update(callees)
+        return (Document.objects.filter(is_template=False,
+                                        macros__name__in=names)
+                                .distinct())
 
     def get_zone_subnav_html(self):
         """
@@ -377,13 +523,73 @@ class Document(NotificationsMixin, models.Model):
             content = self.html
         return self.extract_section(content, section_id, ignore_heading)
 
+    def get_section_store(self):
+        """Get the DocumentSectionStore of this document, if rendered"""
+        try:
+            return self.section_store
+        except DocumentSectionStore.DoesNotExist:
+            return None
+
+    def update_section_store(self, content, sections):
+        """
+        Store the sections of the rendered (or raw) HTML of this document,
+        pre-extracted by build_section_store, along with the index of the
+        sections of its raw HTML.
+
+        The raw HTML is only parsed for its index when it changed since the
+        store was written, and wasn't already parsed by
+        render_changed_sections.
+        """
+        if not self.pk:
+            return
+        source_hash = content_hash(self.html or '')
+        if content == self.html:
+            source_index = json.dumps(sections['plain'])
+        elif (self.source_section_index and
+                self.source_section_index[0] == source_hash):
+            source_index = json.dumps(self.source_section_index[1])
+        else:
+            store = self.get_section_store()
+            if store is not None and store.source_hash == source_hash:
+                source_index = store.source_index
+            else:
+                source_index = json.dumps(compact_section_index(
+                    parse_content(self.html or '').indexSections()))
+        values = {
+            'source_hash': source_hash,
+            'source_index': source_index,
+            'rendered_hash': content_hash(content),
+            'raw_html': sections['raw']['html'],
+            'raw_sections': json.dumps(sections['raw']['sections']),
+        }
+        store, created = DocumentSectionStore.objects.update_or_create(
+            document=self, defaults=values)
+        self.section_store = store
+
+    def get_stored_section(self, content, section_id):
+        """
+        Look up a section of the raw or rendered HTML of this document as
+        served to ?raw views in the section store.
+
+        Returns the section HTML, or None if the section has not been
+        pre-extracted.
+        """
+        store = self.get_section_store()
+        if store is None:
+            return None
+        return store.get_raw_section(content, section_id)
+
     def calculate_etag(self, section_id=None):
         """Calculate an etag-suitable hash for document content or a section"""
         if not section_id:
             content = self.html
         else:
+            store = self.get_section_store()
+            source_index = store and store.get_source_index(self.html)
+            if source_index and section_id in source_index['sections']:
+                return '"%s"' % source_index['sections'][section_id][2]
             content = self.extract_section(self.html, section_id)
-        return '"%s"' % hashlib.sha1(content.encode('utf8')).hexdigest()
+        return '"%s"' % content_hash(content)
 
     def current_or_latest_revision(self):
         """Returns current revision if there is one, else the last created
@@ -441,11 +647,14 @@ class Document(NotificationsMixin, models.Model):
         """Attempt to get rendered content for this document"""
         # No rendered content yet, so schedule the first render.
         if not self.rendered_html:
-            try:
-                self.schedule_rendering(cache_control, base_url)
-            except DocumentRenderingInProgress:
-                # Unable to trigger a rendering right now, so we bail.
-                raise DocumentRenderedContentNotAvailable
+            if waffle.switch_is_active('wiki_render_lease'):
+                self.render_with_lease(cache_control, base_url)
+            else:
+                try:
+                    self.schedule_rendering(cache_control, base_url)
+                except DocumentRenderingInProgress:
+                    # Unable to trigger a rendering right now, so we bail.
+                    raise DocumentRenderedContentNotAvailable
 
         # If we have a cache_control directive, try scheduling a render.
         if cache_control:
@@ -472,6 +681,40 @@ class Document(NotificationsMixin, models.Model):
 
         return (self.rendered_html, errors)
 
+    def render_with_lease(self, cache_control=None, base_url=None):
+        """
+        Schedule the first rendering of this document if its render lease
+        can be taken, or else wait for the request holding it to render the
+        document, see render_lease.
+
+        Raises DocumentRenderedContentNotAvailable if the lease is taken and
+        the rendered content isn't available after waiting.
+        """
+        token = render_lease.acquire(self.pk)
+        if token is not None:
+            render_lease.record('leased')
+            try:
+                self.schedule_rendering(cache_control, base_url)
+            except DocumentRenderingInProgress:
+                raise DocumentRenderedContentNotAvailable
+            finally:
+                render_lease.release(self.pk, token)
+            return
+
+        if render_lease.wait(self.pk):
+            rendered_html, rendered_errors = (
+                Document.objects.filter(pk=self.pk)
+                                .values_list('rendered_html',
+                                             'rendered_errors')
+                                .first() or (None, None))
+            if rendered_html:
+                self.rendered_html = rendered_html
+                self.rendered_errors = rendered_errors
+                render_lease.record('waited')
+                return
+        render_lease.record('fallback')
+        raise DocumentRenderedContentNotAvailable
+
     def schedule_rendering(self, cache_control=None, base_url=None):
         """
         Attempt to schedule rendering. Honor the deferred_rendering field to
@@ -481,6 +724,11 @@ class Document(NotificationsMixin, models.Model):
         if self.is_rendering_scheduled or self.is_rendering_in_progress:
             return False
 
+        coalescing = waffle.switch_is_active('wiki_render_coalescing')
+        if coalescing and not pending_renders.request(self.pk, cache_control):
+            # Another caller scheduled it concurrently.
+            return False
+
         # Note when the rendering was scheduled. Kind of a hack, doing a quick
         # update and setting the local property rather than doing a save()
         now = datetime.now()
@@ -490,6 +738,8 @@ class Document(NotificationsMixin, models.Model):
         if (waffle.switch_is_active('wiki_force_immediate_rendering') or
                 not self.defer_rendering):
             # Attempt an immediate rendering.
+            if coalescing:
+                cache_control = pending_renders.take(self.pk, cache_control)
             self.render(cache_control, base_url)
         else:
             # Attempt to queue a rendering. If celery.conf.ALWAYS_EAGER is
@@ -513,34 +763,110 @@ class Document(NotificationsMixin, models.Model):
         now = datetime.now()
         Document.objects.filter(pk=self.pk).update(render_started_at=now)
         self.render_started_at = now
+        self.render_timer = RenderTimer()
 
         # Perform rendering and update document
+        if not self.render_without_kumascript_get(cache_control, base_url,
+                                                  timeout=timeout):
+            if waffle.switch_is_active('wiki_render_cache'):
+                render = render_cache.render
+            else:
+                render = kumascript.get
+            rendered_html, errors = render(self, cache_control, base_url,
+                                           timeout=timeout)
+            if self.should_abort_rendering(errors):
+                self.abort_rendering()
+                return
+            self.set_rendered(rendered_html, errors)
+
+        self.finish_rendering()
+
+    def should_abort_rendering(self, errors):
+        """
+        Whether to give up rendering the document after a kumascript request
+        returned errors, i.e. when kumascript was unavailable and there's a
+        last rendering to keep. A document never rendered gets the errors
+        instead, so that the rest of its rendering still happens.
+        """
+        return (errors == KUMASCRIPT_UNAVAILABLE_ERROR and
+                bool(self.rendered_html))
+
+    def abort_rendering(self):
+        """
+        Give up rendering the document while kumascript is unavailable,
+        keeping its last rendering, so that it can be rendered again as soon
+        as kumascript is back.
+        """
+        (Document.objects.filter(pk=self.pk)
+                         .update(render_started_at=None,
+                                 render_scheduled_at=None))
+        self.render_started_at = self.render_scheduled_at = None
+
+    def render_without_kumascript_get(self, cache_control, base_url,
+                                      timeout=None):
+        """
+        Render the document without requesting the whole of it from
+        kumascript when possible, i.e. when kumascript is disabled, or when
+        only some of its sections need rendering.
+
+        Returns whether the document was rendered.
+        """
         if not config.KUMASCRIPT_TIMEOUT:
             # A timeout of 0 should shortcircuit kumascript usage.
             self.rendered_html, self.rendered_errors = self.html, []
-        else:
-            self.rendered_html, errors = kumascript.get(self, cache_control,
-                                                        base_url,
-                                                        timeout=timeout)
-            self.rendered_errors = errors and json.dumps(errors) or None
+            return True
+        if (waffle.switch_is_active('wiki_incremental_rendering') and
+                cache_control != 'no-cache'):
+            rendered_html = self.render_changed_sections(cache_control,
+                                                         base_url,
+                                                         timeout=timeout)
+            if rendered_html is not None:
+                # Neither the sections left alone nor those rendered again
+                # have errors, see render_changed_sections.
+                self.set_rendered(rendered_html, None)
+                return True
+        return False
+
+    def set_rendered(self, rendered_html, errors):
+        """Set the result of a kumascript request for the document"""
+        self.rendered_html = rendered_html
+        self.rendered_errors = errors and json.dumps(errors) or None
+
+    def finish_rendering(self, save=True, artifacts=None):
+        """
+        Update and save the document after its rendered HTML was set, with
+        the result of build_render_artifacts for it if already built.
 
-        # Regenerate the cached content fields
-        self.regenerate_cache_with_fields()
+        With save=False, the document is left for the caller to save, e.g.
+        with Document.objects.save_renderings, before calling
+        rendering_saved.
+        """
+        timer = self.render_timer = self.render_timer or RenderTimer()
+        with timer.phase('parse'):
+            self.rendered_source_hash = content_hash(self.html)
+
+            # Regenerate the cached content fields
+            self.regenerate_cache_with_fields(artifacts)
+            self.update_macros(self.get_macro_names())
 
         # Finally, note the end time of rendering and update the document.
         self.last_rendered_at = datetime.now()
 
-        # If this rendering took longer than we'd like, mark it for deferred
-        # rendering in the future.
-        timeout = config.KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT
-        max_duration = timedelta(seconds=timeout)
         duration = self.last_rendered_at - self.render_started_at
-        if duration >= max_duration:
-            self.defer_rendering = True
+        timing = None
+        if waffle.switch_is_active('wiki_render_timing'):
+            timing, created = DocumentRenderTiming.objects.get_or_create(
+                document=self)
+            self.defer_rendering = timing.should_defer_rendering(
+                duration.total_seconds(), self.defer_rendering)
+        else:
+            # If this rendering took longer than we'd like, mark it for
+            # deferred rendering in the future. Only the render timings
+            # free docs from deferred jail automatically.
+            timeout = config.KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT
+            if duration >= timedelta(seconds=timeout):
+                self.defer_rendering = True
 
-        # TODO: Automatically clear the defer_rendering flag if the rendering
-        # time falls under the limit? Probably safer to require manual
-        # intervention to free docs from deferred jail.
         if self.render_max_age:
             # If there's a render_max_age, automatically update render_expires
             self.render_expires = (datetime.now() +
@@ -549,10 +875,86 @@ class Document(NotificationsMixin, models.Model):
             # Otherwise, just clear the expiration time as a one-shot
             self.render_expires = None
 
-        self.save()
+        self.pending_render_timing = timing
+        if not save:
+            return
+        with timer.phase('save'):
+            if waffle.switch_is_active('wiki_render_only_save'):
+                self.save_rendering()
+            else:
+                self.save()
+        self.rendering_saved()
+
+    def save_rendering(self):
+        """
+        Save only the fields set by a rendering, see RENDER_FIELDS.
+
+        Unlike save(), this skips the slug collision, localizability and
+        redirect checks, as well as the post_save signal, none of which
+        depend on those fields. It also leaves the source fields alone,
+        should the document have been edited while being rendered.
+        """
+        self.modified = datetime.now()
+        Document.objects.filter(pk=self.pk).update(
+            **dict((name, getattr(self, name)) for name in self.RENDER_FIELDS))
+        self.fill_last_modified_cache()
+
+    def rendering_saved(self):
+        """Record the timing of the rendering once the document is saved"""
+        timer = self.render_timer or RenderTimer()
+        self.render_timer = None
+        timing, self.pending_render_timing = self.pending_render_timing, None
+        if timing is not None:
+            duration = datetime.now() - self.render_started_at
+            timing.record(duration.total_seconds(), timer.durations)
 
         render_done.send(sender=self.__class__, instance=self)
 
+    def render_changed_sections(self, cache_control, base_url, timeout=None):
+        """
+        Render only the sections of the raw HTML which changed since it was
+        last rendered, and splice them into the current rendered HTML.
+
+        Returns the new rendered HTML, or None if the document needs a full
+        render: when the changes aren't confined to sections, when sections
+        can't be found in the rendered HTML, when the document uses macros
+        depending on the whole page, or when kumascript reports errors,
+        either for the changed sections or when last rendering the document,
+        since those can't be traced back to sections.
+        """
+        if (self.is_template or not self.rendered_html or
+                not self.rendered_source_hash or self.html is None or
+                self.rendered_errors):
+            return None
+        store = self.get_section_store()
+        if store is None or store.source_hash != self.rendered_source_hash:
+            return None
+        old = json.loads(store.source_index)
+
+        whole_page_macros = set(name.lower() for name in
+                                config.KUMASCRIPT_WHOLE_PAGE_MACROS.split())
+        macros = extract_kumascript_macro_names(self.html)
+        if whole_page_macros.intersection(name.lower() for name in macros):
+            return None
+
+        new = parse_content(self.html).indexSections()
+        self.source_section_index = (content_hash(self.html),
+                                     compact_section_index(new))
+        changed = find_changed_sections(old, new)
+        if changed is None:
+            return None
+
+        rendered_sections = {}
+        for section_id, section_html in changed.items():
+            body, errors = kumascript.post_document_content(
+                self, section_html, cache_control, base_url, timeout=timeout)
+            if errors or body is None:
+                return None
+            rendered_sections[section_id] = body
+        return splice_sections(
+            parse_content(self.rendered_html).indexSections(),
+            rendered_sections)
+
     def get_summary(self, strip_markup=True, use_rendered=True):
         """
         Attempt to get the document summary from rendered content, with
@@ -883,11 +1285,30 @@ class Document(NotificationsMixin, models.Model):
             # If this is a translation without a topic parent, try to get one.
             self.acquire_translated_topic_parent()
 
+        # Templates aren't rendered, so note the templates they call and
+        # whether their source changed now. The source is compared here
+        # rather than in the database, whose collation may ignore changes
+        # of case or trailing whitespace.
+        template_changed = False
+        if self.is_template:
+            old_html = None
+            if self.pk:
+                old_html = (Document.objects.filter(pk=self.pk)
+                                            .values_list('html', flat=True)
+                                            .first())
+            template_changed = old_html != self.html
+
         super(Document, self).save(*args, **kwargs)
 
         # Delete any cached last-modified timestamp.
         self.fill_last_modified_cache()
 
+        if self.is_template:
+            self.update_macros(self.get_macro_names())
+            if template_changed:
+                from .tasks import render_template_dependents
+                render_template_dependents.delay(self.pk)
+
     def delete(self, *args, **kwargs):
         if waffle.switch_is_active('wiki_error_on_delete'):
             # bug 863692: Temporary while we investigate disappearing pages.
@@ -928,6 +1349,16 @@ class Document(NotificationsMixin, models.Model):
         signals.pre_save.send(sender=self.__class__, instance=self)
         Document.deleted_objects.filter(pk=self.pk).update(deleted=False)
         signals.post_save.send(sender=self.__class__, instance=self)
+        self.update_linking_documents()
+
+    def update_linking_documents(self):
+        """
+        Schedule the update of the annotations of the links to this document
+        in the documents linking to it, after it has been created, moved,
+        deleted or restored.
+        """
+        from .tasks import update_linking_documents
+        update_linking_documents.delay(self.locale, self.slug)
 
     def _post_move_redirects(self, new_slug, user, title):
         """
@@ -1065,6 +1496,7 @@ class Document(NotificationsMixin, models.Model):
         # Step 5: Save this Document.
         self.slug = new_slug
         self.save()
+        self.update_linking_documents()
 
         # Step 6: Create (but don't yet save) a copy of our current
         # revision, but with the new slug and title (if title is
@@ -1456,6 +1888,313 @@ class DocumentDeletionLog(models.Model):
         }
 
 
+class DocumentSectionStore(models.Model):
+    """
+    The sections of a Document pre-extracted when it's rendered, to serve
+    ?raw&section= requests and section ETags without parsing the document,
+    and to find the sections changed by an edit, see build_section_store.
+    """
+    document = models.OneToOneField(Document, related_name='section_store')
+    # The SHA1 of the raw HTML last rendered, and the JSON index of its
+    # sections, without the HTML
+    source_hash = models.CharField(max_length=40)
+    source_index = models.TextField()
+    # The SHA1 of the rendered (or raw) HTML served, the HTML as served to
+    # ?raw views, and the JSON offsets of its sections in it
+    rendered_hash = models.CharField(max_length=40)
+    raw_html = models.TextField()
+    raw_sections = models.TextField()
+
+    def __unicode__(self):
+        return u'Sections of %s' % self.document
+
+    def get_source_index(self, content):
+        """
+        Get the index of the sections of the raw HTML of the document, if
+        the store is of that content.
+        """
+        if content and self.source_hash == content_hash(content):
+            return json.loads(self.source_index)
+        return None
+
+    def get_raw_section(self, content, section_id):
+        """
+        Get a section of the rendered or raw HTML of the document as served
+        to ?raw views, if the store is of that content and has the section.
+        """
+        if not content or self.rendered_hash != content_hash(content):
+            return None
+        section = json.loads(self.raw_sections).get(section_id)
+        if section is None:
+            return None
+        start, end = section
+        return self.raw_html[start:end]
+
+
+class DocumentLink(models.Model):
+    """
+    A link from a Document to the document at a locale and slug, which may
+    not exist (yet), recorded to update the annotations of the links to a
+    document when it's created or deleted.
+    """
+    document = models.ForeignKey(Document, related_name='links')
+    # Both lower-cased, as links are case insensitive.
+    locale = models.CharField(max_length=7)
+    slug = models.CharField(max_length=255)
+
+    class Meta:
+        unique_together = ('document', 'locale', 'slug')
+        index_together = [('locale', 'slug')]
+
+    def __unicode__(self):
+        return u'%s -> /%s/docs/%s' % (self.document, self.locale, self.slug)
+
+
+class DocumentMacro(models.Model):
+    """
+    A KumaScript macro called in a Document, or a template called by a
+    template Document, recorded to re-render the documents depending on a
+    template when it's changed.
+    """
+    document = models.ForeignKey(Document, related_name='macros')
+    # Lower-cased, like the names of the macros in KumaScript.
+    name = models.CharField(max_length=255, db_index=True)
+
+    class Meta:
+        unique_together = ('document', 'name')
+
+    def __unicode__(self):
+        return u'%s -> %s' % (self.document, self.name)
+
+
+class DocumentRenderTiming(models.Model):
+    """
+    The durations of the last WIKI_RENDER_TIMING_WINDOW renderings of a
+    Document, broken down into the phases of render_timing, used to find the
+    slowest documents and to move documents in and out of deferred rendering.
+    """
+    document = models.OneToOneField(Document, related_name='render_timing')
+    # JSON list of the recent renderings, the oldest first, each a dict of
+    # the durations of its phases and its total duration, in seconds.
+    renders = models.TextField(default='[]')
+    median_duration = models.FloatField(default=0, db_index=True)
+    last_duration = models.FloatField(default=0)
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u'%s: %.2fs' % (self.document, self.median_duration)
+
+    def get_renders(self):
+        return json.loads(self.renders)
+
+    def get_durations(self):
+        return [render['total'] for render in self.get_renders()]
+
+    def get_phase_medians(self):
+        renders = self.get_renders()
+        return dict((phase, median(render.get(phase, 0.0)
+                                   for render in renders))
+                    for phase in PHASES)
+
+    def get_histogram(self):
+        return histogram(self.get_durations())
+
+    def record(self, duration, phase_durations):
+        """Record the durations of a rendering"""
+        render = dict(phase_durations, total=duration)
+        renders = (self.get_renders() +
+                   [render])[-settings.WIKI_RENDER_TIMING_WINDOW:]
+        self.renders = json.dumps(renders)
+        self.median_duration = median(render['total'] for render in renders)
+        self.last_duration = duration
+        self.save()
+
+    def should_defer_rendering(self, duration, deferred):
+        """
+        Decide whether the document should be rendered in the deferred
+        rendering queue, given the duration of its latest rendering.
+
+        A document is deferred when the median duration of its last
+        WIKI_RENDER_TIMING_RECENT renderings reaches
+        KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT, and is only undeferred once
+        they all took less than WIKI_RENDER_TIMING_UNDEFER_RATIO of it, so
+        that it doesn't go back and forth.
+        """
+        timeout = config.KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT
+        count = settings.WIKI_RENDER_TIMING_RECENT
+        recent = (self.get_durations() + [duration])[-count:]
+        if median(recent) >= timeout:
+            return True
+        if deferred:
+            undefer_timeout = timeout * settings.WIKI_RENDER_TIMING_UNDEFER_RATIO
+            return len(recent) < count or max(recent) >= undefer_timeout
+        return False
+
+
+class DocumentRenderQueueItem(models.Model):
+    """
+    A pending rendering of a Document in the render queue, see render_queue.
+    """
+    document = models.ForeignKey(Document,
+                                 related_name='render_queue_items')
+    priority = models.FloatField(db_index=True)
+    queued_at = models.DateTimeField(auto_now_add=True)
+    # The token of the worker rendering it, if any
+    claim = models.CharField(max_length=32, null=True, db_index=True)
+    claimed_at = models.DateTimeField(null=True)
+
+    def __unicode__(self):
+        return u'%s: %s' % (self.document, self.priority)
+
+
+class DocumentRenderJob(models.Model):
+    """
+    A rendering of many documents, split in chunks rendered by up to
+    parallelism tasks at a time, whose completion is recorded so that the
+    job can be resumed where it stopped if workers died.
+    """
+    created = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    cache_control = models.CharField(max_length=64, blank=True)
+    base_url = models.CharField(max_length=255, blank=True)
+    force = models.BooleanField(default=False)
+    parallelism = models.PositiveSmallIntegerField(default=4)
+
+    def __unicode__(self):
+        return u'Render job %s of %s' % (self.pk, self.created)
+
+    @classmethod
+    def create_for(cls, pks, chunk_size, **kwargs):
+        """Create a job rendering documents in chunks of chunk_size"""
+        job = cls.objects.create(**kwargs)
+        DocumentRenderJobChunk.objects.bulk_create(
+            DocumentRenderJobChunk(job=job, index=index,
+                                   pks=json.dumps(list(chunk)))
+            for index, chunk in enumerate(chunked(pks, chunk_size)))
+        return job
+
+    @property
+    def is_finished(self):
+        return self.finished_at is not None
+
+    def get_progress(self):
+        """
+        Return a dict of the number of chunks by status, with the number of
+        chunks and documents in total, and the documents which failed to
+        render.
+        """
+        progress = dict.fromkeys(
+            [status for status, _ in DocumentRenderJobChunk.STATUS_CHOICES],
+            0)
+        documents = 0
+        failures = {}
+        for chunk in self.chunks.all():
+            progress[chunk.status] += 1
+            documents += len(chunk.get_pks())
+            failures.update(chunk.get_failures())
+        progress.update(chunks=sum(progress.values()), documents=documents,
+                        failures=failures)
+        return progress
+
+    def claim_chunks(self):
+        """
+        Mark as running the next pending chunks, while fewer than
+        parallelism chunks are running, and return their pks.
+        """
+        chunks = self.chunks.all()
+        running = chunks.filter(
+            status=DocumentRenderJobChunk.STATUS_RUNNING).count()
+        pending = (chunks.filter(status=DocumentRenderJobChunk.STATUS_PENDING)
+                         .order_by('index')
+                         .values_list('pk', flat=True))
+        claimed = []
+        for pk in pending[:max(self.parallelism - running, 0)]:
+            # Another task may claim the chunk in between.
+            if (DocumentRenderJobChunk.objects
+                    .filter(pk=pk,
+                            status=DocumentRenderJobChunk.STATUS_PENDING)
+                    .update(status=DocumentRenderJobChunk.STATUS_RUNNING,
+                            started_at=datetime.now())):
+                claimed.append(pk)
+        return claimed
+
+    def finish(self):
+        """
+        Mark the job as finished if none of its chunks are pending or
+        running. Returns True if it was marked so by this call.
+        """
+        if self.chunks.filter(status__in=(
+                DocumentRenderJobChunk.STATUS_PENDING,
+                DocumentRenderJobChunk.STATUS_RUNNING)).exists():
+            return False
+        now = datetime.now()
+        finished = (DocumentRenderJob.objects
+                                     .filter(pk=self.pk,
+                                             finished_at__isnull=True)
+                                     .update(finished_at=now))
+        if finished:
+            self.finished_at = now
+        return bool(finished)
+
+    def resume(self):
+        """
+        Put the chunks which were running or failed back to pending, so that
+        the job renders them again.
+        """
+        self.chunks.filter(status__in=(
+            DocumentRenderJobChunk.STATUS_RUNNING,
+            DocumentRenderJobChunk.STATUS_FAILED)).update(
+                status=DocumentRenderJobChunk.STATUS_PENDING,
+                started_at=None, finished_at=None, failures='{}')
+        DocumentRenderJob.objects.filter(pk=self.pk).update(finished_at=None)
+        self.finished_at = None
+
+
+class DocumentRenderJobChunk(models.Model):
+    """The documents of a DocumentRenderJob rendered by one task"""
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    job = models.ForeignKey(DocumentRenderJob, related_name='chunks')
+    index = models.PositiveIntegerField()
+    # JSON list of the pks of the documents
+    pks = models.TextField()
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES,
+                              default=STATUS_PENDING, db_index=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # JSON dict of the errors of the documents which failed to render, by
+    # pk, or of the chunk itself under "chunk" if it failed.
+    failures = models.TextField(default='{}')
+
+    class Meta:
+        ordering = ('job', 'index')
+        unique_together = ('job', 'index')
+
+    def __unicode__(self):
+        return u'%s: chunk %s' % (self.job, self.index)
+
+    def get_pks(self):
+        return json.loads(self.pks)
+
+    def get_failures(self):
+        return json.loads(self.failures)
+
+    def complete(self, status, failures=None):
+        self.status = status
+        self.finished_at = datetime.now()
+        self.failures = json.dumps(failures or {})
+        self.save(update_fields=('status', 'finished_at', 'failures'))
+
+
 class DocumentZone(models.Model):
     """
     Model object declaring a content zone root at a given Document, provides
@@ -0,0 +1,75 @@
+"""
+Coalescing of the renderings of a document scheduled concurrently.
+
+Document.schedule_rendering only checks the render_scheduled_at and
+render_started_at timestamps of its own, possibly outdated, instance before
+scheduling a rendering, so that concurrent callers can schedule several
+renderings of the same document. A pending rendering is instead requested
+with memcache add, which is atomic: only the first of the concurrent
+requests schedules the rendering, the others being collapsed into it.
+
+Each request also adds the cache control it asked for, one key per
+strength, so that the rendering uses the strongest cache control requested
+until it starts, without a read-modify-write of a shared value.
+
+The pending rendering expires after KUMA_DOCUMENT_RENDER_TIMEOUT, as a
+scheduled rendering does, so that a lost rendering task doesn't prevent
+scheduling another one.
+"""
+from constance import config
+
+from kuma.core.cache import memcache
+
+
+PENDING_KEY_TMPL = 'kuma:wiki:pending_render:%s'
+CACHE_CONTROL_KEY_TMPL = 'kuma:wiki:pending_render:%s:cache_control:%s'
+
+# The cache controls forcing kumascript to render documents again, weakest
+# first. Any other cache control is weaker.
+CACHE_CONTROL_STRENGTHS = ('max-age=0', 'no-cache')
+STRENGTHS = range(len(CACHE_CONTROL_STRENGTHS) + 1)
+
+
+def strength(cache_control):
+    if cache_control in CACHE_CONTROL_STRENGTHS:
+        return CACHE_CONTROL_STRENGTHS.index(cache_control) + 1
+    return 0
+
+
+def strongest(*cache_controls):
+    """Return the strongest of cache controls, None being the weakest"""
+    cache_controls = [cache_control for cache_control in cache_controls
+                      if cache_control is not None]
+    if not cache_controls:
+        return None
+    return max(cache_controls, key=strength)
+
+
+def request(pk, cache_control=None):
+    """
+    Request the rendering of a document with a cache control.
+
+    Returns True if the caller should schedule the rendering, or False if a
+    rendering is pending already, which will use the cache control if it's
+    stronger than the one it was scheduled with.
+    """
+    timeout = config.KUMA_DOCUMENT_RENDER_TIMEOUT
+    if cache_control is not None:
+        memcache.add(CACHE_CONTROL_KEY_TMPL % (pk, strength(cache_control)),
+                     cache_control, timeout=timeout)
+    return memcache.add(PENDING_KEY_TMPL % pk, 1, timeout=timeout)
+
+
+def take(pk, cache_control=None):
+    """
+    Take the pending rendering of a document when it starts, returning the
+    strongest of the given cache control and those requested.
+
+    Requests made from then on schedule a new rendering.
+    """
+    memcache.delete(PENDING_KEY_TMPL % pk)
+    keys = [CACHE_CONTROL_KEY_TMPL % (pk, level) for level in STRENGTHS]
+    requested = memcache.get_many(keys)
+    if requested:
+        memcache.delete_many(requested.keys())
+    return strongest(cache_control, *requested.values())
@@ -0,0 +1,203 @@
+"""
+A cache of KumaScript rendering results keyed by the hash of what they
+depend on, rather than by document, so that documents with the same content,
+e.g. untranslated copies of a page or identical stubs, are only rendered once.
+
+The key covers the raw HTML, the revisions of the templates of the macros it
+calls, and, if it calls any, the KumaScript env vars listed in the
+KUMASCRIPT_RENDER_CACHE_ENV_VARS constance setting, by default the locale.
+Documents calling macros depending on the page they're used in, listed in
+the KUMASCRIPT_PAGE_MACROS constance setting, are keyed by the identity of
+their page too, PAGE_ENV_VARS, so they only share results with themselves.
+Templates called from other templates aren't covered, so entries expire
+after the same KUMASCRIPT_MAX_AGE as KumaScript's own cache. Documents
+calling macros depending on the whole page, listed in the
+KUMASCRIPT_WHOLE_PAGE_MACROS constance setting, are never cached.
+
+Entries are stored in a fixed number of memcache slots picked by key, each
+slot holding the last entry stored in it, which bounds the size of the cache
+to WIKI_RENDER_CACHE_SLOTS entries of at most WIKI_RENDER_CACHE_MAX_ENTRY_SIZE
+bytes each.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+
+from constance import config
+
+from kuma.core.cache import memcache
+
+from . import kumascript
+from .constants import TEMPLATE_TITLE_PREFIX
+from .content import MACRO_RE
+
+
+SLOT_KEY_TMPL = 'kuma:wiki:render_cache:slot:%s'
+STAT_KEY_TMPL = 'kuma:wiki:render_cache:stats:%s'
+STATS = ('hits', 'misses', 'stores', 'evictions', 'oversized')
+
+# The env vars of the identity of the page a document is at
+PAGE_ENV_VARS = ('path', 'slug', 'title', 'url')
+
+
+def record(stat):
+    """Count a cache event in memcache, shared by all processes"""
+    key = STAT_KEY_TMPL % stat
+    try:
+        memcache.incr(key)
+    except ValueError:
+        memcache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    """Return the counts of the cache events, and the hit rate"""
+    counts = memcache.get_many([STAT_KEY_TMPL % stat for stat in STATS])
+    stats = dict((stat, counts.get(STAT_KEY_TMPL % stat, 0))
+                 for stat in STATS)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = lookups and float(stats['hits']) / lookups or 0.0
+    return stats
+
+
+def reset_stats():
+    memcache.delete_many([STAT_KEY_TMPL % stat for stat in STATS])
+
+
+def get_template_versions(html):
+    """
+    Return a sorted list of the lower-cased slugs and current revision IDs
+    of the templates of the macros called in the given HTML.
+    """
+    from .models import Document
+
+    slugs = set(u'%s%s' % (TEMPLATE_TITLE_PREFIX, name)
+                for name in MACRO_RE.findall(html))
+    if not slugs:
+        return []
+    return sorted((slug.lower(), revision_id) for slug, revision_id in
+                  Document.objects.filter(locale=settings.WIKI_DEFAULT_LANGUAGE,
+                                          slug__in=slugs)
+                                  .values_list('slug', 'current_revision_id'))
+
+
+def get_macro_names(config_name):
+    """Return the lower-cased names of the macros of a constance setting"""
+    return set(name.lower() for name in getattr(config, config_name).split())
+
+
+def is_cacheable(document):
+    """
+    Return whether the rendering result of a document can be cached, i.e.
+    it doesn't call macros depending on the whole page.
+    """
+    if not (document.html and document.current_revision):
+        return False
+    return not get_macro_names('KUMASCRIPT_WHOLE_PAGE_MACROS').intersection(
+        name.lower() for name in MACRO_RE.findall(document.html))
+
+
+def build_key(document, base_url, cache_control):
+    """
+    Build the key of the rendering result of a document, from its raw HTML,
+    the versions of the templates it uses and the relevant env vars.
+    Without macros, the result only depends on the raw HTML, and is shared
+    by documents of any page and locale. With macros depending on the page
+    they're used in, it depends on the identity of the page.
+    """
+    relevant_env_vars = []
+    macros = set(name.lower() for name in MACRO_RE.findall(document.html))
+    if macros:
+        env_vars = kumascript.get_document_env_vars(document, base_url,
+                                                    cache_control)
+        names = set(config.KUMASCRIPT_RENDER_CACHE_ENV_VARS.split())
+        if get_macro_names('KUMASCRIPT_PAGE_MACROS').intersection(macros):
+            names.update(PAGE_ENV_VARS)
+        relevant_env_vars = sorted((name, env_vars.get(name))
+                                   for name in names)
+    data = json.dumps([document.html,
+                       get_template_versions(document.html),
+                       relevant_env_vars])
+    return hashlib.sha1(data).hexdigest()
+
+
+def slot_key(key):
+    return SLOT_KEY_TMPL % (int(key, 16) % settings.WIKI_RENDER_CACHE_SLOTS)
+
+
+def lookup(key):
+    """Return the cached rendered HTML for a key, or None"""
+    entry = memcache.get(slot_key(key))
+    if entry is not None and entry[0] == key:
+        record('hits')
+        return entry[1]
+    record('misses')
+    return None
+
+
+def store(key, body):
+    """Store the rendered HTML for a key, evicting the entry in its slot"""
+    if len(body.encode('utf-8')) > settings.WIKI_RENDER_CACHE_MAX_ENTRY_SIZE:
+        record('oversized')
+        return
+    slot = slot_key(key)
+    entry = memcache.get(slot)
+    if entry is not None and entry[0] != key:
+        record('evictions')
+    memcache.set(slot, (key, body), timeout=config.KUMASCRIPT_MAX_AGE)
+    record('stores')
+
+
+def render(document, cache_control, base_url, timeout=None):
+    """
+    Render a document with kumascript.get, unless the result of rendering
+    the same content is in the cache. Only results without errors of
+    cacheable documents are cached, and no-cache requests skip the lookup.
+
+    Returns a (body, errors) tuple like kumascript.get.
+    """
+    if not is_cacheable(document):
+        return kumascript.get(document, cache_control, base_url,
+                              timeout=timeout)
+    key = build_key(document, base_url, cache_control)
+    if cache_control != 'no-cache':
+        body = lookup(key)
+        if body is not None:
+            return body, None
+    body, errors = kumascript.get(document, cache_control, base_url,
+                                  timeout=timeout)
+    if body is not None and not errors:
+        store(key, body)
+    return body, errors
+
+
+def render_many(documents, cache_control, base_url, timeout=None):
+    """
+    Render documents like render, those whose results aren't cached with
+    kumascript.get_many.
+
+    Returns a list of (body, errors) tuples in the order of the documents.
+    """
+    results = [None] * len(documents)
+    misses = []
+    for index, document in enumerate(documents):
+        key = None
+        if is_cacheable(document):
+            key = build_key(document, base_url, cache_control)
+            if cache_control != 'no-cache':
+                body = lookup(key)
+                if body is not None:
+                    results[index] = body, None
+                    continue
+        misses.append((index, key))
+
+    if misses:
+        rendered = kumascript.get_many([documents[index]
+                                        for index, _ in misses],
+                                       cache_control, base_url,
+                                       timeout=timeout)
+        for (index, key), (body, errors) in zip(misses, rendered):
+            if key is not None and body is not None and not errors:
+                store(key, body)
+            results[index] = body, errors
+    return results
@@ -0,0 +1,89 @@
+"""
+Render leases, protecting documents without rendered HTML from stampedes of
+renderings when they're read by many requests at once, e.g. a popular new
+document or a tree of documents just moved.
+
+Only the request taking the lease of a document schedules its rendering,
+which is immediate unless the document defers rendering. The others wait
+for up to WIKI_RENDER_LEASE_WAIT seconds for the lease to be released and
+use the rendered HTML if it's there by then, or else fall back to the raw
+HTML of the document.
+
+How often each of these paths is taken is counted in memcache, see the
+render_lease_stats management command:
+
+- leased: the request took the lease and scheduled the rendering
+- waited: the lease was taken, and the request used the rendered HTML once
+  it was released
+- fallback: the lease was taken, and the request fell back to the raw HTML
+"""
+import time
+import uuid
+
+from django.conf import settings
+
+from constance import config
+
+from kuma.core.cache import memcache
+
+
+LEASE_KEY_TMPL = 'kuma:wiki:render_lease:%s'
+STAT_KEY_TMPL = 'kuma:wiki:render_lease:stats:%s'
+STATS = ('leased', 'waited', 'fallback')
+POLL_INTERVAL = 0.1
+
+
+def acquire(pk):
+    """
+    Take the render lease of a document, for up to
+    KUMA_DOCUMENT_RENDER_TIMEOUT seconds should it never be released.
+    Returns the token of the lease, or None if it's taken already.
+    """
+    token = uuid.uuid4().hex
+    if memcache.add(LEASE_KEY_TMPL % pk, token,
+                    timeout=config.KUMA_DOCUMENT_RENDER_TIMEOUT):
+        return token
+    return None
+
+
+def release(pk, token):
+    """Release the render lease of a document, if still held with token"""
+    key = LEASE_KEY_TMPL % pk
+    if memcache.get(key) == token:
+        memcache.delete(key)
+
+
+def wait(pk, timeout=None):
+    """
+    Wait for up to timeout seconds, WIKI_RENDER_LEASE_WAIT by default, for
+    the render lease of a document to be released. Returns True if it was.
+    """
+    if timeout is None:
+        timeout = settings.WIKI_RENDER_LEASE_WAIT
+    key = LEASE_KEY_TMPL % pk
+    deadline = time.time() + timeout
+    while memcache.get(key) is not None:
+        if time.time() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+    return True
+
+
+def record(stat):
+    """Count a render lease event in memcache, shared by all processes"""
+    key = STAT_KEY_TMPL % stat
+    try:
+        memcache.incr(key)
+    except ValueError:
+        memcache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    """Return the counts of the render lease events"""
+    counts = memcache.get_many([STAT_KEY_TMPL % stat for stat in STATS])
+    return dict((stat, counts.get(STAT_KEY_TMPL % stat, 0))
+                for stat in STATS)
+
+
+def reset_stats():
+    memcache.delete_many([STAT_KEY_TMPL % stat for stat in STATS])
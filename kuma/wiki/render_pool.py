@@ -0,0 +1,80 @@
+"""
+A pool of processes building the cached content fields of rendered
+documents, for batch renderings to parse their HTML on more than one core.
+
+Once kumascript responded, rendering a document is mostly parsing and
+serializing its HTML with html5lib in build_render_artifacts, which holds
+the GIL. Document.objects.render_documents hands these builds over to the
+pool when WIKI_RENDER_POOL_WORKERS is above 1, while the documents are
+still updated and saved in the calling process.
+
+The pool is a billiard pool, the multiprocessing fork of celery, since the
+processes of the celery workers are daemonic, and multiprocessing doesn't
+let those have children. It's created on first use and kept for the life
+of the process. The pool processes look up the slugs of links, so they
+drop the database and memcache connections inherited from the calling
+process on start, to open their own rather than share them.
+"""
+from billiard import Pool
+from django.db import connections
+
+from kuma.core.cache import memcache
+
+from .content import build_render_artifacts
+
+
+# The number of builds a pool process makes before being replaced, to bound
+# the memory held by long lived processes.
+MAX_TASKS_PER_CHILD = 1000
+
+_pool = None
+_pool_size = None
+# The database connections inherited by a pool process, referenced so that
+# they're never closed, which would end the sessions of the calling process.
+_inherited_connections = []
+
+
+def init_worker():
+    for connection in connections.all():
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+    # Closing the inherited memcache sockets leaves those of the calling
+    # process open.
+    memcache.close()
+
+
+def build(args):
+    """Build the render artifacts of (src, base_url, locale, toc_filter)"""
+    src, base_url, locale, toc_filter = args
+    return build_render_artifacts(src, base_url, locale=locale,
+                                  toc_filter=toc_filter)
+
+
+def get_pool(workers):
+    """Return the pool of worker processes"""
+    global _pool, _pool_size
+    if _pool is None or _pool_size != workers:
+        close_pool()
+        _pool = Pool(workers, initializer=init_worker,
+                     maxtasksperchild=MAX_TASKS_PER_CHILD)
+        _pool_size = workers
+    return _pool
+
+
+def close_pool():
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+    _pool = _pool_size = None
+
+
+def build_many(args, workers):
+    """
+    Build the render artifacts of many documents, see build, in up to
+    workers processes, or in this process if there is only one worker.
+    """
+    if workers <= 1 or len(args) <= 1:
+        return [build(arg) for arg in args]
+    return get_pool(workers).map(build, args, chunksize=1)
@@ -0,0 +1,151 @@
+"""
+A queue of pending document renderings, rendered by celery workers in the
+order of their priority, so that after a mass invalidation the most viewed
+documents are fresh first.
+
+The priority of a rendering is:
+
+    (1 + views) * (1 + days stale) / render cost
+
+where the views are those of the document counted by the document view in
+memcache, over the current and previous WIKI_RENDER_QUEUE_TRAFFIC_WINDOW,
+the days stale are the time since its rendering expired, or since it was
+last rendered, and the render cost is the median duration in seconds of its
+recent renderings, see DocumentRenderTiming, or
+WIKI_RENDER_QUEUE_DEFAULT_COST without render timings.
+
+Up to WIKI_RENDER_QUEUE_WORKERS process_render_queue tasks render the
+queue, each holding a worker slot in memcache and taking the
+WIKI_RENDER_QUEUE_BATCH_SIZE renderings of highest priority at a time, until
+the queue is empty.
+"""
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.conf import settings
+
+from constance import config
+
+from kuma.core.cache import memcache
+from kuma.core.utils import chunked
+
+
+VIEWS_KEY_TMPL = 'kuma:wiki:render_queue:views:%s:%s'
+WORKER_KEY_TMPL = 'kuma:wiki:render_queue:worker:%s'
+
+# The lowest render cost, in seconds, so that the documents rendering the
+# fastest don't get an unbounded priority.
+MIN_COST = 0.1
+
+
+def current_window():
+    return int(time.time() // settings.WIKI_RENDER_QUEUE_TRAFFIC_WINDOW)
+
+
+def record_view(document):
+    """Count a view of a document"""
+    key = VIEWS_KEY_TMPL % (current_window(), document.pk)
+    try:
+        memcache.incr(key)
+    except ValueError:
+        memcache.set(key, 1,
+                     timeout=2 * settings.WIKI_RENDER_QUEUE_TRAFFIC_WINDOW)
+
+
+def get_views(pks):
+    """
+    Return a dict of the number of views of documents over the current and
+    previous traffic windows, by pk.
+    """
+    window = current_window()
+    keys = dict((VIEWS_KEY_TMPL % (window - offset, pk), pk)
+                for pk in pks for offset in (0, 1))
+    views = dict.fromkeys(pks, 0)
+    for key, count in memcache.get_many(keys.keys()).items():
+        views[keys[key]] += count
+    return views
+
+
+def get_priority(views, stale_seconds, cost):
+    days_stale = max(stale_seconds, 0) / (60 * 60 * 24.0)
+    return (1 + views) * (1 + days_stale) / max(cost, MIN_COST)
+
+
+def enqueue(pks):
+    """
+    Queue the renderings of documents, updating the priority of those
+    already queued but not being rendered yet.
+
+    Returns the number of renderings queued.
+    """
+    from .models import Document, DocumentRenderQueueItem
+
+    now = datetime.now()
+    count = 0
+    for chunk in chunked(list(set(pks)), 500):
+        views = get_views(chunk)
+        items = []
+        for (pk, render_expires, last_rendered_at, modified,
+             cost) in (Document.objects.filter(pk__in=chunk)
+                                       .values_list(
+                                           'pk', 'render_expires',
+                                           'last_rendered_at', 'modified',
+                                           'render_timing__median_duration')):
+            stale_since = render_expires or last_rendered_at or modified
+            stale_seconds = (now - stale_since).total_seconds()
+            if cost is None:
+                cost = settings.WIKI_RENDER_QUEUE_DEFAULT_COST
+            items.append(DocumentRenderQueueItem(
+                document_id=pk,
+                priority=get_priority(views[pk], stale_seconds, cost)))
+        (DocumentRenderQueueItem.objects.filter(document__in=chunk,
+                                                claim__isnull=True)
+                                        .delete())
+        DocumentRenderQueueItem.objects.bulk_create(items)
+        count += len(items)
+    return count
+
+
+def claim(count):
+    """
+    Take up to count renderings of highest priority from the queue, marking
+    them as being rendered, and returns a list of (item pk, document pk)
+    tuples. The renderings taken by workers which haven't finished them
+    within KUMA_DOCUMENT_RENDER_TIMEOUT are put back into the queue.
+    """
+    from .models import DocumentRenderQueueItem
+
+    now = datetime.now()
+    expired = now - timedelta(seconds=config.KUMA_DOCUMENT_RENDER_TIMEOUT)
+    (DocumentRenderQueueItem.objects.filter(claimed_at__lt=expired)
+                                    .update(claim=None, claimed_at=None))
+
+    token = uuid.uuid4().hex
+    pending = DocumentRenderQueueItem.objects.filter(claim__isnull=True)
+    # Another worker may claim the same items in between, in which case
+    # try the next ones.
+    for attempt in range(3):
+        pks = list(pending.order_by('-priority')
+                          .values_list('pk', flat=True)[:count])
+        if not pks:
+            break
+        pending.filter(pk__in=pks).update(claim=token, claimed_at=now)
+        claimed = list(DocumentRenderQueueItem.objects
+                                              .filter(claim=token)
+                                              .order_by('-priority')
+                                              .values_list('pk',
+                                                           'document_id'))
+        if claimed:
+            return claimed
+    return []
+
+
+def start_workers():
+    """Start process_render_queue tasks in the free worker slots"""
+    from .tasks import process_render_queue
+
+    for slot in range(settings.WIKI_RENDER_QUEUE_WORKERS):
+        if memcache.add(WORKER_KEY_TMPL % slot, 1,
+                        timeout=config.KUMA_DOCUMENT_RENDER_TIMEOUT):
+            process_render_queue.delay(slot)
@@ -0,0 +1,76 @@
+"""
+Timing of the phases of document renderings:
+
+- kumascript: building and making the kumascript requests
+- bleach: cleaning the HTML rendered by kumascript
+- parse: hashing and parsing the rendered HTML for the cached content fields
+- save: saving the document
+
+A RenderTimer is set as the render_timer of a document while it's rendered,
+and the durations are recorded in its DocumentRenderTiming afterwards.
+"""
+import time
+from contextlib import contextmanager
+
+
+PHASES = ('kumascript', 'bleach', 'parse', 'save')
+
+# The upper bounds, in seconds, of the buckets of the render duration
+# histograms, the last bucket holding the longer durations.
+HISTOGRAM_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60)
+
+
+class RenderTimer(object):
+    """The durations of the phases of a rendering, in seconds"""
+
+    def __init__(self):
+        self.durations = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, phase, duration):
+        self.durations[phase] += duration
+
+    @contextmanager
+    def phase(self, phase):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(phase, time.time() - start)
+
+
+@contextmanager
+def timed(timer, phase):
+    """Time a phase with a timer, if there is one"""
+    if timer is None:
+        yield
+    else:
+        with timer.phase(phase):
+            yield
+
+
+def median(values):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def histogram(durations):
+    """
+    Return a list of (label, count) tuples of the number of durations in
+    each bucket of HISTOGRAM_BUCKETS.
+    """
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    for duration in durations:
+        for index, bound in enumerate(HISTOGRAM_BUCKETS):
+            if duration < bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+    labels = (['<%ss' % bound for bound in HISTOGRAM_BUCKETS] +
+              ['>=%ss' % HISTOGRAM_BUCKETS[-1]])
+    return zip(labels, counts)
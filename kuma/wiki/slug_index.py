@@ -0,0 +1,215 @@
+"""
+Per-locale indexes of the slugs of existing documents, used to annotate links
+to missing documents without querying the database for every document.
+
+An index is a file of the sorted 8 byte hashes of the lower-cased slugs of a
+locale, built by the build_slug_index management command and memory-mapped,
+so that all the worker processes of a host share a single copy of it.
+Documents saved or deleted since an index was built are recorded in
+memcache, which takes precedence over the index.
+
+The database is still queried for the slugs reported missing, so that a
+change record evicted from memcache can't turn the link to a new document
+into a link to a missing one. Only the links to documents deleted since the
+index was built, whose change record was evicted, or to missing documents
+whose slug hash collides with an indexed one, may be left unannotated.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.encoding import force_bytes, force_text
+
+from kuma.core.cache import memcache
+
+
+log = logging.getLogger('kuma.wiki.slug_index')
+
+HASH_SIZE = 8
+
+SLUG_CHANGE_KEY_TMPL = 'kuma:wiki:slug_index:change:%s'
+
+
+def slug_hash(slug):
+    """Hash a lower-cased slug for the index"""
+    return hashlib.md5(force_bytes(slug)).digest()[:HASH_SIZE]
+
+
+def slug_change_key(locale, slug):
+    key = u'%s/%s' % (force_text(locale), force_text(slug))
+    return SLUG_CHANGE_KEY_TMPL % hashlib.md5(force_bytes(key)).hexdigest()
+
+
+def index_path(locale):
+    return os.path.join(settings.WIKI_SLUG_INDEX_ROOT, '%s.idx' % locale)
+
+
+class SlugIndex(object):
+    """
+    The slug index of a locale, reopened whenever the index file is rebuilt.
+    """
+    def __init__(self, locale):
+        self.locale = locale
+        self.path = None
+        self.stat = None
+        self.map = None
+        self.size = 0
+
+    def is_available(self):
+        """
+        Check that the index file exists and isn't too old for the changes
+        recorded in memcache to still be around, (re)opening it if needed.
+        """
+        path = index_path(self.locale)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.close()
+            return False
+        if time.time() - stat.st_mtime > settings.WIKI_SLUG_INDEX_MAX_AGE:
+            return False
+        if (path != self.path or self.stat is None or
+                stat.st_ino != self.stat.st_ino or
+                stat.st_mtime != self.stat.st_mtime):
+            self.open(path, stat)
+        return True
+
+    def open(self, path, stat):
+        self.close()
+        self.path = path
+        self.stat = stat
+        if stat.st_size:
+            with open(self.path, 'rb') as index_file:
+                self.map = mmap.mmap(index_file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+        self.size = stat.st_size // HASH_SIZE
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.path = self.stat = self.map = None
+        self.size = 0
+
+    def __contains__(self, slug):
+        # Binary search of the sorted hashes
+        value = slug_hash(slug)
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * HASH_SIZE
+            middle_value = self.map[offset:offset + HASH_SIZE]
+            if middle_value < value:
+                low = middle + 1
+            elif middle_value > value:
+                high = middle
+            else:
+                return True
+        return False
+
+    def existing_slugs(self, slugs):
+        """
+        Return the set of the given lower-cased slugs which belong to
+        existing documents.
+        """
+        keys = dict((slug_change_key(self.locale, slug), slug)
+                    for slug in slugs)
+        changes = memcache.get_many(keys.keys())
+        existing = set()
+        for key, slug in keys.items():
+            if key in changes:
+                exists = changes[key]
+            else:
+                exists = slug in self
+            if exists:
+                existing.add(slug)
+        return existing
+
+
+_indexes = {}
+
+
+def get_slug_index(locale):
+    """Return the slug index of a locale if it's available, or None"""
+    locale = locale.lower()
+    index = _indexes.get(locale)
+    if index is None:
+        index = _indexes[locale] = SlugIndex(locale)
+    if index.is_available():
+        return index
+    return None
+
+
+def existing_slugs(locale, slugs):
+    """
+    Return the set of the given slugs of a locale which belong to existing
+    documents, all lower-cased. Uses the slug index if it's available, and
+    the database for the slugs it doesn't know of.
+    """
+    from .models import Document
+
+    slugs = set(force_text(slug).lower() for slug in slugs)
+    index = get_slug_index(locale)
+    if index is not None:
+        existing = index.existing_slugs(slugs)
+    else:
+        existing = set()
+    missing = slugs - existing
+    if missing:
+        existing.update(
+            slug.lower() for slug in
+            Document.objects.filter(locale=locale, slug__in=missing)
+                            .values_list('slug', flat=True))
+    return existing
+
+
+def record_slug_change(locale, slug):
+    """
+    Record in memcache whether a document exists with the given slug, after
+    it has been saved or deleted.
+    """
+    from .models import Document
+
+    exists = Document.objects.filter(locale=locale, slug=slug).exists()
+    key = slug_change_key(force_text(locale).lower(), force_text(slug).lower())
+    memcache.set(key, exists, settings.WIKI_SLUG_INDEX_MAX_AGE)
+
+
+def build_slug_indexes():
+    """
+    Build the slug indexes of all locales, returning the number of slugs
+    indexed by locale.
+    """
+    from .models import Document
+
+    hashes = defaultdict(set)
+    for locale, slug in (Document.objects.values_list('locale', 'slug')
+                                         .iterator()):
+        hashes[locale.lower()].add(slug_hash(slug.lower()))
+
+    if not os.path.isdir(settings.WIKI_SLUG_INDEX_ROOT):
+        os.makedirs(settings.WIKI_SLUG_INDEX_ROOT)
+
+    for locale, locale_hashes in hashes.items():
+        # Write to a temporary file first, so that the index is replaced
+        # atomically under the processes using it.
+        fd, tmp_path = tempfile.mkstemp(dir=settings.WIKI_SLUG_INDEX_ROOT)
+        with os.fdopen(fd, 'wb') as index_file:
+            index_file.write(''.join(sorted(locale_hashes)))
+        os.chmod(tmp_path, 0644)
+        os.rename(tmp_path, index_path(locale))
+        log.info('Indexed %s slugs of locale %s' %
+                 (len(locale_hashes), locale))
+
+    # Remove the indexes of locales without documents anymore
+    for filename in os.listdir(settings.WIKI_SLUG_INDEX_ROOT):
+        locale, ext = os.path.splitext(filename)
+        if ext == '.idx' and locale not in hashes:
+            os.remove(os.path.join(settings.WIKI_SLUG_INDEX_ROOT, filename))
+
+    return dict((locale, len(locale_hashes))
+                for locale, locale_hashes in hashes.items())
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import textwrap
+from collections import defaultdict
 from datetime import datetime
 
 from django.conf import settings
@@ -11,6 +12,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.sitemaps import GenericSitemap
 from django.core.mail import EmailMessage, mail_admins, send_mail
 from django.db import connection, transaction
+from django.db.models import Count
 from django.template.loader import render_to_string
 from django.utils.encoding import smart_str
 
@@ -18,14 +20,19 @@ from celery import chord, task
 from constance import config
 from djcelery_transactions import task as transaction_task
 from lxml import etree
+import waffle
 
 from kuma.core.cache import memcache
 from kuma.core.utils import MemcacheLock, chord_flow, chunked
 from kuma.search.models import Index
 
 from .events import context_dict
-from .exceptions import PageMoveError, StaleDocumentsRenderingInProgress
-from .models import Document, Revision, RevisionIP
+from .exceptions import (DocumentRenderingInProgress, PageMoveError,
+                         StaleDocumentsRenderingInProgress)
+from . import pending_renders, render_queue
+from .models import (Document, DocumentLink, DocumentRenderJob,
+                     DocumentRenderJobChunk, DocumentRenderQueueItem,
+                     Revision, RevisionIP)
 from .search import WikiDocumentType
 from .templatetags.jinja_helpers import absolutify
 from .utils import tidy_content
@@ -41,6 +48,10 @@ def render_document(pk, cache_control, base_url, force=False):
     document = Document.objects.get(pk=pk)
     if force:
         document.render_started_at = None
+    if waffle.switch_is_active('wiki_render_coalescing'):
+        # Render with the strongest cache control requested since the
+        # rendering was scheduled.
+        cache_control = pending_renders.take(pk, cache_control)
 
     try:
         document.render(cache_control, base_url)
@@ -51,38 +62,174 @@ def render_document(pk, cache_control, base_url, force=False):
 
 
 @task
-def email_render_document_progress(percent_complete, total):
+def update_linking_documents(locale, slug):
     """
-    Task to send email for render_document progress notification.
+    Refresh the cached content of the documents linking to the given locale
+    and slug, to update the annotations of the links to it after a document
+    has been created or deleted there.
     """
-    subject = ('The command `render_document` is %s%% complete' %
-               percent_complete)
-    message = (
-        'The command `render_document` is %s%% complete out of a total of '
-        '%s documents to render.' % (percent_complete, total))
-    mail_admins(subject=subject, message=message)
+    docs = (Document.objects.filter(links__locale=locale.lower(),
+                                    links__slug=slug.lower())
+                            .distinct())
+    for doc in docs:
+        if doc.is_rendering_scheduled or doc.is_rendering_in_progress:
+            # The cached content will be regenerated soon enough.
+            continue
+        doc.refresh_cache_with_fields()
+
+
+@task
+def run_render_job(pk):
+    """
+    Start rendering the next chunks of a render job, up to its parallelism,
+    and notify the admins once all of them are rendered.
+    """
+    job = DocumentRenderJob.objects.get(pk=pk)
+    for chunk_pk in job.claim_chunks():
+        render_job_chunk.delay(chunk_pk)
+
+    if job.finish():
+        progress = job.get_progress()
+        subject = 'Render job %s is complete' % job.pk
+        message = (
+            'Render job %s rendered %s documents in %s chunks, of which %s '
+            'failed. %s documents failed to render.' %
+            (job.pk, progress['documents'], progress['chunks'],
+             progress[DocumentRenderJobChunk.STATUS_FAILED],
+             len(progress['failures'])))
+        mail_admins(subject=subject, message=message)
+
+
+@task
+def render_job_chunk(pk):
+    """
+    Render the documents of a chunk of a render job, recording those which
+    failed, then continue with the next chunks of the job.
+    """
+    chunk = DocumentRenderJobChunk.objects.select_related('job').get(pk=pk)
+    job = chunk.job
+    cache_control = job.cache_control or None
+    base_url = job.base_url or settings.SITE_URL
+    failures = {}
+    try:
+        documents = list(Document.objects.filter(pk__in=chunk.get_pks()))
+        if job.force:
+            for document in documents:
+                document.render_started_at = None
+        if waffle.switch_is_active('wiki_batch_rendering'):
+            rendered = Document.objects.render_documents(
+                documents, cache_control, base_url)
+        else:
+            rendered = []
+            for document in documents:
+                try:
+                    document.render(cache_control, base_url)
+                except DocumentRenderingInProgress:
+                    # Left alone, as in the batch rendering
+                    continue
+                except Exception as exc:
+                    rendered.append((document, exc))
+        for document, exc in rendered:
+            if exc is not None:
+                failures[document.pk] = unicode(exc)
+    except Exception as exc:
+        log.exception('Failed to render chunk %s of render job %s' %
+                      (chunk.index, job.pk))
+        chunk.complete(DocumentRenderJobChunk.STATUS_FAILED,
+                       {'chunk': unicode(exc)})
+    else:
+        chunk.complete(DocumentRenderJobChunk.STATUS_DONE, failures)
+    run_render_job.delay(job.pk)
 
 
 @task
 def render_document_chunk(pks, cache_control='no-cache', base_url=None,
-                          force=False):
+                          force=False, workers=None):
     """
     Simple task to render a chunk of documents instead of one per each
+
+    With the wiki_batch_rendering switch, the cached content fields of the
+    chunk are built by up to workers processes, WIKI_RENDER_POOL_WORKERS by
+    default.
     """
     logger = render_document_chunk.get_logger()
     logger.info(u'Starting to render document chunk: %s' %
                 ','.join([str(pk) for pk in pks]))
     base_url = base_url or settings.SITE_URL
-    for pk in pks:
-        # calling the task without delay here since we want to localize
-        # the processing of the chunk in one process
-        result = render_document(pk, cache_control, base_url, force=force)
-        if result:
-            logger.error(u'Error while rendering document %s with error: %s' %
-                         (pk, result))
+    if waffle.switch_is_active('wiki_batch_rendering'):
+        # Render the whole chunk at once, making the kumascript requests
+        # concurrently.
+        documents = list(Document.objects.filter(pk__in=pks))
+        if force:
+            for document in documents:
+                document.render_started_at = None
+        rendered = Document.objects.render_documents(documents, cache_control,
+                                                     base_url,
+                                                     workers=workers)
+        for document, exc in rendered:
+            if exc is not None:
+                subject = ('Exception while rendering document %s' %
+                           document.pk)
+                mail_admins(subject=subject, message=exc)
+            elif document.rendered_errors:
+                logger.error(u'Error while rendering document %s with error: '
+                             u'%s' % (document.pk, document.rendered_errors))
+    else:
+        for pk in pks:
+            # calling the task without delay here since we want to localize
+            # the processing of the chunk in one process
+            result = render_document(pk, cache_control, base_url,
+                                     force=force)
+            if result:
+                logger.error(u'Error while rendering document %s with '
+                             u'error: %s' % (pk, result))
     logger.info(u'Finished rendering of document chunk')
 
 
+@task
+def render_template_dependents(pk):
+    """
+    Re-render the documents depending on a template after it changed, the
+    most viewed first, see render_queue.record_view. Documents with as many
+    views, e.g. all of them while views aren't recorded, are rendered the
+    most linked to first, as a proxy of their traffic.
+    """
+    template = Document.objects.get(pk=pk)
+    dependents = list(template.get_template_dependents()
+                              .values_list('pk', 'locale', 'slug'))
+    if not dependents:
+        return
+
+    views = {}
+    link_counts = defaultdict(int)
+    for chunk in chunked(dependents, 500):
+        views.update(render_queue.get_views(
+            [dependent[0] for dependent in chunk]))
+        links = (DocumentLink.objects
+                             .filter(slug__in=[slug.lower()
+                                               for _, _, slug in chunk])
+                             .values_list('locale', 'slug')
+                             .annotate(count=Count('pk')))
+        for locale, slug, count in links:
+            link_counts[(locale, slug)] = count
+
+    def priority(dependent):
+        document_pk, locale, slug = dependent
+        return (-views[document_pk],
+                -link_counts[(locale.lower(), slug.lower())])
+
+    dependents.sort(key=priority)
+
+    log.info('Re-rendering %s documents depending on %s' %
+             (len(dependents), template.slug))
+    if waffle.switch_is_active('wiki_render_queue'):
+        render_queue.enqueue([dependent[0] for dependent in dependents])
+        render_queue.start_workers()
+        return
+    for pks in chunked([dependent[0] for dependent in dependents], 5):
+        render_document_chunk.delay(pks)
+
+
 @task(throws=(StaleDocumentsRenderingInProgress,))
 def acquire_render_lock():
     """
@@ -119,6 +266,11 @@ def render_stale_documents(log=None):
     log.info('Found %s stale documents' % stale_docs_count)
     stale_pks = stale_docs.values_list('pk', flat=True)
 
+    if waffle.switch_is_active('wiki_render_queue'):
+        render_queue.enqueue(stale_pks)
+        render_queue.start_workers()
+        return
+
     pre_task = acquire_render_lock.si()
     render_tasks = [render_document_chunk.si(pks)
                     for pks in chunked(stale_pks, 5)]
@@ -127,6 +279,33 @@ def render_stale_documents(log=None):
     chord_flow(pre_task, render_tasks, post_task).apply_async()
 
 
+@task
+def process_render_queue(slot):
+    """
+    Render the documents of the render queue by order of priority, in a
+    worker slot, until the queue is empty.
+    """
+    worker_key = render_queue.WORKER_KEY_TMPL % slot
+    claimed = render_queue.claim(settings.WIKI_RENDER_QUEUE_BATCH_SIZE)
+    if not claimed:
+        memcache.delete(worker_key)
+        # Renderings queued after the claim, while the slot was still held,
+        # couldn't start a worker in it, so check the queue again now that
+        # the slot is free.
+        if DocumentRenderQueueItem.objects.filter(claim__isnull=True).exists():
+            render_queue.start_workers()
+        return
+
+    memcache.set(worker_key, 1, timeout=config.KUMA_DOCUMENT_RENDER_TIMEOUT)
+    try:
+        render_document_chunk([document_pk for _, document_pk in claimed])
+    finally:
+        (DocumentRenderQueueItem.objects
+                                .filter(pk__in=[pk for pk, _ in claimed])
+                                .delete())
+    process_render_queue.delay(slot)
+
+
 @task
 def build_json_data_for_document(pk, stale):
     """Force-refresh cached JSON data after rendering."""
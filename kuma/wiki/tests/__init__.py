@@ -1,4 +1,7 @@
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
 from datetime import datetime
+import threading
 import time
 
 from django.contrib.auth import get_user_model
@@ -23,6 +26,45 @@ class WikiTestCase(KumaTestCase):
             name='kumaediting', everyone=True)
 
 
+# Rendered HTML exercising the cached content fields: sections, quick links,
+# summaries and links.
+CONTENT_CORPUS = (
+    '',
+    '<p>Just a paragraph</p>',
+    """
+    <h2>First</h2>
+    <p>This is a document</p>
+    <h3 id="Quick_Links">Quick Links</h3>
+    <ol><li><a href="/en-US/docs/document-with-sections">Here</a></li></ol>
+    <h3 id="Subnav">Subnav</h3>
+    <p>Bar, yay</p>
+    <h2>Second</h2>
+    <p>Another section</p>
+    <a href="/en-US/docs/document-with-sections">Existing link</a>
+    <a href="/en-US/docs/does-not-exist">New link</a>
+    <a href="http://example.com/">External link</a>
+    """,
+    """
+    <div class="warning"><p>Not a summary</p></div>
+    <h2 id="Summary">Summary</h2>
+    <p>The <strong>summary</strong> (of things).</p>
+    <h2>Syntax</h2>
+    <h3>Values</h3>
+    <h4>Deeper <code>code</code></h4>
+    <h2>Syntax</h2>
+    <section><p>An id-less section</p></section>
+    """,
+    """
+    <p>&laquo; Back</p>
+    <p>Intro with <span class="seoSummary">an explicit summary</span>
+    </p>
+    <h2 name="Named">Named heading</h2>
+    <h3>Sub</h3>
+    <h2>Sub</h2>
+    """,
+)
+
+
 # Model makers. These make it clearer and more concise to create objects in
 # test cases. They allow the significant attribute values to stand out rather
 # than being hidden amongst the values needed merely to get the model to
@@ -216,3 +258,67 @@ def create_document_tree():
              slug="Grandchild", save=True)
 
     return root_doc, child_doc, grandchild_doc
+
+
+class KumascriptStubServer(ThreadingMixIn, HTTPServer):
+    """
+    A local stand-in for the KumaScript service, answering every request
+    after a delay with its path, and keeping track of the number of requests
+    it handled at the same time.
+    """
+    daemon_threads = True
+
+    def __init__(self, delay=0):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), KumascriptStubHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = []
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    @property
+    def url_template(self):
+        return 'http://127.0.0.1:%s/docs/{path}' % self.server_port
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class KumascriptStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path,
+                                    dict(self.headers)))
+            server.concurrent += 1
+            server.max_concurrent = max(server.max_concurrent,
+                                        server.concurrent)
+        try:
+            time.sleep(server.delay)
+            body = '<p>Rendered %s</p>' % self.path
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.concurrent -= 1
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.respond()
+
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,466 @@
+"""
+The body filters as they were before FusedFilter fused them, each an
+html5lib filter making its own pass over the token stream. They're chained
+as a reference for the output and throughput of the fused filters, see
+test_content.
+"""
+import urllib
+from collections import defaultdict
+from urlparse import urlparse
+
+from html5lib.filters._base import Filter as html5lib_Filter
+
+from ..content import DOC_SPECIAL_PATHS, HEAD_TAGS, SECTION_TAGS
+from ..utils import locale_and_slug_from_path
+
+
+class LinkAnnotationFilter(html5lib_Filter):
+    """
+    Filter which annotates links to indicate things like whether they're
+    external, if they point to non-existent wiki pages, etc.
+    """
+    # TODO: Need more external link prefixes, here?
+    EXTERNAL_PREFIXES = ('http:', 'https:', 'ftp:',)
+
+    def __init__(self, source, base_url):
+        html5lib_Filter.__init__(self, source)
+        self.base_url = base_url
+        self.base_url_parsed = urlparse(base_url)
+
+    def __iter__(self):
+        from kuma.wiki.models import Document
+
+        input = html5lib_Filter.__iter__(self)
+
+        # Pass #1: Gather all the link URLs and prepare annotations
+        links = {}
+        buffer = []
+        for token in input:
+            buffer.append(token)
+            if token['type'] == 'StartTag' and token['name'] == 'a':
+                for (namespace, name), value in token['data'].items():
+                    if name == 'href':
+                        href = value
+                        href_parsed = urlparse(href)
+                        if href_parsed.netloc == self.base_url_parsed.netloc:
+                            # Squash site-absolute URLs to site-relative paths.
+                            href = href_parsed.path
+
+                        # Prepare annotations record for this path.
+                        links[href] = {'classes': []}
+
+        needs_existence_check = defaultdict(lambda: defaultdict(set))
+
+        # Run through all the links and check for annotatable conditions.
+        for href in links.keys():
+
+            # Is this an external URL?
+            is_external = False
+            for prefix in self.EXTERNAL_PREFIXES:
+                if href.startswith(prefix):
+                    is_external = True
+                    break
+            if is_external:
+                links[href]['classes'].append('external')
+                continue
+
+            # TODO: Should this also check for old-school mindtouch URLs? Or
+            # should we encourage editors to convert to new-style URLs to take
+            # advantage of link annotation? (I'd say the latter)
+
+            # Is this a kuma doc URL?
+            if '/docs/' in href:
+
+                # Check if this is a special docs path that's exempt from "new"
+                skip = False
+                for path in DOC_SPECIAL_PATHS:
+                    if '/docs/%s' % path in href:
+                        skip = True
+                if skip:
+                    continue
+
+                href_locale, href_path = href.split(u'/docs/', 1)
+                if href_locale.startswith(u'/'):
+                    href_locale = href_locale[1:]
+
+                if '#' in href_path:
+                    # If present, discard the hash anchor
+                    href_path, _, _ = href_path.partition('#')
+
+                # Handle any URL-encoded UTF-8 characters in the path
+                href_path = href_path.encode('utf-8', 'ignore')
+                href_path = urllib.unquote(href_path)
+                href_path = href_path.decode('utf-8', 'ignore')
+
+                # Try to sort out the locale and slug through some of our
+                # redirection logic.
+                locale, slug, needs_redirect = (
+                    locale_and_slug_from_path(href_path,
+                                              path_locale=href_locale))
+
+                # Gather up this link for existence check
+                needs_existence_check[locale.lower()][slug.lower()].add(href)
+
+        # Perform existence checks for all the links, using one DB query per
+        # locale for all the candidate slugs.
+        for locale, slug_hrefs in needs_existence_check.items():
+
+            existing_slugs = (Document.objects
+                                      .filter(locale=locale,
+                                              slug__in=slug_hrefs.keys())
+                                      .values_list('slug', flat=True))
+
+            # Remove the slugs that pass existence check.
+            for slug in existing_slugs:
+                lslug = slug.lower()
+                if lslug in slug_hrefs:
+                    del slug_hrefs[lslug]
+
+            # Mark all the links whose slugs did not come back from the DB
+            # query as "new"
+            for slug, hrefs in slug_hrefs.items():
+                for href in hrefs:
+                    links[href]['classes'].append('new')
+
+        # Pass #2: Filter the content, annotating links
+        for token in buffer:
+            if token['type'] == 'StartTag' and token['name'] == 'a':
+                attrs = dict(token['data'])
+                names = [name for (namespace, name) in attrs.keys()]
+                for (namespace, name), value in attrs.items():
+                    if name == 'href':
+                        href = value
+                        href_parsed = urlparse(value)
+                        if href_parsed.netloc == self.base_url_parsed.netloc:
+                            # Squash site-absolute URLs to site-relative paths.
+                            href = href_parsed.path
+
+                        if href in links:
+                            # Update class names on this link element.
+                            if 'class' in names:
+                                classes = set(attrs[(namespace, 'class')].split(u' '))
+                            else:
+                                classes = set()
+                            classes.update(links[href]['classes'])
+                            if classes:
+                                attrs[(namespace, u'class')] = u' '.join(classes)
+
+                token['data'] = attrs
+
+            yield token
+
+
+class SectionIDFilter(html5lib_Filter):
+    """
+    Filter which ensures section-related elements have unique IDs
+    """
+    def __init__(self, source):
+        html5lib_Filter.__init__(self, source)
+        self.id_cnt = 0
+        self.known_ids = set()
+
+    def gen_id(self):
+        """Generate a unique ID"""
+        while True:
+            self.id_cnt += 1
+            id = 'sect%s' % self.id_cnt
+            if id not in self.known_ids:
+                self.known_ids.add(id)
+                return id
+
+    # MindTouch encodes these characters, so we have to encode them
+    # too.
+    non_url_safe = ['"', '#', '$', '%', '&', '+',
+                    ',', '/', ':', ';', '=', '?',
+                    '@', '[', '\\', ']', '^', '`',
+                    '{', '|', '}', '~']
+
+    def slugify(self, text):
+        """
+        Turn the text content of a header into a slug for use in an ID
+        """
+        non_safe = [c for c in text if c in self.non_url_safe]
+        if non_safe:
+            for c in non_safe:
+                text = text.replace(c, '')
+        # Strip leading, trailing and multiple whitespace, convert remaining whitespace to _
+        text = u'_'.join(text.split())
+        return text
+
+    def process_header(self, token, buffer):
+        # If we get into this code, 'token' will be the start tag of a
+        # header element. We're going to grab its text contents to
+        # generate a slugified ID for it, add that ID in, and then
+        # spit it back out. 'buffer' is the list of tokens we were in
+        # the process of handling when we hit this header.
+        start, text, tmp = token, [], []
+        attrs = dict(token['data'])
+        while len(buffer):
+            # Loop through successive tokens in the stream of HTML
+            # until we find our end tag, building up in 'tmp' a list
+            # of those tokens to emit later, and in 'text' a list of
+            # the text content we see along the way.
+            next_token = buffer.pop(0)
+            tmp.append(next_token)
+            if next_token['type'] in ('Characters', 'SpaceCharacters'):
+                text.append(next_token['data'])
+            elif (next_token['type'] == 'EndTag' and
+                  next_token['name'] == start['name']):
+                # Note: This is naive, and doesn't track other
+                # start/end tags nested in the header. Odd things might
+                # happen in a case like <h1><h1></h1></h1>. But, that's
+                # invalid markup and the worst case should be a
+                # truncated ID because all the text wasn't accumulated.
+                break
+
+        # Slugify the text we found inside the header, generate an ID
+        # as a last resort.
+        slug = self.slugify(u''.join(text))
+        if not slug:
+            slug = self.gen_id()
+        else:
+            # Create unique slug for heading tags with the same content
+            start_inc = 2
+            slug_base = slug
+            while slug in self.known_ids:
+                slug = u'%s_%s' % (slug_base, start_inc)
+                start_inc += 1
+
+        attrs[(None, u'id')] = slug
+        start['data'] = attrs
+        self.known_ids.add(slug)
+
+        # Hand back buffer minus the bits we yanked out of it, and the
+        # new ID-ified header start tag and contents.
+        return buffer, [start] + tmp
+
+    def __iter__(self):
+        input = html5lib_Filter.__iter__(self)
+
+        # First, collect all ID values already in the source HTML.
+        buffer = []
+        for token in input:
+            buffer.append(token)
+            if token['type'] == 'StartTag':
+                attrs = dict(token['data'])
+                for (namespace, name), value in attrs.items():
+                    # Collect both 'name' and 'id' attributes since
+                    # 'name' gets treated as a manual override to
+                    # specify an ID.
+                    if name == 'id' and token['name'] not in HEAD_TAGS:
+                        self.known_ids.add(value)
+                    if name == 'name':
+                        self.known_ids.add(value)
+
+        # Then walk the tree again identifying elements in need of IDs
+        # and adding them.
+        while len(buffer):
+            token = buffer.pop(0)
+
+            if not (token['type'] == 'StartTag' and
+                    token['name'] in SECTION_TAGS):
+                # If this token isn't the start tag of a section or
+                # header, we don't add an ID and just short-circuit
+                # out to return the token as-is.
+                yield token
+            else:
+                # Potential bug warning: there may not be any
+                # attributes, so doing a for loop over them to look
+                # for existing ID/name values is unsafe. Instead we
+                # dict-ify the attrs, and then check directly for the
+                # things we care about instead of iterating all
+                # attributes and waiting for one we care about to show
+                # up.
+                attrs = dict(token['data'])
+
+                # First check for a 'name' attribute; if it's present,
+                # treat it as a manual override by the author and make
+                # that value be the ID.
+                if (None, 'name') in attrs:
+                    attrs[(None, u'id')] = attrs[(None, 'name')]
+                    token['data'] = attrs
+                    yield token
+                    continue
+                # Next look for <section> tags which don't have an ID
+                # set; since we don't generate an ID for them from
+                # their text contents, they just get a numeric one
+                # from gen_id().
+                if token['name'] not in HEAD_TAGS:
+                    if (None, 'id') not in attrs:
+                        attrs[(None, u'id')] = self.gen_id()
+                        token['data'] = attrs
+                    yield token
+                    continue
+                # If we got here, we're looking at the start tag of a
+                # header which had no 'name' attribute set. We're
+                # going to pop out the text contents of the header,
+                # use them to generate a slugified ID for it, and
+                # return it with that ID added in.
+                buffer, header_tokens = self.process_header(token, buffer)
+                for t in header_tokens:
+                    yield t
+
+
+class SectionFilter(html5lib_Filter):
+    """
+    Filter which can either extract the fragment representing a section by
+    ID, or substitute a replacement stream for a section. Loosely based on
+    HTML5 outline algorithm
+    """
+    HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hgroup')
+
+    SECTION_TAGS = ('article', 'aside', 'nav', 'section', 'blockquote',
+                    'body', 'details', 'fieldset', 'figure', 'table', 'div')
+
+    def __init__(self, source, id, replace_source=None, ignore_heading=False):
+        html5lib_Filter.__init__(self, source)
+
+        self.replace_source = replace_source
+        self.ignore_heading = ignore_heading
+        self.section_id = id
+
+        self.heading = None
+        self.heading_rank = None
+        self.open_level = 0
+        self.parent_level = None
+        self.in_section = False
+        self.heading_to_ignore = None
+        self.already_ignored_header = False
+        self.next_in_section = False
+        self.replacement_emitted = False
+
+    def __iter__(self):
+        input = html5lib_Filter.__iter__(self)
+        for token in input:
+
+            # Section start was deferred, so start it now.
+            if self.next_in_section:
+                self.next_in_section = False
+                self.in_section = True
+
+            if token['type'] == 'StartTag':
+                attrs = dict(token['data'])
+                self.open_level += 1
+
+                # Have we encountered the section or heading element we're
+                # looking for?
+                if self.section_id in attrs.values():
+
+                    # If we encounter a section element that matches the ID,
+                    # then we'll want to scoop up all its children as an
+                    # explicit section.
+                    if (self.parent_level is None and self._isSection(token)):
+                        self.parent_level = self.open_level
+                        # Defer the start of the section, so the section parent
+                        # itself isn't included.
+                        self.next_in_section = True
+
+                    # If we encounter a heading element that matches the ID, we
+                    # start an implicit section.
+                    elif (self.heading is None and self._isHeading(token)):
+                        self.heading = token
+                        self.heading_rank = self._getHeadingRank(token)
+                        self.parent_level = self.open_level - 1
+                        self.in_section = True
+
+                # If started an implicit section, these rules apply to
+                # siblings...
+                elif (self.heading is not None and
+                        self.open_level - 1 == self.parent_level):
+
+                    # The implicit section should stop if we hit another
+                    # sibling heading whose rank is equal or higher, since that
+                    # starts a new implicit section
+                    if (self._isHeading(token) and
+                            self._getHeadingRank(token) <= self.heading_rank):
+                        self.in_section = False
+
+                # If this is the first heading of the section and we want to
+                # omit it, note that we've found it
+                if (self.in_section and
+                        self.ignore_heading and
+                        not self.already_ignored_header and
+                        not self.heading_to_ignore and
+                        self._isHeading(token)):
+
+                    self.heading_to_ignore = token
+
+            elif token['type'] == 'EndTag':
+                self.open_level -= 1
+
+                # If the parent of the section has ended, end the section.
+                # This applies to both implicit and explicit sections.
+                if (self.parent_level is not None and
+                        self.open_level < self.parent_level):
+                    self.in_section = False
+
+            # If there's no replacement source, then this is a section
+            # extraction. So, emit tokens while we're in the section, as long
+            # as we're also not in the process of ignoring a heading
+            if not self.replace_source:
+                if self.in_section and not self.heading_to_ignore:
+                    yield token
+
+            # If there is a replacement source, then this is a section
+            # replacement. Emit tokens of the source stream until we're in the
+            # section, then emit the replacement stream and ignore the rest of
+            # the source stream for the section. Note that an ignored heading
+            # is *not* replaced.
+            else:
+                if not self.in_section or self.heading_to_ignore:
+                    yield token
+                elif not self.replacement_emitted:
+                    for r_token in self.replace_source:
+                        yield r_token
+                    self.replacement_emitted = True
+
+            # If this looks like the end of a heading we were ignoring, clear
+            # the ignoring condition.
+            if (token['type'] == 'EndTag' and
+                    self.in_section and
+                    self.ignore_heading and
+                    not self.already_ignored_header and
+                    self.heading_to_ignore and
+                    self._isHeading(token) and
+                    token['name'] == self.heading_to_ignore['name']):
+
+                self.heading_to_ignore = None
+                self.already_ignored_header = True
+
+    def _isHeading(self, token):
+        """Is this token a heading element?"""
+        return token['name'] in self.HEADING_TAGS
+
+    def _isSection(self, token):
+        """Is this token a section element?"""
+        return token['name'] in self.SECTION_TAGS
+
+    def _getHeadingRank(self, token):
+        """Calculate the heading rank of this token"""
+        return self.getHeadingRank(token)
+
+    @classmethod
+    def getHeadingRank(cls, token):
+        """Calculate the heading rank of a token"""
+        if token['name'] not in cls.HEADING_TAGS:
+            return None
+        if token['name'] != 'hgroup':
+            return int(token['name'][1])
+        else:
+            # FIXME: hgroup rank == highest rank of headers contained
+            # But, we'd need to track the hgroup and then any child headers
+            # encountered in the stream. Not doing that right now.
+            # For now, just assume an hgroup is equivalent to h1
+            return 1
+
+
+def chain_body_filters(stream, base_url):
+    """
+    Chain the original filters of the body of a document over a token
+    stream, as ContentSectionTool did for get_body_html.
+    """
+    comment = [{'type': 'Comment', 'data': ' '}]
+    stream = SectionFilter(stream, 'Quick_Links', iter(comment))
+    stream = SectionFilter(stream, 'Subnav', iter(comment))
+    stream = SectionIDFilter(stream)
+    return LinkAnnotationFilter(stream, base_url)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+The SEO summary of content as it was found with PyQuery before
+find_seo_summaries, as a reference for its output, see test_content.
+"""
+import re
+
+from pyquery import PyQuery as pq
+
+from ..content import parse
+
+
+def get_seo_description(content, locale=None, strip_markup=True):
+    # Create an SEO summary
+    # TODO:  Google only takes the first 180 characters, so maybe we find a
+    #        logical way to find the end of sentence before 180?
+    page = None
+    if content:
+        # Try constraining the search for summary to an explicit "Summary"
+        # section, if any.
+        summary_section = (parse(content).extractSection('Summary')
+                                         .serialize())
+        page = _get_seo_page(summary_section or content)
+    return _find_seo_summary(page, locale, strip_markup)
+
+
+def _get_seo_page(content):
+    """Parse content with PyQuery for SEO summary extraction"""
+    # Need to add a BR to the page content otherwise pyQuery wont find
+    # a <p></p> element if it's the only element in the doc_html
+    return pq(content + '<br />')
+
+
+def _find_seo_summary(page, locale=None, strip_markup=True):
+    """Find and clean up the SEO summary in a page parsed by _get_seo_page"""
+    seo_summary = ''
+    if page is not None:
+        # Look for the SEO summary class first
+        summaryClasses = page.find('.seoSummary')
+        if len(summaryClasses):
+            if strip_markup:
+                seo_summary = summaryClasses.text()
+            else:
+                seo_summary = summaryClasses.html()
+        else:
+            paragraphs = page.find('p')
+            if paragraphs.length:
+                for p in range(len(paragraphs)):
+                    item = paragraphs.eq(p)
+                    if strip_markup:
+                        text = item.text()
+                    else:
+                        text = item.html()
+                    # Checking for a parent length of 2
+                    # because we don't want p's wrapped
+                    # in DIVs ("<div class='warning'>") and pyQuery adds
+                    # "<html><div>" wrapping to entire document
+                    if (text and len(text) and
+                            'Redirect' not in text and
+                            text.find(u'«') == -1 and
+                            text.find('&laquo') == -1 and
+                            item.parents().length == 2):
+                        seo_summary = text.strip()
+                        break
+
+    if strip_markup:
+        # Post-found cleanup
+        # remove markup chars
+        seo_summary = seo_summary.replace('<', '').replace('>', '')
+        # remove spaces around some punctuation added by PyQuery
+        if locale == 'en-US':
+            seo_summary = re.sub(r' ([,\)\.])', r'\1', seo_summary)
+            seo_summary = re.sub(r'(\() ', r'\1', seo_summary)
+
+    return seo_summary
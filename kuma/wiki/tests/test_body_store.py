@@ -0,0 +1,163 @@
+import os
+import shutil
+import tempfile
+import time
+from cStringIO import StringIO
+
+import mock
+from django.core.management import call_command
+from django.test.utils import override_settings
+from nose.tools import eq_, ok_
+
+from . import WikiTestCase, document
+from .. import kumascript
+from ..body_store import FilesystemBodyStore, get_body_store
+
+
+class FilesystemBodyStoreTests(WikiTestCase):
+
+    def setUp(self):
+        super(FilesystemBodyStoreTests, self).setUp()
+        self.root = tempfile.mkdtemp()
+        self.store = FilesystemBodyStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+        super(FilesystemBodyStoreTests, self).tearDown()
+
+    def blob_paths(self):
+        return [os.path.join(dirpath, filename)
+                for dirpath, dirnames, filenames in
+                os.walk(os.path.join(self.root, 'blobs'))
+                for filename in filenames]
+
+    def test_get_set(self):
+        """Responses should be stored with identical bodies stored once"""
+        eq_(None, self.store.get('a'))
+        self.store.set('a', '"1"', None, u'<p>Caf\xe9</p>', [])
+        self.store.set('b', None, 'Wed, 14 Mar 2012 22:29:17 GMT',
+                       u'<p>Caf\xe9</p>', [{'level': 'error'}])
+        eq_(dict(etag='"1"', modified=None, body=u'<p>Caf\xe9</p>',
+                 errors=None, source_hash=None),
+            self.store.get('a'))
+        eq_([{'level': 'error'}], self.store.get('b')['errors'])
+        eq_(1, len(self.blob_paths()))
+
+        self.store.delete('a')
+        eq_(None, self.store.get('a'))
+        ok_(self.store.get('b') is not None)
+
+    def test_prune(self):
+        """The least recently used blobs should be evicted first"""
+        self.store.set('a', '"a"', None, u'a' * 100, [])
+        self.store.set('b', '"b"', None, u'b' * 100, [])
+        self.store.set('c', '"c"', None, u'c' * 100, [])
+        # Make a the least, then c, recently used
+        old = time.time() - 60
+        for path in self.blob_paths():
+            os.utime(path, (old, old))
+        self.store.get('c')
+        time.sleep(0.01)
+        self.store.get('b')
+
+        eq_((0, 0), self.store.prune(300))
+        eq_((2, 200), self.store.prune(150))
+        eq_(None, self.store.get('a'))
+        eq_(None, self.store.get('c'))
+        eq_(u'b' * 100, self.store.get('b')['body'])
+        # The index files of the evicted blobs are removed
+        eq_([], os.listdir(os.path.join(self.root, 'index', 'a')))
+        eq_(['b.json'], os.listdir(os.path.join(self.root, 'index', 'b')))
+
+    def test_no_prune_on_write(self):
+        """Storing bodies shouldn't evict any, whatever the store size"""
+        with self.settings(KUMASCRIPT_BODY_STORE_MAX_SIZE=150):
+            store = FilesystemBodyStore(self.root)
+            store.set('a', '"a"', None, u'a' * 100, [])
+            store.set('b', '"b"', None, u'b' * 100, [])
+        eq_(2, len(self.blob_paths()))
+        eq_(u'a' * 100, store.get('a')['body'])
+
+    def test_command(self):
+        """The command should prune the store to the maximum size"""
+        self.store.set('a', '"a"', None, u'a' * 100, [])
+        old = time.time() - 60
+        for path in self.blob_paths():
+            os.utime(path, (old, old))
+        self.store.set('b', '"b"', None, u'b' * 100, [])
+        with self.settings(KUMASCRIPT_BODY_STORE_ROOT=self.root):
+            call_command('prune_kumascript_bodies', max_size=150,
+                         stdout=StringIO())
+        eq_(None, self.store.get('a'))
+        eq_(u'b' * 100, self.store.get('b')['body'])
+
+
+class ConditionalGetTests(WikiTestCase):
+
+    def setUp(self):
+        super(ConditionalGetTests, self).setUp()
+        self.root = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            KUMASCRIPT_BODY_STORE='filesystem',
+            KUMASCRIPT_BODY_STORE_ROOT=self.root)
+        self.settings_override.enable()
+        self.doc = document(title='Test', slug='Test', save=True)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.root)
+        super(ConditionalGetTests, self).tearDown()
+
+    def response(self, status_code, text=u''):
+        return mock.Mock(status_code=status_code, text=text,
+                         headers={'etag': '"1"'})
+
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_conditional_get(self, mock_request, mock_env_vars):
+        """A 304 should be served from the body store"""
+        mock_env_vars.return_value = {}
+        mock_request.return_value = self.response(200, u'<p>Rendered</p>')
+        eq_((u'<p>Rendered</p>', []),
+            kumascript.get(self.doc, 'no-cache', 'https://testserver'))
+        ok_('If-None-Match' not in mock_request.call_args[1]['headers'])
+
+        mock_request.return_value = self.response(304)
+        eq_((u'<p>Rendered</p>', None),
+            kumascript.get(self.doc, 'no-cache', 'https://testserver'))
+        eq_('"1"', mock_request.call_args[1]['headers']['If-None-Match'])
+
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_evicted_body(self, mock_request, mock_env_vars):
+        """A request shouldn't be conditional without a stored body, and a
+        304 without one shouldn't render as empty"""
+        mock_env_vars.return_value = {}
+        mock_request.return_value = self.response(200, u'<p>Rendered</p>')
+        kumascript.get(self.doc, 'no-cache', 'https://testserver')
+        get_body_store().prune(0)
+
+        mock_request.return_value = self.response(304)
+        body, errors = kumascript.get(self.doc, 'no-cache',
+                                      'https://testserver')
+        ok_('If-None-Match' not in mock_request.call_args[1]['headers'])
+        eq_(None, body)
+        eq_('error', errors[0]['level'])
+
+    @mock.patch('kuma.wiki.kumascript.process_body')
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_unchanged_body(self, mock_request, mock_env_vars,
+                            mock_process_body):
+        """An unchanged body shouldn't be cleaned again"""
+        mock_env_vars.return_value = {}
+        mock_process_body.return_value = u'<p>Cleaned</p>'
+        mock_request.return_value = self.response(200, u'<p>Rendered</p>')
+        for i in range(2):
+            eq_((u'<p>Cleaned</p>', []),
+                kumascript.get(self.doc, 'no-cache', 'https://testserver'))
+        eq_(1, mock_process_body.call_count)
+
+        mock_request.return_value = self.response(200, u'<p>Changed</p>')
+        kumascript.get(self.doc, 'no-cache', 'https://testserver')
+        eq_(2, mock_process_body.call_count)
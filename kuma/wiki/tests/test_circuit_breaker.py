@@ -0,0 +1,75 @@
+import mock
+from django.test.utils import override_settings
+from nose.tools import eq_, ok_
+
+from kuma.core.cache import memcache
+from kuma.core.tests import KumaTestCase
+
+from ..circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@override_settings(TEST_BREAKER_WINDOW=30,
+                   TEST_BREAKER_MIN_REQUESTS=4,
+                   TEST_BREAKER_MAX_ERROR_RATE=0.5,
+                   TEST_BREAKER_MAX_SLOW_RATE=0.75,
+                   TEST_BREAKER_SLOW_DURATION=10,
+                   TEST_BREAKER_OPEN_DURATION=60)
+@mock.patch('kuma.wiki.circuit_breaker.time.time')
+class CircuitBreakerTests(KumaTestCase):
+
+    def setUp(self):
+        super(CircuitBreakerTests, self).setUp()
+        memcache.clear()
+        self.breaker = CircuitBreaker('test', 'TEST_BREAKER')
+
+    def test_error_rate(self, mock_time):
+        mock_time.return_value = 1000
+        self.breaker.record(True, 1)
+        self.breaker.record(True, 1)
+        self.breaker.record(False, 1)
+        # Not enough requests yet
+        eq_(CLOSED, self.breaker.get_state())
+        ok_(self.breaker.allow_request())
+        self.breaker.record(False, 1)
+        eq_(OPEN, self.breaker.get_state())
+        ok_(not self.breaker.allow_request())
+
+    def test_slow_rate(self, mock_time):
+        mock_time.return_value = 1000
+        for duration in (1, 10, 20):
+            self.breaker.record(True, duration)
+        eq_(CLOSED, self.breaker.get_state())
+        self.breaker.record(True, 30)
+        eq_(OPEN, self.breaker.get_state())
+
+    def test_windows(self, mock_time):
+        """Requests should only be counted in their own window"""
+        mock_time.return_value = 1000
+        self.breaker.record(False, 1)
+        self.breaker.record(False, 1)
+        self.breaker.record(False, 1)
+        mock_time.return_value = 1030
+        self.breaker.record(False, 1)
+        eq_(CLOSED, self.breaker.get_state())
+
+    def test_half_open(self, mock_time):
+        mock_time.return_value = 1000
+        self.breaker.open()
+        mock_time.return_value = 1061
+        eq_(HALF_OPEN, self.breaker.get_state())
+        # A single probe at a time
+        ok_(self.breaker.allow_request())
+        ok_(not self.breaker.allow_request())
+
+        # The failed probe opens the circuit again
+        self.breaker.record(False, 1)
+        eq_(OPEN, self.breaker.get_state())
+        ok_(not self.breaker.allow_request())
+
+        # And the successful one closes it
+        mock_time.return_value = 1122
+        ok_(self.breaker.allow_request())
+        self.breaker.record(True, 1)
+        eq_(CLOSED, self.breaker.get_state())
+        ok_(self.breaker.allow_request())
+        ok_(self.breaker.allow_request())
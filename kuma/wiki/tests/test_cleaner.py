@@ -0,0 +1,51 @@
+import json
+
+import bleach
+from constance.test import override_config
+from nose.tools import eq_, ok_
+
+from kuma.core.tests import KumaTestCase
+
+from ..cleaner import cleaning_version, get_cleaner
+from ..constants import ALLOWED_ATTRIBUTES, ALLOWED_STYLES, ALLOWED_TAGS
+
+
+CONTENT = u"""
+<p id="foo" onclick="alert(1)">
+    <a style="position: absolute; border: 1px;" href="http://example.com">
+    Caf\xe9</a><!-- comment -->
+    <textarea name="foo"></textarea><script>alert(1)</script>
+</p>
+"""
+
+
+class CleanerTests(KumaTestCase):
+
+    def test_clean(self):
+        """Cleaners should clean like bleach.clean"""
+        eq_(bleach.clean(CONTENT, tags=ALLOWED_TAGS,
+                         attributes=ALLOWED_ATTRIBUTES,
+                         styles=ALLOWED_STYLES),
+            get_cleaner().clean(CONTENT))
+        # Twice, with the same parser
+        eq_(get_cleaner().clean(CONTENT), get_cleaner().clean(CONTENT))
+        eq_('', get_cleaner().clean(''))
+
+    @override_config(BLEACH_ALLOWED_TAGS=json.dumps(['a', 'p']),
+                     BLEACH_ALLOWED_ATTRIBUTES=json.dumps({'a': ['style']}),
+                     BLEACH_ALLOWED_STYLES=json.dumps(['border']))
+    def test_constance_whitelists(self):
+        """Cleaners should be compiled again when the whitelists change"""
+        cleaner = get_cleaner(True)
+        ok_(cleaner is get_cleaner(True))
+        ok_(cleaner is not get_cleaner())
+        version = cleaning_version(True)
+        eq_(bleach.clean(CONTENT, tags=json.dumps(['a', 'p']),
+                         attributes=json.dumps({'a': ['style']}),
+                         styles=json.dumps(['border'])),
+            cleaner.clean(CONTENT))
+
+        with override_config(BLEACH_ALLOWED_STYLES=json.dumps([])):
+            ok_(cleaner is not get_cleaner(True))
+            ok_(version != cleaning_version(True))
+        eq_(version, cleaning_version(True))
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import sys
+import time
 from urlparse import urljoin
 
 import bleach
@@ -12,15 +15,19 @@ import kuma.wiki.content
 from kuma.core.tests import KumaTestCase
 from kuma.users.tests import UserTestCase
 
-from . import doc_rev, document, normalize_html
+from . import CONTENT_CORPUS, doc_rev, document, normalize_html, original_seo
 from ..constants import ALLOWED_ATTRIBUTES, ALLOWED_TAGS
-from ..content import (SECTION_TAGS, CodeSyntaxFilter, H2TOCFilter,
-                       H3TOCFilter, SectionIDFilter, SectionTOCFilter,
-                       extract_css_classnames, extract_html_attributes,
-                       extract_kumascript_macro_names, get_content_sections,
-                       get_seo_description)
+from ..content import (SECTION_TAGS, CodeSyntaxFilter, FusedFilter,
+                       H2TOCFilter, H3TOCFilter, LinkAnnotationFilter,
+                       SectionFilter, SectionIDFilter, SectionTOCFilter,
+                       build_section_store, compare_parsers,
+                       extract_css_classnames,
+                       extract_html_attributes, extract_kumascript_macro_names,
+                       find_changed_sections, get_content_sections,
+                       get_seo_description, splice_sections)
 from ..models import Document
 from ..templatetags.jinja_helpers import bugize_text
+from .original_filters import chain_body_filters
 
 
 class ContentSectionToolTests(UserTestCase):
@@ -295,6 +302,255 @@ class ContentSectionToolTests(UserTestCase):
                                    .serialize())
         eq_(normalize_html(expected), normalize_html(result))
 
+    def test_section_store(self):
+        """Every section in the section store should be the same as what
+        extractSection produces for its ID"""
+        doc_src = """
+            <p onclick="alert(1)">test</p>
+            <h1 id="s1">Head 1</h1>
+            <p>test</p>
+            <section id="parent-s2">
+                <h1 id="s2">Head 2</h1>
+                <p>test <script>var a = "</p>";</script></p>
+                <section><h1>head subsection</h1></section>
+                <h2 id="s2-1">Head 2-1</h2>
+                <table id="t1"><tr><td>cell</td></tr></table>
+                <h3>Head 2-1-1</h3>
+                <p>test<br>test</p>
+                <h1 id="s2-next">Head 2 next</h1>
+            </section>
+            <section id="empty"></section>
+            <h2 id="dupe">Dupe</h2>
+            <h2 id="dupe">Dupe</h2>
+            <div class="s3">Not a section ID</div>
+            <h1 id="s3">Head 3</h1>
+            <hgroup id="hg"><h1>Group</h1></hgroup>
+            <h2 id="s4">Head 4 &amp; more</h2>
+            <p>test</p>
+        """
+        store = build_section_store(doc_src)
+        expected_ids = set(['s1', 'parent-s2', 's2', 's2-1', 't1', 's2-next',
+                            'empty', 'hg', 's4'])
+        eq_(expected_ids, set(store['plain']['sections'].keys()))
+        # Only the HTML of the raw view is stored
+        ok_('html' not in store['plain'])
+        # Raw views inject section IDs generated from the heading text
+        ok_('Head_4_more' in store['raw']['sections'])
+
+        raw = store['raw']
+        for section_id, (start, end) in raw['sections'].items():
+            expected = (kuma.wiki.content.parse(doc_src)
+                                         .injectSectionIDs()
+                                         .filterEditorSafety()
+                                         .extractSection(section_id)
+                                         .serialize())
+            eq_(expected, raw['html'][start:end])
+        for section_id, (start, end, sha) in store['plain']['sections'].items():
+            expected = (kuma.wiki.content.parse(doc_src)
+                                         .extractSection(section_id)
+                                         .serialize())
+            eq_(hashlib.sha1(expected.encode('utf8')).hexdigest(), sha)
+
+    def test_find_changed_sections(self):
+        """Changes should be confined to the smallest changed sections"""
+        doc_src = """
+            <p>Intro</p>
+            <h2 id="s1">Head 1</h2>
+            <p>one</p>
+            <h3 id="s1-1">Head 1-1</h3>
+            <p>one-one</p>
+            <h2 id="s2">Head 2</h2>
+            <p>two</p>
+        """
+        old = kuma.wiki.content.parse(doc_src).indexSections()
+
+        def changed(new_src):
+            # Only the hashes of the old content are needed
+            return find_changed_sections(
+                build_section_store(doc_src)['plain'],
+                kuma.wiki.content.parse(new_src).indexSections())
+
+        eq_(None, changed(doc_src))
+        eq_({'s1-1': '<h3 id="s1-1">Head 1-1</h3>\n            <p>new</p>\n'
+                     '            '},
+            changed(doc_src.replace('one-one', 'new')))
+        eq_(['s1', 's2'],
+            sorted(changed(doc_src.replace('<p>one</p>', '<p>new</p>')
+                                  .replace('two', 'new'))))
+        # Changes within both a section and the one containing it
+        eq_(['s1'], sorted(changed(doc_src.replace('one', 'new'))))
+        # Changes outside of any section, or to the sections themselves
+        eq_(None, changed(doc_src.replace('Intro', 'New')))
+        eq_(None, changed(doc_src.replace('id="s2"', 'id="s3"')))
+
+        new = (kuma.wiki.content.parse(doc_src.replace('two', 'new'))
+                                .indexSections())
+        eq_(new['html'],
+            splice_sections(old, find_changed_sections(old, new)))
+        eq_(None, splice_sections(old, {'s1': '', 's1-1': ''}))
+        eq_(None, splice_sections(old, {'missing': ''}))
+
+    def test_lxml_parser(self):
+        """The lxml backend should match html5lib on well-formed content"""
+        doc_src = """
+            <h2 id="s1">Head 1 &amp; <code>more</code></h2>
+            <p>test <a href="/en-US/docs/foo" class="new">foo</a></p>
+            <!-- comment -->
+            <h3 id="s1-1">Head 1-1</h3>
+            <pre class="brush: js">var a = 1 &lt; 2;</pre>
+            <section id="sec"><h2>Section</h2><img src="a.png" alt=""></section>
+            <h2 id="s2">Head 2</h2>
+            <ul><li>one</li><li>two</li></ul>
+        """
+        eq_({}, compare_parsers(doc_src))
+
+        tool = kuma.wiki.content.parse(doc_src, parser='lxml')
+        result = tool.replaceSection('s1-1', '<h3 id="s1-1">New</h3><p>new</p>')
+        ok_('<h3 id="s1-1">New</h3><p>new</p>' in result.serialize())
+        ok_('Head 1-1' not in result.serialize())
+
+    @attr('perf')
+    def test_parser_throughput(self):
+        """The lxml backend should give the same output as html5lib faster,
+        and report the time of each phase of a rendering for both"""
+        doc_src = ''.join(
+            '<h2>Head %s</h2><p>Some <a href="https://example.com/%s">text'
+            '</a> and <code>code</code>, <em>emphasis</em></p><h3>Sub</h3>'
+            '<ul><li>a</li><li>b</li></ul><pre class="brush: js">x = 1;</pre>'
+            % (i, i) for i in range(1000))
+
+        def best_time(run):
+            best = None
+            for i in range(3):
+                start = time.time()
+                run()
+                elapsed = time.time() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+            return best
+
+        def filtered(tool, tokens):
+            tool.stream = [dict(token) for token in tokens]
+            return list(tool.replaceSection('Quick_Links', '<!-- -->')
+                            .replaceSection('Subnav', '<!-- -->')
+                            .injectSectionIDs()
+                            .stream)
+
+        outputs, totals, reports = {}, {}, []
+        for name in ('html5lib', 'lxml'):
+            tool = kuma.wiki.content.ContentSectionTool(parser=name)
+            parser = tool.parser
+            doc = parser.parseFragment(doc_src)
+            tokens = list(parser.walk(doc))
+            out = filtered(tool, tokens)
+            outputs[name] = tool.serialize(out)
+            phases = (
+                ('parse', lambda: parser.parseFragment(doc_src)),
+                ('walk', lambda: list(parser.walk(doc))),
+                ('filters', lambda: filtered(tool, tokens)),
+                ('serialize', lambda: tool.serialize(out)),
+            )
+            times = [(phase, best_time(run)) for phase, run in phases]
+            totals[name] = sum(elapsed for phase, elapsed in times)
+            reports.append('%s: %s, total %.3fs' % (
+                name, ', '.join('%s %.3fs' % phase_time
+                                for phase_time in times),
+                totals[name]))
+
+        report = '\n'.join(reports)
+        sys.stderr.write('\n%s\n' % report)
+        eq_(outputs['html5lib'], outputs['lxml'])
+        ok_(totals['lxml'] < totals['html5lib'], report)
+
+    def test_compare_parsers_divergence(self):
+        """Divergences between backends should be reported per operation"""
+        doc_src = """
+            <h2 id="s1">Head 1</h2>
+            <table><tr><td>cell</td></tr></table>
+        """
+        divergences = compare_parsers(doc_src)
+        ok_('serialize' in divergences)
+        ok_("extractSection('s1')" in divergences)
+        ok_('<tbody>' in divergences['serialize']['html5lib'])
+        ok_('<tbody>' not in divergences['serialize']['lxml'])
+
+    def test_fused_body_filters(self):
+        """Fusing the body filters should give the same output as the chain
+        of html5lib filters they replace"""
+        doc_src = ('<section id="Quick_Links"><ul><li>Quick link</li></ul>'
+                   '</section>'
+                   '<h2>Head 1</h2><p>Some <a href="/en-US/docs/Page1">text'
+                   '</a> and <a href="https://example.com/out">out</a></p>'
+                   '<h2>Head 1</h2><p>Again</p>'
+                   '<h3 id="Subnav">Subnav</h3><p>Nav</p>'
+                   '<h2 name="named">Named</h2><h2></h2><p>Empty</p>')
+        # The output of the html5lib filters chained before fusing them
+        expected = (
+            '<section id="Quick_Links"><!-- --></section>'
+            '<h2 id="Head_1">Head 1</h2><p>Some <a href="/en-US/docs/Page1" '
+            'class="new">text</a> and <a href="https://example.com/out" '
+            'class="external">out</a></p>'
+            '<h2 id="Head_1_2">Head 1</h2><p>Again</p><!-- -->'
+            '<h2 id="named" name="named">Named</h2><h2 id="sect1"></h2>'
+            '<p>Empty</p>')
+        tool = kuma.wiki.content.parse(doc_src)
+        eq_(expected, tool.serialize(chain_body_filters(tool.stream,
+                                                        'http://testserver')))
+        result = (kuma.wiki.content.parse(doc_src)
+                                   .replaceSection('Quick_Links', '<!-- -->')
+                                   .replaceSection('Subnav', '<!-- -->')
+                                   .injectSectionIDs()
+                                   .annotateLinks(base_url='http://testserver')
+                                   .serialize())
+        eq_(expected, result)
+
+    @attr('perf')
+    def test_fused_filter_throughput(self):
+        """Fusing the body filters should give the same output as the
+        original chained filters, and report the throughput of both in
+        tokens per second"""
+        doc_src = ''.join(
+            '<h2>Head %s</h2><p>Some <a href="/en-US/docs/Page%s">text</a> '
+            'and <a href="https://example.com/%s">out</a></p>'
+            '<h3>Head</h3><ul><li>a</li><li>b</li></ul>' %
+            (i, i % 10, i) for i in range(500))
+        doc_src = ('<section id="Quick_Links"><p>Quick</p></section>' +
+                   doc_src + '<h2 id="Subnav">Subnav</h2><p>Nav</p>')
+        tool = kuma.wiki.content.parse(doc_src)
+        tokens = list(tool.stream)
+        base_url = 'http://testserver'
+
+        def chained():
+            stream = [dict(token) for token in tokens]
+            return list(chain_body_filters(stream, base_url))
+
+        def fused():
+            stream = [dict(token) for token in tokens]
+            comment = [{'type': 'Comment', 'data': ' '}]
+            return list(FusedFilter(stream, [
+                SectionFilter(None, 'Quick_Links', iter(comment)),
+                SectionFilter(None, 'Subnav', iter(comment)),
+                SectionIDFilter(None),
+                LinkAnnotationFilter(None, base_url)]))
+
+        def tokens_per_second(run):
+            best = None
+            for i in range(5):
+                start = time.time()
+                run()
+                elapsed = time.time() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+            return len(tokens) / max(best, 1e-6)
+
+        eq_(tool.serialize(chained()), tool.serialize(fused()))
+        chained_rate = tokens_per_second(chained)
+        fused_rate = tokens_per_second(fused)
+        report = ('%d tokens: fused %d tokens/s, chained %d tokens/s' %
+                  (len(tokens), fused_rate, chained_rate))
+        sys.stderr.write('\n%s\n' % report)
+        ok_(fused_rate > chained_rate, report)
+
     def test_basic_section_replace(self):
         doc_src = """
             <h1 id="s1">Head 1</h1>
@@ -1203,3 +1459,38 @@ class GetSEODescriptionTests(KumaTestCase):
                 works well.</div><p></p>'''
         expected = ('')
         eq_(expected, get_seo_description(content, 'en-US', False))
+
+    def test_later_seo_summary(self):
+        """A .seoSummary should win over a paragraph before it, and the
+        Summary section over anything outside it"""
+        content = (u'<p>First paragraph</p>'
+                   u'<p>Intro <span class="seoSummary">The summary</span></p>')
+        eq_('The summary', get_seo_description(content, 'en-US'))
+
+        content = (u'<p><span class="seoSummary">Outside</span></p>'
+                   u'<h2 id="Summary">Summary</h2><p>Inside</p>'
+                   u'<h2 id="Other">Other</h2><p>After</p>')
+        eq_('Inside', get_seo_description(content, 'en-US'))
+
+    def test_matches_pyquery_summary(self):
+        """The summaries should be those found with PyQuery before"""
+        corpus = CONTENT_CORPUS + (
+            u'<p>Only one</p>',
+            u'<div><p>In a div</p></div>',
+            u'<div><p>A <span class="seoSummary">nested</span> one</p></div>',
+            u'<p>Redirect 1</p><p>Not a redirect</p>',
+            u'<p>&laquo; Previous</p><p>Next one</p>',
+            u'<section id="Summary"><p>A section summary</p></section>',
+            u'Just some text',
+            u'<h2 id="Summary">Summary</h2><div><p>Nested</p></div>'
+            u'<h2 id="Next">Next</h2>',
+            u'<table><tr><td><p>In a table</p></td></tr></table>',
+            u'<p>Unclosed <b>bold<p>Another',
+            u'<p><span class="seoSummary"></span></p><p>After</p>',
+        )
+        for content in corpus:
+            for locale in ('en-US', 'fr'):
+                for strip_markup in (True, False):
+                    eq_(original_seo.get_seo_description(content, locale,
+                                                         strip_markup),
+                        get_seo_description(content, locale, strip_markup))
@@ -3,9 +3,18 @@ import json
 import base64
 
 import mock
+import requests
+from constance.test import override_config
+from django.test import RequestFactory
+from django.test.utils import override_settings
 from nose.tools import eq_, ok_
+from waffle.models import Switch
 
+from kuma.core.cache import memcache
 from kuma.wiki import kumascript
+from kuma.wiki.constants import (KUMASCRIPT_TIMEOUT_ERROR,
+                                 KUMASCRIPT_UNAVAILABLE_ERROR)
+from kuma.wiki.models import Document
 from . import WikiTestCase, document
 
 
@@ -34,6 +43,28 @@ class KumascriptClientTests(WikiTestCase):
             eq_(env_vars[n], result_vars[n])
         eq_(sorted([u'foo', u'bar', u'baz']), sorted(result_vars['tags']))
 
+    @override_config(KUMASCRIPT_ENV_ENCODING='compact')
+    def test_compact_env(self):
+        """The env vars should be sent in one deduplicated header"""
+        files = [{'title': 'File %s' % i, 'url': '/files/%s/file.png' % i}
+                 for i in range(50)]
+        env_vars = dict(path='/foo/test-slug', title=u'Test title \xe9',
+                        tags=[u'foo', u'bar'], files=files, attachments=files)
+        headers = kumascript.add_env_headers({}, env_vars)
+        eq_([kumascript.COMPACT_ENV_HEADER], headers.keys())
+        value = headers[kumascript.COMPACT_ENV_HEADER]
+        ok_(value.startswith('2;deflate;'))
+        eq_(env_vars, kumascript.decode_compact_env(value))
+
+        with override_config(KUMASCRIPT_ENV_ENCODING='headers'):
+            headers = kumascript.add_env_headers({}, env_vars)
+        ok_(len(value) * 10 < sum(len(header) for header in headers.values()))
+
+        # Small env vars aren't compressed
+        value = kumascript.encode_compact_env({'locale': 'de'})
+        ok_(value.startswith('2;identity;'))
+        eq_({'locale': 'de'}, kumascript.decode_compact_env(value))
+
     def test_url_normalization(self):
         """Ensure that template URLs are normalized to lowercase for kumascript"""
         eq_(kumascript._format_slug_for_request('Template:SomEthing'), 'Template:something')
@@ -60,3 +91,186 @@ class KumascriptClientTests(WikiTestCase):
         kumascript.get(doc, 'no-cache', 'https://testserver')
         ok_(not mock_format_slug.called,
             "format slug should not have been called")
+
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_post_document_content(self, mock_post, mock_env_vars):
+        """Content should be rendered with the env vars of its document"""
+        doc = document(title='Test', slug='Test', save=True)
+        mock_env_vars.return_value = {'slug': doc.slug}
+        mock_post.return_value = mock.Mock(status_code=200, headers={},
+                                           text=u'<p>Rendered</p>')
+        body, errors = kumascript.post_document_content(
+            doc, u'<p>{{ test }}</p>', 'no-cache', 'https://testserver')
+        eq_(u'<p>Rendered</p>', body)
+        eq_([], errors)
+
+        args, kwargs = mock_post.call_args
+        eq_('<p>{{ test }}</p>', kwargs['data'])
+        env_slug = kwargs['headers']['x-kumascript-env-slug']
+        eq_(doc.slug, json.loads(base64.b64decode(env_slug)))
+
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_preview_coalescing(self, mock_post):
+        """Identical previews should be rendered once"""
+        Switch.objects.create(name='wiki_preview_coalescing', active=True)
+        memcache.clear()
+        mock_post.return_value = mock.Mock(status_code=200, headers={},
+                                           text=u'<p>Rendered</p>')
+        request = RequestFactory().get('/')
+        for i in range(2):
+            eq_((u'<p>Rendered</p>', []),
+                kumascript.post(request, u'<p>{{ test }}</p>'))
+        eq_(1, mock_post.call_count)
+        kumascript.post(request, u'<p>{{ other }}</p>')
+        eq_(2, mock_post.call_count)
+
+        # Failed renderings aren't cached
+        mock_post.return_value = None
+        for i in range(2):
+            eq_((u'<p>{{ failed }}</p>', KUMASCRIPT_TIMEOUT_ERROR),
+                kumascript.post(request, u'<p>{{ failed }}</p>'))
+        eq_(4, mock_post.call_count)
+
+
+class KumascriptSessionTests(WikiTestCase):
+
+    def setUp(self):
+        super(KumascriptSessionTests, self).setUp()
+        kumascript.reset_connection_stats()
+
+    def test_session_reuse(self):
+        """The session should be kept between requests of a process"""
+        client = kumascript.KumascriptClient()
+        session = client.get_session()
+        ok_(client.get_session() is session)
+
+        with mock.patch('kuma.wiki.kumascript.os.getpid',
+                        return_value=client.pid + 1):
+            ok_(client.get_session() is not session)
+
+    @override_settings(KUMASCRIPT_KEEPALIVE_TIMEOUT=4)
+    def test_idle_session(self):
+        """The session should be replaced after being idle too long"""
+        client = kumascript.KumascriptClient()
+        session = client.get_session()
+        client.last_used -= 5
+        ok_(client.get_session() is not session)
+
+    def test_connection_stats(self):
+        """Requests and new connections should be counted"""
+        client = kumascript.KumascriptClient()
+        client.get_session()
+        response = mock.Mock(status_code=200)
+        with mock.patch.object(client.session, 'request',
+                               return_value=response), \
+                mock.patch.object(client, 'count_connections',
+                                  side_effect=[1, 1, 1]):
+            for i in range(3):
+                eq_(response, client.request('get', 'http://testserver/'))
+        stats = kumascript.get_connection_stats()
+        eq_(3, stats['requests'])
+        eq_(1, stats['new_connections'])
+        eq_(2.0 / 3, stats['reuse_rate'])
+
+
+class KumascriptAvailabilityTests(WikiTestCase):
+
+    def setUp(self):
+        super(KumascriptAvailabilityTests, self).setUp()
+        memcache.clear()
+        self.doc = document(title='Test', slug='Test', save=True)
+
+    @override_config(KUMASCRIPT_TIMEOUT=10.0)
+    @override_settings(KUMASCRIPT_ADAPTIVE_TIMEOUT_FACTOR=3,
+                       KUMASCRIPT_ADAPTIVE_TIMEOUT_MIN=2)
+    def test_adaptive_timeout(self):
+        """The timeout should follow the recent durations of renders"""
+        Switch.objects.create(name='wiki_kumascript_adaptive_timeout',
+                              active=True)
+        response = mock.Mock(status_code=200)
+        eq_(10.0, kumascript.get_timeout(self.doc))
+        kumascript.record_duration(self.doc, 'no-cache', response, 1)
+        eq_(3, kumascript.get_timeout(self.doc))
+        kumascript.record_duration(self.doc, 'max-age=0', response, 0.1)
+        eq_(2.7, kumascript.get_timeout(self.doc))
+        for i in range(10):
+            kumascript.record_duration(self.doc, 'no-cache', response, 0.1)
+        eq_(2, kumascript.get_timeout(self.doc))
+        kumascript.record_duration(self.doc, 'no-cache', response, 5)
+        eq_(10.0, kumascript.get_timeout(self.doc))
+
+        # Only full renders are timed, not responses from the cache of
+        # kumascript, nor 304 responses to conditional GETs.
+        memcache.clear()
+        kumascript.record_duration(self.doc, None, response, 0.1)
+        kumascript.record_duration(self.doc, 'max-age=3600', response, 0.1)
+        kumascript.record_duration(self.doc, 'no-cache',
+                                   mock.Mock(status_code=304), 0.1)
+        eq_(10.0, kumascript.get_timeout(self.doc))
+
+        # A timeout forgets the durations, for the next render to get the
+        # whole timeout.
+        kumascript.record_duration(self.doc, 'no-cache', response, 1)
+        kumascript.record_duration(self.doc, 'no-cache',
+                                   requests.exceptions.ReadTimeout(), None)
+        eq_(10.0, kumascript.get_timeout(self.doc))
+
+    @override_config(KUMASCRIPT_TIMEOUT=5.0)
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_keep_rendering(self, mock_request, mock_env_vars):
+        """Failing to get a response from kumascript should keep the last
+        rendering of the document"""
+        mock_env_vars.return_value = {}
+        mock_request.return_value = mock.Mock(status_code=200, headers={},
+                                              text=u'<p>Rendered</p>')
+        self.doc.render('no-cache')
+        eq_(u'<p>Rendered</p>', self.doc.rendered_html)
+
+        failures = (requests.exceptions.ReadTimeout(),
+                    requests.exceptions.ConnectionError(),
+                    mock.Mock(status_code=503, headers={}, text=u'Oops'))
+        for failure in failures:
+            if isinstance(failure, Exception):
+                mock_request.side_effect = failure
+            else:
+                mock_request.side_effect = None
+                mock_request.return_value = failure
+            eq_((None, KUMASCRIPT_UNAVAILABLE_ERROR),
+                kumascript.get(self.doc, 'no-cache', 'https://testserver'))
+            eq_([(None, KUMASCRIPT_UNAVAILABLE_ERROR)],
+                kumascript.get_many([self.doc], 'no-cache',
+                                    'https://testserver'))
+
+            doc = Document.objects.get(pk=self.doc.pk)
+            doc.render('no-cache')
+            doc = Document.objects.get(pk=self.doc.pk)
+            eq_(u'<p>Rendered</p>', doc.rendered_html)
+            eq_(None, doc.rendered_errors)
+            eq_(None, doc.render_started_at)
+
+    @override_config(KUMASCRIPT_TIMEOUT=5.0)
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.client.request')
+    def test_unavailable_first_rendering(self, mock_request, mock_env_vars):
+        """A document never rendered should be rendered with the errors of
+        an unavailable kumascript, there being no rendering to keep"""
+        mock_env_vars.return_value = {}
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        self.doc.render('no-cache')
+        doc = Document.objects.get(pk=self.doc.pk)
+        eq_(KUMASCRIPT_UNAVAILABLE_ERROR, json.loads(doc.rendered_errors))
+        ok_(doc.last_rendered_at is not None)
+
+    @mock.patch('kuma.wiki.kumascript.get_document_env_vars')
+    @mock.patch('kuma.wiki.kumascript.KumascriptClient.get_session')
+    def test_circuit_breaker(self, mock_get_session, mock_env_vars):
+        """Requests should be refused while the circuit is open"""
+        Switch.objects.create(name='wiki_kumascript_circuit_breaker',
+                              active=True)
+        mock_env_vars.return_value = {}
+        kumascript.breaker.open()
+        eq_((None, KUMASCRIPT_UNAVAILABLE_ERROR),
+            kumascript.get(self.doc, 'no-cache', 'https://testserver'))
+        ok_(not mock_get_session.called)
@@ -1,3 +1,4 @@
+import base64
 import json
 import time
 from cStringIO import StringIO
@@ -13,21 +14,28 @@ from waffle.models import Switch
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test.utils import override_settings
 
+from kuma.core.cache import memcache
 from kuma.core.exceptions import ProgrammingError
 from kuma.core.tests import KumaTestCase, get_user
 from kuma.users.tests import UserTestCase
 
-from . import (create_document_tree, create_template_test_users,
-               create_topical_parents_docs, doc_rev, document, normalize_html,
-               revision)
-from .. import tasks
+from . import (CONTENT_CORPUS, KumascriptStubServer,
+               create_document_tree, create_template_test_users,
+               create_topical_parents_docs,
+               doc_rev, document, normalize_html, revision)
+from .. import kumascript, render_pool, render_queue, tasks
 from ..constants import REDIRECT_CONTENT, TEMPLATE_TITLE_PREFIX
+from ..content import parse as parse_content
 from ..events import EditDocumentInTreeEvent
 from ..exceptions import (DocumentRenderedContentNotAvailable,
                           DocumentRenderingInProgress, PageMoveError)
-from ..models import Document, Revision, RevisionIP, TaggedDocument
+from ..models import (Document, DocumentLink, DocumentMacro,
+                      DocumentRenderTiming, Revision, RevisionIP,
+                      TaggedDocument)
+from ..render_timing import PHASES
 from ..templatetags.jinja_helpers import absolutify
 from ..utils import tidy_content
 from ..signals import render_done
@@ -1124,6 +1132,485 @@ class RenderExpiresTests(UserTestCase):
         ok_(d1_fresh.last_rendered_at > earlier)
 
 
+class DocumentLinkTests(UserTestCase):
+    """Tests for the links between documents"""
+
+    def setUp(self):
+        super(DocumentLinkTests, self).setUp()
+        self.doc = document(locale='en-US', slug='linking', save=True,
+                            html='<a href="/en-US/docs/target">Target</a>'
+                                 '<a href="/fr/docs/cible">Cible</a>')
+
+    def links(self):
+        return set(self.doc.links.values_list('locale', 'slug'))
+
+    @override_config(KUMASCRIPT_TIMEOUT=0)
+    def test_links_recorded(self):
+        self.doc.render()
+        eq_(set([('en-us', 'target'), ('fr', 'cible')]), self.links())
+
+        self.doc.html = '<a href="/en-US/docs/Other">Other</a>'
+        self.doc.save()
+        self.doc.render()
+        eq_(set([('en-us', 'other')]), self.links())
+        eq_(1, DocumentLink.objects.count())
+
+    def test_update_document_links(self):
+        """Documents rendered before links were recorded get them recorded
+        by the update_document_links command"""
+        eq_(set(), self.links())
+        call_command('update_document_links', stdout=StringIO())
+        eq_(set([('en-us', 'target'), ('fr', 'cible')]), self.links())
+
+        # So the red links are refreshed when the target is created
+        document(locale='fr', slug='cible', save=True)
+        body_html = Document.objects.get(pk=self.doc.pk).body_html
+        ok_('href="/fr/docs/cible"' in body_html)
+        ok_('cible" class="new"' not in body_html)
+
+    @override_config(KUMASCRIPT_TIMEOUT=0)
+    def test_red_links_updated(self):
+        self.doc.render()
+        ok_('cible" class="new"' in
+            Document.objects.get(pk=self.doc.pk).body_html)
+        modified = Document.objects.get(pk=self.doc.pk).modified
+
+        target = document(locale='fr', slug='cible', save=True)
+        doc = Document.objects.get(pk=self.doc.pk)
+        ok_('cible" class="new"' not in doc.body_html)
+        eq_(modified, doc.modified)
+
+        target.delete()
+        ok_('cible" class="new"' in
+            Document.objects.get(pk=self.doc.pk).body_html)
+
+        target = Document.deleted_objects.get(pk=target.pk)
+        target.restore()
+        ok_('cible" class="new"' not in
+            Document.objects.get(pk=self.doc.pk).body_html)
+
+
+@override_config(KUMASCRIPT_TIMEOUT=0)
+class DocumentMacroTests(UserTestCase):
+    """Tests for the dependencies of documents on templates"""
+
+    def setUp(self):
+        super(DocumentMacroTests, self).setUp()
+        self.data = document(slug='Template:CSSData', html='data', save=True)
+        self.ref = document(slug='Template:CSSRef', save=True,
+                            html='<%- template("CSSData", []) %>')
+        document(slug='Template:Other', html='other', save=True)
+        self.doc = document(slug='color', save=True,
+                            html='{{ CSSRef }}<p>{{cssxref("color")}}</p>')
+        self.doc.render()
+
+    def test_macros_recorded(self):
+        eq_(set(['cssref', 'cssxref']),
+            set(self.doc.macros.values_list('name', flat=True)))
+        eq_(['cssdata'], list(self.ref.macros.values_list('name', flat=True)))
+
+        self.doc.html = '<p>{{ cssxref("color") }}</p>'
+        self.doc.save()
+        self.doc.render()
+        eq_(['cssxref'], list(self.doc.macros.values_list('name', flat=True)))
+        eq_(2, DocumentMacro.objects.count())
+
+    def test_update_document_macros(self):
+        """Documents rendered before macros were recorded get them recorded
+        by the update_document_macros command"""
+        DocumentMacro.objects.all().delete()
+        eq_([], list(self.data.get_template_dependents()))
+        call_command('update_document_macros', stdout=StringIO())
+        eq_([self.doc], list(self.data.get_template_dependents()))
+
+    def test_template_dependents(self):
+        other = document(slug='other', html='{{ Other }}', save=True)
+        other.render()
+        eq_([self.doc], list(self.data.get_template_dependents()))
+        eq_([self.doc], list(self.ref.get_template_dependents()))
+        eq_([other], list(Document.objects.get(slug='Template:Other')
+                                          .get_template_dependents()))
+
+    @mock.patch.object(tasks.render_document_chunk, 'delay')
+    def test_template_change(self, mock_render_document_chunk_delay):
+        linked = document(slug='linked', html='{{ CSSRef }}', save=True)
+        linked.render()
+        linking = document(html='<a href="/en-US/docs/linked">x</a>',
+                           save=True)
+        linking.render()
+
+        # Saving a template unchanged doesn't re-render anything.
+        self.data.save()
+        ok_(not mock_render_document_chunk_delay.called)
+
+        # Changing it re-renders the documents using it, most linked first.
+        self.data.html = 'new data'
+        self.data.save()
+        mock_render_document_chunk_delay.assert_called_once_with(
+            (linked.pk, self.doc.pk))
+
+        # Even if only the case or the trailing whitespace changed
+        for html in ('New data', 'New data '):
+            self.data.html = html
+            self.data.save()
+        eq_(3, mock_render_document_chunk_delay.call_count)
+
+        # The most viewed documents are rendered first
+        render_queue.record_view(self.doc)
+        self.data.html = 'newer data'
+        self.data.save()
+        mock_render_document_chunk_delay.assert_called_with(
+            (self.doc.pk, linked.pk))
+
+
+@override_config(KUMASCRIPT_TIMEOUT=1.0)
+class IncrementalRenderingTests(UserTestCase):
+    """Tests for rendering only the sections changed by an edit"""
+    html = ('<h2 id="s1">One</h2><p>{{ one }}</p>'
+            '<h2 id="s2">Two</h2><p>{{ two }}</p>')
+
+    def setUp(self):
+        super(IncrementalRenderingTests, self).setUp()
+        Switch.objects.create(name='wiki_incremental_rendering', active=True)
+        self.doc = document(html=self.html, save=True)
+
+    def render(self, html, mock_kumascript_get, mock_post):
+        """Render the document after changing its HTML"""
+        mock_kumascript_get.return_value = (
+            html.replace('{{ one }}', '1').replace('{{ two }}', '2'), None)
+        mock_post.return_value = ('<h2 id="s2">Two</h2><p>3</p>', None)
+        self.doc.html = html
+        self.doc.save()
+        self.doc.render()
+
+    @mock.patch('kuma.wiki.kumascript.post_document_content')
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_changed_section(self, mock_kumascript_get, mock_post):
+        self.render(self.html, mock_kumascript_get, mock_post)
+        eq_(1, mock_kumascript_get.call_count)
+
+        self.render(self.html.replace('{{ two }}', '{{ three }}'),
+                    mock_kumascript_get, mock_post)
+        eq_(1, mock_kumascript_get.call_count)
+        eq_('<h2 id="s2">Two</h2><p>{{ three }}</p>',
+            mock_post.call_args[0][1])
+        eq_('<h2 id="s1">One</h2><p>1</p><h2 id="s2">Two</h2><p>3</p>',
+            self.doc.rendered_html)
+        ok_('<p>3</p>' in Document.objects.get(pk=self.doc.pk).body_html)
+
+    @mock.patch('kuma.wiki.kumascript.post_document_content')
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_full_render(self, mock_kumascript_get, mock_post):
+        self.render(self.html, mock_kumascript_get, mock_post)
+
+        # Changes outside of the sections
+        self.render('<p>Intro</p>' + self.html, mock_kumascript_get,
+                    mock_post)
+        eq_(2, mock_kumascript_get.call_count)
+
+        # Macros depending on the whole page
+        html = self.html + '<p>{{ EmbedLiveSample("s1") }}</p>'
+        self.render(html, mock_kumascript_get, mock_post)
+        self.render(html.replace('{{ two }}', '{{ three }}'),
+                    mock_kumascript_get, mock_post)
+        eq_(4, mock_kumascript_get.call_count)
+
+        eq_(0, mock_post.call_count)
+
+        # Errors rendering the changed sections
+        mock_kumascript_get.return_value = (self.html, None)
+        mock_post.return_value = ('', [{'level': 'error'}])
+        self.doc.html = self.html
+        self.doc.save()
+        self.doc.render()
+        eq_(1, mock_post.call_count)
+        eq_(5, mock_kumascript_get.call_count)
+
+    @mock.patch('kuma.wiki.kumascript.post_document_content')
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_errors(self, mock_kumascript_get, mock_post):
+        errors = [{'level': 'error', 'message': 'Boom'}]
+        mock_kumascript_get.return_value = (self.html, errors)
+        self.doc.render()
+        eq_(errors, json.loads(self.doc.rendered_errors))
+
+        # The errors of the last rendering can't be traced back to sections,
+        # so fixing one renders the whole document again.
+        self.render(self.html.replace('{{ two }}', '{{ three }}'),
+                    mock_kumascript_get, mock_post)
+        eq_(2, mock_kumascript_get.call_count)
+        eq_(None, self.doc.rendered_errors)
+
+        # Once rendered without errors, the changed sections are rendered
+        # alone, without errors either.
+        self.render(self.html, mock_kumascript_get, mock_post)
+        eq_(2, mock_kumascript_get.call_count)
+        eq_(1, mock_post.call_count)
+        eq_(None, self.doc.rendered_errors)
+
+    @mock.patch('kuma.wiki.kumascript.post_document_content')
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_source_parsed_once(self, mock_kumascript_get, mock_post):
+        """The raw HTML should only be parsed for the section store when it
+        changed, and only once by an incremental rendering"""
+        with mock.patch('kuma.wiki.models.parse_content',
+                        wraps=parse_content) as mock_parse:
+            def source_parses():
+                return len([call for call in mock_parse.call_args_list
+                            if call[0][0] == self.doc.html])
+
+            self.render(self.html, mock_kumascript_get, mock_post)
+            eq_(1, source_parses())
+            self.doc.render('no-cache')
+            eq_(1, source_parses())
+
+            mock_parse.reset_mock()
+            self.render(self.html.replace('{{ two }}', '{{ three }}'),
+                        mock_kumascript_get, mock_post)
+            eq_(1, mock_post.call_count)
+            eq_(1, source_parses())
+        store = Document.objects.get(pk=self.doc.pk).get_section_store()
+        eq_(parse_content(self.doc.html).indexSections()['sections'].keys(),
+            store.get_source_index(self.doc.html)['sections'].keys())
+
+
+class BatchRenderingTests(UserTestCase):
+    """Tests for rendering chunks of documents at once"""
+
+    def setUp(self):
+        super(BatchRenderingTests, self).setUp()
+        Switch.objects.create(name='wiki_batch_rendering', active=True)
+        self.server = KumascriptStubServer(delay=0.2)
+        self.server.start()
+        self.settings_override = override_settings(
+            KUMASCRIPT_URL_TEMPLATE=self.server.url_template,
+            KUMASCRIPT_BATCH_CONCURRENCY=4)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.server.stop()
+        super(BatchRenderingTests, self).tearDown()
+
+    def create_document(self, slug):
+        return revision(document=document(slug=slug, save=True),
+                        content='<p>{{ test }}</p>', save=True).document
+
+    def test_render_document_chunk(self):
+        """The documents of a chunk should be rendered concurrently"""
+        docs = [self.create_document('batch-%s' % i) for i in range(4)]
+        with override_config(KUMASCRIPT_TIMEOUT=5.0):
+            tasks.render_document_chunk([doc.pk for doc in docs])
+
+        eq_(4, len(self.server.requests))
+        eq_(4, self.server.max_concurrent)
+        for doc in docs:
+            doc = Document.objects.get(pk=doc.pk)
+            eq_('<p>Rendered /docs/en-US/%s</p>' % doc.slug,
+                doc.rendered_html)
+            eq_(None, doc.rendered_errors)
+            ok_(doc.last_rendered_at is not None)
+            ok_(not doc.is_rendering_in_progress)
+
+        # Each request got the env vars of its document
+        slugs = set(json.loads(base64.b64decode(
+                    headers['x-kumascript-env-slug']))
+                    for _, _, headers in self.server.requests)
+        eq_(set(doc.slug for doc in docs), slugs)
+
+    def test_render_pool(self):
+        """The cached fields of a chunk should be built in a render pool"""
+        docs = [self.create_document('pool-%s' % i) for i in range(3)]
+        try:
+            with override_config(KUMASCRIPT_TIMEOUT=5.0):
+                tasks.render_document_chunk([doc.pk for doc in docs],
+                                            workers=2)
+            pool = render_pool._pool
+            ok_(pool is not None)
+
+            docs = [Document.objects.get(pk=doc.pk) for doc in docs]
+            for doc in docs:
+                eq_('<p>Rendered /docs/en-US/%s</p>' % doc.slug,
+                    doc.rendered_html)
+                eq_(doc.rendered_html, doc.body_html)
+                ok_(doc.summary_text)
+            args = [doc.get_render_artifacts_args() for doc in docs]
+            eq_(render_pool.build_many(args, 1),
+                render_pool.build_many(args, 2))
+            # The pool is kept for the next chunks
+            ok_(render_pool.get_pool(2) is pool)
+        finally:
+            render_pool.close_pool()
+
+    def test_rendering_in_progress(self):
+        """Documents already being rendered should be left alone"""
+        doc = self.create_document('busy')
+        Document.objects.filter(pk=doc.pk).update(
+            render_started_at=datetime.now())
+        with override_config(KUMASCRIPT_TIMEOUT=5.0):
+            tasks.render_document_chunk([doc.pk])
+            eq_([], self.server.requests)
+
+            tasks.render_document_chunk([doc.pk], force=True)
+            eq_(1, len(self.server.requests))
+
+
+class UnavailableKumascriptTests(UserTestCase):
+    """Tests for rendering while kumascript is unavailable"""
+
+    def setUp(self):
+        super(UnavailableKumascriptTests, self).setUp()
+        Switch.objects.create(name='wiki_kumascript_circuit_breaker',
+                              active=True)
+        self.doc = document(html='<p>{{ test }}</p>',
+                            rendered_html='<p>Rendered</p>', save=True)
+        kumascript.breaker.open()
+
+    def tearDown(self):
+        kumascript.breaker.close()
+        super(UnavailableKumascriptTests, self).tearDown()
+
+    @override_config(KUMASCRIPT_TIMEOUT=5.0)
+    @mock.patch('kuma.wiki.kumascript.KumascriptClient.get_session')
+    def test_keep_last_rendering(self, mock_get_session):
+        """The last rendering should be kept while the circuit is open"""
+        eq_(('<p>Rendered</p>', None),
+            self.doc.get_rendered('no-cache', 'http://testserver'))
+        ok_(not mock_get_session.called)
+        doc = Document.objects.get(pk=self.doc.pk)
+        eq_('<p>Rendered</p>', doc.rendered_html)
+        ok_(not doc.is_rendering_scheduled)
+        ok_(not doc.is_rendering_in_progress)
+
+
+class RenderTimingTests(UserTestCase):
+    """Tests for the render timings of documents"""
+
+    def setUp(self):
+        super(RenderTimingTests, self).setUp()
+        Switch.objects.create(name='wiki_render_timing', active=True)
+        self.server = KumascriptStubServer(delay=0.1)
+        self.server.start()
+        self.settings_override = override_settings(
+            KUMASCRIPT_URL_TEMPLATE=self.server.url_template)
+        self.settings_override.enable()
+        self.doc = revision(document=document(slug='timed', save=True),
+                            content='<p>{{ test }}</p>', save=True).document
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.server.stop()
+        super(RenderTimingTests, self).tearDown()
+
+    def test_render_timing(self):
+        """The durations of the phases of renderings should be recorded"""
+        with override_config(KUMASCRIPT_TIMEOUT=5.0):
+            self.doc.render('no-cache', 'http://testserver')
+            self.doc.render('no-cache', 'http://testserver')
+        timing = DocumentRenderTiming.objects.get(document=self.doc)
+        renders = timing.get_renders()
+        eq_(2, len(renders))
+        for render in renders:
+            ok_(render['kumascript'] >= self.server.delay)
+            ok_(render['save'] > 0)
+            ok_(render['total'] >= sum(render[phase] for phase in PHASES))
+        eq_(renders[-1]['total'], timing.last_duration)
+        eq_(2, sum(count for label, count in timing.get_histogram()))
+        ok_(self.doc.render_timer is None)
+
+        out = StringIO()
+        call_command('render_timings', stdout=out)
+        ok_('en-US/timed' in out.getvalue())
+
+    @override_config(KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT=1.0)
+    @override_settings(WIKI_RENDER_TIMING_RECENT=3,
+                       WIKI_RENDER_TIMING_UNDEFER_RATIO=0.5)
+    def test_deferred_rendering(self):
+        """Documents should be moved in and out of deferred rendering by the
+        median duration of their recent renderings"""
+        timing = DocumentRenderTiming.objects.create(document=self.doc)
+        deferred = False
+        for duration, expected in ((2, True), (0.1, True), (0.1, True),
+                                   (0.1, False), (2, False), (2, True),
+                                   (0.1, True), (0.6, True), (0.1, True),
+                                   (0.1, True), (0.1, False)):
+            deferred = timing.should_defer_rendering(duration, deferred)
+            eq_(expected, deferred)
+            timing.record(duration, {})
+
+
+@override_config(KUMASCRIPT_TIMEOUT=5.0)
+class RenderOnlySaveTests(UserTestCase):
+    """Tests for saving only the fields set by renderings"""
+
+    def setUp(self):
+        super(RenderOnlySaveTests, self).setUp()
+        Switch.objects.create(name='wiki_render_only_save', active=True)
+        Switch.objects.create(name='wiki_render_timing', active=True)
+
+    def create_document(self, slug):
+        return revision(document=document(slug=slug, save=True),
+                        content='<p>{{ test }}</p>', save=True).document
+
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_render(self, mock_kumascript_get):
+        mock_kumascript_get.return_value = ('<h2 id="One">One</h2>', None)
+        doc = self.create_document('render-only')
+        modified = doc.modified
+        # The document is edited while it's being rendered
+        Document.objects.filter(pk=doc.pk).update(html='<p>Edited</p>')
+
+        with mock.patch.object(Document, 'save') as mock_save:
+            doc.render('no-cache', 'http://testserver')
+        ok_(not mock_save.called)
+
+        saved = Document.objects.get(pk=doc.pk)
+        eq_('<p>Edited</p>', saved.html)
+        eq_('<h2 id="One">One</h2>', saved.rendered_html)
+        ok_('One' in saved.toc_html)
+        eq_(doc.last_rendered_at, saved.last_rendered_at)
+        ok_(saved.modified > modified)
+        eq_(saved.modified.strftime('%s'),
+            memcache.get(saved.last_modified_cache_key))
+
+        timing = DocumentRenderTiming.objects.get(document=doc)
+        eq_(1, len(timing.get_renders()))
+        ok_(doc.render_timer is None)
+        ok_(doc.pending_render_timing is None)
+
+    @mock.patch('kuma.wiki.kumascript.get_many')
+    @override_settings(WIKI_RENDER_SAVE_BATCH_SIZE=2)
+    def test_render_documents(self, mock_kumascript_get_many):
+        docs = [self.create_document('bulk-%s' % i) for i in range(3)]
+        mock_kumascript_get_many.return_value = [
+            ('<p>Rendered %s</p>' % doc.slug, ['Error'] if i else None)
+            for i, doc in enumerate(docs)]
+
+        with mock.patch.object(Document, 'save') as mock_save:
+            rendered = Document.objects.render_documents(
+                docs, 'no-cache', 'http://testserver')
+        ok_(not mock_save.called)
+        eq_([(doc, None) for doc in docs], rendered)
+
+        for i, doc in enumerate(docs):
+            saved = Document.objects.get(pk=doc.pk)
+            eq_('<p>Rendered %s</p>' % doc.slug, saved.rendered_html)
+            eq_(i and '["Error"]' or None, saved.rendered_errors)
+            eq_(doc.last_rendered_at, saved.last_rendered_at)
+            ok_(not saved.is_rendering_in_progress)
+            eq_(1, len(saved.render_timing.get_renders()))
+
+    def test_save_renderings_queries(self):
+        docs = [self.create_document('bulk-%s' % i) for i in range(5)]
+        for doc in docs:
+            doc.rendered_html = '<p>Rendered %s</p>' % doc.slug
+        with override_settings(WIKI_RENDER_SAVE_BATCH_SIZE=2):
+            with self.assertNumQueries(3):
+                Document.objects.save_renderings(docs)
+        eq_(['<p>Rendered %s</p>' % doc.slug for doc in docs],
+            [Document.objects.get(pk=doc.pk).rendered_html for doc in docs])
+
+
 class PageMoveTests(UserTestCase):
     """Tests for page-moving and associated functionality."""
 
@@ -1808,6 +2295,31 @@ class DocumentParsingTests(UserTestCase):
         ]
         eq_(expected_sections, json_data['sections'])
 
+    def test_regenerate_cache_with_fields_matches_getters(self):
+        """The single-parse regeneration should produce exactly the content
+        of the individual @cache_with_field methods"""
+        r = revision(title='Document with sections',
+                     slug='document-with-sections',
+                     is_approved=True, save=True)
+        d = r.document
+        getters = (
+            ('body_html', d.get_body_html),
+            ('quick_links_html', d.get_quick_links_html),
+            ('zone_subnav_local_html', d.get_zone_subnav_local_html),
+            ('toc_html', d.get_toc_html),
+            ('summary_html', d.get_summary_html),
+            ('summary_text', d.get_summary_text),
+        )
+        for toc_depth in (0, 1, 2, 3, 4):
+            d.current_revision.toc_depth = toc_depth
+            for src in CONTENT_CORPUS:
+                d.rendered_html = src
+                d.regenerate_cache_with_fields()
+                regenerated = dict((field_name, getattr(d, field_name))
+                                   for field_name, getter in getters)
+                for field_name, getter in getters:
+                    eq_(getter(force_fresh=True), regenerated[field_name])
+
 
 class RevisionIPTests(UserTestCase):
     def test_delete_older_than_default_30_days(self):
@@ -0,0 +1,85 @@
+import threading
+
+import mock
+from nose.tools import eq_, ok_
+from waffle.models import Switch
+
+from kuma.core.cache import memcache
+from kuma.users.tests import UserTestCase
+
+from . import document, revision
+from .. import pending_renders, tasks
+from ..models import Document
+
+
+class PendingRendersTests(UserTestCase):
+
+    def setUp(self):
+        super(PendingRendersTests, self).setUp()
+        memcache.clear()
+
+    def test_strongest(self):
+        eq_(None, pending_renders.strongest())
+        eq_(None, pending_renders.strongest(None, None))
+        eq_('max-age=3600', pending_renders.strongest(None, 'max-age=3600'))
+        eq_('max-age=0',
+            pending_renders.strongest('max-age=3600', 'max-age=0', None))
+        eq_('no-cache',
+            pending_renders.strongest('no-cache', 'max-age=0'))
+
+    def test_request_and_take(self):
+        ok_(pending_renders.request(1, 'max-age=0'))
+        ok_(not pending_renders.request(1, 'no-cache'))
+        ok_(not pending_renders.request(1, None))
+        ok_(pending_renders.request(2))
+
+        eq_('no-cache', pending_renders.take(1))
+        eq_(None, pending_renders.take(2))
+        eq_('max-age=0', pending_renders.take(2, 'max-age=0'))
+        # Once taken, a new rendering can be requested
+        ok_(pending_renders.request(1))
+
+    @mock.patch('kuma.wiki.pending_renders.config',
+                KUMA_DOCUMENT_RENDER_TIMEOUT=180)
+    def test_concurrent_requests(self, mock_config):
+        cache_controls = [None, 'max-age=0', 'no-cache', 'max-age=3600'] * 8
+        start = threading.Event()
+        scheduled = []
+
+        def schedule(cache_control):
+            start.wait()
+            if pending_renders.request(1, cache_control):
+                scheduled.append(cache_control)
+
+        threads = [threading.Thread(target=schedule, args=(cache_control,))
+                   for cache_control in cache_controls]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+        # The requests are collapsed into one rendering, with the strongest
+        # cache control requested.
+        eq_(1, len(scheduled))
+        eq_('no-cache', pending_renders.take(1, scheduled[0]))
+
+    @mock.patch.object(tasks.render_document, 'delay')
+    def test_schedule_rendering(self, mock_render_document_delay):
+        Switch.objects.create(name='wiki_render_coalescing', active=True)
+        doc = document(defer_rendering=True, save=True)
+        revision(document=doc, is_approved=True, save=True)
+
+        # Instances loaded before the rendering was scheduled don't know
+        # about it, and would schedule it again.
+        first, second = (Document.objects.get(pk=doc.pk),
+                         Document.objects.get(pk=doc.pk))
+        first.schedule_rendering('max-age=0', 'http://testserver/')
+        eq_(False, second.schedule_rendering('no-cache',
+                                             'http://testserver/'))
+        mock_render_document_delay.assert_called_once_with(
+            doc.pk, 'max-age=0', 'http://testserver/')
+
+        with mock.patch('kuma.wiki.models.Document.render') as mock_render:
+            tasks.render_document(doc.pk, 'max-age=0', 'http://testserver/')
+        mock_render.assert_called_once_with('no-cache', 'http://testserver/')
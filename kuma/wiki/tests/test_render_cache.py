@@ -0,0 +1,141 @@
+import mock
+from constance.test import override_config
+from django.test.utils import override_settings
+from nose.tools import eq_, ok_
+
+from kuma.core.cache import memcache
+from kuma.users.tests import UserTestCase
+
+from . import document, revision
+from .. import render_cache
+
+
+@override_config(KUMASCRIPT_RENDER_CACHE_ENV_VARS='locale')
+class RenderCacheTests(UserTestCase):
+
+    def setUp(self):
+        super(RenderCacheTests, self).setUp()
+        memcache.clear()
+        self.html = '<p>{{ SomeMacro }}</p>'
+        self.template = self.doc(slug='Template:SomeMacro', html='macro')
+
+    def doc(self, html=None, **kwargs):
+        doc = document(save=True, **kwargs)
+        revision(document=doc, content=html or self.html, is_approved=True,
+                 save=True)
+        return doc
+
+    def render(self, doc, cache_control=None):
+        return render_cache.render(doc, cache_control, 'http://testserver')
+
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_identical_content(self, mock_kumascript_get):
+        mock_kumascript_get.return_value = ('<p>Rendered</p>', None)
+        eq_(('<p>Rendered</p>', None), self.render(self.doc(slug='one')))
+        eq_(('<p>Rendered</p>', None), self.render(self.doc(slug='two')))
+        eq_(1, mock_kumascript_get.call_count)
+
+        # Other locales render differently
+        self.render(self.doc(locale='fr', slug='un'))
+        eq_(2, mock_kumascript_get.call_count)
+
+        # As do identical documents after a change of their templates
+        revision(document=self.template, content='new macro',
+                 is_approved=True, save=True)
+        self.render(self.doc(slug='three'))
+        eq_(3, mock_kumascript_get.call_count)
+
+        stats = render_cache.get_stats()
+        eq_(1, stats['hits'])
+        eq_(3, stats['misses'])
+        eq_(3, stats['stores'])
+        eq_(0.25, stats['hit_rate'])
+
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_no_macros(self, mock_kumascript_get):
+        mock_kumascript_get.side_effect = lambda doc, *args, **kwargs: (
+            '<p>Rendered %s</p>' % doc.slug, None)
+
+        # Documents without macros share results across pages and locales.
+        html = '<p>No macros</p>'
+        eq_(('<p>Rendered stub</p>', None),
+            self.render(self.doc(slug='stub', html=html)))
+        eq_(('<p>Rendered stub</p>', None),
+            self.render(self.doc(locale='fr', slug='ebauche', html=html)))
+        eq_(1, mock_kumascript_get.call_count)
+
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_page_macros(self, mock_kumascript_get):
+        mock_kumascript_get.side_effect = lambda doc, *args, **kwargs: (
+            '<p>Rendered %s</p>' % doc.slug, None)
+
+        # Documents calling macros depending on their page are cached by
+        # the identity of their page, so they don't share results.
+        html = '<p>{{ Breadcrumbs }}</p>'
+        one = self.doc(slug='one', html=html)
+        two = self.doc(slug='two', html=html)
+        ok_(render_cache.is_cacheable(one))
+        eq_(('<p>Rendered one</p>', None), self.render(one))
+        eq_(('<p>Rendered two</p>', None), self.render(two))
+        eq_(('<p>Rendered one</p>', None), self.render(one))
+        eq_(2, mock_kumascript_get.call_count)
+        eq_(1, render_cache.get_stats()['hits'])
+
+        # Those calling macros depending on the whole page are never cached.
+        html = '<p>{{ EmbedLiveSample("s1") }}</p>'
+        three = self.doc(slug='three', html=html)
+        ok_(not render_cache.is_cacheable(three))
+        self.render(three)
+        self.render(three)
+        eq_(4, mock_kumascript_get.call_count)
+        eq_(2, render_cache.get_stats()['misses'])
+
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_uncached(self, mock_kumascript_get):
+        # Renders with errors aren't cached
+        mock_kumascript_get.return_value = ('<p>Error</p>', ['Error'])
+        self.render(self.doc(slug='one'))
+        self.render(self.doc(slug='two'))
+        eq_(2, mock_kumascript_get.call_count)
+
+        # no-cache renders skip the lookup, but update the cache
+        mock_kumascript_get.return_value = ('<p>Rendered</p>', None)
+        self.render(self.doc(slug='three'), 'no-cache')
+        self.render(self.doc(slug='four'), 'no-cache')
+        eq_(4, mock_kumascript_get.call_count)
+        eq_(('<p>Rendered</p>', None), self.render(self.doc(slug='five')))
+        eq_(4, mock_kumascript_get.call_count)
+
+    @override_settings(WIKI_RENDER_CACHE_SLOTS=1,
+                       WIKI_RENDER_CACHE_MAX_ENTRY_SIZE=20)
+    @mock.patch('kuma.wiki.kumascript.get')
+    def test_eviction(self, mock_kumascript_get):
+        mock_kumascript_get.return_value = ('<p>Rendered</p>', None)
+        self.render(self.doc(slug='one'))
+        self.render(self.doc(slug='two', html='<p>Other</p>'))
+        self.render(self.doc(slug='three'))
+        eq_(3, mock_kumascript_get.call_count)
+        eq_(2, render_cache.get_stats()['evictions'])
+
+        mock_kumascript_get.return_value = ('<p>%s</p>' % ('x' * 20), None)
+        self.render(self.doc(slug='four', html='<p>Big</p>'))
+        stats = render_cache.get_stats()
+        eq_(1, stats['oversized'])
+        eq_(3, stats['stores'])
+        ok_(render_cache.lookup(
+            render_cache.build_key(self.doc(slug='five'), 'http://testserver',
+                                   None)))
+
+    @mock.patch('kuma.wiki.kumascript.get_many')
+    def test_render_many(self, mock_get_many):
+        mock_get_many.side_effect = lambda docs, *args, **kwargs: [
+            ('<p>Rendered %s</p>' % doc.slug, None) for doc in docs]
+        one, two = self.doc(slug='one'), self.doc(slug='two')
+        other = self.doc(slug='other', html='<p>Other</p>')
+        eq_([('<p>Rendered one</p>', None), ('<p>Rendered other</p>', None)],
+            render_cache.render_many([one, other], None, 'http://testserver'))
+
+        # Only the documents whose results aren't cached are rendered
+        eq_([('<p>Rendered one</p>', None), ('<p>Rendered other</p>', None)],
+            render_cache.render_many([two, other], None, 'http://testserver'))
+        eq_(1, mock_get_many.call_count)
@@ -0,0 +1,113 @@
+import mock
+from django.core import mail
+from django.core.management import call_command
+from nose.tools import eq_, ok_
+
+from kuma.users.tests import UserTestCase
+
+from . import document, revision
+from .. import tasks
+from ..models import Document, DocumentRenderJob, DocumentRenderJobChunk
+
+
+class RenderJobTests(UserTestCase):
+
+    def setUp(self):
+        super(RenderJobTests, self).setUp()
+        self.docs = []
+        for index in range(5):
+            doc = document(slug='Doc%s' % index, save=True)
+            revision(document=doc, is_approved=True, save=True)
+            self.docs.append(doc)
+        self.pks = [each.pk for each in self.docs]
+
+    def job(self, **kwargs):
+        return DocumentRenderJob.create_for(self.pks, 2, **kwargs)
+
+    def statuses(self, job):
+        return list(job.chunks.values_list('status', flat=True))
+
+    def test_create_for(self):
+        job = self.job()
+        eq_([self.pks[:2], self.pks[2:4], self.pks[4:]],
+            [chunk.get_pks() for chunk in job.chunks.all()])
+        progress = job.get_progress()
+        eq_(3, progress['chunks'])
+        eq_(5, progress['documents'])
+        eq_(3, progress[DocumentRenderJobChunk.STATUS_PENDING])
+        eq_({}, progress['failures'])
+
+    @mock.patch.object(tasks.render_job_chunk, 'delay')
+    def test_parallelism(self, mock_render_job_chunk_delay):
+        job = self.job(parallelism=2)
+        tasks.run_render_job(job.pk)
+        eq_(2, mock_render_job_chunk_delay.call_count)
+        eq_(['running', 'running', 'pending'], self.statuses(job))
+
+        # No more chunks start until a running one is complete
+        tasks.run_render_job(job.pk)
+        eq_(2, mock_render_job_chunk_delay.call_count)
+
+        job.chunks.get(index=0).complete(DocumentRenderJobChunk.STATUS_DONE)
+        tasks.run_render_job(job.pk)
+        eq_(3, mock_render_job_chunk_delay.call_count)
+        ok_(not DocumentRenderJob.objects.get(pk=job.pk).is_finished)
+
+    def test_run(self):
+        job = self.job(base_url='http://testserver')
+        real_render = Document.render
+
+        def render(document, *args, **kwargs):
+            if document.pk == self.pks[3]:
+                raise Exception('Boom')
+            return real_render(document, *args, **kwargs)
+
+        with mock.patch('kuma.wiki.kumascript.get',
+                        return_value=('<p>Rendered</p>', None)):
+            with mock.patch.object(Document, 'render', render):
+                tasks.run_render_job(job.pk)
+
+        job = DocumentRenderJob.objects.get(pk=job.pk)
+        ok_(job.is_finished)
+        eq_(['done', 'done', 'done'], self.statuses(job))
+        eq_({str(self.pks[3]): 'Boom'}, job.get_progress()['failures'])
+        ok_(all(Document.objects.filter(pk__in=self.pks[:3])
+                                .values_list('last_rendered_at', flat=True)))
+        eq_(1, len(mail.outbox))
+        eq_('[Django] Render job %s is complete' % job.pk,
+            mail.outbox[0].subject)
+
+    def test_resume(self):
+        job = self.job()
+        # The workers of the first two chunks die, and the last one fails
+        with mock.patch.object(tasks.render_job_chunk, 'delay'):
+            tasks.run_render_job(job.pk)
+        chunk = job.chunks.get(index=2)
+        chunk.complete(DocumentRenderJobChunk.STATUS_FAILED,
+                       {'chunk': 'Boom'})
+        eq_(['running', 'running', 'failed'], self.statuses(job))
+
+        job.resume()
+        eq_(['pending', 'pending', 'pending'], self.statuses(job))
+        eq_({}, job.get_progress()['failures'])
+        with mock.patch('kuma.wiki.kumascript.get',
+                        return_value=('<p>Rendered</p>', None)):
+            tasks.run_render_job(job.pk)
+        eq_(['done', 'done', 'done'], self.statuses(job))
+        ok_(DocumentRenderJob.objects.get(pk=job.pk).is_finished)
+
+    @mock.patch.object(tasks.run_render_job, 'delay')
+    def test_command(self, mock_run_render_job_delay):
+        call_command('render_document', all=True, chunk_size=3,
+                     parallelism=1, min_age=0)
+        job = DocumentRenderJob.objects.get()
+        eq_(1, job.parallelism)
+        eq_('max-age=0', job.cache_control)
+        eq_(sorted(self.pks),
+            sorted(pk for chunk in job.chunks.all()
+                   for pk in chunk.get_pks()))
+        mock_run_render_job_delay.assert_called_once_with(job.pk)
+
+        job.chunks.update(status=DocumentRenderJobChunk.STATUS_RUNNING)
+        call_command('render_document', resume=job.pk)
+        eq_(['pending', 'pending'], self.statuses(job))
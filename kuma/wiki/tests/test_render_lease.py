@@ -0,0 +1,84 @@
+from StringIO import StringIO
+
+import mock
+from django.core.management import call_command
+from django.test.utils import override_settings
+from nose.tools import eq_, ok_
+from waffle.models import Switch
+
+from kuma.core.cache import memcache
+from kuma.users.tests import UserTestCase
+
+from . import document, revision
+from .. import render_lease
+from ..exceptions import DocumentRenderedContentNotAvailable
+from ..models import Document
+
+
+class RenderLeaseTests(UserTestCase):
+
+    def setUp(self):
+        super(RenderLeaseTests, self).setUp()
+        memcache.clear()
+        Switch.objects.create(name='wiki_render_lease', active=True)
+        doc = document(save=True)
+        revision(document=doc, content='<p>Hello</p>', is_approved=True,
+                 save=True)
+        Document.objects.filter(pk=doc.pk).update(rendered_html=None)
+        self.doc = Document.objects.get(pk=doc.pk)
+
+    def test_acquire_release(self):
+        token = render_lease.acquire(1)
+        ok_(token)
+        eq_(None, render_lease.acquire(1))
+        ok_(not render_lease.wait(1, timeout=0))
+
+        # Only the holder of the lease releases it
+        render_lease.release(1, 'other')
+        eq_(None, render_lease.acquire(1))
+        render_lease.release(1, token)
+        ok_(render_lease.wait(1, timeout=0))
+        ok_(render_lease.acquire(1))
+
+    def test_leased(self):
+        html, errors = self.doc.get_rendered(None, 'http://testserver/')
+        ok_('Hello' in html)
+        eq_(1, render_lease.get_stats()['leased'])
+        # The lease is released once rendered
+        ok_(render_lease.wait(self.doc.pk, timeout=0))
+
+    @override_settings(WIKI_RENDER_LEASE_WAIT=0)
+    @mock.patch('kuma.wiki.models.Document.schedule_rendering')
+    def test_fallback(self, mock_schedule_rendering):
+        render_lease.acquire(self.doc.pk)
+        with self.assertRaises(DocumentRenderedContentNotAvailable):
+            self.doc.get_rendered(None, 'http://testserver/')
+        ok_(not mock_schedule_rendering.called)
+        eq_({'leased': 0, 'waited': 0, 'fallback': 1},
+            render_lease.get_stats())
+
+    @mock.patch('kuma.wiki.models.Document.schedule_rendering')
+    def test_waited(self, mock_schedule_rendering):
+        token = render_lease.acquire(self.doc.pk)
+
+        def wait(pk, timeout=None):
+            # Another request renders the document while this one waits
+            Document.objects.filter(pk=pk).update(
+                rendered_html='<p>Rendered</p>')
+            render_lease.release(pk, token)
+            return True
+
+        with mock.patch('kuma.wiki.render_lease.wait', side_effect=wait):
+            html, errors = self.doc.get_rendered(None, 'http://testserver/')
+        ok_('Rendered' in html)
+        ok_(not mock_schedule_rendering.called)
+        eq_(1, render_lease.get_stats()['waited'])
+
+    def test_command(self):
+        render_lease.record('leased')
+        render_lease.record('fallback')
+        out = StringIO()
+        call_command('render_lease_stats', reset=True, stdout=out)
+        ok_('leased: 1 (50.0%)' in out.getvalue())
+        eq_({'leased': 0, 'waited': 0, 'fallback': 0},
+            render_lease.get_stats())
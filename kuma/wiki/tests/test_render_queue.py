@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta
+
+import mock
+from django.test.utils import override_settings
+from nose.tools import eq_
+from waffle.models import Switch
+
+from kuma.core.cache import memcache
+from kuma.users.tests import UserTestCase
+
+from . import WikiTestCase, document, revision
+from .. import render_queue
+from ..models import DocumentRenderQueueItem, DocumentRenderTiming
+from ..tasks import process_render_queue, render_stale_documents
+
+
+class RenderQueueTests(UserTestCase, WikiTestCase):
+
+    def setUp(self):
+        super(RenderQueueTests, self).setUp()
+        memcache.clear()
+
+    def doc(self, slug, views=0, stale_days=0, cost=None):
+        doc = document(slug=slug, save=True)
+        revision(document=doc, is_approved=True, save=True)
+        doc.render_expires = datetime.now() - timedelta(days=stale_days)
+        doc.save()
+        for view in range(views):
+            render_queue.record_view(doc)
+        if cost is not None:
+            DocumentRenderTiming.objects.create(document=doc,
+                                                median_duration=cost)
+        return doc
+
+    def test_priority(self):
+        eq_(1.0, render_queue.get_priority(0, 0, 1.0))
+        eq_(4.0, render_queue.get_priority(1, 60 * 60 * 24, 1.0))
+        # The cost has a lower bound
+        eq_(render_queue.get_priority(0, 0, render_queue.MIN_COST),
+            render_queue.get_priority(0, 0, 0))
+
+    def test_views(self):
+        doc = self.doc('Viewed', views=3)
+        eq_({doc.pk: 3}, render_queue.get_views([doc.pk]))
+        # Views of the previous window are counted too
+        with mock.patch('kuma.wiki.render_queue.current_window',
+                        return_value=render_queue.current_window() + 1):
+            eq_({doc.pk: 3}, render_queue.get_views([doc.pk]))
+        with mock.patch('kuma.wiki.render_queue.current_window',
+                        return_value=render_queue.current_window() + 2):
+            eq_({doc.pk: 0}, render_queue.get_views([doc.pk]))
+
+    def test_claim_by_priority(self):
+        unpopular = self.doc('Unpopular')
+        popular = self.doc('Popular', views=10)
+        stale = self.doc('Stale', views=1, stale_days=10)
+        expensive = self.doc('Expensive', views=10, cost=100.0)
+
+        eq_(4, render_queue.enqueue([unpopular.pk, popular.pk, stale.pk,
+                                     expensive.pk]))
+        claimed = render_queue.claim(2)
+        eq_([stale.pk, popular.pk],
+            [document_pk for _, document_pk in claimed])
+        claimed = render_queue.claim(5)
+        eq_([unpopular.pk, expensive.pk],
+            [document_pk for _, document_pk in claimed])
+        eq_([], render_queue.claim(5))
+
+    def test_enqueue_again(self):
+        doc = self.doc('Requeued', views=1)
+        other = self.doc('Other')
+        render_queue.enqueue([doc.pk, other.pk])
+        eq_([doc.pk], [document_pk
+                       for _, document_pk in render_queue.claim(1)])
+
+        # Pending renderings are updated rather than duplicated, while
+        # those being rendered are queued again.
+        render_queue.record_view(other)
+        render_queue.record_view(other)
+        render_queue.enqueue([doc.pk, other.pk])
+        eq_(3, DocumentRenderQueueItem.objects.count())
+        eq_([other.pk, doc.pk],
+            [document_pk for _, document_pk in render_queue.claim(5)])
+
+    def test_release_stale_claims(self):
+        doc = self.doc('Abandoned')
+        render_queue.enqueue([doc.pk])
+        eq_(1, len(render_queue.claim(5)))
+        eq_([], render_queue.claim(5))
+
+        (DocumentRenderQueueItem.objects
+                                .update(claimed_at=datetime.now() -
+                                        timedelta(days=1)))
+        eq_([doc.pk], [document_pk
+                       for _, document_pk in render_queue.claim(5)])
+
+    @override_settings(WIKI_RENDER_QUEUE_BATCH_SIZE=2)
+    @mock.patch('kuma.wiki.tasks.render_document_chunk')
+    def test_render_stale_documents(self, mock_render_document_chunk):
+        Switch.objects.create(name='wiki_render_queue', active=True)
+        docs = [self.doc('Doc%s' % index, views=index) for index in range(5)]
+        render_stale_documents()
+
+        rendered = [list(call[0][0])
+                    for call in mock_render_document_chunk.call_args_list]
+        eq_([[docs[4].pk, docs[3].pk], [docs[2].pk, docs[1].pk],
+             [docs[0].pk]], rendered)
+        eq_(0, DocumentRenderQueueItem.objects.count())
+        # The workers released their slots
+        eq_(None, memcache.get(render_queue.WORKER_KEY_TMPL % 0))
+
+    @override_settings(WIKI_RENDER_QUEUE_WORKERS=1)
+    @mock.patch('kuma.wiki.tasks.render_document_chunk')
+    def test_enqueue_while_releasing_slot(self, mock_render_document_chunk):
+        """Renderings queued after a worker found the queue empty, but before
+        it released its slot, should still be rendered"""
+        Switch.objects.create(name='wiki_render_queue', active=True)
+        doc = self.doc('Late')
+        claim = render_queue.claim
+        memcache.set(render_queue.WORKER_KEY_TMPL % 0, 1)
+
+        def enqueue_after_claim(count):
+            mock_claim.side_effect = claim
+            render_queue.enqueue([doc.pk])
+            # The slot is still held, so no worker is started
+            render_queue.start_workers()
+            return []
+
+        with mock.patch('kuma.wiki.render_queue.claim',
+                        side_effect=enqueue_after_claim) as mock_claim:
+            process_render_queue(0)
+
+        eq_([[doc.pk]], [list(call[0][0]) for call in
+                         mock_render_document_chunk.call_args_list])
+        eq_(0, DocumentRenderQueueItem.objects.count())
+        eq_(None, memcache.get(render_queue.WORKER_KEY_TMPL % 0))
+
+    def test_document_view(self):
+        doc = self.doc('Counted')
+        self.client.get(doc.get_absolute_url())
+        eq_({doc.pk: 0}, render_queue.get_views([doc.pk]))
+
+        Switch.objects.create(name='wiki_render_queue', active=True)
+        self.client.get(doc.get_absolute_url())
+        self.client.get(doc.get_absolute_url())
+        eq_({doc.pk: 2}, render_queue.get_views([doc.pk]))
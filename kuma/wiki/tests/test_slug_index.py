@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import time
+
+from django.test.utils import override_settings
+from nose.tools import eq_, ok_
+
+from kuma.core.cache import memcache
+from kuma.users.tests import UserTestCase
+
+from . import document
+from ..content import parse
+from ..slug_index import (build_slug_indexes, existing_slugs, get_slug_index,
+                          index_path)
+
+
+class SlugIndexTests(UserTestCase):
+
+    def setUp(self):
+        super(SlugIndexTests, self).setUp()
+        self.index_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            WIKI_SLUG_INDEX_ROOT=self.index_root)
+        self.settings_override.enable()
+        document(locale='en-US', slug='existing', save=True)
+        document(locale='en-US', slug='web/css', save=True)
+        document(locale='fr', slug='existant', save=True)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.index_root)
+        super(SlugIndexTests, self).tearDown()
+
+    def test_build(self):
+        """The index should answer for existing documents without querying
+        the database, which is only checked for the missing ones"""
+        counts = build_slug_indexes()
+        eq_(2, counts['en-us'])
+        eq_(1, counts['fr'])
+        with self.assertNumQueries(0):
+            eq_(set(['existing', 'web/css']),
+                existing_slugs('en-US', ['Existing', 'web/CSS']))
+            eq_(set(['existant']), existing_slugs('fr', ['Existant']))
+        with self.assertNumQueries(2):
+            eq_(set(['existing', 'web/css']),
+                existing_slugs('en-US', ['Existing', 'web/CSS', 'Missing',
+                                         'Existant']))
+            eq_(set(['existant']),
+                existing_slugs('fr', ['Existant', 'Existing']))
+
+    def test_fallback(self):
+        """The database should be queried without an up to date index"""
+        eq_(None, get_slug_index('en-US'))
+        with self.assertNumQueries(1):
+            eq_(set(['existing']),
+                existing_slugs('en-US', ['Existing', 'Missing']))
+
+        build_slug_indexes()
+        ok_(get_slug_index('en-US') is not None)
+        stale = time.time() - 2 * 24 * 60 * 60
+        os.utime(index_path('en-us'), (stale, stale))
+        with self.settings(WIKI_SLUG_INDEX_MAX_AGE=24 * 60 * 60):
+            eq_(None, get_slug_index('en-US'))
+
+    def test_changes(self):
+        """Documents saved and deleted after the index was built should be
+        taken into account"""
+        build_slug_indexes()
+        document(locale='en-US', slug='new', save=True)
+        doc = document(locale='en-US', slug='deleted', save=True)
+        doc.delete()
+        with self.assertNumQueries(0):
+            eq_(set(['existing', 'new']),
+                existing_slugs('en-US', ['Existing', 'New']))
+        eq_(set(['existing', 'new']),
+            existing_slugs('en-US', ['Existing', 'New', 'Deleted']))
+
+    def test_evicted_changes(self):
+        """Documents saved after the index was built should exist even
+        once their change records are evicted from memcache"""
+        build_slug_indexes()
+        document(locale='en-US', slug='new', save=True)
+        memcache.clear()
+        with self.assertNumQueries(1):
+            eq_(set(['existing', 'new']),
+                existing_slugs('en-US', ['Existing', 'New', 'Missing']))
+
+    def test_rebuild(self):
+        """A rebuilt index should be picked up by processes using it"""
+        build_slug_indexes()
+        eq_(set(), existing_slugs('en-US', ['New']))
+        document(locale='en-US', slug='new', save=True)
+        # Rebuilding doesn't depend on the recorded changes
+        build_slug_indexes()
+        index = get_slug_index('en-US')
+        ok_('new' in index)
+        ok_('existing' in index)
+        ok_('missing' not in index)
+
+    def test_link_annotation(self):
+        """Links to missing documents should be annotated from the index,
+        checked against the database"""
+        build_slug_indexes()
+        content = ('<a href="/en-US/docs/Existing">a</a>'
+                   '<a href="/en-US/docs/Missing">b</a>'
+                   '<a href="/fr/docs/Existant">c</a>')
+        with self.assertNumQueries(1):
+            result = (parse(content)
+                      .annotateLinks(base_url='http://testserver')
+                      .serialize())
+        eq_('<a href="/en-US/docs/Existing">a</a>'
+            '<a href="/en-US/docs/Missing" class="new">b</a>'
+            '<a href="/fr/docs/Existant">c</a>', result)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import base64
 import datetime
+import hashlib
 import json
 import time
 from urlparse import urlparse
@@ -2845,6 +2846,43 @@ class SectionEditingResourceTests(UserTestCase, WikiTestCase):
         eq_(normalize_html(expected),
             normalize_html(response.content))
 
+    def test_raw_section_source_from_section_store(self):
+        """Section requests are served from the section store of rendered
+        documents, along with the section ETag, without parsing the
+        document"""
+        d, r = doc_rev("""
+            <h1 id="s1">s1</h1>
+            <p>test</p>
+
+            <h1 id="s2">s2</h1>
+            <p>test</p>
+            <div class="noinclude">not included</div>
+
+            <h1 id="s3">s3</h1>
+            <p>test</p>
+        """)
+        # Sections are only pre-extracted when rendering
+        eq_(None, d.get_section_store())
+        d.render()
+        expected = """
+            <h1 id="s2">s2</h1>
+            <p>test</p>
+        """
+        expected_etag = d.calculate_etag('s2')
+        with mock.patch('kuma.wiki.content.parse') as mock_parse, \
+                mock.patch('kuma.wiki.models.parse_content') as mock_parse_doc:
+            response = self.client.get('%s?section=s2&raw=true&include' %
+                                       reverse('wiki.document',
+                                               args=[d.slug]))
+            ok_(not mock_parse.called)
+            ok_(not mock_parse_doc.called)
+        eq_(normalize_html(expected),
+            normalize_html(response.content))
+        eq_(expected_etag, response['ETag'])
+        eq_(expected_etag,
+            '"%s"' % hashlib.sha1(d.extract_section(d.html, 's2')
+                                   .encode('utf8')).hexdigest())
+
     @attr('midair')
     @attr('rawsection')
     def test_raw_section_edit(self):
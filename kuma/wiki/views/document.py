@@ -7,6 +7,7 @@ except ImportError:
     from StringIO import StringIO
 
 import newrelic.agent
+import waffle
 from constance import config
 from django.conf import settings
 from django.contrib import messages
@@ -31,7 +32,7 @@ from kuma.core.urlresolvers import reverse
 from kuma.core.utils import urlparams
 from kuma.search.store import referrer_url
 
-from .. import kumascript
+from .. import kumascript, render_queue
 from ..constants import SLUG_CLEANSING_RE
 from ..decorators import (allow_CORS_GET, check_readonly, prevent_indexing,
                           process_document_path)
@@ -139,29 +140,43 @@ def _filter_doc_html(request, doc, doc_html, rendering_params):
             rendering_params['edit_links'] or rendering_params['include']):
         return doc_html
 
-    # TODO: One more view-time content parsing instance to refactor
-    tool = kuma.wiki.content.parse(doc_html)
+    # If this user can edit the document, inject section editing links.
+    # TODO: Rework so that this happens on the client side?
+    edit_links = ((rendering_params['edit_links'] or
+                   not rendering_params['raw']) and
+                  request.user.is_authenticated() and
+                  doc.allows_revision_by(request.user))
+
+    # If a section ID is specified for a ?raw view, try the pre-extracted
+    # sections first.
+    stored_section = None
+    if (rendering_params['section'] and rendering_params['raw'] and
+            not edit_links):
+        stored_section = doc.get_stored_section(doc_html,
+                                                rendering_params['section'])
+
+    if stored_section is not None:
+        doc_html = stored_section
 
-    # ?raw view is often used for editors - apply safety filtering.
-    # TODO: Should this stuff happen in render() itself?
-    if rendering_params['raw']:
-        # HACK: Raw rendered content has not had section IDs injected
-        tool.injectSectionIDs()
-        tool.filterEditorSafety()
+    else:
+        # TODO: One more view-time content parsing instance to refactor
+        tool = kuma.wiki.content.parse(doc_html)
 
-    # If a section ID is specified, extract that section.
-    # TODO: Pre-extract every section on render? Might be over-optimization
-    if rendering_params['section']:
-        tool.extractSection(rendering_params['section'])
+        # ?raw view is often used for editors - apply safety filtering.
+        # TODO: Should this stuff happen in render() itself?
+        if rendering_params['raw']:
+            # HACK: Raw rendered content has not had section IDs injected
+            tool.injectSectionIDs()
+            tool.filterEditorSafety()
 
-    # If this user can edit the document, inject section editing links.
-    # TODO: Rework so that this happens on the client side?
-    if ((rendering_params['edit_links'] or not rendering_params['raw']) and
-            request.user.is_authenticated() and
-            doc.allows_revision_by(request.user)):
-        tool.injectSectionEditingLinks(doc.slug, doc.locale)
+        # If a section ID is specified, extract that section.
+        if rendering_params['section']:
+            tool.extractSection(rendering_params['section'])
 
-    doc_html = tool.serialize()
+        if edit_links:
+            tool.injectSectionEditingLinks(doc.slug, doc.locale)
+
+        doc_html = tool.serialize()
 
     # If this is an include, filter out the class="noinclude" blocks.
     # TODO: Any way to make this work in rendering? Possibly over-optimization,
@@ -602,6 +617,10 @@ def document(request, document_slug, document_locale):
             }), extra_tags='wiki_redirect')
         return HttpResponsePermanentRedirect(url)
 
+    if waffle.switch_is_active('wiki_render_queue'):
+        # Count the view for the priority of the document's re-renderings
+        render_queue.record_view(doc)
+
     # Read some request params to see what we're supposed to do.
     rendering_params = {}
     for param in ('raw', 'summary', 'include', 'edit_links'):
@@ -965,6 +965,8 @@ MAX_FILENAME_LENGTH = 200
 MAX_FILEPATH_LENGTH = 250
 
 ATTACHMENT_HOST = 'mdn.mozillademos.org'
+# Seconds to cache the metadata of attachment revisions passed to KumaScript
+ATTACHMENT_METADATA_TIMEOUT = 60 * 60 * 24 * 7
 
 # Video settings, hard coded here for now.
 # TODO: figure out a way that doesn't need these values
@@ -1101,6 +1103,62 @@ CELERY_ROUTES = {
 WIKI_REBUILD_TOKEN = 'kuma:wiki:full-rebuild'
 WIKI_REBUILD_ON_DEMAND = False
 
+# Parser backend used by kuma.wiki.content to parse document content,
+# either 'html5lib' or the much faster, but less spec compliant, 'lxml'.
+# lxml only replaces the parser and tree walker, see LxmlParser. See the
+# compare_content_parsers management command before switching.
+WIKI_CONTENT_PARSER = 'html5lib'
+
+# Directory of the per-locale indexes of document slugs used to annotate
+# links to missing documents, built by the build_slug_index command, which
+# should be run on every host more often than the max age of the indexes.
+WIKI_SLUG_INDEX_ROOT = path('tmp', 'slug_index')
+WIKI_SLUG_INDEX_MAX_AGE = 60 * 60 * 24
+
+# Number of memcache slots of the content-keyed cache of KumaScript results,
+# and the largest rendered HTML, in bytes, to store in one.
+WIKI_RENDER_CACHE_SLOTS = 4096
+WIKI_RENDER_CACHE_MAX_ENTRY_SIZE = 256 * 1024
+
+# Number of renderings of each document kept in its render timings, when the
+# wiki_render_timing switch is active. A document is moved to deferred
+# rendering when the median duration of its last WIKI_RENDER_TIMING_RECENT
+# renderings reaches KUMA_DOCUMENT_FORCE_DEFERRED_TIMEOUT, and out of it when
+# they all took less than WIKI_RENDER_TIMING_UNDEFER_RATIO of it.
+WIKI_RENDER_TIMING_WINDOW = 20
+WIKI_RENDER_TIMING_RECENT = 5
+WIKI_RENDER_TIMING_UNDEFER_RATIO = 0.5
+
+# Render queue settings, used when the wiki_render_queue switch is active:
+# the period in seconds over which document views are counted, the render
+# cost in seconds of documents without render timings, and the number of
+# workers rendering the queue, each taking WIKI_RENDER_QUEUE_BATCH_SIZE
+# documents at a time.
+WIKI_RENDER_QUEUE_TRAFFIC_WINDOW = 60 * 60 * 24
+WIKI_RENDER_QUEUE_DEFAULT_COST = 1.0
+WIKI_RENDER_QUEUE_WORKERS = 4
+WIKI_RENDER_QUEUE_BATCH_SIZE = 5
+
+# Default number of documents rendered by each task of the render jobs of
+# render_document --all, and of those tasks running at a time.
+WIKI_RENDER_JOB_CHUNK_SIZE = 100
+WIKI_RENDER_JOB_PARALLELISM = 4
+
+# Number of rendered documents saved by each UPDATE query of a batch
+# rendering, when the wiki_render_only_save switch is active. Each document
+# adds two query parameters per rendered field.
+WIKI_RENDER_SAVE_BATCH_SIZE = 25
+
+# Number of processes building the cached content fields of the documents
+# of batch renderings, see kuma.wiki.render_pool. Above 1, each celery
+# worker process rendering documents keeps a pool of that many processes.
+WIKI_RENDER_POOL_WORKERS = 1
+
+# Seconds a request for a document without rendered HTML waits for another
+# request rendering it, when the wiki_render_lease switch is active, before
+# falling back to the raw HTML.
+WIKI_RENDER_LEASE_WAIT = 2
+
 # Anonymous user cookie
 ANONYMOUS_COOKIE_NAME = 'KUMA_ANONID'
 ANONYMOUS_COOKIE_MAX_AGE = 30 * 86400  # Seconds
@@ -1249,6 +1307,36 @@ CONSTANCE_CONFIG = dict(
         'evaluation as an attempt at graceful failure. NOTE: a value of 0 '
         'disables kumascript altogether.'
     ),
+    KUMASCRIPT_WHOLE_PAGE_MACROS=(
+        'EmbedLiveSample LiveSampleLink page',
+        'Space-separated names of the macros whose output depends on the '
+        'whole page they are used in. Documents using them are always '
+        'rendered in full, rather than just their changed sections.'
+    ),
+    KUMASCRIPT_PAGE_MACROS=(
+        'Breadcrumbs ListSubpages ListSubpagesForSidebar Subpages '
+        'SubpagesWithSummaries',
+        'Space-separated names of the macros whose output depends on the '
+        'page they are used in, e.g. through its path. When the '
+        'wiki_render_cache switch is active, the results of rendering '
+        'documents using them are cached by the identity of their page, '
+        'and those of documents using the macros of '
+        'KUMASCRIPT_WHOLE_PAGE_MACROS are never cached.'
+    ),
+    KUMASCRIPT_RENDER_CACHE_ENV_VARS=(
+        'locale',
+        'Space-separated names of the KumaScript env vars, e.g. locale, the '
+        'results of rendering documents with the same content and macros '
+        'can differ by, when the wiki_render_cache switch is active. '
+        'Documents without macros share results whatever their env vars.'
+    ),
+    KUMASCRIPT_ENV_ENCODING=(
+        'headers',
+        'How the env vars of documents are sent to kumascript: "headers" for '
+        'a base64 JSON header per env var, or "compact" for a single, '
+        'deduplicated and compressed, x-kumascript-env header, which needs '
+        'a kumascript version supporting it.'
+    ),
     KUMASCRIPT_MAX_AGE=(
         600,
         'Maximum acceptable age (in seconds) of a cached response from '
@@ -1367,6 +1455,44 @@ BASKET_URL = 'https://basket.mozilla.com'
 BASKET_APPS_NEWSLETTER = 'app-dev'
 
 KUMASCRIPT_URL_TEMPLATE = 'http://developer.mozilla.org:9080/docs/{path}'
+# Number of keep-alive connections to KumaScript pooled by each process, and
+# the number of seconds an idle connection is kept, which should be less than
+# the keep-alive timeout of the KumaScript service.
+KUMASCRIPT_POOL_MAXSIZE = 10
+KUMASCRIPT_KEEPALIVE_TIMEOUT = 4
+# The circuit breaker of KumaScript requests, when the
+# wiki_kumascript_circuit_breaker switch is active, see
+# kuma.wiki.circuit_breaker.
+KUMASCRIPT_BREAKER_WINDOW = 30
+KUMASCRIPT_BREAKER_MIN_REQUESTS = 20
+KUMASCRIPT_BREAKER_MAX_ERROR_RATE = 0.5
+KUMASCRIPT_BREAKER_MAX_SLOW_RATE = 0.5
+KUMASCRIPT_BREAKER_SLOW_DURATION = 10
+KUMASCRIPT_BREAKER_OPEN_DURATION = 30
+# When the wiki_kumascript_adaptive_timeout switch is active, the timeout of
+# the KumaScript requests of a document is this multiple of the longest of
+# its recent requests, kept for KUMASCRIPT_DURATION_TIMEOUT seconds, but no
+# less than KUMASCRIPT_ADAPTIVE_TIMEOUT_MIN seconds.
+KUMASCRIPT_ADAPTIVE_TIMEOUT_FACTOR = 3
+KUMASCRIPT_ADAPTIVE_TIMEOUT_MIN = 2
+KUMASCRIPT_DURATION_TIMEOUT = 60 * 60 * 24
+# Size in bytes from which the env vars sent to KumaScript in the compact
+# encoding are compressed.
+KUMASCRIPT_ENV_COMPRESS_MIN_SIZE = 1024
+# Number of documents rendered at the same time by each process when
+# rendering them in batches, which shouldn't exceed KUMASCRIPT_POOL_MAXSIZE.
+KUMASCRIPT_BATCH_CONCURRENCY = 4
+# Number of seconds the KumaScript renderings of previews are cached, when
+# the wiki_preview_coalescing switch is active.
+KUMASCRIPT_PREVIEW_CACHE_TIMEOUT = 60
+# Where the last response of KumaScript for each document is stored for
+# conditional GET requests, either 'memcache' or 'filesystem', see
+# kuma.wiki.body_store. The filesystem store is local to each host, which
+# has to run the prune_kumascript_bodies command periodically to evict its
+# least recently used bodies over KUMASCRIPT_BODY_STORE_MAX_SIZE bytes.
+KUMASCRIPT_BODY_STORE = 'memcache'
+KUMASCRIPT_BODY_STORE_ROOT = path('tmp', 'kumascript_bodies')
+KUMASCRIPT_BODY_STORE_MAX_SIZE = 1024 * 1024 * 1024
 
 # Elasticsearch related settings.
 ES_DEFAULT_NUM_REPLICAS = 1
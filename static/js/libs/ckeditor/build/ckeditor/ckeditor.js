@@ -0,0 +1,1051 @@
+﻿/*
+Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
+For licensing, see LICENSE.html or http://ckeditor.com/license
+*/
+(function(){if(!window.CKEDITOR||!window.CKEDITOR.dom)window.CKEDITOR||(window.CKEDITOR=function(){var a=/(^|.*[\\\/])ckeditor\.js(?:\?.*|;.*)?$/i,e={timestamp:"F97K",version:"4.5.4",revision:"3fb4452",rnd:Math.floor(900*Math.random())+100,_:{pending:[],basePathSrcPattern:a},status:"unloaded",basePath:function(){var b=window.CKEDITOR_BASEPATH||"";if(!b)for(var c=document.getElementsByTagName("script"),e=0;e<c.length;e++){var f=c[e].src.match(a);if(f){b=f[1];break}}-1==b.indexOf(":/")&&"//"!=b.slice(0,
+2)&&(b=0===b.indexOf("/")?location.href.match(/^.*?:\/\/[^\/]*/)[0]+b:location.href.match(/^[^\?]*\/(?:)/)[0]+b);if(!b)throw'The CKEditor installation path could not be automatically detected. Please set the global variable "CKEDITOR_BASEPATH" before creating editor instances.';return b}(),getUrl:function(a){-1==a.indexOf(":/")&&0!==a.indexOf("/")&&(a=this.basePath+a);this.timestamp&&("/"!=a.charAt(a.length-1)&&!/[&?]t=/.test(a))&&(a+=(0<=a.indexOf("?")?"&":"?")+"t="+this.timestamp);return a},domReady:function(){function a(){try{document.addEventListener?
+(document.removeEventListener("DOMContentLoaded",a,!1),b()):document.attachEvent&&"complete"===document.readyState&&(document.detachEvent("onreadystatechange",a),b())}catch(f){}}function b(){for(var a;a=c.shift();)a()}var c=[];return function(f){function b(){try{document.documentElement.doScroll("left")}catch(g){setTimeout(b,1);return}a()}c.push(f);"complete"===document.readyState&&setTimeout(a,1);if(1==c.length)if(document.addEventListener)document.addEventListener("DOMContentLoaded",a,!1),window.addEventListener("load",
+a,!1);else if(document.attachEvent){document.attachEvent("onreadystatechange",a);window.attachEvent("onload",a);f=!1;try{f=!window.frameElement}catch(j){}document.documentElement.doScroll&&f&&b()}}}()},b=window.CKEDITOR_GETURL;if(b){var c=e.getUrl;e.getUrl=function(a){return b.call(e,a)||c.call(e,a)}}return e}()),CKEDITOR.event||(CKEDITOR.event=function(){},CKEDITOR.event.implementOn=function(a){var e=CKEDITOR.event.prototype,b;for(b in e)a[b]==null&&(a[b]=e[b])},CKEDITOR.event.prototype=function(){function a(a){var d=
+e(this);return d[a]||(d[a]=new b(a))}var e=function(a){a=a.getPrivate&&a.getPrivate()||a._||(a._={});return a.events||(a.events={})},b=function(a){this.name=a;this.listeners=[]};b.prototype={getListenerIndex:function(a){for(var b=0,e=this.listeners;b<e.length;b++)if(e[b].fn==a)return b;return-1}};return{define:function(b,d){var e=a.call(this,b);CKEDITOR.tools.extend(e,d,true)},on:function(b,d,e,h,f){function k(a,g,f,k){a={name:b,sender:this,editor:a,data:g,listenerData:h,stop:f,cancel:k,removeListener:j};
+return d.call(e,a)===false?false:a.data}function j(){n.removeListener(b,d)}var g=a.call(this,b);if(g.getListenerIndex(d)<0){g=g.listeners;e||(e=this);isNaN(f)&&(f=10);var n=this;k.fn=d;k.priority=f;for(var q=g.length-1;q>=0;q--)if(g[q].priority<=f){g.splice(q+1,0,k);return{removeListener:j}}g.unshift(k)}return{removeListener:j}},once:function(){var a=Array.prototype.slice.call(arguments),b=a[1];a[1]=function(a){a.removeListener();return b.apply(this,arguments)};return this.on.apply(this,a)},capture:function(){CKEDITOR.event.useCapture=
+1;var a=this.on.apply(this,arguments);CKEDITOR.event.useCapture=0;return a},fire:function(){var a=0,b=function(){a=1},i=0,h=function(){i=1};return function(f,k,j){var g=e(this)[f],f=a,n=i;a=i=0;if(g){var q=g.listeners;if(q.length)for(var q=q.slice(0),l,o=0;o<q.length;o++){if(g.errorProof)try{l=q[o].call(this,j,k,b,h)}catch(r){}else l=q[o].call(this,j,k,b,h);l===false?i=1:typeof l!="undefined"&&(k=l);if(a||i)break}}k=i?false:typeof k=="undefined"?true:k;a=f;i=n;return k}}(),fireOnce:function(a,b,i){b=
+this.fire(a,b,i);delete e(this)[a];return b},removeListener:function(a,b){var i=e(this)[a];if(i){var h=i.getListenerIndex(b);h>=0&&i.listeners.splice(h,1)}},removeAllListeners:function(){var a=e(this),b;for(b in a)delete a[b]},hasListeners:function(a){return(a=e(this)[a])&&a.listeners.length>0}}}()),CKEDITOR.editor||(CKEDITOR.editor=function(){CKEDITOR._.pending.push([this,arguments]);CKEDITOR.event.call(this)},CKEDITOR.editor.prototype.fire=function(a,e){a in{instanceReady:1,loaded:1}&&(this[a]=
+true);return CKEDITOR.event.prototype.fire.call(this,a,e,this)},CKEDITOR.editor.prototype.fireOnce=function(a,e){a in{instanceReady:1,loaded:1}&&(this[a]=true);return CKEDITOR.event.prototype.fireOnce.call(this,a,e,this)},CKEDITOR.event.implementOn(CKEDITOR.editor.prototype)),CKEDITOR.env||(CKEDITOR.env=function(){var a=navigator.userAgent.toLowerCase(),e=a.match(/edge[ \/](\d+.?\d*)/),b=a.indexOf("trident/")>-1,b=!(!e&&!b),b={ie:b,edge:!!e,webkit:!b&&a.indexOf(" applewebkit/")>-1,air:a.indexOf(" adobeair/")>
+-1,mac:a.indexOf("macintosh")>-1,quirks:document.compatMode=="BackCompat"&&(!document.documentMode||document.documentMode<10),mobile:a.indexOf("mobile")>-1,iOS:/(ipad|iphone|ipod)/.test(a),isCustomDomain:function(){if(!this.ie)return false;var a=document.domain,b=window.location.hostname;return a!=b&&a!="["+b+"]"},secure:location.protocol=="https:"};b.gecko=navigator.product=="Gecko"&&!b.webkit&&!b.ie;if(b.webkit)a.indexOf("chrome")>-1?b.chrome=true:b.safari=true;var c=0;if(b.ie){c=e?parseFloat(e[1]):
+b.quirks||!document.documentMode?parseFloat(a.match(/msie (\d+)/)[1]):document.documentMode;b.ie9Compat=c==9;b.ie8Compat=c==8;b.ie7Compat=c==7;b.ie6Compat=c<7||b.quirks}if(b.gecko)if(e=a.match(/rv:([\d\.]+)/)){e=e[1].split(".");c=e[0]*1E4+(e[1]||0)*100+(e[2]||0)*1}b.air&&(c=parseFloat(a.match(/ adobeair\/(\d+)/)[1]));b.webkit&&(c=parseFloat(a.match(/ applewebkit\/(\d+)/)[1]));b.version=c;b.isCompatible=!(b.ie&&c<7)&&!(b.gecko&&c<4E4)&&!(b.webkit&&c<534);b.hidpi=window.devicePixelRatio>=2;b.needsBrFiller=
+b.gecko||b.webkit||b.ie&&c>10;b.needsNbspFiller=b.ie&&c<11;b.cssClass="cke_browser_"+(b.ie?"ie":b.gecko?"gecko":b.webkit?"webkit":"unknown");if(b.quirks)b.cssClass=b.cssClass+" cke_browser_quirks";if(b.ie)b.cssClass=b.cssClass+(" cke_browser_ie"+(b.quirks?"6 cke_browser_iequirks":b.version));if(b.air)b.cssClass=b.cssClass+" cke_browser_air";if(b.iOS)b.cssClass=b.cssClass+" cke_browser_ios";if(b.hidpi)b.cssClass=b.cssClass+" cke_hidpi";return b}()),"unloaded"==CKEDITOR.status&&function(){CKEDITOR.event.implementOn(CKEDITOR);
+CKEDITOR.loadFullCore=function(){if(CKEDITOR.status!="basic_ready")CKEDITOR.loadFullCore._load=1;else{delete CKEDITOR.loadFullCore;var a=document.createElement("script");a.type="text/javascript";a.src=CKEDITOR.basePath+"ckeditor.js";document.getElementsByTagName("head")[0].appendChild(a)}};CKEDITOR.loadFullCoreTimeout=0;CKEDITOR.add=function(a){(this._.pending||(this._.pending=[])).push(a)};(function(){CKEDITOR.domReady(function(){var a=CKEDITOR.loadFullCore,e=CKEDITOR.loadFullCoreTimeout;if(a){CKEDITOR.status=
+"basic_ready";a&&a._load?a():e&&setTimeout(function(){CKEDITOR.loadFullCore&&CKEDITOR.loadFullCore()},e*1E3)}})})();CKEDITOR.status="basic_loaded"}(),"use strict",CKEDITOR.VERBOSITY_WARN=1,CKEDITOR.VERBOSITY_ERROR=2,CKEDITOR.verbosity=CKEDITOR.VERBOSITY_WARN|CKEDITOR.VERBOSITY_ERROR,CKEDITOR.warn=function(a,e){CKEDITOR.verbosity&CKEDITOR.VERBOSITY_WARN&&CKEDITOR.fire("log",{type:"warn",errorCode:a,additionalData:e})},CKEDITOR.error=function(a,e){CKEDITOR.verbosity&CKEDITOR.VERBOSITY_ERROR&&CKEDITOR.fire("log",
+{type:"error",errorCode:a,additionalData:e})},CKEDITOR.on("log",function(a){if(window.console&&window.console.log){var e=console[a.data.type]?a.data.type:"log",b=a.data.errorCode;if(a=a.data.additionalData)console[e]("[CKEDITOR] "+b,a);else console[e]("[CKEDITOR] "+b);console[e]("[CKEDITOR] For more information go to http://docs.ckeditor.com/#!/guide/dev_errors-section-"+b)}},null,null,999),CKEDITOR.dom={},function(){var a=[],e=CKEDITOR.env.gecko?"-moz-":CKEDITOR.env.webkit?"-webkit-":CKEDITOR.env.ie?
+"-ms-":"",b=/&/g,c=/>/g,d=/</g,i=/"/g,h=/&(lt|gt|amp|quot|nbsp|shy|#\d{1,5});/g,f={lt:"<",gt:">",amp:"&",quot:'"',nbsp:" ",shy:"­"},k=function(a,g){return g[0]=="#"?String.fromCharCode(parseInt(g.slice(1),10)):f[g]};CKEDITOR.on("reset",function(){a=[]});CKEDITOR.tools={arrayCompare:function(a,g){if(!a&&!g)return true;if(!a||!g||a.length!=g.length)return false;for(var b=0;b<a.length;b++)if(a[b]!=g[b])return false;return true},getIndex:function(a,g){for(var b=0;b<a.length;++b)if(g(a[b]))return b;return-1},
+clone:function(a){var g;if(a&&a instanceof Array){g=[];for(var b=0;b<a.length;b++)g[b]=CKEDITOR.tools.clone(a[b]);return g}if(a===null||typeof a!="object"||a instanceof String||a instanceof Number||a instanceof Boolean||a instanceof Date||a instanceof RegExp||a.nodeType||a.window===a)return a;g=new a.constructor;for(b in a)g[b]=CKEDITOR.tools.clone(a[b]);return g},capitalize:function(a,g){return a.charAt(0).toUpperCase()+(g?a.slice(1):a.slice(1).toLowerCase())},extend:function(a){var g=arguments.length,
+b,f;if(typeof(b=arguments[g-1])=="boolean")g--;else if(typeof(b=arguments[g-2])=="boolean"){f=arguments[g-1];g=g-2}for(var c=1;c<g;c++){var k=arguments[c],d;for(d in k)if(b===true||a[d]==null)if(!f||d in f)a[d]=k[d]}return a},prototypedCopy:function(a){var g=function(){};g.prototype=a;return new g},copy:function(a){var g={},b;for(b in a)g[b]=a[b];return g},isArray:function(a){return Object.prototype.toString.call(a)=="[object Array]"},isEmpty:function(a){for(var g in a)if(a.hasOwnProperty(g))return false;
+return true},cssVendorPrefix:function(a,g,b){if(b)return e+a+":"+g+";"+a+":"+g;b={};b[a]=g;b[e+a]=g;return b},cssStyleToDomStyle:function(){var a=document.createElement("div").style,g=typeof a.cssFloat!="undefined"?"cssFloat":typeof a.styleFloat!="undefined"?"styleFloat":"float";return function(a){return a=="float"?g:a.replace(/-./g,function(a){return a.substr(1).toUpperCase()})}}(),buildStyleHtml:function(a){for(var a=[].concat(a),g,b=[],f=0;f<a.length;f++)if(g=a[f])/@import|[{}]/.test(g)?b.push("<style>"+
+g+"</style>"):b.push('<link type="text/css" rel=stylesheet href="'+g+'">');return b.join("")},htmlEncode:function(a){return a===void 0||a===null?"":(""+a).replace(b,"&amp;").replace(c,"&gt;").replace(d,"&lt;")},htmlDecode:function(a){return a.replace(h,k)},htmlEncodeAttr:function(a){return CKEDITOR.tools.htmlEncode(a).replace(i,"&quot;")},htmlDecodeAttr:function(a){return CKEDITOR.tools.htmlDecode(a)},transformPlainTextToHtml:function(a,g){var b=g==CKEDITOR.ENTER_BR,f=this.htmlEncode(a.replace(/\r\n/g,
+"\n")),f=f.replace(/\t/g,"&nbsp;&nbsp; &nbsp;"),c=g==CKEDITOR.ENTER_P?"p":"div";if(!b){var k=/\n{2}/g;if(k.test(f))var d="<"+c+">",e="</"+c+">",f=d+f.replace(k,function(){return e+d})+e}f=f.replace(/\n/g,"<br>");b||(f=f.replace(RegExp("<br>(?=</"+c+">)"),function(a){return CKEDITOR.tools.repeat(a,2)}));f=f.replace(/^ | $/g,"&nbsp;");return f=f.replace(/(>|\s) /g,function(a,g){return g+"&nbsp;"}).replace(/ (?=<)/g,"&nbsp;")},getNextNumber:function(){var a=0;return function(){return++a}}(),getNextId:function(){return"cke_"+
+this.getNextNumber()},getUniqueId:function(){for(var a="e",g=0;g<8;g++)a=a+Math.floor((1+Math.random())*65536).toString(16).substring(1);return a},override:function(a,g){var b=g(a);b.prototype=a.prototype;return b},setTimeout:function(a,g,b,f,c){c||(c=window);b||(b=c);return c.setTimeout(function(){f?a.apply(b,[].concat(f)):a.apply(b)},g||0)},trim:function(){var a=/(?:^[ \t\n\r]+)|(?:[ \t\n\r]+$)/g;return function(g){return g.replace(a,"")}}(),ltrim:function(){var a=/^[ \t\n\r]+/g;return function(g){return g.replace(a,
+"")}}(),rtrim:function(){var a=/[ \t\n\r]+$/g;return function(g){return g.replace(a,"")}}(),indexOf:function(a,g){if(typeof g=="function")for(var b=0,f=a.length;b<f;b++){if(g(a[b]))return b}else{if(a.indexOf)return a.indexOf(g);b=0;for(f=a.length;b<f;b++)if(a[b]===g)return b}return-1},search:function(a,g){var b=CKEDITOR.tools.indexOf(a,g);return b>=0?a[b]:null},bind:function(a,g){return function(){return a.apply(g,arguments)}},createClass:function(a){var g=a.$,b=a.base,f=a.privates||a._,c=a.proto,
+a=a.statics;!g&&(g=function(){b&&this.base.apply(this,arguments)});if(f)var k=g,g=function(){var a=this._||(this._={}),g;for(g in f){var b=f[g];a[g]=typeof b=="function"?CKEDITOR.tools.bind(b,this):b}k.apply(this,arguments)};if(b){g.prototype=this.prototypedCopy(b.prototype);g.prototype.constructor=g;g.base=b;g.baseProto=b.prototype;g.prototype.base=function(){this.base=b.prototype.base;b.apply(this,arguments);this.base=arguments.callee}}c&&this.extend(g.prototype,c,true);a&&this.extend(g,a,true);
+return g},addFunction:function(b,g){return a.push(function(){return b.apply(g||this,arguments)})-1},removeFunction:function(b){a[b]=null},callFunction:function(b){var g=a[b];return g&&g.apply(window,Array.prototype.slice.call(arguments,1))},cssLength:function(){var a=/^-?\d+\.?\d*px$/,g;return function(b){g=CKEDITOR.tools.trim(b+"")+"px";return a.test(g)?g:b||""}}(),convertToPx:function(){var a;return function(g){if(!a){a=CKEDITOR.dom.element.createFromHtml('<div style="position:absolute;left:-9999px;top:-9999px;margin:0px;padding:0px;border:0px;"></div>',
+CKEDITOR.document);CKEDITOR.document.getBody().append(a)}if(!/%$/.test(g)){a.setStyle("width",g);return a.$.clientWidth}return g}}(),repeat:function(a,g){return Array(g+1).join(a)},tryThese:function(){for(var a,g=0,b=arguments.length;g<b;g++){var f=arguments[g];try{a=f();break}catch(c){}}return a},genKey:function(){return Array.prototype.slice.call(arguments).join("-")},defer:function(a){return function(){var g=arguments,b=this;window.setTimeout(function(){a.apply(b,g)},0)}},normalizeCssText:function(a,
+g){var b=[],f,c=CKEDITOR.tools.parseCssText(a,true,g);for(f in c)b.push(f+":"+c[f]);b.sort();return b.length?b.join(";")+";":""},convertRgbToHex:function(a){return a.replace(/(?:rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\))/gi,function(a,b,f,c){a=[b,f,c];for(b=0;b<3;b++)a[b]=("0"+parseInt(a[b],10).toString(16)).slice(-2);return"#"+a.join("")})},parseCssText:function(a,b,f){var c={};if(f){f=new CKEDITOR.dom.element("span");f.setAttribute("style",a);a=CKEDITOR.tools.convertRgbToHex(f.getAttribute("style")||
+"")}if(!a||a==";")return c;a.replace(/&quot;/g,'"').replace(/\s*([^:;\s]+)\s*:\s*([^;]+)\s*(?=;|$)/g,function(a,f,k){if(b){f=f.toLowerCase();f=="font-family"&&(k=k.toLowerCase().replace(/["']/g,"").replace(/\s*,\s*/g,","));k=CKEDITOR.tools.trim(k)}c[f]=k});return c},writeCssText:function(a,b){var f,c=[];for(f in a)c.push(f+":"+a[f]);b&&c.sort();return c.join("; ")},objectCompare:function(a,b,f){var c;if(!a&&!b)return true;if(!a||!b)return false;for(c in a)if(a[c]!=b[c])return false;if(!f)for(c in b)if(a[c]!=
+b[c])return false;return true},objectKeys:function(a){var b=[],f;for(f in a)b.push(f);return b},convertArrayToObject:function(a,b){var f={};arguments.length==1&&(b=true);for(var c=0,k=a.length;c<k;++c)f[a[c]]=b;return f},fixDomain:function(){for(var a;;)try{a=window.parent.document.domain;break}catch(b){a=a?a.replace(/.+?(?:\.|$)/,""):document.domain;if(!a)break;document.domain=a}return!!a},eventsBuffer:function(a,b,f){function c(){d=(new Date).getTime();k=false;f?b.call(f):b()}var k,d=0;return{input:function(){if(!k){var b=
+(new Date).getTime()-d;b<a?k=setTimeout(c,a-b):c()}},reset:function(){k&&clearTimeout(k);k=d=0}}},enableHtml5Elements:function(a,b){for(var f=["abbr","article","aside","audio","bdi","canvas","data","datalist","details","figcaption","figure","footer","header","hgroup","main","mark","meter","nav","output","progress","section","summary","time","video"],c=f.length,k;c--;){k=a.createElement(f[c]);b&&a.appendChild(k)}},checkIfAnyArrayItemMatches:function(a,b){for(var f=0,c=a.length;f<c;++f)if(a[f].match(b))return true;
+return false},checkIfAnyObjectPropertyMatches:function(a,b){for(var f in a)if(f.match(b))return true;return false},transparentImageData:"data:image/gif;base64,R0lGODlhAQABAPABAP///wAAACH5BAEKAAAALAAAAAABAAEAAAICRAEAOw=="}}(),CKEDITOR.dtd=function(){var a=CKEDITOR.tools.extend,e=function(a,b){for(var f=CKEDITOR.tools.clone(a),c=1;c<arguments.length;c++){var b=arguments[c],k;for(k in b)delete f[k]}return f},b={},c={},d={address:1,article:1,aside:1,blockquote:1,details:1,div:1,dl:1,fieldset:1,figure:1,
+footer:1,form:1,h1:1,h2:1,h3:1,h4:1,h5:1,h6:1,header:1,hgroup:1,hr:1,main:1,menu:1,nav:1,ol:1,p:1,pre:1,section:1,table:1,ul:1},i={command:1,link:1,meta:1,noscript:1,script:1,style:1},h={},f={"#":1},k={center:1,dir:1,noframes:1};a(b,{a:1,abbr:1,area:1,audio:1,b:1,bdi:1,bdo:1,br:1,button:1,canvas:1,cite:1,code:1,command:1,datalist:1,del:1,dfn:1,em:1,embed:1,i:1,iframe:1,img:1,input:1,ins:1,kbd:1,keygen:1,label:1,map:1,mark:1,meter:1,noscript:1,object:1,output:1,progress:1,q:1,ruby:1,s:1,samp:1,script:1,
+select:1,small:1,span:1,strong:1,sub:1,sup:1,textarea:1,time:1,u:1,"var":1,video:1,wbr:1},f,{acronym:1,applet:1,basefont:1,big:1,font:1,isindex:1,strike:1,style:1,tt:1});a(c,d,b,k);e={a:e(b,{a:1,button:1}),abbr:b,address:c,area:h,article:c,aside:c,audio:a({source:1,track:1},c),b:b,base:h,bdi:b,bdo:b,blockquote:c,body:c,br:h,button:e(b,{a:1,button:1}),canvas:b,caption:c,cite:b,code:b,col:h,colgroup:{col:1},command:h,datalist:a({option:1},b),dd:c,del:b,details:a({summary:1},c),dfn:b,div:c,dl:{dt:1,
+dd:1},dt:c,em:b,embed:h,fieldset:a({legend:1},c),figcaption:c,figure:a({figcaption:1},c),footer:c,form:c,h1:b,h2:b,h3:b,h4:b,h5:b,h6:b,head:a({title:1,base:1},i),header:c,hgroup:{h1:1,h2:1,h3:1,h4:1,h5:1,h6:1},hr:h,html:a({head:1,body:1},c,i),i:b,iframe:f,img:h,input:h,ins:b,kbd:b,keygen:h,label:b,legend:b,li:c,link:h,main:c,map:c,mark:b,menu:a({li:1},c),meta:h,meter:e(b,{meter:1}),nav:c,noscript:a({link:1,meta:1,style:1},b),object:a({param:1},b),ol:{li:1},optgroup:{option:1},option:f,output:b,p:b,
+param:h,pre:b,progress:e(b,{progress:1}),q:b,rp:b,rt:b,ruby:a({rp:1,rt:1},b),s:b,samp:b,script:f,section:c,select:{optgroup:1,option:1},small:b,source:h,span:b,strong:b,style:f,sub:b,summary:a({h1:1,h2:1,h3:1,h4:1,h5:1,h6:1},b),sup:b,table:{caption:1,colgroup:1,thead:1,tfoot:1,tbody:1,tr:1},tbody:{tr:1},td:c,textarea:f,tfoot:{tr:1},th:c,thead:{tr:1},time:e(b,{time:1}),title:f,tr:{th:1,td:1},track:h,u:b,ul:{li:1},"var":b,video:a({source:1,track:1},c),wbr:h,acronym:b,applet:a({param:1},c),basefont:h,
+big:b,center:c,dialog:h,dir:{li:1},font:b,isindex:h,noframes:c,strike:b,tt:b};a(e,{$block:a({audio:1,dd:1,dt:1,figcaption:1,li:1,video:1},d,k),$blockLimit:{article:1,aside:1,audio:1,body:1,caption:1,details:1,dir:1,div:1,dl:1,fieldset:1,figcaption:1,figure:1,footer:1,form:1,header:1,hgroup:1,main:1,menu:1,nav:1,ol:1,section:1,table:1,td:1,th:1,tr:1,ul:1,video:1},$cdata:{script:1,style:1},$editable:{address:1,article:1,aside:1,blockquote:1,body:1,details:1,div:1,fieldset:1,figcaption:1,footer:1,form:1,
+h1:1,h2:1,h3:1,h4:1,h5:1,h6:1,header:1,hgroup:1,main:1,nav:1,p:1,pre:1,section:1},$empty:{area:1,base:1,basefont:1,br:1,col:1,command:1,dialog:1,embed:1,hr:1,img:1,input:1,isindex:1,keygen:1,link:1,meta:1,param:1,source:1,track:1,wbr:1},$inline:b,$list:{dl:1,ol:1,ul:1},$listItem:{dd:1,dt:1,li:1},$nonBodyContent:a({body:1,head:1,html:1},e.head),$nonEditable:{applet:1,audio:1,button:1,embed:1,iframe:1,map:1,object:1,option:1,param:1,script:1,textarea:1,video:1},$object:{applet:1,audio:1,button:1,hr:1,
+iframe:1,img:1,input:1,object:1,select:1,table:1,textarea:1,video:1},$removeEmpty:{abbr:1,acronym:1,b:1,bdi:1,bdo:1,big:1,cite:1,code:1,del:1,dfn:1,em:1,font:1,i:1,ins:1,label:1,kbd:1,mark:1,meter:1,output:1,q:1,ruby:1,s:1,samp:1,small:1,span:1,strike:1,strong:1,sub:1,sup:1,time:1,tt:1,u:1,"var":1},$tabIndex:{a:1,area:1,button:1,input:1,object:1,select:1,textarea:1},$tableContent:{caption:1,col:1,colgroup:1,tbody:1,td:1,tfoot:1,th:1,thead:1,tr:1},$transparent:{a:1,audio:1,canvas:1,del:1,ins:1,map:1,
+noscript:1,object:1,video:1},$intermediate:{caption:1,colgroup:1,dd:1,dt:1,figcaption:1,legend:1,li:1,optgroup:1,option:1,rp:1,rt:1,summary:1,tbody:1,td:1,tfoot:1,th:1,thead:1,tr:1}});return e}(),CKEDITOR.dom.event=function(a){this.$=a},CKEDITOR.dom.event.prototype={getKey:function(){return this.$.keyCode||this.$.which},getKeystroke:function(){var a=this.getKey();if(this.$.ctrlKey||this.$.metaKey)a=a+CKEDITOR.CTRL;this.$.shiftKey&&(a=a+CKEDITOR.SHIFT);this.$.altKey&&(a=a+CKEDITOR.ALT);return a},preventDefault:function(a){var e=
+this.$;e.preventDefault?e.preventDefault():e.returnValue=false;a&&this.stopPropagation()},stopPropagation:function(){var a=this.$;a.stopPropagation?a.stopPropagation():a.cancelBubble=true},getTarget:function(){var a=this.$.target||this.$.srcElement;return a?new CKEDITOR.dom.node(a):null},getPhase:function(){return this.$.eventPhase||2},getPageOffset:function(){var a=this.getTarget().getDocument().$;return{x:this.$.pageX||this.$.clientX+(a.documentElement.scrollLeft||a.body.scrollLeft),y:this.$.pageY||
+this.$.clientY+(a.documentElement.scrollTop||a.body.scrollTop)}}},CKEDITOR.CTRL=1114112,CKEDITOR.SHIFT=2228224,CKEDITOR.ALT=4456448,CKEDITOR.EVENT_PHASE_CAPTURING=1,CKEDITOR.EVENT_PHASE_AT_TARGET=2,CKEDITOR.EVENT_PHASE_BUBBLING=3,CKEDITOR.dom.domObject=function(a){if(a)this.$=a},CKEDITOR.dom.domObject.prototype=function(){var a=function(a,b){return function(c){typeof CKEDITOR!="undefined"&&a.fire(b,new CKEDITOR.dom.event(c))}};return{getPrivate:function(){var a;if(!(a=this.getCustomData("_")))this.setCustomData("_",
+a={});return a},on:function(e){var b=this.getCustomData("_cke_nativeListeners");if(!b){b={};this.setCustomData("_cke_nativeListeners",b)}if(!b[e]){b=b[e]=a(this,e);this.$.addEventListener?this.$.addEventListener(e,b,!!CKEDITOR.event.useCapture):this.$.attachEvent&&this.$.attachEvent("on"+e,b)}return CKEDITOR.event.prototype.on.apply(this,arguments)},removeListener:function(a){CKEDITOR.event.prototype.removeListener.apply(this,arguments);if(!this.hasListeners(a)){var b=this.getCustomData("_cke_nativeListeners"),
+c=b&&b[a];if(c){this.$.removeEventListener?this.$.removeEventListener(a,c,false):this.$.detachEvent&&this.$.detachEvent("on"+a,c);delete b[a]}}},removeAllListeners:function(){var a=this.getCustomData("_cke_nativeListeners"),b;for(b in a){var c=a[b];this.$.detachEvent?this.$.detachEvent("on"+b,c):this.$.removeEventListener&&this.$.removeEventListener(b,c,false);delete a[b]}CKEDITOR.event.prototype.removeAllListeners.call(this)}}}(),function(a){var e={};CKEDITOR.on("reset",function(){e={}});a.equals=
+function(a){try{return a&&a.$===this.$}catch(c){return false}};a.setCustomData=function(a,c){var d=this.getUniqueId();(e[d]||(e[d]={}))[a]=c;return this};a.getCustomData=function(a){var c=this.$["data-cke-expando"];return(c=c&&e[c])&&a in c?c[a]:null};a.removeCustomData=function(a){var c=this.$["data-cke-expando"],c=c&&e[c],d,i;if(c){d=c[a];i=a in c;delete c[a]}return i?d:null};a.clearCustomData=function(){this.removeAllListeners();var a=this.$["data-cke-expando"];a&&delete e[a]};a.getUniqueId=function(){return this.$["data-cke-expando"]||
+(this.$["data-cke-expando"]=CKEDITOR.tools.getNextNumber())};CKEDITOR.event.implementOn(a)}(CKEDITOR.dom.domObject.prototype),CKEDITOR.dom.node=function(a){return a?new CKEDITOR.dom[a.nodeType==CKEDITOR.NODE_DOCUMENT?"document":a.nodeType==CKEDITOR.NODE_ELEMENT?"element":a.nodeType==CKEDITOR.NODE_TEXT?"text":a.nodeType==CKEDITOR.NODE_COMMENT?"comment":a.nodeType==CKEDITOR.NODE_DOCUMENT_FRAGMENT?"documentFragment":"domObject"](a):this},CKEDITOR.dom.node.prototype=new CKEDITOR.dom.domObject,CKEDITOR.NODE_ELEMENT=
+1,CKEDITOR.NODE_DOCUMENT=9,CKEDITOR.NODE_TEXT=3,CKEDITOR.NODE_COMMENT=8,CKEDITOR.NODE_DOCUMENT_FRAGMENT=11,CKEDITOR.POSITION_IDENTICAL=0,CKEDITOR.POSITION_DISCONNECTED=1,CKEDITOR.POSITION_FOLLOWING=2,CKEDITOR.POSITION_PRECEDING=4,CKEDITOR.POSITION_IS_CONTAINED=8,CKEDITOR.POSITION_CONTAINS=16,CKEDITOR.tools.extend(CKEDITOR.dom.node.prototype,{appendTo:function(a,e){a.append(this,e);return a},clone:function(a,e){function b(c){c["data-cke-expando"]&&(c["data-cke-expando"]=false);if(!(c.nodeType!=CKEDITOR.NODE_ELEMENT&&
+c.nodeType!=CKEDITOR.NODE_DOCUMENT_FRAGMENT)){!e&&c.nodeType==CKEDITOR.NODE_ELEMENT&&c.removeAttribute("id",false);if(a)for(var c=c.childNodes,d=0;d<c.length;d++)b(c[d])}}function c(b){if(!(b.type!=CKEDITOR.NODE_ELEMENT&&b.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT)){if(b.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT){var d=b.getName();d[0]==":"&&b.renameNode(d.substring(1))}if(a)for(d=0;d<b.getChildCount();d++)c(b.getChild(d))}}var d=this.$.cloneNode(a);b(d);d=new CKEDITOR.dom.node(d);CKEDITOR.env.ie&&(CKEDITOR.env.version<
+9&&(this.type==CKEDITOR.NODE_ELEMENT||this.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT))&&c(d);return d},hasPrevious:function(){return!!this.$.previousSibling},hasNext:function(){return!!this.$.nextSibling},insertAfter:function(a){a.$.parentNode.insertBefore(this.$,a.$.nextSibling);return a},insertBefore:function(a){a.$.parentNode.insertBefore(this.$,a.$);return a},insertBeforeMe:function(a){this.$.parentNode.insertBefore(a.$,this.$);return a},getAddress:function(a){for(var e=[],b=this.getDocument().$.documentElement,
+c=this.$;c&&c!=b;){var d=c.parentNode;d&&e.unshift(this.getIndex.call({$:c},a));c=d}return e},getDocument:function(){return new CKEDITOR.dom.document(this.$.ownerDocument||this.$.parentNode.ownerDocument)},getIndex:function(a){function e(a,b){var f=b?a.nextSibling:a.previousSibling;return!f||f.nodeType!=CKEDITOR.NODE_TEXT?null:f.nodeValue?f:e(f,b)}var b=this.$,c=-1,d;if(!this.$.parentNode||a&&b.nodeType==CKEDITOR.NODE_TEXT&&!b.nodeValue&&!e(b)&&!e(b,true))return-1;do if(!a||!(b!=this.$&&b.nodeType==
+CKEDITOR.NODE_TEXT&&(d||!b.nodeValue))){c++;d=b.nodeType==CKEDITOR.NODE_TEXT}while(b=b.previousSibling);return c},getNextSourceNode:function(a,e,b){if(b&&!b.call)var c=b,b=function(a){return!a.equals(c)};var a=!a&&this.getFirst&&this.getFirst(),d;if(!a){if(this.type==CKEDITOR.NODE_ELEMENT&&b&&b(this,true)===false)return null;a=this.getNext()}for(;!a&&(d=(d||this).getParent());){if(b&&b(d,true)===false)return null;a=d.getNext()}return!a||b&&b(a)===false?null:e&&e!=a.type?a.getNextSourceNode(false,
+e,b):a},getPreviousSourceNode:function(a,e,b){if(b&&!b.call)var c=b,b=function(a){return!a.equals(c)};var a=!a&&this.getLast&&this.getLast(),d;if(!a){if(this.type==CKEDITOR.NODE_ELEMENT&&b&&b(this,true)===false)return null;a=this.getPrevious()}for(;!a&&(d=(d||this).getParent());){if(b&&b(d,true)===false)return null;a=d.getPrevious()}return!a||b&&b(a)===false?null:e&&a.type!=e?a.getPreviousSourceNode(false,e,b):a},getPrevious:function(a){var e=this.$,b;do b=(e=e.previousSibling)&&e.nodeType!=10&&new CKEDITOR.dom.node(e);
+while(b&&a&&!a(b));return b},getNext:function(a){var e=this.$,b;do b=(e=e.nextSibling)&&new CKEDITOR.dom.node(e);while(b&&a&&!a(b));return b},getParent:function(a){var e=this.$.parentNode;return e&&(e.nodeType==CKEDITOR.NODE_ELEMENT||a&&e.nodeType==CKEDITOR.NODE_DOCUMENT_FRAGMENT)?new CKEDITOR.dom.node(e):null},getParents:function(a){var e=this,b=[];do b[a?"push":"unshift"](e);while(e=e.getParent());return b},getCommonAncestor:function(a){if(a.equals(this))return this;if(a.contains&&a.contains(this))return a;
+var e=this.contains?this:this.getParent();do if(e.contains(a))return e;while(e=e.getParent());return null},getPosition:function(a){var e=this.$,b=a.$;if(e.compareDocumentPosition)return e.compareDocumentPosition(b);if(e==b)return CKEDITOR.POSITION_IDENTICAL;if(this.type==CKEDITOR.NODE_ELEMENT&&a.type==CKEDITOR.NODE_ELEMENT){if(e.contains){if(e.contains(b))return CKEDITOR.POSITION_CONTAINS+CKEDITOR.POSITION_PRECEDING;if(b.contains(e))return CKEDITOR.POSITION_IS_CONTAINED+CKEDITOR.POSITION_FOLLOWING}if("sourceIndex"in
+e)return e.sourceIndex<0||b.sourceIndex<0?CKEDITOR.POSITION_DISCONNECTED:e.sourceIndex<b.sourceIndex?CKEDITOR.POSITION_PRECEDING:CKEDITOR.POSITION_FOLLOWING}for(var e=this.getAddress(),a=a.getAddress(),b=Math.min(e.length,a.length),c=0;c<b;c++)if(e[c]!=a[c])return e[c]<a[c]?CKEDITOR.POSITION_PRECEDING:CKEDITOR.POSITION_FOLLOWING;return e.length<a.length?CKEDITOR.POSITION_CONTAINS+CKEDITOR.POSITION_PRECEDING:CKEDITOR.POSITION_IS_CONTAINED+CKEDITOR.POSITION_FOLLOWING},getAscendant:function(a,e){var b=
+this.$,c,d;if(!e)b=b.parentNode;if(typeof a=="function"){d=true;c=a}else{d=false;c=function(b){b=typeof b.nodeName=="string"?b.nodeName.toLowerCase():"";return typeof a=="string"?b==a:b in a}}for(;b;){if(c(d?new CKEDITOR.dom.node(b):b))return new CKEDITOR.dom.node(b);try{b=b.parentNode}catch(i){b=null}}return null},hasAscendant:function(a,e){var b=this.$;if(!e)b=b.parentNode;for(;b;){if(b.nodeName&&b.nodeName.toLowerCase()==a)return true;b=b.parentNode}return false},move:function(a,e){a.append(this.remove(),
+e)},remove:function(a){var e=this.$,b=e.parentNode;if(b){if(a)for(;a=e.firstChild;)b.insertBefore(e.removeChild(a),e);b.removeChild(e)}return this},replace:function(a){this.insertBefore(a);a.remove()},trim:function(){this.ltrim();this.rtrim()},ltrim:function(){for(var a;this.getFirst&&(a=this.getFirst());){if(a.type==CKEDITOR.NODE_TEXT){var e=CKEDITOR.tools.ltrim(a.getText()),b=a.getLength();if(e){if(e.length<b){a.split(b-e.length);this.$.removeChild(this.$.firstChild)}}else{a.remove();continue}}break}},
+rtrim:function(){for(var a;this.getLast&&(a=this.getLast());){if(a.type==CKEDITOR.NODE_TEXT){var e=CKEDITOR.tools.rtrim(a.getText()),b=a.getLength();if(e){if(e.length<b){a.split(e.length);this.$.lastChild.parentNode.removeChild(this.$.lastChild)}}else{a.remove();continue}}break}if(CKEDITOR.env.needsBrFiller)(a=this.$.lastChild)&&(a.type==1&&a.nodeName.toLowerCase()=="br")&&a.parentNode.removeChild(a)},isReadOnly:function(a){var e=this;this.type!=CKEDITOR.NODE_ELEMENT&&(e=this.getParent());CKEDITOR.env.edge&&
+(e&&e.is("textarea"))&&(a=true);if(!a&&e&&typeof e.$.isContentEditable!="undefined")return!(e.$.isContentEditable||e.data("cke-editable"));for(;e;){if(e.data("cke-editable"))return false;if(e.hasAttribute("contenteditable"))return e.getAttribute("contenteditable")=="false";e=e.getParent()}return true}}),CKEDITOR.dom.window=function(a){CKEDITOR.dom.domObject.call(this,a)},CKEDITOR.dom.window.prototype=new CKEDITOR.dom.domObject,CKEDITOR.tools.extend(CKEDITOR.dom.window.prototype,{focus:function(){this.$.focus()},
+getViewPaneSize:function(){var a=this.$.document,e=a.compatMode=="CSS1Compat";return{width:(e?a.documentElement.clientWidth:a.body.clientWidth)||0,height:(e?a.documentElement.clientHeight:a.body.clientHeight)||0}},getScrollPosition:function(){var a=this.$;if("pageXOffset"in a)return{x:a.pageXOffset||0,y:a.pageYOffset||0};a=a.document;return{x:a.documentElement.scrollLeft||a.body.scrollLeft||0,y:a.documentElement.scrollTop||a.body.scrollTop||0}},getFrame:function(){var a=this.$.frameElement;return a?
+new CKEDITOR.dom.element.get(a):null}}),CKEDITOR.dom.document=function(a){CKEDITOR.dom.domObject.call(this,a)},CKEDITOR.dom.document.prototype=new CKEDITOR.dom.domObject,CKEDITOR.tools.extend(CKEDITOR.dom.document.prototype,{type:CKEDITOR.NODE_DOCUMENT,appendStyleSheet:function(a){if(this.$.createStyleSheet)this.$.createStyleSheet(a);else{var e=new CKEDITOR.dom.element("link");e.setAttributes({rel:"stylesheet",type:"text/css",href:a});this.getHead().append(e)}},appendStyleText:function(a){if(this.$.createStyleSheet){var e=
+this.$.createStyleSheet("");e.cssText=a}else{var b=new CKEDITOR.dom.element("style",this);b.append(new CKEDITOR.dom.text(a,this));this.getHead().append(b)}return e||b.$.sheet},createElement:function(a,e){var b=new CKEDITOR.dom.element(a,this);if(e){e.attributes&&b.setAttributes(e.attributes);e.styles&&b.setStyles(e.styles)}return b},createText:function(a){return new CKEDITOR.dom.text(a,this)},focus:function(){this.getWindow().focus()},getActive:function(){var a;try{a=this.$.activeElement}catch(e){return null}return new CKEDITOR.dom.element(a)},
+getById:function(a){return(a=this.$.getElementById(a))?new CKEDITOR.dom.element(a):null},getByAddress:function(a,e){for(var b=this.$.documentElement,c=0;b&&c<a.length;c++){var d=a[c];if(e)for(var i=-1,h=0;h<b.childNodes.length;h++){var f=b.childNodes[h];if(!(e===true&&f.nodeType==3&&f.previousSibling&&f.previousSibling.nodeType==3)){i++;if(i==d){b=f;break}}}else b=b.childNodes[d]}return b?new CKEDITOR.dom.node(b):null},getElementsByTag:function(a,e){!(CKEDITOR.env.ie&&document.documentMode<=8)&&e&&
+(a=e+":"+a);return new CKEDITOR.dom.nodeList(this.$.getElementsByTagName(a))},getHead:function(){var a=this.$.getElementsByTagName("head")[0];return a=a?new CKEDITOR.dom.element(a):this.getDocumentElement().append(new CKEDITOR.dom.element("head"),true)},getBody:function(){return new CKEDITOR.dom.element(this.$.body)},getDocumentElement:function(){return new CKEDITOR.dom.element(this.$.documentElement)},getWindow:function(){return new CKEDITOR.dom.window(this.$.parentWindow||this.$.defaultView)},write:function(a){this.$.open("text/html",
+"replace");CKEDITOR.env.ie&&(a=a.replace(/(?:^\s*<!DOCTYPE[^>]*?>)|^/i,'$&\n<script data-cke-temp="1">('+CKEDITOR.tools.fixDomain+")();<\/script>"));this.$.write(a);this.$.close()},find:function(a){return new CKEDITOR.dom.nodeList(this.$.querySelectorAll(a))},findOne:function(a){return(a=this.$.querySelector(a))?new CKEDITOR.dom.element(a):null},_getHtml5ShivFrag:function(){var a=this.getCustomData("html5ShivFrag");if(!a){a=this.$.createDocumentFragment();CKEDITOR.tools.enableHtml5Elements(a,true);
+this.setCustomData("html5ShivFrag",a)}return a}}),CKEDITOR.dom.nodeList=function(a){this.$=a},CKEDITOR.dom.nodeList.prototype={count:function(){return this.$.length},getItem:function(a){if(a<0||a>=this.$.length)return null;return(a=this.$[a])?new CKEDITOR.dom.node(a):null}},CKEDITOR.dom.element=function(a,e){typeof a=="string"&&(a=(e?e.$:document).createElement(a));CKEDITOR.dom.domObject.call(this,a)},CKEDITOR.dom.element.get=function(a){return(a=typeof a=="string"?document.getElementById(a)||document.getElementsByName(a)[0]:
+a)&&(a.$?a:new CKEDITOR.dom.element(a))},CKEDITOR.dom.element.prototype=new CKEDITOR.dom.node,CKEDITOR.dom.element.createFromHtml=function(a,e){var b=new CKEDITOR.dom.element("div",e);b.setHtml(a);return b.getFirst().remove()},CKEDITOR.dom.element.setMarker=function(a,e,b,c){var d=e.getCustomData("list_marker_id")||e.setCustomData("list_marker_id",CKEDITOR.tools.getNextNumber()).getCustomData("list_marker_id"),i=e.getCustomData("list_marker_names")||e.setCustomData("list_marker_names",{}).getCustomData("list_marker_names");
+a[d]=e;i[b]=1;return e.setCustomData(b,c)},CKEDITOR.dom.element.clearAllMarkers=function(a){for(var e in a)CKEDITOR.dom.element.clearMarkers(a,a[e],1)},CKEDITOR.dom.element.clearMarkers=function(a,e,b){var c=e.getCustomData("list_marker_names"),d=e.getCustomData("list_marker_id"),i;for(i in c)e.removeCustomData(i);e.removeCustomData("list_marker_names");if(b){e.removeCustomData("list_marker_id");delete a[d]}},function(){function a(a,b){return(" "+a+" ").replace(i," ").indexOf(" "+b+" ")>-1}function e(a){var b=
+true;if(!a.$.id){a.$.id="cke_tmp_"+CKEDITOR.tools.getNextNumber();b=false}return function(){b||a.removeAttribute("id")}}function b(a,b){return"#"+a.$.id+" "+b.split(/,\s*/).join(", #"+a.$.id+" ")}function c(a){for(var b=0,c=0,g=h[a].length;c<g;c++)b=b+(parseInt(this.getComputedStyle(h[a][c])||0,10)||0);return b}var d=!!document.createElement("span").classList,i=/[\n\t\r]/g;CKEDITOR.tools.extend(CKEDITOR.dom.element.prototype,{type:CKEDITOR.NODE_ELEMENT,addClass:d?function(a){this.$.classList.add(a);
+return this}:function(b){var c=this.$.className;c&&(a(c,b)||(c=c+(" "+b)));this.$.className=c||b;return this},removeClass:d?function(a){var b=this.$;b.classList.remove(a);b.className||b.removeAttribute("class");return this}:function(b){var c=this.getAttribute("class");if(c&&a(c,b))(c=c.replace(RegExp("(?:^|\\s+)"+b+"(?=\\s|$)"),"").replace(/^\s+/,""))?this.setAttribute("class",c):this.removeAttribute("class");return this},hasClass:function(b){return a(this.$.className,b)},append:function(a,b){typeof a==
+"string"&&(a=this.getDocument().createElement(a));b?this.$.insertBefore(a.$,this.$.firstChild):this.$.appendChild(a.$);return a},appendHtml:function(a){if(this.$.childNodes.length){var b=new CKEDITOR.dom.element("div",this.getDocument());b.setHtml(a);b.moveChildren(this)}else this.setHtml(a)},appendText:function(a){this.$.text!=null&&CKEDITOR.env.ie&&CKEDITOR.env.version<9?this.$.text=this.$.text+a:this.append(new CKEDITOR.dom.text(a))},appendBogus:function(a){if(a||CKEDITOR.env.needsBrFiller){for(a=
+this.getLast();a&&a.type==CKEDITOR.NODE_TEXT&&!CKEDITOR.tools.rtrim(a.getText());)a=a.getPrevious();if(!a||!a.is||!a.is("br")){a=this.getDocument().createElement("br");CKEDITOR.env.gecko&&a.setAttribute("type","_moz");this.append(a)}}},breakParent:function(a,b){var c=new CKEDITOR.dom.range(this.getDocument());c.setStartAfter(this);c.setEndAfter(a);var g=c.extractContents(false,b||false);c.insertNode(this.remove());g.insertAfterNode(this)},contains:!document.compareDocumentPosition?function(a){var b=
+this.$;return a.type!=CKEDITOR.NODE_ELEMENT?b.contains(a.getParent().$):b!=a.$&&b.contains(a.$)}:function(a){return!!(this.$.compareDocumentPosition(a.$)&16)},focus:function(){function a(){try{this.$.focus()}catch(b){}}return function(b){b?CKEDITOR.tools.setTimeout(a,100,this):a.call(this)}}(),getHtml:function(){var a=this.$.innerHTML;return CKEDITOR.env.ie?a.replace(/<\?[^>]*>/g,""):a},getOuterHtml:function(){if(this.$.outerHTML)return this.$.outerHTML.replace(/<\?[^>]*>/,"");var a=this.$.ownerDocument.createElement("div");
+a.appendChild(this.$.cloneNode(true));return a.innerHTML},getClientRect:function(){var a=CKEDITOR.tools.extend({},this.$.getBoundingClientRect());!a.width&&(a.width=a.right-a.left);!a.height&&(a.height=a.bottom-a.top);return a},setHtml:CKEDITOR.env.ie&&CKEDITOR.env.version<9?function(a){try{var b=this.$;if(this.getParent())return b.innerHTML=a;var c=this.getDocument()._getHtml5ShivFrag();c.appendChild(b);b.innerHTML=a;c.removeChild(b);return a}catch(g){this.$.innerHTML="";b=new CKEDITOR.dom.element("body",
+this.getDocument());b.$.innerHTML=a;for(b=b.getChildren();b.count();)this.append(b.getItem(0));return a}}:function(a){return this.$.innerHTML=a},setText:function(){var a=document.createElement("p");a.innerHTML="x";a=a.textContent;return function(b){this.$[a?"textContent":"innerText"]=b}}(),getAttribute:function(){var a=function(a){return this.$.getAttribute(a,2)};return CKEDITOR.env.ie&&(CKEDITOR.env.ie7Compat||CKEDITOR.env.quirks)?function(a){switch(a){case "class":a="className";break;case "http-equiv":a=
+"httpEquiv";break;case "name":return this.$.name;case "tabindex":a=this.$.getAttribute(a,2);a!==0&&this.$.tabIndex===0&&(a=null);return a;case "checked":a=this.$.attributes.getNamedItem(a);return(a.specified?a.nodeValue:this.$.checked)?"checked":null;case "hspace":case "value":return this.$[a];case "style":return this.$.style.cssText;case "contenteditable":case "contentEditable":return this.$.attributes.getNamedItem("contentEditable").specified?this.$.getAttribute("contentEditable"):null}return this.$.getAttribute(a,
+2)}:a}(),getChildren:function(){return new CKEDITOR.dom.nodeList(this.$.childNodes)},getComputedStyle:document.defaultView&&document.defaultView.getComputedStyle?function(a){var b=this.getWindow().$.getComputedStyle(this.$,null);return b?b.getPropertyValue(a):""}:function(a){return this.$.currentStyle[CKEDITOR.tools.cssStyleToDomStyle(a)]},getDtd:function(){var a=CKEDITOR.dtd[this.getName()];this.getDtd=function(){return a};return a},getElementsByTag:CKEDITOR.dom.document.prototype.getElementsByTag,
+getTabIndex:function(){var a=this.$.tabIndex;return a===0&&!CKEDITOR.dtd.$tabIndex[this.getName()]&&parseInt(this.getAttribute("tabindex"),10)!==0?-1:a},getText:function(){return this.$.textContent||this.$.innerText||""},getWindow:function(){return this.getDocument().getWindow()},getId:function(){return this.$.id||null},getNameAtt:function(){return this.$.name||null},getName:function(){var a=this.$.nodeName.toLowerCase();if(CKEDITOR.env.ie&&document.documentMode<=8){var b=this.$.scopeName;b!="HTML"&&
+(a=b.toLowerCase()+":"+a)}this.getName=function(){return a};return this.getName()},getValue:function(){return this.$.value},getFirst:function(a){var b=this.$.firstChild;(b=b&&new CKEDITOR.dom.node(b))&&(a&&!a(b))&&(b=b.getNext(a));return b},getLast:function(a){var b=this.$.lastChild;(b=b&&new CKEDITOR.dom.node(b))&&(a&&!a(b))&&(b=b.getPrevious(a));return b},getStyle:function(a){return this.$.style[CKEDITOR.tools.cssStyleToDomStyle(a)]},is:function(){var a=this.getName();if(typeof arguments[0]=="object")return!!arguments[0][a];
+for(var b=0;b<arguments.length;b++)if(arguments[b]==a)return true;return false},isEditable:function(a){var b=this.getName();if(this.isReadOnly()||this.getComputedStyle("display")=="none"||this.getComputedStyle("visibility")=="hidden"||CKEDITOR.dtd.$nonEditable[b]||CKEDITOR.dtd.$empty[b]||this.is("a")&&(this.data("cke-saved-name")||this.hasAttribute("name"))&&!this.getChildCount())return false;if(a!==false){a=CKEDITOR.dtd[b]||CKEDITOR.dtd.span;return!(!a||!a["#"])}return true},isIdentical:function(a){var b=
+this.clone(0,1),a=a.clone(0,1);b.removeAttributes(["_moz_dirty","data-cke-expando","data-cke-saved-href","data-cke-saved-name"]);a.removeAttributes(["_moz_dirty","data-cke-expando","data-cke-saved-href","data-cke-saved-name"]);if(b.$.isEqualNode){b.$.style.cssText=CKEDITOR.tools.normalizeCssText(b.$.style.cssText);a.$.style.cssText=CKEDITOR.tools.normalizeCssText(a.$.style.cssText);return b.$.isEqualNode(a.$)}b=b.getOuterHtml();a=a.getOuterHtml();if(CKEDITOR.env.ie&&CKEDITOR.env.version<9&&this.is("a")){var c=
+this.getParent();if(c.type==CKEDITOR.NODE_ELEMENT){c=c.clone();c.setHtml(b);b=c.getHtml();c.setHtml(a);a=c.getHtml()}}return b==a},isVisible:function(){var a=(this.$.offsetHeight||this.$.offsetWidth)&&this.getComputedStyle("visibility")!="hidden",b,c;if(a&&CKEDITOR.env.webkit){b=this.getWindow();if(!b.equals(CKEDITOR.document.getWindow())&&(c=b.$.frameElement))a=(new CKEDITOR.dom.element(c)).isVisible()}return!!a},isEmptyInlineRemoveable:function(){if(!CKEDITOR.dtd.$removeEmpty[this.getName()])return false;
+for(var a=this.getChildren(),b=0,c=a.count();b<c;b++){var g=a.getItem(b);if(!(g.type==CKEDITOR.NODE_ELEMENT&&g.data("cke-bookmark"))&&(g.type==CKEDITOR.NODE_ELEMENT&&!g.isEmptyInlineRemoveable()||g.type==CKEDITOR.NODE_TEXT&&CKEDITOR.tools.trim(g.getText())))return false}return true},hasAttributes:CKEDITOR.env.ie&&(CKEDITOR.env.ie7Compat||CKEDITOR.env.quirks)?function(){for(var a=this.$.attributes,b=0;b<a.length;b++){var c=a[b];switch(c.nodeName){case "class":if(this.getAttribute("class"))return true;
+case "data-cke-expando":continue;default:if(c.specified)return true}}return false}:function(){var a=this.$.attributes,b=a.length,c={"data-cke-expando":1,_moz_dirty:1};return b>0&&(b>2||!c[a[0].nodeName]||b==2&&!c[a[1].nodeName])},hasAttribute:function(){function a(b){var c=this.$.attributes.getNamedItem(b);if(this.getName()=="input")switch(b){case "class":return this.$.className.length>0;case "checked":return!!this.$.checked;case "value":b=this.getAttribute("type");return b=="checkbox"||b=="radio"?
+this.$.value!="on":!!this.$.value}return!c?false:c.specified}return CKEDITOR.env.ie?CKEDITOR.env.version<8?function(b){return b=="name"?!!this.$.name:a.call(this,b)}:a:function(a){return!!this.$.attributes.getNamedItem(a)}}(),hide:function(){this.setStyle("display","none")},moveChildren:function(a,b){var c=this.$,a=a.$;if(c!=a){var g;if(b)for(;g=c.lastChild;)a.insertBefore(c.removeChild(g),a.firstChild);else for(;g=c.firstChild;)a.appendChild(c.removeChild(g))}},mergeSiblings:function(){function a(b,
+c,g){if(c&&c.type==CKEDITOR.NODE_ELEMENT){for(var f=[];c.data("cke-bookmark")||c.isEmptyInlineRemoveable();){f.push(c);c=g?c.getNext():c.getPrevious();if(!c||c.type!=CKEDITOR.NODE_ELEMENT)return}if(b.isIdentical(c)){for(var d=g?b.getLast():b.getFirst();f.length;)f.shift().move(b,!g);c.moveChildren(b,!g);c.remove();d&&d.type==CKEDITOR.NODE_ELEMENT&&d.mergeSiblings()}}}return function(b){if(b===false||CKEDITOR.dtd.$removeEmpty[this.getName()]||this.is("a")){a(this,this.getNext(),true);a(this,this.getPrevious())}}}(),
+show:function(){this.setStyles({display:"",visibility:""})},setAttribute:function(){var a=function(a,b){this.$.setAttribute(a,b);return this};return CKEDITOR.env.ie&&(CKEDITOR.env.ie7Compat||CKEDITOR.env.quirks)?function(b,c){b=="class"?this.$.className=c:b=="style"?this.$.style.cssText=c:b=="tabindex"?this.$.tabIndex=c:b=="checked"?this.$.checked=c:b=="contenteditable"?a.call(this,"contentEditable",c):a.apply(this,arguments);return this}:CKEDITOR.env.ie8Compat&&CKEDITOR.env.secure?function(b,c){if(b==
+"src"&&c.match(/^http:\/\//))try{a.apply(this,arguments)}catch(g){}else a.apply(this,arguments);return this}:a}(),setAttributes:function(a){for(var b in a)this.setAttribute(b,a[b]);return this},setValue:function(a){this.$.value=a;return this},removeAttribute:function(){var a=function(a){this.$.removeAttribute(a)};return CKEDITOR.env.ie&&(CKEDITOR.env.ie7Compat||CKEDITOR.env.quirks)?function(a){a=="class"?a="className":a=="tabindex"?a="tabIndex":a=="contenteditable"&&(a="contentEditable");this.$.removeAttribute(a)}:
+a}(),removeAttributes:function(a){if(CKEDITOR.tools.isArray(a))for(var b=0;b<a.length;b++)this.removeAttribute(a[b]);else for(b in a)a.hasOwnProperty(b)&&this.removeAttribute(b)},removeStyle:function(a){var b=this.$.style;if(!b.removeProperty&&(a=="border"||a=="margin"||a=="padding")){var c=["top","left","right","bottom"],g;a=="border"&&(g=["color","style","width"]);for(var b=[],d=0;d<c.length;d++)if(g)for(var e=0;e<g.length;e++)b.push([a,c[d],g[e]].join("-"));else b.push([a,c[d]].join("-"));for(a=
+0;a<b.length;a++)this.removeStyle(b[a])}else{b.removeProperty?b.removeProperty(a):b.removeAttribute(CKEDITOR.tools.cssStyleToDomStyle(a));this.$.style.cssText||this.removeAttribute("style")}},setStyle:function(a,b){this.$.style[CKEDITOR.tools.cssStyleToDomStyle(a)]=b;return this},setStyles:function(a){for(var b in a)this.setStyle(b,a[b]);return this},setOpacity:function(a){if(CKEDITOR.env.ie&&CKEDITOR.env.version<9){a=Math.round(a*100);this.setStyle("filter",a>=100?"":"progid:DXImageTransform.Microsoft.Alpha(opacity="+
+a+")")}else this.setStyle("opacity",a)},unselectable:function(){this.setStyles(CKEDITOR.tools.cssVendorPrefix("user-select","none"));if(CKEDITOR.env.ie){this.setAttribute("unselectable","on");for(var a,b=this.getElementsByTag("*"),c=0,g=b.count();c<g;c++){a=b.getItem(c);a.setAttribute("unselectable","on")}}},getPositionedAncestor:function(){for(var a=this;a.getName()!="html";){if(a.getComputedStyle("position")!="static")return a;a=a.getParent()}return null},getDocumentPosition:function(a){var b=0,
+c=0,g=this.getDocument(),d=g.getBody(),e=g.$.compatMode=="BackCompat";if(document.documentElement.getBoundingClientRect){var i=this.$.getBoundingClientRect(),o=g.$.documentElement,h=o.clientTop||d.$.clientTop||0,m=o.clientLeft||d.$.clientLeft||0,p=true;if(CKEDITOR.env.ie){p=g.getDocumentElement().contains(this);g=g.getBody().contains(this);p=e&&g||!e&&p}if(p){if(CKEDITOR.env.webkit||CKEDITOR.env.ie&&CKEDITOR.env.version>=12){b=d.$.scrollLeft||o.scrollLeft;c=d.$.scrollTop||o.scrollTop}else{c=e?d.$:
+o;b=c.scrollLeft;c=c.scrollTop}b=i.left+b-m;c=i.top+c-h}}else{h=this;for(m=null;h&&!(h.getName()=="body"||h.getName()=="html");){b=b+(h.$.offsetLeft-h.$.scrollLeft);c=c+(h.$.offsetTop-h.$.scrollTop);if(!h.equals(this)){b=b+(h.$.clientLeft||0);c=c+(h.$.clientTop||0)}for(;m&&!m.equals(h);){b=b-m.$.scrollLeft;c=c-m.$.scrollTop;m=m.getParent()}m=h;h=(i=h.$.offsetParent)?new CKEDITOR.dom.element(i):null}}if(a){i=this.getWindow();h=a.getWindow();if(!i.equals(h)&&i.$.frameElement){a=(new CKEDITOR.dom.element(i.$.frameElement)).getDocumentPosition(a);
+b=b+a.x;c=c+a.y}}if(!document.documentElement.getBoundingClientRect&&CKEDITOR.env.gecko&&!e){b=b+(this.$.clientLeft?1:0);c=c+(this.$.clientTop?1:0)}return{x:b,y:c}},scrollIntoView:function(a){var b=this.getParent();if(b){do{(b.$.clientWidth&&b.$.clientWidth<b.$.scrollWidth||b.$.clientHeight&&b.$.clientHeight<b.$.scrollHeight)&&!b.is("body")&&this.scrollIntoParent(b,a,1);if(b.is("html")){var c=b.getWindow();try{var g=c.$.frameElement;g&&(b=new CKEDITOR.dom.element(g))}catch(d){}}}while(b=b.getParent())
+}},scrollIntoParent:function(a,b,c){var g,d,e,i;function o(b,g){if(/body|html/.test(a.getName()))a.getWindow().$.scrollBy(b,g);else{a.$.scrollLeft=a.$.scrollLeft+b;a.$.scrollTop=a.$.scrollTop+g}}function h(a,b){var g={x:0,y:0};if(!a.is(p?"body":"html")){var c=a.$.getBoundingClientRect();g.x=c.left;g.y=c.top}c=a.getWindow();if(!c.equals(b)){c=h(CKEDITOR.dom.element.get(c.$.frameElement),b);g.x=g.x+c.x;g.y=g.y+c.y}return g}function m(a,b){return parseInt(a.getComputedStyle("margin-"+b)||0,10)||0}!a&&
+(a=this.getWindow());e=a.getDocument();var p=e.$.compatMode=="BackCompat";a instanceof CKEDITOR.dom.window&&(a=p?e.getBody():e.getDocumentElement());e=a.getWindow();d=h(this,e);var t=h(a,e),w=this.$.offsetHeight;g=this.$.offsetWidth;var u=a.$.clientHeight,x=a.$.clientWidth;e=d.x-m(this,"left")-t.x||0;i=d.y-m(this,"top")-t.y||0;g=d.x+g+m(this,"right")-(t.x+x)||0;d=d.y+w+m(this,"bottom")-(t.y+u)||0;if(i<0||d>0)o(0,b===true?i:b===false?d:i<0?i:d);if(c&&(e<0||g>0))o(e<0?e:g,0)},setState:function(a,b,
+c){b=b||"cke";switch(a){case CKEDITOR.TRISTATE_ON:this.addClass(b+"_on");this.removeClass(b+"_off");this.removeClass(b+"_disabled");c&&this.setAttribute("aria-pressed",true);c&&this.removeAttribute("aria-disabled");break;case CKEDITOR.TRISTATE_DISABLED:this.addClass(b+"_disabled");this.removeClass(b+"_off");this.removeClass(b+"_on");c&&this.setAttribute("aria-disabled",true);c&&this.removeAttribute("aria-pressed");break;default:this.addClass(b+"_off");this.removeClass(b+"_on");this.removeClass(b+
+"_disabled");c&&this.removeAttribute("aria-pressed");c&&this.removeAttribute("aria-disabled")}},getFrameDocument:function(){var a=this.$;try{a.contentWindow.document}catch(b){a.src=a.src}return a&&new CKEDITOR.dom.document(a.contentWindow.document)},copyAttributes:function(a,b){for(var c=this.$.attributes,b=b||{},g=0;g<c.length;g++){var d=c[g],e=d.nodeName.toLowerCase(),i;if(!(e in b))if(e=="checked"&&(i=this.getAttribute(e)))a.setAttribute(e,i);else if(!CKEDITOR.env.ie||this.hasAttribute(e)){i=this.getAttribute(e);
+if(i===null)i=d.nodeValue;a.setAttribute(e,i)}}if(this.$.style.cssText!=="")a.$.style.cssText=this.$.style.cssText},renameNode:function(a){if(this.getName()!=a){var b=this.getDocument(),a=new CKEDITOR.dom.element(a,b);this.copyAttributes(a);this.moveChildren(a);this.getParent(true)&&this.$.parentNode.replaceChild(a.$,this.$);a.$["data-cke-expando"]=this.$["data-cke-expando"];this.$=a.$;delete this.getName}},getChild:function(){function a(b,c){var g=b.childNodes;if(c>=0&&c<g.length)return g[c]}return function(b){var c=
+this.$;if(b.slice)for(b=b.slice();b.length>0&&c;)c=a(c,b.shift());else c=a(c,b);return c?new CKEDITOR.dom.node(c):null}}(),getChildCount:function(){return this.$.childNodes.length},disableContextMenu:function(){function a(b){return b.type==CKEDITOR.NODE_ELEMENT&&b.hasClass("cke_enable_context_menu")}this.on("contextmenu",function(b){b.data.getTarget().getAscendant(a,true)||b.data.preventDefault()})},getDirection:function(a){return a?this.getComputedStyle("direction")||this.getDirection()||this.getParent()&&
+this.getParent().getDirection(1)||this.getDocument().$.dir||"ltr":this.getStyle("direction")||this.getAttribute("dir")},data:function(a,b){a="data-"+a;if(b===void 0)return this.getAttribute(a);b===false?this.removeAttribute(a):this.setAttribute(a,b);return null},getEditor:function(){var a=CKEDITOR.instances,b,c;for(b in a){c=a[b];if(c.element.equals(this)&&c.elementMode!=CKEDITOR.ELEMENT_MODE_APPENDTO)return c}return null},find:function(a){var c=e(this),a=new CKEDITOR.dom.nodeList(this.$.querySelectorAll(b(this,
+a)));c();return a},findOne:function(a){var c=e(this),a=this.$.querySelector(b(this,a));c();return a?new CKEDITOR.dom.element(a):null},forEach:function(a,b,c){if(!c&&(!b||this.type==b))var g=a(this);if(g!==false)for(var c=this.getChildren(),d=0;d<c.count();d++){g=c.getItem(d);g.type==CKEDITOR.NODE_ELEMENT?g.forEach(a,b):(!b||g.type==b)&&a(g)}}});var h={width:["border-left-width","border-right-width","padding-left","padding-right"],height:["border-top-width","border-bottom-width","padding-top","padding-bottom"]};
+CKEDITOR.dom.element.prototype.setSize=function(a,b,d){if(typeof b=="number"){if(d&&(!CKEDITOR.env.ie||!CKEDITOR.env.quirks))b=b-c.call(this,a);this.setStyle(a,b+"px")}};CKEDITOR.dom.element.prototype.getSize=function(a,b){var d=Math.max(this.$["offset"+CKEDITOR.tools.capitalize(a)],this.$["client"+CKEDITOR.tools.capitalize(a)])||0;b&&(d=d-c.call(this,a));return d}}(),CKEDITOR.dom.documentFragment=function(a){a=a||CKEDITOR.document;this.$=a.type==CKEDITOR.NODE_DOCUMENT?a.$.createDocumentFragment():
+a},CKEDITOR.tools.extend(CKEDITOR.dom.documentFragment.prototype,CKEDITOR.dom.element.prototype,{type:CKEDITOR.NODE_DOCUMENT_FRAGMENT,insertAfterNode:function(a){a=a.$;a.parentNode.insertBefore(this.$,a.nextSibling)},getHtml:function(){var a=new CKEDITOR.dom.element("div");this.clone(1,1).appendTo(a);return a.getHtml().replace(/\s*data-cke-expando=".*?"/g,"")}},!0,{append:1,appendBogus:1,clone:1,getFirst:1,getHtml:1,getLast:1,getParent:1,getNext:1,getPrevious:1,appendTo:1,moveChildren:1,insertBefore:1,
+insertAfterNode:1,replace:1,trim:1,type:1,ltrim:1,rtrim:1,getDocument:1,getChildCount:1,getChild:1,getChildren:1}),function(){function a(a,b){var c=this.range;if(this._.end)return null;if(!this._.start){this._.start=1;if(c.collapsed){this.end();return null}c.optimize()}var g,d=c.startContainer;g=c.endContainer;var f=c.startOffset,e=c.endOffset,i,j=this.guard,k=this.type,h=a?"getPreviousSourceNode":"getNextSourceNode";if(!a&&!this._.guardLTR){var v=g.type==CKEDITOR.NODE_ELEMENT?g:g.getParent(),s=g.type==
+CKEDITOR.NODE_ELEMENT?g.getChild(e):g.getNext();this._.guardLTR=function(a,b){return(!b||!v.equals(a))&&(!s||!a.equals(s))&&(a.type!=CKEDITOR.NODE_ELEMENT||!b||!a.equals(c.root))}}if(a&&!this._.guardRTL){var y=d.type==CKEDITOR.NODE_ELEMENT?d:d.getParent(),z=d.type==CKEDITOR.NODE_ELEMENT?f?d.getChild(f-1):null:d.getPrevious();this._.guardRTL=function(a,b){return(!b||!y.equals(a))&&(!z||!a.equals(z))&&(a.type!=CKEDITOR.NODE_ELEMENT||!b||!a.equals(c.root))}}var B=a?this._.guardRTL:this._.guardLTR;i=
+j?function(a,b){return B(a,b)===false?false:j(a,b)}:B;if(this.current)g=this.current[h](false,k,i);else{if(a)g.type==CKEDITOR.NODE_ELEMENT&&(g=e>0?g.getChild(e-1):i(g,true)===false?null:g.getPreviousSourceNode(true,k,i));else{g=d;if(g.type==CKEDITOR.NODE_ELEMENT&&!(g=g.getChild(f)))g=i(d,true)===false?null:d.getNextSourceNode(true,k,i)}g&&i(g)===false&&(g=null)}for(;g&&!this._.end;){this.current=g;if(!this.evaluator||this.evaluator(g)!==false){if(!b)return g}else if(b&&this.evaluator)return false;
+g=g[h](false,k,i)}this.end();return this.current=null}function e(b){for(var g,c=null;g=a.call(this,b);)c=g;return c}CKEDITOR.dom.walker=CKEDITOR.tools.createClass({$:function(a){this.range=a;this._={}},proto:{end:function(){this._.end=1},next:function(){return a.call(this)},previous:function(){return a.call(this,1)},checkForward:function(){return a.call(this,0,1)!==false},checkBackward:function(){return a.call(this,1,1)!==false},lastForward:function(){return e.call(this)},lastBackward:function(){return e.call(this,
+1)},reset:function(){delete this.current;this._={}}}});var b={block:1,"list-item":1,table:1,"table-row-group":1,"table-header-group":1,"table-footer-group":1,"table-row":1,"table-column-group":1,"table-column":1,"table-cell":1,"table-caption":1},c={absolute:1,fixed:1};CKEDITOR.dom.element.prototype.isBlockBoundary=function(a){return this.getComputedStyle("float")=="none"&&!(this.getComputedStyle("position")in c)&&b[this.getComputedStyle("display")]?true:!!(this.is(CKEDITOR.dtd.$block)||a&&this.is(a))};
+CKEDITOR.dom.walker.blockBoundary=function(a){return function(b){return!(b.type==CKEDITOR.NODE_ELEMENT&&b.isBlockBoundary(a))}};CKEDITOR.dom.walker.listItemBoundary=function(){return this.blockBoundary({br:1})};CKEDITOR.dom.walker.bookmark=function(a,b){function g(a){return a&&a.getName&&a.getName()=="span"&&a.data("cke-bookmark")}return function(c){var d,f;d=c&&c.type!=CKEDITOR.NODE_ELEMENT&&(f=c.getParent())&&g(f);d=a?d:d||g(c);return!!(b^d)}};CKEDITOR.dom.walker.whitespaces=function(a){return function(b){var g;
+b&&b.type==CKEDITOR.NODE_TEXT&&(g=!CKEDITOR.tools.trim(b.getText())||CKEDITOR.env.webkit&&b.getText()=="​");return!!(a^g)}};CKEDITOR.dom.walker.invisible=function(a){var b=CKEDITOR.dom.walker.whitespaces(),g=CKEDITOR.env.webkit?1:0;return function(c){if(b(c))c=1;else{c.type==CKEDITOR.NODE_TEXT&&(c=c.getParent());c=c.$.offsetWidth<=g}return!!(a^c)}};CKEDITOR.dom.walker.nodeType=function(a,b){return function(g){return!!(b^g.type==a)}};CKEDITOR.dom.walker.bogus=function(a){function b(a){return!i(a)&&
+!h(a)}return function(g){var c=CKEDITOR.env.needsBrFiller?g.is&&g.is("br"):g.getText&&d.test(g.getText());if(c){c=g.getParent();g=g.getNext(b);c=c.isBlockBoundary()&&(!g||g.type==CKEDITOR.NODE_ELEMENT&&g.isBlockBoundary())}return!!(a^c)}};CKEDITOR.dom.walker.temp=function(a){return function(b){b.type!=CKEDITOR.NODE_ELEMENT&&(b=b.getParent());b=b&&b.hasAttribute("data-cke-temp");return!!(a^b)}};var d=/^[\t\r\n ]*(?:&nbsp;|\xa0)$/,i=CKEDITOR.dom.walker.whitespaces(),h=CKEDITOR.dom.walker.bookmark(),
+f=CKEDITOR.dom.walker.temp();CKEDITOR.dom.walker.ignored=function(a){return function(b){b=i(b)||h(b)||f(b);return!!(a^b)}};var k=CKEDITOR.dom.walker.ignored();CKEDITOR.dom.walker.empty=function(a){return function(b){for(var g=0,c=b.getChildCount();g<c;++g)if(!k(b.getChild(g)))return!!a;return!a}};var j=CKEDITOR.dom.walker.empty(),g=CKEDITOR.dom.walker.validEmptyBlockContainers=CKEDITOR.tools.extend(function(a){var b={},g;for(g in a)CKEDITOR.dtd[g]["#"]&&(b[g]=1);return b}(CKEDITOR.dtd.$block),{caption:1,
+td:1,th:1});CKEDITOR.dom.walker.editable=function(a){return function(b){return!!(a^(k(b)?0:b.type==CKEDITOR.NODE_TEXT||b.type==CKEDITOR.NODE_ELEMENT&&(b.is(CKEDITOR.dtd.$inline)||(b.is("hr")||b.getAttribute("contenteditable")=="false")||!CKEDITOR.env.needsBrFiller&&b.is(g)&&j(b))?1:0))}};CKEDITOR.dom.element.prototype.getBogus=function(){var a=this;do a=a.getPreviousSourceNode();while(h(a)||i(a)||a.type==CKEDITOR.NODE_ELEMENT&&a.is(CKEDITOR.dtd.$inline)&&!a.is(CKEDITOR.dtd.$empty));return a&&(CKEDITOR.env.needsBrFiller?
+a.is&&a.is("br"):a.getText&&d.test(a.getText()))?a:false}}(),CKEDITOR.dom.range=function(a){this.endOffset=this.endContainer=this.startOffset=this.startContainer=null;this.collapsed=true;var e=a instanceof CKEDITOR.dom.document;this.document=e?a:a.getDocument();this.root=e?a.getBody():a},function(){function a(a){a.collapsed=a.startContainer&&a.endContainer&&a.startContainer.equals(a.endContainer)&&a.startOffset==a.endOffset}function e(a,b,c,d,f){function e(a,b,c,g){var d=c?a.getPrevious():a.getNext();
+if(g&&k)return d;if(u||g)b.append(a.clone(true,f),c);else{a.remove();h&&b.append(a)}return d}function i(){var a,b,c,g=Math.min(E.length,G.length);for(a=0;a<g;a++){b=E[a];c=G[a];if(!b.equals(c))return a}return a-1}function j(){var b=L-1,c=A&&D&&!x.equals(v);if(b<J-1||b<P-1||c){c?a.moveToPosition(v,CKEDITOR.POSITION_BEFORE_START):P==b+1&&B?a.moveToPosition(G[b],CKEDITOR.POSITION_BEFORE_END):a.moveToPosition(G[b+1],CKEDITOR.POSITION_BEFORE_START);if(d)if((b=E[b+1])&&b.type==CKEDITOR.NODE_ELEMENT){c=
+CKEDITOR.dom.element.createFromHtml('<span data-cke-bookmark="1" style="display:none">&nbsp;</span>',a.document);c.insertAfter(b);b.mergeSiblings(false);a.moveToBookmark({startNode:c})}}else a.collapse(true)}a.optimizeBookmark();var k=b===0,h=b==1,u=b==2,b=u||h,x=a.startContainer,v=a.endContainer,s=a.startOffset,y=a.endOffset,z,B,A,D,C,H;if(u&&v.type==CKEDITOR.NODE_TEXT&&x.equals(v)){x=a.document.createText(x.substring(s,y));c.append(x)}else{if(v.type==CKEDITOR.NODE_TEXT)u?H=true:v=v.split(y);else if(v.getChildCount()>
+0)if(y>=v.getChildCount()){v=v.getChild(y-1);B=true}else v=v.getChild(y);else D=B=true;if(x.type==CKEDITOR.NODE_TEXT)u?C=true:x.split(s);else if(x.getChildCount()>0)if(s===0){x=x.getChild(s);z=true}else x=x.getChild(s-1);else A=z=true;for(var E=x.getParents(),G=v.getParents(),L=i(),J=E.length-1,P=G.length-1,I=c,R,T,X,da=-1,S=L;S<=J;S++){T=E[S];X=T.getNext();for(S==J&&!(T.equals(G[S])&&J<P)?z?e(T,I,false,A):C&&I.append(a.document.createText(T.substring(s))):b&&(R=I.append(T.clone(0,f)));X;){if(X.equals(G[S])){da=
+S;break}X=e(X,I)}I=R}I=c;for(S=L;S<=P;S++){c=G[S];X=c.getPrevious();if(c.equals(E[S]))b&&(I=I.getChild(0));else{S==P&&!(c.equals(E[S])&&P<J)?B?e(c,I,false,D):H&&I.append(a.document.createText(c.substring(0,y))):b&&(R=I.append(c.clone(0,f)));if(S>da)for(;X;)X=e(X,I,true);I=R}}u||j()}}function b(){var a=false,b=CKEDITOR.dom.walker.whitespaces(),c=CKEDITOR.dom.walker.bookmark(true),d=CKEDITOR.dom.walker.bogus();return function(f){if(c(f)||b(f))return true;if(d(f)&&!a)return a=true;return f.type==CKEDITOR.NODE_TEXT&&
+(f.hasAscendant("pre")||CKEDITOR.tools.trim(f.getText()).length)||f.type==CKEDITOR.NODE_ELEMENT&&!f.is(i)?false:true}}function c(a){var b=CKEDITOR.dom.walker.whitespaces(),c=CKEDITOR.dom.walker.bookmark(1);return function(d){return c(d)||b(d)?true:!a&&h(d)||d.type==CKEDITOR.NODE_ELEMENT&&d.is(CKEDITOR.dtd.$removeEmpty)}}function d(a){return function(){var b;return this[a?"getPreviousNode":"getNextNode"](function(a){!b&&j(a)&&(b=a);return k(a)&&!(h(a)&&a.equals(b))})}}var i={abbr:1,acronym:1,b:1,bdo:1,
+big:1,cite:1,code:1,del:1,dfn:1,em:1,font:1,i:1,ins:1,label:1,kbd:1,q:1,samp:1,small:1,span:1,strike:1,strong:1,sub:1,sup:1,tt:1,u:1,"var":1},h=CKEDITOR.dom.walker.bogus(),f=/^[\t\r\n ]*(?:&nbsp;|\xa0)$/,k=CKEDITOR.dom.walker.editable(),j=CKEDITOR.dom.walker.ignored(true);CKEDITOR.dom.range.prototype={clone:function(){var a=new CKEDITOR.dom.range(this.root);a._setStartContainer(this.startContainer);a.startOffset=this.startOffset;a._setEndContainer(this.endContainer);a.endOffset=this.endOffset;a.collapsed=
+this.collapsed;return a},collapse:function(a){if(a){this._setEndContainer(this.startContainer);this.endOffset=this.startOffset}else{this._setStartContainer(this.endContainer);this.startOffset=this.endOffset}this.collapsed=true},cloneContents:function(a){var b=new CKEDITOR.dom.documentFragment(this.document);this.collapsed||e(this,2,b,false,typeof a=="undefined"?true:a);return b},deleteContents:function(a){this.collapsed||e(this,0,null,a)},extractContents:function(a,b){var c=new CKEDITOR.dom.documentFragment(this.document);
+this.collapsed||e(this,1,c,a,typeof b=="undefined"?true:b);return c},createBookmark:function(a){var b,c,d,f,e=this.collapsed;b=this.document.createElement("span");b.data("cke-bookmark",1);b.setStyle("display","none");b.setHtml("&nbsp;");if(a){d="cke_bm_"+CKEDITOR.tools.getNextNumber();b.setAttribute("id",d+(e?"C":"S"))}if(!e){c=b.clone();c.setHtml("&nbsp;");a&&c.setAttribute("id",d+"E");f=this.clone();f.collapse();f.insertNode(c)}f=this.clone();f.collapse(true);f.insertNode(b);if(c){this.setStartAfter(b);
+this.setEndBefore(c)}else this.moveToPosition(b,CKEDITOR.POSITION_AFTER_END);return{startNode:a?d+(e?"C":"S"):b,endNode:a?d+"E":c,serializable:a,collapsed:e}},createBookmark2:function(){function a(c){var g=c.container,d=c.offset,f;f=g;var e=d;f=f.type!=CKEDITOR.NODE_ELEMENT||e===0||e==f.getChildCount()?0:f.getChild(e-1).type==CKEDITOR.NODE_TEXT&&f.getChild(e).type==CKEDITOR.NODE_TEXT;if(f){g=g.getChild(d-1);d=g.getLength()}g.type==CKEDITOR.NODE_ELEMENT&&d>1&&(d=g.getChild(d-1).getIndex(true)+1);if(g.type==
+CKEDITOR.NODE_TEXT){f=g;for(e=0;(f=f.getPrevious())&&f.type==CKEDITOR.NODE_TEXT;)e=e+f.getLength();f=e;if(g.getText())d=d+f;else{e=g.getPrevious(b);if(f){d=f;g=e?e.getNext():g.getParent().getFirst()}else{g=g.getParent();d=e?e.getIndex(true)+1:0}}}c.container=g;c.offset=d}var b=CKEDITOR.dom.walker.nodeType(CKEDITOR.NODE_TEXT,true);return function(b){var c=this.collapsed,d={container:this.startContainer,offset:this.startOffset},f={container:this.endContainer,offset:this.endOffset};if(b){a(d);c||a(f)}return{start:d.container.getAddress(b),
+end:c?null:f.container.getAddress(b),startOffset:d.offset,endOffset:f.offset,normalized:b,collapsed:c,is2:true}}}(),moveToBookmark:function(a){if(a.is2){var b=this.document.getByAddress(a.start,a.normalized),c=a.startOffset,d=a.end&&this.document.getByAddress(a.end,a.normalized),a=a.endOffset;this.setStart(b,c);d?this.setEnd(d,a):this.collapse(true)}else{b=(c=a.serializable)?this.document.getById(a.startNode):a.startNode;a=c?this.document.getById(a.endNode):a.endNode;this.setStartBefore(b);b.remove();
+if(a){this.setEndBefore(a);a.remove()}else this.collapse(true)}},getBoundaryNodes:function(){var a=this.startContainer,b=this.endContainer,c=this.startOffset,d=this.endOffset,f;if(a.type==CKEDITOR.NODE_ELEMENT){f=a.getChildCount();if(f>c)a=a.getChild(c);else if(f<1)a=a.getPreviousSourceNode();else{for(a=a.$;a.lastChild;)a=a.lastChild;a=new CKEDITOR.dom.node(a);a=a.getNextSourceNode()||a}}if(b.type==CKEDITOR.NODE_ELEMENT){f=b.getChildCount();if(f>d)b=b.getChild(d).getPreviousSourceNode(true);else if(f<
+1)b=b.getPreviousSourceNode();else{for(b=b.$;b.lastChild;)b=b.lastChild;b=new CKEDITOR.dom.node(b)}}a.getPosition(b)&CKEDITOR.POSITION_FOLLOWING&&(a=b);return{startNode:a,endNode:b}},getCommonAncestor:function(a,b){var c=this.startContainer,d=this.endContainer,c=c.equals(d)?a&&c.type==CKEDITOR.NODE_ELEMENT&&this.startOffset==this.endOffset-1?c.getChild(this.startOffset):c:c.getCommonAncestor(d);return b&&!c.is?c.getParent():c},optimize:function(){var a=this.startContainer,b=this.startOffset;a.type!=
+CKEDITOR.NODE_ELEMENT&&(b?b>=a.getLength()&&this.setStartAfter(a):this.setStartBefore(a));a=this.endContainer;b=this.endOffset;a.type!=CKEDITOR.NODE_ELEMENT&&(b?b>=a.getLength()&&this.setEndAfter(a):this.setEndBefore(a))},optimizeBookmark:function(){var a=this.startContainer,b=this.endContainer;a.is&&(a.is("span")&&a.data("cke-bookmark"))&&this.setStartAt(a,CKEDITOR.POSITION_BEFORE_START);b&&(b.is&&b.is("span")&&b.data("cke-bookmark"))&&this.setEndAt(b,CKEDITOR.POSITION_AFTER_END)},trim:function(a,
+b){var c=this.startContainer,d=this.startOffset,f=this.collapsed;if((!a||f)&&c&&c.type==CKEDITOR.NODE_TEXT){if(d)if(d>=c.getLength()){d=c.getIndex()+1;c=c.getParent()}else{var e=c.split(d),d=c.getIndex()+1,c=c.getParent();if(this.startContainer.equals(this.endContainer))this.setEnd(e,this.endOffset-this.startOffset);else if(c.equals(this.endContainer))this.endOffset=this.endOffset+1}else{d=c.getIndex();c=c.getParent()}this.setStart(c,d);if(f){this.collapse(true);return}}c=this.endContainer;d=this.endOffset;
+if(!b&&!f&&c&&c.type==CKEDITOR.NODE_TEXT){if(d){d>=c.getLength()||c.split(d);d=c.getIndex()+1}else d=c.getIndex();c=c.getParent();this.setEnd(c,d)}},enlarge:function(a,b){function c(a){return a&&a.type==CKEDITOR.NODE_ELEMENT&&a.hasAttribute("contenteditable")?null:a}var d=RegExp(/[^\s\ufeff]/);switch(a){case CKEDITOR.ENLARGE_INLINE:var f=1;case CKEDITOR.ENLARGE_ELEMENT:if(this.collapsed)break;var e=this.getCommonAncestor(),i=this.root,j,k,h,u,x,v=false,s,y;s=this.startContainer;var z=this.startOffset;
+if(s.type==CKEDITOR.NODE_TEXT){if(z){s=!CKEDITOR.tools.trim(s.substring(0,z)).length&&s;v=!!s}if(s&&!(u=s.getPrevious()))h=s.getParent()}else{z&&(u=s.getChild(z-1)||s.getLast());u||(h=s)}for(h=c(h);h||u;){if(h&&!u){!x&&h.equals(e)&&(x=true);if(f?h.isBlockBoundary():!i.contains(h))break;if(!v||h.getComputedStyle("display")!="inline"){v=false;x?j=h:this.setStartBefore(h)}u=h.getPrevious()}for(;u;){s=false;if(u.type==CKEDITOR.NODE_COMMENT)u=u.getPrevious();else{if(u.type==CKEDITOR.NODE_TEXT){y=u.getText();
+d.test(y)&&(u=null);s=/[\s\ufeff]$/.test(y)}else if((u.$.offsetWidth>(CKEDITOR.env.webkit?1:0)||b&&u.is("br"))&&!u.data("cke-bookmark"))if(v&&CKEDITOR.dtd.$removeEmpty[u.getName()]){y=u.getText();if(d.test(y))u=null;else for(var z=u.$.getElementsByTagName("*"),B=0,A;A=z[B++];)if(!CKEDITOR.dtd.$removeEmpty[A.nodeName.toLowerCase()]){u=null;break}u&&(s=!!y.length)}else u=null;s&&(v?x?j=h:h&&this.setStartBefore(h):v=true);if(u){s=u.getPrevious();if(!h&&!s){h=u;u=null;break}u=s}else h=null}}h&&(h=c(h.getParent()))}s=
+this.endContainer;z=this.endOffset;h=u=null;x=v=false;var D=function(a,b){var c=new CKEDITOR.dom.range(i);c.setStart(a,b);c.setEndAt(i,CKEDITOR.POSITION_BEFORE_END);var c=new CKEDITOR.dom.walker(c),g;for(c.guard=function(a){return!(a.type==CKEDITOR.NODE_ELEMENT&&a.isBlockBoundary())};g=c.next();){if(g.type!=CKEDITOR.NODE_TEXT)return false;y=g!=a?g.getText():g.substring(b);if(d.test(y))return false}return true};if(s.type==CKEDITOR.NODE_TEXT)if(CKEDITOR.tools.trim(s.substring(z)).length)v=true;else{v=
+!s.getLength();if(z==s.getLength()){if(!(u=s.getNext()))h=s.getParent()}else D(s,z)&&(h=s.getParent())}else(u=s.getChild(z))||(h=s);for(;h||u;){if(h&&!u){!x&&h.equals(e)&&(x=true);if(f?h.isBlockBoundary():!i.contains(h))break;if(!v||h.getComputedStyle("display")!="inline"){v=false;x?k=h:h&&this.setEndAfter(h)}u=h.getNext()}for(;u;){s=false;if(u.type==CKEDITOR.NODE_TEXT){y=u.getText();D(u,0)||(u=null);s=/^[\s\ufeff]/.test(y)}else if(u.type==CKEDITOR.NODE_ELEMENT){if((u.$.offsetWidth>0||b&&u.is("br"))&&
+!u.data("cke-bookmark"))if(v&&CKEDITOR.dtd.$removeEmpty[u.getName()]){y=u.getText();if(d.test(y))u=null;else{z=u.$.getElementsByTagName("*");for(B=0;A=z[B++];)if(!CKEDITOR.dtd.$removeEmpty[A.nodeName.toLowerCase()]){u=null;break}}u&&(s=!!y.length)}else u=null}else s=1;s&&v&&(x?k=h:this.setEndAfter(h));if(u){s=u.getNext();if(!h&&!s){h=u;u=null;break}u=s}else h=null}h&&(h=c(h.getParent()))}if(j&&k){e=j.contains(k)?k:j;this.setStartBefore(e);this.setEndAfter(e)}break;case CKEDITOR.ENLARGE_BLOCK_CONTENTS:case CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS:h=
+new CKEDITOR.dom.range(this.root);i=this.root;h.setStartAt(i,CKEDITOR.POSITION_AFTER_START);h.setEnd(this.startContainer,this.startOffset);h=new CKEDITOR.dom.walker(h);var C,H,E=CKEDITOR.dom.walker.blockBoundary(a==CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS?{br:1}:null),G=null,L=function(a){if(a.type==CKEDITOR.NODE_ELEMENT&&a.getAttribute("contenteditable")=="false")if(G){if(G.equals(a)){G=null;return}}else G=a;else if(G)return;var b=E(a);b||(C=a);return b},f=function(a){var b=L(a);!b&&(a.is&&a.is("br"))&&
+(H=a);return b};h.guard=L;h=h.lastBackward();C=C||i;this.setStartAt(C,!C.is("br")&&(!h&&this.checkStartOfBlock()||h&&C.contains(h))?CKEDITOR.POSITION_AFTER_START:CKEDITOR.POSITION_AFTER_END);if(a==CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS){h=this.clone();h=new CKEDITOR.dom.walker(h);var J=CKEDITOR.dom.walker.whitespaces(),P=CKEDITOR.dom.walker.bookmark();h.evaluator=function(a){return!J(a)&&!P(a)};if((h=h.previous())&&h.type==CKEDITOR.NODE_ELEMENT&&h.is("br"))break}h=this.clone();h.collapse();h.setEndAt(i,
+CKEDITOR.POSITION_BEFORE_END);h=new CKEDITOR.dom.walker(h);h.guard=a==CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS?f:L;C=G=H=null;h=h.lastForward();C=C||i;this.setEndAt(C,!h&&this.checkEndOfBlock()||h&&C.contains(h)?CKEDITOR.POSITION_BEFORE_END:CKEDITOR.POSITION_BEFORE_START);H&&this.setEndAfter(H)}},shrink:function(a,b,c){if(!this.collapsed){var a=a||CKEDITOR.SHRINK_TEXT,d=this.clone(),f=this.startContainer,e=this.endContainer,i=this.startOffset,j=this.endOffset,h=1,k=1;if(f&&f.type==CKEDITOR.NODE_TEXT)if(i)if(i>=
+f.getLength())d.setStartAfter(f);else{d.setStartBefore(f);h=0}else d.setStartBefore(f);if(e&&e.type==CKEDITOR.NODE_TEXT)if(j)if(j>=e.getLength())d.setEndAfter(e);else{d.setEndAfter(e);k=0}else d.setEndBefore(e);var d=new CKEDITOR.dom.walker(d),u=CKEDITOR.dom.walker.bookmark();d.evaluator=function(b){return b.type==(a==CKEDITOR.SHRINK_ELEMENT?CKEDITOR.NODE_ELEMENT:CKEDITOR.NODE_TEXT)};var x;d.guard=function(b,d){if(u(b))return true;if(a==CKEDITOR.SHRINK_ELEMENT&&b.type==CKEDITOR.NODE_TEXT||d&&b.equals(x)||
+c===false&&b.type==CKEDITOR.NODE_ELEMENT&&b.isBlockBoundary()||b.type==CKEDITOR.NODE_ELEMENT&&b.hasAttribute("contenteditable"))return false;!d&&b.type==CKEDITOR.NODE_ELEMENT&&(x=b);return true};if(h)(f=d[a==CKEDITOR.SHRINK_ELEMENT?"lastForward":"next"]())&&this.setStartAt(f,b?CKEDITOR.POSITION_AFTER_START:CKEDITOR.POSITION_BEFORE_START);if(k){d.reset();(d=d[a==CKEDITOR.SHRINK_ELEMENT?"lastBackward":"previous"]())&&this.setEndAt(d,b?CKEDITOR.POSITION_BEFORE_END:CKEDITOR.POSITION_AFTER_END)}return!(!h&&
+!k)}},insertNode:function(a){this.optimizeBookmark();this.trim(false,true);var b=this.startContainer,c=b.getChild(this.startOffset);c?a.insertBefore(c):b.append(a);a.getParent()&&a.getParent().equals(this.endContainer)&&this.endOffset++;this.setStartBefore(a)},moveToPosition:function(a,b){this.setStartAt(a,b);this.collapse(true)},moveToRange:function(a){this.setStart(a.startContainer,a.startOffset);this.setEnd(a.endContainer,a.endOffset)},selectNodeContents:function(a){this.setStart(a,0);this.setEnd(a,
+a.type==CKEDITOR.NODE_TEXT?a.getLength():a.getChildCount())},setStart:function(b,c){if(b.type==CKEDITOR.NODE_ELEMENT&&CKEDITOR.dtd.$empty[b.getName()]){c=b.getIndex();b=b.getParent()}this._setStartContainer(b);this.startOffset=c;if(!this.endContainer){this._setEndContainer(b);this.endOffset=c}a(this)},setEnd:function(b,c){if(b.type==CKEDITOR.NODE_ELEMENT&&CKEDITOR.dtd.$empty[b.getName()]){c=b.getIndex()+1;b=b.getParent()}this._setEndContainer(b);this.endOffset=c;if(!this.startContainer){this._setStartContainer(b);
+this.startOffset=c}a(this)},setStartAfter:function(a){this.setStart(a.getParent(),a.getIndex()+1)},setStartBefore:function(a){this.setStart(a.getParent(),a.getIndex())},setEndAfter:function(a){this.setEnd(a.getParent(),a.getIndex()+1)},setEndBefore:function(a){this.setEnd(a.getParent(),a.getIndex())},setStartAt:function(b,c){switch(c){case CKEDITOR.POSITION_AFTER_START:this.setStart(b,0);break;case CKEDITOR.POSITION_BEFORE_END:b.type==CKEDITOR.NODE_TEXT?this.setStart(b,b.getLength()):this.setStart(b,
+b.getChildCount());break;case CKEDITOR.POSITION_BEFORE_START:this.setStartBefore(b);break;case CKEDITOR.POSITION_AFTER_END:this.setStartAfter(b)}a(this)},setEndAt:function(b,c){switch(c){case CKEDITOR.POSITION_AFTER_START:this.setEnd(b,0);break;case CKEDITOR.POSITION_BEFORE_END:b.type==CKEDITOR.NODE_TEXT?this.setEnd(b,b.getLength()):this.setEnd(b,b.getChildCount());break;case CKEDITOR.POSITION_BEFORE_START:this.setEndBefore(b);break;case CKEDITOR.POSITION_AFTER_END:this.setEndAfter(b)}a(this)},fixBlock:function(a,
+b){var c=this.createBookmark(),d=this.document.createElement(b);this.collapse(a);this.enlarge(CKEDITOR.ENLARGE_BLOCK_CONTENTS);this.extractContents().appendTo(d);d.trim();this.insertNode(d);var f=d.getBogus();f&&f.remove();d.appendBogus();this.moveToBookmark(c);return d},splitBlock:function(a,b){var c=new CKEDITOR.dom.elementPath(this.startContainer,this.root),d=new CKEDITOR.dom.elementPath(this.endContainer,this.root),f=c.block,e=d.block,i=null;if(!c.blockLimit.equals(d.blockLimit))return null;if(a!=
+"br"){if(!f){f=this.fixBlock(true,a);e=(new CKEDITOR.dom.elementPath(this.endContainer,this.root)).block}e||(e=this.fixBlock(false,a))}c=f&&this.checkStartOfBlock();d=e&&this.checkEndOfBlock();this.deleteContents();if(f&&f.equals(e))if(d){i=new CKEDITOR.dom.elementPath(this.startContainer,this.root);this.moveToPosition(e,CKEDITOR.POSITION_AFTER_END);e=null}else if(c){i=new CKEDITOR.dom.elementPath(this.startContainer,this.root);this.moveToPosition(f,CKEDITOR.POSITION_BEFORE_START);f=null}else{e=this.splitElement(f,
+b||false);f.is("ul","ol")||f.appendBogus()}return{previousBlock:f,nextBlock:e,wasStartOfBlock:c,wasEndOfBlock:d,elementPath:i}},splitElement:function(a,b){if(!this.collapsed)return null;this.setEndAt(a,CKEDITOR.POSITION_BEFORE_END);var c=this.extractContents(false,b||false),d=a.clone(false,b||false);c.appendTo(d);d.insertAfter(a);this.moveToPosition(a,CKEDITOR.POSITION_AFTER_END);return d},removeEmptyBlocksAtEnd:function(){function a(d){return function(a){return b(a)||(c(a)||a.type==CKEDITOR.NODE_ELEMENT&&
+a.isEmptyInlineRemoveable())||d.is("table")&&a.is("caption")?false:true}}var b=CKEDITOR.dom.walker.whitespaces(),c=CKEDITOR.dom.walker.bookmark(false);return function(b){for(var c=this.createBookmark(),d=this[b?"endPath":"startPath"](),f=d.block||d.blockLimit,e;f&&!f.equals(d.root)&&!f.getFirst(a(f));){e=f.getParent();this[b?"setEndAt":"setStartAt"](f,CKEDITOR.POSITION_AFTER_END);f.remove(1);f=e}this.moveToBookmark(c)}}(),startPath:function(){return new CKEDITOR.dom.elementPath(this.startContainer,
+this.root)},endPath:function(){return new CKEDITOR.dom.elementPath(this.endContainer,this.root)},checkBoundaryOfElement:function(a,b){var d=b==CKEDITOR.START,f=this.clone();f.collapse(d);f[d?"setStartAt":"setEndAt"](a,d?CKEDITOR.POSITION_AFTER_START:CKEDITOR.POSITION_BEFORE_END);f=new CKEDITOR.dom.walker(f);f.evaluator=c(d);return f[d?"checkBackward":"checkForward"]()},checkStartOfBlock:function(){var a=this.startContainer,c=this.startOffset;if(CKEDITOR.env.ie&&c&&a.type==CKEDITOR.NODE_TEXT){a=CKEDITOR.tools.ltrim(a.substring(0,
+c));f.test(a)&&this.trim(0,1)}this.trim();a=new CKEDITOR.dom.elementPath(this.startContainer,this.root);c=this.clone();c.collapse(true);c.setStartAt(a.block||a.blockLimit,CKEDITOR.POSITION_AFTER_START);a=new CKEDITOR.dom.walker(c);a.evaluator=b();return a.checkBackward()},checkEndOfBlock:function(){var a=this.endContainer,c=this.endOffset;if(CKEDITOR.env.ie&&a.type==CKEDITOR.NODE_TEXT){a=CKEDITOR.tools.rtrim(a.substring(c));f.test(a)&&this.trim(1,0)}this.trim();a=new CKEDITOR.dom.elementPath(this.endContainer,
+this.root);c=this.clone();c.collapse(false);c.setEndAt(a.block||a.blockLimit,CKEDITOR.POSITION_BEFORE_END);a=new CKEDITOR.dom.walker(c);a.evaluator=b();return a.checkForward()},getPreviousNode:function(a,b,c){var d=this.clone();d.collapse(1);d.setStartAt(c||this.root,CKEDITOR.POSITION_AFTER_START);c=new CKEDITOR.dom.walker(d);c.evaluator=a;c.guard=b;return c.previous()},getNextNode:function(a,b,c){var d=this.clone();d.collapse();d.setEndAt(c||this.root,CKEDITOR.POSITION_BEFORE_END);c=new CKEDITOR.dom.walker(d);
+c.evaluator=a;c.guard=b;return c.next()},checkReadOnly:function(){function a(b,c){for(;b;){if(b.type==CKEDITOR.NODE_ELEMENT){if(b.getAttribute("contentEditable")=="false"&&!b.data("cke-editable"))return 0;if(b.is("html")||b.getAttribute("contentEditable")=="true"&&(b.contains(c)||b.equals(c)))break}b=b.getParent()}return 1}return function(){var b=this.startContainer,c=this.endContainer;return!(a(b,c)&&a(c,b))}}(),moveToElementEditablePosition:function(a,b){if(a.type==CKEDITOR.NODE_ELEMENT&&!a.isEditable(false)){this.moveToPosition(a,
+b?CKEDITOR.POSITION_AFTER_END:CKEDITOR.POSITION_BEFORE_START);return true}for(var c=0;a;){if(a.type==CKEDITOR.NODE_TEXT){b&&this.endContainer&&this.checkEndOfBlock()&&f.test(a.getText())?this.moveToPosition(a,CKEDITOR.POSITION_BEFORE_START):this.moveToPosition(a,b?CKEDITOR.POSITION_AFTER_END:CKEDITOR.POSITION_BEFORE_START);c=1;break}if(a.type==CKEDITOR.NODE_ELEMENT)if(a.isEditable()){this.moveToPosition(a,b?CKEDITOR.POSITION_BEFORE_END:CKEDITOR.POSITION_AFTER_START);c=1}else if(b&&a.is("br")&&this.endContainer&&
+this.checkEndOfBlock())this.moveToPosition(a,CKEDITOR.POSITION_BEFORE_START);else if(a.getAttribute("contenteditable")=="false"&&a.is(CKEDITOR.dtd.$block)){this.setStartBefore(a);this.setEndAfter(a);return true}var d=a,e=c,i=void 0;d.type==CKEDITOR.NODE_ELEMENT&&d.isEditable(false)&&(i=d[b?"getLast":"getFirst"](j));!e&&!i&&(i=d[b?"getPrevious":"getNext"](j));a=i}return!!c},moveToClosestEditablePosition:function(a,b){var c,d=0,f,e,i=[CKEDITOR.POSITION_AFTER_END,CKEDITOR.POSITION_BEFORE_START];if(a){c=
+new CKEDITOR.dom.range(this.root);c.moveToPosition(a,i[b?0:1])}else c=this.clone();if(a&&!a.is(CKEDITOR.dtd.$block))d=1;else if(f=c[b?"getNextEditableNode":"getPreviousEditableNode"]()){d=1;if((e=f.type==CKEDITOR.NODE_ELEMENT)&&f.is(CKEDITOR.dtd.$block)&&f.getAttribute("contenteditable")=="false"){c.setStartAt(f,CKEDITOR.POSITION_BEFORE_START);c.setEndAt(f,CKEDITOR.POSITION_AFTER_END)}else if(!CKEDITOR.env.needsBrFiller&&e&&f.is(CKEDITOR.dom.walker.validEmptyBlockContainers)){c.setEnd(f,0);c.collapse()}else c.moveToPosition(f,
+i[b?1:0])}d&&this.moveToRange(c);return!!d},moveToElementEditStart:function(a){return this.moveToElementEditablePosition(a)},moveToElementEditEnd:function(a){return this.moveToElementEditablePosition(a,true)},getEnclosedNode:function(){var a=this.clone();a.optimize();if(a.startContainer.type!=CKEDITOR.NODE_ELEMENT||a.endContainer.type!=CKEDITOR.NODE_ELEMENT)return null;var a=new CKEDITOR.dom.walker(a),b=CKEDITOR.dom.walker.bookmark(false,true),c=CKEDITOR.dom.walker.whitespaces(true);a.evaluator=function(a){return c(a)&&
+b(a)};var d=a.next();a.reset();return d&&d.equals(a.previous())?d:null},getTouchedStartNode:function(){var a=this.startContainer;return this.collapsed||a.type!=CKEDITOR.NODE_ELEMENT?a:a.getChild(this.startOffset)||a},getTouchedEndNode:function(){var a=this.endContainer;return this.collapsed||a.type!=CKEDITOR.NODE_ELEMENT?a:a.getChild(this.endOffset-1)||a},getNextEditableNode:d(),getPreviousEditableNode:d(1),scrollIntoView:function(){var a=new CKEDITOR.dom.element.createFromHtml("<span>&nbsp;</span>",
+this.document),b,c,d,f=this.clone();f.optimize();if(d=f.startContainer.type==CKEDITOR.NODE_TEXT){c=f.startContainer.getText();b=f.startContainer.split(f.startOffset);a.insertAfter(f.startContainer)}else f.insertNode(a);a.scrollIntoView();if(d){f.startContainer.setText(c);b.remove()}a.remove()},_setStartContainer:function(a){this.startContainer=a},_setEndContainer:function(a){this.endContainer=a}}}(),CKEDITOR.POSITION_AFTER_START=1,CKEDITOR.POSITION_BEFORE_END=2,CKEDITOR.POSITION_BEFORE_START=3,CKEDITOR.POSITION_AFTER_END=
+4,CKEDITOR.ENLARGE_ELEMENT=1,CKEDITOR.ENLARGE_BLOCK_CONTENTS=2,CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS=3,CKEDITOR.ENLARGE_INLINE=4,CKEDITOR.START=1,CKEDITOR.END=2,CKEDITOR.SHRINK_ELEMENT=1,CKEDITOR.SHRINK_TEXT=2,"use strict",function(){function a(a){if(!(arguments.length<1)){this.range=a;this.forceBrBreak=0;this.enlargeBr=1;this.enforceRealBlocks=0;this._||(this._={})}}function e(a){var b=[];a.forEach(function(a){if(a.getAttribute("contenteditable")=="true"){b.push(a);return false}},CKEDITOR.NODE_ELEMENT,
+true);return b}function b(a,c,d,f){a:{f==null&&(f=e(d));for(var i;i=f.shift();)if(i.getDtd().p){f={element:i,remaining:f};break a}f=null}if(!f)return 0;if((i=CKEDITOR.filter.instances[f.element.data("cke-filter")])&&!i.check(c))return b(a,c,d,f.remaining);c=new CKEDITOR.dom.range(f.element);c.selectNodeContents(f.element);c=c.createIterator();c.enlargeBr=a.enlargeBr;c.enforceRealBlocks=a.enforceRealBlocks;c.activeFilter=c.filter=i;a._.nestedEditable={element:f.element,container:d,remaining:f.remaining,
+iterator:c};return 1}function c(a,b,c){if(!b)return false;a=a.clone();a.collapse(!c);return a.checkBoundaryOfElement(b,c?CKEDITOR.START:CKEDITOR.END)}var d=/^[\r\n\t ]+$/,i=CKEDITOR.dom.walker.bookmark(false,true),h=CKEDITOR.dom.walker.whitespaces(true),f=function(a){return i(a)&&h(a)},k={dd:1,dt:1,li:1};a.prototype={getNextParagraph:function(a){var g,e,h,l,o,a=a||"p";if(this._.nestedEditable){if(g=this._.nestedEditable.iterator.getNextParagraph(a)){this.activeFilter=this._.nestedEditable.iterator.activeFilter;
+return g}this.activeFilter=this.filter;if(b(this,a,this._.nestedEditable.container,this._.nestedEditable.remaining)){this.activeFilter=this._.nestedEditable.iterator.activeFilter;return this._.nestedEditable.iterator.getNextParagraph(a)}this._.nestedEditable=null}if(!this.range.root.getDtd()[a])return null;if(!this._.started){var r=this.range.clone();e=r.startPath();var m=r.endPath(),p=!r.collapsed&&c(r,e.block),t=!r.collapsed&&c(r,m.block,1);r.shrink(CKEDITOR.SHRINK_ELEMENT,true);p&&r.setStartAt(e.block,
+CKEDITOR.POSITION_BEFORE_END);t&&r.setEndAt(m.block,CKEDITOR.POSITION_AFTER_START);e=r.endContainer.hasAscendant("pre",true)||r.startContainer.hasAscendant("pre",true);r.enlarge(this.forceBrBreak&&!e||!this.enlargeBr?CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS:CKEDITOR.ENLARGE_BLOCK_CONTENTS);if(!r.collapsed){e=new CKEDITOR.dom.walker(r.clone());m=CKEDITOR.dom.walker.bookmark(true,true);e.evaluator=m;this._.nextNode=e.next();e=new CKEDITOR.dom.walker(r.clone());e.evaluator=m;e=e.previous();this._.lastNode=
+e.getNextSourceNode(true,null,r.root);if(this._.lastNode&&this._.lastNode.type==CKEDITOR.NODE_TEXT&&!CKEDITOR.tools.trim(this._.lastNode.getText())&&this._.lastNode.getParent().isBlockBoundary()){m=this.range.clone();m.moveToPosition(this._.lastNode,CKEDITOR.POSITION_AFTER_END);if(m.checkEndOfBlock()){m=new CKEDITOR.dom.elementPath(m.endContainer,m.root);this._.lastNode=(m.block||m.blockLimit).getNextSourceNode(true)}}if(!this._.lastNode||!r.root.contains(this._.lastNode)){this._.lastNode=this._.docEndMarker=
+r.document.createText("");this._.lastNode.insertAfter(e)}r=null}this._.started=1;e=r}m=this._.nextNode;r=this._.lastNode;for(this._.nextNode=null;m;){var p=0,t=m.hasAscendant("pre"),w=m.type!=CKEDITOR.NODE_ELEMENT,u=0;if(w)m.type==CKEDITOR.NODE_TEXT&&d.test(m.getText())&&(w=0);else{var x=m.getName();if(CKEDITOR.dtd.$block[x]&&m.getAttribute("contenteditable")=="false"){g=m;b(this,a,g);break}else if(m.isBlockBoundary(this.forceBrBreak&&!t&&{br:1})){if(x=="br")w=1;else if(!e&&!m.getChildCount()&&x!=
+"hr"){g=m;h=m.equals(r);break}if(e){e.setEndAt(m,CKEDITOR.POSITION_BEFORE_START);if(x!="br")this._.nextNode=m}p=1}else{if(m.getFirst()){if(!e){e=this.range.clone();e.setStartAt(m,CKEDITOR.POSITION_BEFORE_START)}m=m.getFirst();continue}w=1}}if(w&&!e){e=this.range.clone();e.setStartAt(m,CKEDITOR.POSITION_BEFORE_START)}h=(!p||w)&&m.equals(r);if(e&&!p)for(;!m.getNext(f)&&!h;){x=m.getParent();if(x.isBlockBoundary(this.forceBrBreak&&!t&&{br:1})){p=1;w=0;h||x.equals(r);e.setEndAt(x,CKEDITOR.POSITION_BEFORE_END);
+break}m=x;w=1;h=m.equals(r);u=1}w&&e.setEndAt(m,CKEDITOR.POSITION_AFTER_END);m=this._getNextSourceNode(m,u,r);if((h=!m)||p&&e)break}if(!g){if(!e){this._.docEndMarker&&this._.docEndMarker.remove();return this._.nextNode=null}g=new CKEDITOR.dom.elementPath(e.startContainer,e.root);m=g.blockLimit;p={div:1,th:1,td:1};g=g.block;if(!g&&m&&!this.enforceRealBlocks&&p[m.getName()]&&e.checkStartOfBlock()&&e.checkEndOfBlock()&&!m.equals(e.root))g=m;else if(!g||this.enforceRealBlocks&&g.is(k)){g=this.range.document.createElement(a);
+e.extractContents().appendTo(g);g.trim();e.insertNode(g);l=o=true}else if(g.getName()!="li"){if(!e.checkStartOfBlock()||!e.checkEndOfBlock()){g=g.clone(false);e.extractContents().appendTo(g);g.trim();o=e.splitBlock();l=!o.wasStartOfBlock;o=!o.wasEndOfBlock;e.insertNode(g)}}else if(!h)this._.nextNode=g.equals(r)?null:this._getNextSourceNode(e.getBoundaryNodes().endNode,1,r)}if(l)(l=g.getPrevious())&&l.type==CKEDITOR.NODE_ELEMENT&&(l.getName()=="br"?l.remove():l.getLast()&&l.getLast().$.nodeName.toLowerCase()==
+"br"&&l.getLast().remove());if(o)(l=g.getLast())&&l.type==CKEDITOR.NODE_ELEMENT&&l.getName()=="br"&&(!CKEDITOR.env.needsBrFiller||l.getPrevious(i)||l.getNext(i))&&l.remove();if(!this._.nextNode)this._.nextNode=h||g.equals(r)||!r?null:this._getNextSourceNode(g,1,r);return g},_getNextSourceNode:function(a,b,c){function d(a){return!(a.equals(c)||a.equals(f))}for(var f=this.range.root,a=a.getNextSourceNode(b,null,d);!i(a);)a=a.getNextSourceNode(b,null,d);return a}};CKEDITOR.dom.range.prototype.createIterator=
+function(){return new a(this)}}(),CKEDITOR.command=function(a,e){this.uiItems=[];this.exec=function(b){if(this.state==CKEDITOR.TRISTATE_DISABLED||!this.checkAllowed())return false;this.editorFocus&&a.focus();return this.fire("exec")===false?true:e.exec.call(this,a,b)!==false};this.refresh=function(a,b){if(!this.readOnly&&a.readOnly)return true;if(this.context&&!b.isContextFor(this.context)){this.disable();return true}if(!this.checkAllowed(true)){this.disable();return true}this.startDisabled||this.enable();
+this.modes&&!this.modes[a.mode]&&this.disable();return this.fire("refresh",{editor:a,path:b})===false?true:e.refresh&&e.refresh.apply(this,arguments)!==false};var b;this.checkAllowed=function(c){return!c&&typeof b=="boolean"?b:b=a.activeFilter.checkFeature(this)};CKEDITOR.tools.extend(this,e,{modes:{wysiwyg:1},editorFocus:1,contextSensitive:!!e.context,state:CKEDITOR.TRISTATE_DISABLED});CKEDITOR.event.call(this)},CKEDITOR.command.prototype={enable:function(){this.state==CKEDITOR.TRISTATE_DISABLED&&
+this.checkAllowed()&&this.setState(!this.preserveState||typeof this.previousState=="undefined"?CKEDITOR.TRISTATE_OFF:this.previousState)},disable:function(){this.setState(CKEDITOR.TRISTATE_DISABLED)},setState:function(a){if(this.state==a||a!=CKEDITOR.TRISTATE_DISABLED&&!this.checkAllowed())return false;this.previousState=this.state;this.state=a;this.fire("state");return true},toggleState:function(){this.state==CKEDITOR.TRISTATE_OFF?this.setState(CKEDITOR.TRISTATE_ON):this.state==CKEDITOR.TRISTATE_ON&&
+this.setState(CKEDITOR.TRISTATE_OFF)}},CKEDITOR.event.implementOn(CKEDITOR.command.prototype),CKEDITOR.ENTER_P=1,CKEDITOR.ENTER_BR=2,CKEDITOR.ENTER_DIV=3,CKEDITOR.config={customConfig:"config.js",autoUpdateElement:!0,language:"",defaultLanguage:"en",contentsLangDirection:"",enterMode:CKEDITOR.ENTER_P,forceEnterMode:!1,shiftEnterMode:CKEDITOR.ENTER_BR,docType:"<!DOCTYPE html>",bodyId:"",bodyClass:"",fullPage:!1,height:200,extraPlugins:"",removePlugins:"",protectedSource:[],tabIndex:0,width:"",baseFloatZIndex:1E4,
+blockedKeystrokes:[CKEDITOR.CTRL+66,CKEDITOR.CTRL+73,CKEDITOR.CTRL+85]},function(){function a(a,b,c,d,f){var e,g,a=[];for(e in b){g=b[e];g=typeof g=="boolean"?{}:typeof g=="function"?{match:g}:D(g);if(e.charAt(0)!="$")g.elements=e;if(c)g.featureName=c.toLowerCase();var i=g;i.elements=h(i.elements,/\s+/)||null;i.propertiesOnly=i.propertiesOnly||i.elements===true;var j=/\s*,\s*/,k=void 0;for(k in G){i[k]=h(i[k],j)||null;var o=i,v=L[k],m=h(i[L[k]],j),r=i[k],n=[],s=true,E=void 0;m?s=false:m={};for(E in r)if(E.charAt(0)==
+"!"){E=E.slice(1);n.push(E);m[E]=true;s=false}for(;E=n.pop();){r[E]=r["!"+E];delete r["!"+E]}o[v]=(s?false:m)||null}i.match=i.match||null;d.push(g);a.push(g)}for(var b=f.elements,f=f.generic,l,c=0,d=a.length;c<d;++c){e=D(a[c]);g=e.classes===true||e.styles===true||e.attributes===true;i=e;k=v=j=void 0;for(j in G)i[j]=p(i[j]);o=true;for(k in L){j=L[k];v=i[j];m=[];r=void 0;for(r in v)r.indexOf("*")>-1?m.push(RegExp("^"+r.replace(/\*/g,".*")+"$")):m.push(r);v=m;if(v.length){i[j]=v;o=false}}i.nothingRequired=
+o;i.noProperties=!(i.attributes||i.classes||i.styles);if(e.elements===true||e.elements===null)f[g?"unshift":"push"](e);else{i=e.elements;delete e.elements;for(l in i)if(b[l])b[l][g?"unshift":"push"](e);else b[l]=[e]}}}function e(a,c,d,e){if(!a.match||a.match(c))if(e||f(a,c)){if(!a.propertiesOnly)d.valid=true;if(!d.allAttributes)d.allAttributes=b(a.attributes,c.attributes,d.validAttributes);if(!d.allStyles)d.allStyles=b(a.styles,c.styles,d.validStyles);if(!d.allClasses){a=a.classes;c=c.classes;e=d.validClasses;
+if(a)if(a===true)a=true;else{for(var g=0,i=c.length,j;g<i;++g){j=c[g];e[j]||(e[j]=a(j))}a=false}else a=false;d.allClasses=a}}}function b(a,b,c){if(!a)return false;if(a===true)return true;for(var d in b)c[d]||(c[d]=a(d));return false}function c(a,b,c){if(!a.match||a.match(b)){if(a.noProperties)return false;c.hadInvalidAttribute=d(a.attributes,b.attributes)||c.hadInvalidAttribute;c.hadInvalidStyle=d(a.styles,b.styles)||c.hadInvalidStyle;a=a.classes;b=b.classes;if(a){for(var f=false,e=a===true,g=b.length;g--;)if(e||
+a(b[g])){b.splice(g,1);f=true}a=f}else a=false;c.hadInvalidClass=a||c.hadInvalidClass}}function d(a,b){if(!a)return false;var c=false,d=a===true,f;for(f in b)if(d||a(f)){delete b[f];c=true}return c}function i(a,b,c){if(a.disabled||a.customConfig&&!c||!b)return false;a._.cachedChecks={};return true}function h(a,b){if(!a)return false;if(a===true)return a;if(typeof a=="string"){a=C(a);return a=="*"?true:CKEDITOR.tools.convertArrayToObject(a.split(b))}if(CKEDITOR.tools.isArray(a))return a.length?CKEDITOR.tools.convertArrayToObject(a):
+false;var c={},d=0,f;for(f in a){c[f]=a[f];d++}return d?c:false}function f(a,b){if(a.nothingRequired)return true;var c,d,f,e;if(f=a.requiredClasses){e=b.classes;for(c=0;c<f.length;++c){d=f[c];if(typeof d=="string"){if(CKEDITOR.tools.indexOf(e,d)==-1)return false}else if(!CKEDITOR.tools.checkIfAnyArrayItemMatches(e,d))return false}}return k(b.styles,a.requiredStyles)&&k(b.attributes,a.requiredAttributes)}function k(a,b){if(!b)return true;for(var c=0,d;c<b.length;++c){d=b[c];if(typeof d=="string"){if(!(d in
+a))return false}else if(!CKEDITOR.tools.checkIfAnyObjectPropertyMatches(a,d))return false}return true}function j(a){if(!a)return{};for(var a=a.split(/\s*,\s*/).sort(),b={};a.length;)b[a.shift()]=H;return b}function g(a){for(var b,c,d,f,e={},g=1,a=C(a);b=a.match(J);){if(c=b[2]){d=n(c,"styles");f=n(c,"attrs");c=n(c,"classes")}else d=f=c=null;e["$"+g++]={elements:b[1],classes:c,styles:d,attributes:f};a=a.slice(b[0].length)}return e}function n(a,b){var c=a.match(P[b]);return c?C(c[1]):null}function q(a){var b=
+a.styleBackup=a.attributes.style,c=a.classBackup=a.attributes["class"];if(!a.styles)a.styles=CKEDITOR.tools.parseCssText(b||"",1);if(!a.classes)a.classes=c?c.split(/\s+/):[]}function l(a,b,d,f){var g=0,i;if(f.toHtml)b.name=b.name.replace(I,"$1");if(f.doCallbacks&&a.elementCallbacks){a:for(var j=a.elementCallbacks,h=0,k=j.length,o;h<k;++h)if(o=j[h](b)){i=o;break a}if(i)return i}if(f.doTransform)if(i=a._.transformations[b.name]){q(b);for(j=0;j<i.length;++j)x(a,b,i[j]);r(b)}if(f.doFilter){a:{j=b.name;
+h=a._;a=h.allowedRules.elements[j];i=h.allowedRules.generic;j=h.disallowedRules.elements[j];h=h.disallowedRules.generic;k=f.skipRequired;o={valid:false,validAttributes:{},validClasses:{},validStyles:{},allAttributes:false,allClasses:false,allStyles:false,hadInvalidAttribute:false,hadInvalidClass:false,hadInvalidStyle:false};var v,p;if(!a&&!i)a=null;else{q(b);if(j){v=0;for(p=j.length;v<p;++v)if(c(j[v],b,o)===false){a=null;break a}}if(h){v=0;for(p=h.length;v<p;++v)c(h[v],b,o)}if(a){v=0;for(p=a.length;v<
+p;++v)e(a[v],b,o,k)}if(i){v=0;for(p=i.length;v<p;++v)e(i[v],b,o,k)}a=o}}if(!a){d.push(b);return A}if(!a.valid){d.push(b);return A}p=a.validAttributes;var n=a.validStyles;i=a.validClasses;var j=b.attributes,E=b.styles,h=b.classes,k=b.classBackup,s=b.styleBackup,l,u,G=[];o=[];var t=/^data-cke-/;v=false;delete j.style;delete j["class"];delete b.classBackup;delete b.styleBackup;if(!a.allAttributes)for(l in j)if(!p[l])if(t.test(l)){if(l!=(u=l.replace(/^data-cke-saved-/,""))&&!p[u]){delete j[l];v=true}}else{delete j[l];
+v=true}if(!a.allStyles||a.hadInvalidStyle){for(l in E)a.allStyles||n[l]?G.push(l+":"+E[l]):v=true;if(G.length)j.style=G.sort().join("; ")}else if(s)j.style=s;if(!a.allClasses||a.hadInvalidClass){for(l=0;l<h.length;++l)(a.allClasses||i[h[l]])&&o.push(h[l]);o.length&&(j["class"]=o.sort().join(" "));k&&o.length<k.split(/\s+/).length&&(v=true)}else k&&(j["class"]=k);v&&(g=A);if(!f.skipFinalValidation&&!m(b)){d.push(b);return A}}if(f.toHtml)b.name=b.name.replace(R,"cke:$1");return g}function o(a){var b=
+[],c;for(c in a)c.indexOf("*")>-1&&b.push(c.replace(/\*/g,".*"));return b.length?RegExp("^(?:"+b.join("|")+")$"):null}function r(a){var b=a.attributes,c;delete b.style;delete b["class"];if(c=CKEDITOR.tools.writeCssText(a.styles,true))b.style=c;a.classes.length&&(b["class"]=a.classes.sort().join(" "))}function m(a){switch(a.name){case "a":if(!a.children.length&&!a.attributes.name&&!a.attributes.id)return false;break;case "img":if(!a.attributes.src)return false}return true}function p(a){if(!a)return false;
+if(a===true)return true;var b=o(a);return function(c){return c in a||b&&c.match(b)}}function t(){return new CKEDITOR.htmlParser.element("br")}function w(a){return a.type==CKEDITOR.NODE_ELEMENT&&(a.name=="br"||B.$block[a.name])}function u(a,b,c){var d=a.name;if(B.$empty[d]||!a.children.length)if(d=="hr"&&b=="br")a.replaceWith(t());else{a.parent&&c.push({check:"it",el:a.parent});a.remove()}else if(B.$block[d]||d=="tr")if(b=="br"){if(a.previous&&!w(a.previous)){b=t();b.insertBefore(a)}if(a.next&&!w(a.next)){b=
+t();b.insertAfter(a)}a.replaceWithChildren()}else{var d=a.children,f;b:{f=B[b];for(var e=0,g=d.length,i;e<g;++e){i=d[e];if(i.type==CKEDITOR.NODE_ELEMENT&&!f[i.name]){f=false;break b}}f=true}if(f){a.name=b;a.attributes={};c.push({check:"parent-down",el:a})}else{f=a.parent;for(var e=f.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT||f.name=="body",j,h,g=d.length;g>0;){i=d[--g];if(e&&(i.type==CKEDITOR.NODE_TEXT||i.type==CKEDITOR.NODE_ELEMENT&&B.$inline[i.name])){if(!j){j=new CKEDITOR.htmlParser.element(b);j.insertAfter(a);
+c.push({check:"parent-down",el:j})}j.add(i,0)}else{j=null;h=B[f.name]||B.span;i.insertAfter(a);f.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT&&(i.type==CKEDITOR.NODE_ELEMENT&&!h[i.name])&&c.push({check:"el-up",el:i})}}a.remove()}}else if(d in{style:1,script:1})a.remove();else{a.parent&&c.push({check:"it",el:a.parent});a.replaceWithChildren()}}function x(a,b,c){var d,f;for(d=0;d<c.length;++d){f=c[d];if((!f.check||a.check(f.check,false))&&(!f.left||f.left(b))){f.right(b,T);break}}}function v(a,b){var c=b.getDefinition(),
+d=c.attributes,f=c.styles,e,g,i,j;if(a.name!=c.element)return false;for(e in d)if(e=="class"){c=d[e].split(/\s+/);for(i=a.classes.join("|");j=c.pop();)if(i.indexOf(j)==-1)return false}else if(a.attributes[e]!=d[e])return false;for(g in f)if(a.styles[g]!=f[g])return false;return true}function s(a,b){var c,d;if(typeof a=="string")c=a;else if(a instanceof CKEDITOR.style)d=a;else{c=a[0];d=a[1]}return[{element:c,left:d,right:function(a,c){c.transform(a,b)}}]}function y(a){return function(b){return v(b,
+a)}}function z(a){return function(b,c){c[a](b)}}var B=CKEDITOR.dtd,A=1,D=CKEDITOR.tools.copy,C=CKEDITOR.tools.trim,H="cke-test",E=["","p","br","div"];CKEDITOR.FILTER_SKIP_TREE=2;CKEDITOR.filter=function(a){this.allowedContent=[];this.disallowedContent=[];this.elementCallbacks=null;this.disabled=false;this.editor=null;this.id=CKEDITOR.tools.getNextNumber();this._={allowedRules:{elements:{},generic:[]},disallowedRules:{elements:{},generic:[]},transformations:{},cachedTests:{}};CKEDITOR.filter.instances[this.id]=
+this;if(a instanceof CKEDITOR.editor){a=this.editor=a;this.customConfig=true;var b=a.config.allowedContent;if(b===true)this.disabled=true;else{if(!b)this.customConfig=false;this.allow(b,"config",1);this.allow(a.config.extraAllowedContent,"extra",1);this.allow(E[a.enterMode]+" "+E[a.shiftEnterMode],"default",1);this.disallow(a.config.disallowedContent)}}else{this.customConfig=false;this.allow(a,"default",1)}};CKEDITOR.filter.instances={};CKEDITOR.filter.prototype={allow:function(b,c,d){if(!i(this,
+b,d))return false;var f,e;if(typeof b=="string")b=g(b);else if(b instanceof CKEDITOR.style){if(b.toAllowedContentRules)return this.allow(b.toAllowedContentRules(this.editor),c,d);f=b.getDefinition();b={};d=f.attributes;b[f.element]=f={styles:f.styles,requiredStyles:f.styles&&CKEDITOR.tools.objectKeys(f.styles)};if(d){d=D(d);f.classes=d["class"]?d["class"].split(/\s+/):null;f.requiredClasses=f.classes;delete d["class"];f.attributes=d;f.requiredAttributes=d&&CKEDITOR.tools.objectKeys(d)}}else if(CKEDITOR.tools.isArray(b)){for(f=
+0;f<b.length;++f)e=this.allow(b[f],c,d);return e}a(this,b,c,this.allowedContent,this._.allowedRules);return true},applyTo:function(a,b,c,d){if(this.disabled)return false;var f=this,e=[],g=this.editor&&this.editor.config.protectedSource,i,j=false,h={doFilter:!c,doTransform:true,doCallbacks:true,toHtml:b};a.forEach(function(a){if(a.type==CKEDITOR.NODE_ELEMENT){if(a.attributes["data-cke-filter"]=="off")return false;if(!b||!(a.name=="span"&&~CKEDITOR.tools.objectKeys(a.attributes).join("|").indexOf("data-cke-"))){i=
+l(f,a,e,h);if(i&A)j=true;else if(i&2)return false}}else if(a.type==CKEDITOR.NODE_COMMENT&&a.value.match(/^\{cke_protected\}(?!\{C\})/)){var c;a:{var d=decodeURIComponent(a.value.replace(/^\{cke_protected\}/,""));c=[];var k,o,v;if(g)for(o=0;o<g.length;++o)if((v=d.match(g[o]))&&v[0].length==d.length){c=true;break a}d=CKEDITOR.htmlParser.fragment.fromHtml(d);d.children.length==1&&(k=d.children[0]).type==CKEDITOR.NODE_ELEMENT&&l(f,k,c,h);c=!c.length}c||e.push(a)}},null,true);e.length&&(j=true);for(var k,
+a=[],d=E[d||(this.editor?this.editor.enterMode:CKEDITOR.ENTER_P)],o;c=e.pop();)c.type==CKEDITOR.NODE_ELEMENT?u(c,d,a):c.remove();for(;k=a.pop();){c=k.el;if(c.parent){o=B[c.parent.name]||B.span;switch(k.check){case "it":B.$removeEmpty[c.name]&&!c.children.length?u(c,d,a):m(c)||u(c,d,a);break;case "el-up":c.parent.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT&&!o[c.name]&&u(c,d,a);break;case "parent-down":c.parent.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT&&!o[c.name]&&u(c.parent,d,a)}}}return j},checkFeature:function(a){if(this.disabled||
+!a)return true;a.toFeature&&(a=a.toFeature(this.editor));return!a.requiredContent||this.check(a.requiredContent)},disable:function(){this.disabled=true},disallow:function(b){if(!i(this,b,true))return false;typeof b=="string"&&(b=g(b));a(this,b,null,this.disallowedContent,this._.disallowedRules);return true},addContentForms:function(a){if(!this.disabled&&a){var b,c,d=[],f;for(b=0;b<a.length&&!f;++b){c=a[b];if((typeof c=="string"||c instanceof CKEDITOR.style)&&this.check(c))f=c}if(f){for(b=0;b<a.length;++b)d.push(s(a[b],
+f));this.addTransformations(d)}}},addElementCallback:function(a){if(!this.elementCallbacks)this.elementCallbacks=[];this.elementCallbacks.push(a)},addFeature:function(a){if(this.disabled||!a)return true;a.toFeature&&(a=a.toFeature(this.editor));this.allow(a.allowedContent,a.name);this.addTransformations(a.contentTransformations);this.addContentForms(a.contentForms);return a.requiredContent&&(this.customConfig||this.disallowedContent.length)?this.check(a.requiredContent):true},addTransformations:function(a){var b,
+c;if(!this.disabled&&a){var d=this._.transformations,f;for(f=0;f<a.length;++f){b=a[f];var e=void 0,g=void 0,i=void 0,j=void 0,h=void 0,k=void 0;c=[];for(g=0;g<b.length;++g){i=b[g];if(typeof i=="string"){i=i.split(/\s*:\s*/);j=i[0];h=null;k=i[1]}else{j=i.check;h=i.left;k=i.right}if(!e){e=i;e=e.element?e.element:j?j.match(/^([a-z0-9]+)/i)[0]:e.left.getDefinition().element}h instanceof CKEDITOR.style&&(h=y(h));c.push({check:j==e?null:j,left:h,right:typeof k=="string"?z(k):k})}b=e;d[b]||(d[b]=[]);d[b].push(c)}}},
+check:function(a,b,c){if(this.disabled)return true;if(CKEDITOR.tools.isArray(a)){for(var d=a.length;d--;)if(this.check(a[d],b,c))return true;return false}var f,e;if(typeof a=="string"){e=a+"<"+(b===false?"0":"1")+(c?"1":"0")+">";if(e in this._.cachedChecks)return this._.cachedChecks[e];d=g(a).$1;f=d.styles;var i=d.classes;d.name=d.elements;d.classes=i=i?i.split(/\s*,\s*/):[];d.styles=j(f);d.attributes=j(d.attributes);d.children=[];i.length&&(d.attributes["class"]=i.join(" "));if(f)d.attributes.style=
+CKEDITOR.tools.writeCssText(d.styles);f=d}else{d=a.getDefinition();f=d.styles;i=d.attributes||{};if(f){f=D(f);i.style=CKEDITOR.tools.writeCssText(f,true)}else f={};f={name:d.element,attributes:i,classes:i["class"]?i["class"].split(/\s+/):[],styles:f,children:[]}}var i=CKEDITOR.tools.clone(f),h=[],k;if(b!==false&&(k=this._.transformations[f.name])){for(d=0;d<k.length;++d)x(this,f,k[d]);r(f)}l(this,i,h,{doFilter:true,doTransform:b!==false,skipRequired:!c,skipFinalValidation:!c});b=h.length>0?false:
+CKEDITOR.tools.objectCompare(f.attributes,i.attributes,true)?true:false;typeof a=="string"&&(this._.cachedChecks[e]=b);return b},getAllowedEnterMode:function(){var a=["p","div","br"],b={p:CKEDITOR.ENTER_P,div:CKEDITOR.ENTER_DIV,br:CKEDITOR.ENTER_BR};return function(c,d){var f=a.slice(),e;if(this.check(E[c]))return c;for(d||(f=f.reverse());e=f.pop();)if(this.check(e))return b[e];return CKEDITOR.ENTER_BR}}(),destroy:function(){delete CKEDITOR.filter.instances[this.id];delete this._;delete this.allowedContent;
+delete this.disallowedContent}};var G={styles:1,attributes:1,classes:1},L={styles:"requiredStyles",attributes:"requiredAttributes",classes:"requiredClasses"},J=/^([a-z0-9\-*\s]+)((?:\s*\{[!\w\-,\s\*]+\}\s*|\s*\[[!\w\-,\s\*]+\]\s*|\s*\([!\w\-,\s\*]+\)\s*){0,3})(?:;\s*|$)/i,P={styles:/{([^}]+)}/,attrs:/\[([^\]]+)\]/,classes:/\(([^\)]+)\)/},I=/^cke:(object|embed|param)$/,R=/^(object|embed|param)$/,T=CKEDITOR.filter.transformationsTools={sizeToStyle:function(a){this.lengthToStyle(a,"width");this.lengthToStyle(a,
+"height")},sizeToAttribute:function(a){this.lengthToAttribute(a,"width");this.lengthToAttribute(a,"height")},lengthToStyle:function(a,b,c){c=c||b;if(!(c in a.styles)){var d=a.attributes[b];if(d){/^\d+$/.test(d)&&(d=d+"px");a.styles[c]=d}}delete a.attributes[b]},lengthToAttribute:function(a,b,c){c=c||b;if(!(c in a.attributes)){var d=a.styles[b],f=d&&d.match(/^(\d+)(?:\.\d*)?px$/);f?a.attributes[c]=f[1]:d==H&&(a.attributes[c]=H)}delete a.styles[b]},alignmentToStyle:function(a){if(!("float"in a.styles)){var b=
+a.attributes.align;if(b=="left"||b=="right")a.styles["float"]=b}delete a.attributes.align},alignmentToAttribute:function(a){if(!("align"in a.attributes)){var b=a.styles["float"];if(b=="left"||b=="right")a.attributes.align=b}delete a.styles["float"]},matchesStyle:v,transform:function(a,b){if(typeof b=="string")a.name=b;else{var c=b.getDefinition(),d=c.styles,f=c.attributes,e,g,i,j;a.name=c.element;for(e in f)if(e=="class"){c=a.classes.join("|");for(i=f[e].split(/\s+/);j=i.pop();)c.indexOf(j)==-1&&
+a.classes.push(j)}else a.attributes[e]=f[e];for(g in d)a.styles[g]=d[g]}}}}(),function(){CKEDITOR.focusManager=function(a){if(a.focusManager)return a.focusManager;this.hasFocus=false;this.currentActive=null;this._={editor:a};return this};CKEDITOR.focusManager._={blurDelay:200};CKEDITOR.focusManager.prototype={focus:function(a){this._.timer&&clearTimeout(this._.timer);if(a)this.currentActive=a;if(!this.hasFocus&&!this._.locked){(a=CKEDITOR.currentInstance)&&a.focusManager.blur(1);this.hasFocus=true;
+(a=this._.editor.container)&&a.addClass("cke_focus");this._.editor.fire("focus")}},lock:function(){this._.locked=1},unlock:function(){delete this._.locked},blur:function(a){function e(){if(this.hasFocus){this.hasFocus=false;var a=this._.editor.container;a&&a.removeClass("cke_focus");this._.editor.fire("blur")}}if(!this._.locked){this._.timer&&clearTimeout(this._.timer);var b=CKEDITOR.focusManager._.blurDelay;a||!b?e.call(this):this._.timer=CKEDITOR.tools.setTimeout(function(){delete this._.timer;
+e.call(this)},b,this)}},add:function(a,e){var b=a.getCustomData("focusmanager");if(!b||b!=this){b&&b.remove(a);var b="focus",c="blur";if(e)if(CKEDITOR.env.ie){b="focusin";c="focusout"}else CKEDITOR.event.useCapture=1;var d={blur:function(){a.equals(this.currentActive)&&this.blur()},focus:function(){this.focus(a)}};a.on(b,d.focus,this);a.on(c,d.blur,this);if(e)CKEDITOR.event.useCapture=0;a.setCustomData("focusmanager",this);a.setCustomData("focusmanager_handlers",d)}},remove:function(a){a.removeCustomData("focusmanager");
+var e=a.removeCustomData("focusmanager_handlers");a.removeListener("blur",e.blur);a.removeListener("focus",e.focus)}}}(),CKEDITOR.keystrokeHandler=function(a){if(a.keystrokeHandler)return a.keystrokeHandler;this.keystrokes={};this.blockedKeystrokes={};this._={editor:a};return this},function(){var a,e=function(b){var b=b.data,d=b.getKeystroke(),e=this.keystrokes[d],h=this._.editor;a=h.fire("key",{keyCode:d,domEvent:b})===false;if(!a){e&&(a=h.execCommand(e,{from:"keystrokeHandler"})!==false);a||(a=
+!!this.blockedKeystrokes[d])}a&&b.preventDefault(true);return!a},b=function(b){if(a){a=false;b.data.preventDefault(true)}};CKEDITOR.keystrokeHandler.prototype={attach:function(a){a.on("keydown",e,this);if(CKEDITOR.env.gecko&&CKEDITOR.env.mac)a.on("keypress",b,this)}}}(),function(){CKEDITOR.lang={languages:{af:1,ar:1,bg:1,bn:1,bs:1,ca:1,cs:1,cy:1,da:1,de:1,el:1,"en-au":1,"en-ca":1,"en-gb":1,en:1,eo:1,es:1,et:1,eu:1,fa:1,fi:1,fo:1,"fr-ca":1,fr:1,gl:1,gu:1,he:1,hi:1,hr:1,hu:1,id:1,is:1,it:1,ja:1,ka:1,
+km:1,ko:1,ku:1,lt:1,lv:1,mk:1,mn:1,ms:1,nb:1,nl:1,no:1,pl:1,"pt-br":1,pt:1,ro:1,ru:1,si:1,sk:1,sl:1,sq:1,"sr-latn":1,sr:1,sv:1,th:1,tr:1,tt:1,ug:1,uk:1,vi:1,"zh-cn":1,zh:1},rtl:{ar:1,fa:1,he:1,ku:1,ug:1},load:function(a,e,b){if(!a||!CKEDITOR.lang.languages[a])a=this.detect(e,a);var c=this,e=function(){c[a].dir=c.rtl[a]?"rtl":"ltr";b(a,c[a])};this[a]?e():CKEDITOR.scriptLoader.load(CKEDITOR.getUrl("lang/"+a+".js"),e,this)},detect:function(a,e){var b=this.languages,e=e||navigator.userLanguage||navigator.language||
+a,c=e.toLowerCase().match(/([a-z]+)(?:-([a-z]+))?/),d=c[1],c=c[2];b[d+"-"+c]?d=d+"-"+c:b[d]||(d=null);CKEDITOR.lang.detect=d?function(){return d}:function(a){return a};return d||a}}}(),CKEDITOR.scriptLoader=function(){var a={},e={};return{load:function(b,c,d,i){var h=typeof b=="string";h&&(b=[b]);d||(d=CKEDITOR);var f=b.length,k=[],j=[],g=function(a){c&&(h?c.call(d,a):c.call(d,k,j))};if(f===0)g(true);else{var n=function(a,b){(b?k:j).push(a);if(--f<=0){i&&CKEDITOR.document.getDocumentElement().removeStyle("cursor");
+g(b)}},q=function(b,c){a[b]=1;var d=e[b];delete e[b];for(var f=0;f<d.length;f++)d[f](b,c)},l=function(b){if(a[b])n(b,true);else{var d=e[b]||(e[b]=[]);d.push(n);if(!(d.length>1)){var f=new CKEDITOR.dom.element("script");f.setAttributes({type:"text/javascript",src:b});if(c)if(CKEDITOR.env.ie&&CKEDITOR.env.version<11)f.$.onreadystatechange=function(){if(f.$.readyState=="loaded"||f.$.readyState=="complete"){f.$.onreadystatechange=null;q(b,true)}};else{f.$.onload=function(){setTimeout(function(){q(b,true)},
+0)};f.$.onerror=function(){q(b,false)}}f.appendTo(CKEDITOR.document.getHead())}}};i&&CKEDITOR.document.getDocumentElement().setStyle("cursor","wait");for(var o=0;o<f;o++)l(b[o])}},queue:function(){function a(){var b;(b=c[0])&&this.load(b.scriptUrl,b.callback,CKEDITOR,0)}var c=[];return function(d,e){var h=this;c.push({scriptUrl:d,callback:function(){e&&e.apply(this,arguments);c.shift();a.call(h)}});c.length==1&&a.call(this)}}()}}(),CKEDITOR.resourceManager=function(a,e){this.basePath=a;this.fileName=
+e;this.registered={};this.loaded={};this.externals={};this._={waitingList:{}}},CKEDITOR.resourceManager.prototype={add:function(a,e){if(this.registered[a])throw Error('[CKEDITOR.resourceManager.add] The resource name "'+a+'" is already registered.');var b=this.registered[a]=e||{};b.name=a;b.path=this.getPath(a);CKEDITOR.fire(a+CKEDITOR.tools.capitalize(this.fileName)+"Ready",b);return this.get(a)},get:function(a){return this.registered[a]||null},getPath:function(a){var e=this.externals[a];return CKEDITOR.getUrl(e&&
+e.dir||this.basePath+a+"/")},getFilePath:function(a){var e=this.externals[a];return CKEDITOR.getUrl(this.getPath(a)+(e?e.file:this.fileName+".js"))},addExternal:function(a,e,b){for(var a=a.split(","),c=0;c<a.length;c++){var d=a[c];b||(e=e.replace(/[^\/]+$/,function(a){b=a;return""}));this.externals[d]={dir:e,file:b||this.fileName+".js"}}},load:function(a,e,b){CKEDITOR.tools.isArray(a)||(a=a?[a]:[]);for(var c=this.loaded,d=this.registered,i=[],h={},f={},k=0;k<a.length;k++){var j=a[k];if(j)if(!c[j]&&
+!d[j]){var g=this.getFilePath(j);i.push(g);g in h||(h[g]=[]);h[g].push(j)}else f[j]=this.get(j)}CKEDITOR.scriptLoader.load(i,function(a,d){if(d.length)throw Error('[CKEDITOR.resourceManager.load] Resource name "'+h[d[0]].join(",")+'" was not found at "'+d[0]+'".');for(var g=0;g<a.length;g++)for(var i=h[a[g]],j=0;j<i.length;j++){var k=i[j];f[k]=this.get(k);c[k]=1}e.call(b,f)},this)}},CKEDITOR.plugins=new CKEDITOR.resourceManager("plugins/","plugin"),CKEDITOR.plugins.load=CKEDITOR.tools.override(CKEDITOR.plugins.load,
+function(a){var e={};return function(b,c,d){var i={},h=function(b){a.call(this,b,function(a){CKEDITOR.tools.extend(i,a);var b=[],f;for(f in a){var n=a[f],q=n&&n.requires;if(!e[f]){if(n.icons)for(var l=n.icons.split(","),o=l.length;o--;)CKEDITOR.skin.addIcon(l[o],n.path+"icons/"+(CKEDITOR.env.hidpi&&n.hidpi?"hidpi/":"")+l[o]+".png");e[f]=1}if(q){q.split&&(q=q.split(","));for(n=0;n<q.length;n++)i[q[n]]||b.push(q[n])}}if(b.length)h.call(this,b);else{for(f in i){n=i[f];if(n.onLoad&&!n.onLoad._called){n.onLoad()===
+false&&delete i[f];n.onLoad._called=1}}c&&c.call(d||window,i)}},this)};h.call(this,b)}}),CKEDITOR.plugins.setLang=function(a,e,b){var c=this.get(a),a=c.langEntries||(c.langEntries={}),c=c.lang||(c.lang=[]);c.split&&(c=c.split(","));CKEDITOR.tools.indexOf(c,e)==-1&&c.push(e);a[e]=b},CKEDITOR.ui=function(a){if(a.ui)return a.ui;this.items={};this.instances={};this.editor=a;this._={handlers:{}};return this},CKEDITOR.ui.prototype={add:function(a,e,b){b.name=a.toLowerCase();var c=this.items[a]={type:e,
+command:b.command||null,args:Array.prototype.slice.call(arguments,2)};CKEDITOR.tools.extend(c,b)},get:function(a){return this.instances[a]},create:function(a){var e=this.items[a],b=e&&this._.handlers[e.type],c=e&&e.command&&this.editor.getCommand(e.command),b=b&&b.create.apply(this,e.args);this.instances[a]=b;c&&c.uiItems.push(b);if(b&&!b.type)b.type=e.type;return b},addHandler:function(a,e){this._.handlers[a]=e},space:function(a){return CKEDITOR.document.getById(this.spaceId(a))},spaceId:function(a){return this.editor.id+
+"_"+a}},CKEDITOR.event.implementOn(CKEDITOR.ui),function(){function a(a,c,f){CKEDITOR.event.call(this);a=a&&CKEDITOR.tools.clone(a);if(c!==void 0){if(c instanceof CKEDITOR.dom.element){if(!f)throw Error("One of the element modes must be specified.");}else throw Error("Expect element of type CKEDITOR.dom.element.");if(CKEDITOR.env.ie&&CKEDITOR.env.quirks&&f==CKEDITOR.ELEMENT_MODE_INLINE)throw Error("Inline element mode is not supported on IE quirks.");if(!(f==CKEDITOR.ELEMENT_MODE_INLINE?c.is(CKEDITOR.dtd.$editable)||
+c.is("textarea"):f==CKEDITOR.ELEMENT_MODE_REPLACE?!c.is(CKEDITOR.dtd.$nonBodyContent):1))throw Error('The specified element mode is not supported on element: "'+c.getName()+'".');this.element=c;this.elementMode=f;this.name=this.elementMode!=CKEDITOR.ELEMENT_MODE_APPENDTO&&(c.getId()||c.getNameAtt())}else this.elementMode=CKEDITOR.ELEMENT_MODE_NONE;this._={};this.commands={};this.templates={};this.name=this.name||e();this.id=CKEDITOR.tools.getNextId();this.status="unloaded";this.config=CKEDITOR.tools.prototypedCopy(CKEDITOR.config);
+this.ui=new CKEDITOR.ui(this);this.focusManager=new CKEDITOR.focusManager(this);this.keystrokeHandler=new CKEDITOR.keystrokeHandler(this);this.on("readOnly",b);this.on("selectionChange",function(a){d(this,a.data.path)});this.on("activeFilterChange",function(){d(this,this.elementPath(),true)});this.on("mode",b);this.on("instanceReady",function(){this.config.startupFocus&&this.focus()});CKEDITOR.fire("instanceCreated",null,this);CKEDITOR.add(this);CKEDITOR.tools.setTimeout(function(){h(this,a)},0,this)}
+function e(){do var a="editor"+ ++q;while(CKEDITOR.instances[a]);return a}function b(){var a=this.commands,b;for(b in a)c(this,a[b])}function c(a,b){b[b.startDisabled?"disable":a.readOnly&&!b.readOnly?"disable":b.modes[a.mode]?"enable":"disable"]()}function d(a,b,c){if(b){var d,f,e=a.commands;for(f in e){d=e[f];(c||d.contextSensitive)&&d.refresh(a,b)}}}function i(a){var b=a.config.customConfig;if(!b)return false;var b=CKEDITOR.getUrl(b),c=l[b]||(l[b]={});if(c.fn){c.fn.call(a,a.config);(CKEDITOR.getUrl(a.config.customConfig)==
+b||!i(a))&&a.fireOnce("customConfigLoaded")}else CKEDITOR.scriptLoader.queue(b,function(){c.fn=CKEDITOR.editorConfig?CKEDITOR.editorConfig:function(){};i(a)});return true}function h(a,b){a.on("customConfigLoaded",function(){if(b){if(b.on)for(var c in b.on)a.on(c,b.on[c]);CKEDITOR.tools.extend(a.config,b,true);delete a.config.on}c=a.config;a.readOnly=c.readOnly?true:a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?a.element.is("textarea")?a.element.hasAttribute("disabled")||a.element.hasAttribute("readonly"):
+a.element.isReadOnly():a.elementMode==CKEDITOR.ELEMENT_MODE_REPLACE?a.element.hasAttribute("disabled")||a.element.hasAttribute("readonly"):false;a.blockless=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?!(a.element.is("textarea")||CKEDITOR.dtd[a.element.getName()].p):false;a.tabIndex=c.tabIndex||a.element&&a.element.getAttribute("tabindex")||0;a.activeEnterMode=a.enterMode=a.blockless?CKEDITOR.ENTER_BR:c.enterMode;a.activeShiftEnterMode=a.shiftEnterMode=a.blockless?CKEDITOR.ENTER_BR:c.shiftEnterMode;
+if(c.skin)CKEDITOR.skinName=c.skin;a.fireOnce("configLoaded");a.dataProcessor=new CKEDITOR.htmlDataProcessor(a);a.filter=a.activeFilter=new CKEDITOR.filter(a);f(a)});if(b&&b.customConfig!=null)a.config.customConfig=b.customConfig;i(a)||a.fireOnce("customConfigLoaded")}function f(a){CKEDITOR.skin.loadPart("editor",function(){k(a)})}function k(a){CKEDITOR.lang.load(a.config.language,a.config.defaultLanguage,function(b,c){var d=a.config.title;a.langCode=b;a.lang=CKEDITOR.tools.prototypedCopy(c);a.title=
+typeof d=="string"||d===false?d:[a.lang.editor,a.name].join(", ");if(!a.config.contentsLangDirection)a.config.contentsLangDirection=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?a.element.getDirection(1):a.lang.dir;a.fire("langLoaded");j(a)})}function j(a){a.getStylesSet(function(b){a.once("loaded",function(){a.fire("stylesSet",{styles:b})},null,null,1);g(a)})}function g(a){var b=a.config,c=b.plugins,d=b.extraPlugins,f=b.removePlugins;if(d)var e=RegExp("(?:^|,)(?:"+d.replace(/\s*,\s*/g,"|")+")(?=,|$)",
+"g"),c=c.replace(e,""),c=c+(","+d);if(f)var g=RegExp("(?:^|,)(?:"+f.replace(/\s*,\s*/g,"|")+")(?=,|$)","g"),c=c.replace(g,"");CKEDITOR.env.air&&(c=c+",adobeair");CKEDITOR.plugins.load(c.split(","),function(c){var d=[],f=[],e=[];a.plugins=c;for(var i in c){var j=c[i],h=j.lang,k=null,m=j.requires,p;CKEDITOR.tools.isArray(m)&&(m=m.join(","));if(m&&(p=m.match(g)))for(;m=p.pop();)CKEDITOR.error("editor-plugin-required",{plugin:m.replace(",",""),requiredBy:i});if(h&&!a.lang[i]){h.split&&(h=h.split(","));
+if(CKEDITOR.tools.indexOf(h,a.langCode)>=0)k=a.langCode;else{k=a.langCode.replace(/-.*/,"");k=k!=a.langCode&&CKEDITOR.tools.indexOf(h,k)>=0?k:CKEDITOR.tools.indexOf(h,"en")>=0?"en":h[0]}if(!j.langEntries||!j.langEntries[k])e.push(CKEDITOR.getUrl(j.path+"lang/"+k+".js"));else{a.lang[i]=j.langEntries[k];k=null}}f.push(k);d.push(j)}CKEDITOR.scriptLoader.load(e,function(){for(var c=["beforeInit","init","afterInit"],e=0;e<c.length;e++)for(var g=0;g<d.length;g++){var i=d[g];e===0&&(f[g]&&i.lang&&i.langEntries)&&
+(a.lang[i.name]=i.langEntries[f[g]]);if(i[c[e]])i[c[e]](a)}a.fireOnce("pluginsLoaded");b.keystrokes&&a.setKeystroke(a.config.keystrokes);for(g=0;g<a.config.blockedKeystrokes.length;g++)a.keystrokeHandler.blockedKeystrokes[a.config.blockedKeystrokes[g]]=1;a.status="loaded";a.fireOnce("loaded");CKEDITOR.fire("instanceLoaded",null,a)})})}function n(){var a=this.element;if(a&&this.elementMode!=CKEDITOR.ELEMENT_MODE_APPENDTO){var b=this.getData();this.config.htmlEncodeOutput&&(b=CKEDITOR.tools.htmlEncode(b));
+a.is("textarea")?a.setValue(b):a.setHtml(b);return true}return false}a.prototype=CKEDITOR.editor.prototype;CKEDITOR.editor=a;var q=0,l={};CKEDITOR.tools.extend(CKEDITOR.editor.prototype,{addCommand:function(a,b){b.name=a.toLowerCase();var d=new CKEDITOR.command(this,b);this.mode&&c(this,d);return this.commands[a]=d},_attachToForm:function(){function a(d){b.updateElement();b._.required&&(!c.getValue()&&b.fire("required")===false)&&d.data.preventDefault()}var b=this,c=b.element,d=new CKEDITOR.dom.element(c.$.form);
+if(c.is("textarea")&&d){d.on("submit",a);if(d.$.submit&&d.$.submit.call&&d.$.submit.apply)d.$.submit=CKEDITOR.tools.override(d.$.submit,function(b){return function(){a();b.apply?b.apply(this):b()}});b.on("destroy",function(){d.removeListener("submit",a)})}},destroy:function(a){this.fire("beforeDestroy");!a&&n.call(this);this.editable(null);this.filter.destroy();delete this.filter;delete this.activeFilter;this.status="destroyed";this.fire("destroy");this.removeAllListeners();CKEDITOR.remove(this);
+CKEDITOR.fire("instanceDestroyed",null,this)},elementPath:function(a){if(!a){a=this.getSelection();if(!a)return null;a=a.getStartElement()}return a?new CKEDITOR.dom.elementPath(a,this.editable()):null},createRange:function(){var a=this.editable();return a?new CKEDITOR.dom.range(a):null},execCommand:function(a,b){var c=this.getCommand(a),d={name:a,commandData:b,command:c};if(c&&c.state!=CKEDITOR.TRISTATE_DISABLED&&this.fire("beforeCommandExec",d)!==false){d.returnValue=c.exec(d.commandData);if(!c.async&&
+this.fire("afterCommandExec",d)!==false)return d.returnValue}return false},getCommand:function(a){return this.commands[a]},getData:function(a){!a&&this.fire("beforeGetData");var b=this._.data;if(typeof b!="string")b=(b=this.element)&&this.elementMode==CKEDITOR.ELEMENT_MODE_REPLACE?b.is("textarea")?b.getValue():b.getHtml():"";b={dataValue:b};!a&&this.fire("getData",b);return b.dataValue},getSnapshot:function(){var a=this.fire("getSnapshot");if(typeof a!="string")a=(a=this.element)&&this.elementMode==
+CKEDITOR.ELEMENT_MODE_REPLACE?a.is("textarea")?a.getValue():a.getHtml():"";return a},loadSnapshot:function(a){this.fire("loadSnapshot",a)},setData:function(a,b,c){var d=true,f=b;if(b&&typeof b=="object"){c=b.internal;f=b.callback;d=!b.noSnapshot}!c&&d&&this.fire("saveSnapshot");if(f||!c)this.once("dataReady",function(a){!c&&d&&this.fire("saveSnapshot");f&&f.call(a.editor)});a={dataValue:a};!c&&this.fire("setData",a);this._.data=a.dataValue;!c&&this.fire("afterSetData",a)},setReadOnly:function(a){a=
+a==null||a;if(this.readOnly!=a){this.readOnly=a;this.keystrokeHandler.blockedKeystrokes[8]=+a;this.editable().setReadOnly(a);this.fire("readOnly")}},insertHtml:function(a,b,c){this.fire("insertHtml",{dataValue:a,mode:b,range:c})},insertText:function(a){this.fire("insertText",a)},insertElement:function(a){this.fire("insertElement",a)},getSelectedHtml:function(a){var b=this.editable(),c=this.getSelection(),c=c&&c.getRanges();if(!b||!c||c.length===0)return null;b=b.getHtmlFromRange(c[0]);return a?b.getHtml():
+b},extractSelectedHtml:function(a,b){var c=this.editable(),d=this.getSelection().getRanges();if(!c||d.length===0)return null;d=d[0];c=c.extractHtmlFromRange(d,b);b||this.getSelection().selectRanges([d]);return a?c.getHtml():c},focus:function(){this.fire("beforeFocus")},checkDirty:function(){return this.status=="ready"&&this._.previousValue!==this.getSnapshot()},resetDirty:function(){this._.previousValue=this.getSnapshot()},updateElement:function(){return n.call(this)},setKeystroke:function(){for(var a=
+this.keystrokeHandler.keystrokes,b=CKEDITOR.tools.isArray(arguments[0])?arguments[0]:[[].slice.call(arguments,0)],c,d,f=b.length;f--;){c=b[f];d=0;if(CKEDITOR.tools.isArray(c)){d=c[1];c=c[0]}d?a[c]=d:delete a[c]}},addFeature:function(a){return this.filter.addFeature(a)},setActiveFilter:function(a){if(!a)a=this.filter;if(this.activeFilter!==a){this.activeFilter=a;this.fire("activeFilterChange");a===this.filter?this.setActiveEnterMode(null,null):this.setActiveEnterMode(a.getAllowedEnterMode(this.enterMode),
+a.getAllowedEnterMode(this.shiftEnterMode,true))}},setActiveEnterMode:function(a,b){a=a?this.blockless?CKEDITOR.ENTER_BR:a:this.enterMode;b=b?this.blockless?CKEDITOR.ENTER_BR:b:this.shiftEnterMode;if(this.activeEnterMode!=a||this.activeShiftEnterMode!=b){this.activeEnterMode=a;this.activeShiftEnterMode=b;this.fire("activeEnterModeChange")}},showNotification:function(a){alert(a)}})}(),CKEDITOR.ELEMENT_MODE_NONE=0,CKEDITOR.ELEMENT_MODE_REPLACE=1,CKEDITOR.ELEMENT_MODE_APPENDTO=2,CKEDITOR.ELEMENT_MODE_INLINE=
+3,CKEDITOR.htmlParser=function(){this._={htmlPartsRegex:/<(?:(?:\/([^>]+)>)|(?:!--([\S|\s]*?)--\>)|(?:([^\/\s>]+)((?:\s+[\w\-:.]+(?:\s*=\s*?(?:(?:"[^"]*")|(?:'[^']*')|[^\s"'\/>]+))?)*)[\S\s]*?(\/?)>))/g}},function(){var a=/([\w\-:.]+)(?:(?:\s*=\s*(?:(?:"([^"]*)")|(?:'([^']*)')|([^\s>]+)))|(?=\s|$))/g,e={checked:1,compact:1,declare:1,defer:1,disabled:1,ismap:1,multiple:1,nohref:1,noresize:1,noshade:1,nowrap:1,readonly:1,selected:1};CKEDITOR.htmlParser.prototype={onTagOpen:function(){},onTagClose:function(){},
+onText:function(){},onCDATA:function(){},onComment:function(){},parse:function(b){for(var c,d,i=0,h;c=this._.htmlPartsRegex.exec(b);){d=c.index;if(d>i){i=b.substring(i,d);if(h)h.push(i);else this.onText(i)}i=this._.htmlPartsRegex.lastIndex;if(d=c[1]){d=d.toLowerCase();if(h&&CKEDITOR.dtd.$cdata[d]){this.onCDATA(h.join(""));h=null}if(!h){this.onTagClose(d);continue}}if(h)h.push(c[0]);else if(d=c[3]){d=d.toLowerCase();if(!/="/.test(d)){var f={},k,j=c[4];c=!!c[5];if(j)for(;k=a.exec(j);){var g=k[1].toLowerCase();
+k=k[2]||k[3]||k[4]||"";f[g]=!k&&e[g]?g:CKEDITOR.tools.htmlDecodeAttr(k)}this.onTagOpen(d,f,c);!h&&CKEDITOR.dtd.$cdata[d]&&(h=[])}}else if(d=c[2])this.onComment(d)}if(b.length>i)this.onText(b.substring(i,b.length))}}}(),CKEDITOR.htmlParser.basicWriter=CKEDITOR.tools.createClass({$:function(){this._={output:[]}},proto:{openTag:function(a){this._.output.push("<",a)},openTagClose:function(a,e){e?this._.output.push(" />"):this._.output.push(">")},attribute:function(a,e){typeof e=="string"&&(e=CKEDITOR.tools.htmlEncodeAttr(e));
+this._.output.push(" ",a,'="',e,'"')},closeTag:function(a){this._.output.push("</",a,">")},text:function(a){this._.output.push(a)},comment:function(a){this._.output.push("<\!--",a,"--\>")},write:function(a){this._.output.push(a)},reset:function(){this._.output=[];this._.indent=false},getHtml:function(a){var e=this._.output.join("");a&&this.reset();return e}}}),"use strict",function(){CKEDITOR.htmlParser.node=function(){};CKEDITOR.htmlParser.node.prototype={remove:function(){var a=this.parent.children,
+e=CKEDITOR.tools.indexOf(a,this),b=this.previous,c=this.next;b&&(b.next=c);c&&(c.previous=b);a.splice(e,1);this.parent=null},replaceWith:function(a){var e=this.parent.children,b=CKEDITOR.tools.indexOf(e,this),c=a.previous=this.previous,d=a.next=this.next;c&&(c.next=a);d&&(d.previous=a);e[b]=a;a.parent=this.parent;this.parent=null},insertAfter:function(a){var e=a.parent.children,b=CKEDITOR.tools.indexOf(e,a),c=a.next;e.splice(b+1,0,this);this.next=a.next;this.previous=a;a.next=this;c&&(c.previous=
+this);this.parent=a.parent},insertBefore:function(a){var e=a.parent.children,b=CKEDITOR.tools.indexOf(e,a);e.splice(b,0,this);this.next=a;(this.previous=a.previous)&&(a.previous.next=this);a.previous=this;this.parent=a.parent},getAscendant:function(a){var e=typeof a=="function"?a:typeof a=="string"?function(b){return b.name==a}:function(b){return b.name in a},b=this.parent;for(;b&&b.type==CKEDITOR.NODE_ELEMENT;){if(e(b))return b;b=b.parent}return null},wrapWith:function(a){this.replaceWith(a);a.add(this);
+return a},getIndex:function(){return CKEDITOR.tools.indexOf(this.parent.children,this)},getFilterContext:function(a){return a||{}}}}(),"use strict",CKEDITOR.htmlParser.comment=function(a){this.value=a;this._={isBlockLike:false}},CKEDITOR.htmlParser.comment.prototype=CKEDITOR.tools.extend(new CKEDITOR.htmlParser.node,{type:CKEDITOR.NODE_COMMENT,filter:function(a,e){var b=this.value;if(!(b=a.onComment(e,b,this))){this.remove();return false}if(typeof b!="string"){this.replaceWith(b);return false}this.value=
+b;return true},writeHtml:function(a,e){e&&this.filter(e);a.comment(this.value)}}),"use strict",function(){CKEDITOR.htmlParser.text=function(a){this.value=a;this._={isBlockLike:false}};CKEDITOR.htmlParser.text.prototype=CKEDITOR.tools.extend(new CKEDITOR.htmlParser.node,{type:CKEDITOR.NODE_TEXT,filter:function(a,e){if(!(this.value=a.onText(e,this.value,this))){this.remove();return false}},writeHtml:function(a,e){e&&this.filter(e);a.text(this.value)}})}(),"use strict",function(){CKEDITOR.htmlParser.cdata=
+function(a){this.value=a};CKEDITOR.htmlParser.cdata.prototype=CKEDITOR.tools.extend(new CKEDITOR.htmlParser.node,{type:CKEDITOR.NODE_TEXT,filter:function(){},writeHtml:function(a){a.write(this.value)}})}(),"use strict",CKEDITOR.htmlParser.fragment=function(){this.children=[];this.parent=null;this._={isBlockLike:true,hasInlineStarted:false}},function(){function a(a){return a.attributes["data-cke-survive"]?false:a.name=="a"&&a.attributes.href||CKEDITOR.dtd.$removeEmpty[a.name]}var e=CKEDITOR.tools.extend({table:1,
+ul:1,ol:1,dl:1},CKEDITOR.dtd.table,CKEDITOR.dtd.ul,CKEDITOR.dtd.ol,CKEDITOR.dtd.dl),b={ol:1,ul:1},c=CKEDITOR.tools.extend({},{html:1},CKEDITOR.dtd.html,CKEDITOR.dtd.body,CKEDITOR.dtd.head,{style:1,script:1}),d={ul:"li",ol:"li",dl:"dd",table:"tbody",tbody:"tr",thead:"tr",tfoot:"tr",tr:"td"};CKEDITOR.htmlParser.fragment.fromHtml=function(i,h,f){function k(a){var b;if(m.length>0)for(var c=0;c<m.length;c++){var d=m[c],f=d.name,e=CKEDITOR.dtd[f],g=t.name&&CKEDITOR.dtd[t.name];if((!g||g[f])&&(!a||!e||e[a]||
+!CKEDITOR.dtd[a])){if(!b){j();b=1}d=d.clone();d.parent=t;t=d;m.splice(c,1);c--}else if(f==t.name){n(t,t.parent,1);c--}}}function j(){for(;p.length;)n(p.shift(),t)}function g(a){if(a._.isBlockLike&&a.name!="pre"&&a.name!="textarea"){var b=a.children.length,c=a.children[b-1],d;if(c&&c.type==CKEDITOR.NODE_TEXT)(d=CKEDITOR.tools.rtrim(c.value))?c.value=d:a.children.length=b-1}}function n(b,c,d){var c=c||t||r,e=t;if(b.previous===void 0){if(q(c,b)){t=c;o.onTagOpen(f,{});b.returnPoint=c=t}g(b);(!a(b)||b.children.length)&&
+c.add(b);b.name=="pre"&&(u=false);b.name=="textarea"&&(w=false)}if(b.returnPoint){t=b.returnPoint;delete b.returnPoint}else t=d?c:e}function q(a,b){if((a==r||a.name=="body")&&f&&(!a.name||CKEDITOR.dtd[a.name][f])){var c,d;return(c=b.attributes&&(d=b.attributes["data-cke-real-element-type"])?d:b.name)&&c in CKEDITOR.dtd.$inline&&!(c in CKEDITOR.dtd.head)&&!b.isOrphan||b.type==CKEDITOR.NODE_TEXT}}function l(a,b){return a in CKEDITOR.dtd.$listItem||a in CKEDITOR.dtd.$tableContent?a==b||a=="dt"&&b=="dd"||
+a=="dd"&&b=="dt":false}var o=new CKEDITOR.htmlParser,r=h instanceof CKEDITOR.htmlParser.element?h:typeof h=="string"?new CKEDITOR.htmlParser.element(h):new CKEDITOR.htmlParser.fragment,m=[],p=[],t=r,w=r.name=="textarea",u=r.name=="pre";o.onTagOpen=function(d,f,g,i){f=new CKEDITOR.htmlParser.element(d,f);if(f.isUnknown&&g)f.isEmpty=true;f.isOptionalClose=i;if(a(f))m.push(f);else{if(d=="pre")u=true;else{if(d=="br"&&u){t.add(new CKEDITOR.htmlParser.text("\n"));return}d=="textarea"&&(w=true)}if(d=="br")p.push(f);
+else{for(;;){i=(g=t.name)?CKEDITOR.dtd[g]||(t._.isBlockLike?CKEDITOR.dtd.div:CKEDITOR.dtd.span):c;if(!f.isUnknown&&!t.isUnknown&&!i[d])if(t.isOptionalClose)o.onTagClose(g);else if(d in b&&g in b){g=t.children;(g=g[g.length-1])&&g.name=="li"||n(g=new CKEDITOR.htmlParser.element("li"),t);!f.returnPoint&&(f.returnPoint=t);t=g}else if(d in CKEDITOR.dtd.$listItem&&!l(d,g))o.onTagOpen(d=="li"?"ul":"dl",{},0,1);else if(g in e&&!l(d,g)){!f.returnPoint&&(f.returnPoint=t);t=t.parent}else{g in CKEDITOR.dtd.$inline&&
+m.unshift(t);if(t.parent)n(t,t.parent,1);else{f.isOrphan=1;break}}else break}k(d);j();f.parent=t;f.isEmpty?n(f):t=f}}};o.onTagClose=function(a){for(var b=m.length-1;b>=0;b--)if(a==m[b].name){m.splice(b,1);return}for(var c=[],d=[],e=t;e!=r&&e.name!=a;){e._.isBlockLike||d.unshift(e);c.push(e);e=e.returnPoint||e.parent}if(e!=r){for(b=0;b<c.length;b++){var g=c[b];n(g,g.parent)}t=e;e._.isBlockLike&&j();n(e,e.parent);if(e==t)t=t.parent;m=m.concat(d)}a=="body"&&(f=false)};o.onText=function(a){if((!t._.hasInlineStarted||
+p.length)&&!u&&!w){a=CKEDITOR.tools.ltrim(a);if(a.length===0)return}var b=t.name,g=b?CKEDITOR.dtd[b]||(t._.isBlockLike?CKEDITOR.dtd.div:CKEDITOR.dtd.span):c;if(!w&&!g["#"]&&b in e){o.onTagOpen(d[b]||"");o.onText(a)}else{j();k();!u&&!w&&(a=a.replace(/[\t\r\n ]{2,}|[\t\r\n]/g," "));a=new CKEDITOR.htmlParser.text(a);if(q(t,a))this.onTagOpen(f,{},0,1);t.add(a)}};o.onCDATA=function(a){t.add(new CKEDITOR.htmlParser.cdata(a))};o.onComment=function(a){j();k();t.add(new CKEDITOR.htmlParser.comment(a))};o.parse(i);
+for(j();t!=r;)n(t,t.parent,1);g(r);return r};CKEDITOR.htmlParser.fragment.prototype={type:CKEDITOR.NODE_DOCUMENT_FRAGMENT,add:function(a,b){isNaN(b)&&(b=this.children.length);var c=b>0?this.children[b-1]:null;if(c){if(a._.isBlockLike&&c.type==CKEDITOR.NODE_TEXT){c.value=CKEDITOR.tools.rtrim(c.value);if(c.value.length===0){this.children.pop();this.add(a);return}}c.next=a}a.previous=c;a.parent=this;this.children.splice(b,0,a);if(!this._.hasInlineStarted)this._.hasInlineStarted=a.type==CKEDITOR.NODE_TEXT||
+a.type==CKEDITOR.NODE_ELEMENT&&!a._.isBlockLike},filter:function(a,b){b=this.getFilterContext(b);a.onRoot(b,this);this.filterChildren(a,false,b)},filterChildren:function(a,b,c){if(this.childrenFilteredBy!=a.id){c=this.getFilterContext(c);if(b&&!this.parent)a.onRoot(c,this);this.childrenFilteredBy=a.id;for(b=0;b<this.children.length;b++)this.children[b].filter(a,c)===false&&b--}},writeHtml:function(a,b){b&&this.filter(b);this.writeChildrenHtml(a)},writeChildrenHtml:function(a,b,c){var d=this.getFilterContext();
+if(c&&!this.parent&&b)b.onRoot(d,this);b&&this.filterChildren(b,false,d);b=0;c=this.children;for(d=c.length;b<d;b++)c[b].writeHtml(a)},forEach:function(a,b,c){if(!c&&(!b||this.type==b))var d=a(this);if(d!==false)for(var c=this.children,e=0;e<c.length;e++){d=c[e];d.type==CKEDITOR.NODE_ELEMENT?d.forEach(a,b):(!b||d.type==b)&&a(d)}},getFilterContext:function(a){return a||{}}}}(),"use strict",function(){function a(){this.rules=[]}function e(b,c,d,e){var h,f;for(h in c){(f=b[h])||(f=b[h]=new a);f.add(c[h],
+d,e)}}CKEDITOR.htmlParser.filter=CKEDITOR.tools.createClass({$:function(b){this.id=CKEDITOR.tools.getNextNumber();this.elementNameRules=new a;this.attributeNameRules=new a;this.elementsRules={};this.attributesRules={};this.textRules=new a;this.commentRules=new a;this.rootRules=new a;b&&this.addRules(b,10)},proto:{addRules:function(a,c){var d;if(typeof c=="number")d=c;else if(c&&"priority"in c)d=c.priority;typeof d!="number"&&(d=10);typeof c!="object"&&(c={});a.elementNames&&this.elementNameRules.addMany(a.elementNames,
+d,c);a.attributeNames&&this.attributeNameRules.addMany(a.attributeNames,d,c);a.elements&&e(this.elementsRules,a.elements,d,c);a.attributes&&e(this.attributesRules,a.attributes,d,c);a.text&&this.textRules.add(a.text,d,c);a.comment&&this.commentRules.add(a.comment,d,c);a.root&&this.rootRules.add(a.root,d,c)},applyTo:function(a){a.filter(this)},onElementName:function(a,c){return this.elementNameRules.execOnName(a,c)},onAttributeName:function(a,c){return this.attributeNameRules.execOnName(a,c)},onText:function(a,
+c,d){return this.textRules.exec(a,c,d)},onComment:function(a,c,d){return this.commentRules.exec(a,c,d)},onRoot:function(a,c){return this.rootRules.exec(a,c)},onElement:function(a,c){for(var d=[this.elementsRules["^"],this.elementsRules[c.name],this.elementsRules.$],e,h=0;h<3;h++)if(e=d[h]){e=e.exec(a,c,this);if(e===false)return null;if(e&&e!=c)return this.onNode(a,e);if(c.parent&&!c.name)break}return c},onNode:function(a,c){var d=c.type;return d==CKEDITOR.NODE_ELEMENT?this.onElement(a,c):d==CKEDITOR.NODE_TEXT?
+new CKEDITOR.htmlParser.text(this.onText(a,c.value)):d==CKEDITOR.NODE_COMMENT?new CKEDITOR.htmlParser.comment(this.onComment(a,c.value)):null},onAttribute:function(a,c,d,e){return(d=this.attributesRules[d])?d.exec(a,e,c,this):e}}});CKEDITOR.htmlParser.filterRulesGroup=a;a.prototype={add:function(a,c,d){this.rules.splice(this.findIndex(c),0,{value:a,priority:c,options:d})},addMany:function(a,c,d){for(var e=[this.findIndex(c),0],h=0,f=a.length;h<f;h++)e.push({value:a[h],priority:c,options:d});this.rules.splice.apply(this.rules,
+e)},findIndex:function(a){for(var c=this.rules,d=c.length-1;d>=0&&a<c[d].priority;)d--;return d+1},exec:function(a,c){var d=c instanceof CKEDITOR.htmlParser.node||c instanceof CKEDITOR.htmlParser.fragment,e=Array.prototype.slice.call(arguments,1),h=this.rules,f=h.length,k,j,g,n;for(n=0;n<f;n++){if(d){k=c.type;j=c.name}g=h[n];if(!(a.nonEditable&&!g.options.applyToAll||a.nestedEditable&&g.options.excludeNestedEditable)){g=g.value.apply(null,e);if(g===false||d&&g&&(g.name!=j||g.type!=k))return g;g!=
+null&&(e[0]=c=g)}}return c},execOnName:function(a,c){for(var d=0,e=this.rules,h=e.length,f;c&&d<h;d++){f=e[d];!(a.nonEditable&&!f.options.applyToAll||a.nestedEditable&&f.options.excludeNestedEditable)&&(c=c.replace(f.value[0],f.value[1]))}return c}}}(),function(){function a(a,f){function e(a){return a||CKEDITOR.env.needsNbspFiller?new CKEDITOR.htmlParser.text(" "):new CKEDITOR.htmlParser.element("br",{"data-cke-bogus":1})}function g(a,d){return function(f){if(f.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT){var g=
+[],h=b(f),k,m;if(h)for(j(h,1)&&g.push(h);h;){if(i(h)&&(k=c(h))&&j(k))if((m=c(k))&&!i(m))g.push(k);else{e(v).insertAfter(k);k.remove()}h=h.previous}for(h=0;h<g.length;h++)g[h].remove();if(g=!a||(typeof d=="function"?d(f):d)!==false)if(!v&&!CKEDITOR.env.needsBrFiller&&f.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT)g=false;else if(!v&&!CKEDITOR.env.needsBrFiller&&(document.documentMode>7||f.name in CKEDITOR.dtd.tr||f.name in CKEDITOR.dtd.$listItem))g=false;else{g=b(f);g=!g||f.name=="form"&&g.name=="input"}g&&
+f.add(e(a))}}}function j(a,b){if((!v||CKEDITOR.env.needsBrFiller)&&a.type==CKEDITOR.NODE_ELEMENT&&a.name=="br"&&!a.attributes["data-cke-eol"])return true;var c;if(a.type==CKEDITOR.NODE_TEXT&&(c=a.value.match(m))){if(c.index){(new CKEDITOR.htmlParser.text(a.value.substring(0,c.index))).insertBefore(a);a.value=c[0]}if(!CKEDITOR.env.needsBrFiller&&v&&(!b||a.parent.name in o))return true;if(!v)if((c=a.previous)&&c.name=="br"||!c||i(c))return true}return false}var k={elements:{}},v=f=="html",o=CKEDITOR.tools.extend({},
+u),p;for(p in o)"#"in t[p]||delete o[p];for(p in o)k.elements[p]=g(v,a.config.fillEmptyBlocks);k.root=g(v,false);k.elements.br=function(a){return function(b){if(b.parent.type!=CKEDITOR.NODE_DOCUMENT_FRAGMENT){var f=b.attributes;if("data-cke-bogus"in f||"data-cke-eol"in f)delete f["data-cke-bogus"];else{for(f=b.next;f&&d(f);)f=f.next;var g=c(b);!f&&i(b.parent)?h(b.parent,e(a)):i(f)&&(g&&!i(g))&&e(a).insertBefore(f)}}}}(v);return k}function e(a,b){return a!=CKEDITOR.ENTER_BR&&b!==false?a==CKEDITOR.ENTER_DIV?
+"div":"p":false}function b(a){for(a=a.children[a.children.length-1];a&&d(a);)a=a.previous;return a}function c(a){for(a=a.previous;a&&d(a);)a=a.previous;return a}function d(a){return a.type==CKEDITOR.NODE_TEXT&&!CKEDITOR.tools.trim(a.value)||a.type==CKEDITOR.NODE_ELEMENT&&a.attributes["data-cke-bookmark"]}function i(a){return a&&(a.type==CKEDITOR.NODE_ELEMENT&&a.name in u||a.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT)}function h(a,b){var c=a.children[a.children.length-1];a.children.push(b);b.parent=a;if(c){c.next=
+b;b.previous=c}}function f(a){a=a.attributes;a.contenteditable!="false"&&(a["data-cke-editable"]=a.contenteditable?"true":1);a.contenteditable="false"}function k(a){a=a.attributes;switch(a["data-cke-editable"]){case "true":a.contenteditable="true";break;case "1":delete a.contenteditable}}function j(a){return a.replace(z,function(a,b,c){return"<"+b+c.replace(B,function(a,b){return A.test(b)&&c.indexOf("data-cke-saved-"+b)==-1?" data-cke-saved-"+a+" data-cke-"+CKEDITOR.rnd+"-"+a:a})+">"})}function g(a,
+b){return a.replace(b,function(a,b,c){a.indexOf("<textarea")===0&&(a=b+l(c).replace(/</g,"&lt;").replace(/>/g,"&gt;")+"</textarea>");return"<cke:encoded>"+encodeURIComponent(a)+"</cke:encoded>"})}function n(a){return a.replace(H,function(a,b){return decodeURIComponent(b)})}function q(a){return a.replace(/<\!--(?!{cke_protected})[\s\S]+?--\>/g,function(a){return"<\!--"+p+"{C}"+encodeURIComponent(a).replace(/--/g,"%2D%2D")+"--\>"})}function l(a){return a.replace(/<\!--\{cke_protected\}\{C\}([\s\S]+?)--\>/g,
+function(a,b){return decodeURIComponent(b)})}function o(a,b){var c=b._.dataStore;return a.replace(/<\!--\{cke_protected\}([\s\S]+?)--\>/g,function(a,b){return decodeURIComponent(b)}).replace(/\{cke_protected_(\d+)\}/g,function(a,b){return c&&c[b]||""})}function r(a,b){for(var c=[],d=b.config.protectedSource,f=b._.dataStore||(b._.dataStore={id:1}),e=/<\!--\{cke_temp(comment)?\}(\d*?)--\>/g,d=[/<script[\s\S]*?(<\/script>|$)/gi,/<noscript[\s\S]*?<\/noscript>/gi,/<meta[\s\S]*?\/?>/gi].concat(d),a=a.replace(/<\!--[\s\S]*?--\>/g,
+function(a){return"<\!--{cke_tempcomment}"+(c.push(a)-1)+"--\>"}),g=0;g<d.length;g++)a=a.replace(d[g],function(a){a=a.replace(e,function(a,b,d){return c[d]});return/cke_temp(comment)?/.test(a)?a:"<\!--{cke_temp}"+(c.push(a)-1)+"--\>"});a=a.replace(e,function(a,b,d){return"<\!--"+p+(b?"{C}":"")+encodeURIComponent(c[d]).replace(/--/g,"%2D%2D")+"--\>"});a=a.replace(/<\w+(?:\s+(?:(?:[^\s=>]+\s*=\s*(?:[^'"\s>]+|'[^']*'|"[^"]*"))|[^\s=\/>]+))+\s*\/?>/g,function(a){return a.replace(/<\!--\{cke_protected\}([^>]*)--\>/g,
+function(a,b){f[f.id]=decodeURIComponent(b);return"{cke_protected_"+f.id++ +"}"})});return a=a.replace(/<(title|iframe|textarea)([^>]*)>([\s\S]*?)<\/\1>/g,function(a,c,d,f){return"<"+c+d+">"+o(l(f),b)+"</"+c+">"})}CKEDITOR.htmlDataProcessor=function(b){var c,d,f=this;this.editor=b;this.dataFilter=c=new CKEDITOR.htmlParser.filter;this.htmlFilter=d=new CKEDITOR.htmlParser.filter;this.writer=new CKEDITOR.htmlParser.basicWriter;c.addRules(x);c.addRules(v,{applyToAll:true});c.addRules(a(b,"data"),{applyToAll:true});
+d.addRules(s);d.addRules(y,{applyToAll:true});d.addRules(a(b,"html"),{applyToAll:true});b.on("toHtml",function(a){var a=a.data,c=a.dataValue,d,c=r(c,b),c=g(c,C),c=j(c),c=g(c,D),c=c.replace(E,"$1cke:$2"),c=c.replace(L,"<cke:$1$2></cke:$1>"),c=c.replace(/(<pre\b[^>]*>)(\r\n|\n)/g,"$1$2$2"),c=c.replace(/([^a-z0-9<\-])(on\w{3,})(?!>)/gi,"$1data-cke-"+CKEDITOR.rnd+"-$2");d=a.context||b.editable().getName();var f;if(CKEDITOR.env.ie&&CKEDITOR.env.version<9&&d=="pre"){d="div";c="<pre>"+c+"</pre>";f=1}d=b.document.createElement(d);
+d.setHtml("a"+c);c=d.getHtml().substr(1);c=c.replace(RegExp("data-cke-"+CKEDITOR.rnd+"-","ig"),"");f&&(c=c.replace(/^<pre>|<\/pre>$/gi,""));c=c.replace(G,"$1$2");c=n(c);c=l(c);d=a.fixForBody===false?false:e(a.enterMode,b.config.autoParagraph);c=CKEDITOR.htmlParser.fragment.fromHtml(c,a.context,d);if(d){f=c;if(!f.children.length&&CKEDITOR.dtd[f.name][d]){d=new CKEDITOR.htmlParser.element(d);f.add(d)}}a.dataValue=c},null,null,5);b.on("toHtml",function(a){a.data.filter.applyTo(a.data.dataValue,true,
+a.data.dontFilter,a.data.enterMode)&&b.fire("dataFiltered")},null,null,6);b.on("toHtml",function(a){a.data.dataValue.filterChildren(f.dataFilter,true)},null,null,10);b.on("toHtml",function(a){var a=a.data,b=a.dataValue,c=new CKEDITOR.htmlParser.basicWriter;b.writeChildrenHtml(c);b=c.getHtml(true);a.dataValue=q(b)},null,null,15);b.on("toDataFormat",function(a){var c=a.data.dataValue;a.data.enterMode!=CKEDITOR.ENTER_BR&&(c=c.replace(/^<br *\/?>/i,""));a.data.dataValue=CKEDITOR.htmlParser.fragment.fromHtml(c,
+a.data.context,e(a.data.enterMode,b.config.autoParagraph))},null,null,5);b.on("toDataFormat",function(a){a.data.dataValue.filterChildren(f.htmlFilter,true)},null,null,10);b.on("toDataFormat",function(a){a.data.filter.applyTo(a.data.dataValue,false,true)},null,null,11);b.on("toDataFormat",function(a){var c=a.data.dataValue,d=f.writer;d.reset();c.writeChildrenHtml(d);c=d.getHtml(true);c=l(c);c=o(c,b);a.data.dataValue=c},null,null,15)};CKEDITOR.htmlDataProcessor.prototype={toHtml:function(a,b,c,d){var f=
+this.editor,e,g,i,j;if(b&&typeof b=="object"){e=b.context;c=b.fixForBody;d=b.dontFilter;g=b.filter;i=b.enterMode;j=b.protectedWhitespaces}else e=b;!e&&e!==null&&(e=f.editable().getName());return f.fire("toHtml",{dataValue:a,context:e,fixForBody:c,dontFilter:d,filter:g||f.filter,enterMode:i||f.enterMode,protectedWhitespaces:j}).dataValue},toDataFormat:function(a,b){var c,d,f;if(b){c=b.context;d=b.filter;f=b.enterMode}!c&&c!==null&&(c=this.editor.editable().getName());return this.editor.fire("toDataFormat",
+{dataValue:a,filter:d||this.editor.filter,context:c,enterMode:f||this.editor.enterMode}).dataValue}};var m=/(?:&nbsp;|\xa0)$/,p="{cke_protected}",t=CKEDITOR.dtd,w=["caption","colgroup","col","thead","tfoot","tbody"],u=CKEDITOR.tools.extend({},t.$blockLimit,t.$block),x={elements:{input:f,textarea:f}},v={attributeNames:[[/^on/,"data-cke-pa-on"],[/^data-cke-expando$/,""]]},s={elements:{embed:function(a){var b=a.parent;if(b&&b.name=="object"){var c=b.attributes.width,b=b.attributes.height;if(c)a.attributes.width=
+c;if(b)a.attributes.height=b}},a:function(a){var b=a.attributes;if(!a.children.length&&!b.name&&!b.id&&!a.attributes["data-cke-saved-name"])return false}}},y={elementNames:[[/^cke:/,""],[/^\?xml:namespace$/,""]],attributeNames:[[/^data-cke-(saved|pa)-/,""],[/^data-cke-.*/,""],["hidefocus",""]],elements:{$:function(a){var b=a.attributes;if(b){if(b["data-cke-temp"])return false;for(var c=["name","href","src"],d,f=0;f<c.length;f++){d="data-cke-saved-"+c[f];d in b&&delete b[c[f]]}}return a},table:function(a){a.children.slice(0).sort(function(a,
+b){var c,d;if(a.type==CKEDITOR.NODE_ELEMENT&&b.type==a.type){c=CKEDITOR.tools.indexOf(w,a.name);d=CKEDITOR.tools.indexOf(w,b.name)}if(!(c>-1&&d>-1&&c!=d)){c=a.parent?a.getIndex():-1;d=b.parent?b.getIndex():-1}return c>d?1:-1})},param:function(a){a.children=[];a.isEmpty=true;return a},span:function(a){a.attributes["class"]=="Apple-style-span"&&delete a.name},html:function(a){delete a.attributes.contenteditable;delete a.attributes["class"]},body:function(a){delete a.attributes.spellcheck;delete a.attributes.contenteditable},
+style:function(a){var b=a.children[0];if(b&&b.value)b.value=CKEDITOR.tools.trim(b.value);if(!a.attributes.type)a.attributes.type="text/css"},title:function(a){var b=a.children[0];!b&&h(a,b=new CKEDITOR.htmlParser.text);b.value=a.attributes["data-cke-title"]||""},input:k,textarea:k},attributes:{"class":function(a){return CKEDITOR.tools.ltrim(a.replace(/(?:^|\s+)cke_[^\s]*/g,""))||false}}};if(CKEDITOR.env.ie)y.attributes.style=function(a){return a.replace(/(^|;)([^\:]+)/g,function(a){return a.toLowerCase()})};
+var z=/<(a|area|img|input|source)\b([^>]*)>/gi,B=/([\w-:]+)\s*=\s*(?:(?:"[^"]*")|(?:'[^']*')|(?:[^ "'>]+))/gi,A=/^(href|src|name)$/i,D=/(?:<style(?=[ >])[^>]*>[\s\S]*?<\/style>)|(?:<(:?link|meta|base)[^>]*>)/gi,C=/(<textarea(?=[ >])[^>]*>)([\s\S]*?)(?:<\/textarea>)/gi,H=/<cke:encoded>([^<]*)<\/cke:encoded>/gi,E=/(<\/?)((?:object|embed|param|html|body|head|title)[^>]*>)/gi,G=/(<\/?)cke:((?:html|body|head|title)[^>]*>)/gi,L=/<cke:(param|embed)([^>]*?)\/?>(?!\s*<\/cke:\1)/gi}(),"use strict",CKEDITOR.htmlParser.element=
+function(a,e){this.name=a;this.attributes=e||{};this.children=[];var b=a||"",c=b.match(/^cke:(.*)/);c&&(b=c[1]);b=!(!CKEDITOR.dtd.$nonBodyContent[b]&&!CKEDITOR.dtd.$block[b]&&!CKEDITOR.dtd.$listItem[b]&&!CKEDITOR.dtd.$tableContent[b]&&!(CKEDITOR.dtd.$nonEditable[b]||b=="br"));this.isEmpty=!!CKEDITOR.dtd.$empty[a];this.isUnknown=!CKEDITOR.dtd[a];this._={isBlockLike:b,hasInlineStarted:this.isEmpty||!b}},CKEDITOR.htmlParser.cssStyle=function(a){var e={};((a instanceof CKEDITOR.htmlParser.element?a.attributes.style:
+a)||"").replace(/&quot;/g,'"').replace(/\s*([^ :;]+)\s*:\s*([^;]+)\s*(?=;|$)/g,function(a,c,d){c=="font-family"&&(d=d.replace(/["']/g,""));e[c.toLowerCase()]=d});return{rules:e,populate:function(a){var c=this.toString();if(c)a instanceof CKEDITOR.dom.element?a.setAttribute("style",c):a instanceof CKEDITOR.htmlParser.element?a.attributes.style=c:a.style=c},toString:function(){var a=[],c;for(c in e)e[c]&&a.push(c,":",e[c],";");return a.join("")}}},function(){function a(a){return function(b){return b.type==
+CKEDITOR.NODE_ELEMENT&&(typeof a=="string"?b.name==a:b.name in a)}}var e=function(a,b){a=a[0];b=b[0];return a<b?-1:a>b?1:0},b=CKEDITOR.htmlParser.fragment.prototype;CKEDITOR.htmlParser.element.prototype=CKEDITOR.tools.extend(new CKEDITOR.htmlParser.node,{type:CKEDITOR.NODE_ELEMENT,add:b.add,clone:function(){return new CKEDITOR.htmlParser.element(this.name,this.attributes)},filter:function(a,b){var e=this,h,f,b=e.getFilterContext(b);if(b.off)return true;if(!e.parent)a.onRoot(b,e);for(;;){h=e.name;
+if(!(f=a.onElementName(b,h))){this.remove();return false}e.name=f;if(!(e=a.onElement(b,e))){this.remove();return false}if(e!==this){this.replaceWith(e);return false}if(e.name==h)break;if(e.type!=CKEDITOR.NODE_ELEMENT){this.replaceWith(e);return false}if(!e.name){this.replaceWithChildren();return false}}h=e.attributes;var k,j;for(k in h){j=k;for(f=h[k];;)if(j=a.onAttributeName(b,k))if(j!=k){delete h[k];k=j}else break;else{delete h[k];break}j&&((f=a.onAttribute(b,e,j,f))===false?delete h[j]:h[j]=f)}e.isEmpty||
+this.filterChildren(a,false,b);return true},filterChildren:b.filterChildren,writeHtml:function(a,b){b&&this.filter(b);var i=this.name,h=[],f=this.attributes,k,j;a.openTag(i,f);for(k in f)h.push([k,f[k]]);a.sortAttributes&&h.sort(e);k=0;for(j=h.length;k<j;k++){f=h[k];a.attribute(f[0],f[1])}a.openTagClose(i,this.isEmpty);this.writeChildrenHtml(a);this.isEmpty||a.closeTag(i)},writeChildrenHtml:b.writeChildrenHtml,replaceWithChildren:function(){for(var a=this.children,b=a.length;b;)a[--b].insertAfter(this);
+this.remove()},forEach:b.forEach,getFirst:function(b){if(!b)return this.children.length?this.children[0]:null;typeof b!="function"&&(b=a(b));for(var d=0,e=this.children.length;d<e;++d)if(b(this.children[d]))return this.children[d];return null},getHtml:function(){var a=new CKEDITOR.htmlParser.basicWriter;this.writeChildrenHtml(a);return a.getHtml()},setHtml:function(a){for(var a=this.children=CKEDITOR.htmlParser.fragment.fromHtml(a).children,b=0,e=a.length;b<e;++b)a[b].parent=this},getOuterHtml:function(){var a=
+new CKEDITOR.htmlParser.basicWriter;this.writeHtml(a);return a.getHtml()},split:function(a){for(var b=this.children.splice(a,this.children.length-a),e=this.clone(),h=0;h<b.length;++h)b[h].parent=e;e.children=b;if(b[0])b[0].previous=null;if(a>0)this.children[a-1].next=null;this.parent.add(e,this.getIndex()+1);return e},addClass:function(a){if(!this.hasClass(a)){var b=this.attributes["class"]||"";this.attributes["class"]=b+(b?" ":"")+a}},removeClass:function(a){var b=this.attributes["class"];if(b)(b=
+CKEDITOR.tools.trim(b.replace(RegExp("(?:\\s+|^)"+a+"(?:\\s+|$)")," ")))?this.attributes["class"]=b:delete this.attributes["class"]},hasClass:function(a){var b=this.attributes["class"];return!b?false:RegExp("(?:^|\\s)"+a+"(?=\\s|$)").test(b)},getFilterContext:function(a){var b=[];a||(a={off:false,nonEditable:false,nestedEditable:false});!a.off&&this.attributes["data-cke-processor"]=="off"&&b.push("off",true);!a.nonEditable&&this.attributes.contenteditable=="false"?b.push("nonEditable",true):a.nonEditable&&
+(!a.nestedEditable&&this.attributes.contenteditable=="true")&&b.push("nestedEditable",true);if(b.length)for(var a=CKEDITOR.tools.copy(a),e=0;e<b.length;e=e+2)a[b[e]]=b[e+1];return a}},true)}(),function(){var a={},e=/{([^}]+)}/g,b=/([\\'])/g,c=/\n/g,d=/\r/g;CKEDITOR.template=function(i){if(a[i])this.output=a[i];else{var h=i.replace(b,"\\$1").replace(c,"\\n").replace(d,"\\r").replace(e,function(a,b){return"',data['"+b+"']==undefined?'{"+b+"}':data['"+b+"'],'"});this.output=a[i]=Function("data","buffer",
+"return buffer?buffer.push('"+h+"'):['"+h+"'].join('');")}}}(),delete CKEDITOR.loadFullCore,CKEDITOR.instances={},CKEDITOR.document=new CKEDITOR.dom.document(document),CKEDITOR.add=function(a){CKEDITOR.instances[a.name]=a;a.on("focus",function(){if(CKEDITOR.currentInstance!=a){CKEDITOR.currentInstance=a;CKEDITOR.fire("currentInstance")}});a.on("blur",function(){if(CKEDITOR.currentInstance==a){CKEDITOR.currentInstance=null;CKEDITOR.fire("currentInstance")}});CKEDITOR.fire("instance",null,a)},CKEDITOR.remove=
+function(a){delete CKEDITOR.instances[a.name]},function(){var a={};CKEDITOR.addTemplate=function(e,b){var c=a[e];if(c)return c;c={name:e,source:b};CKEDITOR.fire("template",c);return a[e]=new CKEDITOR.template(c.source)};CKEDITOR.getTemplate=function(e){return a[e]}}(),function(){var a=[];CKEDITOR.addCss=function(e){a.push(e)};CKEDITOR.getCss=function(){return a.join("\n")}}(),CKEDITOR.on("instanceDestroyed",function(){CKEDITOR.tools.isEmpty(this.instances)&&CKEDITOR.fire("reset")}),CKEDITOR.TRISTATE_ON=
+1,CKEDITOR.TRISTATE_OFF=2,CKEDITOR.TRISTATE_DISABLED=0,function(){CKEDITOR.inline=function(a,e){if(!CKEDITOR.env.isCompatible)return null;a=CKEDITOR.dom.element.get(a);if(a.getEditor())throw'The editor instance "'+a.getEditor().name+'" is already attached to the provided element.';var b=new CKEDITOR.editor(e,a,CKEDITOR.ELEMENT_MODE_INLINE),c=a.is("textarea")?a:null;if(c){b.setData(c.getValue(),null,true);a=CKEDITOR.dom.element.createFromHtml('<div contenteditable="'+!!b.readOnly+'" class="cke_textarea_inline">'+
+c.getValue()+"</div>",CKEDITOR.document);a.insertAfter(c);c.hide();c.$.form&&b._attachToForm()}else b.setData(a.getHtml(),null,true);b.on("loaded",function(){b.fire("uiReady");b.editable(a);b.container=a;b.ui.contentsElement=a;b.setData(b.getData(1));b.resetDirty();b.fire("contentDom");b.mode="wysiwyg";b.fire("mode");b.status="ready";b.fireOnce("instanceReady");CKEDITOR.fire("instanceReady",null,b)},null,null,1E4);b.on("destroy",function(){if(c){b.container.clearCustomData();b.container.remove();
+c.show()}b.element.clearCustomData();delete b.element});return b};CKEDITOR.inlineAll=function(){var a,e,b;for(b in CKEDITOR.dtd.$editable)for(var c=CKEDITOR.document.getElementsByTag(b),d=0,i=c.count();d<i;d++){a=c.getItem(d);if(a.getAttribute("contenteditable")=="true"){e={element:a,config:{}};CKEDITOR.fire("inline",e)!==false&&CKEDITOR.inline(a,e.config)}}};CKEDITOR.domReady(function(){!CKEDITOR.disableAutoInline&&CKEDITOR.inlineAll()})}(),CKEDITOR.replaceClass="ckeditor",function(){function a(a,
+d,i,h){if(!CKEDITOR.env.isCompatible)return null;a=CKEDITOR.dom.element.get(a);if(a.getEditor())throw'The editor instance "'+a.getEditor().name+'" is already attached to the provided element.';var f=new CKEDITOR.editor(d,a,h);if(h==CKEDITOR.ELEMENT_MODE_REPLACE){a.setStyle("visibility","hidden");f._.required=a.hasAttribute("required");a.removeAttribute("required")}i&&f.setData(i,null,true);f.on("loaded",function(){b(f);h==CKEDITOR.ELEMENT_MODE_REPLACE&&(f.config.autoUpdateElement&&a.$.form)&&f._attachToForm();
+f.setMode(f.config.startupMode,function(){f.resetDirty();f.status="ready";f.fireOnce("instanceReady");CKEDITOR.fire("instanceReady",null,f)})});f.on("destroy",e);return f}function e(){var a=this.container,b=this.element;if(a){a.clearCustomData();a.remove()}if(b){b.clearCustomData();if(this.elementMode==CKEDITOR.ELEMENT_MODE_REPLACE){b.show();this._.required&&b.setAttribute("required","required")}delete this.element}}function b(a){var b=a.name,e=a.element,h=a.elementMode,f=a.fire("uiSpace",{space:"top",
+html:""}).html,k=a.fire("uiSpace",{space:"bottom",html:""}).html,j=new CKEDITOR.template('<{outerEl} id="cke_{name}" class="{id} cke cke_reset cke_chrome cke_editor_{name} cke_{langDir} '+CKEDITOR.env.cssClass+'"  dir="{langDir}" lang="{langCode}" role="application"'+(a.title?' aria-labelledby="cke_{name}_arialbl"':"")+">"+(a.title?'<span id="cke_{name}_arialbl" class="cke_voice_label">{voiceLabel}</span>':"")+'<{outerEl} class="cke_inner cke_reset" role="presentation">{topHtml}<{outerEl} id="{contentId}" class="cke_contents cke_reset" role="presentation"></{outerEl}>{bottomHtml}</{outerEl}></{outerEl}>'),
+b=CKEDITOR.dom.element.createFromHtml(j.output({id:a.id,name:b,langDir:a.lang.dir,langCode:a.langCode,voiceLabel:a.title,topHtml:f?'<span id="'+a.ui.spaceId("top")+'" class="cke_top cke_reset_all" role="presentation" style="height:auto">'+f+"</span>":"",contentId:a.ui.spaceId("contents"),bottomHtml:k?'<span id="'+a.ui.spaceId("bottom")+'" class="cke_bottom cke_reset_all" role="presentation">'+k+"</span>":"",outerEl:CKEDITOR.env.ie?"span":"div"}));if(h==CKEDITOR.ELEMENT_MODE_REPLACE){e.hide();b.insertAfter(e)}else e.append(b);
+a.container=b;a.ui.contentsElement=a.ui.space("contents");f&&a.ui.space("top").unselectable();k&&a.ui.space("bottom").unselectable();e=a.config.width;h=a.config.height;e&&b.setStyle("width",CKEDITOR.tools.cssLength(e));h&&a.ui.space("contents").setStyle("height",CKEDITOR.tools.cssLength(h));b.disableContextMenu();CKEDITOR.env.webkit&&b.on("focus",function(){a.focus()});a.fireOnce("uiReady")}CKEDITOR.replace=function(b,d){return a(b,d,null,CKEDITOR.ELEMENT_MODE_REPLACE)};CKEDITOR.appendTo=function(b,
+d,e){return a(b,d,e,CKEDITOR.ELEMENT_MODE_APPENDTO)};CKEDITOR.replaceAll=function(){for(var a=document.getElementsByTagName("textarea"),b=0;b<a.length;b++){var e=null,h=a[b];if(h.name||h.id){if(typeof arguments[0]=="string"){if(!RegExp("(?:^|\\s)"+arguments[0]+"(?:$|\\s)").test(h.className))continue}else if(typeof arguments[0]=="function"){e={};if(arguments[0](h,e)===false)continue}this.replace(h,e)}}};CKEDITOR.editor.prototype.addMode=function(a,b){(this._.modes||(this._.modes={}))[a]=b};CKEDITOR.editor.prototype.setMode=
+function(a,b){var e=this,h=this._.modes;if(!(a==e.mode||!h||!h[a])){e.fire("beforeSetMode",a);if(e.mode){var f=e.checkDirty(),h=e._.previousModeData,k,j=0;e.fire("beforeModeUnload");e.editable(0);e._.previousMode=e.mode;e._.previousModeData=k=e.getData(1);if(e.mode=="source"&&h==k){e.fire("lockSnapshot",{forceUpdate:true});j=1}e.ui.space("contents").setHtml("");e.mode=""}else e._.previousModeData=e.getData(1);this._.modes[a](function(){e.mode=a;f!==void 0&&!f&&e.resetDirty();j?e.fire("unlockSnapshot"):
+a=="wysiwyg"&&e.fire("saveSnapshot");setTimeout(function(){e.fire("mode");b&&b.call(e)},0)})}};CKEDITOR.editor.prototype.resize=function(a,b,e,h){var f=this.container,k=this.ui.space("contents"),j=CKEDITOR.env.webkit&&this.document&&this.document.getWindow().$.frameElement,h=h?this.container.getFirst(function(a){return a.type==CKEDITOR.NODE_ELEMENT&&a.hasClass("cke_inner")}):f;h.setSize("width",a,true);j&&(j.style.width="1%");var g=(h.$.offsetHeight||0)-(k.$.clientHeight||0),f=Math.max(b-(e?0:g),
+0),b=e?b+g:b;k.setStyle("height",f+"px");j&&(j.style.width="100%");this.fire("resize",{outerHeight:b,contentsHeight:f,outerWidth:a||h.getSize("width")})};CKEDITOR.editor.prototype.getResizable=function(a){return a?this.ui.space("contents"):this.container};CKEDITOR.domReady(function(){CKEDITOR.replaceClass&&CKEDITOR.replaceAll(CKEDITOR.replaceClass)})}(),CKEDITOR.config.startupMode="wysiwyg",function(){var a,e,b,c;function d(a){var b=a.editor,c=a.data.path,d=c.blockLimit,e=a.data.selection,j=e.getRanges()[0],
+h;if(CKEDITOR.env.gecko||CKEDITOR.env.ie&&CKEDITOR.env.needsBrFiller)if(e=i(e,c)){e.appendBogus();h=CKEDITOR.env.ie}if(g(b,c.block,d)&&j.collapsed&&!j.getCommonAncestor().isReadOnly()){c=j.clone();c.enlarge(CKEDITOR.ENLARGE_BLOCK_CONTENTS);d=new CKEDITOR.dom.walker(c);d.guard=function(a){return!f(a)||a.type==CKEDITOR.NODE_COMMENT||a.isReadOnly()};if(!d.checkForward()||c.checkStartOfBlock()&&c.checkEndOfBlock()){b=j.fixBlock(true,b.activeEnterMode==CKEDITOR.ENTER_DIV?"div":"p");if(!CKEDITOR.env.needsBrFiller)(b=
+b.getFirst(f))&&(b.type==CKEDITOR.NODE_TEXT&&CKEDITOR.tools.trim(b.getText()).match(/^(?:&nbsp;|\xa0)$/))&&b.remove();h=1;a.cancel()}}h&&j.select()}function i(a,b){if(a.isFake)return 0;var c=b.block||b.blockLimit,d=c&&c.getLast(f);if(c&&c.isBlockBoundary()&&(!d||!(d.type==CKEDITOR.NODE_ELEMENT&&d.isBlockBoundary()))&&!c.is("pre")&&!c.getBogus())return c}function h(a){var b=a.data.getTarget();if(b.is("input")){b=b.getAttribute("type");(b=="submit"||b=="reset")&&a.data.preventDefault()}}function f(a){return o(a)&&
+r(a)}function k(a,b){return function(c){var d=c.data.$.toElement||c.data.$.fromElement||c.data.$.relatedTarget,d=d&&d.nodeType==CKEDITOR.NODE_ELEMENT?new CKEDITOR.dom.element(d):null;(!d||!b.equals(d)&&!b.contains(d))&&a.call(this,c)}}function j(a){function b(a){return function(b,d){d&&(b.type==CKEDITOR.NODE_ELEMENT&&b.is(e))&&(c=b);if(!d&&f(b)&&(!a||!p(b)))return false}}var c,d=a.getRanges()[0],a=a.root,e={table:1,ul:1,ol:1,dl:1};if(d.startPath().contains(e)){var g=d.clone();g.collapse(1);g.setStartAt(a,
+CKEDITOR.POSITION_AFTER_START);a=new CKEDITOR.dom.walker(g);a.guard=b();a.checkBackward();if(c){g=d.clone();g.collapse();g.setEndAt(c,CKEDITOR.POSITION_AFTER_END);a=new CKEDITOR.dom.walker(g);a.guard=b(true);c=false;a.checkForward();return c}}return null}function g(a,b,c){return a.config.autoParagraph!==false&&a.activeEnterMode!=CKEDITOR.ENTER_BR&&(a.editable().equals(c)&&!b||b&&b.getAttribute("contenteditable")=="true")}function n(a){return a.activeEnterMode!=CKEDITOR.ENTER_BR&&a.config.autoParagraph!==
+false?a.activeEnterMode==CKEDITOR.ENTER_DIV?"div":"p":false}function q(a){var b=a.editor;b.getSelection().scrollIntoView();setTimeout(function(){b.fire("saveSnapshot")},0)}function l(a,b,c){for(var d=a.getCommonAncestor(b),b=a=c?b:a;(a=a.getParent())&&!d.equals(a)&&a.getChildCount()==1;)b=a;b.remove()}CKEDITOR.editable=CKEDITOR.tools.createClass({base:CKEDITOR.dom.element,$:function(a,b){this.base(b.$||b);this.editor=a;this.status="unloaded";this.hasFocus=false;this.setup()},proto:{focus:function(){var a;
+if(CKEDITOR.env.webkit&&!this.hasFocus){a=this.editor._.previousActive||this.getDocument().getActive();if(this.contains(a)){a.focus();return}}try{this.$[CKEDITOR.env.ie&&this.getDocument().equals(CKEDITOR.document)?"setActive":"focus"]()}catch(b){if(!CKEDITOR.env.ie)throw b;}if(CKEDITOR.env.safari&&!this.isInline()){a=CKEDITOR.document.getActive();a.equals(this.getWindow().getFrame())||this.getWindow().focus()}},on:function(a,b){var c=Array.prototype.slice.call(arguments,0);if(CKEDITOR.env.ie&&/^focus|blur$/.exec(a)){a=
+a=="focus"?"focusin":"focusout";b=k(b,this);c[0]=a;c[1]=b}return CKEDITOR.dom.element.prototype.on.apply(this,c)},attachListener:function(a){!this._.listeners&&(this._.listeners=[]);var b=Array.prototype.slice.call(arguments,1),b=a.on.apply(a,b);this._.listeners.push(b);return b},clearListeners:function(){var a=this._.listeners;try{for(;a.length;)a.pop().removeListener()}catch(b){}},restoreAttrs:function(){var a=this._.attrChanges,b,c;for(c in a)if(a.hasOwnProperty(c)){b=a[c];b!==null?this.setAttribute(c,
+b):this.removeAttribute(c)}},attachClass:function(a){var b=this.getCustomData("classes");if(!this.hasClass(a)){!b&&(b=[]);b.push(a);this.setCustomData("classes",b);this.addClass(a)}},changeAttr:function(a,b){var c=this.getAttribute(a);if(b!==c){!this._.attrChanges&&(this._.attrChanges={});a in this._.attrChanges||(this._.attrChanges[a]=c);this.setAttribute(a,b)}},insertText:function(a){this.editor.focus();this.insertHtml(this.transformPlainTextToHtml(a),"text")},transformPlainTextToHtml:function(a){var b=
+this.editor.getSelection().getStartElement().hasAscendant("pre",true)?CKEDITOR.ENTER_BR:this.editor.activeEnterMode;return CKEDITOR.tools.transformPlainTextToHtml(a,b)},insertHtml:function(a,b,c){var d=this.editor;d.focus();d.fire("saveSnapshot");c||(c=d.getSelection().getRanges()[0]);w(this,b||"html",a,c);c.select();q(this);this.editor.fire("afterInsertHtml",{})},insertHtmlIntoRange:function(a,b,c){w(this,c||"html",a,b);this.editor.fire("afterInsertHtml",{intoRange:b})},insertElement:function(a,
+b){var c=this.editor;c.focus();c.fire("saveSnapshot");var d=c.activeEnterMode,c=c.getSelection(),e=a.getName(),e=CKEDITOR.dtd.$block[e];b||(b=c.getRanges()[0]);if(this.insertElementIntoRange(a,b)){b.moveToPosition(a,CKEDITOR.POSITION_AFTER_END);if(e)if((e=a.getNext(function(a){return f(a)&&!p(a)}))&&e.type==CKEDITOR.NODE_ELEMENT&&e.is(CKEDITOR.dtd.$block))e.getDtd()["#"]?b.moveToElementEditStart(e):b.moveToElementEditEnd(a);else if(!e&&d!=CKEDITOR.ENTER_BR){e=b.fixBlock(true,d==CKEDITOR.ENTER_DIV?
+"div":"p");b.moveToElementEditStart(e)}}c.selectRanges([b]);q(this)},insertElementIntoSelection:function(a){this.insertElement(a)},insertElementIntoRange:function(a,b){var c=this.editor,d=c.config.enterMode,f=a.getName(),e=CKEDITOR.dtd.$block[f];if(b.checkReadOnly())return false;b.deleteContents(1);b.startContainer.type==CKEDITOR.NODE_ELEMENT&&b.startContainer.is({tr:1,table:1,tbody:1,thead:1,tfoot:1})&&u(b);var g,j;if(e)for(;(g=b.getCommonAncestor(0,1))&&(j=CKEDITOR.dtd[g.getName()])&&(!j||!j[f]);)if(g.getName()in
+CKEDITOR.dtd.span)b.splitElement(g);else if(b.checkStartOfBlock()&&b.checkEndOfBlock()){b.setStartBefore(g);b.collapse(true);g.remove()}else b.splitBlock(d==CKEDITOR.ENTER_DIV?"div":"p",c.editable());b.insertNode(a);return true},setData:function(a,b){b||(a=this.editor.dataProcessor.toHtml(a));this.setHtml(a);this.fixInitialSelection();if(this.status=="unloaded")this.status="ready";this.editor.fire("dataReady")},getData:function(a){var b=this.getHtml();a||(b=this.editor.dataProcessor.toDataFormat(b));
+return b},setReadOnly:function(a){this.setAttribute("contenteditable",!a)},detach:function(){this.removeClass("cke_editable");this.status="detached";var a=this.editor;this._.detach();delete a.document;delete a.window},isInline:function(){return this.getDocument().equals(CKEDITOR.document)},fixInitialSelection:function(){function a(){var b=c.getDocument().$,d=b.getSelection(),f;if(d.anchorNode&&d.anchorNode==c.$)f=true;else if(CKEDITOR.env.webkit){var e=c.getDocument().getActive();e&&(e.equals(c)&&
+!d.anchorNode)&&(f=true)}if(f){f=new CKEDITOR.dom.range(c);f.moveToElementEditStart(c);b=b.createRange();b.setStart(f.startContainer.$,f.startOffset);b.collapse(true);d.removeAllRanges();d.addRange(b)}}function b(){var a=c.getDocument().$,d=a.selection,f=c.getDocument().getActive();if(d.type=="None"&&f.equals(c)){d=new CKEDITOR.dom.range(c);a=a.body.createTextRange();d.moveToElementEditStart(c);d=d.startContainer;d.type!=CKEDITOR.NODE_ELEMENT&&(d=d.getParent());a.moveToElementText(d.$);a.collapse(true);
+a.select()}}var c=this;if(CKEDITOR.env.ie&&(CKEDITOR.env.version<9||CKEDITOR.env.quirks)){if(this.hasFocus){this.focus();b()}}else if(this.hasFocus){this.focus();a()}else this.once("focus",function(){a()},null,null,-999)},getHtmlFromRange:function(d){if(d.collapsed)return new CKEDITOR.dom.documentFragment(d.document);d={doc:this.getDocument(),range:d.clone()};a.detect(d,this);e.exclude(d);b.shrink(d);d.fragment=d.range.cloneContents();c.rebuild(d,this);a.fix(d,this);return new CKEDITOR.dom.documentFragment(d.fragment.$)},
+extractHtmlFromRange:function(a,b){var c=x,d={range:a,doc:a.document},f=this.getHtmlFromRange(a);if(a.collapsed){a.optimize();return f}a.enlarge(CKEDITOR.ENLARGE_INLINE,1);c.table.detectPurge(d);d.bookmark=a.createBookmark();delete d.range;var e=this.editor.createRange();e.moveToPosition(d.bookmark.startNode,CKEDITOR.POSITION_BEFORE_START);d.targetBookmark=e.createBookmark();c.list.detectMerge(d,this);c.table.detectRanges(d,this);c.block.detectMerge(d,this);if(d.tableContentsRanges){c.table.deleteRanges(d);
+a.moveToBookmark(d.bookmark);d.range=a}else{a.moveToBookmark(d.bookmark);d.range=a;a.extractContents(c.detectExtractMerge(d))}a.moveToBookmark(d.targetBookmark);a.optimize();c.fixUneditableRangePosition(a);c.list.merge(d,this);c.table.purge(d,this);c.block.merge(d,this);if(b){c=a.startPath();if(d=a.checkStartOfBlock())if(d=a.checkEndOfBlock())if(d=c.block)if(d=!a.root.equals(c.block)){a:{var d=c.block.getElementsByTag("span"),e=0,g;if(d)for(;g=d.getItem(e++);)if(!r(g)){d=true;break a}d=false}d=!d}if(d){a.moveToPosition(c.block,
+CKEDITOR.POSITION_BEFORE_START);c.block.remove()}}else{c.autoParagraph(this.editor,a);m(a.startContainer)&&a.startContainer.appendBogus()}a.startContainer.mergeSiblings();return f},setup:function(){var a=this.editor;this.attachListener(a,"beforeGetData",function(){var b=this.getData();this.is("textarea")||a.config.ignoreEmptyParagraph!==false&&(b=b.replace(t,function(a,b){return b}));a.setData(b,null,1)},this);this.attachListener(a,"getSnapshot",function(a){a.data=this.getData(1)},this);this.attachListener(a,
+"afterSetData",function(){this.setData(a.getData(1))},this);this.attachListener(a,"loadSnapshot",function(a){this.setData(a.data,1)},this);this.attachListener(a,"beforeFocus",function(){var b=a.getSelection();(b=b&&b.getNative())&&b.type=="Control"||this.focus()},this);this.attachListener(a,"insertHtml",function(a){this.insertHtml(a.data.dataValue,a.data.mode,a.data.range)},this);this.attachListener(a,"insertElement",function(a){this.insertElement(a.data)},this);this.attachListener(a,"insertText",
+function(a){this.insertText(a.data)},this);this.setReadOnly(a.readOnly);this.attachClass("cke_editable");a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?this.attachClass("cke_editable_inline"):(a.elementMode==CKEDITOR.ELEMENT_MODE_REPLACE||a.elementMode==CKEDITOR.ELEMENT_MODE_APPENDTO)&&this.attachClass("cke_editable_themed");this.attachClass("cke_contents_"+a.config.contentsLangDirection);a.keystrokeHandler.blockedKeystrokes[8]=+a.readOnly;a.keystrokeHandler.attach(this);this.on("blur",function(){this.hasFocus=
+false},null,null,-1);this.on("focus",function(){this.hasFocus=true},null,null,-1);a.focusManager.add(this);if(this.equals(CKEDITOR.document.getActive())){this.hasFocus=true;a.once("contentDom",function(){a.focusManager.focus(this)},this)}this.isInline()&&this.changeAttr("tabindex",a.tabIndex);if(!this.is("textarea")){a.document=this.getDocument();a.window=this.getWindow();var b=a.document;this.changeAttr("spellcheck",!a.config.disableNativeSpellChecker);var c=a.config.contentsLangDirection;this.getDirection(1)!=
+c&&this.changeAttr("dir",c);var d=CKEDITOR.getCss();if(d){c=b.getHead();if(!c.getCustomData("stylesheet")){d=b.appendStyleText(d);d=new CKEDITOR.dom.element(d.ownerNode||d.owningElement);c.setCustomData("stylesheet",d);d.data("cke-temp",1)}}c=b.getCustomData("stylesheet_ref")||0;b.setCustomData("stylesheet_ref",c+1);this.setCustomData("cke_includeReadonly",!a.config.disableReadonlyStyling);this.attachListener(this,"click",function(a){var a=a.data,b=(new CKEDITOR.dom.elementPath(a.getTarget(),this)).contains("a");
+b&&(a.$.button!=2&&b.isReadOnly())&&a.preventDefault()});var e={8:1,46:1};this.attachListener(a,"key",function(b){if(a.readOnly)return true;var c=b.data.domEvent.getKey(),d;if(c in e){var b=a.getSelection(),f,g=b.getRanges()[0],i=g.startPath(),h,k,m,c=c==8;if(CKEDITOR.env.ie&&CKEDITOR.env.version<11&&(f=b.getSelectedElement())||(f=j(b))){a.fire("saveSnapshot");g.moveToPosition(f,CKEDITOR.POSITION_BEFORE_START);f.remove();g.select();a.fire("saveSnapshot");d=1}else if(g.collapsed)if((h=i.block)&&(m=
+h[c?"getPrevious":"getNext"](o))&&m.type==CKEDITOR.NODE_ELEMENT&&m.is("table")&&g[c?"checkStartOfBlock":"checkEndOfBlock"]()){a.fire("saveSnapshot");g[c?"checkEndOfBlock":"checkStartOfBlock"]()&&h.remove();g["moveToElementEdit"+(c?"End":"Start")](m);g.select();a.fire("saveSnapshot");d=1}else if(i.blockLimit&&i.blockLimit.is("td")&&(k=i.blockLimit.getAscendant("table"))&&g.checkBoundaryOfElement(k,c?CKEDITOR.START:CKEDITOR.END)&&(m=k[c?"getPrevious":"getNext"](o))){a.fire("saveSnapshot");g["moveToElementEdit"+
+(c?"End":"Start")](m);g.checkStartOfBlock()&&g.checkEndOfBlock()?m.remove():g.select();a.fire("saveSnapshot");d=1}else if((k=i.contains(["td","th","caption"]))&&g.checkBoundaryOfElement(k,c?CKEDITOR.START:CKEDITOR.END))d=1}return!d});a.blockless&&(CKEDITOR.env.ie&&CKEDITOR.env.needsBrFiller)&&this.attachListener(this,"keyup",function(b){if(b.data.getKeystroke()in e&&!this.getFirst(f)){this.appendBogus();b=a.createRange();b.moveToPosition(this,CKEDITOR.POSITION_AFTER_START);b.select()}});this.attachListener(this,
+"dblclick",function(b){if(a.readOnly)return false;b={element:b.data.getTarget()};a.fire("doubleclick",b)});CKEDITOR.env.ie&&this.attachListener(this,"click",h);(!CKEDITOR.env.ie||CKEDITOR.env.edge)&&this.attachListener(this,"mousedown",function(b){var c=b.data.getTarget();if(c.is("img","hr","input","textarea","select")&&!c.isReadOnly()){a.getSelection().selectElement(c);c.is("input","textarea","select")&&b.data.preventDefault()}});CKEDITOR.env.edge&&this.attachListener(this,"mouseup",function(b){(b=
+b.data.getTarget())&&b.is("img")&&a.getSelection().selectElement(b)});CKEDITOR.env.gecko&&this.attachListener(this,"mouseup",function(b){if(b.data.$.button==2){b=b.data.getTarget();if(!b.getOuterHtml().replace(t,"")){var c=a.createRange();c.moveToElementEditStart(b);c.select(true)}}});if(CKEDITOR.env.webkit){this.attachListener(this,"click",function(a){a.data.getTarget().is("input","select")&&a.data.preventDefault()});this.attachListener(this,"mouseup",function(a){a.data.getTarget().is("input","textarea")&&
+a.data.preventDefault()})}CKEDITOR.env.webkit&&this.attachListener(a,"key",function(b){if(a.readOnly)return true;b=b.data.domEvent.getKey();if(b in e){var c=b==8,d=a.getSelection().getRanges()[0],b=d.startPath();if(d.collapsed){var f;a:{var g=b.block;if(g)if(d[c?"checkStartOfBlock":"checkEndOfBlock"]())if(!d.moveToClosestEditablePosition(g,!c)||!d.collapsed)f=false;else{if(d.startContainer.type==CKEDITOR.NODE_ELEMENT){var j=d.startContainer.getChild(d.startOffset-(c?1:0));if(j&&j.type==CKEDITOR.NODE_ELEMENT&&
+j.is("hr")){a.fire("saveSnapshot");j.remove();f=true;break a}}if((d=d.startPath().block)&&(!d||!d.contains(g))){a.fire("saveSnapshot");var i;(i=(c?d:g).getBogus())&&i.remove();f=a.getSelection();i=f.createBookmarks();(c?g:d).moveChildren(c?d:g,false);b.lastElement.mergeSiblings();l(g,d,!c);f.selectBookmarks(i);f=true}}else f=false;else f=false}if(!f)return}else{c=d;f=b.block;i=c.endPath().block;if(!f||!i||f.equals(i))b=false;else{a.fire("saveSnapshot");(g=f.getBogus())&&g.remove();c.enlarge(CKEDITOR.ENLARGE_INLINE);
+c.deleteContents();if(i.getParent()){i.moveChildren(f,false);b.lastElement.mergeSiblings();l(f,i,true)}c=a.getSelection().getRanges()[0];c.collapse(1);c.optimize();c.startContainer.getHtml()===""&&c.startContainer.appendBogus();c.select();b=true}if(!b)return}a.getSelection().scrollIntoView();a.fire("saveSnapshot");return false}},this,null,100)}}},_:{detach:function(){this.editor.setData(this.editor.getData(),0,1);this.clearListeners();this.restoreAttrs();var a;if(a=this.removeCustomData("classes"))for(;a.length;)this.removeClass(a.pop());
+if(!this.is("textarea")){a=this.getDocument();var b=a.getHead();if(b.getCustomData("stylesheet")){var c=a.getCustomData("stylesheet_ref");if(--c)a.setCustomData("stylesheet_ref",c);else{a.removeCustomData("stylesheet_ref");b.removeCustomData("stylesheet").remove()}}}this.editor.fire("contentDomUnload");delete this.editor}}});CKEDITOR.editor.prototype.editable=function(a){var b=this._.editable;if(b&&a)return 0;if(arguments.length)b=this._.editable=a?a instanceof CKEDITOR.editable?a:new CKEDITOR.editable(this,
+a):(b&&b.detach(),null);return b};CKEDITOR.on("instanceLoaded",function(a){var b=a.editor;b.on("insertElement",function(a){a=a.data;if(a.type==CKEDITOR.NODE_ELEMENT&&(a.is("input")||a.is("textarea"))){a.getAttribute("contentEditable")!="false"&&a.data("cke-editable",a.hasAttribute("contenteditable")?"true":"1");a.setAttribute("contentEditable",false)}});b.on("selectionChange",function(a){if(!b.readOnly){var c=b.getSelection();if(c&&!c.isLocked){c=b.checkDirty();b.fire("lockSnapshot");d(a);b.fire("unlockSnapshot");
+!c&&b.resetDirty()}}})});CKEDITOR.on("instanceCreated",function(a){var b=a.editor;b.on("mode",function(){var a=b.editable();if(a&&a.isInline()){var c=b.title;a.changeAttr("role","textbox");a.changeAttr("aria-label",c);c&&a.changeAttr("title",c);var d=b.fire("ariaEditorHelpLabel",{}).label;if(d)if(c=this.ui.space(this.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?"top":"contents")){var f=CKEDITOR.tools.getNextId(),d=CKEDITOR.dom.element.createFromHtml('<span id="'+f+'" class="cke_voice_label">'+d+"</span>");
+c.append(d);a.changeAttr("aria-describedby",f)}}})});CKEDITOR.addCss(".cke_editable{cursor:text}.cke_editable img,.cke_editable input,.cke_editable textarea{cursor:default}");var o=CKEDITOR.dom.walker.whitespaces(true),r=CKEDITOR.dom.walker.bookmark(false,true),m=CKEDITOR.dom.walker.empty(),p=CKEDITOR.dom.walker.bogus(),t=/(^|<body\b[^>]*>)\s*<(p|div|address|h\d|center|pre)[^>]*>\s*(?:<br[^>]*>|&nbsp;|\u00A0|&#160;)?\s*(:?<\/\2>)?\s*(?=$|<\/body>)/gi,w=function(){function a(b){return b.type==CKEDITOR.NODE_ELEMENT}
+function b(c,d){var f,e,g,j,h=[],k=d.range.startContainer;f=d.range.startPath();for(var k=i[k.getName()],m=0,p=c.getChildren(),o=p.count(),n=-1,l=-1,E=0,u=f.contains(i.$list);m<o;++m){f=p.getItem(m);if(a(f)){g=f.getName();if(u&&g in CKEDITOR.dtd.$list)h=h.concat(b(f,d));else{j=!!k[g];if(g=="br"&&f.data("cke-eol")&&(!m||m==o-1)){E=(e=m?h[m-1].node:p.getItem(m+1))&&(!a(e)||!e.is("br"));e=e&&a(e)&&i.$block[e.getName()]}n==-1&&!j&&(n=m);j||(l=m);h.push({isElement:1,isLineBreak:E,isBlock:f.isBlockBoundary(),
+hasBlockSibling:e,node:f,name:g,allowed:j});e=E=0}}else h.push({isElement:0,node:f,allowed:1})}if(n>-1)h[n].firstNotAllowed=1;if(l>-1)h[l].lastNotAllowed=1;return h}function c(b,d){var f=[],e=b.getChildren(),g=e.count(),j,h=0,k=i[d],m=!b.is(i.$inline)||b.is("br");for(m&&f.push(" ");h<g;h++){j=e.getItem(h);a(j)&&!j.is(k)?f=f.concat(c(j,d)):f.push(j)}m&&f.push(" ");return f}function d(b){return b&&a(b)&&(b.is(i.$removeEmpty)||b.is("a")&&!b.isBlockBoundary())}function e(b,c,d,f){var g=b.clone(),j,i;
+g.setEndAt(c,CKEDITOR.POSITION_BEFORE_END);if((j=(new CKEDITOR.dom.walker(g)).next())&&a(j)&&h[j.getName()]&&(i=j.getPrevious())&&a(i)&&!i.getParent().equals(b.startContainer)&&d.contains(i)&&f.contains(j)&&j.isIdentical(i)){j.moveChildren(i);j.remove();e(b,c,d,f)}}function j(b,c){function d(b,c){if(c.isBlock&&c.isElement&&!c.node.is("br")&&a(b)&&b.is("br")){b.remove();return 1}}var f=c.endContainer.getChild(c.endOffset),e=c.endContainer.getChild(c.endOffset-1);f&&d(f,b[b.length-1]);if(e&&d(e,b[0])){c.setEnd(c.endContainer,
+c.endOffset-1);c.collapse()}}var i=CKEDITOR.dtd,h={p:1,div:1,h1:1,h2:1,h3:1,h4:1,h5:1,h6:1,ul:1,ol:1,li:1,pre:1,dl:1,blockquote:1},k={p:1,div:1,h1:1,h2:1,h3:1,h4:1,h5:1,h6:1},m=CKEDITOR.tools.extend({},i.$inline);delete m.br;return function(h,p,o,l){var u=h.editor,r=false;if(p=="unfiltered_html"){p="html";r=true}if(!l.checkReadOnly()){var t=(new CKEDITOR.dom.elementPath(l.startContainer,l.root)).blockLimit||l.root,h={type:p,dontFilter:r,editable:h,editor:u,range:l,blockLimit:t,mergeCandidates:[],
+zombies:[]},p=h.range,l=h.mergeCandidates,q,x;if(h.type=="text"&&p.shrink(CKEDITOR.SHRINK_ELEMENT,true,false)){q=CKEDITOR.dom.element.createFromHtml("<span>&nbsp;</span>",p.document);p.insertNode(q);p.setStartAfter(q)}r=new CKEDITOR.dom.elementPath(p.startContainer);h.endPath=t=new CKEDITOR.dom.elementPath(p.endContainer);if(!p.collapsed){var u=t.block||t.blockLimit,w=p.getCommonAncestor();u&&(!u.equals(w)&&!u.contains(w)&&p.checkEndOfBlock())&&h.zombies.push(u);p.deleteContents()}for(;(x=a(p.startContainer)&&
+p.startContainer.getChild(p.startOffset-1))&&a(x)&&x.isBlockBoundary()&&r.contains(x);)p.moveToPosition(x,CKEDITOR.POSITION_BEFORE_END);e(p,h.blockLimit,r,t);if(q){p.setEndBefore(q);p.collapse();q.remove()}q=p.startPath();if(u=q.contains(d,false,1)){p.splitElement(u);h.inlineStylesRoot=u;h.inlineStylesPeak=q.lastElement}q=p.createBookmark();(u=q.startNode.getPrevious(f))&&a(u)&&d(u)&&l.push(u);(u=q.startNode.getNext(f))&&a(u)&&d(u)&&l.push(u);for(u=q.startNode;(u=u.getParent())&&d(u);)l.push(u);p.moveToBookmark(q);
+if(q=o){q=h.range;if(h.type=="text"&&h.inlineStylesRoot){x=h.inlineStylesPeak;p=x.getDocument().createText("{cke-peak}");for(l=h.inlineStylesRoot.getParent();!x.equals(l);){p=p.appendTo(x.clone());x=x.getParent()}o=p.getOuterHtml().split("{cke-peak}").join(o)}x=h.blockLimit.getName();if(/^\s+|\s+$/.test(o)&&"span"in CKEDITOR.dtd[x])var C='<span data-cke-marker="1">&nbsp;</span>',o=C+o+C;o=h.editor.dataProcessor.toHtml(o,{context:null,fixForBody:false,protectedWhitespaces:!!C,dontFilter:h.dontFilter,
+filter:h.editor.activeFilter,enterMode:h.editor.activeEnterMode});x=q.document.createElement("body");x.setHtml(o);if(C){x.getFirst().remove();x.getLast().remove()}if((C=q.startPath().block)&&!(C.getChildCount()==1&&C.getBogus()))a:{var K;if(x.getChildCount()==1&&a(K=x.getFirst())&&K.is(k)&&!K.hasAttribute("contenteditable")){C=K.getElementsByTag("*");q=0;for(l=C.count();q<l;q++){p=C.getItem(q);if(!p.is(m))break a}K.moveChildren(K.getParent(1));K.remove()}}h.dataWrapper=x;q=o}if(q){K=h.range;q=K.document;
+var F;x=h.blockLimit;var l=0,M,C=[],N,U,o=u=0,Q,V,p=K.startContainer,r=h.endPath.elements[0],Z,t=r.getPosition(p),w=!!r.getCommonAncestor(p)&&t!=CKEDITOR.POSITION_IDENTICAL&&!(t&CKEDITOR.POSITION_CONTAINS+CKEDITOR.POSITION_IS_CONTAINED),p=b(h.dataWrapper,h);for(j(p,K);l<p.length;l++){t=p[l];if(F=t.isLineBreak){F=K;Q=x;var O=void 0,aa=void 0;if(t.hasBlockSibling)F=1;else{O=F.startContainer.getAscendant(i.$block,1);if(!O||!O.is({div:1,p:1}))F=0;else{aa=O.getPosition(Q);if(aa==CKEDITOR.POSITION_IDENTICAL||
+aa==CKEDITOR.POSITION_CONTAINS)F=0;else{Q=F.splitElement(O);F.moveToPosition(Q,CKEDITOR.POSITION_AFTER_START);F=1}}}}if(F)o=l>0;else{F=K.startPath();if(!t.isBlock&&g(h.editor,F.block,F.blockLimit)&&(U=n(h.editor))){U=q.createElement(U);U.appendBogus();K.insertNode(U);CKEDITOR.env.needsBrFiller&&(M=U.getBogus())&&M.remove();K.moveToPosition(U,CKEDITOR.POSITION_BEFORE_END)}if((F=K.startPath().block)&&!F.equals(N)){if(M=F.getBogus()){M.remove();C.push(F)}N=F}t.firstNotAllowed&&(u=1);if(u&&t.isElement){F=
+K.startContainer;for(Q=null;F&&!i[F.getName()][t.name];){if(F.equals(x)){F=null;break}Q=F;F=F.getParent()}if(F){if(Q){V=K.splitElement(Q);h.zombies.push(V);h.zombies.push(Q)}}else{Q=x.getName();Z=!l;F=l==p.length-1;Q=c(t.node,Q);for(var O=[],aa=Q.length,Y=0,W=void 0,ba=0,fa=-1;Y<aa;Y++){W=Q[Y];if(W==" "){if(!ba&&(!Z||Y)){O.push(new CKEDITOR.dom.text(" "));fa=O.length}ba=1}else{O.push(W);ba=0}}F&&fa==O.length&&O.pop();Z=O}}if(Z){for(;F=Z.pop();)K.insertNode(F);Z=0}else K.insertNode(t.node);if(t.lastNotAllowed&&
+l<p.length-1){(V=w?r:V)&&K.setEndAt(V,CKEDITOR.POSITION_AFTER_START);u=0}K.collapse()}}if(p.length!=1)M=false;else{M=p[0];M=M.isElement&&M.node.getAttribute("contenteditable")=="false"}if(M){o=true;F=p[0].node;K.setStartAt(F,CKEDITOR.POSITION_BEFORE_START);K.setEndAt(F,CKEDITOR.POSITION_AFTER_END)}h.dontMoveCaret=o;h.bogusNeededBlocks=C}M=h.range;var ca;V=h.bogusNeededBlocks;for(Z=M.createBookmark();N=h.zombies.pop();)if(N.getParent()){U=M.clone();U.moveToElementEditStart(N);U.removeEmptyBlocksAtEnd()}if(V)for(;N=
+V.pop();)CKEDITOR.env.needsBrFiller?N.appendBogus():N.append(M.document.createText(" "));for(;N=h.mergeCandidates.pop();)N.mergeSiblings();M.moveToBookmark(Z);if(!h.dontMoveCaret){for(N=a(M.startContainer)&&M.startContainer.getChild(M.startOffset-1);N&&a(N)&&!N.is(i.$empty);){if(N.isBlockBoundary())M.moveToPosition(N,CKEDITOR.POSITION_BEFORE_END);else{if(d(N)&&N.getHtml().match(/(\s|&nbsp;)$/g)){ca=null;break}ca=M.clone();ca.moveToPosition(N,CKEDITOR.POSITION_BEFORE_END)}N=N.getLast(f)}ca&&M.moveToRange(ca)}}}}(),
+u=function(){function a(b){b=new CKEDITOR.dom.walker(b);b.guard=function(a,b){if(b)return false;if(a.type==CKEDITOR.NODE_ELEMENT)return a.is(CKEDITOR.dtd.$tableContent)};b.evaluator=function(a){return a.type==CKEDITOR.NODE_ELEMENT};return b}function b(a,c,d){c=a.getDocument().createElement(c);a.append(c,d);return c}function c(a){var b=a.count(),d;for(b;b-- >0;){d=a.getItem(b);if(!CKEDITOR.tools.trim(d.getHtml())){d.appendBogus();CKEDITOR.env.ie&&(CKEDITOR.env.version<9&&d.getChildCount())&&d.getFirst().remove()}}}
+return function(d){var f=d.startContainer,e=f.getAscendant("table",1),g=false;c(e.getElementsByTag("td"));c(e.getElementsByTag("th"));e=d.clone();e.setStart(f,0);e=a(e).lastBackward();if(!e){e=d.clone();e.setEndAt(f,CKEDITOR.POSITION_BEFORE_END);e=a(e).lastForward();g=true}e||(e=f);if(e.is("table")){d.setStartAt(e,CKEDITOR.POSITION_BEFORE_START);d.collapse(true);e.remove()}else{e.is({tbody:1,thead:1,tfoot:1})&&(e=b(e,"tr",g));e.is("tr")&&(e=b(e,e.getParent().is("thead")?"th":"td",g));(f=e.getBogus())&&
+f.remove();d.moveToPosition(e,g?CKEDITOR.POSITION_AFTER_START:CKEDITOR.POSITION_BEFORE_END)}}}();a={detect:function(a,b){var c=a.range,d=c.clone(),f=c.clone(),e=new CKEDITOR.dom.elementPath(c.startContainer,b),g=new CKEDITOR.dom.elementPath(c.endContainer,b);d.collapse(1);f.collapse();if(e.block&&d.checkBoundaryOfElement(e.block,CKEDITOR.END)){c.setStartAfter(e.block);a.prependEolBr=1}if(g.block&&f.checkBoundaryOfElement(g.block,CKEDITOR.START)){c.setEndBefore(g.block);a.appendEolBr=1}},fix:function(a,
+b){var c=b.getDocument(),d;if(a.appendEolBr){d=this.createEolBr(c);a.fragment.append(d)}a.prependEolBr&&(!d||d.getPrevious())&&a.fragment.append(this.createEolBr(c),1)},createEolBr:function(a){return a.createElement("br",{attributes:{"data-cke-eol":1}})}};e={exclude:function(a){var b=a.range.getBoundaryNodes(),c=b.startNode;(b=b.endNode)&&(p(b)&&(!c||!c.equals(b)))&&a.range.setEndBefore(b)}};c={rebuild:function(a,b){var c=a.range,d=c.getCommonAncestor(),f=new CKEDITOR.dom.elementPath(d,b),e=new CKEDITOR.dom.elementPath(c.startContainer,
+b),c=new CKEDITOR.dom.elementPath(c.endContainer,b),g;d.type==CKEDITOR.NODE_TEXT&&(d=d.getParent());if(f.blockLimit.is({tr:1,table:1})){var j=f.contains("table").getParent();g=function(a){return!a.equals(j)}}else if(f.block&&f.block.is(CKEDITOR.dtd.$listItem)){e=e.contains(CKEDITOR.dtd.$list);c=c.contains(CKEDITOR.dtd.$list);if(!e.equals(c)){var i=f.contains(CKEDITOR.dtd.$list).getParent();g=function(a){return!a.equals(i)}}}g||(g=function(a){return!a.equals(f.block)&&!a.equals(f.blockLimit)});this.rebuildFragment(a,
+b,d,g)},rebuildFragment:function(a,b,c,d){for(var f;c&&!c.equals(b)&&d(c);){f=c.clone(0,1);a.fragment.appendTo(f);a.fragment=f;c=c.getParent()}}};b={shrink:function(a){var a=a.range,b=a.startContainer,c=a.endContainer,d=a.startOffset,f=a.endOffset;b.type==CKEDITOR.NODE_ELEMENT&&(b.equals(c)&&b.is("tr")&&++d==f)&&a.shrink(CKEDITOR.SHRINK_TEXT)}};var x=function(){function a(b,c){var d=b.getParent();if(d.is(CKEDITOR.dtd.$inline))b[c?"insertBefore":"insertAfter"](d)}function b(c,d,f){a(d);a(f,1);for(var e;e=
+f.getNext();){e.insertAfter(d);d=e}m(c)&&c.remove()}function c(a,b){var d=new CKEDITOR.dom.range(a);d.setStartAfter(b.startNode);d.setEndBefore(b.endNode);return d}return{list:{detectMerge:function(a,b){var d=c(b,a.bookmark),f=d.startPath(),e=d.endPath(),g=f.contains(CKEDITOR.dtd.$list),j=e.contains(CKEDITOR.dtd.$list);a.mergeList=g&&j&&g.getParent().equals(j.getParent())&&!g.equals(j);a.mergeListItems=f.block&&e.block&&f.block.is(CKEDITOR.dtd.$listItem)&&e.block.is(CKEDITOR.dtd.$listItem);if(a.mergeList||
+a.mergeListItems){d=d.clone();d.setStartBefore(a.bookmark.startNode);d.setEndAfter(a.bookmark.endNode);a.mergeListBookmark=d.createBookmark()}},merge:function(a,c){if(a.mergeListBookmark){var d=a.mergeListBookmark.startNode,f=a.mergeListBookmark.endNode,e=new CKEDITOR.dom.elementPath(d,c),g=new CKEDITOR.dom.elementPath(f,c);if(a.mergeList){var j=e.contains(CKEDITOR.dtd.$list),i=g.contains(CKEDITOR.dtd.$list);if(!j.equals(i)){i.moveChildren(j);i.remove()}}if(a.mergeListItems){e=e.contains(CKEDITOR.dtd.$listItem);
+g=g.contains(CKEDITOR.dtd.$listItem);e.equals(g)||b(g,d,f)}d.remove();f.remove()}}},block:{detectMerge:function(a,b){if(!a.tableContentsRanges&&!a.mergeListBookmark){var c=new CKEDITOR.dom.range(b);c.setStartBefore(a.bookmark.startNode);c.setEndAfter(a.bookmark.endNode);a.mergeBlockBookmark=c.createBookmark()}},merge:function(a,c){if(a.mergeBlockBookmark&&!a.purgeTableBookmark){var d=a.mergeBlockBookmark.startNode,f=a.mergeBlockBookmark.endNode,e=new CKEDITOR.dom.elementPath(d,c),g=new CKEDITOR.dom.elementPath(f,
+c),e=e.block,g=g.block;e&&(g&&!e.equals(g))&&b(g,d,f);d.remove();f.remove()}}},table:function(){function a(c){var f=[],e,g=new CKEDITOR.dom.walker(c),j=c.startPath().contains(d),i=c.endPath().contains(d),h={};g.guard=function(a,g){if(a.type==CKEDITOR.NODE_ELEMENT){var k="visited_"+(g?"out":"in");if(a.getCustomData(k))return;CKEDITOR.dom.element.setMarker(h,a,k,1)}if(g&&j&&a.equals(j)){e=c.clone();e.setEndAt(j,CKEDITOR.POSITION_BEFORE_END);f.push(e)}else if(!g&&i&&a.equals(i)){e=c.clone();e.setStartAt(i,
+CKEDITOR.POSITION_AFTER_START);f.push(e)}else if(!g&&a.type==CKEDITOR.NODE_ELEMENT&&a.is(d)&&(!j||b(a,j))&&(!i||b(a,i))){e=c.clone();e.selectNodeContents(a);f.push(e)}};g.lastForward();CKEDITOR.dom.element.clearAllMarkers(h);return f}function b(a,c){var d=CKEDITOR.POSITION_CONTAINS+CKEDITOR.POSITION_IS_CONTAINED,f=a.getPosition(c);return f===CKEDITOR.POSITION_IDENTICAL?false:(f&d)===0}var d={td:1,th:1,caption:1};return{detectPurge:function(a){var b=a.range,c=b.clone();c.enlarge(CKEDITOR.ENLARGE_ELEMENT);
+var c=new CKEDITOR.dom.walker(c),f=0;c.evaluator=function(a){a.type==CKEDITOR.NODE_ELEMENT&&a.is(d)&&++f};c.checkForward();if(f>1){var c=b.startPath().contains("table"),e=b.endPath().contains("table");if(c&&e&&b.checkBoundaryOfElement(c,CKEDITOR.START)&&b.checkBoundaryOfElement(e,CKEDITOR.END)){b=a.range.clone();b.setStartBefore(c);b.setEndAfter(e);a.purgeTableBookmark=b.createBookmark()}}},detectRanges:function(f,e){var g=c(e,f.bookmark),j=g.clone(),i,h,k=g.getCommonAncestor();k.is(CKEDITOR.dtd.$tableContent)&&
+!k.is(d)&&(k=k.getAscendant("table",true));h=k;k=new CKEDITOR.dom.elementPath(g.startContainer,h);h=new CKEDITOR.dom.elementPath(g.endContainer,h);k=k.contains("table");h=h.contains("table");if(k||h){if(k&&h&&b(k,h)){f.tableSurroundingRange=j;j.setStartAt(k,CKEDITOR.POSITION_AFTER_END);j.setEndAt(h,CKEDITOR.POSITION_BEFORE_START);j=g.clone();j.setEndAt(k,CKEDITOR.POSITION_AFTER_END);i=g.clone();i.setStartAt(h,CKEDITOR.POSITION_BEFORE_START);i=a(j).concat(a(i))}else if(k){if(!h){f.tableSurroundingRange=
+j;j.setStartAt(k,CKEDITOR.POSITION_AFTER_END);g.setEndAt(k,CKEDITOR.POSITION_AFTER_END)}}else{f.tableSurroundingRange=j;j.setEndAt(h,CKEDITOR.POSITION_BEFORE_START);g.setStartAt(h,CKEDITOR.POSITION_AFTER_START)}f.tableContentsRanges=i?i:a(g)}},deleteRanges:function(a){for(var b;b=a.tableContentsRanges.pop();){b.extractContents();m(b.startContainer)&&b.startContainer.appendBogus()}a.tableSurroundingRange&&a.tableSurroundingRange.extractContents()},purge:function(a){if(a.purgeTableBookmark){var b=a.doc,
+c=a.range.clone(),b=b.createElement("p");b.insertBefore(a.purgeTableBookmark.startNode);c.moveToBookmark(a.purgeTableBookmark);c.deleteContents();a.range.moveToPosition(b,CKEDITOR.POSITION_AFTER_START)}}}}(),detectExtractMerge:function(a){return!(a.range.startPath().contains(CKEDITOR.dtd.$listItem)&&a.range.endPath().contains(CKEDITOR.dtd.$listItem))},fixUneditableRangePosition:function(a){a.startContainer.getDtd()["#"]||a.moveToClosestEditablePosition(null,true)},autoParagraph:function(a,b){var c=
+b.startPath(),d;if(g(a,c.block,c.blockLimit)&&(d=n(a))){d=b.document.createElement(d);d.appendBogus();b.insertNode(d);b.moveToPosition(d,CKEDITOR.POSITION_AFTER_START)}}}}()}(),function(){function a(){var a=this._.fakeSelection,b;if(a){b=this.getSelection(1);if(!b||!b.isHidden()){a.reset();a=0}}if(!a){a=b||this.getSelection(1);if(!a||a.getType()==CKEDITOR.SELECTION_NONE)return}this.fire("selectionCheck",a);b=this.elementPath();if(!b.compare(this._.selectionPreviousPath)){if(CKEDITOR.env.webkit)this._.previousActive=
+this.document.getActive();this._.selectionPreviousPath=b;this.fire("selectionChange",{selection:a,path:b})}}function e(){o=true;if(!l){b.call(this);l=CKEDITOR.tools.setTimeout(b,200,this)}}function b(){l=null;if(o){CKEDITOR.tools.setTimeout(a,0,this);o=false}}function c(a){return r(a)||a.type==CKEDITOR.NODE_ELEMENT&&!a.is(CKEDITOR.dtd.$empty)?true:false}function d(a){function b(c,d){return!c||c.type==CKEDITOR.NODE_TEXT?false:a.clone()["moveToElementEdit"+(d?"End":"Start")](c)}if(!(a.root instanceof
+CKEDITOR.editable))return false;var d=a.startContainer,f=a.getPreviousNode(c,null,d),e=a.getNextNode(c,null,d);return b(f)||b(e,1)||!f&&!e&&!(d.type==CKEDITOR.NODE_ELEMENT&&d.isBlockBoundary()&&d.getBogus())?true:false}function i(a){return a.getCustomData("cke-fillingChar")}function h(a,b){var c=a&&a.removeCustomData("cke-fillingChar");if(c){if(b!==false){var d,e=a.getDocument().getSelection().getNative(),g=e&&e.type!="None"&&e.getRangeAt(0);if(c.getLength()>1&&g&&g.intersectsNode(c.$)){d=k(e);g=
+e.focusNode==c.$&&e.focusOffset>0;e.anchorNode==c.$&&e.anchorOffset>0&&d[0].offset--;g&&d[1].offset--}}c.setText(f(c.getText()));d&&j(a.getDocument().$,d)}}function f(a){return a.replace(/\u200B( )?/g,function(a){return a[1]?" ":""})}function k(a){return[{node:a.anchorNode,offset:a.anchorOffset},{node:a.focusNode,offset:a.focusOffset}]}function j(a,b){var c=a.getSelection(),d=a.createRange();d.setStart(b[0].node,b[0].offset);d.collapse(true);c.removeAllRanges();c.addRange(d);c.extend(b[1].node,b[1].offset)}
+function g(a){var b=CKEDITOR.dom.element.createFromHtml('<div data-cke-hidden-sel="1" data-cke-temp="1" style="'+(CKEDITOR.env.ie?"display:none":"position:fixed;top:0;left:-1000px")+'">&nbsp;</div>',a.document);a.fire("lockSnapshot");a.editable().append(b);var c=a.getSelection(1),d=a.createRange(),f=c.root.on("selectionchange",function(a){a.cancel()},null,null,0);d.setStartAt(b,CKEDITOR.POSITION_AFTER_START);d.setEndAt(b,CKEDITOR.POSITION_BEFORE_END);c.selectRanges([d]);f.removeListener();a.fire("unlockSnapshot");
+a._.hiddenSelectionContainer=b}function n(a){var b={37:1,39:1,8:1,46:1};return function(c){var d=c.data.getKeystroke();if(b[d]){var f=a.getSelection().getRanges(),e=f[0];if(f.length==1&&e.collapsed)if((d=e[d<38?"getPreviousEditableNode":"getNextEditableNode"]())&&d.type==CKEDITOR.NODE_ELEMENT&&d.getAttribute("contenteditable")=="false"){a.getSelection().fake(d);c.data.preventDefault();c.cancel()}}}}function q(a){for(var b=0;b<a.length;b++){var c=a[b];c.getCommonAncestor().isReadOnly()&&a.splice(b,
+1);if(!c.collapsed){if(c.startContainer.isReadOnly())for(var d=c.startContainer,f;d;){if((f=d.type==CKEDITOR.NODE_ELEMENT)&&d.is("body")||!d.isReadOnly())break;f&&d.getAttribute("contentEditable")=="false"&&c.setStartAfter(d);d=d.getParent()}d=c.startContainer;f=c.endContainer;var e=c.startOffset,g=c.endOffset,j=c.clone();d&&d.type==CKEDITOR.NODE_TEXT&&(e>=d.getLength()?j.setStartAfter(d):j.setStartBefore(d));f&&f.type==CKEDITOR.NODE_TEXT&&(g?j.setEndAfter(f):j.setEndBefore(f));d=new CKEDITOR.dom.walker(j);
+d.evaluator=function(d){if(d.type==CKEDITOR.NODE_ELEMENT&&d.isReadOnly()){var f=c.clone();c.setEndBefore(d);c.collapsed&&a.splice(b--,1);if(!(d.getPosition(j.endContainer)&CKEDITOR.POSITION_CONTAINS)){f.setStartAfter(d);f.collapsed||a.splice(b+1,0,f)}return true}return false};d.next()}}return a}var l,o,r=CKEDITOR.dom.walker.invisible(1),m=function(){function a(b){return function(a){var c=a.editor.createRange();c.moveToClosestEditablePosition(a.selected,b)&&a.editor.getSelection().selectRanges([c]);
+return false}}function b(a){return function(b){var c=b.editor,d=c.createRange(),f;if(!(f=d.moveToClosestEditablePosition(b.selected,a)))f=d.moveToClosestEditablePosition(b.selected,!a);f&&c.getSelection().selectRanges([d]);c.fire("saveSnapshot");b.selected.remove();if(!f){d.moveToElementEditablePosition(c.editable());c.getSelection().selectRanges([d])}c.fire("saveSnapshot");return false}}var c=a(),d=a(1);return{37:c,38:c,39:d,40:d,8:b(),46:b(1)}}();CKEDITOR.on("instanceCreated",function(b){function c(){var a=
+d.getSelection();a&&a.removeAllRanges()}var d=b.editor;d.on("contentDom",function(){function b(){l=new CKEDITOR.dom.selection(d.getSelection());l.lock()}function c(){g.removeListener("mouseup",c);k.removeListener("mouseup",c);var a=CKEDITOR.document.$.selection,b=a.createRange();a.type!="None"&&b.parentElement().ownerDocument==f.$&&b.select()}var f=d.document,g=CKEDITOR.document,j=d.editable(),i=f.getBody(),k=f.getDocumentElement(),m=j.isInline(),o,l;CKEDITOR.env.gecko&&j.attachListener(j,"focus",
+function(a){a.removeListener();if(o!==0)if((a=d.getSelection().getNative())&&a.isCollapsed&&a.anchorNode==j.$){a=d.createRange();a.moveToElementEditStart(j);a.select()}},null,null,-2);j.attachListener(j,CKEDITOR.env.webkit?"DOMFocusIn":"focus",function(){o&&CKEDITOR.env.webkit&&(o=d._.previousActive&&d._.previousActive.equals(f.getActive()));d.unlockSelection(o);o=0},null,null,-1);j.attachListener(j,"mousedown",function(){o=0});if(CKEDITOR.env.ie||m){p?j.attachListener(j,"beforedeactivate",b,null,
+null,-1):j.attachListener(d,"selectionCheck",b,null,null,-1);j.attachListener(j,CKEDITOR.env.webkit?"DOMFocusOut":"blur",function(){d.lockSelection(l);o=1},null,null,-1);j.attachListener(j,"mousedown",function(){o=0})}if(CKEDITOR.env.ie&&!m){var r;j.attachListener(j,"mousedown",function(a){if(a.data.$.button==2){a=d.document.getSelection();if(!a||a.getType()==CKEDITOR.SELECTION_NONE)r=d.window.getScrollPosition()}});j.attachListener(j,"mouseup",function(a){if(a.data.$.button==2&&r){d.document.$.documentElement.scrollLeft=
+r.x;d.document.$.documentElement.scrollTop=r.y}r=null});if(f.$.compatMode!="BackCompat"){if(CKEDITOR.env.ie7Compat||CKEDITOR.env.ie6Compat)k.on("mousedown",function(a){function b(a){a=a.data.$;if(d){var c=i.$.createTextRange();try{c.moveToPoint(a.clientX,a.clientY)}catch(f){}d.setEndPoint(e.compareEndPoints("StartToStart",c)<0?"EndToEnd":"StartToStart",c);d.select()}}function c(){k.removeListener("mousemove",b);g.removeListener("mouseup",c);k.removeListener("mouseup",c);d.select()}a=a.data;if(a.getTarget().is("html")&&
+a.$.y<k.$.clientHeight&&a.$.x<k.$.clientWidth){var d=i.$.createTextRange();try{d.moveToPoint(a.$.clientX,a.$.clientY)}catch(f){}var e=d.duplicate();k.on("mousemove",b);g.on("mouseup",c);k.on("mouseup",c)}});if(CKEDITOR.env.version>7&&CKEDITOR.env.version<11)k.on("mousedown",function(a){if(a.data.getTarget().is("html")){g.on("mouseup",c);k.on("mouseup",c)}})}}j.attachListener(j,"selectionchange",a,d);j.attachListener(j,"keyup",e,d);j.attachListener(j,CKEDITOR.env.webkit?"DOMFocusIn":"focus",function(){d.forceNextSelectionCheck();
+d.selectionChange(1)});if(m&&(CKEDITOR.env.webkit||CKEDITOR.env.gecko)){var u;j.attachListener(j,"mousedown",function(){u=1});j.attachListener(f.getDocumentElement(),"mouseup",function(){u&&e.call(d);u=0})}else j.attachListener(CKEDITOR.env.ie?j:f.getDocumentElement(),"mouseup",e,d);CKEDITOR.env.webkit&&j.attachListener(f,"keydown",function(a){switch(a.data.getKey()){case 13:case 33:case 34:case 35:case 36:case 37:case 39:case 8:case 45:case 46:h(j)}},null,null,-1);j.attachListener(j,"keydown",n(d),
+null,null,-1)});d.on("setData",function(){d.unlockSelection();CKEDITOR.env.webkit&&c()});d.on("contentDomUnload",function(){d.unlockSelection()});if(CKEDITOR.env.ie9Compat)d.on("beforeDestroy",c,null,null,9);d.on("dataReady",function(){delete d._.fakeSelection;delete d._.hiddenSelectionContainer;d.selectionChange(1)});d.on("loadSnapshot",function(){var a=CKEDITOR.dom.walker.nodeType(CKEDITOR.NODE_ELEMENT),b=d.editable().getLast(a);if(b&&b.hasAttribute("data-cke-hidden-sel")){b.remove();if(CKEDITOR.env.gecko)(a=
+d.editable().getFirst(a))&&(a.is("br")&&a.getAttribute("_moz_editor_bogus_node"))&&a.remove()}},null,null,100);d.on("key",function(a){if(d.mode=="wysiwyg"){var b=d.getSelection();if(b.isFake){var c=m[a.data.keyCode];if(c)return c({editor:d,selected:b.getSelectedElement(),selection:b,keyEvent:a})}}})});CKEDITOR.on("instanceReady",function(a){function b(){var a=d.editable();if(a)if(a=i(a)){var c=d.document.$.getSelection();if(c.type!="None"&&(c.anchorNode==a.$||c.focusNode==a.$))g=k(c);e=a.getText();
+a.setText(f(e))}}function c(){var a=d.editable();if(a)if(a=i(a)){a.setText(e);if(g){j(d.document.$,g);g=null}}}var d=a.editor,e,g;if(CKEDITOR.env.webkit){d.on("selectionChange",function(){var a=d.editable(),b=i(a);b&&(b.getCustomData("ready")?h(a):b.setCustomData("ready",1))},null,null,-1);d.on("beforeSetMode",function(){h(d.editable())},null,null,-1);d.on("beforeUndoImage",b);d.on("afterUndoImage",c);d.on("beforeGetData",b,null,null,0);d.on("getData",c)}});CKEDITOR.editor.prototype.selectionChange=
+function(b){(b?a:e).call(this)};CKEDITOR.editor.prototype.getSelection=function(a){if((this._.savedSelection||this._.fakeSelection)&&!a)return this._.savedSelection||this._.fakeSelection;return(a=this.editable())&&this.mode=="wysiwyg"?new CKEDITOR.dom.selection(a):null};CKEDITOR.editor.prototype.lockSelection=function(a){a=a||this.getSelection(1);if(a.getType()!=CKEDITOR.SELECTION_NONE){!a.isLocked&&a.lock();this._.savedSelection=a;return true}return false};CKEDITOR.editor.prototype.unlockSelection=
+function(a){var b=this._.savedSelection;if(b){b.unlock(a);delete this._.savedSelection;return true}return false};CKEDITOR.editor.prototype.forceNextSelectionCheck=function(){delete this._.selectionPreviousPath};CKEDITOR.dom.document.prototype.getSelection=function(){return new CKEDITOR.dom.selection(this)};CKEDITOR.dom.range.prototype.select=function(){var a=this.root instanceof CKEDITOR.editable?this.root.editor.getSelection():new CKEDITOR.dom.selection(this.root);a.selectRanges([this]);return a};
+CKEDITOR.SELECTION_NONE=1;CKEDITOR.SELECTION_TEXT=2;CKEDITOR.SELECTION_ELEMENT=3;var p=typeof window.getSelection!="function",t=1;CKEDITOR.dom.selection=function(a){if(a instanceof CKEDITOR.dom.selection)var b=a,a=a.root;var c=a instanceof CKEDITOR.dom.element;this.rev=b?b.rev:t++;this.document=a instanceof CKEDITOR.dom.document?a:a.getDocument();this.root=c?a:this.document.getBody();this.isLocked=0;this._={cache:{}};if(b){CKEDITOR.tools.extend(this._.cache,b._.cache);this.isFake=b.isFake;this.isLocked=
+b.isLocked;return this}var a=this.getNative(),d,f;if(a)if(a.getRangeAt)d=(f=a.rangeCount&&a.getRangeAt(0))&&new CKEDITOR.dom.node(f.commonAncestorContainer);else{try{f=a.createRange()}catch(e){}d=f&&CKEDITOR.dom.element.get(f.item&&f.item(0)||f.parentElement())}if(!d||!(d.type==CKEDITOR.NODE_ELEMENT||d.type==CKEDITOR.NODE_TEXT)||!this.root.equals(d)&&!this.root.contains(d)){this._.cache.type=CKEDITOR.SELECTION_NONE;this._.cache.startElement=null;this._.cache.selectedElement=null;this._.cache.selectedText=
+"";this._.cache.ranges=new CKEDITOR.dom.rangeList}return this};var w={img:1,hr:1,li:1,table:1,tr:1,td:1,th:1,embed:1,object:1,ol:1,ul:1,a:1,input:1,form:1,select:1,textarea:1,button:1,fieldset:1,thead:1,tfoot:1};CKEDITOR.dom.selection.prototype={getNative:function(){return this._.cache.nativeSel!==void 0?this._.cache.nativeSel:this._.cache.nativeSel=p?this.document.$.selection:this.document.getWindow().$.getSelection()},getType:p?function(){var a=this._.cache;if(a.type)return a.type;var b=CKEDITOR.SELECTION_NONE;
+try{var c=this.getNative(),d=c.type;if(d=="Text")b=CKEDITOR.SELECTION_TEXT;if(d=="Control")b=CKEDITOR.SELECTION_ELEMENT;if(c.createRange().parentElement())b=CKEDITOR.SELECTION_TEXT}catch(f){}return a.type=b}:function(){var a=this._.cache;if(a.type)return a.type;var b=CKEDITOR.SELECTION_TEXT,c=this.getNative();if(!c||!c.rangeCount)b=CKEDITOR.SELECTION_NONE;else if(c.rangeCount==1){var c=c.getRangeAt(0),d=c.startContainer;if(d==c.endContainer&&d.nodeType==1&&c.endOffset-c.startOffset==1&&w[d.childNodes[c.startOffset].nodeName.toLowerCase()])b=
+CKEDITOR.SELECTION_ELEMENT}return a.type=b},getRanges:function(){var a=p?function(){function a(b){return(new CKEDITOR.dom.node(b)).getIndex()}var b=function(b,c){b=b.duplicate();b.collapse(c);var d=b.parentElement();if(!d.hasChildNodes())return{container:d,offset:0};for(var f=d.children,e,g,j=b.duplicate(),i=0,h=f.length-1,k=-1,p,m;i<=h;){k=Math.floor((i+h)/2);e=f[k];j.moveToElementText(e);p=j.compareEndPoints("StartToStart",b);if(p>0)h=k-1;else if(p<0)i=k+1;else return{container:d,offset:a(e)}}if(k==
+-1||k==f.length-1&&p<0){j.moveToElementText(d);j.setEndPoint("StartToStart",b);j=j.text.replace(/(\r\n|\r)/g,"\n").length;f=d.childNodes;if(!j){e=f[f.length-1];return e.nodeType!=CKEDITOR.NODE_TEXT?{container:d,offset:f.length}:{container:e,offset:e.nodeValue.length}}for(d=f.length;j>0&&d>0;){g=f[--d];if(g.nodeType==CKEDITOR.NODE_TEXT){m=g;j=j-g.nodeValue.length}}return{container:m,offset:-j}}j.collapse(p>0?true:false);j.setEndPoint(p>0?"StartToStart":"EndToStart",b);j=j.text.replace(/(\r\n|\r)/g,
+"\n").length;if(!j)return{container:d,offset:a(e)+(p>0?0:1)};for(;j>0;)try{g=e[p>0?"previousSibling":"nextSibling"];if(g.nodeType==CKEDITOR.NODE_TEXT){j=j-g.nodeValue.length;m=g}e=g}catch(o){return{container:d,offset:a(e)}}return{container:m,offset:p>0?-j:m.nodeValue.length+j}};return function(){var a=this.getNative(),c=a&&a.createRange(),d=this.getType();if(!a)return[];if(d==CKEDITOR.SELECTION_TEXT){a=new CKEDITOR.dom.range(this.root);d=b(c,true);a.setStart(new CKEDITOR.dom.node(d.container),d.offset);
+d=b(c);a.setEnd(new CKEDITOR.dom.node(d.container),d.offset);a.endContainer.getPosition(a.startContainer)&CKEDITOR.POSITION_PRECEDING&&a.endOffset<=a.startContainer.getIndex()&&a.collapse();return[a]}if(d==CKEDITOR.SELECTION_ELEMENT){for(var d=[],f=0;f<c.length;f++){for(var e=c.item(f),g=e.parentNode,j=0,a=new CKEDITOR.dom.range(this.root);j<g.childNodes.length&&g.childNodes[j]!=e;j++);a.setStart(new CKEDITOR.dom.node(g),j);a.setEnd(new CKEDITOR.dom.node(g),j+1);d.push(a)}return d}return[]}}():function(){var a=
+[],b,c=this.getNative();if(!c)return a;for(var d=0;d<c.rangeCount;d++){var f=c.getRangeAt(d);b=new CKEDITOR.dom.range(this.root);b.setStart(new CKEDITOR.dom.node(f.startContainer),f.startOffset);b.setEnd(new CKEDITOR.dom.node(f.endContainer),f.endOffset);a.push(b)}return a};return function(b){var c=this._.cache,d=c.ranges;if(!d)c.ranges=d=new CKEDITOR.dom.rangeList(a.call(this));return!b?d:q(new CKEDITOR.dom.rangeList(d.slice()))}}(),getStartElement:function(){var a=this._.cache;if(a.startElement!==
+void 0)return a.startElement;var b;switch(this.getType()){case CKEDITOR.SELECTION_ELEMENT:return this.getSelectedElement();case CKEDITOR.SELECTION_TEXT:var c=this.getRanges()[0];if(c){if(c.collapsed){b=c.startContainer;b.type!=CKEDITOR.NODE_ELEMENT&&(b=b.getParent())}else{for(c.optimize();;){b=c.startContainer;if(c.startOffset==(b.getChildCount?b.getChildCount():b.getLength())&&!b.isBlockBoundary())c.setStartAfter(b);else break}b=c.startContainer;if(b.type!=CKEDITOR.NODE_ELEMENT)return b.getParent();
+b=b.getChild(c.startOffset);if(!b||b.type!=CKEDITOR.NODE_ELEMENT)b=c.startContainer;else for(c=b.getFirst();c&&c.type==CKEDITOR.NODE_ELEMENT;){b=c;c=c.getFirst()}}b=b.$}}return a.startElement=b?new CKEDITOR.dom.element(b):null},getSelectedElement:function(){var a=this._.cache;if(a.selectedElement!==void 0)return a.selectedElement;var b=this,c=CKEDITOR.tools.tryThese(function(){return b.getNative().createRange().item(0)},function(){for(var a=b.getRanges()[0].clone(),c,d,f=2;f&&(!(c=a.getEnclosedNode())||
+!(c.type==CKEDITOR.NODE_ELEMENT&&w[c.getName()]&&(d=c)));f--)a.shrink(CKEDITOR.SHRINK_ELEMENT);return d&&d.$});return a.selectedElement=c?new CKEDITOR.dom.element(c):null},getSelectedText:function(){var a=this._.cache;if(a.selectedText!==void 0)return a.selectedText;var b=this.getNative(),b=p?b.type=="Control"?"":b.createRange().text:b.toString();return a.selectedText=b},lock:function(){this.getRanges();this.getStartElement();this.getSelectedElement();this.getSelectedText();this._.cache.nativeSel=
+null;this.isLocked=1},unlock:function(a){if(this.isLocked){if(a)var b=this.getSelectedElement(),c=!b&&this.getRanges(),d=this.isFake;this.isLocked=0;this.reset();if(a)(a=b||c[0]&&c[0].getCommonAncestor())&&a.getAscendant("body",1)&&(d?this.fake(b):b?this.selectElement(b):this.selectRanges(c))}},reset:function(){this._.cache={};this.isFake=0;var a=this.root.editor;if(a&&a._.fakeSelection)if(this.rev==a._.fakeSelection.rev){delete a._.fakeSelection;var b=a._.hiddenSelectionContainer;if(b){var c=a.checkDirty();
+a.fire("lockSnapshot");b.remove();a.fire("unlockSnapshot");!c&&a.resetDirty()}delete a._.hiddenSelectionContainer}else CKEDITOR.warn("selection-fake-reset");this.rev=t++},selectElement:function(a){var b=new CKEDITOR.dom.range(this.root);b.setStartBefore(a);b.setEndAfter(a);this.selectRanges([b])},selectRanges:function(a){var b=this.root.editor,b=b&&b._.hiddenSelectionContainer;this.reset();if(b)for(var b=this.root,c,f=0;f<a.length;++f){c=a[f];if(c.endContainer.equals(b))c.endOffset=Math.min(c.endOffset,
+b.getChildCount())}if(a.length)if(this.isLocked){var e=CKEDITOR.document.getActive();this.unlock();this.selectRanges(a);this.lock();e&&!e.equals(this.root)&&e.focus()}else{var g;a:{var j,i;if(a.length==1&&!(i=a[0]).collapsed&&(g=i.getEnclosedNode())&&g.type==CKEDITOR.NODE_ELEMENT){i=i.clone();i.shrink(CKEDITOR.SHRINK_ELEMENT,true);if((j=i.getEnclosedNode())&&j.type==CKEDITOR.NODE_ELEMENT)g=j;if(g.getAttribute("contenteditable")=="false")break a}g=void 0}if(g)this.fake(g);else{if(p){i=CKEDITOR.dom.walker.whitespaces(true);
+j=/\ufeff|\u00a0/;b={table:1,tbody:1,tr:1};if(a.length>1){g=a[a.length-1];a[0].setEnd(g.endContainer,g.endOffset)}g=a[0];var a=g.collapsed,k,m,o;if((c=g.getEnclosedNode())&&c.type==CKEDITOR.NODE_ELEMENT&&c.getName()in w&&(!c.is("a")||!c.getText()))try{o=c.$.createControlRange();o.addElement(c.$);o.select();return}catch(l){}if(g.startContainer.type==CKEDITOR.NODE_ELEMENT&&g.startContainer.getName()in b||g.endContainer.type==CKEDITOR.NODE_ELEMENT&&g.endContainer.getName()in b){g.shrink(CKEDITOR.NODE_ELEMENT,
+true);a=g.collapsed}o=g.createBookmark();b=o.startNode;if(!a)e=o.endNode;o=g.document.$.body.createTextRange();o.moveToElementText(b.$);o.moveStart("character",1);if(e){j=g.document.$.body.createTextRange();j.moveToElementText(e.$);o.setEndPoint("EndToEnd",j);o.moveEnd("character",-1)}else{k=b.getNext(i);m=b.hasAscendant("pre");k=!(k&&k.getText&&k.getText().match(j))&&(m||!b.hasPrevious()||b.getPrevious().is&&b.getPrevious().is("br"));m=g.document.createElement("span");m.setHtml("&#65279;");m.insertBefore(b);
+k&&g.document.createText("﻿").insertBefore(b)}g.setStartBefore(b);b.remove();if(a){if(k){o.moveStart("character",-1);o.select();g.document.$.selection.clear()}else o.select();g.moveToPosition(m,CKEDITOR.POSITION_BEFORE_START);m.remove()}else{g.setEndBefore(e);e.remove();o.select()}}else{e=this.getNative();if(!e)return;this.removeAllRanges();for(o=0;o<a.length;o++){if(o<a.length-1){k=a[o];m=a[o+1];j=k.clone();j.setStart(k.endContainer,k.endOffset);j.setEnd(m.startContainer,m.startOffset);if(!j.collapsed){j.shrink(CKEDITOR.NODE_ELEMENT,
+true);g=j.getCommonAncestor();j=j.getEnclosedNode();if(g.isReadOnly()||j&&j.isReadOnly()){m.setStart(k.startContainer,k.startOffset);a.splice(o--,1);continue}}}g=a[o];m=this.document.$.createRange();if(g.collapsed&&CKEDITOR.env.webkit&&d(g)){k=this.root;h(k,false);j=k.getDocument().createText("​");k.setCustomData("cke-fillingChar",j);g.insertNode(j);if((k=j.getNext())&&!j.getPrevious()&&k.type==CKEDITOR.NODE_ELEMENT&&k.getName()=="br"){h(this.root);g.moveToPosition(k,CKEDITOR.POSITION_BEFORE_START)}else g.moveToPosition(j,
+CKEDITOR.POSITION_AFTER_END)}m.setStart(g.startContainer.$,g.startOffset);try{m.setEnd(g.endContainer.$,g.endOffset)}catch(n){if(n.toString().indexOf("NS_ERROR_ILLEGAL_VALUE")>=0){g.collapse(1);m.setEnd(g.endContainer.$,g.endOffset)}else throw n;}e.addRange(m)}}this.reset();this.root.fire("selectionchange")}}},fake:function(a){var b=this.root.editor;this.reset();g(b);var c=this._.cache,d=new CKEDITOR.dom.range(this.root);d.setStartBefore(a);d.setEndAfter(a);c.ranges=new CKEDITOR.dom.rangeList(d);
+c.selectedElement=c.startElement=a;c.type=CKEDITOR.SELECTION_ELEMENT;c.selectedText=c.nativeSel=null;this.isFake=1;this.rev=t++;b._.fakeSelection=this;this.root.fire("selectionchange")},isHidden:function(){var a=this.getCommonAncestor();a&&a.type==CKEDITOR.NODE_TEXT&&(a=a.getParent());return!(!a||!a.data("cke-hidden-sel"))},createBookmarks:function(a){a=this.getRanges().createBookmarks(a);this.isFake&&(a.isFake=1);return a},createBookmarks2:function(a){a=this.getRanges().createBookmarks2(a);this.isFake&&
+(a.isFake=1);return a},selectBookmarks:function(a){for(var b=[],c,d=0;d<a.length;d++){var f=new CKEDITOR.dom.range(this.root);f.moveToBookmark(a[d]);b.push(f)}if(a.isFake){c=b[0].getEnclosedNode();if(!c||c.type!=CKEDITOR.NODE_ELEMENT){CKEDITOR.warn("selection-not-fake");a.isFake=0}}a.isFake?this.fake(c):this.selectRanges(b);return this},getCommonAncestor:function(){var a=this.getRanges();return!a.length?null:a[0].startContainer.getCommonAncestor(a[a.length-1].endContainer)},scrollIntoView:function(){this.type!=
+CKEDITOR.SELECTION_NONE&&this.getRanges()[0].scrollIntoView()},removeAllRanges:function(){if(this.getType()!=CKEDITOR.SELECTION_NONE){var a=this.getNative();try{a&&a[p?"empty":"removeAllRanges"]()}catch(b){}this.reset()}}}}(),"use strict",CKEDITOR.STYLE_BLOCK=1,CKEDITOR.STYLE_INLINE=2,CKEDITOR.STYLE_OBJECT=3,function(){function a(a,b){for(var c,d;a=a.getParent();){if(a.equals(b))break;if(a.getAttribute("data-nostyle"))c=a;else if(!d){var f=a.getAttribute("contentEditable");f=="false"?c=a:f=="true"&&
+(d=1)}}return c}function e(b){var d=b.document;if(b.collapsed){d=m(this,d);b.insertNode(d);b.moveToPosition(d,CKEDITOR.POSITION_BEFORE_END)}else{var f=this.element,g=this._.definition,j,i=g.ignoreReadonly,h=i||g.includeReadonly;h==null&&(h=b.root.getCustomData("cke_includeReadonly"));var k=CKEDITOR.dtd[f];if(!k){j=true;k=CKEDITOR.dtd.span}b.enlarge(CKEDITOR.ENLARGE_INLINE,1);b.trim();var p=b.createBookmark(),o=p.startNode,n=p.endNode,r=o,t;if(!i){var q=b.getCommonAncestor(),i=a(o,q),q=a(n,q);i&&(r=
+i.getNextSourceNode(true));q&&(n=q)}for(r.getPosition(n)==CKEDITOR.POSITION_FOLLOWING&&(r=0);r;){i=false;if(r.equals(n)){r=null;i=true}else{var w=r.type==CKEDITOR.NODE_ELEMENT?r.getName():null,q=w&&r.getAttribute("contentEditable")=="false",u=w&&r.getAttribute("data-nostyle");if(w&&r.data("cke-bookmark")){r=r.getNextSourceNode(true);continue}if(q&&h&&CKEDITOR.dtd.$block[w])for(var x=r,v=c(x),s=void 0,z=v.length,y=0,x=z&&new CKEDITOR.dom.range(x.getDocument());y<z;++y){var s=v[y],A=CKEDITOR.filter.instances[s.data("cke-filter")];
+if(A?A.check(this):1){x.selectNodeContents(s);e.call(this,x)}}v=w?!k[w]||u?0:q&&!h?0:(r.getPosition(n)|D)==D&&(!g.childRule||g.childRule(r)):1;if(v)if((v=r.getParent())&&((v.getDtd()||CKEDITOR.dtd.span)[f]||j)&&(!g.parentRule||g.parentRule(v))){if(!t&&(!w||!CKEDITOR.dtd.$removeEmpty[w]||(r.getPosition(n)|D)==D)){t=b.clone();t.setStartBefore(r)}w=r.type;if(w==CKEDITOR.NODE_TEXT||q||w==CKEDITOR.NODE_ELEMENT&&!r.getChildCount()){for(var w=r,aa;(i=!w.getNext(B))&&(aa=w.getParent(),k[aa.getName()])&&(aa.getPosition(o)|
+C)==C&&(!g.childRule||g.childRule(aa));)w=aa;t.setEndAfter(w)}}else i=true;else i=true;r=r.getNextSourceNode(u||q)}if(i&&t&&!t.collapsed){for(var i=m(this,d),q=i.hasAttributes(),u=t.getCommonAncestor(),w={},v={},s={},z={},Y,W,ba;i&&u;){if(u.getName()==f){for(Y in g.attributes)if(!z[Y]&&(ba=u.getAttribute(W)))i.getAttribute(Y)==ba?v[Y]=1:z[Y]=1;for(W in g.styles)if(!s[W]&&(ba=u.getStyle(W)))i.getStyle(W)==ba?w[W]=1:s[W]=1}u=u.getParent()}for(Y in v)i.removeAttribute(Y);for(W in w)i.removeStyle(W);
+q&&!i.hasAttributes()&&(i=null);if(i){t.extractContents().appendTo(i);t.insertNode(i);l.call(this,i);i.mergeSiblings();CKEDITOR.env.ie||i.$.normalize()}else{i=new CKEDITOR.dom.element("span");t.extractContents().appendTo(i);t.insertNode(i);l.call(this,i);i.remove(true)}t=null}}b.moveToBookmark(p);b.shrink(CKEDITOR.SHRINK_TEXT);b.shrink(CKEDITOR.NODE_ELEMENT,true)}}function b(a){function b(){for(var a=new CKEDITOR.dom.elementPath(d.getParent()),c=new CKEDITOR.dom.elementPath(h.getParent()),f=null,
+e=null,g=0;g<a.elements.length;g++){var j=a.elements[g];if(j==a.block||j==a.blockLimit)break;k.checkElementRemovable(j,true)&&(f=j)}for(g=0;g<c.elements.length;g++){j=c.elements[g];if(j==c.block||j==c.blockLimit)break;k.checkElementRemovable(j,true)&&(e=j)}e&&h.breakParent(e);f&&d.breakParent(f)}a.enlarge(CKEDITOR.ENLARGE_INLINE,1);var c=a.createBookmark(),d=c.startNode;if(a.collapsed){for(var f=new CKEDITOR.dom.elementPath(d.getParent(),a.root),e,g=0,j;g<f.elements.length&&(j=f.elements[g]);g++){if(j==
+f.block||j==f.blockLimit)break;if(this.checkElementRemovable(j)){var i;if(a.collapsed&&(a.checkBoundaryOfElement(j,CKEDITOR.END)||(i=a.checkBoundaryOfElement(j,CKEDITOR.START)))){e=j;e.match=i?"start":"end"}else{j.mergeSiblings();j.is(this.element)?q.call(this,j):o(j,w(this)[j.getName()])}}}if(e){j=d;for(g=0;;g++){i=f.elements[g];if(i.equals(e))break;else if(i.match)continue;else i=i.clone();i.append(j);j=i}j[e.match=="start"?"insertBefore":"insertAfter"](e)}}else{var h=c.endNode,k=this;b();for(f=
+d;!f.equals(h);){e=f.getNextSourceNode();if(f.type==CKEDITOR.NODE_ELEMENT&&this.checkElementRemovable(f)){f.getName()==this.element?q.call(this,f):o(f,w(this)[f.getName()]);if(e.type==CKEDITOR.NODE_ELEMENT&&e.contains(d)){b();e=d.getNext()}}f=e}}a.moveToBookmark(c);a.shrink(CKEDITOR.NODE_ELEMENT,true)}function c(a){var b=[];a.forEach(function(a){if(a.getAttribute("contenteditable")=="true"){b.push(a);return false}},CKEDITOR.NODE_ELEMENT,true);return b}function d(a){var b=a.getEnclosedNode()||a.getCommonAncestor(false,
+true);(a=(new CKEDITOR.dom.elementPath(b,a.root)).contains(this.element,1))&&!a.isReadOnly()&&p(a,this)}function i(a){var b=a.getCommonAncestor(true,true);if(a=(new CKEDITOR.dom.elementPath(b,a.root)).contains(this.element,1)){var b=this._.definition,c=b.attributes;if(c)for(var d in c)a.removeAttribute(d,c[d]);if(b.styles)for(var f in b.styles)b.styles.hasOwnProperty(f)&&a.removeStyle(f)}}function h(a){var b=a.createBookmark(true),c=a.createIterator();c.enforceRealBlocks=true;if(this._.enterMode)c.enlargeBr=
+this._.enterMode!=CKEDITOR.ENTER_BR;for(var d,f=a.document,e;d=c.getNextParagraph();)if(!d.isReadOnly()&&(c.activeFilter?c.activeFilter.check(this):1)){e=m(this,f,d);k(d,e)}a.moveToBookmark(b)}function f(a){var b=a.createBookmark(1),c=a.createIterator();c.enforceRealBlocks=true;c.enlargeBr=this._.enterMode!=CKEDITOR.ENTER_BR;for(var d,f;d=c.getNextParagraph();)if(this.checkElementRemovable(d))if(d.is("pre")){(f=this._.enterMode==CKEDITOR.ENTER_BR?null:a.document.createElement(this._.enterMode==CKEDITOR.ENTER_P?
+"p":"div"))&&d.copyAttributes(f);k(d,f)}else q.call(this,d);a.moveToBookmark(b)}function k(a,b){var c=!b;if(c){b=a.getDocument().createElement("div");a.copyAttributes(b)}var d=b&&b.is("pre"),f=a.is("pre"),e=!d&&f;if(d&&!f){f=b;(e=a.getBogus())&&e.remove();e=a.getHtml();e=g(e,/(?:^[ \t\n\r]+)|(?:[ \t\n\r]+$)/g,"");e=e.replace(/[ \t\r\n]*(<br[^>]*>)[ \t\r\n]*/gi,"$1");e=e.replace(/([ \t\n\r]+|&nbsp;)/g," ");e=e.replace(/<br\b[^>]*>/gi,"\n");if(CKEDITOR.env.ie){var i=a.getDocument().createElement("div");
+i.append(f);f.$.outerHTML="<pre>"+e+"</pre>";f.copyAttributes(i.getFirst());f=i.getFirst().remove()}else f.setHtml(e);b=f}else e?b=n(c?[a.getHtml()]:j(a),b):a.moveChildren(b);b.replace(a);if(d){var c=b,h;if((h=c.getPrevious(A))&&h.type==CKEDITOR.NODE_ELEMENT&&h.is("pre")){d=g(h.getHtml(),/\n$/,"")+"\n\n"+g(c.getHtml(),/^\n/,"");CKEDITOR.env.ie?c.$.outerHTML="<pre>"+d+"</pre>":c.setHtml(d);h.remove()}}else c&&r(b)}function j(a){var b=[];g(a.getOuterHtml(),/(\S\s*)\n(?:\s|(<span[^>]+data-cke-bookmark.*?\/span>))*\n(?!$)/gi,
+function(a,b,c){return b+"</pre>"+c+"<pre>"}).replace(/<pre\b.*?>([\s\S]*?)<\/pre>/gi,function(a,c){b.push(c)});return b}function g(a,b,c){var d="",f="",a=a.replace(/(^<span[^>]+data-cke-bookmark.*?\/span>)|(<span[^>]+data-cke-bookmark.*?\/span>$)/gi,function(a,b,c){b&&(d=b);c&&(f=c);return""});return d+a.replace(b,c)+f}function n(a,b){var c;a.length>1&&(c=new CKEDITOR.dom.documentFragment(b.getDocument()));for(var d=0;d<a.length;d++){var f=a[d],f=f.replace(/(\r\n|\r)/g,"\n"),f=g(f,/^[ \t]*\n/,""),
+f=g(f,/\n$/,""),f=g(f,/^[ \t]+|[ \t]+$/g,function(a,b){return a.length==1?"&nbsp;":b?" "+CKEDITOR.tools.repeat("&nbsp;",a.length-1):CKEDITOR.tools.repeat("&nbsp;",a.length-1)+" "}),f=f.replace(/\n/g,"<br>"),f=f.replace(/[ \t]{2,}/g,function(a){return CKEDITOR.tools.repeat("&nbsp;",a.length-1)+" "});if(c){var e=b.clone();e.setHtml(f);c.append(e)}else b.setHtml(f)}return c||b}function q(a,b){var c=this._.definition,d=c.attributes,c=c.styles,f=w(this)[a.getName()],e=CKEDITOR.tools.isEmpty(d)&&CKEDITOR.tools.isEmpty(c),
+g;for(g in d)if(!((g=="class"||this._.definition.fullMatch)&&a.getAttribute(g)!=u(g,d[g]))&&!(b&&g.slice(0,5)=="data-")){e=a.hasAttribute(g);a.removeAttribute(g)}for(var j in c)if(!(this._.definition.fullMatch&&a.getStyle(j)!=u(j,c[j],true))){e=e||!!a.getStyle(j);a.removeStyle(j)}o(a,f,v[a.getName()]);e&&(this._.definition.alwaysRemoveElement?r(a,1):!CKEDITOR.dtd.$block[a.getName()]||this._.enterMode==CKEDITOR.ENTER_BR&&!a.hasAttributes()?r(a):a.renameNode(this._.enterMode==CKEDITOR.ENTER_P?"p":"div"))}
+function l(a){for(var b=w(this),c=a.getElementsByTag(this.element),d,f=c.count();--f>=0;){d=c.getItem(f);d.isReadOnly()||q.call(this,d,true)}for(var e in b)if(e!=this.element){c=a.getElementsByTag(e);for(f=c.count()-1;f>=0;f--){d=c.getItem(f);d.isReadOnly()||o(d,b[e])}}}function o(a,b,c){if(b=b&&b.attributes)for(var d=0;d<b.length;d++){var f=b[d][0],e;if(e=a.getAttribute(f)){var g=b[d][1];(g===null||g.test&&g.test(e)||typeof g=="string"&&e==g)&&a.removeAttribute(f)}}c||r(a)}function r(a,b){if(!a.hasAttributes()||
+b)if(CKEDITOR.dtd.$block[a.getName()]){var c=a.getPrevious(A),d=a.getNext(A);c&&(c.type==CKEDITOR.NODE_TEXT||!c.isBlockBoundary({br:1}))&&a.append("br",1);d&&(d.type==CKEDITOR.NODE_TEXT||!d.isBlockBoundary({br:1}))&&a.append("br");a.remove(true)}else{c=a.getFirst();d=a.getLast();a.remove(true);if(c){c.type==CKEDITOR.NODE_ELEMENT&&c.mergeSiblings();d&&(!c.equals(d)&&d.type==CKEDITOR.NODE_ELEMENT)&&d.mergeSiblings()}}}function m(a,b,c){var d;d=a.element;d=="*"&&(d="span");d=new CKEDITOR.dom.element(d,
+b);c&&c.copyAttributes(d);d=p(d,a);b.getCustomData("doc_processing_style")&&d.hasAttribute("id")?d.removeAttribute("id"):b.setCustomData("doc_processing_style",1);return d}function p(a,b){var c=b._.definition,d=c.attributes,c=CKEDITOR.style.getStyleText(c);if(d)for(var f in d)a.setAttribute(f,d[f]);c&&a.setAttribute("style",c);return a}function t(a,b){for(var c in a)a[c]=a[c].replace(z,function(a,c){return b[c]})}function w(a){if(a._.overrides)return a._.overrides;var b=a._.overrides={},c=a._.definition.overrides;
+if(c){CKEDITOR.tools.isArray(c)||(c=[c]);for(var d=0;d<c.length;d++){var f=c[d],e,g;if(typeof f=="string")e=f.toLowerCase();else{e=f.element?f.element.toLowerCase():a.element;g=f.attributes}f=b[e]||(b[e]={});if(g){var f=f.attributes=f.attributes||[],j;for(j in g)f.push([j.toLowerCase(),g[j]])}}}return b}function u(a,b,c){var d=new CKEDITOR.dom.element("span");d[c?"setStyle":"setAttribute"](a,b);return d[c?"getStyle":"getAttribute"](a)}function x(a,b,c){for(var d=a.document,f=a.getRanges(),b=b?this.removeFromRange:
+this.applyToRange,e,g=f.createIterator();e=g.getNextRange();)b.call(this,e,c);a.selectRanges(f);d.removeCustomData("doc_processing_style")}var v={address:1,div:1,h1:1,h2:1,h3:1,h4:1,h5:1,h6:1,p:1,pre:1,section:1,header:1,footer:1,nav:1,article:1,aside:1,figure:1,dialog:1,hgroup:1,time:1,meter:1,menu:1,command:1,keygen:1,output:1,progress:1,details:1,datagrid:1,datalist:1},s={a:1,blockquote:1,embed:1,hr:1,img:1,li:1,object:1,ol:1,table:1,td:1,tr:1,th:1,ul:1,dl:1,dt:1,dd:1,form:1,audio:1,video:1},y=
+/\s*(?:;\s*|$)/,z=/#\((.+?)\)/g,B=CKEDITOR.dom.walker.bookmark(0,1),A=CKEDITOR.dom.walker.whitespaces(1);CKEDITOR.style=function(a,b){if(typeof a.type=="string")return new CKEDITOR.style.customHandlers[a.type](a);var c=a.attributes;if(c&&c.style){a.styles=CKEDITOR.tools.extend({},a.styles,CKEDITOR.tools.parseCssText(c.style));delete c.style}if(b){a=CKEDITOR.tools.clone(a);t(a.attributes,b);t(a.styles,b)}c=this.element=a.element?typeof a.element=="string"?a.element.toLowerCase():a.element:"*";this.type=
+a.type||(v[c]?CKEDITOR.STYLE_BLOCK:s[c]?CKEDITOR.STYLE_OBJECT:CKEDITOR.STYLE_INLINE);if(typeof this.element=="object")this.type=CKEDITOR.STYLE_OBJECT;this._={definition:a}};CKEDITOR.style.prototype={apply:function(a){if(a instanceof CKEDITOR.dom.document)return x.call(this,a.getSelection());if(this.checkApplicable(a.elementPath(),a)){var b=this._.enterMode;if(!b)this._.enterMode=a.activeEnterMode;x.call(this,a.getSelection(),0,a);this._.enterMode=b}},remove:function(a){if(a instanceof CKEDITOR.dom.document)return x.call(this,
+a.getSelection(),1);if(this.checkApplicable(a.elementPath(),a)){var b=this._.enterMode;if(!b)this._.enterMode=a.activeEnterMode;x.call(this,a.getSelection(),1,a);this._.enterMode=b}},applyToRange:function(a){this.applyToRange=this.type==CKEDITOR.STYLE_INLINE?e:this.type==CKEDITOR.STYLE_BLOCK?h:this.type==CKEDITOR.STYLE_OBJECT?d:null;return this.applyToRange(a)},removeFromRange:function(a){this.removeFromRange=this.type==CKEDITOR.STYLE_INLINE?b:this.type==CKEDITOR.STYLE_BLOCK?f:this.type==CKEDITOR.STYLE_OBJECT?
+i:null;return this.removeFromRange(a)},applyToObject:function(a){p(a,this)},checkActive:function(a,b){switch(this.type){case CKEDITOR.STYLE_BLOCK:return this.checkElementRemovable(a.block||a.blockLimit,true,b);case CKEDITOR.STYLE_OBJECT:case CKEDITOR.STYLE_INLINE:for(var c=a.elements,d=0,f;d<c.length;d++){f=c[d];if(!(this.type==CKEDITOR.STYLE_INLINE&&(f==a.block||f==a.blockLimit))){if(this.type==CKEDITOR.STYLE_OBJECT){var e=f.getName();if(!(typeof this.element=="string"?e==this.element:e in this.element))continue}if(this.checkElementRemovable(f,
+true,b))return true}}}return false},checkApplicable:function(a,b,c){b&&b instanceof CKEDITOR.filter&&(c=b);if(c&&!c.check(this))return false;switch(this.type){case CKEDITOR.STYLE_OBJECT:return!!a.contains(this.element);case CKEDITOR.STYLE_BLOCK:return!!a.blockLimit.getDtd()[this.element]}return true},checkElementMatch:function(a,b){var c=this._.definition;if(!a||!c.ignoreReadonly&&a.isReadOnly())return false;var d=a.getName();if(typeof this.element=="string"?d==this.element:d in this.element){if(!b&&
+!a.hasAttributes())return true;if(d=c._AC)c=d;else{var d={},f=0,e=c.attributes;if(e)for(var g in e){f++;d[g]=e[g]}if(g=CKEDITOR.style.getStyleText(c)){d.style||f++;d.style=g}d._length=f;c=c._AC=d}if(c._length){for(var j in c)if(j!="_length"){f=a.getAttribute(j)||"";if(j=="style")a:{d=c[j];typeof d=="string"&&(d=CKEDITOR.tools.parseCssText(d));typeof f=="string"&&(f=CKEDITOR.tools.parseCssText(f,true));g=void 0;for(g in d)if(!(g in f&&(f[g]==d[g]||d[g]=="inherit"||f[g]=="inherit"))){d=false;break a}d=
+true}else d=c[j]==f;if(d){if(!b)return true}else if(b)return false}if(b)return true}else return true}return false},checkElementRemovable:function(a,b,c){if(this.checkElementMatch(a,b,c))return true;if(b=w(this)[a.getName()]){var d;if(!(b=b.attributes))return true;for(c=0;c<b.length;c++){d=b[c][0];if(d=a.getAttribute(d)){var f=b[c][1];if(f===null)return true;if(typeof f=="string"){if(d==f)return true}else if(f.test(d))return true}}}return false},buildPreview:function(a){var b=this._.definition,c=[],
+d=b.element;d=="bdo"&&(d="span");var c=["<",d],f=b.attributes;if(f)for(var e in f)c.push(" ",e,'="',f[e],'"');(f=CKEDITOR.style.getStyleText(b))&&c.push(' style="',f,'"');c.push(">",a||b.name,"</",d,">");return c.join("")},getDefinition:function(){return this._.definition}};CKEDITOR.style.getStyleText=function(a){var b=a._ST;if(b)return b;var b=a.styles,c=a.attributes&&a.attributes.style||"",d="";c.length&&(c=c.replace(y,";"));for(var f in b){var e=b[f],g=(f+":"+e).replace(y,";");e=="inherit"?d=d+
+g:c=c+g}c.length&&(c=CKEDITOR.tools.normalizeCssText(c,true));return a._ST=c+d};CKEDITOR.style.customHandlers={};CKEDITOR.style.addCustomHandler=function(a){var b=function(a){this._={definition:a};this.setup&&this.setup(a)};b.prototype=CKEDITOR.tools.extend(CKEDITOR.tools.prototypedCopy(CKEDITOR.style.prototype),{assignedTo:CKEDITOR.STYLE_OBJECT},a,true);return this.customHandlers[a.type]=b};var D=CKEDITOR.POSITION_PRECEDING|CKEDITOR.POSITION_IDENTICAL|CKEDITOR.POSITION_IS_CONTAINED,C=CKEDITOR.POSITION_FOLLOWING|
+CKEDITOR.POSITION_IDENTICAL|CKEDITOR.POSITION_IS_CONTAINED}(),CKEDITOR.styleCommand=function(a,e){this.requiredContent=this.allowedContent=this.style=a;CKEDITOR.tools.extend(this,e,true)},CKEDITOR.styleCommand.prototype.exec=function(a){a.focus();this.state==CKEDITOR.TRISTATE_OFF?a.applyStyle(this.style):this.state==CKEDITOR.TRISTATE_ON&&a.removeStyle(this.style)},CKEDITOR.stylesSet=new CKEDITOR.resourceManager("","stylesSet"),CKEDITOR.addStylesSet=CKEDITOR.tools.bind(CKEDITOR.stylesSet.add,CKEDITOR.stylesSet),
+CKEDITOR.loadStylesSet=function(a,e,b){CKEDITOR.stylesSet.addExternal(a,e,"");CKEDITOR.stylesSet.load(a,b)},CKEDITOR.tools.extend(CKEDITOR.editor.prototype,{attachStyleStateChange:function(a,e){var b=this._.styleStateChangeCallbacks;if(!b){b=this._.styleStateChangeCallbacks=[];this.on("selectionChange",function(a){for(var d=0;d<b.length;d++){var e=b[d],h=e.style.checkActive(a.data.path,this)?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF;e.fn.call(this,h)}})}b.push({style:a,fn:e})},applyStyle:function(a){a.apply(this)},
+removeStyle:function(a){a.remove(this)},getStylesSet:function(a){if(this._.stylesDefinitions)a(this._.stylesDefinitions);else{var e=this,b=e.config.stylesCombo_stylesSet||e.config.stylesSet;if(b===false)a(null);else if(b instanceof Array){e._.stylesDefinitions=b;a(b)}else{b||(b="default");var b=b.split(":"),c=b[0];CKEDITOR.stylesSet.addExternal(c,b[1]?b.slice(1).join(":"):CKEDITOR.getUrl("styles.js"),"");CKEDITOR.stylesSet.load(c,function(b){e._.stylesDefinitions=b[c];a(e._.stylesDefinitions)})}}}}),
+CKEDITOR.dom.comment=function(a,e){typeof a=="string"&&(a=(e?e.$:document).createComment(a));CKEDITOR.dom.domObject.call(this,a)},CKEDITOR.dom.comment.prototype=new CKEDITOR.dom.node,CKEDITOR.tools.extend(CKEDITOR.dom.comment.prototype,{type:CKEDITOR.NODE_COMMENT,getOuterHtml:function(){return"<\!--"+this.$.nodeValue+"--\>"}}),"use strict",function(){var a={},e={},b;for(b in CKEDITOR.dtd.$blockLimit)b in CKEDITOR.dtd.$list||(a[b]=1);for(b in CKEDITOR.dtd.$block)b in CKEDITOR.dtd.$blockLimit||b in
+CKEDITOR.dtd.$empty||(e[b]=1);CKEDITOR.dom.elementPath=function(b,d){var i=null,h=null,f=[],k=b,j,d=d||b.getDocument().getBody();do if(k.type==CKEDITOR.NODE_ELEMENT){f.push(k);if(!this.lastElement){this.lastElement=k;if(k.is(CKEDITOR.dtd.$object)||k.getAttribute("contenteditable")=="false")continue}if(k.equals(d))break;if(!h){j=k.getName();k.getAttribute("contenteditable")=="true"?h=k:!i&&e[j]&&(i=k);if(a[j]){var g;if(g=!i){if(j=j=="div"){a:{j=k.getChildren();g=0;for(var n=j.count();g<n;g++){var q=
+j.getItem(g);if(q.type==CKEDITOR.NODE_ELEMENT&&CKEDITOR.dtd.$block[q.getName()]){j=true;break a}}j=false}j=!j}g=j}g?i=k:h=k}}}while(k=k.getParent());h||(h=d);this.block=i;this.blockLimit=h;this.root=d;this.elements=f}}(),CKEDITOR.dom.elementPath.prototype={compare:function(a){var e=this.elements,a=a&&a.elements;if(!a||e.length!=a.length)return false;for(var b=0;b<e.length;b++)if(!e[b].equals(a[b]))return false;return true},contains:function(a,e,b){var c;typeof a=="string"&&(c=function(b){return b.getName()==
+a});a instanceof CKEDITOR.dom.element?c=function(b){return b.equals(a)}:CKEDITOR.tools.isArray(a)?c=function(b){return CKEDITOR.tools.indexOf(a,b.getName())>-1}:typeof a=="function"?c=a:typeof a=="object"&&(c=function(b){return b.getName()in a});var d=this.elements,i=d.length;e&&i--;if(b){d=Array.prototype.slice.call(d,0);d.reverse()}for(e=0;e<i;e++)if(c(d[e]))return d[e];return null},isContextFor:function(a){var e;if(a in CKEDITOR.dtd.$block){e=this.contains(CKEDITOR.dtd.$intermediate)||this.root.equals(this.block)&&
+this.block||this.blockLimit;return!!e.getDtd()[a]}return true},direction:function(){return(this.block||this.blockLimit||this.root).getDirection(1)}},CKEDITOR.dom.text=function(a,e){typeof a=="string"&&(a=(e?e.$:document).createTextNode(a));this.$=a},CKEDITOR.dom.text.prototype=new CKEDITOR.dom.node,CKEDITOR.tools.extend(CKEDITOR.dom.text.prototype,{type:CKEDITOR.NODE_TEXT,getLength:function(){return this.$.nodeValue.length},getText:function(){return this.$.nodeValue},setText:function(a){this.$.nodeValue=
+a},split:function(a){var e=this.$.parentNode,b=e.childNodes.length,c=this.getLength(),d=this.getDocument(),i=new CKEDITOR.dom.text(this.$.splitText(a),d);if(e.childNodes.length==b)if(a>=c){i=d.createText("");i.insertAfter(this)}else{a=d.createText("");a.insertAfter(i);a.remove()}return i},substring:function(a,e){return typeof e!="number"?this.$.nodeValue.substr(a):this.$.nodeValue.substring(a,e)}}),function(){function a(a,c,d){var e=a.serializable,h=c[d?"endContainer":"startContainer"],f=d?"endOffset":
+"startOffset",k=e?c.document.getById(a.startNode):a.startNode,a=e?c.document.getById(a.endNode):a.endNode;if(h.equals(k.getPrevious())){c.startOffset=c.startOffset-h.getLength()-a.getPrevious().getLength();h=a.getNext()}else if(h.equals(a.getPrevious())){c.startOffset=c.startOffset-h.getLength();h=a.getNext()}h.equals(k.getParent())&&c[f]++;h.equals(a.getParent())&&c[f]++;c[d?"endContainer":"startContainer"]=h;return c}CKEDITOR.dom.rangeList=function(a){if(a instanceof CKEDITOR.dom.rangeList)return a;
+a?a instanceof CKEDITOR.dom.range&&(a=[a]):a=[];return CKEDITOR.tools.extend(a,e)};var e={createIterator:function(){var a=this,c=CKEDITOR.dom.walker.bookmark(),d=[],e;return{getNextRange:function(h){e=e===void 0?0:e+1;var f=a[e];if(f&&a.length>1){if(!e)for(var k=a.length-1;k>=0;k--)d.unshift(a[k].createBookmark(true));if(h)for(var j=0;a[e+j+1];){for(var g=f.document,h=0,k=g.getById(d[j].endNode),g=g.getById(d[j+1].startNode);;){k=k.getNextSourceNode(false);if(g.equals(k))h=1;else if(c(k)||k.type==
+CKEDITOR.NODE_ELEMENT&&k.isBlockBoundary())continue;break}if(!h)break;j++}for(f.moveToBookmark(d.shift());j--;){k=a[++e];k.moveToBookmark(d.shift());f.setEnd(k.endContainer,k.endOffset)}}return f}}},createBookmarks:function(b){for(var c=[],d,e=0;e<this.length;e++){c.push(d=this[e].createBookmark(b,true));for(var h=e+1;h<this.length;h++){this[h]=a(d,this[h]);this[h]=a(d,this[h],true)}}return c},createBookmarks2:function(a){for(var c=[],d=0;d<this.length;d++)c.push(this[d].createBookmark2(a));return c},
+moveToBookmarks:function(a){for(var c=0;c<this.length;c++)this[c].moveToBookmark(a[c])}}}(),function(){function a(){return CKEDITOR.getUrl(CKEDITOR.skinName.split(",")[1]||"skins/"+CKEDITOR.skinName.split(",")[0]+"/")}function e(b){var c=CKEDITOR.skin["ua_"+b],d=CKEDITOR.env;if(c)for(var c=c.split(",").sort(function(a,b){return a>b?-1:1}),f=0,e;f<c.length;f++){e=c[f];if(d.ie&&(e.replace(/^ie/,"")==d.version||d.quirks&&e=="iequirks"))e="ie";if(d[e]){b=b+("_"+c[f]);break}}return CKEDITOR.getUrl(a()+
+b+".css")}function b(a,b){if(!i[a]){CKEDITOR.document.appendStyleSheet(e(a));i[a]=1}b&&b()}function c(a){var b=a.getById(h);if(!b){b=a.getHead().append("style");b.setAttribute("id",h);b.setAttribute("type","text/css")}return b}function d(a,b,c){var d,f,e;if(CKEDITOR.env.webkit){b=b.split("}").slice(0,-1);for(f=0;f<b.length;f++)b[f]=b[f].split("{")}for(var i=0;i<a.length;i++)if(CKEDITOR.env.webkit)for(f=0;f<b.length;f++){e=b[f][1];for(d=0;d<c.length;d++)e=e.replace(c[d][0],c[d][1]);a[i].$.sheet.addRule(b[f][0],
+e)}else{e=b;for(d=0;d<c.length;d++)e=e.replace(c[d][0],c[d][1]);CKEDITOR.env.ie&&CKEDITOR.env.version<11?a[i].$.styleSheet.cssText=a[i].$.styleSheet.cssText+e:a[i].$.innerHTML=a[i].$.innerHTML+e}}var i={};CKEDITOR.skin={path:a,loadPart:function(c,d){CKEDITOR.skin.name!=CKEDITOR.skinName.split(",")[0]?CKEDITOR.scriptLoader.load(CKEDITOR.getUrl(a()+"skin.js"),function(){b(c,d)}):b(c,d)},getPath:function(a){return CKEDITOR.getUrl(e(a))},icons:{},addIcon:function(a,b,c,d){a=a.toLowerCase();this.icons[a]||
+(this.icons[a]={path:b,offset:c||0,bgsize:d||"16px"})},getIconStyle:function(a,b,c,d,f){var e;if(a){a=a.toLowerCase();b&&(e=this.icons[a+"-rtl"]);e||(e=this.icons[a])}a=c||e&&e.path||"";d=d||e&&e.offset;f=f||e&&e.bgsize||"16px";return a&&"background-image:url("+CKEDITOR.getUrl(a)+");background-position:0 "+d+"px;background-size:"+f+";"}};CKEDITOR.tools.extend(CKEDITOR.editor.prototype,{getUiColor:function(){return this.uiColor},setUiColor:function(a){var b=c(CKEDITOR.document);return(this.setUiColor=
+function(a){this.uiColor=a;var c=CKEDITOR.skin.chameleon,e="",j="";if(typeof c=="function"){e=c(this,"editor");j=c(this,"panel")}a=[[k,a]];d([b],e,a);d(f,j,a)}).call(this,a)}});var h="cke_ui_color",f=[],k=/\$color/g;CKEDITOR.on("instanceLoaded",function(a){if(!CKEDITOR.env.ie||!CKEDITOR.env.quirks){var b=a.editor,a=function(a){a=(a.data[0]||a.data).element.getElementsByTag("iframe").getItem(0).getFrameDocument();if(!a.getById("cke_ui_color")){a=c(a);f.push(a);var e=b.getUiColor();e&&d([a],CKEDITOR.skin.chameleon(b,
+"panel"),[[k,e]])}};b.on("panelShow",a);b.on("menuShow",a);b.config.uiColor&&b.setUiColor(b.config.uiColor)}})}(),function(){if(CKEDITOR.env.webkit)CKEDITOR.env.hc=false;else{var a=CKEDITOR.dom.element.createFromHtml('<div style="width:0;height:0;position:absolute;left:-10000px;border:1px solid;border-color:red blue"></div>',CKEDITOR.document);a.appendTo(CKEDITOR.document.getHead());try{var e=a.getComputedStyle("border-top-color"),b=a.getComputedStyle("border-right-color");CKEDITOR.env.hc=!!(e&&e==
+b)}catch(c){CKEDITOR.env.hc=false}a.remove()}if(CKEDITOR.env.hc)CKEDITOR.env.cssClass=CKEDITOR.env.cssClass+" cke_hc";CKEDITOR.document.appendStyleText(".cke{visibility:hidden;}");CKEDITOR.status="loaded";CKEDITOR.fireOnce("loaded");if(a=CKEDITOR._.pending){delete CKEDITOR._.pending;for(e=0;e<a.length;e++){CKEDITOR.editor.prototype.constructor.apply(a[e][0],a[e][1]);CKEDITOR.add(a[e][0])}}}(),CKEDITOR.skin.name="moono",CKEDITOR.skin.ua_editor="ie,iequirks,ie7,ie8,gecko",CKEDITOR.skin.ua_dialog="ie,iequirks,ie7,ie8",
+CKEDITOR.skin.chameleon=function(){var a=function(){return function(a,b){for(var e=a.match(/[^#]./g),h=0;h<3;h++){var f=e,k=h,j;j=parseInt(e[h],16);j=("0"+(b<0?0|j*(1+b):0|j+(255-j)*b).toString(16)).slice(-2);f[k]=j}return"#"+e.join("")}}(),e=function(){var a=new CKEDITOR.template("background:#{to};background-image:linear-gradient(to bottom,{from},{to});filter:progid:DXImageTransform.Microsoft.gradient(gradientType=0,startColorstr='{from}',endColorstr='{to}');");return function(b,e){return a.output({from:b,
+to:e})}}(),b={editor:new CKEDITOR.template("{id}.cke_chrome [border-color:{defaultBorder};] {id} .cke_top [ {defaultGradient}border-bottom-color:{defaultBorder};] {id} .cke_bottom [{defaultGradient}border-top-color:{defaultBorder};] {id} .cke_resizer [border-right-color:{ckeResizer}] {id} .cke_dialog_title [{defaultGradient}border-bottom-color:{defaultBorder};] {id} .cke_dialog_footer [{defaultGradient}outline-color:{defaultBorder};border-top-color:{defaultBorder};] {id} .cke_dialog_tab [{lightGradient}border-color:{defaultBorder};] {id} .cke_dialog_tab:hover [{mediumGradient}] {id} .cke_dialog_contents [border-top-color:{defaultBorder};] {id} .cke_dialog_tab_selected, {id} .cke_dialog_tab_selected:hover [background:{dialogTabSelected};border-bottom-color:{dialogTabSelectedBorder};] {id} .cke_dialog_body [background:{dialogBody};border-color:{defaultBorder};] {id} .cke_toolgroup [{lightGradient}border-color:{defaultBorder};] {id} a.cke_button_off:hover, {id} a.cke_button_off:focus, {id} a.cke_button_off:active [{mediumGradient}] {id} .cke_button_on [{ckeButtonOn}] {id} .cke_toolbar_separator [background-color: {ckeToolbarSeparator};] {id} .cke_combo_button [border-color:{defaultBorder};{lightGradient}] {id} a.cke_combo_button:hover, {id} a.cke_combo_button:focus, {id} .cke_combo_on a.cke_combo_button [border-color:{defaultBorder};{mediumGradient}] {id} .cke_path_item [color:{elementsPathColor};] {id} a.cke_path_item:hover, {id} a.cke_path_item:focus, {id} a.cke_path_item:active [background-color:{elementsPathBg};] {id}.cke_panel [border-color:{defaultBorder};] "),
+panel:new CKEDITOR.template(".cke_panel_grouptitle [{lightGradient}border-color:{defaultBorder};] .cke_menubutton_icon [background-color:{menubuttonIcon};] .cke_menubutton:hover .cke_menubutton_icon, .cke_menubutton:focus .cke_menubutton_icon, .cke_menubutton:active .cke_menubutton_icon [background-color:{menubuttonIconHover};] .cke_menuseparator [background-color:{menubuttonIcon};] a:hover.cke_colorbox, a:focus.cke_colorbox, a:active.cke_colorbox [border-color:{defaultBorder};] a:hover.cke_colorauto, a:hover.cke_colormore, a:focus.cke_colorauto, a:focus.cke_colormore, a:active.cke_colorauto, a:active.cke_colormore [background-color:{ckeColorauto};border-color:{defaultBorder};] ")};
+return function(c,d){var i=c.uiColor,i={id:"."+c.id,defaultBorder:a(i,-0.1),defaultGradient:e(a(i,0.9),i),lightGradient:e(a(i,1),a(i,0.7)),mediumGradient:e(a(i,0.8),a(i,0.5)),ckeButtonOn:e(a(i,0.6),a(i,0.7)),ckeResizer:a(i,-0.4),ckeToolbarSeparator:a(i,0.5),ckeColorauto:a(i,0.8),dialogBody:a(i,0.7),dialogTabSelected:e("#FFFFFF","#FFFFFF"),dialogTabSelectedBorder:"#FFF",elementsPathColor:a(i,-0.6),elementsPathBg:i,menubuttonIcon:a(i,0.5),menubuttonIconHover:a(i,0.3)};return b[d].output(i).replace(/\[/g,
+"{").replace(/\]/g,"}")}}(),CKEDITOR.plugins.add("dialogui",{onLoad:function(){var a=function(a){this._||(this._={});this._["default"]=this._.initValue=a["default"]||"";this._.required=a.required||false;for(var b=[this._],c=1;c<arguments.length;c++)b.push(arguments[c]);b.push(true);CKEDITOR.tools.extend.apply(CKEDITOR.tools,b);return this._},e={build:function(a,b,c){return new CKEDITOR.ui.dialog.textInput(a,b,c)}},b={build:function(a,b,c){return new CKEDITOR.ui.dialog[b.type](a,b,c)}},c={isChanged:function(){return this.getValue()!=
+this.getInitValue()},reset:function(a){this.setValue(this.getInitValue(),a)},setInitValue:function(){this._.initValue=this.getValue()},resetInitValue:function(){this._.initValue=this._["default"]},getInitValue:function(){return this._.initValue}},d=CKEDITOR.tools.extend({},CKEDITOR.ui.dialog.uiElement.prototype.eventProcessors,{onChange:function(a,b){if(!this._.domOnChangeRegistered){a.on("load",function(){this.getInputElement().on("change",function(){a.parts.dialog.isVisible()&&this.fire("change",
+{value:this.getValue()})},this)},this);this._.domOnChangeRegistered=true}this.on("change",b)}},true),i=/^on([A-Z]\w+)/,h=function(a){for(var b in a)(i.test(b)||b=="title"||b=="type")&&delete a[b];return a},f=function(a){a=a.data.getKeystroke();a==CKEDITOR.SHIFT+CKEDITOR.ALT+36?this.setDirectionMarker("ltr"):a==CKEDITOR.SHIFT+CKEDITOR.ALT+35&&this.setDirectionMarker("rtl")};CKEDITOR.tools.extend(CKEDITOR.ui.dialog,{labeledElement:function(b,c,d,f){if(!(arguments.length<4)){var e=a.call(this,c);e.labelId=
+CKEDITOR.tools.getNextId()+"_label";this._.children=[];var i={role:c.role||"presentation"};if(c.includeLabel)i["aria-labelledby"]=e.labelId;CKEDITOR.ui.dialog.uiElement.call(this,b,c,d,"div",null,i,function(){var a=[],d=c.required?" cke_required":"";if(c.labelLayout!="horizontal")a.push('<label class="cke_dialog_ui_labeled_label'+d+'" ',' id="'+e.labelId+'"',e.inputId?' for="'+e.inputId+'"':"",(c.labelStyle?' style="'+c.labelStyle+'"':"")+">",c.label,"</label>",'<div class="cke_dialog_ui_labeled_content"',
+c.controlStyle?' style="'+c.controlStyle+'"':"",' role="presentation">',f.call(this,b,c),"</div>");else{d={type:"hbox",widths:c.widths,padding:0,children:[{type:"html",html:'<label class="cke_dialog_ui_labeled_label'+d+'" id="'+e.labelId+'" for="'+e.inputId+'"'+(c.labelStyle?' style="'+c.labelStyle+'"':"")+">"+CKEDITOR.tools.htmlEncode(c.label)+"</label>"},{type:"html",html:'<span class="cke_dialog_ui_labeled_content"'+(c.controlStyle?' style="'+c.controlStyle+'"':"")+">"+f.call(this,b,c)+"</span>"}]};
+CKEDITOR.dialog._.uiElementBuilders.hbox.build(b,d,a)}return a.join("")})}},textInput:function(b,c,d){if(!(arguments.length<3)){a.call(this,c);var e=this._.inputId=CKEDITOR.tools.getNextId()+"_textInput",i={"class":"cke_dialog_ui_input_"+c.type,id:e,type:c.type};if(c.validate)this.validate=c.validate;if(c.maxLength)i.maxlength=c.maxLength;if(c.size)i.size=c.size;if(c.inputStyle)i.style=c.inputStyle;var h=this,o=false;b.on("load",function(){h.getInputElement().on("keydown",function(a){a.data.getKeystroke()==
+13&&(o=true)});h.getInputElement().on("keyup",function(a){if(a.data.getKeystroke()==13&&o){b.getButton("ok")&&setTimeout(function(){b.getButton("ok").click()},0);o=false}h.bidi&&f.call(h,a)},null,null,1E3)});CKEDITOR.ui.dialog.labeledElement.call(this,b,c,d,function(){var a=['<div class="cke_dialog_ui_input_',c.type,'" role="presentation"'];c.width&&a.push('style="width:'+c.width+'" ');a.push("><input ");i["aria-labelledby"]=this._.labelId;this._.required&&(i["aria-required"]=this._.required);for(var b in i)a.push(b+
+'="'+i[b]+'" ');a.push(" /></div>");return a.join("")})}},textarea:function(b,c,d){if(!(arguments.length<3)){a.call(this,c);var e=this,i=this._.inputId=CKEDITOR.tools.getNextId()+"_textarea",h={};if(c.validate)this.validate=c.validate;h.rows=c.rows||5;h.cols=c.cols||20;h["class"]="cke_dialog_ui_input_textarea "+(c["class"]||"");if(typeof c.inputStyle!="undefined")h.style=c.inputStyle;if(c.dir)h.dir=c.dir;if(e.bidi)b.on("load",function(){e.getInputElement().on("keyup",f)},e);CKEDITOR.ui.dialog.labeledElement.call(this,
+b,c,d,function(){h["aria-labelledby"]=this._.labelId;this._.required&&(h["aria-required"]=this._.required);var a=['<div class="cke_dialog_ui_input_textarea" role="presentation"><textarea id="',i,'" '],b;for(b in h)a.push(b+'="'+CKEDITOR.tools.htmlEncode(h[b])+'" ');a.push(">",CKEDITOR.tools.htmlEncode(e._["default"]),"</textarea></div>");return a.join("")})}},checkbox:function(b,c,d){if(!(arguments.length<3)){var f=a.call(this,c,{"default":!!c["default"]});if(c.validate)this.validate=c.validate;CKEDITOR.ui.dialog.uiElement.call(this,
+b,c,d,"span",null,null,function(){var a=CKEDITOR.tools.extend({},c,{id:c.id?c.id+"_checkbox":CKEDITOR.tools.getNextId()+"_checkbox"},true),d=[],e=CKEDITOR.tools.getNextId()+"_label",g={"class":"cke_dialog_ui_checkbox_input",type:"checkbox","aria-labelledby":e};h(a);if(c["default"])g.checked="checked";if(typeof a.inputStyle!="undefined")a.style=a.inputStyle;f.checkbox=new CKEDITOR.ui.dialog.uiElement(b,a,d,"input",null,g);d.push(' <label id="',e,'" for="',g.id,'"'+(c.labelStyle?' style="'+c.labelStyle+
+'"':"")+">",CKEDITOR.tools.htmlEncode(c.label),"</label>");return d.join("")})}},radio:function(b,c,d){if(!(arguments.length<3)){a.call(this,c);if(!this._["default"])this._["default"]=this._.initValue=c.items[0][1];if(c.validate)this.validate=c.validate;var f=[],e=this;c.role="radiogroup";c.includeLabel=true;CKEDITOR.ui.dialog.labeledElement.call(this,b,c,d,function(){for(var a=[],d=[],g=(c.id?c.id:CKEDITOR.tools.getNextId())+"_radio",i=0;i<c.items.length;i++){var p=c.items[i],t=p[2]!==void 0?p[2]:
+p[0],w=p[1]!==void 0?p[1]:p[0],u=CKEDITOR.tools.getNextId()+"_radio_input",x=u+"_label",u=CKEDITOR.tools.extend({},c,{id:u,title:null,type:null},true),t=CKEDITOR.tools.extend({},u,{title:t},true),v={type:"radio","class":"cke_dialog_ui_radio_input",name:g,value:w,"aria-labelledby":x},s=[];if(e._["default"]==w)v.checked="checked";h(u);h(t);if(typeof u.inputStyle!="undefined")u.style=u.inputStyle;u.keyboardFocusable=true;f.push(new CKEDITOR.ui.dialog.uiElement(b,u,s,"input",null,v));s.push(" ");new CKEDITOR.ui.dialog.uiElement(b,
+t,s,"label",null,{id:x,"for":v.id},p[0]);a.push(s.join(""))}new CKEDITOR.ui.dialog.hbox(b,f,a,d);return d.join("")});this._.children=f}},button:function(b,c,d){if(arguments.length){typeof c=="function"&&(c=c(b.getParentEditor()));a.call(this,c,{disabled:c.disabled||false});CKEDITOR.event.implementOn(this);var f=this;b.on("load",function(){var a=this.getElement();(function(){a.on("click",function(a){f.click();a.data.preventDefault()});a.on("keydown",function(a){if(a.data.getKeystroke()in{32:1}){f.click();
+a.data.preventDefault()}})})();a.unselectable()},this);var e=CKEDITOR.tools.extend({},c);delete e.style;var i=CKEDITOR.tools.getNextId()+"_label";CKEDITOR.ui.dialog.uiElement.call(this,b,e,d,"a",null,{style:c.style,href:"javascript:void(0)",title:c.label,hidefocus:"true","class":c["class"],role:"button","aria-labelledby":i},'<span id="'+i+'" class="cke_dialog_ui_button">'+CKEDITOR.tools.htmlEncode(c.label)+"</span>")}},select:function(b,c,d){if(!(arguments.length<3)){var f=a.call(this,c);if(c.validate)this.validate=
+c.validate;f.inputId=CKEDITOR.tools.getNextId()+"_select";CKEDITOR.ui.dialog.labeledElement.call(this,b,c,d,function(){var a=CKEDITOR.tools.extend({},c,{id:c.id?c.id+"_select":CKEDITOR.tools.getNextId()+"_select"},true),d=[],e=[],g={id:f.inputId,"class":"cke_dialog_ui_input_select","aria-labelledby":this._.labelId};d.push('<div class="cke_dialog_ui_input_',c.type,'" role="presentation"');c.width&&d.push('style="width:'+c.width+'" ');d.push(">");if(c.size!==void 0)g.size=c.size;if(c.multiple!==void 0)g.multiple=
+c.multiple;h(a);for(var i=0,p;i<c.items.length&&(p=c.items[i]);i++)e.push('<option value="',CKEDITOR.tools.htmlEncode(p[1]!==void 0?p[1]:p[0]).replace(/"/g,"&quot;"),'" /> ',CKEDITOR.tools.htmlEncode(p[0]));if(typeof a.inputStyle!="undefined")a.style=a.inputStyle;f.select=new CKEDITOR.ui.dialog.uiElement(b,a,d,"select",null,g,e.join(""));d.push("</div>");return d.join("")})}},file:function(b,c,d){if(!(arguments.length<3)){c["default"]===void 0&&(c["default"]="");var f=CKEDITOR.tools.extend(a.call(this,
+c),{definition:c,buttons:[]});if(c.validate)this.validate=c.validate;b.on("load",function(){CKEDITOR.document.getById(f.frameId).getParent().addClass("cke_dialog_ui_input_file")});CKEDITOR.ui.dialog.labeledElement.call(this,b,c,d,function(){f.frameId=CKEDITOR.tools.getNextId()+"_fileInput";var a=['<iframe frameborder="0" allowtransparency="0" class="cke_dialog_ui_input_file" role="presentation" id="',f.frameId,'" title="',c.label,'" src="javascript:void('];a.push(CKEDITOR.env.ie?"(function(){"+encodeURIComponent("document.open();("+
+CKEDITOR.tools.fixDomain+")();document.close();")+"})()":"0");a.push(')"></iframe>');return a.join("")})}},fileButton:function(b,c,d){var f=this;if(!(arguments.length<3)){a.call(this,c);if(c.validate)this.validate=c.validate;var e=CKEDITOR.tools.extend({},c),i=e.onClick;e.className=(e.className?e.className+" ":"")+"cke_dialog_ui_button";e.onClick=function(a){var d=c["for"];if(!i||i.call(this,a)!==false){b.getContentElement(d[0],d[1]).submit();this.disable()}};b.on("load",function(){b.getContentElement(c["for"][0],
+c["for"][1])._.buttons.push(f)});CKEDITOR.ui.dialog.button.call(this,b,e,d)}},html:function(){var a=/^\s*<[\w:]+\s+([^>]*)?>/,b=/^(\s*<[\w:]+(?:\s+[^>]*)?)((?:.|\r|\n)+)$/,c=/\/$/;return function(d,f,e){if(!(arguments.length<3)){var i=[],h=f.html;h.charAt(0)!="<"&&(h="<span>"+h+"</span>");var m=f.focus;if(m){var p=this.focus;this.focus=function(){(typeof m=="function"?m:p).call(this);this.fire("focus")};if(f.isFocusable)this.isFocusable=this.isFocusable;this.keyboardFocusable=true}CKEDITOR.ui.dialog.uiElement.call(this,
+d,f,i,"span",null,null,"");i=i.join("").match(a);h=h.match(b)||["","",""];if(c.test(h[1])){h[1]=h[1].slice(0,-1);h[2]="/"+h[2]}e.push([h[1]," ",i[1]||"",h[2]].join(""))}}}(),fieldset:function(a,b,c,d,f){var e=f.label;this._={children:b};CKEDITOR.ui.dialog.uiElement.call(this,a,f,d,"fieldset",null,null,function(){var a=[];e&&a.push("<legend"+(f.labelStyle?' style="'+f.labelStyle+'"':"")+">"+e+"</legend>");for(var b=0;b<c.length;b++)a.push(c[b]);return a.join("")})}},true);CKEDITOR.ui.dialog.html.prototype=
+new CKEDITOR.ui.dialog.uiElement;CKEDITOR.ui.dialog.labeledElement.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.uiElement,{setLabel:function(a){var b=CKEDITOR.document.getById(this._.labelId);b.getChildCount()<1?(new CKEDITOR.dom.text(a,CKEDITOR.document)).appendTo(b):b.getChild(0).$.nodeValue=a;return this},getLabel:function(){var a=CKEDITOR.document.getById(this._.labelId);return!a||a.getChildCount()<1?"":a.getChild(0).getText()},eventProcessors:d},true);CKEDITOR.ui.dialog.button.prototype=
+CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.uiElement,{click:function(){return!this._.disabled?this.fire("click",{dialog:this._.dialog}):false},enable:function(){this._.disabled=false;var a=this.getElement();a&&a.removeClass("cke_disabled")},disable:function(){this._.disabled=true;this.getElement().addClass("cke_disabled")},isVisible:function(){return this.getElement().getFirst().isVisible()},isEnabled:function(){return!this._.disabled},eventProcessors:CKEDITOR.tools.extend({},CKEDITOR.ui.dialog.uiElement.prototype.eventProcessors,
+{onClick:function(a,b){this.on("click",function(){b.apply(this,arguments)})}},true),accessKeyUp:function(){this.click()},accessKeyDown:function(){this.focus()},keyboardFocusable:true},true);CKEDITOR.ui.dialog.textInput.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.labeledElement,{getInputElement:function(){return CKEDITOR.document.getById(this._.inputId)},focus:function(){var a=this.selectParentTab();setTimeout(function(){var b=a.getInputElement();b&&b.$.focus()},0)},select:function(){var a=
+this.selectParentTab();setTimeout(function(){var b=a.getInputElement();if(b){b.$.focus();b.$.select()}},0)},accessKeyUp:function(){this.select()},setValue:function(a){if(this.bidi){var b=a&&a.charAt(0);(b=b=="‪"?"ltr":b=="‫"?"rtl":null)&&(a=a.slice(1));this.setDirectionMarker(b)}a||(a="");return CKEDITOR.ui.dialog.uiElement.prototype.setValue.apply(this,arguments)},getValue:function(){var a=CKEDITOR.ui.dialog.uiElement.prototype.getValue.call(this);if(this.bidi&&a){var b=this.getDirectionMarker();
+b&&(a=(b=="ltr"?"‪":"‫")+a)}return a},setDirectionMarker:function(a){var b=this.getInputElement();a?b.setAttributes({dir:a,"data-cke-dir-marker":a}):this.getDirectionMarker()&&b.removeAttributes(["dir","data-cke-dir-marker"])},getDirectionMarker:function(){return this.getInputElement().data("cke-dir-marker")},keyboardFocusable:true},c,true);CKEDITOR.ui.dialog.textarea.prototype=new CKEDITOR.ui.dialog.textInput;CKEDITOR.ui.dialog.select.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.labeledElement,
+{getInputElement:function(){return this._.select.getElement()},add:function(a,b,c){var d=new CKEDITOR.dom.element("option",this.getDialog().getParentEditor().document),f=this.getInputElement().$;d.$.text=a;d.$.value=b===void 0||b===null?a:b;c===void 0||c===null?CKEDITOR.env.ie?f.add(d.$):f.add(d.$,null):f.add(d.$,c);return this},remove:function(a){this.getInputElement().$.remove(a);return this},clear:function(){for(var a=this.getInputElement().$;a.length>0;)a.remove(0);return this},keyboardFocusable:true},
+c,true);CKEDITOR.ui.dialog.checkbox.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.uiElement,{getInputElement:function(){return this._.checkbox.getElement()},setValue:function(a,b){this.getInputElement().$.checked=a;!b&&this.fire("change",{value:a})},getValue:function(){return this.getInputElement().$.checked},accessKeyUp:function(){this.setValue(!this.getValue())},eventProcessors:{onChange:function(a,b){if(!CKEDITOR.env.ie||CKEDITOR.env.version>8)return d.onChange.apply(this,arguments);a.on("load",
+function(){var a=this._.checkbox.getElement();a.on("propertychange",function(b){b=b.data.$;b.propertyName=="checked"&&this.fire("change",{value:a.$.checked})},this)},this);this.on("change",b);return null}},keyboardFocusable:true},c,true);CKEDITOR.ui.dialog.radio.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.uiElement,{setValue:function(a,b){for(var c=this._.children,d,f=0;f<c.length&&(d=c[f]);f++)d.getElement().$.checked=d.getValue()==a;!b&&this.fire("change",{value:a})},getValue:function(){for(var a=
+this._.children,b=0;b<a.length;b++)if(a[b].getElement().$.checked)return a[b].getValue();return null},accessKeyUp:function(){var a=this._.children,b;for(b=0;b<a.length;b++)if(a[b].getElement().$.checked){a[b].getElement().focus();return}a[0].getElement().focus()},eventProcessors:{onChange:function(a,b){if(!CKEDITOR.env.ie||CKEDITOR.env.version>8)return d.onChange.apply(this,arguments);a.on("load",function(){for(var a=this._.children,b=this,c=0;c<a.length;c++)a[c].getElement().on("propertychange",
+function(a){a=a.data.$;a.propertyName=="checked"&&this.$.checked&&b.fire("change",{value:this.getAttribute("value")})})},this);this.on("change",b);return null}}},c,true);CKEDITOR.ui.dialog.file.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.labeledElement,c,{getInputElement:function(){var a=CKEDITOR.document.getById(this._.frameId).getFrameDocument();return a.$.forms.length>0?new CKEDITOR.dom.element(a.$.forms[0].elements[0]):this.getElement()},submit:function(){this.getInputElement().getParent().$.submit();
+return this},getAction:function(){return this.getInputElement().getParent().$.action},registerEvents:function(a){var b=/^on([A-Z]\w+)/,c,d=function(a,b,c,d){a.on("formLoaded",function(){a.getInputElement().on(c,d,a)})},f;for(f in a)if(c=f.match(b))this.eventProcessors[f]?this.eventProcessors[f].call(this,this._.dialog,a[f]):d(this,this._.dialog,c[1].toLowerCase(),a[f]);return this},reset:function(){function a(){c.$.open();var k="";d.size&&(k=d.size-(CKEDITOR.env.ie?7:0));var t=b.frameId+"_input";
+c.$.write(['<html dir="'+h+'" lang="'+m+'"><head><title></title></head><body style="margin: 0; overflow: hidden; background: transparent;">','<form enctype="multipart/form-data" method="POST" dir="'+h+'" lang="'+m+'" action="',CKEDITOR.tools.htmlEncode(d.action),'"><label id="',b.labelId,'" for="',t,'" style="display:none">',CKEDITOR.tools.htmlEncode(d.label),'</label><input style="width:100%" id="',t,'" aria-labelledby="',b.labelId,'" type="file" name="',CKEDITOR.tools.htmlEncode(d.id||"cke_upload"),
+'" size="',CKEDITOR.tools.htmlEncode(k>0?k:""),'" /></form></body></html><script>',CKEDITOR.env.ie?"("+CKEDITOR.tools.fixDomain+")();":"","window.parent.CKEDITOR.tools.callFunction("+e+");","window.onbeforeunload = function() {window.parent.CKEDITOR.tools.callFunction("+i+")}","<\/script>"].join(""));c.$.close();for(k=0;k<f.length;k++)f[k].enable()}var b=this._,c=CKEDITOR.document.getById(b.frameId).getFrameDocument(),d=b.definition,f=b.buttons,e=this.formLoadedNumber,i=this.formUnloadNumber,h=b.dialog._.editor.lang.dir,
+m=b.dialog._.editor.langCode;if(!e){e=this.formLoadedNumber=CKEDITOR.tools.addFunction(function(){this.fire("formLoaded")},this);i=this.formUnloadNumber=CKEDITOR.tools.addFunction(function(){this.getInputElement().clearCustomData()},this);this.getDialog()._.editor.on("destroy",function(){CKEDITOR.tools.removeFunction(e);CKEDITOR.tools.removeFunction(i)})}CKEDITOR.env.gecko?setTimeout(a,500):a()},getValue:function(){return this.getInputElement().$.value||""},setInitValue:function(){this._.initValue=
+""},eventProcessors:{onChange:function(a,b){if(!this._.domOnChangeRegistered){this.on("formLoaded",function(){this.getInputElement().on("change",function(){this.fire("change",{value:this.getValue()})},this)},this);this._.domOnChangeRegistered=true}this.on("change",b)}},keyboardFocusable:true},true);CKEDITOR.ui.dialog.fileButton.prototype=new CKEDITOR.ui.dialog.button;CKEDITOR.ui.dialog.fieldset.prototype=CKEDITOR.tools.clone(CKEDITOR.ui.dialog.hbox.prototype);CKEDITOR.dialog.addUIElement("text",e);
+CKEDITOR.dialog.addUIElement("password",e);CKEDITOR.dialog.addUIElement("textarea",b);CKEDITOR.dialog.addUIElement("checkbox",b);CKEDITOR.dialog.addUIElement("radio",b);CKEDITOR.dialog.addUIElement("button",b);CKEDITOR.dialog.addUIElement("select",b);CKEDITOR.dialog.addUIElement("file",b);CKEDITOR.dialog.addUIElement("fileButton",b);CKEDITOR.dialog.addUIElement("html",b);CKEDITOR.dialog.addUIElement("fieldset",{build:function(a,b,c){for(var d=b.children,f,e=[],i=[],h=0;h<d.length&&(f=d[h]);h++){var m=
+[];e.push(m);i.push(CKEDITOR.dialog._.uiElementBuilders[f.type].build(a,f,m))}return new CKEDITOR.ui.dialog[b.type](a,i,e,c,b)}})}}),CKEDITOR.DIALOG_RESIZE_NONE=0,CKEDITOR.DIALOG_RESIZE_WIDTH=1,CKEDITOR.DIALOG_RESIZE_HEIGHT=2,CKEDITOR.DIALOG_RESIZE_BOTH=3,CKEDITOR.DIALOG_STATE_IDLE=1,CKEDITOR.DIALOG_STATE_BUSY=2,function(){function a(){for(var a=this._.tabIdList.length,b=CKEDITOR.tools.indexOf(this._.tabIdList,this._.currentTabId)+a,c=b-1;c>b-a;c--)if(this._.tabs[this._.tabIdList[c%a]][0].$.offsetHeight)return this._.tabIdList[c%
+a];return null}function e(){for(var a=this._.tabIdList.length,b=CKEDITOR.tools.indexOf(this._.tabIdList,this._.currentTabId),c=b+1;c<b+a;c++)if(this._.tabs[this._.tabIdList[c%a]][0].$.offsetHeight)return this._.tabIdList[c%a];return null}function b(a,b){for(var c=a.$.getElementsByTagName("input"),d=0,f=c.length;d<f;d++){var e=new CKEDITOR.dom.element(c[d]);if(e.getAttribute("type").toLowerCase()=="text")if(b){e.setAttribute("value",e.getCustomData("fake_value")||"");e.removeCustomData("fake_value")}else{e.setCustomData("fake_value",
+e.getAttribute("value"));e.setAttribute("value","")}}}function c(a,b){var c=this.getInputElement();c&&(a?c.removeAttribute("aria-invalid"):c.setAttribute("aria-invalid",true));a||(this.select?this.select():this.focus());b&&alert(b);this.fire("validated",{valid:a,msg:b})}function d(){var a=this.getInputElement();a&&a.removeAttribute("aria-invalid")}function i(a){var b=CKEDITOR.dom.element.createFromHtml(CKEDITOR.addTemplate("dialog",r).output({id:CKEDITOR.tools.getNextNumber(),editorId:a.id,langDir:a.lang.dir,
+langCode:a.langCode,editorDialogClass:"cke_editor_"+a.name.replace(/\./g,"\\.")+"_dialog",closeTitle:a.lang.common.close,hidpi:CKEDITOR.env.hidpi?"cke_hidpi":""})),c=b.getChild([0,0,0,0,0]),d=c.getChild(0),f=c.getChild(1);a.plugins.clipboard&&CKEDITOR.plugins.clipboard.preventDefaultDropOnElement(c);if(CKEDITOR.env.ie&&!CKEDITOR.env.quirks&&!CKEDITOR.env.edge){a="javascript:void(function(){"+encodeURIComponent("document.open();("+CKEDITOR.tools.fixDomain+")();document.close();")+"}())";CKEDITOR.dom.element.createFromHtml('<iframe frameBorder="0" class="cke_iframe_shim" src="'+
+a+'" tabIndex="-1"></iframe>').appendTo(c.getParent())}d.unselectable();f.unselectable();return{element:b,parts:{dialog:b.getChild(0),title:d,close:f,tabs:c.getChild(2),contents:c.getChild([3,0,0,0]),footer:c.getChild([3,0,1,0])}}}function h(a,b,c){this.element=b;this.focusIndex=c;this.tabIndex=0;this.isFocusable=function(){return!b.getAttribute("disabled")&&b.isVisible()};this.focus=function(){a._.currentFocusIndex=this.focusIndex;this.element.focus()};b.on("keydown",function(a){a.data.getKeystroke()in
+{32:1,13:1}&&this.fire("click")});b.on("focus",function(){this.fire("mouseover")});b.on("blur",function(){this.fire("mouseout")})}function f(a){function b(){a.layout()}var c=CKEDITOR.document.getWindow();c.on("resize",b);a.on("hide",function(){c.removeListener("resize",b)})}function k(a,b){this._={dialog:a};CKEDITOR.tools.extend(this,b)}function j(a){function b(c){var h=a.getSize(),j=CKEDITOR.document.getWindow().getViewPaneSize(),k=c.data.$.screenX,p=c.data.$.screenY,m=k-d.x,o=p-d.y;d={x:k,y:p};
+f.x=f.x+m;f.y=f.y+o;a.move(f.x+i[3]<g?-i[3]:f.x-i[1]>j.width-h.width-g?j.width-h.width+(e.lang.dir=="rtl"?0:i[1]):f.x,f.y+i[0]<g?-i[0]:f.y-i[2]>j.height-h.height-g?j.height-h.height+i[2]:f.y,1);c.data.preventDefault()}function c(){CKEDITOR.document.removeListener("mousemove",b);CKEDITOR.document.removeListener("mouseup",c);if(CKEDITOR.env.ie6Compat){var a=s.getChild(0).getFrameDocument();a.removeListener("mousemove",b);a.removeListener("mouseup",c)}}var d=null,f=null,e=a.getParentEditor(),g=e.config.dialog_magnetDistance,
+i=CKEDITOR.skin.margins||[0,0,0,0];typeof g=="undefined"&&(g=20);a.parts.title.on("mousedown",function(e){d={x:e.data.$.screenX,y:e.data.$.screenY};CKEDITOR.document.on("mousemove",b);CKEDITOR.document.on("mouseup",c);f=a.getPosition();if(CKEDITOR.env.ie6Compat){var g=s.getChild(0).getFrameDocument();g.on("mousemove",b);g.on("mouseup",c)}e.data.preventDefault()},a)}function g(a){var b,c;function d(f){var m=i.lang.dir=="rtl",o=p.width,l=p.height,n=o+(f.data.$.screenX-b)*(m?-1:1)*(a._.moved?1:2),r=
+l+(f.data.$.screenY-c)*(a._.moved?1:2),t=a._.element.getFirst(),t=m&&t.getComputedStyle("right"),w=a.getPosition();w.y+r>k.height&&(r=k.height-w.y);if((m?t:w.x)+n>k.width)n=k.width-(m?t:w.x);if(g==CKEDITOR.DIALOG_RESIZE_WIDTH||g==CKEDITOR.DIALOG_RESIZE_BOTH)o=Math.max(e.minWidth||0,n-h);if(g==CKEDITOR.DIALOG_RESIZE_HEIGHT||g==CKEDITOR.DIALOG_RESIZE_BOTH)l=Math.max(e.minHeight||0,r-j);a.resize(o,l);a._.moved||a.layout();f.data.preventDefault()}function f(){CKEDITOR.document.removeListener("mouseup",
+f);CKEDITOR.document.removeListener("mousemove",d);if(m){m.remove();m=null}if(CKEDITOR.env.ie6Compat){var a=s.getChild(0).getFrameDocument();a.removeListener("mouseup",f);a.removeListener("mousemove",d)}}var e=a.definition,g=e.resizable;if(g!=CKEDITOR.DIALOG_RESIZE_NONE){var i=a.getParentEditor(),h,j,k,p,m,o=CKEDITOR.tools.addFunction(function(e){p=a.getSize();var g=a.parts.contents;if(g.$.getElementsByTagName("iframe").length){m=CKEDITOR.dom.element.createFromHtml('<div class="cke_dialog_resize_cover" style="height: 100%; position: absolute; width: 100%;"></div>');
+g.append(m)}j=p.height-a.parts.contents.getSize("height",!(CKEDITOR.env.gecko||CKEDITOR.env.ie&&CKEDITOR.env.quirks));h=p.width-a.parts.contents.getSize("width",1);b=e.screenX;c=e.screenY;k=CKEDITOR.document.getWindow().getViewPaneSize();CKEDITOR.document.on("mousemove",d);CKEDITOR.document.on("mouseup",f);if(CKEDITOR.env.ie6Compat){g=s.getChild(0).getFrameDocument();g.on("mousemove",d);g.on("mouseup",f)}e.preventDefault&&e.preventDefault()});a.on("load",function(){var b="";g==CKEDITOR.DIALOG_RESIZE_WIDTH?
+b=" cke_resizer_horizontal":g==CKEDITOR.DIALOG_RESIZE_HEIGHT&&(b=" cke_resizer_vertical");b=CKEDITOR.dom.element.createFromHtml('<div class="cke_resizer'+b+" cke_resizer_"+i.lang.dir+'" title="'+CKEDITOR.tools.htmlEncode(i.lang.common.resize)+'" onmousedown="CKEDITOR.tools.callFunction('+o+', event )">'+(i.lang.dir=="ltr"?"◢":"◣")+"</div>");a.parts.footer.append(b,1)});i.on("destroy",function(){CKEDITOR.tools.removeFunction(o)})}}function n(a){a.data.preventDefault(1)}function q(a){var b=CKEDITOR.document.getWindow(),
+c=a.config,d=c.dialog_backgroundCoverColor||"white",f=c.dialog_backgroundCoverOpacity,e=c.baseFloatZIndex,c=CKEDITOR.tools.genKey(d,f,e),g=v[c];if(g)g.show();else{e=['<div tabIndex="-1" style="position: ',CKEDITOR.env.ie6Compat?"absolute":"fixed","; z-index: ",e,"; top: 0px; left: 0px; ",!CKEDITOR.env.ie6Compat?"background-color: "+d:"",'" class="cke_dialog_background_cover">'];if(CKEDITOR.env.ie6Compat){d="<html><body style=\\'background-color:"+d+";\\'></body></html>";e.push('<iframe hidefocus="true" frameborder="0" id="cke_dialog_background_iframe" src="javascript:');
+e.push("void((function(){"+encodeURIComponent("document.open();("+CKEDITOR.tools.fixDomain+")();document.write( '"+d+"' );document.close();")+"})())");e.push('" style="position:absolute;left:0;top:0;width:100%;height: 100%;filter: progid:DXImageTransform.Microsoft.Alpha(opacity=0)"></iframe>')}e.push("</div>");g=CKEDITOR.dom.element.createFromHtml(e.join(""));g.setOpacity(f!==void 0?f:0.5);g.on("keydown",n);g.on("keypress",n);g.on("keyup",n);g.appendTo(CKEDITOR.document.getBody());v[c]=g}a.focusManager.add(g);
+s=g;var a=function(){var a=b.getViewPaneSize();g.setStyles({width:a.width+"px",height:a.height+"px"})},i=function(){var a=b.getScrollPosition(),c=CKEDITOR.dialog._.currentTop;g.setStyles({left:a.x+"px",top:a.y+"px"});if(c){do{a=c.getPosition();c.move(a.x,a.y)}while(c=c._.parentDialog)}};x=a;b.on("resize",a);a();(!CKEDITOR.env.mac||!CKEDITOR.env.webkit)&&g.focus();if(CKEDITOR.env.ie6Compat){var h=function(){i();arguments.callee.prevScrollHandler.apply(this,arguments)};b.$.setTimeout(function(){h.prevScrollHandler=
+window.onscroll||function(){};window.onscroll=h},0);i()}}function l(a){if(s){a.focusManager.remove(s);a=CKEDITOR.document.getWindow();s.hide();a.removeListener("resize",x);CKEDITOR.env.ie6Compat&&a.$.setTimeout(function(){window.onscroll=window.onscroll&&window.onscroll.prevScrollHandler||null},0);x=null}}var o=CKEDITOR.tools.cssLength,r='<div class="cke_reset_all {editorId} {editorDialogClass} {hidpi}" dir="{langDir}" lang="{langCode}" role="dialog" aria-labelledby="cke_dialog_title_{id}"><table class="cke_dialog '+
+CKEDITOR.env.cssClass+' cke_{langDir}" style="position:absolute" role="presentation"><tr><td role="presentation"><div class="cke_dialog_body" role="presentation"><div id="cke_dialog_title_{id}" class="cke_dialog_title" role="presentation"></div><a id="cke_dialog_close_button_{id}" class="cke_dialog_close_button" href="javascript:void(0)" title="{closeTitle}" role="button"><span class="cke_label">X</span></a><div id="cke_dialog_tabs_{id}" class="cke_dialog_tabs" role="tablist"></div><table class="cke_dialog_contents" role="presentation"><tr><td id="cke_dialog_contents_{id}" class="cke_dialog_contents_body" role="presentation"></td></tr><tr><td id="cke_dialog_footer_{id}" class="cke_dialog_footer" role="presentation"></td></tr></table></div></td></tr></table></div>';
+CKEDITOR.dialog=function(b,f){function h(){var a=s._.focusList;a.sort(function(a,b){return a.tabIndex!=b.tabIndex?b.tabIndex-a.tabIndex:a.focusIndex-b.focusIndex});for(var b=a.length,c=0;c<b;c++)a[c].focusIndex=c}function k(a){var b=s._.focusList,a=a||0;if(!(b.length<1)){var c=s._.currentFocusIndex;s._.tabBarMode&&a<0&&(c=0);try{b[c].getInputElement().$.blur()}catch(d){}var f=c,e=s._.pageCount>1;do{f=f+a;if(e&&!s._.tabBarMode&&(f==b.length||f==-1)){s._.tabBarMode=true;s._.tabs[s._.currentTabId][0].focus();
+s._.currentFocusIndex=-1;return}f=(f+b.length)%b.length;if(f==c)break}while(a&&!b[f].isFocusable());b[f].focus();b[f].type=="text"&&b[f].select()}}function p(c){if(s==CKEDITOR.dialog._.currentTop){var d=c.data.getKeystroke(),f=b.lang.dir=="rtl",g=[37,38,39,40];q=x=0;if(d==9||d==CKEDITOR.SHIFT+9){k(d==CKEDITOR.SHIFT+9?-1:1);q=1}else if(d==CKEDITOR.ALT+121&&!s._.tabBarMode&&s.getPageCount()>1){s._.tabBarMode=true;s._.tabs[s._.currentTabId][0].focus();s._.currentFocusIndex=-1;q=1}else if(CKEDITOR.tools.indexOf(g,
+d)!=-1&&s._.tabBarMode){d=CKEDITOR.tools.indexOf([f?39:37,38],d)!=-1?a.call(s):e.call(s);s.selectPage(d);s._.tabs[d][0].focus();q=1}else if((d==13||d==32)&&s._.tabBarMode){this.selectPage(this._.currentTabId);this._.tabBarMode=false;this._.currentFocusIndex=-1;k(1);q=1}else if(d==13){d=c.data.getTarget();if(!d.is("a","button","select","textarea")&&(!d.is("input")||d.$.type!="button")){(d=this.getButton("ok"))&&CKEDITOR.tools.setTimeout(d.click,0,d);q=1}x=1}else if(d==27){(d=this.getButton("cancel"))?
+CKEDITOR.tools.setTimeout(d.click,0,d):this.fire("cancel",{hide:true}).hide!==false&&this.hide();x=1}else return;o(c)}}function o(a){q?a.data.preventDefault(1):x&&a.data.stopPropagation()}var l=CKEDITOR.dialog._.dialogDefinitions[f],n=CKEDITOR.tools.clone(m),r=b.config.dialog_buttonsOrder||"OS",t=b.lang.dir,w={},q,x;(r=="OS"&&CKEDITOR.env.mac||r=="rtl"&&t=="ltr"||r=="ltr"&&t=="rtl")&&n.buttons.reverse();l=CKEDITOR.tools.extend(l(b),n);l=CKEDITOR.tools.clone(l);l=new u(this,l);n=i(b);this._={editor:b,
+element:n.element,name:f,contentSize:{width:0,height:0},size:{width:0,height:0},contents:{},buttons:{},accessKeyMap:{},tabs:{},tabIdList:[],currentTabId:null,currentTabIndex:null,pageCount:0,lastTab:null,tabBarMode:false,focusList:[],currentFocusIndex:0,hasFocus:false};this.parts=n.parts;CKEDITOR.tools.setTimeout(function(){b.fire("ariaWidget",this.parts.contents)},0,this);n={position:CKEDITOR.env.ie6Compat?"absolute":"fixed",top:0,visibility:"hidden"};n[t=="rtl"?"right":"left"]=0;this.parts.dialog.setStyles(n);
+CKEDITOR.event.call(this);this.definition=l=CKEDITOR.fire("dialogDefinition",{name:f,definition:l},b).definition;if(!("removeDialogTabs"in b._)&&b.config.removeDialogTabs){n=b.config.removeDialogTabs.split(";");for(t=0;t<n.length;t++){r=n[t].split(":");if(r.length==2){var v=r[0];w[v]||(w[v]=[]);w[v].push(r[1])}}b._.removeDialogTabs=w}if(b._.removeDialogTabs&&(w=b._.removeDialogTabs[f]))for(t=0;t<w.length;t++)l.removeContents(w[t]);if(l.onLoad)this.on("load",l.onLoad);if(l.onShow)this.on("show",l.onShow);
+if(l.onHide)this.on("hide",l.onHide);if(l.onOk)this.on("ok",function(a){b.fire("saveSnapshot");setTimeout(function(){b.fire("saveSnapshot")},0);if(l.onOk.call(this,a)===false)a.data.hide=false});this.state=CKEDITOR.DIALOG_STATE_IDLE;if(l.onCancel)this.on("cancel",function(a){if(l.onCancel.call(this,a)===false)a.data.hide=false});var s=this,z=function(a){var b=s._.contents,c=false,d;for(d in b)for(var f in b[d])if(c=a.call(this,b[d][f]))return};this.on("ok",function(a){z(function(b){if(b.validate){var d=
+b.validate(this),f=typeof d=="string"||d===false;if(f){a.data.hide=false;a.stop()}c.call(b,!f,typeof d=="string"?d:void 0);return f}})},this,null,0);this.on("cancel",function(a){z(function(c){if(c.isChanged()){if(!b.config.dialog_noConfirmCancel&&!confirm(b.lang.common.confirmCancel))a.data.hide=false;return true}})},this,null,0);this.parts.close.on("click",function(a){this.fire("cancel",{hide:true}).hide!==false&&this.hide();a.data.preventDefault()},this);this.changeFocus=k;var y=this._.element;
+b.focusManager.add(y,1);this.on("show",function(){y.on("keydown",p,this);if(CKEDITOR.env.gecko)y.on("keypress",o,this)});this.on("hide",function(){y.removeListener("keydown",p);CKEDITOR.env.gecko&&y.removeListener("keypress",o);z(function(a){d.apply(a)})});this.on("iframeAdded",function(a){(new CKEDITOR.dom.document(a.data.iframe.$.contentWindow.document)).on("keydown",p,this,null,0)});this.on("show",function(){h();var a=s._.pageCount>1;if(b.config.dialog_startupFocusTab&&a){s._.tabBarMode=true;s._.tabs[s._.currentTabId][0].focus();
+s._.currentFocusIndex=-1}else if(!this._.hasFocus){this._.currentFocusIndex=a?-1:this._.focusList.length-1;if(l.onFocus)(a=l.onFocus.call(this))&&a.focus();else k(1)}},this,null,4294967295);if(CKEDITOR.env.ie6Compat)this.on("load",function(){var a=this.getElement(),b=a.getFirst();b.remove();b.appendTo(a)},this);j(this);g(this);(new CKEDITOR.dom.text(l.title,CKEDITOR.document)).appendTo(this.parts.title);for(t=0;t<l.contents.length;t++)(w=l.contents[t])&&this.addPage(w);this.parts.tabs.on("click",
+function(a){var b=a.data.getTarget();if(b.hasClass("cke_dialog_tab")){b=b.$.id;this.selectPage(b.substring(4,b.lastIndexOf("_")));if(this._.tabBarMode){this._.tabBarMode=false;this._.currentFocusIndex=-1;k(1)}a.data.preventDefault()}},this);t=[];w=CKEDITOR.dialog._.uiElementBuilders.hbox.build(this,{type:"hbox",className:"cke_dialog_footer_buttons",widths:[],children:l.buttons},t).getChild();this.parts.footer.setHtml(t.join(""));for(t=0;t<w.length;t++)this._.buttons[w[t].id]=w[t]};CKEDITOR.dialog.prototype=
+{destroy:function(){this.hide();this._.element.remove()},resize:function(){return function(a,b){if(!this._.contentSize||!(this._.contentSize.width==a&&this._.contentSize.height==b)){CKEDITOR.dialog.fire("resize",{dialog:this,width:a,height:b},this._.editor);this.fire("resize",{width:a,height:b},this._.editor);this.parts.contents.setStyles({width:a+"px",height:b+"px"});if(this._.editor.lang.dir=="rtl"&&this._.position)this._.position.x=CKEDITOR.document.getWindow().getViewPaneSize().width-this._.contentSize.width-
+parseInt(this._.element.getFirst().getStyle("right"),10);this._.contentSize={width:a,height:b}}}}(),getSize:function(){var a=this._.element.getFirst();return{width:a.$.offsetWidth||0,height:a.$.offsetHeight||0}},move:function(a,b,c){var d=this._.element.getFirst(),f=this._.editor.lang.dir=="rtl",e=d.getComputedStyle("position")=="fixed";CKEDITOR.env.ie&&d.setStyle("zoom","100%");if(!e||!this._.position||!(this._.position.x==a&&this._.position.y==b)){this._.position={x:a,y:b};if(!e){e=CKEDITOR.document.getWindow().getScrollPosition();
+a=a+e.x;b=b+e.y}if(f){e=this.getSize();a=CKEDITOR.document.getWindow().getViewPaneSize().width-e.width-a}b={top:(b>0?b:0)+"px"};b[f?"right":"left"]=(a>0?a:0)+"px";d.setStyles(b);c&&(this._.moved=1)}},getPosition:function(){return CKEDITOR.tools.extend({},this._.position)},show:function(){var a=this._.element,b=this.definition;!a.getParent()||!a.getParent().equals(CKEDITOR.document.getBody())?a.appendTo(CKEDITOR.document.getBody()):a.setStyle("display","block");this.resize(this._.contentSize&&this._.contentSize.width||
+b.width||b.minWidth,this._.contentSize&&this._.contentSize.height||b.height||b.minHeight);this.reset();this.selectPage(this.definition.contents[0].id);if(CKEDITOR.dialog._.currentZIndex===null)CKEDITOR.dialog._.currentZIndex=this._.editor.config.baseFloatZIndex;this._.element.getFirst().setStyle("z-index",CKEDITOR.dialog._.currentZIndex=CKEDITOR.dialog._.currentZIndex+10);if(CKEDITOR.dialog._.currentTop===null){CKEDITOR.dialog._.currentTop=this;this._.parentDialog=null;q(this._.editor)}else{this._.parentDialog=
+CKEDITOR.dialog._.currentTop;this._.parentDialog.getElement().getFirst().$.style.zIndex-=Math.floor(this._.editor.config.baseFloatZIndex/2);CKEDITOR.dialog._.currentTop=this}a.on("keydown",z);a.on("keyup",B);this._.hasFocus=false;for(var c in b.contents)if(b.contents[c]){var a=b.contents[c],d=this._.tabs[a.id],e=a.requiredContent,g=0;if(d){for(var i in this._.contents[a.id]){var h=this._.contents[a.id][i];if(!(h.type=="hbox"||h.type=="vbox"||!h.getInputElement()))if(h.requiredContent&&!this._.editor.activeFilter.check(h.requiredContent))h.disable();
+else{h.enable();g++}}!g||e&&!this._.editor.activeFilter.check(e)?d[0].addClass("cke_dialog_tab_disabled"):d[0].removeClass("cke_dialog_tab_disabled")}}CKEDITOR.tools.setTimeout(function(){this.layout();f(this);this.parts.dialog.setStyle("visibility","");this.fireOnce("load",{});CKEDITOR.ui.fire("ready",this);this.fire("show",{});this._.editor.fire("dialogShow",this);this._.parentDialog||this._.editor.focusManager.lock();this.foreach(function(a){a.setInitValue&&a.setInitValue()})},100,this)},layout:function(){var a=
+this.parts.dialog,b=this.getSize(),c=CKEDITOR.document.getWindow().getViewPaneSize(),d=(c.width-b.width)/2,f=(c.height-b.height)/2;CKEDITOR.env.ie6Compat||(b.height+(f>0?f:0)>c.height||b.width+(d>0?d:0)>c.width?a.setStyle("position","absolute"):a.setStyle("position","fixed"));this.move(this._.moved?this._.position.x:d,this._.moved?this._.position.y:f)},foreach:function(a){for(var b in this._.contents)for(var c in this._.contents[b])a.call(this,this._.contents[b][c]);return this},reset:function(){var a=
+function(a){a.reset&&a.reset(1)};return function(){this.foreach(a);return this}}(),setupContent:function(){var a=arguments;this.foreach(function(b){b.setup&&b.setup.apply(b,a)})},commitContent:function(){var a=arguments;this.foreach(function(b){CKEDITOR.env.ie&&this._.currentFocusIndex==b.focusIndex&&b.getInputElement().$.blur();b.commit&&b.commit.apply(b,a)})},hide:function(){if(this.parts.dialog.isVisible()){this.fire("hide",{});this._.editor.fire("dialogHide",this);this.selectPage(this._.tabIdList[0]);
+var a=this._.element;a.setStyle("display","none");this.parts.dialog.setStyle("visibility","hidden");for(D(this);CKEDITOR.dialog._.currentTop!=this;)CKEDITOR.dialog._.currentTop.hide();if(this._.parentDialog){var b=this._.parentDialog.getElement().getFirst();b.setStyle("z-index",parseInt(b.$.style.zIndex,10)+Math.floor(this._.editor.config.baseFloatZIndex/2))}else l(this._.editor);if(CKEDITOR.dialog._.currentTop=this._.parentDialog)CKEDITOR.dialog._.currentZIndex=CKEDITOR.dialog._.currentZIndex-10;
+else{CKEDITOR.dialog._.currentZIndex=null;a.removeListener("keydown",z);a.removeListener("keyup",B);var c=this._.editor;c.focus();setTimeout(function(){c.focusManager.unlock();CKEDITOR.env.iOS&&c.window.focus()},0)}delete this._.parentDialog;this.foreach(function(a){a.resetInitValue&&a.resetInitValue()});this.setState(CKEDITOR.DIALOG_STATE_IDLE)}},addPage:function(a){if(!a.requiredContent||this._.editor.filter.check(a.requiredContent)){for(var b=[],c=a.label?' title="'+CKEDITOR.tools.htmlEncode(a.label)+
+'"':"",d=CKEDITOR.dialog._.uiElementBuilders.vbox.build(this,{type:"vbox",className:"cke_dialog_page_contents",children:a.elements,expand:!!a.expand,padding:a.padding,style:a.style||"width: 100%;"},b),f=this._.contents[a.id]={},e=d.getChild(),g=0;d=e.shift();){!d.notAllowed&&(d.type!="hbox"&&d.type!="vbox")&&g++;f[d.id]=d;typeof d.getChild=="function"&&e.push.apply(e,d.getChild())}if(!g)a.hidden=true;b=CKEDITOR.dom.element.createFromHtml(b.join(""));b.setAttribute("role","tabpanel");d=CKEDITOR.env;
+f="cke_"+a.id+"_"+CKEDITOR.tools.getNextNumber();c=CKEDITOR.dom.element.createFromHtml(['<a class="cke_dialog_tab"',this._.pageCount>0?" cke_last":"cke_first",c,a.hidden?' style="display:none"':"",' id="',f,'"',d.gecko&&!d.hc?"":' href="javascript:void(0)"',' tabIndex="-1" hidefocus="true" role="tab">',a.label,"</a>"].join(""));b.setAttribute("aria-labelledby",f);this._.tabs[a.id]=[c,b];this._.tabIdList.push(a.id);!a.hidden&&this._.pageCount++;this._.lastTab=c;this.updateStyle();b.setAttribute("name",
+a.id);b.appendTo(this.parts.contents);c.unselectable();this.parts.tabs.append(c);if(a.accessKey){A(this,this,"CTRL+"+a.accessKey,H,C);this._.accessKeyMap["CTRL+"+a.accessKey]=a.id}}},selectPage:function(a){if(this._.currentTabId!=a&&!this._.tabs[a][0].hasClass("cke_dialog_tab_disabled")&&this.fire("selectPage",{page:a,currentPage:this._.currentTabId})!==false){for(var c in this._.tabs){var d=this._.tabs[c][0],f=this._.tabs[c][1];if(c!=a){d.removeClass("cke_dialog_tab_selected");f.hide()}f.setAttribute("aria-hidden",
+c!=a)}var e=this._.tabs[a];e[0].addClass("cke_dialog_tab_selected");if(CKEDITOR.env.ie6Compat||CKEDITOR.env.ie7Compat){b(e[1]);e[1].show();setTimeout(function(){b(e[1],1)},0)}else e[1].show();this._.currentTabId=a;this._.currentTabIndex=CKEDITOR.tools.indexOf(this._.tabIdList,a)}},updateStyle:function(){this.parts.dialog[(this._.pageCount===1?"add":"remove")+"Class"]("cke_single_page")},hidePage:function(b){var c=this._.tabs[b]&&this._.tabs[b][0];if(c&&this._.pageCount!=1&&c.isVisible()){b==this._.currentTabId&&
+this.selectPage(a.call(this));c.hide();this._.pageCount--;this.updateStyle()}},showPage:function(a){if(a=this._.tabs[a]&&this._.tabs[a][0]){a.show();this._.pageCount++;this.updateStyle()}},getElement:function(){return this._.element},getName:function(){return this._.name},getContentElement:function(a,b){var c=this._.contents[a];return c&&c[b]},getValueOf:function(a,b){return this.getContentElement(a,b).getValue()},setValueOf:function(a,b,c){return this.getContentElement(a,b).setValue(c)},getButton:function(a){return this._.buttons[a]},
+click:function(a){return this._.buttons[a].click()},disableButton:function(a){return this._.buttons[a].disable()},enableButton:function(a){return this._.buttons[a].enable()},getPageCount:function(){return this._.pageCount},getParentEditor:function(){return this._.editor},getSelectedElement:function(){return this.getParentEditor().getSelection().getSelectedElement()},addFocusable:function(a,b){if(typeof b=="undefined"){b=this._.focusList.length;this._.focusList.push(new h(this,a,b))}else{this._.focusList.splice(b,
+0,new h(this,a,b));for(var c=b+1;c<this._.focusList.length;c++)this._.focusList[c].focusIndex++}},setState:function(a){if(this.state!=a){this.state=a;if(a==CKEDITOR.DIALOG_STATE_BUSY){if(!this.parts.spinner){var b=this.getParentEditor().lang.dir,c={attributes:{"class":"cke_dialog_spinner"},styles:{"float":b=="rtl"?"right":"left"}};c.styles["margin-"+(b=="rtl"?"left":"right")]="8px";this.parts.spinner=CKEDITOR.document.createElement("div",c);this.parts.spinner.setHtml("&#8987;");this.parts.spinner.appendTo(this.parts.title,
+1)}this.parts.spinner.show();this.getButton("ok").disable()}else if(a==CKEDITOR.DIALOG_STATE_IDLE){this.parts.spinner&&this.parts.spinner.hide();this.getButton("ok").enable()}this.fire("state",a)}}};CKEDITOR.tools.extend(CKEDITOR.dialog,{add:function(a,b){if(!this._.dialogDefinitions[a]||typeof b=="function")this._.dialogDefinitions[a]=b},exists:function(a){return!!this._.dialogDefinitions[a]},getCurrent:function(){return CKEDITOR.dialog._.currentTop},isTabEnabled:function(a,b,c){a=a.config.removeDialogTabs;
+return!(a&&a.match(RegExp("(?:^|;)"+b+":"+c+"(?:$|;)","i")))},okButton:function(){var a=function(a,b){b=b||{};return CKEDITOR.tools.extend({id:"ok",type:"button",label:a.lang.common.ok,"class":"cke_dialog_ui_button_ok",onClick:function(a){a=a.data.dialog;a.fire("ok",{hide:true}).hide!==false&&a.hide()}},b,true)};a.type="button";a.override=function(b){return CKEDITOR.tools.extend(function(c){return a(c,b)},{type:"button"},true)};return a}(),cancelButton:function(){var a=function(a,b){b=b||{};return CKEDITOR.tools.extend({id:"cancel",
+type:"button",label:a.lang.common.cancel,"class":"cke_dialog_ui_button_cancel",onClick:function(a){a=a.data.dialog;a.fire("cancel",{hide:true}).hide!==false&&a.hide()}},b,true)};a.type="button";a.override=function(b){return CKEDITOR.tools.extend(function(c){return a(c,b)},{type:"button"},true)};return a}(),addUIElement:function(a,b){this._.uiElementBuilders[a]=b}});CKEDITOR.dialog._={uiElementBuilders:{},dialogDefinitions:{},currentTop:null,currentZIndex:null};CKEDITOR.event.implementOn(CKEDITOR.dialog);
+CKEDITOR.event.implementOn(CKEDITOR.dialog.prototype);var m={resizable:CKEDITOR.DIALOG_RESIZE_BOTH,minWidth:600,minHeight:400,buttons:[CKEDITOR.dialog.okButton,CKEDITOR.dialog.cancelButton]},p=function(a,b,c){for(var d=0,f;f=a[d];d++){if(f.id==b)return f;if(c&&f[c])if(f=p(f[c],b,c))return f}return null},t=function(a,b,c,d,f){if(c){for(var e=0,g;g=a[e];e++){if(g.id==c){a.splice(e,0,b);return b}if(d&&g[d])if(g=t(g[d],b,c,d,true))return g}if(f)return null}a.push(b);return b},w=function(a,b,c){for(var d=
+0,f;f=a[d];d++){if(f.id==b)return a.splice(d,1);if(c&&f[c])if(f=w(f[c],b,c))return f}return null},u=function(a,b){this.dialog=a;for(var c=b.contents,d=0,f;f=c[d];d++)c[d]=f&&new k(a,f);CKEDITOR.tools.extend(this,b)};u.prototype={getContents:function(a){return p(this.contents,a)},getButton:function(a){return p(this.buttons,a)},addContents:function(a,b){return t(this.contents,a,b)},addButton:function(a,b){return t(this.buttons,a,b)},removeContents:function(a){w(this.contents,a)},removeButton:function(a){w(this.buttons,
+a)}};k.prototype={get:function(a){return p(this.elements,a,"children")},add:function(a,b){return t(this.elements,a,b,"children")},remove:function(a){w(this.elements,a,"children")}};var x,v={},s,y={},z=function(a){var b=a.data.$.ctrlKey||a.data.$.metaKey,c=a.data.$.altKey,d=a.data.$.shiftKey,f=String.fromCharCode(a.data.$.keyCode);if((b=y[(b?"CTRL+":"")+(c?"ALT+":"")+(d?"SHIFT+":"")+f])&&b.length){b=b[b.length-1];b.keydown&&b.keydown.call(b.uiElement,b.dialog,b.key);a.data.preventDefault()}},B=function(a){var b=
+a.data.$.ctrlKey||a.data.$.metaKey,c=a.data.$.altKey,d=a.data.$.shiftKey,f=String.fromCharCode(a.data.$.keyCode);if((b=y[(b?"CTRL+":"")+(c?"ALT+":"")+(d?"SHIFT+":"")+f])&&b.length){b=b[b.length-1];if(b.keyup){b.keyup.call(b.uiElement,b.dialog,b.key);a.data.preventDefault()}}},A=function(a,b,c,d,f){(y[c]||(y[c]=[])).push({uiElement:a,dialog:b,key:c,keyup:f||a.accessKeyUp,keydown:d||a.accessKeyDown})},D=function(a){for(var b in y){for(var c=y[b],d=c.length-1;d>=0;d--)(c[d].dialog==a||c[d].uiElement==
+a)&&c.splice(d,1);c.length===0&&delete y[b]}},C=function(a,b){a._.accessKeyMap[b]&&a.selectPage(a._.accessKeyMap[b])},H=function(){};(function(){CKEDITOR.ui.dialog={uiElement:function(a,b,c,d,f,e,g){if(!(arguments.length<4)){var i=(d.call?d(b):d)||"div",h=["<",i," "],j=(f&&f.call?f(b):f)||{},k=(e&&e.call?e(b):e)||{},p=(g&&g.call?g.call(this,a,b):g)||"",m=this.domId=k.id||CKEDITOR.tools.getNextId()+"_uiElement";if(b.requiredContent&&!a.getParentEditor().filter.check(b.requiredContent)){j.display="none";
+this.notAllowed=true}k.id=m;var o={};b.type&&(o["cke_dialog_ui_"+b.type]=1);b.className&&(o[b.className]=1);if(b.disabled)o.cke_disabled=1;for(var l=k["class"]&&k["class"].split?k["class"].split(" "):[],m=0;m<l.length;m++)l[m]&&(o[l[m]]=1);l=[];for(m in o)l.push(m);k["class"]=l.join(" ");if(b.title)k.title=b.title;o=(b.style||"").split(";");if(b.align){l=b.align;j["margin-left"]=l=="left"?0:"auto";j["margin-right"]=l=="right"?0:"auto"}for(m in j)o.push(m+":"+j[m]);b.hidden&&o.push("display:none");
+for(m=o.length-1;m>=0;m--)o[m]===""&&o.splice(m,1);if(o.length>0)k.style=(k.style?k.style+"; ":"")+o.join("; ");for(m in k)h.push(m+'="'+CKEDITOR.tools.htmlEncode(k[m])+'" ');h.push(">",p,"</",i,">");c.push(h.join(""));(this._||(this._={})).dialog=a;if(typeof b.isChanged=="boolean")this.isChanged=function(){return b.isChanged};if(typeof b.isChanged=="function")this.isChanged=b.isChanged;if(typeof b.setValue=="function")this.setValue=CKEDITOR.tools.override(this.setValue,function(a){return function(c){a.call(this,
+b.setValue.call(this,c))}});if(typeof b.getValue=="function")this.getValue=CKEDITOR.tools.override(this.getValue,function(a){return function(){return b.getValue.call(this,a.call(this))}});CKEDITOR.event.implementOn(this);this.registerEvents(b);this.accessKeyUp&&(this.accessKeyDown&&b.accessKey)&&A(this,a,"CTRL+"+b.accessKey);var t=this;a.on("load",function(){var b=t.getInputElement();if(b){var c=t.type in{checkbox:1,ratio:1}&&CKEDITOR.env.ie&&CKEDITOR.env.version<8?"cke_dialog_ui_focused":"";b.on("focus",
+function(){a._.tabBarMode=false;a._.hasFocus=true;t.fire("focus");c&&this.addClass(c)});b.on("blur",function(){t.fire("blur");c&&this.removeClass(c)})}});CKEDITOR.tools.extend(this,b);if(this.keyboardFocusable){this.tabIndex=b.tabIndex||0;this.focusIndex=a._.focusList.push(this)-1;this.on("focus",function(){a._.currentFocusIndex=t.focusIndex})}}},hbox:function(a,b,c,d,f){if(!(arguments.length<4)){this._||(this._={});var e=this._.children=b,g=f&&f.widths||null,i=f&&f.height||null,h,j={role:"presentation"};
+f&&f.align&&(j.align=f.align);CKEDITOR.ui.dialog.uiElement.call(this,a,f||{type:"hbox"},d,"table",{},j,function(){var a=['<tbody><tr class="cke_dialog_ui_hbox">'];for(h=0;h<c.length;h++){var b="cke_dialog_ui_hbox_child",d=[];h===0&&(b="cke_dialog_ui_hbox_first");h==c.length-1&&(b="cke_dialog_ui_hbox_last");a.push('<td class="',b,'" role="presentation" ');g?g[h]&&d.push("width:"+o(g[h])):d.push("width:"+Math.floor(100/c.length)+"%");i&&d.push("height:"+o(i));f&&f.padding!==void 0&&d.push("padding:"+
+o(f.padding));CKEDITOR.env.ie&&(CKEDITOR.env.quirks&&e[h].align)&&d.push("text-align:"+e[h].align);d.length>0&&a.push('style="'+d.join("; ")+'" ');a.push(">",c[h],"</td>")}a.push("</tr></tbody>");return a.join("")})}},vbox:function(a,b,c,d,f){if(!(arguments.length<3)){this._||(this._={});var e=this._.children=b,g=f&&f.width||null,i=f&&f.heights||null;CKEDITOR.ui.dialog.uiElement.call(this,a,f||{type:"vbox"},d,"div",null,{role:"presentation"},function(){var b=['<table role="presentation" cellspacing="0" border="0" '];
+b.push('style="');f&&f.expand&&b.push("height:100%;");b.push("width:"+o(g||"100%"),";");CKEDITOR.env.webkit&&b.push("float:none;");b.push('"');b.push('align="',CKEDITOR.tools.htmlEncode(f&&f.align||(a.getParentEditor().lang.dir=="ltr"?"left":"right")),'" ');b.push("><tbody>");for(var d=0;d<c.length;d++){var h=[];b.push('<tr><td role="presentation" ');g&&h.push("width:"+o(g||"100%"));i?h.push("height:"+o(i[d])):f&&f.expand&&h.push("height:"+Math.floor(100/c.length)+"%");f&&f.padding!==void 0&&h.push("padding:"+
+o(f.padding));CKEDITOR.env.ie&&(CKEDITOR.env.quirks&&e[d].align)&&h.push("text-align:"+e[d].align);h.length>0&&b.push('style="',h.join("; "),'" ');b.push(' class="cke_dialog_ui_vbox_child">',c[d],"</td></tr>")}b.push("</tbody></table>");return b.join("")})}}}})();CKEDITOR.ui.dialog.uiElement.prototype={getElement:function(){return CKEDITOR.document.getById(this.domId)},getInputElement:function(){return this.getElement()},getDialog:function(){return this._.dialog},setValue:function(a,b){this.getInputElement().setValue(a);
+!b&&this.fire("change",{value:a});return this},getValue:function(){return this.getInputElement().getValue()},isChanged:function(){return false},selectParentTab:function(){for(var a=this.getInputElement();(a=a.getParent())&&a.$.className.search("cke_dialog_page_contents")==-1;);if(!a)return this;a=a.getAttribute("name");this._.dialog._.currentTabId!=a&&this._.dialog.selectPage(a);return this},focus:function(){this.selectParentTab().getInputElement().focus();return this},registerEvents:function(a){var b=
+/^on([A-Z]\w+)/,c,d=function(a,b,c,d){b.on("load",function(){a.getInputElement().on(c,d,a)})},f;for(f in a)if(c=f.match(b))this.eventProcessors[f]?this.eventProcessors[f].call(this,this._.dialog,a[f]):d(this,this._.dialog,c[1].toLowerCase(),a[f]);return this},eventProcessors:{onLoad:function(a,b){a.on("load",b,this)},onShow:function(a,b){a.on("show",b,this)},onHide:function(a,b){a.on("hide",b,this)}},accessKeyDown:function(){this.focus()},accessKeyUp:function(){},disable:function(){var a=this.getElement();
+this.getInputElement().setAttribute("disabled","true");a.addClass("cke_disabled")},enable:function(){var a=this.getElement();this.getInputElement().removeAttribute("disabled");a.removeClass("cke_disabled")},isEnabled:function(){return!this.getElement().hasClass("cke_disabled")},isVisible:function(){return this.getInputElement().isVisible()},isFocusable:function(){return!this.isEnabled()||!this.isVisible()?false:true}};CKEDITOR.ui.dialog.hbox.prototype=CKEDITOR.tools.extend(new CKEDITOR.ui.dialog.uiElement,
+{getChild:function(a){if(arguments.length<1)return this._.children.concat();a.splice||(a=[a]);return a.length<2?this._.children[a[0]]:this._.children[a[0]]&&this._.children[a[0]].getChild?this._.children[a[0]].getChild(a.slice(1,a.length)):null}},true);CKEDITOR.ui.dialog.vbox.prototype=new CKEDITOR.ui.dialog.hbox;(function(){var a={build:function(a,b,c){for(var d=b.children,f,e=[],g=[],i=0;i<d.length&&(f=d[i]);i++){var h=[];e.push(h);g.push(CKEDITOR.dialog._.uiElementBuilders[f.type].build(a,f,h))}return new CKEDITOR.ui.dialog[b.type](a,
+g,e,c,b)}};CKEDITOR.dialog.addUIElement("hbox",a);CKEDITOR.dialog.addUIElement("vbox",a)})();CKEDITOR.dialogCommand=function(a,b){this.dialogName=a;CKEDITOR.tools.extend(this,b,true)};CKEDITOR.dialogCommand.prototype={exec:function(a){a.openDialog(this.dialogName)},canUndo:false,editorFocus:1};(function(){var a=/^([a]|[^a])+$/,b=/^\d*$/,c=/^\d*(?:\.\d+)?$/,d=/^(((\d*(\.\d+))|(\d*))(px|\%)?)?$/,f=/^(((\d*(\.\d+))|(\d*))(px|em|ex|in|cm|mm|pt|pc|\%)?)?$/i,e=/^(\s*[\w-]+\s*:\s*[^:;]+(?:;|$))*$/;CKEDITOR.VALIDATE_OR=
+1;CKEDITOR.VALIDATE_AND=2;CKEDITOR.dialog.validate={functions:function(){var a=arguments;return function(){var b=this&&this.getValue?this.getValue():a[0],c,d=CKEDITOR.VALIDATE_AND,f=[],e;for(e=0;e<a.length;e++)if(typeof a[e]=="function")f.push(a[e]);else break;if(e<a.length&&typeof a[e]=="string"){c=a[e];e++}e<a.length&&typeof a[e]=="number"&&(d=a[e]);var g=d==CKEDITOR.VALIDATE_AND?true:false;for(e=0;e<f.length;e++)g=d==CKEDITOR.VALIDATE_AND?g&&f[e](b):g||f[e](b);return!g?c:true}},regex:function(a,
+b){return function(c){c=this&&this.getValue?this.getValue():c;return!a.test(c)?b:true}},notEmpty:function(b){return this.regex(a,b)},integer:function(a){return this.regex(b,a)},number:function(a){return this.regex(c,a)},cssLength:function(a){return this.functions(function(a){return f.test(CKEDITOR.tools.trim(a))},a)},htmlLength:function(a){return this.functions(function(a){return d.test(CKEDITOR.tools.trim(a))},a)},inlineStyle:function(a){return this.functions(function(a){return e.test(CKEDITOR.tools.trim(a))},
+a)},equals:function(a,b){return this.functions(function(b){return b==a},b)},notEqual:function(a,b){return this.functions(function(b){return b!=a},b)}};CKEDITOR.on("instanceDestroyed",function(a){if(CKEDITOR.tools.isEmpty(CKEDITOR.instances)){for(var b;b=CKEDITOR.dialog._.currentTop;)b.hide();for(var c in v)v[c].remove();v={}}var a=a.editor._.storedDialogs,d;for(d in a)a[d].destroy()})})();CKEDITOR.tools.extend(CKEDITOR.editor.prototype,{openDialog:function(a,b){var c=null,d=CKEDITOR.dialog._.dialogDefinitions[a];
+CKEDITOR.dialog._.currentTop===null&&q(this);if(typeof d=="function"){c=this._.storedDialogs||(this._.storedDialogs={});c=c[a]||(c[a]=new CKEDITOR.dialog(this,a));b&&b.call(c,c);c.show()}else{if(d=="failed"){l(this);throw Error('[CKEDITOR.dialog.openDialog] Dialog "'+a+'" failed when loading definition.');}typeof d=="string"&&CKEDITOR.scriptLoader.load(CKEDITOR.getUrl(d),function(){typeof CKEDITOR.dialog._.dialogDefinitions[a]!="function"&&(CKEDITOR.dialog._.dialogDefinitions[a]="failed");this.openDialog(a,
+b)},this,0,1)}CKEDITOR.skin.loadPart("dialog");return c}})}(),CKEDITOR.plugins.add("dialog",{requires:"dialogui",init:function(a){a.on("doubleclick",function(e){e.data.dialog&&a.openDialog(e.data.dialog)},null,null,999)}}),function(){CKEDITOR.plugins.add("a11yhelp",{requires:"dialog",availableLangs:{af:1,ar:1,bg:1,ca:1,cs:1,cy:1,da:1,de:1,el:1,en:1,"en-gb":1,eo:1,es:1,et:1,fa:1,fi:1,fo:1,fr:1,"fr-ca":1,gl:1,gu:1,he:1,hi:1,hr:1,hu:1,id:1,it:1,ja:1,km:1,ko:1,ku:1,lt:1,lv:1,mk:1,mn:1,nb:1,nl:1,no:1,
+pl:1,pt:1,"pt-br":1,ro:1,ru:1,si:1,sk:1,sl:1,sq:1,sr:1,"sr-latn":1,sv:1,th:1,tr:1,tt:1,ug:1,uk:1,vi:1,zh:1,"zh-cn":1},init:function(a){var e=this;a.addCommand("a11yHelp",{exec:function(){var b=a.langCode,b=e.availableLangs[b]?b:e.availableLangs[b.replace(/-.*/,"")]?b.replace(/-.*/,""):"en";CKEDITOR.scriptLoader.load(CKEDITOR.getUrl(e.path+"dialogs/lang/"+b+".js"),function(){a.lang.a11yhelp=e.langEntries[b];a.openDialog("a11yHelp")})},modes:{wysiwyg:1,source:1},readOnly:1,canUndo:false});a.setKeystroke(CKEDITOR.ALT+
+48,"a11yHelp");CKEDITOR.dialog.add("a11yHelp",this.path+"dialogs/a11yhelp.js");a.on("ariaEditorHelpLabel",function(b){b.data.label=a.lang.common.editorHelp})}})}(),"use strict",function(){function a(a){function b(){i=a.document;h=i[CKEDITOR.env.ie?"getBody":"getDocumentElement"]();f=CKEDITOR.env.quirks?i.getBody():i.getDocumentElement();k=CKEDITOR.dom.element.createFromHtml('<span style="margin:0;padding:0;border:0;clear:both;width:1px;height:1px;display:block;">'+(CKEDITOR.env.webkit?"&nbsp;":"")+
+"</span>",i)}function c(){q&&f.setStyle("overflow-y","hidden");var b=a.window.getViewPaneSize().height,c;h.append(k);c=k.getDocumentPosition(i).y+k.$.offsetHeight;k.remove();c=c+j;c=Math.max(c,g);c=Math.min(c,n);if(c!=b&&d!=c){c=a.fire("autoGrow",{currentHeight:b,newHeight:c}).newHeight;a.resize(a.container.getStyle("width"),c,true);d=c}q||(c<n&&f.$.scrollHeight>f.$.clientHeight?f.setStyle("overflow-y","hidden"):f.removeStyle("overflow-y"))}var d,i,h,f,k,j=a.config.autoGrow_bottomSpace||0,g=a.config.autoGrow_minHeight!==
+void 0?a.config.autoGrow_minHeight:200,n=a.config.autoGrow_maxHeight||Infinity,q=!a.config.autoGrow_maxHeight;a.addCommand("autogrow",{exec:c,modes:{wysiwyg:1},readOnly:1,canUndo:false,editorFocus:false});var l={contentDom:1,key:1,selectionChange:1,insertElement:1,mode:1},o;for(o in l)a.on(o,function(b){b.editor.mode=="wysiwyg"&&setTimeout(function(){var b=a.getCommand("maximize");if(!a.window||b&&b.state==CKEDITOR.TRISTATE_ON)d=null;else{c();q||c()}},100)});a.on("afterCommandExec",function(a){a.data.name==
+"maximize"&&a.editor.mode=="wysiwyg"&&(a.data.command.state==CKEDITOR.TRISTATE_ON?f.removeStyle("overflow-y"):c())});a.on("contentDom",b);b();a.config.autoGrow_onStartup&&a.execCommand("autogrow")}CKEDITOR.plugins.add("autogrow",{init:function(e){if(e.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE)e.on("instanceReady",function(){e.editable().isInline()?e.ui.space("contents").setStyle("height","auto"):a(e)})}})}(),CKEDITOR.plugins.add("basicstyles",{init:function(a){var e=0,b=function(b,d,i,j){if(j){var j=
+new CKEDITOR.style(j),g=c[i];g.unshift(j);a.attachStyleStateChange(j,function(b){!a.readOnly&&a.getCommand(i).setState(b)});a.addCommand(i,new CKEDITOR.styleCommand(j,{contentForms:g}));a.ui.addButton&&a.ui.addButton(b,{label:d,command:i,toolbar:"basicstyles,"+(e=e+10)})}},c={bold:["strong","b",["span",function(a){a=a.styles["font-weight"];return a=="bold"||+a>=700}]],italic:["em","i",["span",function(a){return a.styles["font-style"]=="italic"}]],underline:["u",["span",function(a){return a.styles["text-decoration"]==
+"underline"}]],strike:["s","strike",["span",function(a){return a.styles["text-decoration"]=="line-through"}]],subscript:["sub"],superscript:["sup"]},d=a.config,i=a.lang.basicstyles;b("Bold",i.bold,"bold",d.coreStyles_bold);b("Italic",i.italic,"italic",d.coreStyles_italic);b("Underline",i.underline,"underline",d.coreStyles_underline);b("Strike",i.strike,"strike",d.coreStyles_strike);b("Subscript",i.subscript,"subscript",d.coreStyles_subscript);b("Superscript",i.superscript,"superscript",d.coreStyles_superscript);
+a.setKeystroke([[CKEDITOR.CTRL+66,"bold"],[CKEDITOR.CTRL+73,"italic"],[CKEDITOR.CTRL+85,"underline"]])}}),CKEDITOR.config.coreStyles_bold={element:"strong",overrides:"b"},CKEDITOR.config.coreStyles_italic={element:"em",overrides:"i"},CKEDITOR.config.coreStyles_underline={element:"u"},CKEDITOR.config.coreStyles_strike={element:"s",overrides:"strike"},CKEDITOR.config.coreStyles_subscript={element:"sub"},CKEDITOR.config.coreStyles_superscript={element:"sup"},function(){function a(a,b,c,d){if(!a.isReadOnly()&&
+!a.equals(c.editable())){CKEDITOR.dom.element.setMarker(d,a,"bidi_processed",1);for(var d=a,f=c.editable();(d=d.getParent())&&!d.equals(f);)if(d.getCustomData("bidi_processed")){a.removeStyle("direction");a.removeAttribute("dir");return}d="useComputedState"in c.config?c.config.useComputedState:1;if((d?a.getComputedStyle("direction"):a.getStyle("direction")||a.hasAttribute("dir"))!=b){a.removeStyle("direction");if(d){a.removeAttribute("dir");b!=a.getComputedStyle("direction")&&a.setAttribute("dir",
+b)}else a.setAttribute("dir",b);c.forceNextSelectionCheck()}}}function e(a,b,c){var d=a.getCommonAncestor(false,true),a=a.clone();a.enlarge(c==CKEDITOR.ENTER_BR?CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS:CKEDITOR.ENLARGE_BLOCK_CONTENTS);if(a.checkBoundaryOfElement(d,CKEDITOR.START)&&a.checkBoundaryOfElement(d,CKEDITOR.END)){for(var f;d&&d.type==CKEDITOR.NODE_ELEMENT&&(f=d.getParent())&&f.getChildCount()==1&&!(d.getName()in b);)d=f;return d.type==CKEDITOR.NODE_ELEMENT&&d.getName()in b&&d}}function b(b){return{context:"p",
+allowedContent:{"h1 h2 h3 h4 h5 h6 table ul ol blockquote div tr p div li td":{propertiesOnly:true,attributes:"dir"}},requiredContent:"p[dir]",refresh:function(a,b){var c=a.config.useComputedState,d,c=c===void 0||c;if(!c){d=b.lastElement;for(var f=a.editable();d&&!(d.getName()in h||d.equals(f));){var e=d.getParent();if(!e)break;d=e}}d=d||b.block||b.blockLimit;if(d.equals(a.editable()))(f=a.getSelection().getRanges()[0].getEnclosedNode())&&f.type==CKEDITOR.NODE_ELEMENT&&(d=f);if(d){c=c?d.getComputedStyle("direction"):
+d.getStyle("direction")||d.getAttribute("dir");a.getCommand("bidirtl").setState(c=="rtl"?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF);a.getCommand("bidiltr").setState(c=="ltr"?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF)}c=(b.block||b.blockLimit||a.editable()).getDirection(1);if(c!=(a._.selDir||a.lang.dir)){a._.selDir=c;a.fire("contentDirChanged",c)}},exec:function(c){var f=c.getSelection(),h=c.config.enterMode,j=f.getRanges();if(j&&j.length){for(var k={},m=f.createBookmarks(),j=j.createIterator(),
+p,t=0;p=j.getNextRange(1);){var w=p.getEnclosedNode();if(!w||w&&!(w.type==CKEDITOR.NODE_ELEMENT&&w.getName()in i))w=e(p,d,h);w&&a(w,b,c,k);var u=new CKEDITOR.dom.walker(p),x=m[t].startNode,v=m[t++].endNode;u.evaluator=function(a){var b=h==CKEDITOR.ENTER_P?"p":"div",c;if(c=a?a.type==CKEDITOR.NODE_ELEMENT:false)if(c=a.getName()in d){if(b=a.is(b))b=((b=a.getParent())?b.type==CKEDITOR.NODE_ELEMENT:false)&&a.getParent().is("blockquote");c=!b&&a.getPosition(x)&CKEDITOR.POSITION_FOLLOWING&&(a.getPosition(v)&
+CKEDITOR.POSITION_PRECEDING+CKEDITOR.POSITION_CONTAINS)==CKEDITOR.POSITION_PRECEDING}return!!c};for(;w=u.next();)a(w,b,c,k);p=p.createIterator();for(p.enlargeBr=h!=CKEDITOR.ENTER_BR;w=p.getNextParagraph(h==CKEDITOR.ENTER_P?"p":"div");)a(w,b,c,k)}CKEDITOR.dom.element.clearAllMarkers(k);c.forceNextSelectionCheck();f.selectBookmarks(m);c.focus()}}}}function c(a){var b=a==f.setAttribute,c=a==f.removeAttribute,d=/\bdirection\s*:\s*(.*?)\s*(:?$|;)/;return function(f,e){if(!this.isReadOnly()){var i;if(i=
+f==(b||c?"dir":"direction")||f=="style"&&(c||d.test(e))){a:{i=this;for(var h=i.getDocument().getBody().getParent();i;){if(i.equals(h)){i=false;break a}i=i.getParent()}i=true}i=!i}if(i){i=this.getDirection(1);h=a.apply(this,arguments);if(i!=this.getDirection(1)){this.getDocument().fire("dirChanged",this);return h}}}return a.apply(this,arguments)}}var d={table:1,ul:1,ol:1,blockquote:1,div:1},i={},h={};CKEDITOR.tools.extend(i,d,{tr:1,p:1,div:1,li:1});CKEDITOR.tools.extend(h,i,{td:1});CKEDITOR.plugins.add("bidi",
+{init:function(a){function c(b,d,f,e,i){a.addCommand(f,new CKEDITOR.command(a,e));a.ui.addButton&&a.ui.addButton(b,{label:d,command:f,toolbar:"bidi,"+i})}if(!a.blockless){var d=a.lang.bidi;c("BidiLtr",d.ltr,"bidiltr",b("ltr"),10);c("BidiRtl",d.rtl,"bidirtl",b("rtl"),20);a.on("contentDom",function(){a.document.on("dirChanged",function(b){a.fire("dirChanged",{node:b.data,dir:b.data.getDirection(1)})})});a.on("contentDirChanged",function(b){var b=(a.lang.dir!=b.data?"add":"remove")+"Class",c=a.ui.space(a.config.toolbarLocation);
+if(c)c[b]("cke_mixed_dir_content")})}}});for(var f=CKEDITOR.dom.element.prototype,k=["setStyle","removeStyle","setAttribute","removeAttribute"],j=0;j<k.length;j++)f[k[j]]=CKEDITOR.tools.override(f[k[j]],c)}(),function(){var a={exec:function(a){var b=a.getCommand("blockquote").state,c=a.getSelection(),d=c&&c.getRanges()[0];if(d){var i=c.createBookmarks();if(CKEDITOR.env.ie){var h=i[0].startNode,f=i[0].endNode,k;if(h&&h.getParent().getName()=="blockquote")for(k=h;k=k.getNext();)if(k.type==CKEDITOR.NODE_ELEMENT&&
+k.isBlockBoundary()){h.move(k,true);break}if(f&&f.getParent().getName()=="blockquote")for(k=f;k=k.getPrevious();)if(k.type==CKEDITOR.NODE_ELEMENT&&k.isBlockBoundary()){f.move(k);break}}var j=d.createIterator();j.enlargeBr=a.config.enterMode!=CKEDITOR.ENTER_BR;if(b==CKEDITOR.TRISTATE_OFF){for(h=[];b=j.getNextParagraph();)h.push(b);if(h.length<1){b=a.document.createElement(a.config.enterMode==CKEDITOR.ENTER_P?"p":"div");f=i.shift();d.insertNode(b);b.append(new CKEDITOR.dom.text("﻿",a.document));d.moveToBookmark(f);
+d.selectNodeContents(b);d.collapse(true);f=d.createBookmark();h.push(b);i.unshift(f)}k=h[0].getParent();d=[];for(f=0;f<h.length;f++){b=h[f];k=k.getCommonAncestor(b.getParent())}for(b={table:1,tbody:1,tr:1,ol:1,ul:1};b[k.getName()];)k=k.getParent();for(f=null;h.length>0;){for(b=h.shift();!b.getParent().equals(k);)b=b.getParent();b.equals(f)||d.push(b);f=b}for(;d.length>0;){b=d.shift();if(b.getName()=="blockquote"){for(f=new CKEDITOR.dom.documentFragment(a.document);b.getFirst();){f.append(b.getFirst().remove());
+h.push(f.getLast())}f.replace(b)}else h.push(b)}d=a.document.createElement("blockquote");for(d.insertBefore(h[0]);h.length>0;){b=h.shift();d.append(b)}}else if(b==CKEDITOR.TRISTATE_ON){f=[];for(k={};b=j.getNextParagraph();){for(h=d=null;b.getParent();){if(b.getParent().getName()=="blockquote"){d=b.getParent();h=b;break}b=b.getParent()}if(d&&h&&!h.getCustomData("blockquote_moveout")){f.push(h);CKEDITOR.dom.element.setMarker(k,h,"blockquote_moveout",true)}}CKEDITOR.dom.element.clearAllMarkers(k);b=
+[];h=[];for(k={};f.length>0;){j=f.shift();d=j.getParent();if(j.getPrevious())if(j.getNext()){j.breakParent(j.getParent());h.push(j.getNext())}else j.remove().insertAfter(d);else j.remove().insertBefore(d);if(!d.getCustomData("blockquote_processed")){h.push(d);CKEDITOR.dom.element.setMarker(k,d,"blockquote_processed",true)}b.push(j)}CKEDITOR.dom.element.clearAllMarkers(k);for(f=h.length-1;f>=0;f--){d=h[f];a:{k=d;for(var j=0,g=k.getChildCount(),n=void 0;j<g&&(n=k.getChild(j));j++)if(n.type==CKEDITOR.NODE_ELEMENT&&
+n.isBlockBoundary()){k=false;break a}k=true}k&&d.remove()}if(a.config.enterMode==CKEDITOR.ENTER_BR)for(d=true;b.length;){j=b.shift();if(j.getName()=="div"){f=new CKEDITOR.dom.documentFragment(a.document);d&&(j.getPrevious()&&!(j.getPrevious().type==CKEDITOR.NODE_ELEMENT&&j.getPrevious().isBlockBoundary()))&&f.append(a.document.createElement("br"));for(d=j.getNext()&&!(j.getNext().type==CKEDITOR.NODE_ELEMENT&&j.getNext().isBlockBoundary());j.getFirst();)j.getFirst().remove().appendTo(f);d&&f.append(a.document.createElement("br"));
+f.replace(j);d=false}}}c.selectBookmarks(i);a.focus()}},refresh:function(a,b){this.setState(a.elementPath(b.block||b.blockLimit).contains("blockquote",1)?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF)},context:"blockquote",allowedContent:"blockquote",requiredContent:"blockquote"};CKEDITOR.plugins.add("blockquote",{init:function(e){if(!e.blockless){e.addCommand("blockquote",a);e.ui.addButton&&e.ui.addButton("Blockquote",{label:e.lang.blockquote.toolbar,command:"blockquote",toolbar:"blocks,10"})}}})}(),
+"use strict",function(){function a(a,b,c){if(!b.type)b.type="auto";if(c&&a.fire("beforePaste",b)===false||!b.dataValue&&b.dataTransfer.isEmpty())return false;if(!b.dataValue)b.dataValue="";if(CKEDITOR.env.gecko&&b.method=="drop"&&a.toolbox)a.once("afterPaste",function(){a.toolbox.focus()});return a.fire("paste",b)}function e(b){function c(){var a=b.editable();if(CKEDITOR.plugins.clipboard.isCustomCopyCutSupported){var d=function(a){y.initPasteDataTransfer(a,b);a.data.preventDefault()};a.on("copy",
+d);a.on("cut",d);a.on("cut",function(){b.extractSelectedHtml()},null,null,999)}a.on(y.mainPasteEvent,function(a){y.mainPasteEvent=="beforepaste"&&z||x(a)});if(y.mainPasteEvent=="beforepaste"){a.on("paste",function(a){if(!B){e();a.data.preventDefault();x(a);h("paste")||b.openDialog("paste")}});a.on("contextmenu",i,null,null,0);a.on("beforepaste",function(a){a.data&&(!a.data.$.ctrlKey&&!a.data.$.shiftKey)&&i()},null,null,0)}a.on("beforecut",function(){!z&&j(b)});var f;a.attachListener(CKEDITOR.env.ie?
+a:b.document.getDocumentElement(),"mouseup",function(){f=setTimeout(function(){v()},0)});b.on("destroy",function(){clearTimeout(f)});a.on("keyup",v)}function d(a){return{type:a,canUndo:a=="cut",startDisabled:true,exec:function(){this.type=="cut"&&j();var a;var c=this.type;if(CKEDITOR.env.ie)a=h(c);else try{a=b.document.$.execCommand(c,false,null)}catch(d){a=false}a||b.showNotification(b.lang.clipboard[this.type+"Error"]);return a}}}function f(){return{canUndo:false,async:true,exec:function(b,c){var d=
+function(c,d){c&&a(b,c,!!d);b.fire("afterCommandExec",{name:"paste",command:f,returnValue:!!c})},f=this;typeof c=="string"?d({dataValue:c,method:"paste",dataTransfer:y.initPasteDataTransfer()},1):b.getClipboardData(d)}}}function e(){B=1;setTimeout(function(){B=0},100)}function i(){z=1;setTimeout(function(){z=0},10)}function h(a){var c=b.document,d=c.getBody(),f=false,e=function(){f=true};d.on(a,e);CKEDITOR.env.version>7?c.$.execCommand(a):c.$.selection.createRange().execCommand(a);d.removeListener(a,
+e);return f}function j(){if(CKEDITOR.env.ie&&!CKEDITOR.env.quirks){var a=b.getSelection(),c,d,f;if(a.getType()==CKEDITOR.SELECTION_ELEMENT&&(c=a.getSelectedElement())){d=a.getRanges()[0];f=b.document.createText("");f.insertBefore(c);d.setStartBefore(f);d.setEndAfter(c);a.selectRanges([d]);setTimeout(function(){if(c.getParent()){f.remove();a.selectElement(c)}},0)}}}function k(a,c){var d=b.document,f=b.editable(),e=function(a){a.cancel()},i;if(!d.getById("cke_pastebin")){var h=b.getSelection(),j=h.createBookmarks();
+CKEDITOR.env.ie&&h.root.fire("selectionchange");var p=new CKEDITOR.dom.element((CKEDITOR.env.webkit||f.is("body"))&&!CKEDITOR.env.ie?"body":"div",d);p.setAttributes({id:"cke_pastebin","data-cke-temp":"1"});var m=0,d=d.getWindow();if(CKEDITOR.env.webkit){f.append(p);p.addClass("cke_editable");if(!f.is("body")){m=f.getComputedStyle("position")!="static"?f:CKEDITOR.dom.element.get(f.$.offsetParent);m=m.getDocumentPosition().y}}else f.getAscendant(CKEDITOR.env.ie?"body":"html",1).append(p);p.setStyles({position:"absolute",
+top:d.getScrollPosition().y-m+10+"px",width:"1px",height:Math.max(1,d.getViewPaneSize().height-20)+"px",overflow:"hidden",margin:0,padding:0});CKEDITOR.env.safari&&p.setStyles(CKEDITOR.tools.cssVendorPrefix("user-select","text"));if(m=p.getParent().isReadOnly()){p.setOpacity(0);p.setAttribute("contenteditable",true)}else p.setStyle(b.config.contentsLangDirection=="ltr"?"left":"right","-1000px");b.on("selectionChange",e,null,null,0);if(CKEDITOR.env.webkit||CKEDITOR.env.gecko)i=f.once("blur",e,null,
+null,-100);m&&p.focus();m=new CKEDITOR.dom.range(p);m.selectNodeContents(p);var o=m.select();CKEDITOR.env.ie&&(i=f.once("blur",function(){b.lockSelection(o)}));var t=CKEDITOR.document.getWindow().getScrollPosition().y;setTimeout(function(){if(CKEDITOR.env.webkit)CKEDITOR.document.getBody().$.scrollTop=t;i&&i.removeListener();CKEDITOR.env.ie&&f.focus();h.selectBookmarks(j);p.remove();var a;if(CKEDITOR.env.webkit&&(a=p.getFirst())&&a.is&&a.hasClass("Apple-style-span"))p=a;b.removeListener("selectionChange",
+e);c(p.getHtml())},0)}}function w(){if(y.mainPasteEvent=="paste"){b.fire("beforePaste",{type:"auto",method:"paste"});return false}b.focus();e();var a=b.focusManager;a.lock();if(b.editable().fire(y.mainPasteEvent)&&!h("paste")){a.unlock();return false}a.unlock();return true}function u(a){if(b.mode=="wysiwyg")switch(a.data.keyCode){case CKEDITOR.CTRL+86:case CKEDITOR.SHIFT+45:a=b.editable();e();y.mainPasteEvent=="paste"&&a.fire("beforepaste");break;case CKEDITOR.CTRL+88:case CKEDITOR.SHIFT+46:b.fire("saveSnapshot");
+setTimeout(function(){b.fire("saveSnapshot")},50)}}function x(c){var d={type:"auto",method:"paste",dataTransfer:y.initPasteDataTransfer(c)};d.dataTransfer.cacheData();var f=b.fire("beforePaste",d)!==false;if(f&&y.canClipboardApiBeTrusted(d.dataTransfer,b)){c.data.preventDefault();setTimeout(function(){a(b,d)},0)}else k(c,function(c){d.dataValue=c.replace(/<span[^>]+data-cke-bookmark[^<]*?<\/span>/ig,"");f&&a(b,d)})}function v(){if(b.mode=="wysiwyg"){var a=s("paste");b.getCommand("cut").setState(s("cut"));
+b.getCommand("copy").setState(s("copy"));b.getCommand("paste").setState(a);b.fire("pasteState",a)}}function s(a){if(A&&a in{paste:1,cut:1})return CKEDITOR.TRISTATE_DISABLED;if(a=="paste")return CKEDITOR.TRISTATE_OFF;var a=b.getSelection(),c=a.getRanges();return a.getType()==CKEDITOR.SELECTION_NONE||c.length==1&&c[0].collapsed?CKEDITOR.TRISTATE_DISABLED:CKEDITOR.TRISTATE_OFF}var y=CKEDITOR.plugins.clipboard,z=0,B=0,A=0;(function(){b.on("key",u);b.on("contentDom",c);b.on("selectionChange",function(a){A=
+a.data.selection.getRanges()[0].checkReadOnly();v()});b.contextMenu&&b.contextMenu.addListener(function(a,b){A=b.getRanges()[0].checkReadOnly();return{cut:s("cut"),copy:s("copy"),paste:s("paste")}})})();(function(){function a(c,d,f,e,i){var h=b.lang.clipboard[d];b.addCommand(d,f);b.ui.addButton&&b.ui.addButton(c,{label:h,command:d,toolbar:"clipboard,"+e});b.addMenuItems&&b.addMenuItem(d,{label:h,command:d,group:"clipboard",order:i})}a("Cut","cut",d("cut"),10,1);a("Copy","copy",d("copy"),20,4);a("Paste",
+"paste",f(),30,8)})();b.getClipboardData=function(a,c){function d(a){a.removeListener();a.cancel();c(a.data)}function f(a){a.removeListener();a.cancel();j=true;c({type:h,dataValue:a.data,method:"paste"})}function e(){this.customTitle=a&&a.title}var i=false,h="auto",j=false;if(!c){c=a;a=null}b.on("paste",d,null,null,0);b.on("beforePaste",function(a){a.removeListener();i=true;h=a.data.type},null,null,1E3);if(w()===false){b.removeListener("paste",d);if(i&&b.fire("pasteDialog",e)){b.on("pasteDialogCommit",
+f);b.on("dialogHide",function(a){a.removeListener();a.data.removeListener("pasteDialogCommit",f);setTimeout(function(){j||c(null)},10)})}else c(null)}}}function b(a){if(CKEDITOR.env.webkit){if(!a.match(/^[^<]*$/g)&&!a.match(/^(<div><br( ?\/)?><\/div>|<div>[^<]*<\/div>)*$/gi))return"html"}else if(CKEDITOR.env.ie){if(!a.match(/^([^<]|<br( ?\/)?>)*$/gi)&&!a.match(/^(<p>([^<]|<br( ?\/)?>)*<\/p>|(\r\n))*$/gi))return"html"}else if(CKEDITOR.env.gecko){if(!a.match(/^([^<]|<br( ?\/)?>)*$/gi))return"html"}else return"html";
+return"htmlifiedtext"}function c(a,b){function c(a){return CKEDITOR.tools.repeat("</p><p>",~~(a/2))+(a%2==1?"<br>":"")}b=b.replace(/\s+/g," ").replace(/> +</g,"><").replace(/<br ?\/>/gi,"<br>");b=b.replace(/<\/?[A-Z]+>/g,function(a){return a.toLowerCase()});if(b.match(/^[^<]$/))return b;if(CKEDITOR.env.webkit&&b.indexOf("<div>")>-1){b=b.replace(/^(<div>(<br>|)<\/div>)(?!$|(<div>(<br>|)<\/div>))/g,"<br>").replace(/^(<div>(<br>|)<\/div>){2}(?!$)/g,"<div></div>");b.match(/<div>(<br>|)<\/div>/)&&(b="<p>"+
+b.replace(/(<div>(<br>|)<\/div>)+/g,function(a){return c(a.split("</div><div>").length+1)})+"</p>");b=b.replace(/<\/div><div>/g,"<br>");b=b.replace(/<\/?div>/g,"")}if(CKEDITOR.env.gecko&&a.enterMode!=CKEDITOR.ENTER_BR){CKEDITOR.env.gecko&&(b=b.replace(/^<br><br>$/,"<br>"));b.indexOf("<br><br>")>-1&&(b="<p>"+b.replace(/(<br>){2,}/g,function(a){return c(a.length/4)})+"</p>")}return h(a,b)}function d(){function a(){var b={},c;for(c in CKEDITOR.dtd)c.charAt(0)!="$"&&(c!="div"&&c!="span")&&(b[c]=1);return b}
+var b,c;return{get:function(d){if(d=="plain-text")return b||(b=new CKEDITOR.filter("br"));if(d=="semantic-content"){if(!(d=c)){d=new CKEDITOR.filter;d.allow({$1:{elements:a(),attributes:true,styles:false,classes:false}});d=c=d}return d}return d?new CKEDITOR.filter(d):null}}}function i(a,b,c){var b=CKEDITOR.htmlParser.fragment.fromHtml(b),d=new CKEDITOR.htmlParser.basicWriter;c.applyTo(b,true,false,a.activeEnterMode);b.writeHtml(d);return d.getHtml()}function h(a,b){a.enterMode==CKEDITOR.ENTER_BR?
+b=b.replace(/(<\/p><p>)+/g,function(a){return CKEDITOR.tools.repeat("<br>",a.length/7*2)}).replace(/<\/?p>/g,""):a.enterMode==CKEDITOR.ENTER_DIV&&(b=b.replace(/<(\/)?p>/g,"<$1div>"));return b}function f(a){a.data.preventDefault();a.data.$.dataTransfer.dropEffect="none"}function k(b){var c=CKEDITOR.plugins.clipboard;b.on("contentDom",function(){function d(c,f,e){f.select();a(b,{dataTransfer:e,method:"drop"},1);e.sourceEditor.fire("saveSnapshot");e.sourceEditor.editable().extractHtmlFromRange(c);e.sourceEditor.getSelection().selectRanges([c]);
+e.sourceEditor.fire("saveSnapshot")}function f(d,e){d.select();a(b,{dataTransfer:e,method:"drop"},1);c.resetDragDataTransfer()}function e(a,c,d){var f={$:a.data.$,target:a.data.getTarget()};if(c)f.dragRange=c;if(d)f.dropRange=d;b.fire(a.name,f)===false&&a.data.preventDefault()}function i(a){a.type!=CKEDITOR.NODE_ELEMENT&&(a=a.getParent());return a.getChildCount()}var h=b.editable(),j=CKEDITOR.plugins.clipboard.getDropTarget(b),k=b.ui.space("top"),w=b.ui.space("bottom");c.preventDefaultDropOnElement(k);
+c.preventDefaultDropOnElement(w);h.attachListener(j,"dragstart",e);h.attachListener(b,"dragstart",c.resetDragDataTransfer,c,null,1);h.attachListener(b,"dragstart",function(a){c.initDragDataTransfer(a,b)},null,null,2);h.attachListener(b,"dragstart",function(){var a=c.dragRange=b.getSelection().getRanges()[0];if(CKEDITOR.env.ie&&CKEDITOR.env.version<10){c.dragStartContainerChildCount=a?i(a.startContainer):null;c.dragEndContainerChildCount=a?i(a.endContainer):null}},null,null,100);h.attachListener(j,
+"dragend",e);h.attachListener(b,"dragend",c.initDragDataTransfer,c,null,1);h.attachListener(b,"dragend",c.resetDragDataTransfer,c,null,100);h.attachListener(j,"dragover",function(a){var b=a.data.getTarget();b&&b.is&&b.is("html")?a.data.preventDefault():CKEDITOR.env.ie&&(CKEDITOR.plugins.clipboard.isFileApiSupported&&a.data.$.dataTransfer.types.contains("Files"))&&a.data.preventDefault()});h.attachListener(j,"drop",function(a){a.data.preventDefault();var d=a.data.getTarget();if(!d.isReadOnly()||d.type==
+CKEDITOR.NODE_ELEMENT&&d.is("html")){var d=c.getRangeAtDropPosition(a,b),f=c.dragRange;d&&e(a,f,d)}});h.attachListener(b,"drop",c.initDragDataTransfer,c,null,1);h.attachListener(b,"drop",function(a){if(a=a.data){var e=a.dropRange,i=a.dragRange,h=a.dataTransfer;h.getTransferType(b)==CKEDITOR.DATA_TRANSFER_INTERNAL?setTimeout(function(){c.internalDrop(i,e,h,b)},0):h.getTransferType(b)==CKEDITOR.DATA_TRANSFER_CROSS_EDITORS?d(i,e,h):f(e,h)}},null,null,9999)})}CKEDITOR.plugins.add("clipboard",{requires:"dialog",
+init:function(a){var f,h=d();a.config.forcePasteAsPlainText?f="plain-text":a.config.pasteFilter?f=a.config.pasteFilter:CKEDITOR.env.webkit&&!("pasteFilter"in a.config)&&(f="semantic-content");a.pasteFilter=h.get(f);e(a);k(a);CKEDITOR.dialog.add("paste",CKEDITOR.getUrl(this.path+"dialogs/paste.js"));a.on("paste",function(b){if(!b.data.dataTransfer)b.data.dataTransfer=new CKEDITOR.plugins.clipboard.dataTransfer;if(!b.data.dataValue){var c=b.data.dataTransfer,d=c.getData("text/html");if(d){b.data.dataValue=
+d;b.data.type="html"}else if(d=c.getData("text/plain")){b.data.dataValue=a.editable().transformPlainTextToHtml(d);b.data.type="text"}}},null,null,1);a.on("paste",function(a){var b=a.data.dataValue,c=CKEDITOR.dtd.$block;if(b.indexOf("Apple-")>-1){b=b.replace(/<span class="Apple-converted-space">&nbsp;<\/span>/gi," ");a.data.type!="html"&&(b=b.replace(/<span class="Apple-tab-span"[^>]*>([^<]*)<\/span>/gi,function(a,b){return b.replace(/\t/g,"&nbsp;&nbsp; &nbsp;")}));if(b.indexOf('<br class="Apple-interchange-newline">')>
+-1){a.data.startsWithEOL=1;a.data.preSniffing="html";b=b.replace(/<br class="Apple-interchange-newline">/,"")}b=b.replace(/(<[^>]+) class="Apple-[^"]*"/gi,"$1")}if(b.match(/^<[^<]+cke_(editable|contents)/i)){var d,f,e=new CKEDITOR.dom.element("div");for(e.setHtml(b);e.getChildCount()==1&&(d=e.getFirst())&&d.type==CKEDITOR.NODE_ELEMENT&&(d.hasClass("cke_editable")||d.hasClass("cke_contents"));)e=f=d;f&&(b=f.getHtml().replace(/<br>$/i,""))}CKEDITOR.env.ie?b=b.replace(/^&nbsp;(?: |\r\n)?<(\w+)/g,function(b,
+d){if(d.toLowerCase()in c){a.data.preSniffing="html";return"<"+d}return b}):CKEDITOR.env.webkit?b=b.replace(/<\/(\w+)><div><br><\/div>$/,function(b,d){if(d in c){a.data.endsWithEOL=1;return"</"+d+">"}return b}):CKEDITOR.env.gecko&&(b=b.replace(/(\s)<br>$/,"$1"));a.data.dataValue=b},null,null,3);a.on("paste",function(d){var d=d.data,f=d.type,e=d.dataValue,j,k=a.config.clipboard_defaultContentType||"html",t=d.dataTransfer.getTransferType(a);j=f=="html"||d.preSniffing=="html"?"html":b(e);j=="htmlifiedtext"&&
+(e=c(a.config,e));f=="text"&&j=="html"?e=i(a,e,h.get("plain-text")):t==CKEDITOR.DATA_TRANSFER_EXTERNAL&&(a.pasteFilter&&!d.dontFilter)&&(e=i(a,e,a.pasteFilter));d.startsWithEOL&&(e='<br data-cke-eol="1">'+e);d.endsWithEOL&&(e=e+'<br data-cke-eol="1">');f=="auto"&&(f=j=="html"||k=="html"?"html":"text");d.type=f;d.dataValue=e;delete d.preSniffing;delete d.startsWithEOL;delete d.endsWithEOL},null,null,6);a.on("paste",function(b){b=b.data;if(b.dataValue){a.insertHtml(b.dataValue,b.type,b.range);setTimeout(function(){a.fire("afterPaste")},
+0)}},null,null,1E3);a.on("pasteDialog",function(b){setTimeout(function(){a.openDialog("paste",b.data)},0)})}});CKEDITOR.plugins.clipboard={isCustomCopyCutSupported:!CKEDITOR.env.ie&&!CKEDITOR.env.iOS,isCustomDataTypesSupported:!CKEDITOR.env.ie,isFileApiSupported:!CKEDITOR.env.ie||CKEDITOR.env.version>9,mainPasteEvent:CKEDITOR.env.ie&&!CKEDITOR.env.edge?"beforepaste":"paste",canClipboardApiBeTrusted:function(a,b){return a.getTransferType(b)!=CKEDITOR.DATA_TRANSFER_EXTERNAL||CKEDITOR.env.chrome&&!a.isEmpty()||
+CKEDITOR.env.gecko&&(a.getData("text/html")||a.getFilesCount())?true:false},getDropTarget:function(a){var b=a.editable();return CKEDITOR.env.ie&&CKEDITOR.env.version<9||b.isInline()?b:a.document},fixSplitNodesAfterDrop:function(a,b,c,d){function f(a,c,d){var e=a;e.type==CKEDITOR.NODE_TEXT&&(e=a.getParent());if(e.equals(c)&&d!=c.getChildCount()){a=b;c=a.startContainer.getChild(a.startOffset-1);d=a.startContainer.getChild(a.startOffset);if(c&&c.type==CKEDITOR.NODE_TEXT&&d&&d.type==CKEDITOR.NODE_TEXT){e=
+c.getLength();c.setText(c.getText()+d.getText());d.remove();a.setStart(c,e);a.collapse(true)}return true}}var e=b.startContainer;!(typeof d!="number"||typeof c!="number")&&(e.type==CKEDITOR.NODE_ELEMENT&&!f(a.startContainer,e,c))&&f(a.endContainer,e,d)},isDropRangeAffectedByDragRange:function(a,b){var c=b.startContainer,d=b.endOffset;return a.endContainer.equals(c)&&a.endOffset<=d||a.startContainer.getParent().equals(c)&&a.startContainer.getIndex()<d||a.endContainer.getParent().equals(c)&&a.endContainer.getIndex()<
+d?true:false},internalDrop:function(b,c,d,f){var e=CKEDITOR.plugins.clipboard,i=f.editable(),h,j;f.fire("saveSnapshot");f.fire("lockSnapshot",{dontUpdate:1});CKEDITOR.env.ie&&CKEDITOR.env.version<10&&this.fixSplitNodesAfterDrop(b,c,e.dragStartContainerChildCount,e.dragEndContainerChildCount);(j=this.isDropRangeAffectedByDragRange(b,c))||(h=b.createBookmark(false));e=c.clone().createBookmark(false);j&&(h=b.createBookmark(false));b=h.startNode;c=h.endNode;j=e.startNode;c&&(b.getPosition(j)&CKEDITOR.POSITION_PRECEDING&&
+c.getPosition(j)&CKEDITOR.POSITION_FOLLOWING)&&j.insertBefore(b);b=f.createRange();b.moveToBookmark(h);i.extractHtmlFromRange(b,1);c=f.createRange();c.moveToBookmark(e);a(f,{dataTransfer:d,method:"drop",range:c},1);f.fire("unlockSnapshot")},getRangeAtDropPosition:function(a,b){var c=a.data.$,d=c.clientX,f=c.clientY,e=b.getSelection(true).getRanges()[0],i=b.createRange();if(a.data.testRange)return a.data.testRange;if(document.caretRangeFromPoint){c=b.document.$.caretRangeFromPoint(d,f);i.setStart(CKEDITOR.dom.node(c.startContainer),
+c.startOffset);i.collapse(true)}else if(c.rangeParent){i.setStart(CKEDITOR.dom.node(c.rangeParent),c.rangeOffset);i.collapse(true)}else{if(CKEDITOR.env.ie&&CKEDITOR.env.version>8&&e&&b.editable().hasFocus)return e;if(document.body.createTextRange){b.focus();c=b.document.getBody().$.createTextRange();try{for(var h=false,j=0;j<20&&!h;j++){if(!h)try{c.moveToPoint(d,f-j);h=true}catch(k){}if(!h)try{c.moveToPoint(d,f+j);h=true}catch(u){}}if(h){var x="cke-temp-"+(new Date).getTime();c.pasteHTML('<span id="'+
+x+'">​</span>');var v=b.document.getById(x);i.moveToPosition(v,CKEDITOR.POSITION_BEFORE_START);v.remove()}else{var s=b.document.$.elementFromPoint(d,f),y=new CKEDITOR.dom.element(s),z;if(!y.equals(b.editable())&&y.getName()!="html"){z=y.getClientRect();d<z.left?i.setStartAt(y,CKEDITOR.POSITION_AFTER_START):i.setStartAt(y,CKEDITOR.POSITION_BEFORE_END);i.collapse(true)}else return e&&e.startContainer&&!e.startContainer.equals(b.editable())?e:null}}catch(B){return null}}else return null}return i},initDragDataTransfer:function(a,
+b){var c=a.data.$?a.data.$.dataTransfer:null,d=new this.dataTransfer(c,b);c?this.dragData&&d.id==this.dragData.id?d=this.dragData:this.dragData=d:this.dragData?d=this.dragData:this.dragData=d;a.data.dataTransfer=d},resetDragDataTransfer:function(){this.dragData=null},initPasteDataTransfer:function(a,b){if(this.isCustomCopyCutSupported&&a&&a.data&&a.data.$){var c=new this.dataTransfer(a.data.$.clipboardData,b);if(this.copyCutData&&c.id==this.copyCutData.id){c=this.copyCutData;c.$=a.data.$.clipboardData}else this.copyCutData=
+c;return c}return new this.dataTransfer(null,b)},preventDefaultDropOnElement:function(a){a&&a.on("dragover",f)}};var j=CKEDITOR.plugins.clipboard.isCustomDataTypesSupported?"cke/id":"Text";CKEDITOR.plugins.clipboard.dataTransfer=function(a,b){if(a)this.$=a;this._={metaRegExp:/^<meta.*?>/i,bodyRegExp:/<body(?:[\s\S]*?)>([\s\S]*)<\/body>/i,fragmentRegExp:/<\!--(?:Start|End)Fragment--\>/g,data:{},files:[],normalizeType:function(a){a=a.toLowerCase();return a=="text"||a=="text/plain"?"Text":a=="url"?"URL":
+a}};this.id=this.getData(j);if(!this.id)this.id=j=="Text"?"":"cke-"+CKEDITOR.tools.getUniqueId();if(j!="Text")try{this.$.setData(j,this.id)}catch(c){}if(b){this.sourceEditor=b;this.setData("text/html",b.getSelectedHtml(1));j!="Text"&&!this.getData("text/plain")&&this.setData("text/plain",b.getSelection().getSelectedText())}};CKEDITOR.DATA_TRANSFER_INTERNAL=1;CKEDITOR.DATA_TRANSFER_CROSS_EDITORS=2;CKEDITOR.DATA_TRANSFER_EXTERNAL=3;CKEDITOR.plugins.clipboard.dataTransfer.prototype={getData:function(a){var a=
+this._.normalizeType(a),b=this._.data[a];if(b===void 0||b===null||b==="")try{b=this.$.getData(a)}catch(c){}if(b===void 0||b===null||b==="")b="";if(a=="text/html"){b=b.replace(this._.metaRegExp,"");if((a=this._.bodyRegExp.exec(b))&&a.length){b=a[1];b=b.replace(this._.fragmentRegExp,"")}}else a=="Text"&&(CKEDITOR.env.gecko&&this.getFilesCount()&&b.substring(0,7)=="file://")&&(b="");return b},setData:function(a,b){a=this._.normalizeType(a);this._.data[a]=b;if(CKEDITOR.plugins.clipboard.isCustomDataTypesSupported||
+!(a!="URL"&&a!="Text")){if(j=="Text"&&a=="Text")this.id=b;try{this.$.setData(a,b)}catch(c){}}},getTransferType:function(a){return this.sourceEditor?this.sourceEditor==a?CKEDITOR.DATA_TRANSFER_INTERNAL:CKEDITOR.DATA_TRANSFER_CROSS_EDITORS:CKEDITOR.DATA_TRANSFER_EXTERNAL},cacheData:function(){function a(c){var c=b._.normalizeType(c),d=b.getData(c);d&&(b._.data[c]=d)}if(this.$){var b=this,c,d;if(CKEDITOR.plugins.clipboard.isCustomDataTypesSupported){if(this.$.types)for(c=0;c<this.$.types.length;c++)a(this.$.types[c])}else{a("Text");
+a("URL")}d=this._getImageFromClipboard();if(this.$&&this.$.files||d){this._.files=[];for(c=0;c<this.$.files.length;c++)this._.files.push(this.$.files[c]);this._.files.length===0&&d&&this._.files.push(d)}}},getFilesCount:function(){return this._.files.length?this._.files.length:this.$&&this.$.files&&this.$.files.length?this.$.files.length:this._getImageFromClipboard()?1:0},getFile:function(a){return this._.files.length?this._.files[a]:this.$&&this.$.files&&this.$.files.length?this.$.files[a]:a===0?
+this._getImageFromClipboard():void 0},isEmpty:function(){var a={},b;if(this.getFilesCount())return false;for(b in this._.data)a[b]=1;if(this.$)if(CKEDITOR.plugins.clipboard.isCustomDataTypesSupported){if(this.$.types)for(var c=0;c<this.$.types.length;c++)a[this.$.types[c]]=1}else{a.Text=1;a.URL=1}j!="Text"&&(a[j]=0);for(b in a)if(a[b]&&this.getData(b)!=="")return false;return true},_getImageFromClipboard:function(){var a;if(this.$&&this.$.items&&this.$.items[0])try{if((a=this.$.items[0].getAsFile())&&
+a.type)return a}catch(b){}}}}(),function(){CKEDITOR.plugins.add("panel",{beforeInit:function(a){a.ui.addHandler(CKEDITOR.UI_PANEL,CKEDITOR.ui.panel.handler)}});CKEDITOR.UI_PANEL="panel";CKEDITOR.ui.panel=function(a,b){b&&CKEDITOR.tools.extend(this,b);CKEDITOR.tools.extend(this,{className:"",css:[]});this.id=CKEDITOR.tools.getNextId();this.document=a;this.isFramed=this.forceIFrame||this.css.length;this._={blocks:{}}};CKEDITOR.ui.panel.handler={create:function(a){return new CKEDITOR.ui.panel(a)}};var a=
+CKEDITOR.addTemplate("panel",'<div lang="{langCode}" id="{id}" dir={dir} class="cke cke_reset_all {editorId} cke_panel cke_panel {cls} cke_{dir}" style="z-index:{z-index}" role="presentation">{frame}</div>'),e=CKEDITOR.addTemplate("panel-frame",'<iframe id="{id}" class="cke_panel_frame" role="presentation" frameborder="0" src="{src}"></iframe>'),b=CKEDITOR.addTemplate("panel-frame-inner",'<!DOCTYPE html><html class="cke_panel_container {env}" dir="{dir}" lang="{langCode}"><head>{css}</head><body class="cke_{dir}" style="margin:0;padding:0" onload="{onload}"></body></html>');
+CKEDITOR.ui.panel.prototype={render:function(c,d){this.getHolderElement=function(){var a=this._.holder;if(!a){if(this.isFramed){var a=this.document.getById(this.id+"_frame"),c=a.getParent(),a=a.getFrameDocument();CKEDITOR.env.iOS&&c.setStyles({overflow:"scroll","-webkit-overflow-scrolling":"touch"});c=CKEDITOR.tools.addFunction(CKEDITOR.tools.bind(function(){this.isLoaded=true;if(this.onLoad)this.onLoad()},this));a.write(b.output(CKEDITOR.tools.extend({css:CKEDITOR.tools.buildStyleHtml(this.css),
+onload:"window.parent.CKEDITOR.tools.callFunction("+c+");"},i)));a.getWindow().$.CKEDITOR=CKEDITOR;a.on("keydown",function(a){var b=a.data.getKeystroke(),c=this.document.getById(this.id).getAttribute("dir");this._.onKeyDown&&this._.onKeyDown(b)===false?a.data.preventDefault():(b==27||b==(c=="rtl"?39:37))&&this.onEscape&&this.onEscape(b)===false&&a.data.preventDefault()},this);a=a.getBody();a.unselectable();CKEDITOR.env.air&&CKEDITOR.tools.callFunction(c)}else a=this.document.getById(this.id);this._.holder=
+a}return a};var i={editorId:c.id,id:this.id,langCode:c.langCode,dir:c.lang.dir,cls:this.className,frame:"",env:CKEDITOR.env.cssClass,"z-index":c.config.baseFloatZIndex+1};if(this.isFramed){var h=CKEDITOR.env.air?"javascript:void(0)":CKEDITOR.env.ie?"javascript:void(function(){"+encodeURIComponent("document.open();("+CKEDITOR.tools.fixDomain+")();document.close();")+"}())":"";i.frame=e.output({id:this.id+"_frame",src:h})}h=a.output(i);d&&d.push(h);return h},addBlock:function(a,b){b=this._.blocks[a]=
+b instanceof CKEDITOR.ui.panel.block?b:new CKEDITOR.ui.panel.block(this.getHolderElement(),b);this._.currentBlock||this.showBlock(a);return b},getBlock:function(a){return this._.blocks[a]},showBlock:function(a){var a=this._.blocks[a],b=this._.currentBlock,e=!this.forceIFrame||CKEDITOR.env.ie?this._.holder:this.document.getById(this.id+"_frame");b&&b.hide();this._.currentBlock=a;CKEDITOR.fire("ariaWidget",e);a._.focusIndex=-1;this._.onKeyDown=a.onKeyDown&&CKEDITOR.tools.bind(a.onKeyDown,a);a.show();
+return a},destroy:function(){this.element&&this.element.remove()}};CKEDITOR.ui.panel.block=CKEDITOR.tools.createClass({$:function(a,b){this.element=a.append(a.getDocument().createElement("div",{attributes:{tabindex:-1,"class":"cke_panel_block"},styles:{display:"none"}}));b&&CKEDITOR.tools.extend(this,b);this.element.setAttributes({role:this.attributes.role||"presentation","aria-label":this.attributes["aria-label"],title:this.attributes.title||this.attributes["aria-label"]});this.keys={};this._.focusIndex=
+-1;this.element.disableContextMenu()},_:{markItem:function(a){if(a!=-1){a=this.element.getElementsByTag("a").getItem(this._.focusIndex=a);CKEDITOR.env.webkit&&a.getDocument().getWindow().focus();a.focus();this.onMark&&this.onMark(a)}}},proto:{show:function(){this.element.setStyle("display","")},hide:function(){(!this.onHide||this.onHide.call(this)!==true)&&this.element.setStyle("display","none")},onKeyDown:function(a,b){var e=this.keys[a];switch(e){case "next":for(var h=this._.focusIndex,e=this.element.getElementsByTag("a"),
+f;f=e.getItem(++h);)if(f.getAttribute("_cke_focus")&&f.$.offsetWidth){this._.focusIndex=h;f.focus();break}if(!f&&!b){this._.focusIndex=-1;return this.onKeyDown(a,1)}return false;case "prev":h=this._.focusIndex;for(e=this.element.getElementsByTag("a");h>0&&(f=e.getItem(--h));){if(f.getAttribute("_cke_focus")&&f.$.offsetWidth){this._.focusIndex=h;f.focus();break}f=null}if(!f&&!b){this._.focusIndex=e.count();return this.onKeyDown(a,1)}return false;case "click":case "mouseup":h=this._.focusIndex;(f=h>=
+0&&this.element.getElementsByTag("a").getItem(h))&&(f.$[e]?f.$[e]():f.$["on"+e]());return false}return true}}})}(),CKEDITOR.plugins.add("floatpanel",{requires:"panel"}),function(){function a(a,c,d,i,h){var h=CKEDITOR.tools.genKey(c.getUniqueId(),d.getUniqueId(),a.lang.dir,a.uiColor||"",i.css||"",h||""),f=e[h];if(!f){f=e[h]=new CKEDITOR.ui.panel(c,i);f.element=d.append(CKEDITOR.dom.element.createFromHtml(f.render(a),c));f.element.setStyles({display:"none",position:"absolute"})}return f}var e={};CKEDITOR.ui.floatPanel=
+CKEDITOR.tools.createClass({$:function(b,c,d,e){function h(){g.hide()}d.forceIFrame=1;d.toolbarRelated&&b.elementMode==CKEDITOR.ELEMENT_MODE_INLINE&&(c=CKEDITOR.document.getById("cke_"+b.name));var f=c.getDocument(),e=a(b,f,c,d,e||0),k=e.element,j=k.getFirst(),g=this;k.disableContextMenu();this.element=k;this._={editor:b,panel:e,parentElement:c,definition:d,document:f,iframe:j,children:[],dir:b.lang.dir,showBlockParams:null};b.on("mode",h);b.on("resize",h);f.getWindow().on("resize",function(){this.reposition()},
+this)},proto:{addBlock:function(a,c){return this._.panel.addBlock(a,c)},addListBlock:function(a,c){return this._.panel.addListBlock(a,c)},getBlock:function(a){return this._.panel.getBlock(a)},showBlock:function(a,c,d,e,h,f){var k=this._.panel,j=k.showBlock(a);this._.showBlockParams=[].slice.call(arguments);this.allowBlur(false);var g=this._.editor.editable();this._.returnFocus=g.hasFocus?g:new CKEDITOR.dom.element(CKEDITOR.document.$.activeElement);this._.hideTimeout=0;var n=this.element,g=this._.iframe,
+g=CKEDITOR.env.ie&&!CKEDITOR.env.edge?g:new CKEDITOR.dom.window(g.$.contentWindow),q=n.getDocument(),l=this._.parentElement.getPositionedAncestor(),o=c.getDocumentPosition(q),q=l?l.getDocumentPosition(q):{x:0,y:0},r=this._.dir=="rtl",m=o.x+(e||0)-q.x,p=o.y+(h||0)-q.y;if(r&&(d==1||d==4))m=m+c.$.offsetWidth;else if(!r&&(d==2||d==3))m=m+(c.$.offsetWidth-1);if(d==3||d==4)p=p+(c.$.offsetHeight-1);this._.panel._.offsetParentId=c.getId();n.setStyles({top:p+"px",left:0,display:""});n.setOpacity(0);n.getFirst().removeStyle("width");
+this._.editor.focusManager.add(g);if(!this._.blurSet){CKEDITOR.event.useCapture=true;g.on("blur",function(a){function b(){delete this._.returnFocus;this.hide()}if(this.allowBlur()&&a.data.getPhase()==CKEDITOR.EVENT_PHASE_AT_TARGET&&this.visible&&!this._.activeChild)if(CKEDITOR.env.iOS){if(!this._.hideTimeout)this._.hideTimeout=CKEDITOR.tools.setTimeout(b,0,this)}else b.call(this)},this);g.on("focus",function(){this._.focused=true;this.hideChild();this.allowBlur(true)},this);if(CKEDITOR.env.iOS){g.on("touchstart",
+function(){clearTimeout(this._.hideTimeout)},this);g.on("touchend",function(){this._.hideTimeout=0;this.focus()},this)}CKEDITOR.event.useCapture=false;this._.blurSet=1}k.onEscape=CKEDITOR.tools.bind(function(a){if(this.onEscape&&this.onEscape(a)===false)return false},this);CKEDITOR.tools.setTimeout(function(){var a=CKEDITOR.tools.bind(function(){var a=n;a.removeStyle("width");if(j.autoSize){var b=j.element.getDocument(),b=(CKEDITOR.env.webkit?j.element:b.getBody()).$.scrollWidth;CKEDITOR.env.ie&&
+(CKEDITOR.env.quirks&&b>0)&&(b=b+((a.$.offsetWidth||0)-(a.$.clientWidth||0)+3));a.setStyle("width",b+10+"px");b=j.element.$.scrollHeight;CKEDITOR.env.ie&&(CKEDITOR.env.quirks&&b>0)&&(b=b+((a.$.offsetHeight||0)-(a.$.clientHeight||0)+3));a.setStyle("height",b+"px");k._.currentBlock.element.setStyle("display","none").removeStyle("display")}else a.removeStyle("height");r&&(m=m-n.$.offsetWidth);n.setStyle("left",m+"px");var b=k.element.getWindow(),a=n.$.getBoundingClientRect(),b=b.getViewPaneSize(),c=
+a.width||a.right-a.left,d=a.height||a.bottom-a.top,e=r?a.right:b.width-a.left,g=r?b.width-a.right:a.left;r?e<c&&(m=g>c?m+c:b.width>c?m-a.left:m-a.right+b.width):e<c&&(m=g>c?m-c:b.width>c?m-a.right+b.width:m-a.left);c=a.top;b.height-a.top<d&&(p=c>d?p-d:b.height>d?p-a.bottom+b.height:p-a.top);if(CKEDITOR.env.ie){b=a=new CKEDITOR.dom.element(n.$.offsetParent);b.getName()=="html"&&(b=b.getDocument().getBody());b.getComputedStyle("direction")=="rtl"&&(m=CKEDITOR.env.ie8Compat?m-n.getDocument().getDocumentElement().$.scrollLeft*
+2:m-(a.$.scrollWidth-a.$.clientWidth))}var a=n.getFirst(),i;(i=a.getCustomData("activePanel"))&&i.onHide&&i.onHide.call(this,1);a.setCustomData("activePanel",this);n.setStyles({top:p+"px",left:m+"px"});n.setOpacity(1);f&&f()},this);k.isLoaded?a():k.onLoad=a;CKEDITOR.tools.setTimeout(function(){var a=CKEDITOR.env.webkit&&CKEDITOR.document.getWindow().getScrollPosition().y;this.focus();j.element.focus();if(CKEDITOR.env.webkit)CKEDITOR.document.getBody().$.scrollTop=a;this.allowBlur(true);this._.editor.fire("panelShow",
+this)},0,this)},CKEDITOR.env.air?200:0,this);this.visible=1;this.onShow&&this.onShow.call(this)},reposition:function(){var a=this._.showBlockParams;if(this.visible&&this._.showBlockParams){this.hide();this.showBlock.apply(this,a)}},focus:function(){if(CKEDITOR.env.webkit){var a=CKEDITOR.document.getActive();a&&!a.equals(this._.iframe)&&a.$.blur()}(this._.lastFocused||this._.iframe.getFrameDocument().getWindow()).focus()},blur:function(){var a=this._.iframe.getFrameDocument().getActive();a&&a.is("a")&&
+(this._.lastFocused=a)},hide:function(a){if(this.visible&&(!this.onHide||this.onHide.call(this)!==true)){this.hideChild();CKEDITOR.env.gecko&&this._.iframe.getFrameDocument().$.activeElement.blur();this.element.setStyle("display","none");this.visible=0;this.element.getFirst().removeCustomData("activePanel");if(a=a&&this._.returnFocus){CKEDITOR.env.webkit&&a.type&&a.getWindow().$.focus();a.focus()}delete this._.lastFocused;this._.showBlockParams=null;this._.editor.fire("panelHide",this)}},allowBlur:function(a){var c=
+this._.panel;if(a!==void 0)c.allowBlur=a;return c.allowBlur},showAsChild:function(a,c,d,e,h,f){if(!(this._.activeChild==a&&a._.panel._.offsetParentId==d.getId())){this.hideChild();a.onHide=CKEDITOR.tools.bind(function(){CKEDITOR.tools.setTimeout(function(){this._.focused||this.hide()},0,this)},this);this._.activeChild=a;this._.focused=false;a.showBlock(c,d,e,h,f);this.blur();(CKEDITOR.env.ie7Compat||CKEDITOR.env.ie6Compat)&&setTimeout(function(){a.element.getChild(0).$.style.cssText+=""},100)}},hideChild:function(a){var c=
+this._.activeChild;if(c){delete c.onHide;delete this._.activeChild;c.hide();a&&this.focus()}}}});CKEDITOR.on("instanceDestroyed",function(){var a=CKEDITOR.tools.isEmpty(CKEDITOR.instances),c;for(c in e){var d=e[c];a?d.destroy():d.element.hide()}a&&(e={})})}(),CKEDITOR.plugins.add("menu",{requires:"floatpanel",beforeInit:function(a){for(var e=a.config.menu_groups.split(","),b=a._.menuGroups={},c=a._.menuItems={},d=0;d<e.length;d++)b[e[d]]=d+1;a.addMenuGroup=function(a,c){b[a]=c||100};a.addMenuItem=
+function(a,d){b[d.group]&&(c[a]=new CKEDITOR.menuItem(this,a,d))};a.addMenuItems=function(a){for(var b in a)this.addMenuItem(b,a[b])};a.getMenuItem=function(a){return c[a]};a.removeMenuItem=function(a){delete c[a]}}}),function(){function a(a){a.sort(function(a,b){return a.group<b.group?-1:a.group>b.group?1:a.order<b.order?-1:a.order>b.order?1:0})}var e='<span class="cke_menuitem"><a id="{id}" class="cke_menubutton cke_menubutton__{name} cke_menubutton_{state} {cls}" href="{href}" title="{title}" tabindex="-1"_cke_focus=1 hidefocus="true" role="{role}" aria-haspopup="{hasPopup}" aria-disabled="{disabled}" {ariaChecked}';
+CKEDITOR.env.gecko&&CKEDITOR.env.mac&&(e=e+' onkeypress="return false;"');CKEDITOR.env.gecko&&(e=e+' onblur="this.style.cssText = this.style.cssText;"');var e=e+(' onmouseover="CKEDITOR.tools.callFunction({hoverFn},{index});" onmouseout="CKEDITOR.tools.callFunction({moveOutFn},{index});" '+(CKEDITOR.env.ie?'onclick="return false;" onmouseup':"onclick")+'="CKEDITOR.tools.callFunction({clickFn},{index}); return false;">'),b=CKEDITOR.addTemplate("menuItem",e+'<span class="cke_menubutton_inner"><span class="cke_menubutton_icon"><span class="cke_button_icon cke_button__{iconName}_icon" style="{iconStyle}"></span></span><span class="cke_menubutton_label">{label}</span>{arrowHtml}</span></a></span>'),
+c=CKEDITOR.addTemplate("menuArrow",'<span class="cke_menuarrow"><span>{label}</span></span>');CKEDITOR.menu=CKEDITOR.tools.createClass({$:function(a,b){b=this._.definition=b||{};this.id=CKEDITOR.tools.getNextId();this.editor=a;this.items=[];this._.listeners=[];this._.level=b.level||1;var c=CKEDITOR.tools.extend({},b.panel,{css:[CKEDITOR.skin.getPath("editor")],level:this._.level-1,block:{}}),f=c.block.attributes=c.attributes||{};!f.role&&(f.role="menu");this._.panelDefinition=c},_:{onShow:function(){var a=
+this.editor.getSelection(),b=a&&a.getStartElement(),c=this.editor.elementPath(),f=this._.listeners;this.removeAll();for(var e=0;e<f.length;e++){var j=f[e](b,a,c);if(j)for(var g in j){var n=this.editor.getMenuItem(g);if(n&&(!n.command||this.editor.getCommand(n.command).state)){n.state=j[g];this.add(n)}}}},onClick:function(a){this.hide();if(a.onClick)a.onClick();else a.command&&this.editor.execCommand(a.command)},onEscape:function(a){var b=this.parent;b?b._.panel.hideChild(1):a==27&&this.hide(1);return false},
+onHide:function(){this.onHide&&this.onHide()},showSubMenu:function(a){var b=this._.subMenu,c=this.items[a];if(c=c.getItems&&c.getItems()){if(b)b.removeAll();else{b=this._.subMenu=new CKEDITOR.menu(this.editor,CKEDITOR.tools.extend({},this._.definition,{level:this._.level+1},true));b.parent=this;b._.onClick=CKEDITOR.tools.bind(this._.onClick,this)}for(var f in c){var e=this.editor.getMenuItem(f);if(e){e.state=c[f];b.add(e)}}var j=this._.panel.getBlock(this.id).element.getDocument().getById(this.id+
+(""+a));setTimeout(function(){b.show(j,2)},0)}else this._.panel.hideChild(1)}},proto:{add:function(a){if(!a.order)a.order=this.items.length;this.items.push(a)},removeAll:function(){this.items=[]},show:function(b,c,e,f){if(!this.parent){this._.onShow();if(!this.items.length)return}var c=c||(this.editor.lang.dir=="rtl"?2:1),k=this.items,j=this.editor,g=this._.panel,n=this._.element;if(!g){g=this._.panel=new CKEDITOR.ui.floatPanel(this.editor,CKEDITOR.document.getBody(),this._.panelDefinition,this._.level);
+g.onEscape=CKEDITOR.tools.bind(function(a){if(this._.onEscape(a)===false)return false},this);g.onShow=function(){g._.panel.getHolderElement().getParent().addClass("cke").addClass("cke_reset_all")};g.onHide=CKEDITOR.tools.bind(function(){this._.onHide&&this._.onHide()},this);n=g.addBlock(this.id,this._.panelDefinition.block);n.autoSize=true;var q=n.keys;q[40]="next";q[9]="next";q[38]="prev";q[CKEDITOR.SHIFT+9]="prev";q[j.lang.dir=="rtl"?37:39]=CKEDITOR.env.ie?"mouseup":"click";q[32]=CKEDITOR.env.ie?
+"mouseup":"click";CKEDITOR.env.ie&&(q[13]="mouseup");n=this._.element=n.element;q=n.getDocument();q.getBody().setStyle("overflow","hidden");q.getElementsByTag("html").getItem(0).setStyle("overflow","hidden");this._.itemOverFn=CKEDITOR.tools.addFunction(function(a){clearTimeout(this._.showSubTimeout);this._.showSubTimeout=CKEDITOR.tools.setTimeout(this._.showSubMenu,j.config.menu_subMenuDelay||400,this,[a])},this);this._.itemOutFn=CKEDITOR.tools.addFunction(function(){clearTimeout(this._.showSubTimeout)},
+this);this._.itemClickFn=CKEDITOR.tools.addFunction(function(a){var b=this.items[a];if(b.state==CKEDITOR.TRISTATE_DISABLED)this.hide(1);else if(b.getItems)this._.showSubMenu(a);else this._.onClick(b)},this)}a(k);for(var q=j.elementPath(),q=['<div class="cke_menu'+(q&&q.direction()!=j.lang.dir?" cke_mixed_dir_content":"")+'" role="presentation">'],l=k.length,o=l&&k[0].group,r=0;r<l;r++){var m=k[r];if(o!=m.group){q.push('<div class="cke_menuseparator" role="separator"></div>');o=m.group}m.render(this,
+r,q)}q.push("</div>");n.setHtml(q.join(""));CKEDITOR.ui.fire("ready",this);this.parent?this.parent._.panel.showAsChild(g,this.id,b,c,e,f):g.showBlock(this.id,b,c,e,f);j.fire("menuShow",[g])},addListener:function(a){this._.listeners.push(a)},hide:function(a){this._.onHide&&this._.onHide();this._.panel&&this._.panel.hide(a)}}});CKEDITOR.menuItem=CKEDITOR.tools.createClass({$:function(a,b,c){CKEDITOR.tools.extend(this,c,{order:0,className:"cke_menubutton__"+b});this.group=a._.menuGroups[this.group];
+this.editor=a;this.name=b},proto:{render:function(a,e,h){var f=a.id+(""+e),k=typeof this.state=="undefined"?CKEDITOR.TRISTATE_OFF:this.state,j="",g=k==CKEDITOR.TRISTATE_ON?"on":k==CKEDITOR.TRISTATE_DISABLED?"disabled":"off";this.role in{menuitemcheckbox:1,menuitemradio:1}&&(j=' aria-checked="'+(k==CKEDITOR.TRISTATE_ON?"true":"false")+'"');var n=this.getItems,q="&#"+(this.editor.lang.dir=="rtl"?"9668":"9658")+";",l=this.name;if(this.icon&&!/\./.test(this.icon))l=this.icon;a={id:f,name:this.name,iconName:l,
+label:this.label,cls:this.className||"",state:g,hasPopup:n?"true":"false",disabled:k==CKEDITOR.TRISTATE_DISABLED,title:this.label,href:"javascript:void('"+(this.label||"").replace("'")+"')",hoverFn:a._.itemOverFn,moveOutFn:a._.itemOutFn,clickFn:a._.itemClickFn,index:e,iconStyle:CKEDITOR.skin.getIconStyle(l,this.editor.lang.dir=="rtl",l==this.icon?null:this.icon,this.iconOffset),arrowHtml:n?c.output({label:q}):"",role:this.role?this.role:"menuitem",ariaChecked:j};b.output(a,h)}}})}(),CKEDITOR.config.menu_groups=
+"clipboard,form,tablecell,tablecellproperties,tablerow,tablecolumn,table,anchor,link,image,flash,checkbox,radio,textfield,hiddenfield,imagebutton,button,select,textarea,div",CKEDITOR.plugins.add("contextmenu",{requires:"menu",onLoad:function(){CKEDITOR.plugins.contextMenu=CKEDITOR.tools.createClass({base:CKEDITOR.menu,$:function(a){this.base.call(this,a,{panel:{className:"cke_menu_panel",attributes:{"aria-label":a.lang.contextmenu.options}}})},proto:{addTarget:function(a,e){a.on("contextmenu",function(a){var a=
+a.data,c=CKEDITOR.env.webkit?b:CKEDITOR.env.mac?a.$.metaKey:a.$.ctrlKey;if(!e||!c){a.preventDefault();if(CKEDITOR.env.mac&&CKEDITOR.env.webkit){var c=this.editor,h=(new CKEDITOR.dom.elementPath(a.getTarget(),c.editable())).contains(function(a){return a.hasAttribute("contenteditable")},true);h&&h.getAttribute("contenteditable")=="false"&&c.getSelection().fake(h)}var h=a.getTarget().getDocument(),f=a.getTarget().getDocument().getDocumentElement(),c=!h.equals(CKEDITOR.document),h=h.getWindow().getScrollPosition(),
+k=c?a.$.clientX:a.$.pageX||h.x+a.$.clientX,j=c?a.$.clientY:a.$.pageY||h.y+a.$.clientY;CKEDITOR.tools.setTimeout(function(){this.open(f,null,k,j)},CKEDITOR.env.ie?200:0,this)}},this);if(CKEDITOR.env.webkit){var b,c=function(){b=0};a.on("keydown",function(a){b=CKEDITOR.env.mac?a.data.$.metaKey:a.data.$.ctrlKey});a.on("keyup",c);a.on("contextmenu",c)}},open:function(a,e,b,c){this.editor.focus();a=a||CKEDITOR.document.getDocumentElement();this.editor.selectionChange(1);this.show(a,e,b,c)}}})},beforeInit:function(a){var e=
+a.contextMenu=new CKEDITOR.plugins.contextMenu(a);a.on("contentDom",function(){e.addTarget(a.editable(),a.config.browserContextMenuOnCtrl!==false)});a.addCommand("contextMenu",{exec:function(){a.contextMenu.open(a.document.getBody())}});a.setKeystroke(CKEDITOR.SHIFT+121,"contextMenu");a.setKeystroke(CKEDITOR.CTRL+CKEDITOR.SHIFT+121,"contextMenu")}}),function(){function a(a){var b=this.att,a=a&&a.hasAttribute(b)&&a.getAttribute(b)||"";a!==void 0&&this.setValue(a)}function e(){for(var a,b=0;b<arguments.length;b++)if(arguments[b]instanceof
+CKEDITOR.dom.element){a=arguments[b];break}if(a){var b=this.att,e=this.getValue();e?a.setAttribute(b,e):a.removeAttribute(b,e)}}var b={id:1,dir:1,classes:1,styles:1};CKEDITOR.plugins.add("dialogadvtab",{requires:"dialog",allowedContent:function(a){a||(a=b);var d=[];a.id&&d.push("id");a.dir&&d.push("dir");var e="";d.length&&(e=e+("["+d.join(",")+"]"));a.classes&&(e=e+"(*)");a.styles&&(e=e+"{*}");return e},createAdvancedTab:function(c,d,i){d||(d=b);var h=c.lang.common,f={id:"advanced",label:h.advancedTab,
+title:h.advancedTab,elements:[{type:"vbox",padding:1,children:[]}]},k=[];if(d.id||d.dir){d.id&&k.push({id:"advId",att:"id",type:"text",requiredContent:i?i+"[id]":null,label:h.id,setup:a,commit:e});d.dir&&k.push({id:"advLangDir",att:"dir",type:"select",requiredContent:i?i+"[dir]":null,label:h.langDir,"default":"",style:"width:100%",items:[[h.notSet,""],[h.langDirLTR,"ltr"],[h.langDirRTL,"rtl"]],setup:a,commit:e});f.elements[0].children.push({type:"hbox",widths:["50%","50%"],children:[].concat(k)})}if(d.styles||
+d.classes){k=[];d.styles&&k.push({id:"advStyles",att:"style",type:"text",requiredContent:i?i+"{cke-xyz}":null,label:h.styles,"default":"",validate:CKEDITOR.dialog.validate.inlineStyle(h.invalidInlineStyle),onChange:function(){},getStyle:function(a,b){var c=this.getValue().match(RegExp("(?:^|;)\\s*"+a+"\\s*:\\s*([^;]*)","i"));return c?c[1]:b},updateStyle:function(a,b){var d=this.getValue(),f=c.document.createElement("span");f.setAttribute("style",d);f.setStyle(a,b);d=CKEDITOR.tools.normalizeCssText(f.getAttribute("style"));
+this.setValue(d,1)},setup:a,commit:e});d.classes&&k.push({type:"hbox",widths:["45%","55%"],children:[{id:"advCSSClasses",att:"class",type:"text",requiredContent:i?i+"(cke-xyz)":null,label:h.cssClasses,"default":"",setup:a,commit:e}]});f.elements[0].children.push({type:"hbox",widths:["50%","50%"],children:[].concat(k)})}return f}})}(),function(){var a;function e(c,e){function f(a){a=n.list[a];if(a.equals(c.editable())||a.getAttribute("contenteditable")=="true"){var b=c.createRange();b.selectNodeContents(a);
+b.select()}else c.getSelection().selectElement(a);c.focus()}function k(){g&&g.setHtml(b);delete n.list}var j=c.ui.spaceId("path"),g,n=c._.elementsPath,q=n.idBase;e.html=e.html+('<span id="'+j+'_label" class="cke_voice_label">'+c.lang.elementspath.eleLabel+'</span><span id="'+j+'" class="cke_path" role="group" aria-labelledby="'+j+'_label">'+b+"</span>");c.on("uiReady",function(){var a=c.ui.space("path");a&&c.focusManager.add(a,1)});n.onClick=f;var l=CKEDITOR.tools.addFunction(f),o=CKEDITOR.tools.addFunction(function(a,
+b){var d=n.idBase,e,b=new CKEDITOR.dom.event(b);e=c.lang.dir=="rtl";switch(b.getKeystroke()){case e?39:37:case 9:(e=CKEDITOR.document.getById(d+(a+1)))||(e=CKEDITOR.document.getById(d+"0"));e.focus();return false;case e?37:39:case CKEDITOR.SHIFT+9:(e=CKEDITOR.document.getById(d+(a-1)))||(e=CKEDITOR.document.getById(d+(n.list.length-1)));e.focus();return false;case 27:c.focus();return false;case 13:case 32:f(a);return false}return true});c.on("selectionChange",function(){for(var a=[],f=n.list=[],e=
+[],h=n.filters,k=true,u=c.elementPath().elements,x,v=u.length;v--;){var s=u[v],y=0;x=s.data("cke-display-name")?s.data("cke-display-name"):s.data("cke-real-element-type")?s.data("cke-real-element-type"):s.getName();k=s.hasAttribute("contenteditable")?s.getAttribute("contenteditable")=="true":k;!k&&!s.hasAttribute("contenteditable")&&(y=1);for(var z=0;z<h.length;z++){var B=h[z](s,x);if(B===false){y=1;break}x=B||x}if(!y){f.unshift(s);e.unshift(x)}}f=f.length;for(h=0;h<f;h++){x=e[h];k=c.lang.elementspath.eleTitle.replace(/%1/,
+x);x=d.output({id:q+h,label:k,text:x,jsTitle:"javascript:void('"+x+"')",index:h,keyDownFn:o,clickFn:l});a.unshift(x)}g||(g=CKEDITOR.document.getById(j));e=g;e.setHtml(a.join("")+b);c.fire("elementsPathUpdate",{space:e})});c.on("readOnly",k);c.on("contentDomUnload",k);c.addCommand("elementsPathFocus",a);c.setKeystroke(CKEDITOR.ALT+122,"elementsPathFocus")}a={editorFocus:false,readOnly:1,exec:function(a){(a=CKEDITOR.document.getById(a._.elementsPath.idBase+"0"))&&a.focus(CKEDITOR.env.ie||CKEDITOR.env.air)}};
+var b='<span class="cke_path_empty">&nbsp;</span>',c="";CKEDITOR.env.gecko&&CKEDITOR.env.mac&&(c=c+' onkeypress="return false;"');CKEDITOR.env.gecko&&(c=c+' onblur="this.style.cssText = this.style.cssText;"');var d=CKEDITOR.addTemplate("pathItem",'<a id="{id}" href="{jsTitle}" tabindex="-1" class="cke_path_item" title="{label}"'+c+' hidefocus="true"  onkeydown="return CKEDITOR.tools.callFunction({keyDownFn},{index}, event );" onclick="CKEDITOR.tools.callFunction({clickFn},{index}); return false;" role="button" aria-label="{label}">{text}</a>');
+CKEDITOR.plugins.add("elementspath",{init:function(a){a._.elementsPath={idBase:"cke_elementspath_"+CKEDITOR.tools.getNextNumber()+"_",filters:[]};a.on("uiSpace",function(b){b.data.space=="bottom"&&e(a,b.data)})}})}(),function(){function a(a,b,c){c=a.config.forceEnterMode||c;if(a.mode=="wysiwyg"){if(!b)b=a.activeEnterMode;if(!a.elementPath().isContextFor("p")){b=CKEDITOR.ENTER_BR;c=1}a.fire("saveSnapshot");b==CKEDITOR.ENTER_BR?h(a,b,null,c):f(a,b,null,c);a.fire("saveSnapshot")}}function e(a){for(var a=
+a.getSelection().getRanges(true),b=a.length-1;b>0;b--)a[b].deleteContents();return a[0]}function b(a){var b=a.startContainer.getAscendant(function(a){return a.type==CKEDITOR.NODE_ELEMENT&&a.getAttribute("contenteditable")=="true"},true);if(a.root.equals(b))return a;b=new CKEDITOR.dom.range(b);b.moveToRange(a);return b}CKEDITOR.plugins.add("enterkey",{init:function(b){b.addCommand("enter",{modes:{wysiwyg:1},editorFocus:false,exec:function(b){a(b)}});b.addCommand("shiftEnter",{modes:{wysiwyg:1},editorFocus:false,
+exec:function(b){a(b,b.activeShiftEnterMode,1)}});b.setKeystroke([[13,"enter"],[CKEDITOR.SHIFT+13,"shiftEnter"]])}});var c=CKEDITOR.dom.walker.whitespaces(),d=CKEDITOR.dom.walker.bookmark();CKEDITOR.plugins.enterkey={enterBlock:function(a,f,i,q){if(i=i||e(a)){var i=b(i),l=i.document,o=i.checkStartOfBlock(),r=i.checkEndOfBlock(),m=a.elementPath(i.startContainer),p=m.block,t=f==CKEDITOR.ENTER_DIV?"div":"p",w;if(o&&r){if(p&&(p.is("li")||p.getParent().is("li"))){p.is("li")||(p=p.getParent());i=p.getParent();
+w=i.getParent();var q=!p.hasPrevious(),u=!p.hasNext(),t=a.getSelection(),x=t.createBookmarks(),o=p.getDirection(1),r=p.getAttribute("class"),v=p.getAttribute("style"),s=w.getDirection(1)!=o,a=a.enterMode!=CKEDITOR.ENTER_BR||s||v||r;if(w.is("li"))if(q||u){q&&u&&i.remove();p[u?"insertAfter":"insertBefore"](w)}else p.breakParent(w);else{if(a){if(m.block.is("li")){w=l.createElement(f==CKEDITOR.ENTER_P?"p":"div");s&&w.setAttribute("dir",o);v&&w.setAttribute("style",v);r&&w.setAttribute("class",r);p.moveChildren(w)}else w=
+m.block;if(q||u)w[q?"insertBefore":"insertAfter"](i);else{p.breakParent(i);w.insertAfter(i)}}else{p.appendBogus(true);if(q||u)for(;l=p[q?"getFirst":"getLast"]();)l[q?"insertBefore":"insertAfter"](i);else for(p.breakParent(i);l=p.getLast();)l.insertAfter(i)}p.remove()}t.selectBookmarks(x);return}if(p&&p.getParent().is("blockquote")){p.breakParent(p.getParent());p.getPrevious().getFirst(CKEDITOR.dom.walker.invisible(1))||p.getPrevious().remove();p.getNext().getFirst(CKEDITOR.dom.walker.invisible(1))||
+p.getNext().remove();i.moveToElementEditStart(p);i.select();return}}else if(p&&p.is("pre")&&!r){h(a,f,i,q);return}if(o=i.splitBlock(t)){f=o.previousBlock;p=o.nextBlock;m=o.wasStartOfBlock;a=o.wasEndOfBlock;if(p){x=p.getParent();if(x.is("li")){p.breakParent(x);p.move(p.getNext(),1)}}else if(f&&(x=f.getParent())&&x.is("li")){f.breakParent(x);x=f.getNext();i.moveToElementEditStart(x);f.move(f.getPrevious())}if(!m&&!a){if(p.is("li")){w=i.clone();w.selectNodeContents(p);w=new CKEDITOR.dom.walker(w);w.evaluator=
+function(a){return!(d(a)||c(a)||a.type==CKEDITOR.NODE_ELEMENT&&a.getName()in CKEDITOR.dtd.$inline&&!(a.getName()in CKEDITOR.dtd.$empty))};(x=w.next())&&(x.type==CKEDITOR.NODE_ELEMENT&&x.is("ul","ol"))&&(CKEDITOR.env.needsBrFiller?l.createElement("br"):l.createText(" ")).insertBefore(x)}p&&i.moveToElementEditStart(p)}else{if(f){if(f.is("li")||!k.test(f.getName())&&!f.is("pre"))w=f.clone()}else p&&(w=p.clone());if(w)q&&!w.is("li")&&w.renameNode(t);else if(x&&x.is("li"))w=x;else{w=l.createElement(t);
+f&&(u=f.getDirection())&&w.setAttribute("dir",u)}if(l=o.elementPath){q=0;for(t=l.elements.length;q<t;q++){x=l.elements[q];if(x.equals(l.block)||x.equals(l.blockLimit))break;if(CKEDITOR.dtd.$removeEmpty[x.getName()]){x=x.clone();w.moveChildren(x);w.append(x)}}}w.appendBogus();w.getParent()||i.insertNode(w);w.is("li")&&w.removeAttribute("value");if(CKEDITOR.env.ie&&m&&(!a||!f.getChildCount())){i.moveToElementEditStart(a?f:w);i.select()}i.moveToElementEditStart(m&&!a?p:w)}i.select();i.scrollIntoView()}}},
+enterBr:function(a,b,c,d){if(c=c||e(a)){var h=c.document,i=c.checkEndOfBlock(),r=new CKEDITOR.dom.elementPath(a.getSelection().getStartElement()),m=r.block,p=m&&r.block.getName();if(!d&&p=="li")f(a,b,c,d);else{if(!d&&i&&k.test(p))if(i=m.getDirection()){h=h.createElement("div");h.setAttribute("dir",i);h.insertAfter(m);c.setStart(h,0)}else{h.createElement("br").insertAfter(m);CKEDITOR.env.gecko&&h.createText("").insertAfter(m);c.setStartAt(m.getNext(),CKEDITOR.env.ie?CKEDITOR.POSITION_BEFORE_START:
+CKEDITOR.POSITION_AFTER_START)}else{a=p=="pre"&&CKEDITOR.env.ie&&CKEDITOR.env.version<8?h.createText("\r"):h.createElement("br");c.deleteContents();c.insertNode(a);if(CKEDITOR.env.needsBrFiller){h.createText("﻿").insertAfter(a);i&&(m||r.blockLimit).appendBogus();a.getNext().$.nodeValue="";c.setStartAt(a.getNext(),CKEDITOR.POSITION_AFTER_START)}else c.setStartAt(a,CKEDITOR.POSITION_AFTER_END)}c.collapse(true);c.select();c.scrollIntoView()}}}};var i=CKEDITOR.plugins.enterkey,h=i.enterBr,f=i.enterBlock,
+k=/^h[1-6]$/}(),function(){function a(a,b){var c={},d=[],i={nbsp:" ",shy:"­",gt:">",lt:"<",amp:"&",apos:"'",quot:'"'},a=a.replace(/\b(nbsp|shy|gt|lt|amp|apos|quot)(?:,|$)/g,function(a,f){var e=b?"&"+f+";":i[f];c[e]=b?i[f]:"&"+f+";";d.push(e);return""});if(!b&&a){var a=a.split(","),h=document.createElement("div"),f;h.innerHTML="&"+a.join(";&")+";";f=h.innerHTML;h=null;for(h=0;h<f.length;h++){var k=f.charAt(h);c[k]="&"+a[h]+";";d.push(k)}}c.regex=d.join(b?"|":"");return c}CKEDITOR.plugins.add("entities",
+{afterInit:function(e){function b(a){return k[a]}function c(a){return d.entities_processNumerical=="force"||!h[a]?"&#"+a.charCodeAt(0)+";":h[a]}var d=e.config;if(e=(e=e.dataProcessor)&&e.htmlFilter){var i=[];d.basicEntities!==false&&i.push("nbsp,gt,lt,amp");if(d.entities){i.length&&i.push("quot,iexcl,cent,pound,curren,yen,brvbar,sect,uml,copy,ordf,laquo,not,shy,reg,macr,deg,plusmn,sup2,sup3,acute,micro,para,middot,cedil,sup1,ordm,raquo,frac14,frac12,frac34,iquest,times,divide,fnof,bull,hellip,prime,Prime,oline,frasl,weierp,image,real,trade,alefsym,larr,uarr,rarr,darr,harr,crarr,lArr,uArr,rArr,dArr,hArr,forall,part,exist,empty,nabla,isin,notin,ni,prod,sum,minus,lowast,radic,prop,infin,ang,and,or,cap,cup,int,there4,sim,cong,asymp,ne,equiv,le,ge,sub,sup,nsub,sube,supe,oplus,otimes,perp,sdot,lceil,rceil,lfloor,rfloor,lang,rang,loz,spades,clubs,hearts,diams,circ,tilde,ensp,emsp,thinsp,zwnj,zwj,lrm,rlm,ndash,mdash,lsquo,rsquo,sbquo,ldquo,rdquo,bdquo,dagger,Dagger,permil,lsaquo,rsaquo,euro");
+d.entities_latin&&i.push("Agrave,Aacute,Acirc,Atilde,Auml,Aring,AElig,Ccedil,Egrave,Eacute,Ecirc,Euml,Igrave,Iacute,Icirc,Iuml,ETH,Ntilde,Ograve,Oacute,Ocirc,Otilde,Ouml,Oslash,Ugrave,Uacute,Ucirc,Uuml,Yacute,THORN,szlig,agrave,aacute,acirc,atilde,auml,aring,aelig,ccedil,egrave,eacute,ecirc,euml,igrave,iacute,icirc,iuml,eth,ntilde,ograve,oacute,ocirc,otilde,ouml,oslash,ugrave,uacute,ucirc,uuml,yacute,thorn,yuml,OElig,oelig,Scaron,scaron,Yuml");d.entities_greek&&i.push("Alpha,Beta,Gamma,Delta,Epsilon,Zeta,Eta,Theta,Iota,Kappa,Lambda,Mu,Nu,Xi,Omicron,Pi,Rho,Sigma,Tau,Upsilon,Phi,Chi,Psi,Omega,alpha,beta,gamma,delta,epsilon,zeta,eta,theta,iota,kappa,lambda,mu,nu,xi,omicron,pi,rho,sigmaf,sigma,tau,upsilon,phi,chi,psi,omega,thetasym,upsih,piv");
+d.entities_additional&&i.push(d.entities_additional)}var h=a(i.join(",")),f=h.regex?"["+h.regex+"]":"a^";delete h.regex;d.entities&&d.entities_processNumerical&&(f="[^ -~]|"+f);var f=RegExp(f,"g"),k=a("nbsp,gt,lt,amp,shy",true),j=RegExp(k.regex,"g");e.addRules({text:function(a){return a.replace(j,b).replace(f,c)}},{applyToAll:true,excludeNestedEditable:true})}}})}(),CKEDITOR.config.basicEntities=!0,CKEDITOR.config.entities=!0,CKEDITOR.config.entities_latin=!0,CKEDITOR.config.entities_greek=!0,CKEDITOR.config.entities_additional=
+"#39",CKEDITOR.plugins.add("find",{requires:"dialog",init:function(a){var e=a.addCommand("find",new CKEDITOR.dialogCommand("find"));e.canUndo=false;e.readOnly=1;a.addCommand("replace",new CKEDITOR.dialogCommand("replace")).canUndo=false;if(a.ui.addButton){a.ui.addButton("Find",{label:a.lang.find.find,command:"find",toolbar:"find,10"});a.ui.addButton("Replace",{label:a.lang.find.replace,command:"replace",toolbar:"find,20"})}CKEDITOR.dialog.add("find",this.path+"dialogs/find.js");CKEDITOR.dialog.add("replace",
+this.path+"dialogs/find.js")}}),CKEDITOR.config.find_highlight={element:"span",styles:{"background-color":"#004",color:"#fff"}},CKEDITOR.plugins.add("htmlwriter",{init:function(a){var e=new CKEDITOR.htmlWriter;e.forceSimpleAmpersand=a.config.forceSimpleAmpersand;e.indentationChars=a.config.dataIndentationChars||"\t";a.dataProcessor.writer=e}}),CKEDITOR.htmlWriter=CKEDITOR.tools.createClass({base:CKEDITOR.htmlParser.basicWriter,$:function(){this.base();this.indentationChars="\t";this.selfClosingEnd=
+" />";this.lineBreakChars="\n";this.sortAttributes=1;this._.indent=0;this._.indentation="";this._.inPre=0;this._.rules={};var a=CKEDITOR.dtd,e;for(e in CKEDITOR.tools.extend({},a.$nonBodyContent,a.$block,a.$listItem,a.$tableContent))this.setRules(e,{indent:!a[e]["#"],breakBeforeOpen:1,breakBeforeClose:!a[e]["#"],breakAfterClose:1,needsSpace:e in a.$block&&!(e in{li:1,dt:1,dd:1})});this.setRules("br",{breakAfterOpen:1});this.setRules("title",{indent:0,breakAfterOpen:0});this.setRules("style",{indent:0,
+breakBeforeClose:1});this.setRules("pre",{breakAfterOpen:1,indent:0})},proto:{openTag:function(a){var e=this._.rules[a];this._.afterCloser&&(e&&e.needsSpace&&this._.needsSpace)&&this._.output.push("\n");if(this._.indent)this.indentation();else if(e&&e.breakBeforeOpen){this.lineBreak();this.indentation()}this._.output.push("<",a);this._.afterCloser=0},openTagClose:function(a,e){var b=this._.rules[a];if(e){this._.output.push(this.selfClosingEnd);if(b&&b.breakAfterClose)this._.needsSpace=b.needsSpace}else{this._.output.push(">");
+if(b&&b.indent)this._.indentation=this._.indentation+this.indentationChars}b&&b.breakAfterOpen&&this.lineBreak();a=="pre"&&(this._.inPre=1)},attribute:function(a,e){if(typeof e=="string"){this.forceSimpleAmpersand&&(e=e.replace(/&amp;/g,"&"));e=CKEDITOR.tools.htmlEncodeAttr(e)}this._.output.push(" ",a,'="',e,'"')},closeTag:function(a){var e=this._.rules[a];if(e&&e.indent)this._.indentation=this._.indentation.substr(this.indentationChars.length);if(this._.indent)this.indentation();else if(e&&e.breakBeforeClose){this.lineBreak();
+this.indentation()}this._.output.push("</",a,">");a=="pre"&&(this._.inPre=0);if(e&&e.breakAfterClose){this.lineBreak();this._.needsSpace=e.needsSpace}this._.afterCloser=1},text:function(a){if(this._.indent){this.indentation();!this._.inPre&&(a=CKEDITOR.tools.ltrim(a))}this._.output.push(a)},comment:function(a){this._.indent&&this.indentation();this._.output.push("<\!--",a,"--\>")},lineBreak:function(){!this._.inPre&&this._.output.length>0&&this._.output.push(this.lineBreakChars);this._.indent=1},
+indentation:function(){!this._.inPre&&this._.indentation&&this._.output.push(this._.indentation);this._.indent=0},reset:function(){this._.output=[];this._.indent=0;this._.indentation="";this._.afterCloser=0;this._.inPre=0},setRules:function(a,e){var b=this._.rules[a];b?CKEDITOR.tools.extend(b,e,true):this._.rules[a]=e}}}),function(){function a(a,c){c||(c=a.getSelection().getSelectedElement());if(c&&c.is("img")&&!c.data("cke-realelement")&&!c.isReadOnly())return c}function e(a){var c=a.getStyle("float");
+if(c=="inherit"||c=="none")c=0;c||(c=a.getAttribute("align"));return c}CKEDITOR.plugins.add("image",{requires:"dialog",init:function(b){if(!b.plugins.image2){CKEDITOR.dialog.add("image",this.path+"dialogs/image.js");var c="img[alt,!src]{border-style,border-width,float,height,margin,margin-bottom,margin-left,margin-right,margin-top,width}";CKEDITOR.dialog.isTabEnabled(b,"image","advanced")&&(c="img[alt,dir,id,lang,longdesc,!src,title]{*}(*)");b.addCommand("image",new CKEDITOR.dialogCommand("image",
+{allowedContent:c,requiredContent:"img[alt,src]",contentTransformations:[["img{width}: sizeToStyle","img[width]: sizeToAttribute"],["img{float}: alignmentToStyle","img[align]: alignmentToAttribute"]]}));b.ui.addButton&&b.ui.addButton("Image",{label:b.lang.common.image,command:"image",toolbar:"insert,10"});b.on("doubleclick",function(a){var b=a.data.element;if(b.is("img")&&!b.data("cke-realelement")&&!b.isReadOnly())a.data.dialog="image"});b.addMenuItems&&b.addMenuItems({image:{label:b.lang.image.menu,
+command:"image",group:"image"}});b.contextMenu&&b.contextMenu.addListener(function(c){if(a(b,c))return{image:CKEDITOR.TRISTATE_OFF}})}},afterInit:function(b){function c(c){var i=b.getCommand("justify"+c);if(i){if(c=="left"||c=="right")i.on("exec",function(h){var f=a(b),i;if(f){i=e(f);if(i==c){f.removeStyle("float");c==e(f)&&f.removeAttribute("align")}else f.setStyle("float",c);h.cancel()}});i.on("refresh",function(h){var f=a(b);if(f){f=e(f);this.setState(f==c?CKEDITOR.TRISTATE_ON:c=="right"||c=="left"?
+CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED);h.cancel()}})}}if(!b.plugins.image2){c("left");c("right");c("center");c("block")}}})}(),CKEDITOR.config.image_removeLinkByEmptyURL=!0,function(){function a(a,d){var i,h;d.on("refresh",function(a){var c=[e],d;for(d in a.data.states)c.push(a.data.states[d]);this.setState(CKEDITOR.tools.search(c,b)?b:e)},d,null,100);d.on("exec",function(b){i=a.getSelection();h=i.createBookmarks(1);if(!b.data)b.data={};b.data.done=false},d,null,0);d.on("exec",function(){a.forceNextSelectionCheck();
+i.selectBookmarks(h)},d,null,100)}var e=CKEDITOR.TRISTATE_DISABLED,b=CKEDITOR.TRISTATE_OFF;CKEDITOR.plugins.add("indent",{init:function(b){var d=CKEDITOR.plugins.indent.genericDefinition;a(b,b.addCommand("indent",new d(true)));a(b,b.addCommand("outdent",new d));if(b.ui.addButton){b.ui.addButton("Indent",{label:b.lang.indent.indent,command:"indent",directional:true,toolbar:"indent,20"});b.ui.addButton("Outdent",{label:b.lang.indent.outdent,command:"outdent",directional:true,toolbar:"indent,10"})}b.on("dirChanged",
+function(a){var d=b.createRange(),f=a.data.node;d.setStartBefore(f);d.setEndAfter(f);for(var e=new CKEDITOR.dom.walker(d),j;j=e.next();)if(j.type==CKEDITOR.NODE_ELEMENT)if(!j.equals(f)&&j.getDirection()){d.setStartAfter(j);e=new CKEDITOR.dom.walker(d)}else{var g=b.config.indentClasses;if(g)for(var n=a.data.dir=="ltr"?["_rtl",""]:["","_rtl"],q=0;q<g.length;q++)if(j.hasClass(g[q]+n[0])){j.removeClass(g[q]+n[0]);j.addClass(g[q]+n[1])}g=j.getStyle("margin-right");n=j.getStyle("margin-left");g?j.setStyle("margin-left",
+g):j.removeStyle("margin-left");n?j.setStyle("margin-right",n):j.removeStyle("margin-right")}})}});CKEDITOR.plugins.indent={genericDefinition:function(a){this.isIndent=!!a;this.startDisabled=!this.isIndent},specificDefinition:function(a,b,e){this.name=b;this.editor=a;this.jobs={};this.enterBr=a.config.enterMode==CKEDITOR.ENTER_BR;this.isIndent=!!e;this.relatedGlobal=e?"indent":"outdent";this.indentKey=e?9:CKEDITOR.SHIFT+9;this.database={}},registerCommands:function(a,b){a.on("pluginsLoaded",function(){for(var a in b)(function(a,
+b){var c=a.getCommand(b.relatedGlobal),d;for(d in b.jobs){c.on("exec",function(c){if(!c.data.done){a.fire("lockSnapshot");if(b.execJob(a,d))c.data.done=true;a.fire("unlockSnapshot");CKEDITOR.dom.element.clearAllMarkers(b.database)}},this,null,d);c.on("refresh",function(c){if(!c.data.states)c.data.states={};c.data.states[b.name+"@"+d]=b.refreshJob(a,d,c.data.path)},this,null,d)}a.addFeature(b)})(this,b[a])})}};CKEDITOR.plugins.indent.genericDefinition.prototype={context:"p",exec:function(){}};CKEDITOR.plugins.indent.specificDefinition.prototype=
+{execJob:function(a,b){var i=this.jobs[b];if(i.state!=e)return i.exec.call(this,a)},refreshJob:function(a,b,i){b=this.jobs[b];b.state=a.activeFilter.checkFeature(this)?b.refresh.call(this,a,i):e;return b.state},getContext:function(a){return a.contains(this.context)}}}(),function(){function a(a){function c(e){for(var i=l.startContainer,k=l.endContainer;i&&!i.getParent().equals(e);)i=i.getParent();for(;k&&!k.getParent().equals(e);)k=k.getParent();if(!i||!k)return false;for(var o=i,i=[],r=false;!r;){o.equals(k)&&
+(r=true);i.push(o);o=o.getNext()}if(i.length<1)return false;o=e.getParents(true);for(k=0;k<o.length;k++)if(o[k].getName&&h[o[k].getName()]){e=o[k];break}for(var o=d.isIndent?1:-1,k=i[0],i=i[i.length-1],r=CKEDITOR.plugins.list.listToArray(e,g),x=r[i.getCustomData("listarray_index")].indent,k=k.getCustomData("listarray_index");k<=i.getCustomData("listarray_index");k++){r[k].indent=r[k].indent+o;if(o>0){var q=r[k].parent;r[k].parent=new CKEDITOR.dom.element(q.getName(),q.getDocument())}}for(k=i.getCustomData("listarray_index")+
+1;k<r.length&&r[k].indent>x;k++)r[k].indent=r[k].indent+o;i=CKEDITOR.plugins.list.arrayToList(r,g,null,a.config.enterMode,e.getDirection());if(!d.isIndent){var s;if((s=e.getParent())&&s.is("li"))for(var o=i.listNode.getChildren(),y=[],z,k=o.count()-1;k>=0;k--)(z=o.getItem(k))&&(z.is&&z.is("li"))&&y.push(z)}i&&i.listNode.replace(e);if(y&&y.length)for(k=0;k<y.length;k++){for(z=e=y[k];(z=z.getNext())&&z.is&&z.getName()in h;){CKEDITOR.env.needsNbspFiller&&!e.getFirst(b)&&e.append(l.document.createText(" "));
+e.append(z)}e.insertAfter(s)}i&&a.fire("contentDomInvalidated");return true}for(var d=this,g=this.database,h=this.context,i=a.getSelection(),i=(i&&i.getRanges()).createIterator(),l;l=i.getNextRange();){for(var o=l.getCommonAncestor();o&&!(o.type==CKEDITOR.NODE_ELEMENT&&h[o.getName()]);){if(a.editable().equals(o)){o=false;break}o=o.getParent()}o||(o=l.startPath().contains(h))&&l.setEndAt(o,CKEDITOR.POSITION_BEFORE_END);if(!o){var r=l.getEnclosedNode();if(r&&r.type==CKEDITOR.NODE_ELEMENT&&r.getName()in
+h){l.setStartAt(r,CKEDITOR.POSITION_AFTER_START);l.setEndAt(r,CKEDITOR.POSITION_BEFORE_END);o=r}}if(o&&l.startContainer.type==CKEDITOR.NODE_ELEMENT&&l.startContainer.getName()in h){r=new CKEDITOR.dom.walker(l);r.evaluator=e;l.startContainer=r.next()}if(o&&l.endContainer.type==CKEDITOR.NODE_ELEMENT&&l.endContainer.getName()in h){r=new CKEDITOR.dom.walker(l);r.evaluator=e;l.endContainer=r.previous()}if(o)return c(o)}return 0}function e(a){return a.type==CKEDITOR.NODE_ELEMENT&&a.is("li")}function b(a){return c(a)&&
+d(a)}var c=CKEDITOR.dom.walker.whitespaces(true),d=CKEDITOR.dom.walker.bookmark(false,true),i=CKEDITOR.TRISTATE_DISABLED,h=CKEDITOR.TRISTATE_OFF;CKEDITOR.plugins.add("indentlist",{requires:"indent",init:function(b){function c(b){d.specificDefinition.apply(this,arguments);this.requiredContent=["ul","ol"];b.on("key",function(a){if(b.mode=="wysiwyg"&&a.data.keyCode==this.indentKey){var c=this.getContext(b.elementPath());if(c&&(!this.isIndent||!CKEDITOR.plugins.indentList.firstItemInPath(this.context,
+b.elementPath(),c))){b.execCommand(this.relatedGlobal);a.cancel()}}},this);this.jobs[this.isIndent?10:30]={refresh:this.isIndent?function(a,b){var c=this.getContext(b),d=CKEDITOR.plugins.indentList.firstItemInPath(this.context,b,c);return!c||!this.isIndent||d?i:h}:function(a,b){return!this.getContext(b)||this.isIndent?i:h},exec:CKEDITOR.tools.bind(a,this)}}var d=CKEDITOR.plugins.indent;d.registerCommands(b,{indentlist:new c(b,"indentlist",true),outdentlist:new c(b,"outdentlist")});CKEDITOR.tools.extend(c.prototype,
+d.specificDefinition.prototype,{context:{ol:1,ul:1}})}});CKEDITOR.plugins.indentList={};CKEDITOR.plugins.indentList.firstItemInPath=function(a,b,c){var d=b.contains(e);c||(c=b.contains(a));return c&&d&&d.equals(c.getFirst(e))}}(),function(){var a='<a id="{id}" class="cke_button cke_button__{name} cke_button_{state} {cls}"'+(CKEDITOR.env.gecko&&!CKEDITOR.env.hc?"":" href=\"javascript:void('{titleJs}')\"")+' title="{title}" tabindex="-1" hidefocus="true" role="button" aria-labelledby="{id}_label" aria-haspopup="{hasArrow}" aria-disabled="{ariaDisabled}"';
+CKEDITOR.env.gecko&&CKEDITOR.env.mac&&(a=a+' onkeypress="return false;"');CKEDITOR.env.gecko&&(a=a+' onblur="this.style.cssText = this.style.cssText;"');var a=a+(' onkeydown="return CKEDITOR.tools.callFunction({keydownFn},event);" onfocus="return CKEDITOR.tools.callFunction({focusFn},event);" '+(CKEDITOR.env.ie?'onclick="return false;" onmouseup':"onclick")+'="CKEDITOR.tools.callFunction({clickFn},this);return false;"><span class="cke_button_icon cke_button__{iconName}_icon" style="{style}"'),a=a+
+'>&nbsp;</span><span id="{id}_label" class="cke_button_label cke_button__{name}_label" aria-hidden="false">{label}</span>{arrowHtml}</a>',e=CKEDITOR.addTemplate("buttonArrow",'<span class="cke_button_arrow">'+(CKEDITOR.env.hc?"&#9660;":"")+"</span>"),b=CKEDITOR.addTemplate("button",a);CKEDITOR.plugins.add("button",{beforeInit:function(a){a.ui.addHandler(CKEDITOR.UI_BUTTON,CKEDITOR.ui.button.handler)}});CKEDITOR.UI_BUTTON="button";CKEDITOR.ui.button=function(a){CKEDITOR.tools.extend(this,a,{title:a.label,
+click:a.click||function(b){b.execCommand(a.command)}});this._={}};CKEDITOR.ui.button.handler={create:function(a){return new CKEDITOR.ui.button(a)}};CKEDITOR.ui.button.prototype={render:function(a,d){function i(){var b=a.mode;if(b){b=this.modes[b]?r[b]!==void 0?r[b]:CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED;b=a.readOnly&&!this.readOnly?CKEDITOR.TRISTATE_DISABLED:b;this.setState(b);this.refresh&&this.refresh()}}var h=CKEDITOR.env,f=this._.id=CKEDITOR.tools.getNextId(),k="",j=this.command,g;this._.editor=
+a;var n={id:f,button:this,editor:a,focus:function(){CKEDITOR.document.getById(f).focus()},execute:function(){this.button.click(a)},attach:function(a){this.button.attach(a)}},q=CKEDITOR.tools.addFunction(function(a){if(n.onkey){a=new CKEDITOR.dom.event(a);return n.onkey(n,a.getKeystroke())!==false}}),l=CKEDITOR.tools.addFunction(function(a){var b;n.onfocus&&(b=n.onfocus(n,new CKEDITOR.dom.event(a))!==false);return b}),o=0;n.clickFn=g=CKEDITOR.tools.addFunction(function(){if(o){a.unlockSelection(1);
+o=0}n.execute();h.iOS&&a.focus()});if(this.modes){var r={};a.on("beforeModeUnload",function(){if(a.mode&&this._.state!=CKEDITOR.TRISTATE_DISABLED)r[a.mode]=this._.state},this);a.on("activeFilterChange",i,this);a.on("mode",i,this);!this.readOnly&&a.on("readOnly",i,this)}else if(j)if(j=a.getCommand(j)){j.on("state",function(){this.setState(j.state)},this);k=k+(j.state==CKEDITOR.TRISTATE_ON?"on":j.state==CKEDITOR.TRISTATE_DISABLED?"disabled":"off")}if(this.directional)a.on("contentDirChanged",function(b){var d=
+CKEDITOR.document.getById(this._.id),f=d.getFirst(),b=b.data;b!=a.lang.dir?d.addClass("cke_"+b):d.removeClass("cke_ltr").removeClass("cke_rtl");f.setAttribute("style",CKEDITOR.skin.getIconStyle(p,b=="rtl",this.icon,this.iconOffset))},this);j||(k=k+"off");var m=this.name||this.command,p=m;if(this.icon&&!/\./.test(this.icon)){p=this.icon;this.icon=null}k={id:f,name:m,iconName:p,label:this.label,cls:this.className||"",state:k,ariaDisabled:k=="disabled"?"true":"false",title:this.title,titleJs:h.gecko&&
+!h.hc?"":(this.title||"").replace("'",""),hasArrow:this.hasArrow?"true":"false",keydownFn:q,focusFn:l,clickFn:g,style:CKEDITOR.skin.getIconStyle(p,a.lang.dir=="rtl",this.icon,this.iconOffset),arrowHtml:this.hasArrow?e.output():""};b.output(k,d);if(this.onRender)this.onRender();return n},setState:function(a){if(this._.state==a)return false;this._.state=a;var b=CKEDITOR.document.getById(this._.id);if(b){b.setState(a,"cke_button");a==CKEDITOR.TRISTATE_DISABLED?b.setAttribute("aria-disabled",true):b.removeAttribute("aria-disabled");
+if(this.hasArrow){a=a==CKEDITOR.TRISTATE_ON?this._.editor.lang.button.selectedLabel.replace(/%1/g,this.label):this.label;CKEDITOR.document.getById(this._.id+"_label").setText(a)}else a==CKEDITOR.TRISTATE_ON?b.setAttribute("aria-pressed",true):b.removeAttribute("aria-pressed");return true}return false},getState:function(){return this._.state},toFeature:function(a){if(this._.feature)return this._.feature;var b=this;!this.allowedContent&&(!this.requiredContent&&this.command)&&(b=a.getCommand(this.command)||
+b);return this._.feature=b}};CKEDITOR.ui.prototype.addButton=function(a,b){this.add(a,CKEDITOR.UI_BUTTON,b)}}(),CKEDITOR.plugins.add("menubutton",{requires:"button,menu",onLoad:function(){var a=function(a){var b=this._,c=b.menu;if(b.state!==CKEDITOR.TRISTATE_DISABLED)if(b.on&&c)c.hide();else{b.previousState=b.state;if(!c){c=b.menu=new CKEDITOR.menu(a,{panel:{className:"cke_menu_panel",attributes:{"aria-label":a.lang.common.options}}});c.onHide=CKEDITOR.tools.bind(function(){var c=this.command?a.getCommand(this.command).modes:
+this.modes;this.setState(!c||c[a.mode]?b.previousState:CKEDITOR.TRISTATE_DISABLED);b.on=0},this);this.onMenu&&c.addListener(this.onMenu)}this.setState(CKEDITOR.TRISTATE_ON);b.on=1;setTimeout(function(){c.show(CKEDITOR.document.getById(b.id),4)},0)}};CKEDITOR.ui.menuButton=CKEDITOR.tools.createClass({base:CKEDITOR.ui.button,$:function(e){delete e.panel;this.base(e);this.hasArrow=true;this.click=a},statics:{handler:{create:function(a){return new CKEDITOR.ui.menuButton(a)}}}})},beforeInit:function(a){a.ui.addHandler(CKEDITOR.UI_MENUBUTTON,
+CKEDITOR.ui.menuButton.handler)}}),CKEDITOR.UI_MENUBUTTON="menubutton","use strict",function(){CKEDITOR.plugins.add("language",{requires:"menubutton",init:function(a){var e=a.config.language_list||["ar:Arabic:rtl","fr:French","es:Spanish"],b=this,c=a.lang.language,d={},i,h,f,k;a.addCommand("language",{allowedContent:"span[!lang,!dir]",requiredContent:"span[lang,dir]",contextSensitive:true,exec:function(a,b){var c=d["language_"+b];if(c)a[c.style.checkActive(a.elementPath(),a)?"removeStyle":"applyStyle"](c.style)},
+refresh:function(a){this.setState(b.getCurrentLangElement(a)?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF)}});for(k=0;k<e.length;k++){i=e[k].split(":");h=i[0];f="language_"+h;d[f]={label:i[1],langId:h,group:"language",order:k,ltr:(""+i[2]).toLowerCase()!="rtl",onClick:function(){a.execCommand("language",this.langId)},role:"menuitemcheckbox"};d[f].style=new CKEDITOR.style({element:"span",attributes:{lang:h,dir:d[f].ltr?"ltr":"rtl"}})}d.language_remove={label:c.remove,group:"language_remove",state:CKEDITOR.TRISTATE_DISABLED,
+order:d.length,onClick:function(){var c=b.getCurrentLangElement(a);c&&a.execCommand("language",c.getAttribute("lang"))}};a.addMenuGroup("language",1);a.addMenuGroup("language_remove");a.addMenuItems(d);a.ui.add("Language",CKEDITOR.UI_MENUBUTTON,{label:c.button,allowedContent:"span[!lang,!dir]",requiredContent:"span[lang,dir]",toolbar:"bidi,30",command:"language",onMenu:function(){var c={},f=b.getCurrentLangElement(a),e;for(e in d)c[e]=CKEDITOR.TRISTATE_OFF;c.language_remove=f?CKEDITOR.TRISTATE_OFF:
+CKEDITOR.TRISTATE_DISABLED;if(f)c["language_"+f.getAttribute("lang")]=CKEDITOR.TRISTATE_ON;return c}})},getCurrentLangElement:function(a){var e=a.elementPath(),a=e&&e.elements,b;if(e)for(var c=0;c<a.length;c++){e=a[c];!b&&(e.getName()=="span"&&e.hasAttribute("dir")&&e.hasAttribute("lang"))&&(b=e)}return b}})}(),function(){function a(a,b){var d=c.exec(a),e=c.exec(b);if(d){if(!d[2]&&e[2]=="px")return e[1];if(d[2]=="px"&&!e[2])return e[1]+"px"}return b}var e=CKEDITOR.htmlParser.cssStyle,b=CKEDITOR.tools.cssLength,
+c=/^((?:\d*(?:\.\d+))|(?:\d+))(.*)?$/i,d={elements:{$:function(b){var c=b.attributes;if((c=(c=(c=c&&c["data-cke-realelement"])&&new CKEDITOR.htmlParser.fragment.fromHtml(decodeURIComponent(c)))&&c.children[0])&&b.attributes["data-cke-resizable"]){var d=(new e(b)).rules,b=c.attributes,k=d.width,d=d.height;k&&(b.width=a(b.width,k));d&&(b.height=a(b.height,d))}return c}}};CKEDITOR.plugins.add("fakeobjects",{init:function(a){a.filter.allow("img[!data-cke-realelement,src,alt,title](*){*}","fakeobjects")},
+afterInit:function(a){(a=(a=a.dataProcessor)&&a.htmlFilter)&&a.addRules(d,{applyToAll:true})}});CKEDITOR.editor.prototype.createFakeElement=function(a,c,d,k){var j=this.lang.fakeobjects,j=j[d]||j.unknown,c={"class":c,"data-cke-realelement":encodeURIComponent(a.getOuterHtml()),"data-cke-real-node-type":a.type,alt:j,title:j,align:a.getAttribute("align")||""};if(!CKEDITOR.env.hc)c.src=CKEDITOR.tools.transparentImageData;d&&(c["data-cke-real-element-type"]=d);if(k){c["data-cke-resizable"]=k;d=new e;k=
+a.getAttribute("width");a=a.getAttribute("height");k&&(d.rules.width=b(k));a&&(d.rules.height=b(a));d.populate(c)}return this.document.createElement("img",{attributes:c})};CKEDITOR.editor.prototype.createFakeParserElement=function(a,c,d,k){var j=this.lang.fakeobjects,j=j[d]||j.unknown,g;g=new CKEDITOR.htmlParser.basicWriter;a.writeHtml(g);g=g.getHtml();c={"class":c,"data-cke-realelement":encodeURIComponent(g),"data-cke-real-node-type":a.type,alt:j,title:j,align:a.attributes.align||""};if(!CKEDITOR.env.hc)c.src=
+CKEDITOR.tools.transparentImageData;d&&(c["data-cke-real-element-type"]=d);if(k){c["data-cke-resizable"]=k;k=a.attributes;a=new e;d=k.width;k=k.height;d!==void 0&&(a.rules.width=b(d));k!==void 0&&(a.rules.height=b(k));a.populate(c)}return new CKEDITOR.htmlParser.element("img",c)};CKEDITOR.editor.prototype.restoreRealElement=function(b){if(b.data("cke-real-node-type")!=CKEDITOR.NODE_ELEMENT)return null;var c=CKEDITOR.dom.element.createFromHtml(decodeURIComponent(b.data("cke-realelement")),this.document);
+if(b.data("cke-resizable")){var d=b.getStyle("width"),b=b.getStyle("height");d&&c.setAttribute("width",a(c.getAttribute("width"),d));b&&c.setAttribute("height",a(c.getAttribute("height"),b))}return c}}(),"use strict",function(){function a(a){return a.replace(/'/g,"\\$&")}function e(a){for(var b,c=a.length,d=[],f=0;f<c;f++){b=a.charCodeAt(f);d.push(b)}return"String.fromCharCode("+d.join(",")+")"}function b(b,c){var d=b.plugins.link,f=d.compiledProtectionFunction.params,e,g;g=[d.compiledProtectionFunction.name,
+"("];for(var h=0;h<f.length;h++){d=f[h].toLowerCase();e=c[d];h>0&&g.push(",");g.push("'",e?a(encodeURIComponent(c[d])):"","'")}g.push(")");return g.join("")}function c(a){var a=a.config.emailProtection||"",b;if(a&&a!="encode"){b={};a.replace(/^([^(]+)\(([^)]+)\)$/,function(a,c,d){b.name=c;b.params=[];d.replace(/[^,\s]+/g,function(a){b.params.push(a)})})}return b}CKEDITOR.plugins.add("link",{requires:"dialog,fakeobjects",onLoad:function(){function a(b){return c.replace(/%1/g,b=="rtl"?"right":"left").replace(/%2/g,
+"cke_contents_"+b)}var b="background:url("+CKEDITOR.getUrl(this.path+"images"+(CKEDITOR.env.hidpi?"/hidpi":"")+"/anchor.png")+") no-repeat %1 center;border:1px dotted #00f;background-size:16px;",c=".%2 a.cke_anchor,.%2 a.cke_anchor_empty,.cke_editable.%2 a[name],.cke_editable.%2 a[data-cke-saved-name]{"+b+"padding-%1:18px;cursor:auto;}.%2 img.cke_anchor{"+b+"width:16px;min-height:15px;height:1.15em;vertical-align:text-bottom;}";CKEDITOR.addCss(a("ltr")+a("rtl"))},init:function(a){var b="a[!href]";
+CKEDITOR.dialog.isTabEnabled(a,"link","advanced")&&(b=b.replace("]",",accesskey,charset,dir,id,lang,name,rel,tabindex,title,type]{*}(*)"));CKEDITOR.dialog.isTabEnabled(a,"link","target")&&(b=b.replace("]",",target,onclick]"));a.addCommand("link",new CKEDITOR.dialogCommand("link",{allowedContent:b,requiredContent:"a[href]"}));a.addCommand("anchor",new CKEDITOR.dialogCommand("anchor",{allowedContent:"a[!name,id]",requiredContent:"a[name]"}));a.addCommand("unlink",new CKEDITOR.unlinkCommand);a.addCommand("removeAnchor",
+new CKEDITOR.removeAnchorCommand);a.setKeystroke(CKEDITOR.CTRL+76,"link");if(a.ui.addButton){a.ui.addButton("Link",{label:a.lang.link.toolbar,command:"link",toolbar:"links,10"});a.ui.addButton("Unlink",{label:a.lang.link.unlink,command:"unlink",toolbar:"links,20"});a.ui.addButton("Anchor",{label:a.lang.link.anchor.toolbar,command:"anchor",toolbar:"links,30"})}CKEDITOR.dialog.add("link",this.path+"dialogs/link.js");CKEDITOR.dialog.add("anchor",this.path+"dialogs/anchor.js");a.on("doubleclick",function(b){var c=
+CKEDITOR.plugins.link.getSelectedLink(a)||b.data.element;if(!c.isReadOnly())if(c.is("a")){b.data.dialog=c.getAttribute("name")&&(!c.getAttribute("href")||!c.getChildCount())?"anchor":"link";b.data.link=c}else if(CKEDITOR.plugins.link.tryRestoreFakeAnchor(a,c))b.data.dialog="anchor"},null,null,0);a.on("doubleclick",function(b){b.data.dialog in{link:1,anchor:1}&&b.data.link&&a.getSelection().selectElement(b.data.link)},null,null,20);a.addMenuItems&&a.addMenuItems({anchor:{label:a.lang.link.anchor.menu,
+command:"anchor",group:"anchor",order:1},removeAnchor:{label:a.lang.link.anchor.remove,command:"removeAnchor",group:"anchor",order:5},link:{label:a.lang.link.menu,command:"link",group:"link",order:1},unlink:{label:a.lang.link.unlink,command:"unlink",group:"link",order:5}});a.contextMenu&&a.contextMenu.addListener(function(b){if(!b||b.isReadOnly())return null;b=CKEDITOR.plugins.link.tryRestoreFakeAnchor(a,b);if(!b&&!(b=CKEDITOR.plugins.link.getSelectedLink(a)))return null;var c={};b.getAttribute("href")&&
+b.getChildCount()&&(c={link:CKEDITOR.TRISTATE_OFF,unlink:CKEDITOR.TRISTATE_OFF});if(b&&b.hasAttribute("name"))c.anchor=c.removeAnchor=CKEDITOR.TRISTATE_OFF;return c});this.compiledProtectionFunction=c(a)},afterInit:function(a){a.dataProcessor.dataFilter.addRules({elements:{a:function(b){return!b.attributes.name?null:!b.children.length?a.createFakeParserElement(b,"cke_anchor","anchor"):null}}});var b=a._.elementsPath&&a._.elementsPath.filters;b&&b.push(function(b,c){if(c=="a"&&(CKEDITOR.plugins.link.tryRestoreFakeAnchor(a,
+b)||b.getAttribute("name")&&(!b.getAttribute("href")||!b.getChildCount())))return"anchor"})}});var d=/^javascript:/,i=/^mailto:([^?]+)(?:\?(.+))?$/,h=/subject=([^;?:@&=$,\/]*)/,f=/body=([^;?:@&=$,\/]*)/,k=/^#(.*)$/,j=/^((?:http|https|ftp|news):\/\/)?(.*)$/,g=/^(_(?:self|top|parent|blank))$/,n=/^javascript:void\(location\.href='mailto:'\+String\.fromCharCode\(([^)]+)\)(?:\+'(.*)')?\)$/,q=/^javascript:([^(]+)\(([^)]+)\)$/,l=/\s*window.open\(\s*this\.href\s*,\s*(?:'([^']*)'|null)\s*,\s*'([^']*)'\s*\)\s*;\s*return\s*false;*\s*/,
+o=/(?:^|,)([^=]+)=(\d+|yes|no)/gi,r={id:"advId",dir:"advLangDir",accessKey:"advAccessKey",name:"advName",lang:"advLangCode",tabindex:"advTabIndex",title:"advTitle",type:"advContentType","class":"advCSSClasses",charset:"advCharset",style:"advStyles",rel:"advRel"};CKEDITOR.plugins.link={getSelectedLink:function(a){var b=a.getSelection(),c=b.getSelectedElement();if(c&&c.is("a"))return c;if(b=b.getRanges()[0]){b.shrink(CKEDITOR.SHRINK_TEXT);return a.elementPath(b.getCommonAncestor()).contains("a",1)}return null},
+getEditorAnchors:function(a){for(var b=a.editable(),c=b.isInline()&&!a.plugins.divarea?a.document:b,b=c.getElementsByTag("a"),c=c.getElementsByTag("img"),d=[],f=0,e;e=b.getItem(f++);)if(e.data("cke-saved-name")||e.hasAttribute("name"))d.push({name:e.data("cke-saved-name")||e.getAttribute("name"),id:e.getAttribute("id")});for(f=0;e=c.getItem(f++);)(e=this.tryRestoreFakeAnchor(a,e))&&d.push({name:e.getAttribute("name"),id:e.getAttribute("id")});return d},fakeAnchor:true,tryRestoreFakeAnchor:function(a,
+b){if(b&&b.data("cke-real-element-type")&&b.data("cke-real-element-type")=="anchor"){var c=a.restoreRealElement(b);if(c.data("cke-saved-name"))return c}},parseLinkAttributes:function(a,b){var c=b&&(b.data("cke-saved-href")||b.getAttribute("href"))||"",e=a.plugins.link.compiledProtectionFunction,u=a.config.emailProtection,x,v={};c.match(d)&&(u=="encode"?c=c.replace(n,function(a,b,c){return"mailto:"+String.fromCharCode.apply(String,b.split(","))+(c&&c.replace(/\\'/g,"'"))}):u&&c.replace(q,function(a,
+b,c){if(b==e.name){v.type="email";for(var a=v.email={},b=/(^')|('$)/g,c=c.match(/[^,\s]+/g),d=c.length,f,g,h=0;h<d;h++){f=decodeURIComponent;g=c[h].replace(b,"").replace(/\\'/g,"'");g=f(g);f=e.params[h].toLowerCase();a[f]=g}a.address=[a.name,a.domain].join("@")}}));if(!v.type)if(u=c.match(k)){v.type="anchor";v.anchor={};v.anchor.name=v.anchor.id=u[1]}else if(u=c.match(i)){x=c.match(h);c=c.match(f);v.type="email";var s=v.email={};s.address=u[1];x&&(s.subject=decodeURIComponent(x[1]));c&&(s.body=decodeURIComponent(c[1]))}else if(c&&
+(x=c.match(j))){v.type="url";v.url={};v.url.protocol=x[1];v.url.url=x[2]}if(b){if(c=b.getAttribute("target"))v.target={type:c.match(g)?c:"frame",name:c};else if(c=(c=b.data("cke-pa-onclick")||b.getAttribute("onclick"))&&c.match(l))for(v.target={type:"popup",name:c[1]};u=o.exec(c[2]);)(u[2]=="yes"||u[2]=="1")&&!(u[1]in{height:1,width:1,top:1,left:1})?v.target[u[1]]=true:isFinite(u[2])&&(v.target[u[1]]=u[2]);var c={},y;for(y in r)(u=b.getAttribute(y))&&(c[r[y]]=u);if(y=b.data("cke-saved-name")||c.advName)c.advName=
+y;if(!CKEDITOR.tools.isEmpty(c))v.advanced=c}return v},getLinkAttributes:function(c,d){var f=c.config.emailProtection||"",g={};switch(d.type){case "url":var f=d.url&&d.url.protocol!==void 0?d.url.protocol:"http://",h=d.url&&CKEDITOR.tools.trim(d.url.url)||"";g["data-cke-saved-href"]=h.indexOf("/")===0?h:f+h;break;case "anchor":f=d.anchor&&d.anchor.id;g["data-cke-saved-href"]="#"+(d.anchor&&d.anchor.name||f||"");break;case "email":var i=d.email,h=i.address;switch(f){case "":case "encode":var j=encodeURIComponent(i.subject||
+""),k=encodeURIComponent(i.body||""),i=[];j&&i.push("subject="+j);k&&i.push("body="+k);i=i.length?"?"+i.join("&"):"";if(f=="encode"){f=["javascript:void(location.href='mailto:'+",e(h)];i&&f.push("+'",a(i),"'");f.push(")")}else f=["mailto:",h,i];break;default:f=h.split("@",2);i.name=f[0];i.domain=f[1];f=["javascript:",b(c,i)]}g["data-cke-saved-href"]=f.join("")}if(d.target)if(d.target.type=="popup"){for(var f=["window.open(this.href, '",d.target.name||"","', '"],o=["resizable","status","location",
+"toolbar","menubar","fullscreen","scrollbars","dependent"],h=o.length,j=function(a){d.target[a]&&o.push(a+"="+d.target[a])},i=0;i<h;i++)o[i]=o[i]+(d.target[o[i]]?"=yes":"=no");j("width");j("left");j("height");j("top");f.push(o.join(","),"'); return false;");g["data-cke-pa-onclick"]=f.join("")}else if(d.target.type!="notSet"&&d.target.name)g.target=d.target.name;if(d.advanced){for(var l in r)(f=d.advanced[r[l]])&&(g[l]=f);if(g.name)g["data-cke-saved-name"]=g.name}if(g["data-cke-saved-href"])g.href=
+g["data-cke-saved-href"];l={target:1,onclick:1,"data-cke-pa-onclick":1,"data-cke-saved-name":1};d.advanced&&CKEDITOR.tools.extend(l,r);for(var q in g)delete l[q];return{set:g,removed:CKEDITOR.tools.objectKeys(l)}}};CKEDITOR.unlinkCommand=function(){};CKEDITOR.unlinkCommand.prototype={exec:function(a){var b=new CKEDITOR.style({element:"a",type:CKEDITOR.STYLE_INLINE,alwaysRemoveElement:1});a.removeStyle(b)},refresh:function(a,b){var c=b.lastElement&&b.lastElement.getAscendant("a",true);c&&c.getName()==
+"a"&&c.getAttribute("href")&&c.getChildCount()?this.setState(CKEDITOR.TRISTATE_OFF):this.setState(CKEDITOR.TRISTATE_DISABLED)},contextSensitive:1,startDisabled:1,requiredContent:"a[href]"};CKEDITOR.removeAnchorCommand=function(){};CKEDITOR.removeAnchorCommand.prototype={exec:function(a){var b=a.getSelection(),c=b.createBookmarks(),d;if(b&&(d=b.getSelectedElement())&&(!d.getChildCount()?CKEDITOR.plugins.link.tryRestoreFakeAnchor(a,d):d.is("a")))d.remove(1);else if(d=CKEDITOR.plugins.link.getSelectedLink(a))if(d.hasAttribute("href")){d.removeAttributes({name:1,
+"data-cke-saved-name":1});d.removeClass("cke_anchor")}else d.remove(1);b.selectBookmarks(c)},requiredContent:"a[name]"};CKEDITOR.tools.extend(CKEDITOR.config,{linkShowAdvancedTab:true,linkShowTargetTab:true})}(),function(){function a(a,b,c){function d(c){if((j=i[c?"getFirst":"getLast"]())&&(!j.is||!j.isBlockBoundary())&&(k=b.root[c?"getPrevious":"getNext"](CKEDITOR.dom.walker.invisible(true)))&&(!k.is||!k.isBlockBoundary({br:1})))a.document.createElement("br")[c?"insertBefore":"insertAfter"](j)}for(var f=
+CKEDITOR.plugins.list.listToArray(b.root,c),e=[],g=0;g<b.contents.length;g++){var h=b.contents[g];if((h=h.getAscendant("li",true))&&!h.getCustomData("list_item_processed")){e.push(h);CKEDITOR.dom.element.setMarker(c,h,"list_item_processed",true)}}h=null;for(g=0;g<e.length;g++){h=e[g].getCustomData("listarray_index");f[h].indent=-1}for(g=h+1;g<f.length;g++)if(f[g].indent>f[g-1].indent+1){e=f[g-1].indent+1-f[g].indent;for(h=f[g].indent;f[g]&&f[g].indent>=h;){f[g].indent=f[g].indent+e;g++}g--}var i=
+CKEDITOR.plugins.list.arrayToList(f,c,null,a.config.enterMode,b.root.getAttribute("dir")).listNode,j,k;d(true);d();i.replace(b.root);a.fire("contentDomInvalidated")}function e(a,b){this.name=a;this.context=this.type=b;this.allowedContent=b+" li";this.requiredContent=b}function b(a,b,c,d){for(var f,e;f=a[d?"getLast":"getFirst"](l);){(e=f.getDirection(1))!==b.getDirection(1)&&f.setAttribute("dir",e);f.remove();c?f[d?"insertBefore":"insertAfter"](c):b.append(f,d)}}function c(a){function c(d){var f=a[d?
+"getPrevious":"getNext"](g);if(f&&f.type==CKEDITOR.NODE_ELEMENT&&f.is(a.getName())){b(a,f,null,!d);a.remove();a=f}}c();c(1)}function d(a){return a.type==CKEDITOR.NODE_ELEMENT&&(a.getName()in CKEDITOR.dtd.$block||a.getName()in CKEDITOR.dtd.$listItem)&&CKEDITOR.dtd[a.getName()]["#"]}function i(a,d,f){a.fire("saveSnapshot");f.enlarge(CKEDITOR.ENLARGE_LIST_ITEM_CONTENTS);var e=f.extractContents();d.trim(false,true);var i=d.createBookmark(),j=new CKEDITOR.dom.elementPath(d.startContainer),k=j.block,j=
+j.lastElement.getAscendant("li",1)||k,l=new CKEDITOR.dom.elementPath(f.startContainer),q=l.contains(CKEDITOR.dtd.$listItem),l=l.contains(CKEDITOR.dtd.$list);if(k)(k=k.getBogus())&&k.remove();else if(l)(k=l.getPrevious(g))&&n(k)&&k.remove();(k=e.getLast())&&(k.type==CKEDITOR.NODE_ELEMENT&&k.is("br"))&&k.remove();(k=d.startContainer.getChild(d.startOffset))?e.insertBefore(k):d.startContainer.append(e);if(q)if(e=h(q))if(j.contains(q)){b(e,q.getParent(),q);e.remove()}else j.append(e);for(;f.checkStartOfBlock()&&
+f.checkEndOfBlock();){l=f.startPath();e=l.block;if(!e)break;if(e.is("li")){j=e.getParent();e.equals(j.getLast(g))&&e.equals(j.getFirst(g))&&(e=j)}f.moveToPosition(e,CKEDITOR.POSITION_BEFORE_START);e.remove()}f=f.clone();e=a.editable();f.setEndAt(e,CKEDITOR.POSITION_BEFORE_END);f=new CKEDITOR.dom.walker(f);f.evaluator=function(a){return g(a)&&!n(a)};(f=f.next())&&(f.type==CKEDITOR.NODE_ELEMENT&&f.getName()in CKEDITOR.dtd.$list)&&c(f);d.moveToBookmark(i);d.select();a.fire("saveSnapshot")}function h(a){return(a=
+a.getLast(g))&&a.type==CKEDITOR.NODE_ELEMENT&&a.getName()in f?a:null}var f={ol:1,ul:1},k=CKEDITOR.dom.walker.whitespaces(),j=CKEDITOR.dom.walker.bookmark(),g=function(a){return!(k(a)||j(a))},n=CKEDITOR.dom.walker.bogus();CKEDITOR.plugins.list={listToArray:function(a,b,c,d,e){if(!f[a.getName()])return[];d||(d=0);c||(c=[]);for(var g=0,h=a.getChildCount();g<h;g++){var i=a.getChild(g);i.type==CKEDITOR.NODE_ELEMENT&&i.getName()in CKEDITOR.dtd.$list&&CKEDITOR.plugins.list.listToArray(i,b,c,d+1);if(i.$.nodeName.toLowerCase()==
+"li"){var j={parent:a,indent:d,element:i,contents:[]};if(e)j.grandparent=e;else{j.grandparent=a.getParent();if(j.grandparent&&j.grandparent.$.nodeName.toLowerCase()=="li")j.grandparent=j.grandparent.getParent()}b&&CKEDITOR.dom.element.setMarker(b,i,"listarray_index",c.length);c.push(j);for(var k=0,l=i.getChildCount(),q;k<l;k++){q=i.getChild(k);q.type==CKEDITOR.NODE_ELEMENT&&f[q.getName()]?CKEDITOR.plugins.list.listToArray(q,b,c,d+1,j.grandparent):j.contents.push(q)}}}return c},arrayToList:function(a,
+b,c,d,e){c||(c=0);if(!a||a.length<c+1)return null;for(var h,i=a[c].parent.getDocument(),k=new CKEDITOR.dom.documentFragment(i),l=null,q=c,n=Math.max(a[c].indent,0),z=null,B,A,D=d==CKEDITOR.ENTER_P?"p":"div";;){var C=a[q];h=C.grandparent;B=C.element.getDirection(1);if(C.indent==n){if(!l||a[q].parent.getName()!=l.getName()){l=a[q].parent.clone(false,1);e&&l.setAttribute("dir",e);k.append(l)}z=l.append(C.element.clone(0,1));B!=l.getDirection(1)&&z.setAttribute("dir",B);for(h=0;h<C.contents.length;h++)z.append(C.contents[h].clone(1,
+1));q++}else if(C.indent==Math.max(n,0)+1){C=a[q-1].element.getDirection(1);q=CKEDITOR.plugins.list.arrayToList(a,null,q,d,C!=B?B:null);!z.getChildCount()&&(CKEDITOR.env.needsNbspFiller&&i.$.documentMode<=7)&&z.append(i.createText(" "));z.append(q.listNode);q=q.nextIndex}else if(C.indent==-1&&!c&&h){if(f[h.getName()]){z=C.element.clone(false,true);B!=h.getDirection(1)&&z.setAttribute("dir",B)}else z=new CKEDITOR.dom.documentFragment(i);var l=h.getDirection(1)!=B,H=C.element,E=H.getAttribute("class"),
+G=H.getAttribute("style"),L=z.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT&&(d!=CKEDITOR.ENTER_BR||l||G||E),J,P=C.contents.length,I;for(h=0;h<P;h++){J=C.contents[h];if(j(J)&&P>1)L?I=J.clone(1,1):z.append(J.clone(1,1));else if(J.type==CKEDITOR.NODE_ELEMENT&&J.isBlockBoundary()){l&&!J.getDirection()&&J.setAttribute("dir",B);A=J;var R=H.getAttribute("style");R&&A.setAttribute("style",R.replace(/([^;])$/,"$1;")+(A.getAttribute("style")||""));E&&J.addClass(E);A=null;if(I){z.append(I);I=null}z.append(J.clone(1,
+1))}else if(L){if(!A){A=i.createElement(D);z.append(A);l&&A.setAttribute("dir",B)}G&&A.setAttribute("style",G);E&&A.setAttribute("class",E);if(I){A.append(I);I=null}A.append(J.clone(1,1))}else z.append(J.clone(1,1))}if(I){(A||z).append(I);I=null}if(z.type==CKEDITOR.NODE_DOCUMENT_FRAGMENT&&q!=a.length-1){if(CKEDITOR.env.needsBrFiller)(B=z.getLast())&&(B.type==CKEDITOR.NODE_ELEMENT&&B.is("br"))&&B.remove();B=z.getLast(g);(!B||!(B.type==CKEDITOR.NODE_ELEMENT&&B.is(CKEDITOR.dtd.$block)))&&z.append(i.createElement("br"))}B=
+z.$.nodeName.toLowerCase();(B=="div"||B=="p")&&z.appendBogus();k.append(z);l=null;q++}else return null;A=null;if(a.length<=q||Math.max(a[q].indent,0)<n)break}if(b)for(a=k.getFirst();a;){if(a.type==CKEDITOR.NODE_ELEMENT){CKEDITOR.dom.element.clearMarkers(b,a);if(a.getName()in CKEDITOR.dtd.$listItem){c=a;i=e=d=void 0;if(d=c.getDirection()){for(e=c.getParent();e&&!(i=e.getDirection());)e=e.getParent();d==i&&c.removeAttribute("dir")}}}a=a.getNextSourceNode()}return{listNode:k,nextIndex:q}}};var q=/^h[1-6]$/,
+l=CKEDITOR.dom.walker.nodeType(CKEDITOR.NODE_ELEMENT);e.prototype={exec:function(b){this.refresh(b,b.elementPath());var d=b.config,e=b.getSelection(),h=e&&e.getRanges();if(this.state==CKEDITOR.TRISTATE_OFF){var i=b.editable();if(i.getFirst(g)){var j=h.length==1&&h[0];(d=j&&j.getEnclosedNode())&&(d.is&&this.type==d.getName())&&this.setState(CKEDITOR.TRISTATE_ON)}else{d.enterMode==CKEDITOR.ENTER_BR?i.appendBogus():h[0].fixBlock(1,d.enterMode==CKEDITOR.ENTER_P?"p":"div");e.selectRanges(h)}}for(var d=
+e.createBookmarks(true),i=[],k={},h=h.createIterator(),l=0;(j=h.getNextRange())&&++l;){var n=j.getBoundaryNodes(),s=n.startNode,y=n.endNode;s.type==CKEDITOR.NODE_ELEMENT&&s.getName()=="td"&&j.setStartAt(n.startNode,CKEDITOR.POSITION_AFTER_START);y.type==CKEDITOR.NODE_ELEMENT&&y.getName()=="td"&&j.setEndAt(n.endNode,CKEDITOR.POSITION_BEFORE_END);j=j.createIterator();for(j.forceBrBreak=this.state==CKEDITOR.TRISTATE_OFF;n=j.getNextParagraph();)if(!n.getCustomData("list_block")){CKEDITOR.dom.element.setMarker(k,
+n,"list_block",1);for(var z=b.elementPath(n),s=z.elements,y=0,z=z.blockLimit,B,A=s.length-1;A>=0&&(B=s[A]);A--)if(f[B.getName()]&&z.contains(B)){z.removeCustomData("list_group_object_"+l);if(s=B.getCustomData("list_group_object"))s.contents.push(n);else{s={root:B,contents:[n]};i.push(s);CKEDITOR.dom.element.setMarker(k,B,"list_group_object",s)}y=1;break}if(!y){y=z;if(y.getCustomData("list_group_object_"+l))y.getCustomData("list_group_object_"+l).contents.push(n);else{s={root:y,contents:[n]};CKEDITOR.dom.element.setMarker(k,
+y,"list_group_object_"+l,s);i.push(s)}}}}for(B=[];i.length>0;){s=i.shift();if(this.state==CKEDITOR.TRISTATE_OFF)if(f[s.root.getName()]){h=b;l=s;s=k;j=B;y=CKEDITOR.plugins.list.listToArray(l.root,s);z=[];for(n=0;n<l.contents.length;n++){A=l.contents[n];if((A=A.getAscendant("li",true))&&!A.getCustomData("list_item_processed")){z.push(A);CKEDITOR.dom.element.setMarker(s,A,"list_item_processed",true)}}for(var A=l.root.getDocument(),D=void 0,C=void 0,n=0;n<z.length;n++){var H=z[n].getCustomData("listarray_index"),
+D=y[H].parent;if(!D.is(this.type)){C=A.createElement(this.type);D.copyAttributes(C,{start:1,type:1});C.removeStyle("list-style-type");y[H].parent=C}}s=CKEDITOR.plugins.list.arrayToList(y,s,null,h.config.enterMode);y=void 0;z=s.listNode.getChildCount();for(n=0;n<z&&(y=s.listNode.getChild(n));n++)y.getName()==this.type&&j.push(y);s.listNode.replace(l.root);h.fire("contentDomInvalidated")}else{y=b;n=s;j=B;z=n.contents;h=n.root.getDocument();l=[];if(z.length==1&&z[0].equals(n.root)){s=h.createElement("div");
+z[0].moveChildren&&z[0].moveChildren(s);z[0].append(s);z[0]=s}n=n.contents[0].getParent();for(A=0;A<z.length;A++)n=n.getCommonAncestor(z[A].getParent());D=y.config.useComputedState;y=s=void 0;D=D===void 0||D;for(A=0;A<z.length;A++)for(C=z[A];H=C.getParent();){if(H.equals(n)){l.push(C);!y&&C.getDirection()&&(y=1);C=C.getDirection(D);s!==null&&(s=s&&s!=C?null:C);break}C=H}if(!(l.length<1)){z=l[l.length-1].getNext();A=h.createElement(this.type);j.push(A);for(D=j=void 0;l.length;){j=l.shift();D=h.createElement("li");
+if(j.is("pre")||q.test(j.getName())||j.getAttribute("contenteditable")=="false")j.appendTo(D);else{j.copyAttributes(D);if(s&&j.getDirection()){D.removeStyle("direction");D.removeAttribute("dir")}j.moveChildren(D);j.remove()}D.appendTo(A)}s&&y&&A.setAttribute("dir",s);z?A.insertBefore(z):A.appendTo(n)}}else this.state==CKEDITOR.TRISTATE_ON&&f[s.root.getName()]&&a.call(this,b,s,k)}for(A=0;A<B.length;A++)c(B[A]);CKEDITOR.dom.element.clearAllMarkers(k);e.selectBookmarks(d);b.focus()},refresh:function(a,
+b){var c=b.contains(f,1),d=b.blockLimit||b.root;c&&d.contains(c)?this.setState(c.is(this.type)?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF):this.setState(CKEDITOR.TRISTATE_OFF)}};CKEDITOR.plugins.add("list",{requires:"indentlist",init:function(a){if(!a.blockless){a.addCommand("numberedlist",new e("numberedlist","ol"));a.addCommand("bulletedlist",new e("bulletedlist","ul"));if(a.ui.addButton){a.ui.addButton("NumberedList",{label:a.lang.list.numberedlist,command:"numberedlist",directional:true,toolbar:"list,10"});
+a.ui.addButton("BulletedList",{label:a.lang.list.bulletedlist,command:"bulletedlist",directional:true,toolbar:"list,20"})}a.on("key",function(b){var c=b.data.domEvent.getKey(),e;if(a.mode=="wysiwyg"&&c in{8:1,46:1}){var j=a.getSelection().getRanges()[0],k=j&&j.startPath();if(j&&j.collapsed){var l=c==8,q=a.editable(),v=new CKEDITOR.dom.walker(j.clone());v.evaluator=function(a){return g(a)&&!n(a)};v.guard=function(a,b){return!(b&&a.type==CKEDITOR.NODE_ELEMENT&&a.is("table"))};c=j.clone();if(l){var s;
+if((s=k.contains(f))&&j.checkBoundaryOfElement(s,CKEDITOR.START)&&(s=s.getParent())&&s.is("li")&&(s=h(s))){e=s;s=s.getPrevious(g);c.moveToPosition(s&&n(s)?s:e,CKEDITOR.POSITION_BEFORE_START)}else{v.range.setStartAt(q,CKEDITOR.POSITION_AFTER_START);v.range.setEnd(j.startContainer,j.startOffset);if((s=v.previous())&&s.type==CKEDITOR.NODE_ELEMENT&&(s.getName()in f||s.is("li"))){if(!s.is("li")){v.range.selectNodeContents(s);v.reset();v.evaluator=d;s=v.previous()}e=s;c.moveToElementEditEnd(e);c.moveToPosition(c.endPath().block,
+CKEDITOR.POSITION_BEFORE_END)}}if(e){i(a,c,j);b.cancel()}else{var y=k.contains(f);if(y&&j.checkBoundaryOfElement(y,CKEDITOR.START)){e=y.getFirst(g);if(j.checkBoundaryOfElement(e,CKEDITOR.START)){s=y.getPrevious(g);if(h(e)){if(s){j.moveToElementEditEnd(s);j.select()}}else a.execCommand("outdent");b.cancel()}}}}else if(e=k.contains("li")){v.range.setEndAt(q,CKEDITOR.POSITION_BEFORE_END);l=(q=e.getLast(g))&&d(q)?q:e;k=0;if((s=v.next())&&s.type==CKEDITOR.NODE_ELEMENT&&s.getName()in f&&s.equals(q)){k=
+1;s=v.next()}else j.checkBoundaryOfElement(l,CKEDITOR.END)&&(k=2);if(k&&s){j=j.clone();j.moveToElementEditStart(s);if(k==1){c.optimize();if(!c.startContainer.equals(e)){for(e=c.startContainer;e.is(CKEDITOR.dtd.$inline);){y=e;e=e.getParent()}y&&c.moveToPosition(y,CKEDITOR.POSITION_AFTER_END)}}if(k==2){c.moveToPosition(c.endPath().block,CKEDITOR.POSITION_BEFORE_END);j.endPath().block&&j.moveToPosition(j.endPath().block,CKEDITOR.POSITION_AFTER_START)}i(a,c,j);b.cancel()}}else{v.range.setEndAt(q,CKEDITOR.POSITION_BEFORE_END);
+if((s=v.next())&&s.type==CKEDITOR.NODE_ELEMENT&&s.is(f)){s=s.getFirst(g);if(k.block&&j.checkStartOfBlock()&&j.checkEndOfBlock()){k.block.remove();j.moveToElementEditStart(s);j.select()}else if(h(s)){j.moveToElementEditStart(s);j.select()}else{j=j.clone();j.moveToElementEditStart(s);i(a,c,j)}b.cancel()}}setTimeout(function(){a.selectionChange(1)})}}})}}})}(),function(){CKEDITOR.plugins.liststyle={requires:"dialog,contextmenu",init:function(a){if(!a.blockless){var e;e=new CKEDITOR.dialogCommand("numberedListStyle",
+{requiredContent:"ol",allowedContent:"ol{list-style-type}[start]"});e=a.addCommand("numberedListStyle",e);a.addFeature(e);CKEDITOR.dialog.add("numberedListStyle",this.path+"dialogs/liststyle.js");e=new CKEDITOR.dialogCommand("bulletedListStyle",{requiredContent:"ul",allowedContent:"ul{list-style-type}"});e=a.addCommand("bulletedListStyle",e);a.addFeature(e);CKEDITOR.dialog.add("bulletedListStyle",this.path+"dialogs/liststyle.js");a.addMenuGroup("list",108);a.addMenuItems({numberedlist:{label:a.lang.liststyle.numberedTitle,
+group:"list",command:"numberedListStyle"},bulletedlist:{label:a.lang.liststyle.bulletedTitle,group:"list",command:"bulletedListStyle"}});a.contextMenu.addListener(function(a){if(!a||a.isReadOnly())return null;for(;a;){var c=a.getName();if(c=="ol")return{numberedlist:CKEDITOR.TRISTATE_OFF};if(c=="ul")return{bulletedlist:CKEDITOR.TRISTATE_OFF};a=a.getParent()}return null})}}};CKEDITOR.plugins.add("liststyle",CKEDITOR.plugins.liststyle)}(),"use strict",function(){function a(a,b,c){return g(b)&&g(c)&&
+c.equals(b.getNext(function(a){return!(Q(a)||V(a)||n(a))}))}function e(a){this.upper=a[0];this.lower=a[1];this.set.apply(this,a.slice(2))}function b(a){var b=a.element;if(b&&g(b))if((b=b.getAscendant(a.triggers,true))&&a.editable.contains(b)){var c=i(b);if(c.getAttribute("contenteditable")=="true")return b;if(c.is(a.triggers))return c}return null}function c(a,b,c){w(a,b);w(a,c);a=b.size.bottom;c=c.size.top;return a&&c?0|(a+c)/2:a||c}function d(a,b,c){return b=b[c?"getPrevious":"getNext"](function(b){return b&&
+b.type==CKEDITOR.NODE_TEXT&&!Q(b)||g(b)&&!n(b)&&!j(a,b)})}function i(a,b){if(a.data("cke-editable"))return null;for(b||(a=a.getParent());a;){if(a.data("cke-editable"))break;if(a.hasAttribute("contenteditable"))return a;a=a.getParent()}return null}function h(a){var b=a.doc,c=z('<span contenteditable="false" style="'+F+"position:absolute;border-top:1px dashed "+a.boxColor+'"></span>',b),d=CKEDITOR.getUrl(this.path+"images/"+(B.hidpi?"hidpi/":"")+"icon"+(a.rtl?"-rtl":"")+".png");s(c,{attach:function(){this.wrap.getParent()||
+this.wrap.appendTo(a.editable,true);return this},lineChildren:[s(z('<span title="'+a.editor.lang.magicline.title+'" contenteditable="false">&#8629;</span>',b),{base:F+"height:17px;width:17px;"+(a.rtl?"left":"right")+":17px;background:url("+d+") center no-repeat "+a.boxColor+";cursor:pointer;"+(B.hc?"font-size: 15px;line-height:14px;border:1px solid #fff;text-align:center;":"")+(B.hidpi?"background-size: 9px 10px;":""),looks:["top:-8px; border-radius: 2px;","top:-17px; border-radius: 2px 2px 0px 0px;",
+"top:-1px; border-radius: 0px 0px 2px 2px;"]}),s(z(N,b),{base:M+"left:0px;border-left-color:"+a.boxColor+";",looks:["border-width:8px 0 8px 8px;top:-8px","border-width:8px 0 0 8px;top:-8px","border-width:0 0 8px 8px;top:0px"]}),s(z(N,b),{base:M+"right:0px;border-right-color:"+a.boxColor+";",looks:["border-width:8px 8px 8px 0;top:-8px","border-width:8px 8px 0 0;top:-8px","border-width:0 8px 8px 0;top:0px"]})],detach:function(){this.wrap.getParent()&&this.wrap.remove();return this},mouseNear:function(){w(a,
+this);var b=a.holdDistance,c=this.size;return c&&a.mouse.y>c.top-b&&a.mouse.y<c.bottom+b&&a.mouse.x>c.left-b&&a.mouse.x<c.right+b?true:false},place:function(){var b=a.view,c=a.editable,d=a.trigger,f=d.upper,e=d.lower,g=f||e,h=g.getParent(),i={};this.trigger=d;f&&w(a,f,true);e&&w(a,e,true);w(a,h,true);a.inInlineMode&&u(a,true);if(h.equals(c)){i.left=b.scroll.x;i.right=-b.scroll.x;i.width=""}else{i.left=g.size.left-g.size.margin.left+b.scroll.x-(a.inInlineMode?b.editable.left+b.editable.border.left:
+0);i.width=g.size.outerWidth+g.size.margin.left+g.size.margin.right+b.scroll.x;i.right=""}if(f&&e)i.top=f.size.margin.bottom===e.size.margin.top?0|f.size.bottom+f.size.margin.bottom/2:f.size.margin.bottom<e.size.margin.top?f.size.bottom+f.size.margin.bottom:f.size.bottom+f.size.margin.bottom-e.size.margin.top;else if(f){if(!e)i.top=f.size.bottom+f.size.margin.bottom}else i.top=e.size.top-e.size.margin.top;if(d.is(P)||i.top>b.scroll.y-15&&i.top<b.scroll.y+5){i.top=a.inInlineMode?0:b.scroll.y;this.look(P)}else if(d.is(I)||
+i.top>b.pane.bottom-5&&i.top<b.pane.bottom+15){i.top=a.inInlineMode?b.editable.height+b.editable.padding.top+b.editable.padding.bottom:b.pane.bottom-1;this.look(I)}else{if(a.inInlineMode)i.top=i.top-(b.editable.top+b.editable.border.top);this.look(R)}if(a.inInlineMode){i.top--;i.top=i.top+b.editable.scroll.top;i.left=i.left+b.editable.scroll.left}for(var j in i)i[j]=CKEDITOR.tools.cssLength(i[j]);this.setStyles(i)},look:function(a){if(this.oldLook!=a){for(var b=this.lineChildren.length,c;b--;)(c=
+this.lineChildren[b]).setAttribute("style",c.base+c.looks[0|a/2]);this.oldLook=a}},wrap:new y("span",a.doc)});for(b=c.lineChildren.length;b--;)c.lineChildren[b].appendTo(c);c.look(R);c.appendTo(c.wrap);c.unselectable();c.lineChildren[0].on("mouseup",function(b){c.detach();f(a,function(b){var c=a.line.trigger;b[c.is(H)?"insertBefore":"insertAfter"](c.is(H)?c.lower:c.upper)},true);a.editor.focus();!B.ie&&a.enterMode!=CKEDITOR.ENTER_BR&&a.hotNode.scrollIntoView();b.data.preventDefault(true)});c.on("mousedown",
+function(a){a.data.preventDefault(true)});a.line=c}function f(a,b,c){var d=new CKEDITOR.dom.range(a.doc),f=a.editor,e;if(B.ie&&a.enterMode==CKEDITOR.ENTER_BR)e=a.doc.createText(T);else{e=(e=i(a.element,true))&&e.data("cke-enter-mode")||a.enterMode;e=new y(C[e],a.doc);e.is("br")||a.doc.createText(T).appendTo(e)}c&&f.fire("saveSnapshot");b(e);d.moveToPosition(e,CKEDITOR.POSITION_AFTER_START);f.getSelection().selectRanges([d]);a.hotNode=e;c&&f.fire("saveSnapshot")}function k(a,c){return{canUndo:true,
+modes:{wysiwyg:1},exec:function(){function e(b){var d=B.ie&&B.version<9?" ":T,g=a.hotNode&&a.hotNode.getText()==d&&a.element.equals(a.hotNode)&&a.lastCmdDirection===!!c;f(a,function(d){g&&a.hotNode&&a.hotNode.remove();d[c?"insertAfter":"insertBefore"](b);d.setAttributes({"data-cke-magicline-hot":1,"data-cke-magicline-dir":!!c});a.lastCmdDirection=!!c});!B.ie&&a.enterMode!=CKEDITOR.ENTER_BR&&a.hotNode.scrollIntoView();a.line.detach()}return function(f){var f=f.getSelection().getStartElement(),h,f=
+f.getAscendant(ea,1);if(!o(a,f)&&f&&!f.equals(a.editable)&&!f.contains(a.editable)){if((h=i(f))&&h.getAttribute("contenteditable")=="false")f=h;a.element=f;h=d(a,f,!c);var j;if(g(h)&&h.is(a.triggers)&&h.is(S)&&(!d(a,h,!c)||(j=d(a,h,!c))&&g(j)&&j.is(a.triggers)))e(h);else{j=b(a,f);if(g(j))if(d(a,j,!c))(f=d(a,j,!c))&&(g(f)&&f.is(a.triggers))&&e(j);else e(j)}}}}()}}function j(a,b){if(!b||!(b.type==CKEDITOR.NODE_ELEMENT&&b.$))return false;var c=a.line;return c.wrap.equals(b)||c.wrap.contains(b)}function g(a){return a&&
+a.type==CKEDITOR.NODE_ELEMENT&&a.$}function n(a){if(!g(a))return false;var b;if(!(b=q(a)))if(g(a)){b={left:1,right:1,center:1};b=!(!b[a.getComputedStyle("float")]&&!b[a.getAttribute("align")])}else b=false;return b}function q(a){return!!{absolute:1,fixed:1}[a.getComputedStyle("position")]}function l(a,b){return g(b)?b.is(a.triggers):null}function o(a,b){if(!b)return false;for(var c=b.getParents(1),d=c.length;d--;)for(var f=a.tabuList.length;f--;)if(c[d].hasAttribute(a.tabuList[f]))return true;return false}
+function r(a,b,c){b=b[c?"getLast":"getFirst"](function(b){return a.isRelevant(b)&&!b.is(da)});if(!b)return false;w(a,b);return c?b.size.top>a.mouse.y:b.size.bottom<a.mouse.y}function m(a){var b=a.editable,c=a.mouse,d=a.view,f=a.triggerOffset;u(a);var h=c.y>(a.inInlineMode?d.editable.top+d.editable.height/2:Math.min(d.editable.height,d.pane.height)/2),b=b[h?"getLast":"getFirst"](function(a){return!(Q(a)||V(a))});if(!b)return null;j(a,b)&&(b=a.line.wrap[h?"getPrevious":"getNext"](function(a){return!(Q(a)||
+V(a))}));if(!g(b)||n(b)||!l(a,b))return null;w(a,b);if(!h&&b.size.top>=0&&c.y>0&&c.y<b.size.top+f){a=a.inInlineMode||d.scroll.y===0?P:R;return new e([null,b,H,L,a])}if(h&&b.size.bottom<=d.pane.height&&c.y>b.size.bottom-f&&c.y<d.pane.height){a=a.inInlineMode||b.size.bottom>d.pane.height-f&&b.size.bottom<d.pane.height?I:R;return new e([b,null,E,L,a])}return null}function p(a){var c=a.mouse,f=a.view,h=a.triggerOffset,i=b(a);if(!i)return null;w(a,i);var h=Math.min(h,0|i.size.outerHeight/2),j=[],k,o;if(c.y>
+i.size.top-1&&c.y<i.size.top+h)o=false;else if(c.y>i.size.bottom-h&&c.y<i.size.bottom+1)o=true;else return null;if(n(i)||r(a,i,o)||i.getParent().is(X))return null;var p=d(a,i,!o);if(p){if(p&&p.type==CKEDITOR.NODE_TEXT)return null;if(g(p)){if(n(p)||!l(a,p)||p.getParent().is(X))return null;j=[p,i][o?"reverse":"concat"]().concat([G,L])}}else{if(i.equals(a.editable[o?"getLast":"getFirst"](a.isRelevant))){u(a);o&&c.y>i.size.bottom-h&&c.y<f.pane.height&&i.size.bottom>f.pane.height-h&&i.size.bottom<f.pane.height?
+k=I:c.y>0&&c.y<i.size.top+h&&(k=P)}else k=R;j=[null,i][o?"reverse":"concat"]().concat([o?E:H,L,k,i.equals(a.editable[o?"getLast":"getFirst"](a.isRelevant))?o?I:P:R])}return 0 in j?new e(j):null}function t(a,b,c,d){for(var f=b.getDocumentPosition(),e={},h={},i={},g={},j=O.length;j--;){e[O[j]]=parseInt(b.getComputedStyle.call(b,"border-"+O[j]+"-width"),10)||0;i[O[j]]=parseInt(b.getComputedStyle.call(b,"padding-"+O[j]),10)||0;h[O[j]]=parseInt(b.getComputedStyle.call(b,"margin-"+O[j]),10)||0}(!c||d)&&
+x(a,d);g.top=f.y-(c?0:a.view.scroll.y);g.left=f.x-(c?0:a.view.scroll.x);g.outerWidth=b.$.offsetWidth;g.outerHeight=b.$.offsetHeight;g.height=g.outerHeight-(i.top+i.bottom+e.top+e.bottom);g.width=g.outerWidth-(i.left+i.right+e.left+e.right);g.bottom=g.top+g.outerHeight;g.right=g.left+g.outerWidth;if(a.inInlineMode)g.scroll={top:b.$.scrollTop,left:b.$.scrollLeft};return s({border:e,padding:i,margin:h,ignoreScroll:c},g,true)}function w(a,b,c){if(!g(b))return b.size=null;if(b.size){if(b.size.ignoreScroll==
+c&&b.size.date>new Date-K)return null}else b.size={};return s(b.size,t(a,b,c),{date:+new Date},true)}function u(a,b){a.view.editable=t(a,a.editable,b,true)}function x(a,b){if(!a.view)a.view={};var c=a.view;if(b||!(c&&c.date>new Date-K)){var d=a.win,c=d.getScrollPosition(),d=d.getViewPaneSize();s(a.view,{scroll:{x:c.x,y:c.y,width:a.doc.$.documentElement.scrollWidth-d.width,height:a.doc.$.documentElement.scrollHeight-d.height},pane:{width:d.width,height:d.height,bottom:d.height+c.y},date:+new Date},
+true)}}function v(a,b,c,d){for(var f=d,g=d,i=0,h=false,j=false,k=a.view.pane.height,o=a.mouse;o.y+i<k&&o.y-i>0;){h||(h=b(f,d));j||(j=b(g,d));!h&&o.y-i>0&&(f=c(a,{x:o.x,y:o.y-i}));!j&&o.y+i<k&&(g=c(a,{x:o.x,y:o.y+i}));if(h&&j)break;i=i+2}return new e([f,g,null,null])}CKEDITOR.plugins.add("magicline",{init:function(a){var c=a.config,i=c.magicline_triggerOffset||30,l={editor:a,enterMode:c.enterMode,triggerOffset:i,holdDistance:0|i*(c.magicline_holdDistance||0.5),boxColor:c.magicline_color||"#ff0000",
+rtl:c.contentsLangDirection=="rtl",tabuList:["data-cke-hidden-sel"].concat(c.magicline_tabuList||[]),triggers:c.magicline_everywhere?ea:{table:1,hr:1,div:1,ul:1,ol:1,dl:1,form:1,blockquote:1}},r,w,v;l.isRelevant=function(a){return g(a)&&!j(l,a)&&!n(a)};a.on("contentDom",function(){var g=a.editable(),i=a.document,n=a.window;s(l,{editable:g,inInlineMode:g.isInline(),doc:i,win:n,hotNode:null},true);l.boundary=l.inInlineMode?l.editable:l.doc.getDocumentElement();if(!g.is(D.$inline)){l.inInlineMode&&!q(g)&&
+g.setStyles({position:"relative",top:null,left:null});h.call(this,l);x(l);g.attachListener(a,"beforeUndoImage",function(){l.line.detach()});g.attachListener(a,"beforeGetData",function(){if(l.line.wrap.getParent()){l.line.detach();a.once("getData",function(){l.line.attach()},null,null,1E3)}},null,null,0);g.attachListener(l.inInlineMode?i:i.getWindow().getFrame(),"mouseout",function(b){if(a.mode=="wysiwyg")if(l.inInlineMode){var c=b.data.$.clientX,b=b.data.$.clientY;x(l);u(l,true);var d=l.view.editable,
+f=l.view.scroll;if(!(c>d.left-f.x&&c<d.right-f.x)||!(b>d.top-f.y&&b<d.bottom-f.y)){clearTimeout(v);v=null;l.line.detach()}}else{clearTimeout(v);v=null;l.line.detach()}});g.attachListener(g,"keyup",function(){l.hiddenMode=0});g.attachListener(g,"keydown",function(b){if(a.mode=="wysiwyg")switch(b.data.getKeystroke()){case 2228240:case 16:l.hiddenMode=1;l.line.detach()}});g.attachListener(l.inInlineMode?g:i,"mousemove",function(b){w=true;if(!(a.mode!="wysiwyg"||a.readOnly||v)){var c={x:b.data.$.clientX,
+y:b.data.$.clientY};v=setTimeout(function(){l.mouse=c;v=l.trigger=null;x(l);if(w&&!l.hiddenMode&&a.focusManager.hasFocus&&!l.line.mouseNear()&&(l.element=U(l,true))){if((l.trigger=m(l)||p(l)||Z(l))&&!o(l,l.trigger.upper||l.trigger.lower))l.line.attach().place();else{l.trigger=null;l.line.detach()}w=false}},30)}});g.attachListener(n,"scroll",function(){if(a.mode=="wysiwyg"){l.line.detach();if(B.webkit){l.hiddenMode=1;clearTimeout(r);r=setTimeout(function(){if(!l.mouseDown)l.hiddenMode=0},50)}}});g.attachListener(A?
+i:n,"mousedown",function(){if(a.mode=="wysiwyg"){l.line.detach();l.hiddenMode=1;l.mouseDown=1}});g.attachListener(A?i:n,"mouseup",function(){l.hiddenMode=0;l.mouseDown=0});a.addCommand("accessPreviousSpace",k(l));a.addCommand("accessNextSpace",k(l,true));a.setKeystroke([[c.magicline_keystrokePrevious,"accessPreviousSpace"],[c.magicline_keystrokeNext,"accessNextSpace"]]);a.on("loadSnapshot",function(){var b,c,d,f;for(f in{p:1,br:1,div:1}){b=a.document.getElementsByTag(f);for(d=b.count();d--;)if((c=
+b.getItem(d)).data("cke-magicline-hot")){l.hotNode=c;l.lastCmdDirection=c.data("cke-magicline-dir")==="true"?true:false;return}}});this.backdoor={accessFocusSpace:f,boxTrigger:e,isLine:j,getAscendantTrigger:b,getNonEmptyNeighbour:d,getSize:t,that:l,triggerEdge:p,triggerEditable:m,triggerExpand:Z}}},this)}});var s=CKEDITOR.tools.extend,y=CKEDITOR.dom.element,z=y.createFromHtml,B=CKEDITOR.env,A=CKEDITOR.env.ie&&CKEDITOR.env.version<9,D=CKEDITOR.dtd,C={},H=128,E=64,G=32,L=16,J=8,P=4,I=2,R=1,T=" ",X=
+D.$listItem,da=D.$tableContent,S=s({},D.$nonEditable,D.$empty),ea=D.$block,K=100,F="width:0px;height:0px;padding:0px;margin:0px;display:block;z-index:9999;color:#fff;position:absolute;font-size: 0px;line-height:0px;",M=F+"border-color:transparent;display:block;border-style:solid;",N="<span>"+T+"</span>";C[CKEDITOR.ENTER_BR]="br";C[CKEDITOR.ENTER_P]="p";C[CKEDITOR.ENTER_DIV]="div";e.prototype={set:function(a,b,c){this.properties=a+b+(c||R);return this},is:function(a){return(this.properties&a)==a}};
+var U=function(){function a(b,c){var d=b.$.elementFromPoint(c.x,c.y);return d&&d.nodeType?new CKEDITOR.dom.element(d):null}return function(b,c,d){if(!b.mouse)return null;var f=b.doc,e=b.line.wrap,d=d||b.mouse,g=a(f,d);if(c&&j(b,g)){e.hide();g=a(f,d);e.show()}return!g||!(g.type==CKEDITOR.NODE_ELEMENT&&g.$)||B.ie&&B.version<9&&!b.boundary.equals(g)&&!b.boundary.contains(g)?null:g}}(),Q=CKEDITOR.dom.walker.whitespaces(),V=CKEDITOR.dom.walker.nodeType(CKEDITOR.NODE_COMMENT),Z=function(){function b(f){var e=
+f.element,i,h,j;if(!g(e)||e.contains(f.editable)||e.isReadOnly())return null;j=v(f,function(a,b){return!b.equals(a)},function(a,b){return U(a,true,b)},e);i=j.upper;h=j.lower;if(a(f,i,h))return j.set(G,J);if(i&&e.contains(i))for(;!i.getParent().equals(e);)i=i.getParent();else i=e.getFirst(function(a){return d(f,a)});if(h&&e.contains(h))for(;!h.getParent().equals(e);)h=h.getParent();else h=e.getLast(function(a){return d(f,a)});if(!i||!h)return null;w(f,i);w(f,h);if(!(f.mouse.y>i.size.top&&f.mouse.y<
+h.size.bottom))return null;for(var e=Number.MAX_VALUE,k,l,o,p;h&&!h.equals(i);){if(!(l=i.getNext(f.isRelevant)))break;k=Math.abs(c(f,i,l)-f.mouse.y);if(k<e){e=k;o=i;p=l}i=l;w(f,i)}if(!o||!p||!(f.mouse.y>o.size.top&&f.mouse.y<p.size.bottom))return null;j.upper=o;j.lower=p;return j.set(G,J)}function d(a,b){return!(b&&b.type==CKEDITOR.NODE_TEXT||V(b)||n(b)||j(a,b)||b.type==CKEDITOR.NODE_ELEMENT&&b.$&&b.is("br"))}return function(c){var d=b(c),f;if(f=d){f=d.upper;var e=d.lower;f=!f||!e||n(e)||n(f)||e.equals(f)||
+f.equals(e)||e.contains(f)||f.contains(e)?false:l(c,f)&&l(c,e)&&a(c,f,e)?true:false}return f?d:null}}(),O=["top","left","right","bottom"]}(),CKEDITOR.config.magicline_keystrokePrevious=CKEDITOR.CTRL+CKEDITOR.SHIFT+51,CKEDITOR.config.magicline_keystrokeNext=CKEDITOR.CTRL+CKEDITOR.SHIFT+52,function(){function a(a){if(!a||a.type!=CKEDITOR.NODE_ELEMENT||a.getName()!="form")return[];for(var b=[],c=["style","className"],d=0;d<c.length;d++){var e=a.$.elements.namedItem(c[d]);if(e){e=new CKEDITOR.dom.element(e);
+b.push([e,e.nextSibling]);e.remove()}}return b}function e(a,b){if(a&&!(a.type!=CKEDITOR.NODE_ELEMENT||a.getName()!="form")&&b.length>0)for(var c=b.length-1;c>=0;c--){var d=b[c][0],e=b[c][1];e?d.insertBefore(e):d.appendTo(a)}}function b(b,c){var d=a(b),k={},j=b.$;if(!c){k["class"]=j.className||"";j.className=""}k.inline=j.style.cssText||"";if(!c)j.style.cssText="position: static; overflow: visible";e(d);return k}function c(b,c){var d=a(b),k=b.$;if("class"in c)k.className=c["class"];if("inline"in c)k.style.cssText=
+c.inline;e(d)}function d(a){if(!a.editable().isInline()){var b=CKEDITOR.instances,c;for(c in b){var d=b[c];if(d.mode=="wysiwyg"&&!d.readOnly){d=d.document.getBody();d.setAttribute("contentEditable",false);d.setAttribute("contentEditable",true)}}if(a.editable().hasFocus){a.toolbox.focus();a.focus()}}}CKEDITOR.plugins.add("maximize",{init:function(a){function e(){var b=j.getViewPaneSize();a.resize(b.width,b.height,null,true)}if(a.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE){var f=a.lang,k=CKEDITOR.document,
+j=k.getWindow(),g,n,q,l=CKEDITOR.TRISTATE_OFF;a.addCommand("maximize",{modes:{wysiwyg:!CKEDITOR.env.iOS,source:!CKEDITOR.env.iOS},readOnly:1,editorFocus:false,exec:function(){var o=a.container.getFirst(function(a){return a.type==CKEDITOR.NODE_ELEMENT&&a.hasClass("cke_inner")}),r=a.ui.space("contents");if(a.mode=="wysiwyg"){var m=a.getSelection();g=m&&m.getRanges();n=j.getScrollPosition()}else{var p=a.editable().$;g=!CKEDITOR.env.ie&&[p.selectionStart,p.selectionEnd];n=[p.scrollLeft,p.scrollTop]}if(this.state==
+CKEDITOR.TRISTATE_OFF){j.on("resize",e);q=j.getScrollPosition();for(m=a.container;m=m.getParent();){m.setCustomData("maximize_saved_styles",b(m));m.setStyle("z-index",a.config.baseFloatZIndex-5)}r.setCustomData("maximize_saved_styles",b(r,true));o.setCustomData("maximize_saved_styles",b(o,true));r={overflow:CKEDITOR.env.webkit?"":"hidden",width:0,height:0};k.getDocumentElement().setStyles(r);!CKEDITOR.env.gecko&&k.getDocumentElement().setStyle("position","fixed");(!CKEDITOR.env.gecko||!CKEDITOR.env.quirks)&&
+k.getBody().setStyles(r);CKEDITOR.env.ie?setTimeout(function(){j.$.scrollTo(0,0)},0):j.$.scrollTo(0,0);o.setStyle("position",CKEDITOR.env.gecko&&CKEDITOR.env.quirks?"fixed":"absolute");o.$.offsetLeft;o.setStyles({"z-index":a.config.baseFloatZIndex-5,left:"0px",top:"0px"});o.addClass("cke_maximized");e();r=o.getDocumentPosition();o.setStyles({left:-1*r.x+"px",top:-1*r.y+"px"});CKEDITOR.env.gecko&&d(a)}else if(this.state==CKEDITOR.TRISTATE_ON){j.removeListener("resize",e);for(var m=[r,o],t=0;t<m.length;t++){c(m[t],
+m[t].getCustomData("maximize_saved_styles"));m[t].removeCustomData("maximize_saved_styles")}for(m=a.container;m=m.getParent();){c(m,m.getCustomData("maximize_saved_styles"));m.removeCustomData("maximize_saved_styles")}CKEDITOR.env.ie?setTimeout(function(){j.$.scrollTo(q.x,q.y)},0):j.$.scrollTo(q.x,q.y);o.removeClass("cke_maximized");if(CKEDITOR.env.webkit){o.setStyle("display","inline");setTimeout(function(){o.setStyle("display","block")},0)}a.fire("resize",{outerHeight:a.container.$.offsetHeight,
+contentsHeight:r.$.offsetHeight,outerWidth:a.container.$.offsetWidth})}this.toggleState();if(m=this.uiItems[0]){r=this.state==CKEDITOR.TRISTATE_OFF?f.maximize.maximize:f.maximize.minimize;m=CKEDITOR.document.getById(m._.id);m.getChild(1).setHtml(r);m.setAttribute("title",r);m.setAttribute("href",'javascript:void("'+r+'");')}if(a.mode=="wysiwyg")if(g){CKEDITOR.env.gecko&&d(a);a.getSelection().selectRanges(g);(p=a.getSelection().getStartElement())&&p.scrollIntoView(true)}else j.$.scrollTo(n.x,n.y);
+else{if(g){p.selectionStart=g[0];p.selectionEnd=g[1]}p.scrollLeft=n[0];p.scrollTop=n[1]}g=n=null;l=this.state;a.fire("maximize",this.state)},canUndo:false});a.ui.addButton&&a.ui.addButton("Maximize",{label:f.maximize.maximize,command:"maximize",toolbar:"tools,10"});a.on("mode",function(){var b=a.getCommand("maximize");b.setState(b.state==CKEDITOR.TRISTATE_DISABLED?CKEDITOR.TRISTATE_DISABLED:l)},null,null,100)}}})}(),function(){function a(a,c,d){var e=CKEDITOR.cleanWord;if(e)d();else{a=CKEDITOR.getUrl(a.config.pasteFromWordCleanupFile||
+c+"filter/default.js");CKEDITOR.scriptLoader.load(a,d,null,true)}return!e}function e(a){a.data.type="html"}CKEDITOR.plugins.add("pastefromword",{requires:"clipboard",init:function(b){var c=0,d=this.path;b.addCommand("pastefromword",{canUndo:false,async:true,exec:function(a){var b=this;c=1;a.once("beforePaste",e);a.getClipboardData({title:a.lang.pastefromword.title},function(c){c&&a.fire("paste",{type:"html",dataValue:c.dataValue,method:"paste",dataTransfer:CKEDITOR.plugins.clipboard.initPasteDataTransfer()});
+a.fire("afterCommandExec",{name:"pastefromword",command:b,returnValue:!!c})})}});b.ui.addButton&&b.ui.addButton("PasteFromWord",{label:b.lang.pastefromword.toolbar,command:"pastefromword",toolbar:"clipboard,50"});b.on("pasteState",function(a){b.getCommand("pastefromword").setState(a.data)});b.on("paste",function(e){var h=e.data,f=h.dataValue;if(f&&(c||/(class=\"?Mso|style=\"[^\"]*\bmso\-|w:WordDocument)/.test(f))){h.dontFilter=true;var k=a(b,d,function(){if(k)b.fire("paste",h);else if(!b.config.pasteFromWordPromptCleanup||
+c||confirm(b.lang.pastefromword.confirmCleanup))h.dataValue=CKEDITOR.cleanWord(f,b);c=0});k&&e.cancel()}},null,null,3)}})}(),function(){var a={canUndo:false,async:true,exec:function(e){e.getClipboardData({title:e.lang.pastetext.title},function(b){b&&e.fire("paste",{type:"text",dataValue:b.dataValue,method:"paste",dataTransfer:CKEDITOR.plugins.clipboard.initPasteDataTransfer()});e.fire("afterCommandExec",{name:"pastetext",command:a,returnValue:!!b})})}};CKEDITOR.plugins.add("pastetext",{requires:"clipboard",
+init:function(e){e.addCommand("pastetext",a);e.ui.addButton&&e.ui.addButton("PasteText",{label:e.lang.pastetext.button,command:"pastetext",toolbar:"clipboard,40"});if(e.config.forcePasteAsPlainText)e.on("beforePaste",function(a){if(a.data.type!="html")a.data.type="text"});e.on("pasteState",function(a){e.getCommand("pastetext").setState(a.data)})}})}(),CKEDITOR.plugins.add("removeformat",{init:function(a){a.addCommand("removeFormat",CKEDITOR.plugins.removeformat.commands.removeformat);a.ui.addButton&&
+a.ui.addButton("RemoveFormat",{label:a.lang.removeformat.toolbar,command:"removeFormat",toolbar:"cleanup,10"})}}),CKEDITOR.plugins.removeformat={commands:{removeformat:{exec:function(a){for(var e=a._.removeFormatRegex||(a._.removeFormatRegex=RegExp("^(?:"+a.config.removeFormatTags.replace(/,/g,"|")+")$","i")),b=a._.removeAttributes||(a._.removeAttributes=a.config.removeFormatAttributes.split(",")),c=CKEDITOR.plugins.removeformat.filter,d=a.getSelection().getRanges(),i=d.createIterator(),h=function(a){return a.type==
+CKEDITOR.NODE_ELEMENT},f;f=i.getNextRange();){f.collapsed||f.enlarge(CKEDITOR.ENLARGE_ELEMENT);var k=f.createBookmark(),j=k.startNode,g=k.endNode,n=function(b){for(var d=a.elementPath(b),f=d.elements,g=1,h;h=f[g];g++){if(h.equals(d.block)||h.equals(d.blockLimit))break;e.test(h.getName())&&c(a,h)&&b.breakParent(h)}};n(j);if(g){n(g);for(j=j.getNextSourceNode(true,CKEDITOR.NODE_ELEMENT);j;){if(j.equals(g))break;if(j.isReadOnly()){if(j.getPosition(g)&CKEDITOR.POSITION_CONTAINS)break;j=j.getNext(h)}else{n=
+j.getNextSourceNode(false,CKEDITOR.NODE_ELEMENT);if(!(j.getName()=="img"&&j.data("cke-realelement"))&&c(a,j))if(e.test(j.getName()))j.remove(1);else{j.removeAttributes(b);a.fire("removeFormatCleanup",j)}j=n}}}f.moveToBookmark(k)}a.forceNextSelectionCheck();a.getSelection().selectRanges(d)}}},filter:function(a,e){for(var b=a._.removeFormatFilters||[],c=0;c<b.length;c++)if(b[c](e)===false)return false;return true}},CKEDITOR.editor.prototype.addRemoveFormatFilter=function(a){if(!this._.removeFormatFilters)this._.removeFormatFilters=
+[];this._.removeFormatFilters.push(a)},CKEDITOR.config.removeFormatTags="b,big,cite,code,del,dfn,em,font,i,ins,kbd,q,s,samp,small,span,strike,strong,sub,sup,tt,u,var",CKEDITOR.config.removeFormatAttributes="class,style,lang,width,height,align,hspace,valign",CKEDITOR.plugins.add("resize",{init:function(a){var e,b,c,d;function i(g){var h=e,i=b,k=h+(g.data.$.screenX-c)*(j=="rtl"?-1:1),g=i+(g.data.$.screenY-d);n&&(h=Math.max(f.resize_minWidth,Math.min(k,f.resize_maxWidth)));q&&(i=Math.max(f.resize_minHeight,
+Math.min(g,f.resize_maxHeight)));a.resize(n?h:null,i)}function h(){CKEDITOR.document.removeListener("mousemove",i);CKEDITOR.document.removeListener("mouseup",h);if(a.document){a.document.removeListener("mousemove",i);a.document.removeListener("mouseup",h)}}var f=a.config,k=a.ui.spaceId("resizer"),j=a.element?a.element.getDirection(1):"ltr";!f.resize_dir&&(f.resize_dir="vertical");f.resize_maxWidth===void 0&&(f.resize_maxWidth=3E3);f.resize_maxHeight===void 0&&(f.resize_maxHeight=3E3);f.resize_minWidth===
+void 0&&(f.resize_minWidth=750);f.resize_minHeight===void 0&&(f.resize_minHeight=250);if(f.resize_enabled!==false){var g=null,n=(f.resize_dir=="both"||f.resize_dir=="horizontal")&&f.resize_minWidth!=f.resize_maxWidth,q=(f.resize_dir=="both"||f.resize_dir=="vertical")&&f.resize_minHeight!=f.resize_maxHeight,l=CKEDITOR.tools.addFunction(function(j){g||(g=a.getResizable());e=g.$.offsetWidth||0;b=g.$.offsetHeight||0;c=j.screenX;d=j.screenY;f.resize_minWidth>e&&(f.resize_minWidth=e);f.resize_minHeight>
+b&&(f.resize_minHeight=b);CKEDITOR.document.on("mousemove",i);CKEDITOR.document.on("mouseup",h);if(a.document){a.document.on("mousemove",i);a.document.on("mouseup",h)}j.preventDefault&&j.preventDefault()});a.on("destroy",function(){CKEDITOR.tools.removeFunction(l)});a.on("uiSpace",function(b){if(b.data.space=="bottom"){var c="";n&&!q&&(c=" cke_resizer_horizontal");!n&&q&&(c=" cke_resizer_vertical");var d='<span id="'+k+'" class="cke_resizer'+c+" cke_resizer_"+j+'" title="'+CKEDITOR.tools.htmlEncode(a.lang.common.resize)+
+'" onmousedown="CKEDITOR.tools.callFunction('+l+', event)">'+(j=="ltr"?"◢":"◣")+"</span>";j=="ltr"&&c=="ltr"?b.data.html=b.data.html+d:b.data.html=d+b.data.html}},a,null,100);a.on("maximize",function(b){a.ui.space("resizer")[b.data==CKEDITOR.TRISTATE_ON?"hide":"show"]()})}}}),"use strict",CKEDITOR.plugins.add("scayt",{requires:"menubutton,dialog",tabToOpen:null,dialogName:"scaytDialog",init:function(a){var e=this,b=CKEDITOR.plugins.scayt;this.bindEvents(a);this.parseConfig(a);this.addRule(a);CKEDITOR.dialog.add(this.dialogName,
+CKEDITOR.getUrl(this.path+"dialogs/options.js"));this.addMenuItems(a);var c=a.lang.scayt,d=CKEDITOR.env;a.ui.add("Scayt",CKEDITOR.UI_MENUBUTTON,{label:c.text_title,title:a.plugins.wsc?a.lang.wsc.title:c.text_title,modes:{wysiwyg:!(d.ie&&(d.version<8||d.quirks))},toolbar:"spellchecker,20",refresh:function(){var c=a.ui.instances.Scayt.getState();a.scayt&&(c=b.state.scayt[a.name]?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF);a.fire("scaytButtonState",c)},onRender:function(){var b=this;a.on("scaytButtonState",
+function(a){typeof a.data!==void 0&&b.setState(a.data)})},onMenu:function(){var c=a.scayt;a.getMenuItem("scaytToggle").label=a.lang.scayt[c&&b.state.scayt[a.name]?"btn_disable":"btn_enable"];c={scaytToggle:CKEDITOR.TRISTATE_OFF,scaytOptions:c?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,scaytLangs:c?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,scaytDict:c?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,scaytAbout:c?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,WSC:a.plugins.wsc?CKEDITOR.TRISTATE_OFF:
+CKEDITOR.TRISTATE_DISABLED};a.config.scayt_uiTabs[0]||delete c.scaytOptions;a.config.scayt_uiTabs[1]||delete c.scaytLangs;a.config.scayt_uiTabs[2]||delete c.scaytDict;return c}});if(a.contextMenu&&a.addMenuItems){a.contextMenu.addListener(function(){var b=a.scayt,c,d;if(b)if(d=b.getSelectionNode()){c=e.menuGenerator(a,d);b.showBanner("."+a.contextMenu._.definition.panel.className.split(" ").join(" ."))}return c});a.contextMenu._.onHide=CKEDITOR.tools.override(a.contextMenu._.onHide,function(b){return function(){var c=
+a.scayt;c&&c.hideBanner();return b.apply(this)}})}},addMenuItems:function(a){var e=this,b=CKEDITOR.plugins.scayt;a.addMenuGroup("scaytButton");for(var c=a.config.scayt_contextMenuItemsOrder.split("|"),d=0;d<c.length;d++)c[d]="scayt_"+c[d];if((c=["grayt_description","grayt_suggest","grayt_control"].concat(c))&&c.length)for(d=0;d<c.length;d++)a.addMenuGroup(c[d],d-10);a.addCommand("scaytToggle",{exec:function(a){var c=a.scayt;b.state.scayt[a.name]=!b.state.scayt[a.name];b.state.scayt[a.name]===true?
+c||b.createScayt(a):c&&b.destroy(a)}});a.addCommand("scaytAbout",{exec:function(a){a.scayt.tabToOpen="about";a.lockSelection();a.openDialog(e.dialogName)}});a.addCommand("scaytOptions",{exec:function(a){a.scayt.tabToOpen="options";a.lockSelection();a.openDialog(e.dialogName)}});a.addCommand("scaytLangs",{exec:function(a){a.scayt.tabToOpen="langs";a.lockSelection();a.openDialog(e.dialogName)}});a.addCommand("scaytDict",{exec:function(a){a.scayt.tabToOpen="dictionaries";a.lockSelection();a.openDialog(e.dialogName)}});
+c={scaytToggle:{label:a.lang.scayt.btn_enable,group:"scaytButton",command:"scaytToggle"},scaytAbout:{label:a.lang.scayt.btn_about,group:"scaytButton",command:"scaytAbout"},scaytOptions:{label:a.lang.scayt.btn_options,group:"scaytButton",command:"scaytOptions"},scaytLangs:{label:a.lang.scayt.btn_langs,group:"scaytButton",command:"scaytLangs"},scaytDict:{label:a.lang.scayt.btn_dictionaries,group:"scaytButton",command:"scaytDict"}};if(a.plugins.wsc)c.WSC={label:a.lang.wsc.toolbar,group:"scaytButton",
+onClick:function(){var b=CKEDITOR.plugins.scayt,c=a.scayt,d=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?a.container.getText():a.document.getBody().getText();if(d=d.replace(/\s/g,"")){c&&(b.state.scayt[a.name]&&c.setMarkupPaused)&&c.setMarkupPaused(true);a.lockSelection();a.execCommand("checkspell")}else alert("Nothing to check!")}};a.addMenuItems(c)},bindEvents:function(a){var e=CKEDITOR.plugins.scayt,b=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE,c=function(){e.destroy(a)},d=function(){e.state.scayt[a.name]&&
+(!a.readOnly&&!a.scayt)&&e.createScayt(a)},i=function(){var c=a.editable();c.attachListener(c,"focus",function(){CKEDITOR.plugins.scayt&&!a.scayt&&setTimeout(d,0);var c=CKEDITOR.plugins.scayt&&CKEDITOR.plugins.scayt.state.scayt[a.name]&&a.scayt,f,e;if((b||c)&&a._.savedSelection)for(var c=a._.savedSelection.getSelectedElement(),c=!c&&a._.savedSelection.getRanges(),h=0;h<c.length;h++){e=c[h];if(typeof e.startContainer.$.nodeValue==="string"){f=e.startContainer.getText().length;(f<e.startOffset||f<e.endOffset)&&
+a.unlockSelection(false)}}},this,null,-10)},h=function(){if(b)if(a.config.scayt_inlineModeImmediateMarkup)d();else{a.on("blur",c);a.on("focus",d);a.focusManager.hasFocus&&d()}else d();i()};a.on("contentDom",h);a.on("beforeCommandExec",function(b){var c=a.scayt,d=null,g=false,h=true;if(b.data.name in e.options.disablingCommandExec&&a.mode=="wysiwyg"){if(c){e.destroy(a);a.fire("scaytButtonState",CKEDITOR.TRISTATE_DISABLED)}}else if((b.data.name==="bold"||b.data.name==="italic"||b.data.name==="underline"||
+b.data.name==="strike"||b.data.name==="subscript"||b.data.name==="superscript"||b.data.name==="enter"||b.data.name==="cut"||b.data.name==="language")&&c){if(b.data.name==="cut"){h=false;g=true}if(b.data.name==="language"){d=(d=a.plugins.language.getCurrentLangElement(a))&&d.$;g=true}a.fire("reloadMarkupScayt",{removeOptions:{removeInside:h,forceBookmark:g,selectionNode:d},timeout:0})}});a.on("beforeSetMode",function(b){if(b.data=="source"){if(b=a.scayt){e.destroy(a);a.fire("scaytButtonState",CKEDITOR.TRISTATE_DISABLED)}a.document&&
+a.document.getBody().removeAttribute("_jquid")}});a.on("afterCommandExec",function(b){var c=a.scayt;a.mode=="wysiwyg"&&(b.data.name=="undo"||b.data.name=="redo")&&c&&setTimeout(function(){c.fire("startSpellCheck, startGrammarCheck")},250)});a.on("readOnly",function(b){var c;if(b){c=a.scayt;if(b.editor.readOnly===true)c&&c.fire("removeMarkupInDocument",{});else if(c)c.fire("startSpellCheck, startGrammarCheck");else if(b.editor.mode=="wysiwyg"&&e.state.scayt[b.editor.name]===true){e.createScayt(a);
+b.editor.fire("scaytButtonState",CKEDITOR.TRISTATE_ON)}}});a.on("beforeDestroy",c);a.on("setData",function(){c();(a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE||a.plugins.divarea)&&h()},this,null,50);a.on("reloadMarkupScayt",function(b){var c=a.scayt,d=b.data&&b.data.removeOptions,b=b.data&&b.data.timeout;if(c){c.removeMarkupInSelectionNode(d);typeof b==="number"?setTimeout(function(){c.fire("startSpellCheck, startGrammarCheck")},b):c.fire("startSpellCheck, startGrammarCheck")}});a.on("insertElement",
+function(){a.fire("reloadMarkupScayt",{removeOptions:{forceBookmark:true}})},this,null,50);a.on("insertHtml",function(){a.fire("reloadMarkupScayt")},this,null,50);a.on("insertText",function(){a.fire("reloadMarkupScayt")},this,null,50);a.on("scaytDialogShown",function(b){b.data.selectPage(a.scayt.tabToOpen)});a.on("paste",function(){var b=a.scayt;b&&b.removeMarkupInSelectionNode()},null,null,0)},parseConfig:function(a){var e=CKEDITOR.plugins.scayt,b=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE;e.replaceOldOptionsNames(a.config);
+if(typeof a.config.scayt_autoStartup!=="boolean")a.config.scayt_autoStartup=false;e.state.scayt[a.name]=a.config.scayt_autoStartup;if(typeof a.config.grayt_autoStartup!=="boolean"||b||a.plugins.divarea)a.config.grayt_autoStartup=false;if(typeof a.config.scayt_inlineModeImmediateMarkup!=="boolean")a.config.scayt_inlineModeImmediateMarkup=false;e.state.grayt[a.name]=a.config.grayt_autoStartup;if(!a.config.scayt_contextCommands)a.config.scayt_contextCommands="ignore|ignoreall|add";if(!a.config.scayt_contextMenuItemsOrder)a.config.scayt_contextMenuItemsOrder=
+"suggest|moresuggest|control";if(!a.config.scayt_sLang)a.config.scayt_sLang="en_US";if(a.config.scayt_maxSuggestions===void 0||typeof a.config.scayt_maxSuggestions!="number"||a.config.scayt_maxSuggestions<0)a.config.scayt_maxSuggestions=5;if(a.config.scayt_minWordLength===void 0||typeof a.config.scayt_minWordLength!="number"||a.config.scayt_minWordLength<1)a.config.scayt_minWordLength=4;if(a.config.scayt_customDictionaryIds===void 0||typeof a.config.scayt_customDictionaryIds!=="string")a.config.scayt_customDictionaryIds=
+"";if(a.config.scayt_userDictionaryName===void 0||typeof a.config.scayt_userDictionaryName!=="string")a.config.scayt_userDictionaryName=null;if(typeof a.config.scayt_uiTabs==="string"&&a.config.scayt_uiTabs.split(",").length===3){var c=[],d=[];a.config.scayt_uiTabs=a.config.scayt_uiTabs.split(",");CKEDITOR.tools.search(a.config.scayt_uiTabs,function(a){if(Number(a)===1||Number(a)===0){d.push(true);c.push(Number(a))}else d.push(false)});a.config.scayt_uiTabs=CKEDITOR.tools.search(d,false)===null?c:
+[1,1,1]}else a.config.scayt_uiTabs=[1,1,1];if(typeof a.config.scayt_serviceProtocol!="string")a.config.scayt_serviceProtocol=null;if(typeof a.config.scayt_serviceHost!="string")a.config.scayt_serviceHost=null;if(typeof a.config.scayt_servicePort!="string")a.config.scayt_servicePort=null;if(typeof a.config.scayt_servicePath!="string")a.config.scayt_servicePath=null;if(!a.config.scayt_moreSuggestions)a.config.scayt_moreSuggestions="on";if(typeof a.config.scayt_customerId!=="string")a.config.scayt_customerId=
+"1:WvF0D4-UtPqN1-43nkD4-NKvUm2-daQqk3-LmNiI-z7Ysb4-mwry24-T8YrS3-Q2tpq2";if(typeof a.config.scayt_srcUrl!=="string"){e=document.location.protocol;e=e.search(/https?:/)!=-1?e:"http:";a.config.scayt_srcUrl=e+"//svc.webspellchecker.net/spellcheck31/lf/scayt3/ckscayt/ckscayt.js"}if(typeof CKEDITOR.config.scayt_handleCheckDirty!=="boolean")CKEDITOR.config.scayt_handleCheckDirty=true;if(typeof CKEDITOR.config.scayt_handleUndoRedo!=="boolean")CKEDITOR.config.scayt_handleUndoRedo=true;if(typeof a.config.scayt_multiLanguageMode!==
+"boolean")a.config.scayt_multiLanguageMode=false;if(typeof a.config.scayt_multiLanguageStyles!=="object")a.config.scayt_multiLanguageStyles={};if(a.config.scayt_disableOptionsStorage){var e=CKEDITOR.tools.isArray(a.config.scayt_disableOptionsStorage)?a.config.scayt_disableOptionsStorage:typeof a.config.scayt_disableOptionsStorage==="string"?[a.config.scayt_disableOptionsStorage]:void 0,i=["all","options","lang","ignore-all-caps-words","ignore-domain-names","ignore-words-with-mixed-cases","ignore-words-with-numbers"],
+h=["lang","ignore-all-caps-words","ignore-domain-names","ignore-words-with-mixed-cases","ignore-words-with-numbers"],f=CKEDITOR.tools.search,k=CKEDITOR.tools.indexOf;a.config.scayt_disableOptionsStorage=function(a){for(var b=[],c=0;c<a.length;c++){var d=a[c],e=!!f(a,"options");if(!f(i,d)||e&&f(h,function(a){if(a==="lang")return false}))return;f(h,d)&&h.splice(k(h,d),1);if(d==="all"||e&&f(a,"lang"))return[];d==="options"&&(h=["lang"])}return b=b.concat(h)}(e)}},addRule:function(a){var e=CKEDITOR.plugins.scayt,
+b=a.dataProcessor,c=b&&b.htmlFilter,d=a._.elementsPath&&a._.elementsPath.filters,b=b&&b.dataFilter,i=a.addRemoveFormatFilter,h=function(b){if(a.scayt&&(b.hasAttribute(e.options.data_attribute_name)||b.hasAttribute(e.options.problem_grammar_data_attribute)))return false},f=function(b){var c=true;if(a.scayt&&(b.hasAttribute(e.options.data_attribute_name)||b.hasAttribute(e.options.problem_grammar_data_attribute)))c=false;return c};d&&d.push(h);b&&b.addRules({elements:{span:function(a){var b=a.hasClass(e.options.misspelled_word_class)&&
+a.attributes[e.options.data_attribute_name],c=a.hasClass(e.options.problem_grammar_class)&&a.attributes[e.options.problem_grammar_data_attribute];e&&(b||c)&&delete a.name;return a}}});c&&c.addRules({elements:{span:function(a){var b=a.hasClass(e.options.misspelled_word_class)&&a.attributes[e.options.data_attribute_name],c=a.hasClass(e.options.problem_grammar_class)&&a.attributes[e.options.problem_grammar_data_attribute];e&&(b||c)&&delete a.name;return a}}});i&&i.call(a,f)},scaytMenuDefinition:function(a){var e=
+this,a=a.scayt;return{scayt:{scayt_ignore:{label:a.getLocal("btn_ignore"),group:"scayt_control",order:1,exec:function(a){a.scayt.ignoreWord()}},scayt_ignoreall:{label:a.getLocal("btn_ignoreAll"),group:"scayt_control",order:2,exec:function(a){a.scayt.ignoreAllWords()}},scayt_add:{label:a.getLocal("btn_addWord"),group:"scayt_control",order:3,exec:function(a){var c=a.scayt;setTimeout(function(){c.addWordToUserDictionary()},10)}},scayt_option:{label:a.getLocal("btn_options"),group:"scayt_control",order:4,
+exec:function(a){a.scayt.tabToOpen="options";a.lockSelection();a.openDialog(e.dialogName)},verification:function(a){return a.config.scayt_uiTabs[0]==1?true:false}},scayt_language:{label:a.getLocal("btn_langs"),group:"scayt_control",order:5,exec:function(a){a.scayt.tabToOpen="langs";a.lockSelection();a.openDialog(e.dialogName)},verification:function(a){return a.config.scayt_uiTabs[1]==1?true:false}},scayt_dictionary:{label:a.getLocal("btn_dictionaries"),group:"scayt_control",order:6,exec:function(a){a.scayt.tabToOpen=
+"dictionaries";a.lockSelection();a.openDialog(e.dialogName)},verification:function(a){return a.config.scayt_uiTabs[2]==1?true:false}},scayt_about:{label:a.getLocal("btn_about"),group:"scayt_control",order:7,exec:function(a){a.scayt.tabToOpen="about";a.lockSelection();a.openDialog(e.dialogName)}}},grayt:{grayt_problemdescription:{label:"Grammar problem description",group:"grayt_description",order:1,state:CKEDITOR.TRISTATE_DISABLED,exec:function(){}},grayt_ignore:{label:a.getLocal("btn_ignore"),group:"grayt_control",
+order:2,exec:function(a){a.scayt.ignorePhrase()}}}}},buildSuggestionMenuItems:function(a,e,b){var c={},d={},i=b?"word":"phrase",h=b?"startGrammarCheck":"startSpellCheck",f=a.scayt;if(e.length>0&&e[0]!=="no_any_suggestions")if(b)for(b=0;b<e.length;b++){var k="scayt_suggest_"+CKEDITOR.plugins.scayt.suggestions[b].replace(" ","_");a.addCommand(k,this.createCommand(CKEDITOR.plugins.scayt.suggestions[b],i,h));if(b<a.config.scayt_maxSuggestions){a.addMenuItem(k,{label:e[b],command:k,group:"scayt_suggest",
+order:b+1});c[k]=CKEDITOR.TRISTATE_OFF}else{a.addMenuItem(k,{label:e[b],command:k,group:"scayt_moresuggest",order:b+1});d[k]=CKEDITOR.TRISTATE_OFF;if(a.config.scayt_moreSuggestions==="on"){a.addMenuItem("scayt_moresuggest",{label:f.getLocal("btn_moreSuggestions"),group:"scayt_moresuggest",order:10,getItems:function(){return d}});c.scayt_moresuggest=CKEDITOR.TRISTATE_OFF}}}else for(b=0;b<e.length;b++){k="grayt_suggest_"+CKEDITOR.plugins.scayt.suggestions[b].replace(" ","_");a.addCommand(k,this.createCommand(CKEDITOR.plugins.scayt.suggestions[b],
+i,h));a.addMenuItem(k,{label:e[b],command:k,group:"grayt_suggest",order:b+1});c[k]=CKEDITOR.TRISTATE_OFF}else{c.no_scayt_suggest=CKEDITOR.TRISTATE_DISABLED;a.addCommand("no_scayt_suggest",{exec:function(){}});a.addMenuItem("no_scayt_suggest",{label:f.getLocal("btn_noSuggestions")||"no_scayt_suggest",command:"no_scayt_suggest",group:"scayt_suggest",order:0})}return c},menuGenerator:function(a,e){var b=a.scayt,c=this.scaytMenuDefinition(a),d={},i=a.config.scayt_contextCommands.split("|"),h=e.getAttribute(b.getLangAttribute())||
+b.getLang(),f,k;f=b.isScaytNode(e);k=b.isGraytNode(e);if(f){c=c.scayt;d=e.getAttribute(b.getScaytNodeAttributeName());b.fire("getSuggestionsList",{lang:h,word:d});d=this.buildSuggestionMenuItems(a,CKEDITOR.plugins.scayt.suggestions,f)}else if(k){c=c.grayt;d=e.getAttribute(b.getGraytNodeAttributeName());k=b.getProblemDescriptionText(d,h);if(c.grayt_problemdescription&&k)c.grayt_problemdescription.label=k;b.fire("getGrammarSuggestionsList",{lang:h,phrase:d});d=this.buildSuggestionMenuItems(a,CKEDITOR.plugins.scayt.suggestions,
+f)}if(f&&a.config.scayt_contextCommands=="off")return d;for(var j in c)if(!f||!(CKEDITOR.tools.indexOf(i,j.replace("scayt_",""))==-1&&a.config.scayt_contextCommands!="all")){d[j]=typeof c[j].state!="undefined"?c[j].state:CKEDITOR.TRISTATE_OFF;typeof c[j].verification==="function"&&!c[j].verification(a)&&delete d[j];a.addCommand(j,{exec:c[j].exec});a.addMenuItem(j,{label:a.lang.scayt[c[j].label]||c[j].label,command:j,group:c[j].group,order:c[j].order})}return d},createCommand:function(a,e,b){return{exec:function(c){var c=
+c.scayt,d={};d[e]=a;c.replaceSelectionNode(d);b==="startGrammarCheck"&&c.removeMarkupInSelectionNode({grammarOnly:true});c.fire(b)}}}}),CKEDITOR.plugins.scayt={state:{scayt:{},grayt:{}},suggestions:[],loadingHelper:{loadOrder:[]},isLoading:!1,options:{disablingCommandExec:{source:!0,newpage:!0,templates:!0},data_attribute_name:"data-scayt-word",misspelled_word_class:"scayt-misspell-word",problem_grammar_data_attribute:"data-grayt-phrase",problem_grammar_class:"gramm-problem"},backCompatibilityMap:{scayt_service_protocol:"scayt_serviceProtocol",
+scayt_service_host:"scayt_serviceHost",scayt_service_port:"scayt_servicePort",scayt_service_path:"scayt_servicePath",scayt_customerid:"scayt_customerId"},replaceOldOptionsNames:function(a){for(var e in a)if(e in this.backCompatibilityMap){a[this.backCompatibilityMap[e]]=a[e];delete a[e]}},createScayt:function(a){var e=this,b=CKEDITOR.plugins.scayt;this.loadScaytLibrary(a,function(a){var d=a.editable().$.nodeName=="BODY"?a.document.getWindow().$.frameElement:a.editable().$,i={lang:a.config.scayt_sLang,
+container:a.editable().$.nodeName=="BODY"?a.document.getWindow().$.frameElement:a.editable().$,customDictionary:a.config.scayt_customDictionaryIds,userDictionaryName:a.config.scayt_userDictionaryName,localization:a.langCode,customer_id:a.config.scayt_customerId,debug:a.config.scayt_debug,data_attribute_name:e.options.data_attribute_name,misspelled_word_class:e.options.misspelled_word_class,problem_grammar_data_attribute:e.options.problem_grammar_data_attribute,problem_grammar_class:e.options.problem_grammar_class,
+"options-to-restore":a.config.scayt_disableOptionsStorage,focused:a.editable().hasFocus,ignoreElementsRegex:a.config.scayt_elementsToIgnore,minWordLength:a.config.scayt_minWordLength,multiLanguageMode:a.config.scayt_multiLanguageMode,multiLanguageStyles:a.config.scayt_multiLanguageStyles,graytAutoStartup:b.state.grayt[a.name]};if(a.config.scayt_serviceProtocol)i.service_protocol=a.config.scayt_serviceProtocol;if(a.config.scayt_serviceHost)i.service_host=a.config.scayt_serviceHost;if(a.config.scayt_servicePort)i.service_port=
+a.config.scayt_servicePort;if(a.config.scayt_servicePath)i.service_path=a.config.scayt_servicePath;if(!d.id&&a.element.getAttribute("id"))d.id=a.element.getAttribute("id");d=new SCAYT.CKSCAYT(i,function(){},function(){});d.subscribe("suggestionListSend",function(a){for(var b={},c=[],d=0;d<a.suggestionList.length;d++)if(!b["word_"+a.suggestionList[d]]){b["word_"+a.suggestionList[d]]=a.suggestionList[d];c.push(a.suggestionList[d])}CKEDITOR.plugins.scayt.suggestions=c});d.subscribe("selectionIsChanged",
+function(){a.getSelection().isLocked&&a.lockSelection()});d.subscribe("graytStateChanged",function(d){b.state.grayt[a.name]=d.state});a.scayt=d;a.fire("scaytButtonState",a.readOnly?CKEDITOR.TRISTATE_DISABLED:CKEDITOR.TRISTATE_ON)})},destroy:function(a){a.scayt&&a.scayt.destroy();delete a.scayt;a.fire("scaytButtonState",CKEDITOR.TRISTATE_OFF)},loadScaytLibrary:function(a,e){var b=this,c,d;if(!this.loadingHelper[a.name])if(typeof window.SCAYT==="undefined"||typeof window.SCAYT.CKSCAYT!=="function"){this.loadingHelper[a.name]=
+e;this.loadingHelper.loadOrder.push(a.name);c=new Date;c=c.getTime();d=a.config.scayt_srcUrl;d=d+(d.indexOf("?")>=0?"":"?"+c);if(!this.loadingHelper.ckscaytLoading){CKEDITOR.scriptLoader.load(d,function(){var a;CKEDITOR.fireOnce("scaytReady");for(var c=0;c<b.loadingHelper.loadOrder.length;c++){a=b.loadingHelper.loadOrder[c];if(typeof b.loadingHelper[a]==="function")b.loadingHelper[a](CKEDITOR.instances[a]);delete b.loadingHelper[a]}b.loadingHelper.loadOrder=[]});this.loadingHelper.ckscaytLoading=
+true}}else if(window.SCAYT&&typeof window.SCAYT.CKSCAYT==="function"){CKEDITOR.fireOnce("scaytReady");a.scayt||typeof e==="function"&&e(a)}}},CKEDITOR.on("dialogDefinition",function(a){var e=a.data.name,a=a.data.definition.dialog;if(e==="scaytDialog")a.on("cancel",function(){return false},this,null,-1);if(e==="link")a.on("ok",function(a){var c=a.sender&&a.sender.getParentEditor();c&&setTimeout(function(){c.fire("reloadMarkupScayt",{removeOptions:{removeInside:true,forceBookmark:true},timeout:0})},
+0)})}),CKEDITOR.on("scaytReady",function(){if(CKEDITOR.config.scayt_handleCheckDirty===true){var a=CKEDITOR.editor.prototype;a.checkDirty=CKEDITOR.tools.override(a.checkDirty,function(a){return function(){var c=null,d=this.scayt;if(!CKEDITOR.plugins.scayt||!CKEDITOR.plugins.scayt.state.scayt[this.name]||!this.scayt)c=a.call(this);else if(c=this.status=="ready")var e=d.removeMarkupFromString(this.getSnapshot()),d=d.removeMarkupFromString(this._.previousValue),c=c&&d!==e;return c}});a.resetDirty=CKEDITOR.tools.override(a.resetDirty,
+function(a){return function(){var c=this.scayt;!CKEDITOR.plugins.scayt||!CKEDITOR.plugins.scayt.state.scayt[this.name]||!this.scayt?a.call(this):this._.previousValue=c.removeMarkupFromString(this.getSnapshot())}})}if(CKEDITOR.config.scayt_handleUndoRedo===true){var a=CKEDITOR.plugins.undo.Image.prototype,e=typeof a.equalsContent=="function"?"equalsContent":"equals";a[e]=CKEDITOR.tools.override(a[e],function(a){return function(c){var d=c.editor.scayt,e=this.contents,h=c.contents,f=null;if(CKEDITOR.plugins.scayt&&
+CKEDITOR.plugins.scayt.state.scayt[c.editor.name]&&c.editor.scayt){this.contents=d.removeMarkupFromString(e)||"";c.contents=d.removeMarkupFromString(h)||""}f=a.apply(this,arguments);this.contents=e;c.contents=h;return f}})}}),function(){function a(a,c,d){var i,h;if(d=typeof d=="string"?CKEDITOR.document.getById(d):new CKEDITOR.dom.element(d))if(i=a.fire("uiSpace",{space:c,html:""}).html){a.on("uiSpace",function(a){a.data.space==c&&a.cancel()},null,null,1);h=d.append(CKEDITOR.dom.element.createFromHtml(e.output({id:a.id,
+name:a.name,langDir:a.lang.dir,langCode:a.langCode,space:c,spaceId:a.ui.spaceId(c),content:i})));d.getCustomData("cke_hasshared")?h.hide():d.setCustomData("cke_hasshared",1);h.unselectable();h.on("mousedown",function(a){a=a.data;a.getTarget().hasAscendant("a",1)||a.preventDefault()});a.focusManager.add(h,1);a.on("focus",function(){for(var a=0,b,c=d.getChildren();b=c.getItem(a);a++)b.type==CKEDITOR.NODE_ELEMENT&&(!b.equals(h)&&b.hasClass("cke_shared"))&&b.hide();h.show()});a.on("destroy",function(){h.remove()})}}
+var e=CKEDITOR.addTemplate("sharedcontainer",'<div id="cke_{name}" class="cke {id} cke_reset_all cke_chrome cke_editor_{name} cke_shared cke_detached cke_{langDir} '+CKEDITOR.env.cssClass+'" dir="{langDir}" title="'+(CKEDITOR.env.gecko?" ":"")+'" lang="{langCode}" role="presentation"><div class="cke_inner"><div id="{spaceId}" class="cke_{space}" role="presentation">{content}</div></div></div>');CKEDITOR.plugins.add("sharedspace",{init:function(b){b.on("loaded",function(){var c=b.config.sharedSpaces;
+if(c)for(var d in c)a(b,d,c[d])},null,null,9)}})}(),function(){var a={readOnly:1,preserveState:true,editorFocus:false,exec:function(a){this.toggleState();this.refresh(a)},refresh:function(a){if(a.document){var b=this.state==CKEDITOR.TRISTATE_ON&&(a.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE||a.focusManager.hasFocus)?"attachClass":"removeClass";a.editable()[b]("cke_show_blocks")}}};CKEDITOR.plugins.add("showblocks",{onLoad:function(){var a=["p","div","pre","address","blockquote","h1","h2","h3","h4",
+"h5","h6"],b,c,d,i,h=CKEDITOR.getUrl(this.path),f=!(CKEDITOR.env.ie&&CKEDITOR.env.version<9),k=f?":not([contenteditable=false]):not(.cke_show_blocks_off)":"",j,g;for(b=c=d=i="";j=a.pop();){g=a.length?",":"";b=b+(".cke_show_blocks "+j+k+g);d=d+(".cke_show_blocks.cke_contents_ltr "+j+k+g);i=i+(".cke_show_blocks.cke_contents_rtl "+j+k+g);c=c+(".cke_show_blocks "+j+k+"{background-image:url("+CKEDITOR.getUrl(h+"images/block_"+j+".png")+")}")}CKEDITOR.addCss((b+"{background-repeat:no-repeat;border:1px dotted gray;padding-top:8px}").concat(c,
+d+"{background-position:top left;padding-left:8px}",i+"{background-position:top right;padding-right:8px}"));f||CKEDITOR.addCss(".cke_show_blocks [contenteditable=false],.cke_show_blocks .cke_show_blocks_off{border:none;padding-top:0;background-image:none}.cke_show_blocks.cke_contents_rtl [contenteditable=false],.cke_show_blocks.cke_contents_rtl .cke_show_blocks_off{padding-right:0}.cke_show_blocks.cke_contents_ltr [contenteditable=false],.cke_show_blocks.cke_contents_ltr .cke_show_blocks_off{padding-left:0}")},
+init:function(e){function b(){c.refresh(e)}if(!e.blockless){var c=e.addCommand("showblocks",a);c.canUndo=false;e.config.startupOutlineBlocks&&c.setState(CKEDITOR.TRISTATE_ON);e.ui.addButton&&e.ui.addButton("ShowBlocks",{label:e.lang.showblocks.toolbar,command:"showblocks",toolbar:"tools,20"});e.on("mode",function(){c.state!=CKEDITOR.TRISTATE_DISABLED&&c.refresh(e)});if(e.elementMode==CKEDITOR.ELEMENT_MODE_INLINE){e.on("focus",b);e.on("blur",b)}e.on("contentDom",function(){c.state!=CKEDITOR.TRISTATE_DISABLED&&
+c.refresh(e)})}}})}(),function(){var a={preserveState:true,editorFocus:false,readOnly:1,exec:function(a){this.toggleState();this.refresh(a)},refresh:function(a){if(a.document){var b=this.state==CKEDITOR.TRISTATE_ON?"attachClass":"removeClass";a.editable()[b]("cke_show_borders")}}};CKEDITOR.plugins.add("showborders",{modes:{wysiwyg:1},onLoad:function(){var a;a=(CKEDITOR.env.ie6Compat?[".%1 table.%2,",".%1 table.%2 td, .%1 table.%2 th","{","border : #d3d3d3 1px dotted","}"]:[".%1 table.%2,",".%1 table.%2 > tr > td, .%1 table.%2 > tr > th,",
+".%1 table.%2 > tbody > tr > td, .%1 table.%2 > tbody > tr > th,",".%1 table.%2 > thead > tr > td, .%1 table.%2 > thead > tr > th,",".%1 table.%2 > tfoot > tr > td, .%1 table.%2 > tfoot > tr > th","{","border : #d3d3d3 1px dotted","}"]).join("").replace(/%2/g,"cke_show_border").replace(/%1/g,"cke_show_borders ");CKEDITOR.addCss(a)},init:function(e){var b=e.addCommand("showborders",a);b.canUndo=false;e.config.startupShowBorders!==false&&b.setState(CKEDITOR.TRISTATE_ON);e.on("mode",function(){b.state!=
+CKEDITOR.TRISTATE_DISABLED&&b.refresh(e)},null,null,100);e.on("contentDom",function(){b.state!=CKEDITOR.TRISTATE_DISABLED&&b.refresh(e)});e.on("removeFormatCleanup",function(a){a=a.data;e.getCommand("showborders").state==CKEDITOR.TRISTATE_ON&&(a.is("table")&&(!a.hasAttribute("border")||parseInt(a.getAttribute("border"),10)<=0))&&a.addClass("cke_show_border")})},afterInit:function(a){var b=a.dataProcessor,a=b&&b.dataFilter,b=b&&b.htmlFilter;a&&a.addRules({elements:{table:function(a){var a=a.attributes,
+b=a["class"],e=parseInt(a.border,10);if((!e||e<=0)&&(!b||b.indexOf("cke_show_border")==-1))a["class"]=(b||"")+" cke_show_border"}}});b&&b.addRules({elements:{table:function(a){var a=a.attributes,b=a["class"];b&&(a["class"]=b.replace("cke_show_border","").replace(/\s{2}/," ").replace(/^\s+|\s+$/,""))}}})}});CKEDITOR.on("dialogDefinition",function(a){var b=a.data.name;if(b=="table"||b=="tableProperties"){a=a.data.definition;b=a.getContents("info").get("txtBorder");b.commit=CKEDITOR.tools.override(b.commit,
+function(a){return function(b,e){a.apply(this,arguments);var h=parseInt(this.getValue(),10);e[!h||h<=0?"addClass":"removeClass"]("cke_show_border")}});if(a=(a=a.getContents("advanced"))&&a.get("advCSSClasses")){a.setup=CKEDITOR.tools.override(a.setup,function(a){return function(){a.apply(this,arguments);this.setValue(this.getValue().replace(/cke_show_border/,""))}});a.commit=CKEDITOR.tools.override(a.commit,function(a){return function(b,e){a.apply(this,arguments);parseInt(e.getAttribute("border"),
+10)||e.addClass("cke_show_border")}})}}})}(),function(){CKEDITOR.plugins.add("sourcearea",{init:function(e){function b(){var a=d&&this.equals(CKEDITOR.document.getActive());this.hide();this.setStyle("height",this.getParent().$.clientHeight+"px");this.setStyle("width",this.getParent().$.clientWidth+"px");this.show();a&&this.focus()}if(e.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE){var c=CKEDITOR.plugins.sourcearea;e.addMode("source",function(c){var d=e.ui.space("contents").getDocument().createElement("textarea");
+d.setStyles(CKEDITOR.tools.extend({width:CKEDITOR.env.ie7Compat?"99%":"100%",height:"100%",resize:"none",outline:"none","text-align":"left"},CKEDITOR.tools.cssVendorPrefix("tab-size",e.config.sourceAreaTabSize||4)));d.setAttribute("dir","ltr");d.addClass("cke_source").addClass("cke_reset").addClass("cke_enable_context_menu");e.ui.space("contents").append(d);d=e.editable(new a(e,d));d.setData(e.getData(1));if(CKEDITOR.env.ie){d.attachListener(e,"resize",b,d);d.attachListener(CKEDITOR.document.getWindow(),
+"resize",b,d);CKEDITOR.tools.setTimeout(b,0,d)}e.fire("ariaWidget",this);c()});e.addCommand("source",c.commands.source);e.ui.addButton&&e.ui.addButton("Source",{label:e.lang.sourcearea.toolbar,command:"source",toolbar:"mode,10"});e.on("mode",function(){e.getCommand("source").setState(e.mode=="source"?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF)});var d=CKEDITOR.env.ie&&CKEDITOR.env.version==9}}});var a=CKEDITOR.tools.createClass({base:CKEDITOR.editable,proto:{setData:function(a){this.setValue(a);this.status=
+"ready";this.editor.fire("dataReady")},getData:function(){return this.getValue()},insertHtml:function(){},insertElement:function(){},insertText:function(){},setReadOnly:function(a){this[(a?"set":"remove")+"Attribute"]("readOnly","readonly")},detach:function(){a.baseProto.detach.call(this);this.clearCustomData();this.remove()}}})}(),CKEDITOR.plugins.sourcearea={commands:{source:{modes:{wysiwyg:1,source:1},editorFocus:!1,readOnly:1,exec:function(a){a.mode=="wysiwyg"&&a.fire("saveSnapshot");a.getCommand("source").setState(CKEDITOR.TRISTATE_DISABLED);
+a.setMode(a.mode=="source"?"wysiwyg":"source")},canUndo:!1}}},CKEDITOR.plugins.add("listblock",{requires:"panel",onLoad:function(){var a=CKEDITOR.addTemplate("panel-list",'<ul role="presentation" class="cke_panel_list">{items}</ul>'),e=CKEDITOR.addTemplate("panel-list-item",'<li id="{id}" class="cke_panel_listItem" role=presentation><a id="{id}_option" _cke_focus=1 hidefocus=true title="{title}" href="javascript:void(\'{val}\')"  {onclick}="CKEDITOR.tools.callFunction({clickFn},\'{val}\'); return false;" role="option">{text}</a></li>'),
+b=CKEDITOR.addTemplate("panel-list-group",'<h1 id="{id}" class="cke_panel_grouptitle" role="presentation" >{label}</h1>'),c=/\'/g;CKEDITOR.ui.panel.prototype.addListBlock=function(a,b){return this.addBlock(a,new CKEDITOR.ui.listBlock(this.getHolderElement(),b))};CKEDITOR.ui.listBlock=CKEDITOR.tools.createClass({base:CKEDITOR.ui.panel.block,$:function(a,b){var b=b||{},c=b.attributes||(b.attributes={});(this.multiSelect=!!b.multiSelect)&&(c["aria-multiselectable"]=true);!c.role&&(c.role="listbox");
+this.base.apply(this,arguments);this.element.setAttribute("role",c.role);c=this.keys;c[40]="next";c[9]="next";c[38]="prev";c[CKEDITOR.SHIFT+9]="prev";c[32]=CKEDITOR.env.ie?"mouseup":"click";CKEDITOR.env.ie&&(c[13]="mouseup");this._.pendingHtml=[];this._.pendingList=[];this._.items={};this._.groups={}},_:{close:function(){if(this._.started){var b=a.output({items:this._.pendingList.join("")});this._.pendingList=[];this._.pendingHtml.push(b);delete this._.started}},getClick:function(){if(!this._.click)this._.click=
+CKEDITOR.tools.addFunction(function(a){var b=this.toggle(a);if(this.onClick)this.onClick(a,b)},this);return this._.click}},proto:{add:function(a,b,h){var f=CKEDITOR.tools.getNextId();if(!this._.started){this._.started=1;this._.size=this._.size||0}this._.items[a]=f;var k;k=CKEDITOR.tools.htmlEncodeAttr(a).replace(c,"\\'");a={id:f,val:k,onclick:CKEDITOR.env.ie?'onclick="return false;" onmouseup':"onclick",clickFn:this._.getClick(),title:CKEDITOR.tools.htmlEncodeAttr(h||a),text:b||a};this._.pendingList.push(e.output(a))},
+startGroup:function(a){this._.close();var c=CKEDITOR.tools.getNextId();this._.groups[a]=c;this._.pendingHtml.push(b.output({id:c,label:a}))},commit:function(){this._.close();this.element.appendHtml(this._.pendingHtml.join(""));delete this._.size;this._.pendingHtml=[]},toggle:function(a){var b=this.isMarked(a);b?this.unmark(a):this.mark(a);return!b},hideGroup:function(a){var b=(a=this.element.getDocument().getById(this._.groups[a]))&&a.getNext();if(a){a.setStyle("display","none");b&&b.getName()=="ul"&&
+b.setStyle("display","none")}},hideItem:function(a){this.element.getDocument().getById(this._.items[a]).setStyle("display","none")},showAll:function(){var a=this._.items,b=this._.groups,c=this.element.getDocument(),f;for(f in a)c.getById(a[f]).setStyle("display","");for(var e in b){a=c.getById(b[e]);f=a.getNext();a.setStyle("display","");f&&f.getName()=="ul"&&f.setStyle("display","")}},mark:function(a){this.multiSelect||this.unmarkAll();var a=this._.items[a],b=this.element.getDocument().getById(a);
+b.addClass("cke_selected");this.element.getDocument().getById(a+"_option").setAttribute("aria-selected",true);this.onMark&&this.onMark(b)},unmark:function(a){var b=this.element.getDocument(),a=this._.items[a],c=b.getById(a);c.removeClass("cke_selected");b.getById(a+"_option").removeAttribute("aria-selected");this.onUnmark&&this.onUnmark(c)},unmarkAll:function(){var a=this._.items,b=this.element.getDocument(),c;for(c in a){var f=a[c];b.getById(f).removeClass("cke_selected");b.getById(f+"_option").removeAttribute("aria-selected")}this.onUnmark&&
+this.onUnmark()},isMarked:function(a){return this.element.getDocument().getById(this._.items[a]).hasClass("cke_selected")},focus:function(a){this._.focusIndex=-1;var b=this.element.getElementsByTag("a"),c,f=-1;if(a)for(c=this.element.getDocument().getById(this._.items[a]).getFirst();a=b.getItem(++f);){if(a.equals(c)){this._.focusIndex=f;break}}else this.element.focus();c&&setTimeout(function(){c.focus()},0)}}})}}),CKEDITOR.plugins.add("richcombo",{requires:"floatpanel,listblock,button",beforeInit:function(a){a.ui.addHandler(CKEDITOR.UI_RICHCOMBO,
+CKEDITOR.ui.richCombo.handler)}}),function(){var a='<span id="{id}" class="cke_combo cke_combo__{name} {cls}" role="presentation"><span id="{id}_label" class="cke_combo_label">{label}</span><a class="cke_combo_button" title="{title}" tabindex="-1"'+(CKEDITOR.env.gecko&&!CKEDITOR.env.hc?"":" href=\"javascript:void('{titleJs}')\"")+' hidefocus="true" role="button" aria-labelledby="{id}_label" aria-haspopup="true"';CKEDITOR.env.gecko&&CKEDITOR.env.mac&&(a=a+' onkeypress="return false;"');CKEDITOR.env.gecko&&
+(a=a+' onblur="this.style.cssText = this.style.cssText;"');var a=a+(' onkeydown="return CKEDITOR.tools.callFunction({keydownFn},event,this);" onfocus="return CKEDITOR.tools.callFunction({focusFn},event);" '+(CKEDITOR.env.ie?'onclick="return false;" onmouseup':"onclick")+'="CKEDITOR.tools.callFunction({clickFn},this);return false;"><span id="{id}_text" class="cke_combo_text cke_combo_inlinelabel">{label}</span><span class="cke_combo_open"><span class="cke_combo_arrow">'+(CKEDITOR.env.hc?"&#9660;":
+CKEDITOR.env.air?"&nbsp;":"")+"</span></span></a></span>"),e=CKEDITOR.addTemplate("combo",a);CKEDITOR.UI_RICHCOMBO="richcombo";CKEDITOR.ui.richCombo=CKEDITOR.tools.createClass({$:function(a){CKEDITOR.tools.extend(this,a,{canGroup:false,title:a.label,modes:{wysiwyg:1},editorFocus:1});a=this.panel||{};delete this.panel;this.id=CKEDITOR.tools.getNextNumber();this.document=a.parent&&a.parent.getDocument()||CKEDITOR.document;a.className="cke_combopanel";a.block={multiSelect:a.multiSelect,attributes:a.attributes};
+a.toolbarRelated=true;this._={panelDefinition:a,items:{}}},proto:{renderHtml:function(a){var c=[];this.render(a,c);return c.join("")},render:function(a,c){function d(){if(this.getState()!=CKEDITOR.TRISTATE_ON){var c=this.modes[a.mode]?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED;if(a.readOnly&&!this.readOnly)c=CKEDITOR.TRISTATE_DISABLED;this.setState(c);this.setValue("");c!=CKEDITOR.TRISTATE_DISABLED&&this.refresh&&this.refresh()}}var i=CKEDITOR.env,h="cke_"+this.id,f=CKEDITOR.tools.addFunction(function(c){if(q){a.unlockSelection(1);
+q=0}j.execute(c)},this),k=this,j={id:h,combo:this,focus:function(){CKEDITOR.document.getById(h).getChild(1).focus()},execute:function(c){var d=k._;if(d.state!=CKEDITOR.TRISTATE_DISABLED){k.createPanel(a);if(d.on)d.panel.hide();else{k.commit();var f=k.getValue();f?d.list.mark(f):d.list.unmarkAll();d.panel.showBlock(k.id,new CKEDITOR.dom.element(c),4)}}},clickFn:f};a.on("activeFilterChange",d,this);a.on("mode",d,this);a.on("selectionChange",d,this);!this.readOnly&&a.on("readOnly",d,this);var g=CKEDITOR.tools.addFunction(function(c,
+d){var c=new CKEDITOR.dom.event(c),e=c.getKeystroke();if(e==40)a.once("panelShow",function(a){a.data._.panel._.currentBlock.onKeyDown(40)});switch(e){case 13:case 32:case 40:CKEDITOR.tools.callFunction(f,d);break;default:j.onkey(j,e)}c.preventDefault()}),n=CKEDITOR.tools.addFunction(function(){j.onfocus&&j.onfocus()}),q=0;j.keyDownFn=g;i={id:h,name:this.name||this.command,label:this.label,title:this.title,cls:this.className||"",titleJs:i.gecko&&!i.hc?"":(this.title||"").replace("'",""),keydownFn:g,
+focusFn:n,clickFn:f};e.output(i,c);if(this.onRender)this.onRender();return j},createPanel:function(a){if(!this._.panel){var c=this._.panelDefinition,d=this._.panelDefinition.block,e=c.parent||CKEDITOR.document.getBody(),h="cke_combopanel__"+this.name,f=new CKEDITOR.ui.floatPanel(a,e,c),k=f.addListBlock(this.id,d),j=this;f.onShow=function(){this.element.addClass(h);j.setState(CKEDITOR.TRISTATE_ON);j._.on=1;j.editorFocus&&!a.focusManager.hasFocus&&a.focus();if(j.onOpen)j.onOpen();a.once("panelShow",
+function(){k.focus(!k.multiSelect&&j.getValue())})};f.onHide=function(c){this.element.removeClass(h);j.setState(j.modes&&j.modes[a.mode]?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED);j._.on=0;if(!c&&j.onClose)j.onClose()};f.onEscape=function(){f.hide(1)};k.onClick=function(a,b){j.onClick&&j.onClick.call(j,a,b);f.hide()};this._.panel=f;this._.list=k;f.getBlock(this.id).onHide=function(){j._.on=0;j.setState(CKEDITOR.TRISTATE_OFF)};this.init&&this.init()}},setValue:function(a,c){this._.value=a;var d=
+this.document.getById("cke_"+this.id+"_text");if(d){if(!a&&!c){c=this.label;d.addClass("cke_combo_inlinelabel")}else d.removeClass("cke_combo_inlinelabel");d.setText(typeof c!="undefined"?c:a)}},getValue:function(){return this._.value||""},unmarkAll:function(){this._.list.unmarkAll()},mark:function(a){this._.list.mark(a)},hideItem:function(a){this._.list.hideItem(a)},hideGroup:function(a){this._.list.hideGroup(a)},showAll:function(){this._.list.showAll()},add:function(a,c,d){this._.items[a]=d||a;
+this._.list.add(a,c,d)},startGroup:function(a){this._.list.startGroup(a)},commit:function(){if(!this._.committed){this._.list.commit();this._.committed=1;CKEDITOR.ui.fire("ready",this)}this._.committed=1},setState:function(a){if(this._.state!=a){var c=this.document.getById("cke_"+this.id);c.setState(a,"cke_combo");a==CKEDITOR.TRISTATE_DISABLED?c.setAttribute("aria-disabled",true):c.removeAttribute("aria-disabled");this._.state=a}},getState:function(){return this._.state},enable:function(){this._.state==
+CKEDITOR.TRISTATE_DISABLED&&this.setState(this._.lastState)},disable:function(){if(this._.state!=CKEDITOR.TRISTATE_DISABLED){this._.lastState=this._.state;this.setState(CKEDITOR.TRISTATE_DISABLED)}}},statics:{handler:{create:function(a){return new CKEDITOR.ui.richCombo(a)}}}});CKEDITOR.ui.prototype.addRichCombo=function(a,c){this.add(a,CKEDITOR.UI_RICHCOMBO,c)}}(),function(){CKEDITOR.plugins.add("stylescombo",{requires:"richcombo",init:function(a){var e=a.config,b=a.lang.stylescombo,c={},d=[],i=[];
+a.on("stylesSet",function(b){if(b=b.data.styles){for(var f,k,j,g=0,n=b.length;g<n;g++){f=b[g];if(!(a.blockless&&f.element in CKEDITOR.dtd.$block)){k=f.name;f=new CKEDITOR.style(f);if(!a.filter.customConfig||a.filter.check(f)){f._name=k;f._.enterMode=e.enterMode;f._.type=j=f.assignedTo||f.type;f._.weight=g+(j==CKEDITOR.STYLE_OBJECT?1:j==CKEDITOR.STYLE_BLOCK?2:3)*1E3;c[k]=f;d.push(f);i.push(f)}}}d.sort(function(a,b){return a._.weight-b._.weight})}});a.ui.addRichCombo("Styles",{label:b.label,title:b.panelTitle,
+toolbar:"styles,10",allowedContent:i,panel:{css:[CKEDITOR.skin.getPath("editor")].concat(e.contentsCss),multiSelect:true,attributes:{"aria-label":b.panelTitle}},init:function(){var a,c,e,i,g,n;g=0;for(n=d.length;g<n;g++){a=d[g];c=a._name;i=a._.type;if(i!=e){this.startGroup(b["panelTitle"+i]);e=i}this.add(c,a.type==CKEDITOR.STYLE_OBJECT?c:a.buildPreview(),c)}this.commit()},onClick:function(b){a.focus();a.fire("saveSnapshot");var b=c[b],d=a.elementPath();a[b.checkActive(d,a)?"removeStyle":"applyStyle"](b);
+a.fire("saveSnapshot")},onRender:function(){a.on("selectionChange",function(b){for(var d=this.getValue(),b=b.data.path.elements,e=0,i=b.length,g;e<i;e++){g=b[e];for(var n in c)if(c[n].checkElementRemovable(g,true,a)){n!=d&&this.setValue(n);return}}this.setValue("")},this)},onOpen:function(){var d=a.getSelection().getSelectedElement(),d=a.elementPath(d),e=[0,0,0,0];this.showAll();this.unmarkAll();for(var i in c){var j=c[i],g=j._.type;j.checkApplicable(d,a,a.activeFilter)?e[g]++:this.hideItem(i);j.checkActive(d,
+a)&&this.mark(i)}e[CKEDITOR.STYLE_BLOCK]||this.hideGroup(b["panelTitle"+CKEDITOR.STYLE_BLOCK]);e[CKEDITOR.STYLE_INLINE]||this.hideGroup(b["panelTitle"+CKEDITOR.STYLE_INLINE]);e[CKEDITOR.STYLE_OBJECT]||this.hideGroup(b["panelTitle"+CKEDITOR.STYLE_OBJECT])},refresh:function(){var b=a.elementPath();if(b){for(var d in c)if(c[d].checkApplicable(b,a,a.activeFilter))return;this.setState(CKEDITOR.TRISTATE_DISABLED)}},reset:function(){c={};d=[]}})}})}(),function(){function a(a){return{editorFocus:false,canUndo:false,
+modes:{wysiwyg:1},exec:function(b){if(b.editable().hasFocus){var c=b.getSelection(),e;if(e=(new CKEDITOR.dom.elementPath(c.getCommonAncestor(),c.root)).contains({td:1,th:1},1)){var c=b.createRange(),k=CKEDITOR.tools.tryThese(function(){var b=e.getParent().$.cells[e.$.cellIndex+(a?-1:1)];b.parentNode.parentNode;return b},function(){var b=e.getParent(),b=b.getAscendant("table").$.rows[b.$.rowIndex+(a?-1:1)];return b.cells[a?b.cells.length-1:0]});if(!k&&!a){for(var j=e.getAscendant("table").$,k=e.getParent().$.cells,
+j=new CKEDITOR.dom.element(j.insertRow(-1),b.document),g=0,n=k.length;g<n;g++)j.append((new CKEDITOR.dom.element(k[g],b.document)).clone(false,false)).appendBogus();c.moveToElementEditStart(j)}else if(k){k=new CKEDITOR.dom.element(k);c.moveToElementEditStart(k);(!c.checkStartOfBlock()||!c.checkEndOfBlock())&&c.selectNodeContents(k)}else return true;c.select(true);return true}}return false}}}var e={editorFocus:false,modes:{wysiwyg:1,source:1}},b={exec:function(a){a.container.focusNext(true,a.tabIndex)}},
+c={exec:function(a){a.container.focusPrevious(true,a.tabIndex)}};CKEDITOR.plugins.add("tab",{init:function(d){for(var i=d.config.enableTabKeyTools!==false,h=d.config.tabSpaces||0,f="";h--;)f=f+" ";if(f)d.on("key",function(a){if(a.data.keyCode==9){d.insertText(f);a.cancel()}});if(i)d.on("key",function(a){(a.data.keyCode==9&&d.execCommand("selectNextCell")||a.data.keyCode==CKEDITOR.SHIFT+9&&d.execCommand("selectPreviousCell"))&&a.cancel()});d.addCommand("blur",CKEDITOR.tools.extend(b,e));d.addCommand("blurBack",
+CKEDITOR.tools.extend(c,e));d.addCommand("selectNextCell",a());d.addCommand("selectPreviousCell",a(true))}})}(),CKEDITOR.dom.element.prototype.focusNext=function(a,e){var b=e===void 0?this.getTabIndex():e,c,d,i,h,f,k;if(b<=0)for(f=this.getNextSourceNode(a,CKEDITOR.NODE_ELEMENT);f;){if(f.isVisible()&&f.getTabIndex()===0){i=f;break}f=f.getNextSourceNode(false,CKEDITOR.NODE_ELEMENT)}else for(f=this.getDocument().getBody().getFirst();f=f.getNextSourceNode(false,CKEDITOR.NODE_ELEMENT);){if(!c)if(!d&&f.equals(this)){d=
+true;if(a){if(!(f=f.getNextSourceNode(true,CKEDITOR.NODE_ELEMENT)))break;c=1}}else d&&!this.contains(f)&&(c=1);if(f.isVisible()&&!((k=f.getTabIndex())<0)){if(c&&k==b){i=f;break}if(k>b&&(!i||!h||k<h)){i=f;h=k}else if(!i&&k===0){i=f;h=k}}}i&&i.focus()},CKEDITOR.dom.element.prototype.focusPrevious=function(a,e){for(var b=e===void 0?this.getTabIndex():e,c,d,i,h=0,f,k=this.getDocument().getBody().getLast();k=k.getPreviousSourceNode(false,CKEDITOR.NODE_ELEMENT);){if(!c)if(!d&&k.equals(this)){d=true;if(a){if(!(k=
+k.getPreviousSourceNode(true,CKEDITOR.NODE_ELEMENT)))break;c=1}}else d&&!this.contains(k)&&(c=1);if(k.isVisible()&&!((f=k.getTabIndex())<0))if(b<=0){if(c&&f===0){i=k;break}if(f>h){i=k;h=f}}else{if(c&&f==b){i=k;break}if(f<b&&(!i||f>h)){i=k;h=f}}}i&&i.focus()},CKEDITOR.plugins.add("table",{requires:"dialog",init:function(a){function e(a){return CKEDITOR.tools.extend(a||{},{contextSensitive:1,refresh:function(a,b){this.setState(b.contains("table",1)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED)}})}
+if(!a.blockless){var b=a.lang.table;a.addCommand("table",new CKEDITOR.dialogCommand("table",{context:"table",allowedContent:"table{width,height}[align,border,cellpadding,cellspacing,summary];caption tbody thead tfoot;th td tr[scope];"+(a.plugins.dialogadvtab?"table"+a.plugins.dialogadvtab.allowedContent():""),requiredContent:"table",contentTransformations:[["table{width}: sizeToStyle","table[width]: sizeToAttribute"]]}));a.addCommand("tableProperties",new CKEDITOR.dialogCommand("tableProperties",
+e()));a.addCommand("tableDelete",e({exec:function(a){var b=a.elementPath().contains("table",1);if(b){var e=b.getParent(),h=a.editable();e.getChildCount()==1&&(!e.is("td","th")&&!e.equals(h))&&(b=e);a=a.createRange();a.moveToPosition(b,CKEDITOR.POSITION_BEFORE_START);b.remove();a.select()}}}));a.ui.addButton&&a.ui.addButton("Table",{label:b.toolbar,command:"table",toolbar:"insert,30"});CKEDITOR.dialog.add("table",this.path+"dialogs/table.js");CKEDITOR.dialog.add("tableProperties",this.path+"dialogs/table.js");
+a.addMenuItems&&a.addMenuItems({table:{label:b.menu,command:"tableProperties",group:"table",order:5},tabledelete:{label:b.deleteTable,command:"tableDelete",group:"table",order:1}});a.on("doubleclick",function(a){if(a.data.element.is("table"))a.data.dialog="tableProperties"});a.contextMenu&&a.contextMenu.addListener(function(){return{tabledelete:CKEDITOR.TRISTATE_OFF,table:CKEDITOR.TRISTATE_OFF}})}}}),function(){function a(a){function b(a){if(!(c.length>0)&&a.type==CKEDITOR.NODE_ELEMENT&&q.test(a.getName())&&
+!a.getCustomData("selected_cell")){CKEDITOR.dom.element.setMarker(d,a,"selected_cell",true);c.push(a)}}for(var a=a.getRanges(),c=[],d={},e=0;e<a.length;e++){var f=a[e];if(f.collapsed){f=f.getCommonAncestor();(f=f.getAscendant("td",true)||f.getAscendant("th",true))&&c.push(f)}else{var f=new CKEDITOR.dom.walker(f),g;for(f.guard=b;g=f.next();)if(g.type!=CKEDITOR.NODE_ELEMENT||!g.is(CKEDITOR.dtd.table))if((g=g.getAscendant("td",true)||g.getAscendant("th",true))&&!g.getCustomData("selected_cell")){CKEDITOR.dom.element.setMarker(d,
+g,"selected_cell",true);c.push(g)}}}CKEDITOR.dom.element.clearAllMarkers(d);return c}function e(b,c){for(var d=a(b),e=d[0],f=e.getAscendant("table"),e=e.getDocument(),g=d[0].getParent(),h=g.$.rowIndex,d=d[d.length-1],i=d.getParent().$.rowIndex+d.$.rowSpan-1,d=new CKEDITOR.dom.element(f.$.rows[i]),h=c?h:i,g=c?g:d,d=CKEDITOR.tools.buildTableMap(f),f=d[h],h=c?d[h-1]:d[h+1],d=d[0].length,e=e.createElement("tr"),i=0;f[i]&&i<d;i++){var j;if(f[i].rowSpan>1&&h&&f[i]==h[i]){j=f[i];j.rowSpan=j.rowSpan+1}else{j=
+(new CKEDITOR.dom.element(f[i])).clone();j.removeAttribute("rowSpan");j.appendBogus();e.append(j);j=j.$}i=i+(j.colSpan-1)}c?e.insertBefore(g):e.insertAfter(g)}function b(c){if(c instanceof CKEDITOR.dom.selection){for(var d=a(c),e=d[0].getAscendant("table"),f=CKEDITOR.tools.buildTableMap(e),c=d[0].getParent().$.rowIndex,d=d[d.length-1],g=d.getParent().$.rowIndex+d.$.rowSpan-1,d=[],h=c;h<=g;h++){for(var i=f[h],j=new CKEDITOR.dom.element(e.$.rows[h]),k=0;k<i.length;k++){var n=new CKEDITOR.dom.element(i[k]),
+q=n.getParent().$.rowIndex;if(n.$.rowSpan==1)n.remove();else{n.$.rowSpan=n.$.rowSpan-1;if(q==h){q=f[h+1];q[k-1]?n.insertAfter(new CKEDITOR.dom.element(q[k-1])):(new CKEDITOR.dom.element(e.$.rows[h+1])).append(n,1)}}k=k+(n.$.colSpan-1)}d.push(j)}f=e.$.rows;e=new CKEDITOR.dom.element(f[g+1]||(c>0?f[c-1]:null)||e.$.parentNode);for(h=d.length;h>=0;h--)b(d[h]);return e}if(c instanceof CKEDITOR.dom.element){e=c.getAscendant("table");e.$.rows.length==1?e.remove():c.remove()}return null}function c(a,b){for(var c=
+b?Infinity:0,d=0;d<a.length;d++){var e;e=a[d];for(var f=b,g=e.getParent().$.cells,h=0,i=0;i<g.length;i++){var j=g[i],h=h+(f?1:j.colSpan);if(j==e.$)break}e=h-1;if(b?e<c:e>c)c=e}return c}function d(b,d){for(var e=a(b),f=e[0].getAscendant("table"),g=c(e,1),e=c(e),g=d?g:e,h=CKEDITOR.tools.buildTableMap(f),f=[],e=[],i=h.length,j=0;j<i;j++){f.push(h[j][g]);e.push(d?h[j][g-1]:h[j][g+1])}for(j=0;j<i;j++)if(f[j]){if(f[j].colSpan>1&&e[j]==f[j]){g=f[j];g.colSpan=g.colSpan+1}else{g=(new CKEDITOR.dom.element(f[j])).clone();
+g.removeAttribute("colSpan");g.appendBogus();g[d?"insertBefore":"insertAfter"].call(g,new CKEDITOR.dom.element(f[j]));g=g.$}j=j+(g.rowSpan-1)}}function i(a,b){var c=a.getStartElement();if(c=c.getAscendant("td",1)||c.getAscendant("th",1)){var d=c.clone();d.appendBogus();b?d.insertBefore(c):d.insertAfter(c)}}function h(b){if(b instanceof CKEDITOR.dom.selection){var b=a(b),c=b[0]&&b[0].getAscendant("table"),d;a:{var e=0;d=b.length-1;for(var g={},i,j;i=b[e++];)CKEDITOR.dom.element.setMarker(g,i,"delete_cell",
+true);for(e=0;i=b[e++];)if((j=i.getPrevious())&&!j.getCustomData("delete_cell")||(j=i.getNext())&&!j.getCustomData("delete_cell")){CKEDITOR.dom.element.clearAllMarkers(g);d=j;break a}CKEDITOR.dom.element.clearAllMarkers(g);j=b[0].getParent();if(j=j.getPrevious())d=j.getLast();else{j=b[d].getParent();d=(j=j.getNext())?j.getChild(0):null}}for(j=b.length-1;j>=0;j--)h(b[j]);d?f(d,true):c&&c.remove()}else if(b instanceof CKEDITOR.dom.element){c=b.getParent();c.getChildCount()==1?c.remove():b.remove()}}
+function f(a,b){var c=a.getDocument(),d=CKEDITOR.document;if(CKEDITOR.env.ie&&CKEDITOR.env.version==10){d.focus();c.focus()}c=new CKEDITOR.dom.range(c);if(!c["moveToElementEdit"+(b?"End":"Start")](a)){c.selectNodeContents(a);c.collapse(b?false:true)}c.select(true)}function k(a,b,c){a=a[b];if(typeof c=="undefined")return a;for(b=0;a&&b<a.length;b++){if(c.is&&a[b]==c.$)return b;if(b==c)return new CKEDITOR.dom.element(a[b])}return c.is?-1:null}function j(b,c,d){var e=a(b),f;if((c?e.length!=1:e.length<
+2)||(f=b.getCommonAncestor())&&f.type==CKEDITOR.NODE_ELEMENT&&f.is("table"))return false;var g,b=e[0];f=b.getAscendant("table");var h=CKEDITOR.tools.buildTableMap(f),i=h.length,j=h[0].length,n=b.getParent().$.rowIndex,q=k(h,n,b);if(c){var y;try{var z=parseInt(b.getAttribute("rowspan"),10)||1;g=parseInt(b.getAttribute("colspan"),10)||1;y=h[c=="up"?n-z:c=="down"?n+z:n][c=="left"?q-g:c=="right"?q+g:q]}catch(B){return false}if(!y||b.$==y)return false;e[c=="up"||c=="left"?"unshift":"push"](new CKEDITOR.dom.element(y))}for(var c=
+b.getDocument(),A=n,z=y=0,D=!d&&new CKEDITOR.dom.documentFragment(c),C=0,c=0;c<e.length;c++){g=e[c];var H=g.getParent(),E=g.getFirst(),G=g.$.colSpan,L=g.$.rowSpan,H=H.$.rowIndex,J=k(h,H,g),C=C+G*L,z=Math.max(z,J-q+G);y=Math.max(y,H-n+L);if(!d){G=g;(L=G.getBogus())&&L.remove();G.trim();if(g.getChildren().count()){if(H!=A&&E&&(!E.isBlockBoundary||!E.isBlockBoundary({br:1})))(A=D.getLast(CKEDITOR.dom.walker.whitespaces(true)))&&(!A.is||!A.is("br"))&&D.append("br");g.moveChildren(D)}c?g.remove():g.setHtml("")}A=
+H}if(d)return y*z==C;D.moveChildren(b);b.appendBogus();z>=j?b.removeAttribute("rowSpan"):b.$.rowSpan=y;y>=i?b.removeAttribute("colSpan"):b.$.colSpan=z;d=new CKEDITOR.dom.nodeList(f.$.rows);e=d.count();for(c=e-1;c>=0;c--){f=d.getItem(c);if(!f.$.cells.length){f.remove();e++}}return b}function g(b,c){var d=a(b);if(d.length>1)return false;if(c)return true;var d=d[0],e=d.getParent(),f=e.getAscendant("table"),g=CKEDITOR.tools.buildTableMap(f),h=e.$.rowIndex,i=k(g,h,d),j=d.$.rowSpan,n;if(j>1){n=Math.ceil(j/
+2);for(var j=Math.floor(j/2),e=h+n,f=new CKEDITOR.dom.element(f.$.rows[e]),g=k(g,e),q,e=d.clone(),h=0;h<g.length;h++){q=g[h];if(q.parentNode==f.$&&h>i){e.insertBefore(new CKEDITOR.dom.element(q));break}else q=null}q||f.append(e)}else{j=n=1;f=e.clone();f.insertAfter(e);f.append(e=d.clone());q=k(g,h);for(i=0;i<q.length;i++)q[i].rowSpan++}e.appendBogus();d.$.rowSpan=n;e.$.rowSpan=j;n==1&&d.removeAttribute("rowSpan");j==1&&e.removeAttribute("rowSpan");return e}function n(b,c){var d=a(b);if(d.length>1)return false;
+if(c)return true;var d=d[0],e=d.getParent(),f=e.getAscendant("table"),f=CKEDITOR.tools.buildTableMap(f),g=k(f,e.$.rowIndex,d),h=d.$.colSpan;if(h>1){e=Math.ceil(h/2);h=Math.floor(h/2)}else{for(var h=e=1,i=[],j=0;j<f.length;j++){var n=f[j];i.push(n[g]);n[g].rowSpan>1&&(j=j+(n[g].rowSpan-1))}for(f=0;f<i.length;f++)i[f].colSpan++}f=d.clone();f.insertAfter(d);f.appendBogus();d.$.colSpan=e;f.$.colSpan=h;e==1&&d.removeAttribute("colSpan");h==1&&f.removeAttribute("colSpan");return f}var q=/^(?:td|th)$/;CKEDITOR.plugins.tabletools=
+{requires:"table,dialog,contextmenu",init:function(c){function k(a){return CKEDITOR.tools.extend(a||{},{contextSensitive:1,refresh:function(a,b){this.setState(b.contains({td:1,th:1},1)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED)}})}function q(a,b){var d=c.addCommand(a,b);c.addFeature(d)}var m=c.lang.table;q("cellProperties",new CKEDITOR.dialogCommand("cellProperties",k({allowedContent:"td th{width,height,border-color,background-color,white-space,vertical-align,text-align}[colspan,rowspan]",
+requiredContent:"table"})));CKEDITOR.dialog.add("cellProperties",this.path+"dialogs/tableCell.js");q("rowDelete",k({requiredContent:"table",exec:function(a){a=a.getSelection();f(b(a))}}));q("rowInsertBefore",k({requiredContent:"table",exec:function(a){a=a.getSelection();e(a,true)}}));q("rowInsertAfter",k({requiredContent:"table",exec:function(a){a=a.getSelection();e(a)}}));q("columnDelete",k({requiredContent:"table",exec:function(b){for(var b=b.getSelection(),b=a(b),c=b[0],d=b[b.length-1],b=c.getAscendant("table"),
+e=CKEDITOR.tools.buildTableMap(b),g,h,i=[],j=0,k=e.length;j<k;j++)for(var l=0,o=e[j].length;l<o;l++){e[j][l]==c.$&&(g=l);e[j][l]==d.$&&(h=l)}for(j=g;j<=h;j++)for(l=0;l<e.length;l++){d=e[l];c=new CKEDITOR.dom.element(b.$.rows[l]);d=new CKEDITOR.dom.element(d[j]);if(d.$){d.$.colSpan==1?d.remove():d.$.colSpan=d.$.colSpan-1;l=l+(d.$.rowSpan-1);c.$.cells.length||i.push(c)}}h=b.$.rows[0]&&b.$.rows[0].cells;g=new CKEDITOR.dom.element(h[g]||(g?h[g-1]:b.$.parentNode));i.length==k&&b.remove();g&&f(g,true)}}));
+q("columnInsertBefore",k({requiredContent:"table",exec:function(a){a=a.getSelection();d(a,true)}}));q("columnInsertAfter",k({requiredContent:"table",exec:function(a){a=a.getSelection();d(a)}}));q("cellDelete",k({requiredContent:"table",exec:function(a){a=a.getSelection();h(a)}}));q("cellMerge",k({allowedContent:"td[colspan,rowspan]",requiredContent:"td[colspan,rowspan]",exec:function(a){f(j(a.getSelection()),true)}}));q("cellMergeRight",k({allowedContent:"td[colspan]",requiredContent:"td[colspan]",
+exec:function(a){f(j(a.getSelection(),"right"),true)}}));q("cellMergeDown",k({allowedContent:"td[rowspan]",requiredContent:"td[rowspan]",exec:function(a){f(j(a.getSelection(),"down"),true)}}));q("cellVerticalSplit",k({allowedContent:"td[rowspan]",requiredContent:"td[rowspan]",exec:function(a){f(n(a.getSelection()))}}));q("cellHorizontalSplit",k({allowedContent:"td[colspan]",requiredContent:"td[colspan]",exec:function(a){f(g(a.getSelection()))}}));q("cellInsertBefore",k({requiredContent:"table",exec:function(a){a=
+a.getSelection();i(a,true)}}));q("cellInsertAfter",k({requiredContent:"table",exec:function(a){a=a.getSelection();i(a)}}));c.addMenuItems&&c.addMenuItems({tablecell:{label:m.cell.menu,group:"tablecell",order:1,getItems:function(){var b=c.getSelection(),d=a(b);return{tablecell_insertBefore:CKEDITOR.TRISTATE_OFF,tablecell_insertAfter:CKEDITOR.TRISTATE_OFF,tablecell_delete:CKEDITOR.TRISTATE_OFF,tablecell_merge:j(b,null,true)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,tablecell_merge_right:j(b,
+"right",true)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,tablecell_merge_down:j(b,"down",true)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,tablecell_split_vertical:n(b,true)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,tablecell_split_horizontal:g(b,true)?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED,tablecell_properties:d.length>0?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED}}},tablecell_insertBefore:{label:m.cell.insertBefore,group:"tablecell",command:"cellInsertBefore",order:5},
+tablecell_insertAfter:{label:m.cell.insertAfter,group:"tablecell",command:"cellInsertAfter",order:10},tablecell_delete:{label:m.cell.deleteCell,group:"tablecell",command:"cellDelete",order:15},tablecell_merge:{label:m.cell.merge,group:"tablecell",command:"cellMerge",order:16},tablecell_merge_right:{label:m.cell.mergeRight,group:"tablecell",command:"cellMergeRight",order:17},tablecell_merge_down:{label:m.cell.mergeDown,group:"tablecell",command:"cellMergeDown",order:18},tablecell_split_horizontal:{label:m.cell.splitHorizontal,
+group:"tablecell",command:"cellHorizontalSplit",order:19},tablecell_split_vertical:{label:m.cell.splitVertical,group:"tablecell",command:"cellVerticalSplit",order:20},tablecell_properties:{label:m.cell.title,group:"tablecellproperties",command:"cellProperties",order:21},tablerow:{label:m.row.menu,group:"tablerow",order:1,getItems:function(){return{tablerow_insertBefore:CKEDITOR.TRISTATE_OFF,tablerow_insertAfter:CKEDITOR.TRISTATE_OFF,tablerow_delete:CKEDITOR.TRISTATE_OFF}}},tablerow_insertBefore:{label:m.row.insertBefore,
+group:"tablerow",command:"rowInsertBefore",order:5},tablerow_insertAfter:{label:m.row.insertAfter,group:"tablerow",command:"rowInsertAfter",order:10},tablerow_delete:{label:m.row.deleteRow,group:"tablerow",command:"rowDelete",order:15},tablecolumn:{label:m.column.menu,group:"tablecolumn",order:1,getItems:function(){return{tablecolumn_insertBefore:CKEDITOR.TRISTATE_OFF,tablecolumn_insertAfter:CKEDITOR.TRISTATE_OFF,tablecolumn_delete:CKEDITOR.TRISTATE_OFF}}},tablecolumn_insertBefore:{label:m.column.insertBefore,
+group:"tablecolumn",command:"columnInsertBefore",order:5},tablecolumn_insertAfter:{label:m.column.insertAfter,group:"tablecolumn",command:"columnInsertAfter",order:10},tablecolumn_delete:{label:m.column.deleteColumn,group:"tablecolumn",command:"columnDelete",order:15}});c.contextMenu&&c.contextMenu.addListener(function(a,b,c){return(a=c.contains({td:1,th:1},1))&&!a.isReadOnly()?{tablecell:CKEDITOR.TRISTATE_OFF,tablerow:CKEDITOR.TRISTATE_OFF,tablecolumn:CKEDITOR.TRISTATE_OFF}:null})},getSelectedCells:a};
+CKEDITOR.plugins.add("tabletools",CKEDITOR.plugins.tabletools)}(),CKEDITOR.tools.buildTableMap=function(a){for(var a=a.$.rows,e=-1,b=[],c=0;c<a.length;c++){e++;!b[e]&&(b[e]=[]);for(var d=-1,i=0;i<a[c].cells.length;i++){var h=a[c].cells[i];for(d++;b[e][d];)d++;for(var f=isNaN(h.colSpan)?1:h.colSpan,h=isNaN(h.rowSpan)?1:h.rowSpan,k=0;k<h;k++){b[e+k]||(b[e+k]=[]);for(var j=0;j<f;j++)b[e+k][d+j]=a[c].cells[i]}d=d+(f-1)}}return b},function(){function a(a){function b(){for(var g=c(),i=CKEDITOR.tools.clone(a.config.toolbarGroups)||
+e(a),j=0;j<i.length;j++){var k=i[j];if(k!="/"){typeof k=="string"&&(k=i[j]={name:k});var r,m=k.groups;if(m)for(var p=0;p<m.length;p++){r=m[p];(r=g[r])&&f(k,r)}(r=g[k.name])&&f(k,r)}}return i}function c(){var b={},e,f,g;for(e in a.ui.items){f=a.ui.items[e];g=f.toolbar||"others";g=g.split(",");f=g[0];g=parseInt(g[1]||-1,10);b[f]||(b[f]=[]);b[f].push({name:e,order:g})}for(f in b)b[f]=b[f].sort(function(a,b){return a.order==b.order?0:b.order<0?-1:a.order<0?1:a.order<b.order?-1:1});return b}function f(b,
+c){if(c.length){b.items?b.items.push(a.ui.create("-")):b.items=[];for(var e;e=c.shift();){e=typeof e=="string"?e:e.name;if(!j||CKEDITOR.tools.indexOf(j,e)==-1)(e=a.ui.create(e))&&a.addFeature(e)&&b.items.push(e)}}}function k(a){var b=[],c,d,e;for(c=0;c<a.length;++c){d=a[c];e={};if(d=="/")b.push(d);else if(CKEDITOR.tools.isArray(d)){f(e,CKEDITOR.tools.clone(d));b.push(e)}else if(d.items){f(e,CKEDITOR.tools.clone(d.items));e.name=d.name;b.push(e)}}return b}var j=a.config.removeButtons,j=j&&j.split(","),
+g=a.config.toolbar;typeof g=="string"&&(g=a.config["toolbar_"+g]);return a.toolbar=g?k(g):b()}function e(a){return a._.toolbarGroups||(a._.toolbarGroups=[{name:"document",groups:["mode","document","doctools"]},{name:"clipboard",groups:["clipboard","undo"]},{name:"editing",groups:["find","selection","spellchecker"]},{name:"forms"},"/",{name:"basicstyles",groups:["basicstyles","cleanup"]},{name:"paragraph",groups:["list","indent","blocks","align","bidi"]},{name:"links"},{name:"insert"},"/",{name:"styles"},
+{name:"colors"},{name:"tools"},{name:"others"},{name:"about"}])}var b=function(){this.toolbars=[];this.focusCommandExecuted=false};b.prototype.focus=function(){for(var a=0,b;b=this.toolbars[a++];)for(var c=0,e;e=b.items[c++];)if(e.focus){e.focus();return}};var c={modes:{wysiwyg:1,source:1},readOnly:1,exec:function(a){if(a.toolbox){a.toolbox.focusCommandExecuted=true;CKEDITOR.env.ie||CKEDITOR.env.air?setTimeout(function(){a.toolbox.focus()},100):a.toolbox.focus()}}};CKEDITOR.plugins.add("toolbar",
+{requires:"button",init:function(d){var e,h=function(a,b){var c,g=d.lang.dir=="rtl",n=d.config.toolbarGroupCycling,q=g?37:39,g=g?39:37,n=n===void 0||n;switch(b){case 9:case CKEDITOR.SHIFT+9:for(;!c||!c.items.length;){c=b==9?(c?c.next:a.toolbar.next)||d.toolbox.toolbars[0]:(c?c.previous:a.toolbar.previous)||d.toolbox.toolbars[d.toolbox.toolbars.length-1];if(c.items.length)for(a=c.items[e?c.items.length-1:0];a&&!a.focus;)(a=e?a.previous:a.next)||(c=0)}a&&a.focus();return false;case q:c=a;do{c=c.next;
+!c&&n&&(c=a.toolbar.items[0])}while(c&&!c.focus);c?c.focus():h(a,9);return false;case 40:if(a.button&&a.button.hasArrow){d.once("panelShow",function(a){a.data._.panel._.currentBlock.onKeyDown(40)});a.execute()}else h(a,b==40?q:g);return false;case g:case 38:c=a;do{c=c.previous;!c&&n&&(c=a.toolbar.items[a.toolbar.items.length-1])}while(c&&!c.focus);if(c)c.focus();else{e=1;h(a,CKEDITOR.SHIFT+9);e=0}return false;case 27:d.focus();return false;case 13:case 32:a.execute();return false}return true};d.on("uiSpace",
+function(c){if(c.data.space==d.config.toolbarLocation){c.removeListener();d.toolbox=new b;var e=CKEDITOR.tools.getNextId(),i=['<span id="',e,'" class="cke_voice_label">',d.lang.toolbar.toolbars,"</span>",'<span id="'+d.ui.spaceId("toolbox")+'" class="cke_toolbox" role="group" aria-labelledby="',e,'" onmousedown="return false;">'],e=d.config.toolbarStartupExpanded!==false,g,n;d.config.toolbarCanCollapse&&d.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE&&i.push('<span class="cke_toolbox_main"'+(e?">":' style="display:none">'));
+for(var q=d.toolbox.toolbars,l=a(d),o=0;o<l.length;o++){var r,m=0,p,t=l[o],w;if(t){if(g){i.push("</span>");n=g=0}if(t==="/")i.push('<span class="cke_toolbar_break"></span>');else{w=t.items||t;for(var u=0;u<w.length;u++){var x=w[u],v;if(x)if(x.type==CKEDITOR.UI_SEPARATOR)n=g&&x;else{v=x.canGroup!==false;if(!m){r=CKEDITOR.tools.getNextId();m={id:r,items:[]};p=t.name&&(d.lang.toolbar.toolbarGroups[t.name]||t.name);i.push('<span id="',r,'" class="cke_toolbar"',p?' aria-labelledby="'+r+'_label"':"",' role="toolbar">');
+p&&i.push('<span id="',r,'_label" class="cke_voice_label">',p,"</span>");i.push('<span class="cke_toolbar_start"></span>');var s=q.push(m)-1;if(s>0){m.previous=q[s-1];m.previous.next=m}}if(v){if(!g){i.push('<span class="cke_toolgroup" role="presentation">');g=1}}else if(g){i.push("</span>");g=0}r=function(a){a=a.render(d,i);s=m.items.push(a)-1;if(s>0){a.previous=m.items[s-1];a.previous.next=a}a.toolbar=m;a.onkey=h;a.onfocus=function(){d.toolbox.focusCommandExecuted||d.focus()}};if(n){r(n);n=0}r(x)}}if(g){i.push("</span>");
+n=g=0}m&&i.push('<span class="cke_toolbar_end"></span></span>')}}}d.config.toolbarCanCollapse&&i.push("</span>");if(d.config.toolbarCanCollapse&&d.elementMode!=CKEDITOR.ELEMENT_MODE_INLINE){var y=CKEDITOR.tools.addFunction(function(){d.execCommand("toolbarCollapse")});d.on("destroy",function(){CKEDITOR.tools.removeFunction(y)});d.addCommand("toolbarCollapse",{readOnly:1,exec:function(a){var b=a.ui.space("toolbar_collapser"),c=b.getPrevious(),d=a.ui.space("contents"),e=c.getParent(),f=parseInt(d.$.style.height,
+10),g=e.$.offsetHeight,h=b.hasClass("cke_toolbox_collapser_min");if(h){c.show();b.removeClass("cke_toolbox_collapser_min");b.setAttribute("title",a.lang.toolbar.toolbarCollapse)}else{c.hide();b.addClass("cke_toolbox_collapser_min");b.setAttribute("title",a.lang.toolbar.toolbarExpand)}b.getFirst().setText(h?"▲":"◀");d.setStyle("height",f-(e.$.offsetHeight-g)+"px");a.fire("resize",{outerHeight:a.container.$.offsetHeight,contentsHeight:d.$.offsetHeight,outerWidth:a.container.$.offsetWidth})},modes:{wysiwyg:1,
+source:1}});d.setKeystroke(CKEDITOR.ALT+(CKEDITOR.env.ie||CKEDITOR.env.webkit?189:109),"toolbarCollapse");i.push('<a title="'+(e?d.lang.toolbar.toolbarCollapse:d.lang.toolbar.toolbarExpand)+'" id="'+d.ui.spaceId("toolbar_collapser")+'" tabIndex="-1" class="cke_toolbox_collapser');e||i.push(" cke_toolbox_collapser_min");i.push('" onclick="CKEDITOR.tools.callFunction('+y+')">','<span class="cke_arrow">&#9650;</span>',"</a>")}i.push("</span>");c.data.html=c.data.html+i.join("")}});d.on("destroy",function(){if(this.toolbox){var a,
+b=0,c,d,e;for(a=this.toolbox.toolbars;b<a.length;b++){d=a[b].items;for(c=0;c<d.length;c++){e=d[c];e.clickFn&&CKEDITOR.tools.removeFunction(e.clickFn);e.keyDownFn&&CKEDITOR.tools.removeFunction(e.keyDownFn)}}}});d.on("uiReady",function(){var a=d.ui.space("toolbox");a&&d.focusManager.add(a,1)});d.addCommand("toolbarFocus",c);d.setKeystroke(CKEDITOR.ALT+121,"toolbarFocus");d.ui.add("-",CKEDITOR.UI_SEPARATOR,{});d.ui.addHandler(CKEDITOR.UI_SEPARATOR,{create:function(){return{render:function(a,b){b.push('<span class="cke_toolbar_separator" role="separator"></span>');
+return{}}}}})}});CKEDITOR.ui.prototype.addToolbarGroup=function(a,b,c){var f=e(this.editor),k=b===0,j={name:a};if(c){if(c=CKEDITOR.tools.search(f,function(a){return a.name==c})){!c.groups&&(c.groups=[]);if(b){b=CKEDITOR.tools.indexOf(c.groups,b);if(b>=0){c.groups.splice(b+1,0,a);return}}k?c.groups.splice(0,0,a):c.groups.push(a);return}b=null}b&&(b=CKEDITOR.tools.indexOf(f,function(a){return a.name==b}));k?f.splice(0,0,a):typeof b=="number"?f.splice(b+1,0,j):f.push(a)}}(),CKEDITOR.UI_SEPARATOR="separator",
+CKEDITOR.config.toolbarLocation="top","use strict",function(){var a=[CKEDITOR.CTRL+90,CKEDITOR.CTRL+89,CKEDITOR.CTRL+CKEDITOR.SHIFT+90],e={8:1,46:1};CKEDITOR.plugins.add("undo",{init:function(c){function d(a){g.enabled&&a.data.command.canUndo!==false&&g.save()}function e(){g.enabled=c.readOnly?false:c.mode=="wysiwyg";g.onChange()}var g=c.undoManager=new b(c),h=g.editingHandler=new i(g),q=c.addCommand("undo",{exec:function(){if(g.undo()){c.selectionChange();this.fire("afterUndo")}},startDisabled:true,
+canUndo:false}),l=c.addCommand("redo",{exec:function(){if(g.redo()){c.selectionChange();this.fire("afterRedo")}},startDisabled:true,canUndo:false});c.setKeystroke([[a[0],"undo"],[a[1],"redo"],[a[2],"redo"]]);g.onChange=function(){q.setState(g.undoable()?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED);l.setState(g.redoable()?CKEDITOR.TRISTATE_OFF:CKEDITOR.TRISTATE_DISABLED)};c.on("beforeCommandExec",d);c.on("afterCommandExec",d);c.on("saveSnapshot",function(a){g.save(a.data&&a.data.contentOnly)});
+c.on("contentDom",h.attachListeners,h);c.on("instanceReady",function(){c.fire("saveSnapshot")});c.on("beforeModeUnload",function(){c.mode=="wysiwyg"&&g.save(true)});c.on("mode",e);c.on("readOnly",e);if(c.ui.addButton){c.ui.addButton("Undo",{label:c.lang.undo.undo,command:"undo",toolbar:"undo,10"});c.ui.addButton("Redo",{label:c.lang.undo.redo,command:"redo",toolbar:"undo,20"})}c.resetUndo=function(){g.reset();c.fire("saveSnapshot")};c.on("updateSnapshot",function(){g.currentImage&&g.update()});c.on("lockSnapshot",
+function(a){a=a.data;g.lock(a&&a.dontUpdate,a&&a.forceUpdate)});c.on("unlockSnapshot",g.unlock,g)}});CKEDITOR.plugins.undo={};var b=CKEDITOR.plugins.undo.UndoManager=function(a){this.strokesRecorded=[0,0];this.locked=null;this.previousKeyGroup=-1;this.limit=a.config.undoStackSize||20;this.strokesLimit=25;this.editor=a;this.reset()};b.prototype={type:function(a,c){var d=b.getKeyGroup(a),e=this.strokesRecorded[d]+1,c=c||e>=this.strokesLimit;if(!this.typing){this.hasUndo=this.typing=true;this.hasRedo=
+false;this.onChange()}if(c){e=0;this.editor.fire("saveSnapshot")}else this.editor.fire("change");this.strokesRecorded[d]=e;this.previousKeyGroup=d},keyGroupChanged:function(a){return b.getKeyGroup(a)!=this.previousKeyGroup},reset:function(){this.snapshots=[];this.index=-1;this.currentImage=null;this.hasRedo=this.hasUndo=false;this.locked=null;this.resetType()},resetType:function(){this.strokesRecorded=[0,0];this.typing=false;this.previousKeyGroup=-1},refreshState:function(){this.hasUndo=!!this.getNextImage(true);
+this.hasRedo=!!this.getNextImage(false);this.resetType();this.onChange()},save:function(a,b,d){var e=this.editor;if(this.locked||e.status!="ready"||e.mode!="wysiwyg")return false;var h=e.editable();if(!h||h.status!="ready")return false;h=this.snapshots;b||(b=new c(e));if(b.contents===false)return false;if(this.currentImage)if(b.equalsContent(this.currentImage)){if(a||b.equalsSelection(this.currentImage))return false}else d!==false&&e.fire("change");h.splice(this.index+1,h.length-this.index-1);h.length==
+this.limit&&h.shift();this.index=h.push(b)-1;this.currentImage=b;d!==false&&this.refreshState();return true},restoreImage:function(a){var b=this.editor,c;if(a.bookmarks){b.focus();c=b.getSelection()}this.locked={level:999};this.editor.loadSnapshot(a.contents);if(a.bookmarks)c.selectBookmarks(a.bookmarks);else if(CKEDITOR.env.ie){c=this.editor.document.getBody().$.createTextRange();c.collapse(true);c.select()}this.locked=null;this.index=a.index;this.currentImage=this.snapshots[this.index];this.update();
+this.refreshState();b.fire("change")},getNextImage:function(a){var b=this.snapshots,c=this.currentImage,d;if(c)if(a)for(d=this.index-1;d>=0;d--){a=b[d];if(!c.equalsContent(a)){a.index=d;return a}}else for(d=this.index+1;d<b.length;d++){a=b[d];if(!c.equalsContent(a)){a.index=d;return a}}return null},redoable:function(){return this.enabled&&this.hasRedo},undoable:function(){return this.enabled&&this.hasUndo},undo:function(){if(this.undoable()){this.save(true);var a=this.getNextImage(true);if(a)return this.restoreImage(a),
+true}return false},redo:function(){if(this.redoable()){this.save(true);if(this.redoable()){var a=this.getNextImage(false);if(a)return this.restoreImage(a),true}}return false},update:function(a){if(!this.locked){a||(a=new c(this.editor));for(var b=this.index,d=this.snapshots;b>0&&this.currentImage.equalsContent(d[b-1]);)b=b-1;d.splice(b,this.index-b+1,a);this.index=b;this.currentImage=a}},updateSelection:function(a){if(!this.snapshots.length)return false;var b=this.snapshots,c=b[b.length-1];if(c.equalsContent(a)&&
+!c.equalsSelection(a)){this.currentImage=b[b.length-1]=a;return true}return false},lock:function(a,b){if(this.locked)this.locked.level++;else if(a)this.locked={level:1};else{var d=null;if(b)d=true;else{var e=new c(this.editor,true);this.currentImage&&this.currentImage.equalsContent(e)&&(d=e)}this.locked={update:d,level:1}}},unlock:function(){if(this.locked&&!--this.locked.level){var a=this.locked.update;this.locked=null;if(a===true)this.update();else if(a){var b=new c(this.editor,true);a.equalsContent(b)||
+this.update()}}}};b.navigationKeyCodes={37:1,38:1,39:1,40:1,36:1,35:1,33:1,34:1};b.keyGroups={PRINTABLE:0,FUNCTIONAL:1};b.isNavigationKey=function(a){return!!b.navigationKeyCodes[a]};b.getKeyGroup=function(a){var c=b.keyGroups;return e[a]?c.FUNCTIONAL:c.PRINTABLE};b.getOppositeKeyGroup=function(a){var c=b.keyGroups;return a==c.FUNCTIONAL?c.PRINTABLE:c.FUNCTIONAL};b.ieFunctionalKeysBug=function(a){return CKEDITOR.env.ie&&b.getKeyGroup(a)==b.keyGroups.FUNCTIONAL};var c=CKEDITOR.plugins.undo.Image=function(a,
+b){this.editor=a;a.fire("beforeUndoImage");var c=a.getSnapshot();CKEDITOR.env.ie&&c&&(c=c.replace(/\s+data-cke-expando=".*?"/g,""));this.contents=c;if(!b)this.bookmarks=(c=c&&a.getSelection())&&c.createBookmarks2(true);a.fire("afterUndoImage")},d=/\b(?:href|src|name)="[^"]*?"/gi;c.prototype={equalsContent:function(a){var b=this.contents,a=a.contents;if(CKEDITOR.env.ie&&(CKEDITOR.env.ie7Compat||CKEDITOR.env.quirks)){b=b.replace(d,"");a=a.replace(d,"")}return b!=a?false:true},equalsSelection:function(a){var b=
+this.bookmarks,a=a.bookmarks;if(b||a){if(!b||!a||b.length!=a.length)return false;for(var c=0;c<b.length;c++){var d=b[c],e=a[c];if(d.startOffset!=e.startOffset||d.endOffset!=e.endOffset||!CKEDITOR.tools.arrayCompare(d.start,e.start)||!CKEDITOR.tools.arrayCompare(d.end,e.end))return false}}return true}};var i=CKEDITOR.plugins.undo.NativeEditingHandler=function(a){this.undoManager=a;this.ignoreInputEvent=false;this.keyEventsStack=new h;this.lastKeydownImage=null};i.prototype={onKeydown:function(d){var e=
+d.data.getKey();if(e!==229)if(CKEDITOR.tools.indexOf(a,d.data.getKeystroke())>-1)d.data.preventDefault();else{this.keyEventsStack.cleanUp(d);d=this.undoManager;this.keyEventsStack.getLast(e)||this.keyEventsStack.push(e);this.lastKeydownImage=new c(d.editor);if(b.isNavigationKey(e)||this.undoManager.keyGroupChanged(e))if(d.strokesRecorded[0]||d.strokesRecorded[1]){d.save(false,this.lastKeydownImage,false);d.resetType()}}},onInput:function(){if(this.ignoreInputEvent)this.ignoreInputEvent=false;else{var a=
+this.keyEventsStack.getLast();a||(a=this.keyEventsStack.push(0));this.keyEventsStack.increment(a.keyCode);if(this.keyEventsStack.getTotalInputs()>=this.undoManager.strokesLimit){this.undoManager.type(a.keyCode,true);this.keyEventsStack.resetInputs()}}},onKeyup:function(a){var d=this.undoManager,a=a.data.getKey(),e=this.keyEventsStack.getTotalInputs();this.keyEventsStack.remove(a);if(!b.ieFunctionalKeysBug(a)||!this.lastKeydownImage||!this.lastKeydownImage.equalsContent(new c(d.editor,true)))if(e>
+0)d.type(a);else if(b.isNavigationKey(a))this.onNavigationKey(true)},onNavigationKey:function(a){var b=this.undoManager;(a||!b.save(true,null,false))&&b.updateSelection(new c(b.editor));b.resetType()},ignoreInputEventListener:function(){this.ignoreInputEvent=true},attachListeners:function(){var a=this.undoManager.editor,c=a.editable(),d=this;c.attachListener(c,"keydown",function(a){d.onKeydown(a);if(b.ieFunctionalKeysBug(a.data.getKey()))d.onInput()},null,null,999);c.attachListener(c,CKEDITOR.env.ie?
+"keypress":"input",d.onInput,d,null,999);c.attachListener(c,"keyup",d.onKeyup,d,null,999);c.attachListener(c,"paste",d.ignoreInputEventListener,d,null,999);c.attachListener(c,"drop",d.ignoreInputEventListener,d,null,999);c.attachListener(c.isInline()?c:a.document.getDocumentElement(),"click",function(){d.onNavigationKey()},null,null,999);c.attachListener(this.undoManager.editor,"blur",function(){d.keyEventsStack.remove(9)},null,null,999)}};var h=CKEDITOR.plugins.undo.KeyEventsStack=function(){this.stack=
+[]};h.prototype={push:function(a){return this.stack[this.stack.push({keyCode:a,inputs:0})-1]},getLastIndex:function(a){if(typeof a!="number")return this.stack.length-1;for(var b=this.stack.length;b--;)if(this.stack[b].keyCode==a)return b;return-1},getLast:function(a){a=this.getLastIndex(a);return a!=-1?this.stack[a]:null},increment:function(a){this.getLast(a).inputs++},remove:function(a){a=this.getLastIndex(a);a!=-1&&this.stack.splice(a,1)},resetInputs:function(a){if(typeof a=="number")this.getLast(a).inputs=
+0;else for(a=this.stack.length;a--;)this.stack[a].inputs=0},getTotalInputs:function(){for(var a=this.stack.length,b=0;a--;)b=b+this.stack[a].inputs;return b},cleanUp:function(a){a=a.data.$;!a.ctrlKey&&!a.metaKey&&this.remove(17);a.shiftKey||this.remove(16);a.altKey||this.remove(18)}}}(),CKEDITOR.plugins.add("wsc",{requires:"dialog",parseApi:function(a){a.config.wsc_onFinish=typeof a.config.wsc_onFinish==="function"?a.config.wsc_onFinish:function(){};a.config.wsc_onClose=typeof a.config.wsc_onClose===
+"function"?a.config.wsc_onClose:function(){}},parseConfig:function(a){a.config.wsc_customerId=a.config.wsc_customerId||CKEDITOR.config.wsc_customerId||"1:ua3xw1-2XyGJ3-GWruD3-6OFNT1-oXcuB1-nR6Bp4-hgQHc-EcYng3-sdRXG3-NOfFk";a.config.wsc_customDictionaryIds=a.config.wsc_customDictionaryIds||CKEDITOR.config.wsc_customDictionaryIds||"";a.config.wsc_userDictionaryName=a.config.wsc_userDictionaryName||CKEDITOR.config.wsc_userDictionaryName||"";a.config.wsc_customLoaderScript=a.config.wsc_customLoaderScript||
+CKEDITOR.config.wsc_customLoaderScript;CKEDITOR.config.wsc_cmd=a.config.wsc_cmd||CKEDITOR.config.wsc_cmd||"spell";CKEDITOR.config.wsc_version="v4.3.0-master-d769233";CKEDITOR.config.wsc_removeGlobalVariable=true},init:function(a){var e=CKEDITOR.env;this.parseConfig(a);this.parseApi(a);a.addCommand("checkspell",new CKEDITOR.dialogCommand("checkspell")).modes={wysiwyg:!CKEDITOR.env.opera&&!CKEDITOR.env.air&&document.domain==window.location.hostname&&!(e.ie&&(e.version<8||e.quirks))};typeof a.plugins.scayt==
+"undefined"&&a.ui.addButton&&a.ui.addButton("SpellChecker",{label:a.lang.wsc.toolbar,click:function(a){var c=a.elementMode==CKEDITOR.ELEMENT_MODE_INLINE?a.container.getText():a.document.getBody().getText();(c=c.replace(/\s/g,""))?a.execCommand("checkspell"):alert("Nothing to check!")},toolbar:"spellchecker,10"});CKEDITOR.dialog.add("checkspell",this.path+(CKEDITOR.env.ie&&CKEDITOR.env.version<=7?"dialogs/wsc_ie.js":window.postMessage?"dialogs/wsc.js":"dialogs/wsc_ie.js"))}}),function(){function a(a){function b(a){var c=
+false;g.attachListener(g,"keydown",function(){var b=f.getBody().getElementsByTag(a);if(!c){for(var d=0;d<b.count();d++)b.getItem(d).setCustomData("retain",true);c=true}},null,null,1);g.attachListener(g,"keyup",function(){var b=f.getElementsByTag(a);if(c){b.count()==1&&!b.getItem(0).getCustomData("retain")&&b.getItem(0).remove(1);c=false}})}var c=this.editor,f=a.document,k=f.body,j=f.getElementById("cke_actscrpt");j&&j.parentNode.removeChild(j);(j=f.getElementById("cke_shimscrpt"))&&j.parentNode.removeChild(j);
+(j=f.getElementById("cke_basetagscrpt"))&&j.parentNode.removeChild(j);k.contentEditable=true;if(CKEDITOR.env.ie){k.hideFocus=true;k.disabled=true;k.removeAttribute("disabled")}delete this._.isLoadingData;this.$=k;f=new CKEDITOR.dom.document(f);this.setup();this.fixInitialSelection();var g=this;CKEDITOR.env.ie&&!CKEDITOR.env.edge&&c.enterMode!=CKEDITOR.ENTER_P?b("p"):CKEDITOR.env.edge&&c.enterMode!=CKEDITOR.ENTER_DIV&&b("div");if(CKEDITOR.env.webkit||CKEDITOR.env.ie&&CKEDITOR.env.version>10)f.getDocumentElement().on("mousedown",
+function(a){a.data.getTarget().is("html")&&setTimeout(function(){c.editable().focus()})});e(c);try{c.document.$.execCommand("2D-position",false,true)}catch(n){}(CKEDITOR.env.gecko||CKEDITOR.env.ie&&c.document.$.compatMode=="CSS1Compat")&&this.attachListener(this,"keydown",function(a){var b=a.data.getKeystroke();if(b==33||b==34)if(CKEDITOR.env.ie)setTimeout(function(){c.getSelection().scrollIntoView()},0);else if(c.window.$.innerHeight>this.$.offsetHeight){var d=c.createRange();d[b==33?"moveToElementEditStart":
+"moveToElementEditEnd"](this);d.select();a.data.preventDefault()}});CKEDITOR.env.ie&&this.attachListener(f,"blur",function(){try{f.$.selection.empty()}catch(a){}});CKEDITOR.env.iOS&&this.attachListener(f,"touchend",function(){a.focus()});k=c.document.getElementsByTag("title").getItem(0);k.data("cke-title",k.getText());if(CKEDITOR.env.ie)c.document.$.title=this._.docTitle;CKEDITOR.tools.setTimeout(function(){if(this.status=="unloaded")this.status="ready";c.fire("contentDom");if(this._.isPendingFocus){c.focus();
+this._.isPendingFocus=false}setTimeout(function(){c.fire("dataReady")},0)},0,this)}function e(a){function b(){var e;a.editable().attachListener(a,"selectionChange",function(){var b=a.getSelection().getSelectedElement();if(b){if(e){e.detachEvent("onresizestart",c);e=null}b.$.attachEvent("onresizestart",c);e=b.$}})}function c(a){a.returnValue=false}if(CKEDITOR.env.gecko)try{var e=a.document.$;e.execCommand("enableObjectResizing",false,!a.config.disableObjectResizing);e.execCommand("enableInlineTableEditing",
+false,!a.config.disableNativeTableHandles)}catch(k){}else CKEDITOR.env.ie&&(CKEDITOR.env.version<11&&a.config.disableObjectResizing)&&b(a)}function b(){var a=[];if(CKEDITOR.document.$.documentMode>=8){a.push("html.CSS1Compat [contenteditable=false]{min-height:0 !important}");var b=[],c;for(c in CKEDITOR.dtd.$removeEmpty)b.push("html.CSS1Compat "+c+"[contenteditable=false]");a.push(b.join(",")+"{display:inline-block}")}else if(CKEDITOR.env.gecko){a.push("html{height:100% !important}");a.push("img:-moz-broken{-moz-force-broken-image-icon:1;min-width:24px;min-height:24px}")}a.push("html{cursor:text;*cursor:auto}");
+a.push("img,input,textarea{cursor:default}");return a.join("\n")}CKEDITOR.plugins.add("wysiwygarea",{init:function(a){a.config.fullPage&&a.addFeature({allowedContent:"html head title; style [media,type]; body (*)[id]; meta link [*]",requiredContent:"body"});a.addMode("wysiwyg",function(b){function e(f){f&&f.removeListener();a.editable(new c(a,k.$.contentWindow.document.body));a.setData(a.getData(1),b)}var f="document.open();"+(CKEDITOR.env.ie?"("+CKEDITOR.tools.fixDomain+")();":"")+"document.close();",
+f=CKEDITOR.env.air?"javascript:void(0)":CKEDITOR.env.ie&&!CKEDITOR.env.edge?"javascript:void(function(){"+encodeURIComponent(f)+"}())":"",k=CKEDITOR.dom.element.createFromHtml('<iframe src="'+f+'" frameBorder="0"></iframe>');k.setStyles({width:"100%",height:"100%"});k.addClass("cke_wysiwyg_frame").addClass("cke_reset");f=a.ui.space("contents");f.append(k);var j=CKEDITOR.env.ie&&!CKEDITOR.env.edge||CKEDITOR.env.gecko;if(j)k.on("load",e);var g=a.title,n=a.fire("ariaEditorHelpLabel",{}).label;if(g){CKEDITOR.env.ie&&
+n&&(g=g+(", "+n));k.setAttribute("title",g)}if(n){var g=CKEDITOR.tools.getNextId(),q=CKEDITOR.dom.element.createFromHtml('<span id="'+g+'" class="cke_voice_label">'+n+"</span>");f.append(q,1);k.setAttribute("aria-describedby",g)}a.on("beforeModeUnload",function(a){a.removeListener();q&&q.remove()});k.setAttributes({tabIndex:a.tabIndex,allowTransparency:"true"});!j&&e();a.fire("ariaWidget",k)})}});CKEDITOR.editor.prototype.addContentsCss=function(a){var b=this.config,c=b.contentsCss;if(!CKEDITOR.tools.isArray(c))b.contentsCss=
+c?[c]:[];b.contentsCss.push(a)};var c=CKEDITOR.tools.createClass({$:function(){this.base.apply(this,arguments);this._.frameLoadedHandler=CKEDITOR.tools.addFunction(function(b){CKEDITOR.tools.setTimeout(a,0,this,b)},this);this._.docTitle=this.getWindow().getFrame().getAttribute("title")},base:CKEDITOR.editable,proto:{setData:function(a,c){var e=this.editor;if(c){this.setHtml(a);this.fixInitialSelection();e.fire("dataReady")}else{this._.isLoadingData=true;e._.dataStore={id:1};var f=e.config,k=f.fullPage,
+j=f.docType,g=CKEDITOR.tools.buildStyleHtml(b()).replace(/<style>/,'<style data-cke-temp="1">');k||(g=g+CKEDITOR.tools.buildStyleHtml(e.config.contentsCss));var n=f.baseHref?'<base href="'+f.baseHref+'" data-cke-temp="1" />':"";k&&(a=a.replace(/<!DOCTYPE[^>]*>/i,function(a){e.docType=j=a;return""}).replace(/<\?xml\s[^\?]*\?>/i,function(a){e.xmlDeclaration=a;return""}));a=e.dataProcessor.toHtml(a);if(k){/<body[\s|>]/.test(a)||(a="<body>"+a);/<html[\s|>]/.test(a)||(a="<html>"+a+"</html>");/<head[\s|>]/.test(a)?
+/<title[\s|>]/.test(a)||(a=a.replace(/<head[^>]*>/,"$&<title></title>")):a=a.replace(/<html[^>]*>/,"$&<head><title></title></head>");n&&(a=a.replace(/<head[^>]*?>/,"$&"+n));a=a.replace(/<\/head\s*>/,g+"$&");a=j+a}else a=f.docType+'<html dir="'+f.contentsLangDirection+'" lang="'+(f.contentsLanguage||e.langCode)+'"><head><title>'+this._.docTitle+"</title>"+n+g+"</head><body"+(f.bodyId?' id="'+f.bodyId+'"':"")+(f.bodyClass?' class="'+f.bodyClass+'"':"")+">"+a+"</body></html>";if(CKEDITOR.env.gecko){a=
+a.replace(/<body/,'<body contenteditable="true" ');CKEDITOR.env.version<2E4&&(a=a.replace(/<body[^>]*>/,"$&<\!-- cke-content-start --\>"))}f='<script id="cke_actscrpt" type="text/javascript"'+(CKEDITOR.env.ie?' defer="defer" ':"")+">var wasLoaded=0;function onload(){if(!wasLoaded)window.parent.CKEDITOR.tools.callFunction("+this._.frameLoadedHandler+",window);wasLoaded=1;}"+(CKEDITOR.env.ie?"onload();":'document.addEventListener("DOMContentLoaded", onload, false );')+"<\/script>";CKEDITOR.env.ie&&
+CKEDITOR.env.version<9&&(f=f+'<script id="cke_shimscrpt">window.parent.CKEDITOR.tools.enableHtml5Elements(document)<\/script>');n&&(CKEDITOR.env.ie&&CKEDITOR.env.version<10)&&(f=f+'<script id="cke_basetagscrpt">var baseTag = document.querySelector( "base" );baseTag.href = baseTag.href;<\/script>');a=a.replace(/(?=\s*<\/(:?head)>)/,f);this.clearCustomData();this.clearListeners();e.fire("contentDomUnload");var q=this.getDocument();try{q.write(a)}catch(l){setTimeout(function(){q.write(a)},0)}}},getData:function(a){if(a)return this.getHtml();
+var a=this.editor,b=a.config,c=b.fullPage,e=c&&a.docType,k=c&&a.xmlDeclaration,j=this.getDocument(),c=c?j.getDocumentElement().getOuterHtml():j.getBody().getHtml();CKEDITOR.env.gecko&&b.enterMode!=CKEDITOR.ENTER_BR&&(c=c.replace(/<br>(?=\s*(:?$|<\/body>))/,""));c=a.dataProcessor.toDataFormat(c);k&&(c=k+"\n"+c);e&&(c=e+"\n"+c);return c},focus:function(){this._.isLoadingData?this._.isPendingFocus=true:c.baseProto.focus.call(this)},detach:function(){var a=this.editor,b=a.document,a=a.window.getFrame();
+c.baseProto.detach.call(this);this.clearCustomData();b.getDocumentElement().clearCustomData();a.clearCustomData();CKEDITOR.tools.removeFunction(this._.frameLoadedHandler);(b=a.removeCustomData("onResize"))&&b.removeListener();a.remove()}}})}(),CKEDITOR.config.disableObjectResizing=!1,CKEDITOR.config.disableNativeTableHandles=!0,CKEDITOR.config.disableNativeSpellChecker=!0,CKEDITOR.config.contentsCss=CKEDITOR.getUrl("contents.css"),"use strict",CKEDITOR.plugins.add("mdn-attachment",{onLoad:function(){mdn.ckeditor.updateAttachments=
+function(a,e,b){if(a){var c=[],d=mdn.wiki.attachments,i={};a.clear();if(d){d=d.slice(0);d.sort(function(a,b){var c=a.title.toLowerCase(),d=b.title.toLowerCase();return c<d?-1:c>d?1:0});jQuery.each(d,function(){if(!b||b(this)){c.length||a.add(gettext("Select an attachment"),"",0);c.push(this);a.add(this.title,this.url);i[this.url]=this}})}c.length?i[e]&&a.setValue(e):a.add(gettext("No attachments available"),"",0)}};mdn.ckeditor.getObjectByUrl=function(a){var e=mdn.wiki.attachments;if(e){var b=false;
+$.each(e,function(){this.url==a&&(b=this)});return b}}}}),"use strict",CKEDITOR.config.mdnFormat_tags="pre code h2 h3 h4 h5".split(" "),CKEDITOR.plugins.add("mdn-format",{icons:"mdn-format-pre,mdn-format-code,mdn-format-h2,mdn-format-h3,mdn-format-h4,mdn-format-h5",init:function(a){var e=a.config.mdnFormat_tags,b=100,c=100;e&&e.forEach(function(d){var e="mdn-format-"+d,h=new CKEDITOR.style({element:d});h._.enterMode=a.enterMode;a.addCommand(e,new CKEDITOR.styleCommand(h));a.attachStyleStateChange(h,
+function(b){!a.readOnly&&a.getCommand(e).setState(b)});a.ui.addButton&&a.ui.addButton("MdnFormat"+CKEDITOR.tools.capitalize(d),{icon:"mdn-format-"+d,label:CKEDITOR.tools.capitalize(d),command:e,toolbar:CKEDITOR.dtd.$inline[d]?"basicstyles,"+(b=b+10):"blocks,"+(c=c+10)})})}}),"use strict",function(){CKEDITOR.plugins.add("mdn-sticky-toolbar",{init:function(a){function e(){if(g){var b=l.getScrollPosition().y,e=c.getDocumentPosition().y,f=a.container.getClientRect();if(b>e&&f.bottom>q){if(!j){j=true;
+d.setStyles({position:"fixed",top:0})}}else if(j){j=false;d.setStyles({position:"relative"})}}}function b(){f.replace(i);k.replace(h);d.append(i);d.append(h);h.setStyle("border-top",null);d.setStyle("border","1px solid #B6B6B6")}var c,d,i,h,f,k,j=false,g=false,n,q,l=CKEDITOR.document.getWindow();CKEDITOR.document.on("scroll",e);a.on("loaded",function(){i=a.ui.space("top");h=a.ui.space("bottom");c=new CKEDITOR.dom.element("div");d=new CKEDITOR.dom.element("div");f=new CKEDITOR.dom.element("span");
+k=new CKEDITOR.dom.element("span");f.setStyle("display","none");k.setStyle("display","none");c.insertBefore(a.container);c.append(d);b();n=c.getSize("width");q=c.getSize("height");d.setStyle("width",n+"px");c.setStyle("height",q+"px");g=true;setTimeout(function(){e()},500)},null,null,999);a.on("beforeCommandExec",function(a){if(a.data.name=="maximize")if(a.data.command.state==CKEDITOR.TRISTATE_OFF){i.replace(f);h.replace(k);h.removeStyle("border-top");d.removeStyle("border")}else b()})}})}(),"use strict",
+function(){function a(a){return a.mime.toLowerCase()in{"image/png":1,"image/jpeg":1,"image/jpg":1,"image/pjpeg":1,"image/gif":1,"image/bmp":1,"image/x-windows-bmp":1,"image/svg+xml":1}}CKEDITOR.plugins.add("mdn-image-attachment",{requires:"image,mdn-attachment",onLoad:function(){CKEDITOR.on("dialogDefinition",function(a){var b=a.data.definition;if(a.data.name=="image"){a=b.getContents("info");a.add({type:"vbox",children:[{type:"select",id:"attachment",label:gettext("Attachments"),items:[],onChange:function(){var a=
+this.getValue(),b=this.getDialog(),e=mdn.ckeditor.getObjectByUrl(a);b.setValueOf("info","txtUrl",a);!b.getValueOf("info","txtAlt")&&e&&b.setValueOf("info","txtAlt",e.description)}}]});a.elements.unshift(a.elements.pop())}})},init:function(e){e.on("dialogShow",function(b){b=b.data;if(b.getName()=="image"){var c=b.getContentElement("info","attachment");mdn.ckeditor.updateAttachments(c,b.getValueOf("info","txtUrl"),a)}})}})}(),"use strict",CKEDITOR.plugins.add("mdn-link-customization",{requires:"link,mdn-attachment",
+autoCompleteTextbox:null,autoCompleteSelection:null,originalHighlightedText:"",onLoad:function(){var a=this;CKEDITOR.on("dialogDefinition",function(e){var b=e.data.definition;if(e.data.name=="link"){b.removeContents("target");e=b.getContents("info");a.removeProtocolField(e);a.addArticleNameField(e);a.addAttachmentField(e);a.customizeLinkText(b);a.loadSelectedTextIntoAutoCompleteTextbox(b)}})},init:function(a){var e=this;a.on("dialogShow",function(b){b=b.data;if(b.getName()=="link"){var c=b.getContentElement("info",
+"attachment");mdn.ckeditor.updateAttachments(c,b.getValueOf("info","url"));e.originalHighlightedText=a.getSelection().getSelectedText()}})},removeProtocolField:function(a){a.remove("protocol");var e=this,a=a.get("url"),b=a.commit;a.onKeyUp=function(){};a.commit=function(a){b.call(this,a);a.url.protocol=""};a.setup=function(a){var b;if(a.url){b=a.url.url;a.url.protocol&&(b=a.url.protocol+b);this.setValue(b)}else this.setValue(e.getDefaultSlug())}},addArticleNameField:function(a){var e=this;a.add({id:"articleName",
+type:"text",label:gettext("Article Title Lookup / Link Text"),setup:function(){var a=this.getDialog();e.autoCompleteSelection=null;if(!e.autoCompleteTextbox){e.autoCompleteTextbox=this.getElement().getElementsByTag("input").$[0];jQuery(e.autoCompleteTextbox).mozillaAutocomplete({minLength:1,requireValidOption:true,_renderItemAsLink:true,labelField:"label",styleElement:e.autoCompleteTextbox.parentNode,autocompleteUrl:mdn.wiki.autosuggestTitleUrl,onSelect:function(c){e.autoCompleteSelection=c;a.setValueOf("info",
+"url",c.url)},buildRequestData:function(a){a.current_locale=1;return a}})}jQuery(e.autoCompleteTextbox).mozillaAutocomplete("clear")}},"urlOptions")},addAttachmentField:function(a){a.add({id:"attachment",type:"select",label:gettext("Attachments"),items:[],onChange:function(){this.getDialog().setValueOf("info","url",this.getValue())}},"articleName")},getDefaultSlug:function(){var a=jQuery("html").attr("lang"),e="";a&&(e="/"+a+"/docs/");return e},customizeLinkText:function(a){var e=this,b=a.onOk;a.onOk=
+function(){var a=this.getParentEditor(),d=this._.selectedElement;b.call(this);if(!d){var i;if(e.originalHighlightedText)i=e.originalHighlightedText;else if(e.autoCompleteSelection)i=e.autoCompleteSelection.title;else if(e.autoCompleteTextbox.value)i=e.autoCompleteTextbox.value;if(i)if(d=a.elementPath().contains("a")){d.setText(i);i=a.createRange();i.selectNodeContents(d);a.getSelection().selectRanges([i])}}}},loadSelectedTextIntoAutoCompleteTextbox:function(a){var e=this,b=a.onFocus;a.onFocus=function(){var a=
+this.getParentEditor().getSelection(),d=a.getSelectedText().replace("()",""),a=a.getSelectedElement(),i=jQuery(e.autoCompleteTextbox);if(d&&!a){i.val(d);e.autoCompleteTextbox.focus();e.autoCompleteTextbox.select();i.mozillaAutocomplete("deselect");i.mozillaAutocomplete("search",d)}else b.call(this)}}}),"use strict",CKEDITOR.plugins.add("mdn-link-launch",{requires:"link",init:function(a){a.addCommand("launchLink",new CKEDITOR.launchCommand);a.addMenuItems&&a.addMenuItems({launchLink:{label:gettext("Launch"),
+command:"launchLink",group:"link",order:6}});a.contextMenu&&a.contextMenu.addListener(function(e){return!e||e.isReadOnly()||!CKEDITOR.plugins.link.tryRestoreFakeAnchor(a,e)&&!CKEDITOR.plugins.link.getSelectedLink(a)?null:{launchLink:CKEDITOR.TRISTATE_OFF}})}}),CKEDITOR.launchCommand=function(){},CKEDITOR.launchCommand.prototype={exec:function(a){(a=CKEDITOR.plugins.link.getSelectedLink(a))&&a.$&&window.open(a.$.href)}},CKEDITOR.plugins.add("mdn-redirect",{icons:"mdn-redirect",init:function(a){a.addCommand("mdn-redirect",
+new CKEDITOR.dialogCommand("mdn-redirect"));a.ui.addButton("MdnRedirect",{icon:"mdn-redirect",label:gettext("Create a Redirect"),command:"mdn-redirect",toolbar:"links,100"});CKEDITOR.dialog.add("mdn-redirect",this.path+"dialogs/mdn-redirect.js")}}),"use strict",CKEDITOR.plugins.add("mdn-sample-finder",{icons:"mdn-sample-finder-moono",init:function(a){a.addCommand("mdn-sample-finder",new CKEDITOR.dialogCommand("mdn-sample-finder"));var e=gettext("Insert Code Sample iFrame");a.ui.addButton("mdn-sample-finder",
+{icon:"mdn-sample-finder-moono",label:e,toolbar:"blocks,220",command:"mdn-sample-finder"});CKEDITOR.dialog.add("mdn-sample-finder",this.path+"dialogs/mdn-sample-finder.js")}}),CKEDITOR.plugins.add("mdn-sampler",{icons:"mdn-sampler-moono",init:function(a){a.addCommand("mdn-sampler",{exec:function(a){function c(a,b,c){a=e.createElement(a);b&&a.setText(gettext(b));c&&a.setAttributes(c);h.append(a)}var d=prompt(gettext("What should the sample title be?"));if(d){var e=a.document,h=e.createElement("div");
+sampleSlug=$.slugifyString(d);c("h2",d,{name:sampleSlug});c("h3",gettext("HTML Content"));c("pre",gettext("Sample HTML Content"),{"class":"brush: html"});c("h3",gettext("CSS Content"));c("pre",gettext("Sample CSS Content"),{"class":"brush: css"});c("h3",gettext("JavaScript Content"));c("pre",gettext("Sample JavaScript Content"),{"class":"brush: js"});c("p","{{ EmbedLiveSample('"+sampleSlug+"') }}");a.insertHtml(h.getHtml())}}});var e=gettext("Insert Code Sample Template");a.ui.addButton("mdn-sampler",
+{icon:"mdn-sampler-moono",label:e,toolbar:"blocks,210",command:"mdn-sampler"})}}),"use strict",function(){function a(){var a=1,c=document.cookie.replace(/(?:(?:^|.*;\s*)disable_native_spell\s*\=\s*([^;]*).*$)|^.*$/,"$1");typeof c!=void 0&&c=="true"&&(a=2);CKEDITOR.on("instanceReady",function(){e(a)});return a}function e(a){for(var c=CKEDITOR.instances.id_content,d=["checkspell","scaytcheck"],e=0;e<d.length;e++){var h=c.getCommand(d[e]);a==CKEDITOR.TRISTATE_ON?h.disable():a==CKEDITOR.TRISTATE_OFF&&
+h.enable()}c.document.getBody().setAttribute("spellcheck",a!=2);document.cookie="disable_native_spell="+(a==2?true:false)+";expires=Fri, 31 Dec 9999 23:59:59 GMT"}CKEDITOR.plugins.add("mdn-spell",{icons:"mdn-spell",init:function(b){var c=b.lang;b.addCommand("mdn-spell",{exec:function(){var a;a=this.state==1?2:1;e(a);this.toggleState()},state:a(),canUndo:false});b.ui.addButton("MdnSpell",{label:c.native_spell_check,command:"mdn-spell",icon:"mdn-spell"})}})}(),"use strict",CKEDITOR.config.mdnSyntaxhighlighter_brushes=
+[{name:"Bash",brush:"bash"},{name:"C/C++",brush:"cpp"},{name:"CSS",brush:"css"},{name:"HTML",brush:"html"},{name:"Java",brush:"java"},{name:"JavaScript",brush:"js"},{name:"JSON",brush:"json"},{name:"PHP",brush:"php"},{name:"Python",brush:"python"},{name:"SQL",brush:"sql"},{name:"XML",brush:"xml"}],CKEDITOR.plugins.add("mdn-syntaxhighlighter",{requires:"menubutton,mdn-format",icons:"mdn-syntaxhighlighter-moono",init:function(a){var e=this,b=a.config.mdnSyntaxhighlighter_brushes,c=gettext("Syntax Highlighter"),
+d={};d.none={label:gettext("No Highlight"),group:"mdn-syntaxhighlighter",order:0,onClick:function(){a.execCommand("mdn-syntaxhighlighter","none")}};b.forEach(function(b,c){d[b.brush]={label:b.name,brushId:b.brush,group:"mdn-syntaxhighlighter",order:c+1,onClick:function(){a.execCommand("mdn-syntaxhighlighter",this.brushId)}}});a.addMenuGroup("mdn-syntaxhighlighter",1);a.addMenuItems(d);a.addCommand("mdn-syntaxhighlighter",{contextSensitive:true,exec:function(a,b){var c=d[b],e=a.elementPath().contains("pre");
+if(c){if(!e){a.execCommand("mdn-format-pre");e=a.elementPath().contains("pre");if(!e)return}e.$.className=b=="none"?"":"brush: "+b;this.refresh(a,a.elementPath())}},refresh:function(a,b){this.setState(e.getBrushId(b)!="none"?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF)}});a.ui.add("MdnSyntaxhighlighter",CKEDITOR.UI_MENUBUTTON,{icon:"mdn-syntaxhighlighter-moono",label:c,toolbar:"blocks,200",command:"mdn-syntaxhighlighter",onMenu:function(){var b={},c=e.getBrushId(a.elementPath()),f;for(f in d)b[f]=
+c==f?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF;return b}})},getBrushId:function(a){var e=a.contains("pre");if(!e)return"none";a="none";if(e=e.$.className){e=e.match(/brush\:(.*?);?$/);if(e!=null){a=e[1].split(";");a=a[0].replace(/^\s+|\s+$/g,"")}}return a}}),"use strict",CKEDITOR.plugins.add("mdn-system-integration",{icons:"mdn-preview,mdn-save-edit-moono,mdn-save",init:function(a){var e=CKEDITOR.document.findOne(".page-buttons"),b=e.findOne(".btn-save-and-edit"),c=e.findOne(".btn-save"),d=e.findOne(".btn-preview");
+if(!c||!d)throw Error("[CKEDITOR plugin:mdn-system-integration] Page buttons have not been found");b&&a.addCommand("mdn-save-edit",{modes:{wysiwyg:1,source:1},exec:function(a){a.updateElement();b.$.click()}});a.addCommand("mdn-save",{modes:{wysiwyg:1,source:1},exec:function(a){a.updateElement();c.$.click()}});a.addCommand("mdn-preview",{exec:function(a){a.updateElement();d.$.click()}});b&&a.ui.addButton("MdnSaveEdit",{icon:"mdn-save-edit-moono",label:b.getText(),command:"mdn-save-edit",toolbar:"document,100"});
+a.ui.addButton("MdnSave",{icon:"mdn-save",label:c.getText(),command:"mdn-save",toolbar:"document,110"});a.ui.addButton("MdnPreview",{icon:"mdn-preview",label:d.getText(),command:"mdn-preview",toolbar:"document,130"})}}),"use strict",CKEDITOR.plugins.add("mdn-table-customization",{requires:"table",onLoad:function(){CKEDITOR.on("dialogDefinition",function(a){var e=a.data.name,a=a.data.definition;if(!(e!="table"&&e!="tableProperties")){e=a.getContents("info");e.remove("txtWidth");e.remove("txtHeight");
+e.remove("txtCellSpace");e.remove("txtCellPad");e.remove("txtBorder");a.getContents("advanced").get("advCSSClasses")["default"]="standard-table"}})}}),"use strict",CKEDITOR.plugins.add("mdn-toggle-block",{init:function(a){a.addCommand("mdn-toggle-block",{exec:function(a){var b;if(a.getCommand("numberedlist").state==CKEDITOR.TRISTATE_ON)b="bulletedlist";else if(a.getCommand("bulletedlist").state==CKEDITOR.TRISTATE_ON){a:{b=a.elementPath();b=(new CKEDITOR.dom.elementPath(b.contains("li"),b.blockLimit)).elements;
+for(var c=0,d=0;d<b.length;++d){b[d].is({ul:1,ol:1})&&c++;if(c>1){b=true;break a}}b=false}b=b?"numberedlist":"bulletedlist"}else b="numberedlist";a.execCommand(b)}})}}),"use strict",function(){function a(a,b,e){if(!b.is||!b.getCustomData("block_processed")){b.is&&CKEDITOR.dom.element.setMarker(e,b,"block_processed",true);a.push(b)}}var e=function(){var a=CKEDITOR.tools.extend({},CKEDITOR.dtd.$blockLimit);delete a.div;delete a.td;delete a.th;return a}(),b=CKEDITOR.dtd.div;CKEDITOR.plugins.add("mdn-wrapstyle",
+{onLoad:function(){CKEDITOR.style.addCustomHandler({type:"wrap",assignedTo:CKEDITOR.STYLE_BLOCK,setup:function(a){this.element=a.element},apply:function(a){a.execCommand("wrapstyle",this)},remove:function(a){a.execCommand("wrapstyle",this)},checkElementRemovable:function(a,b){return(a=a&&a.getAscendant(this.element,true))?CKEDITOR.style.prototype.checkElementRemovable.call(this,a,b):false}})},init:function(c){c.addCommand("wrapstyle",{exec:function(c,i){for(var h=c.getSelection(),f=h&&h.createBookmarks(),
+k=h&&h.getRanges(),j=k&&k.createIterator(),g,n,q=true,k=[];g=j.getNextRange();){n=g.createIterator();for(n.enforceRealBlocks=true;g=n.getNextParagraph();)if((g=g.getAscendant(i.element,true))&&i.checkElementRemovable(g)){var l=k.pop(),o=l&&l.getCommonAncestor(g);if(o&&i.checkElementRemovable(o))k.push(o);else{l&&k.push(l);k.push(g)}}else k.length==0&&(q=false)}if(q){j=0;for(q=k.length;j<q;j++)k[j].remove(true)}else{k=[];g={};n=[];for(var r,j=c.document.getSelection(),l=j.getRanges(),q=j.createBookmarks(),
+m,o=0;o<l.length;o++)for(m=l[o].createIterator();r=m.getNextParagraph();)if(r.getName()in e){var p=r.getChildren();for(r=0;r<p.count();r++)a(n,p.getItem(r),g)}else{for(;!b[r.getName()]&&r.getName()!="body";)r=r.getParent();a(n,r,g)}CKEDITOR.dom.element.clearAllMarkers(g);l=[];o=null;for(m=0;m<n.length;m++){r=n[m];for(var p=(new CKEDITOR.dom.elementPath(r)).elements,t=void 0,w=0;w<p.length;w++)if(p[w].getName()in e){t=p[w];break}p=t;if(!p.equals(o)){o=p;l.push([])}l[l.length-1].push(r)}for(o=0;o<l.length;o++){p=
+l[o][0];n=p.getParent();for(r=1;r<l[o].length;r++)n=n.getCommonAncestor(l[o][r]);m=new CKEDITOR.dom.element("div",c.document);for(r=0;r<l[o].length;r++){for(p=l[o][r];!p.getParent().equals(n);)p=p.getParent();l[o][r]=p}for(r=0;r<l[o].length;r++){p=l[o][r];if(!p.getCustomData||!p.getCustomData("block_processed")){p.is&&CKEDITOR.dom.element.setMarker(g,p,"block_processed",true);r||m.insertBefore(p);m.append(p)}}CKEDITOR.dom.element.clearAllMarkers(g);k.push(m)}j.selectBookmarks(q);j=0;for(q=k.length;j<
+q;j++){g=k[j];i.applyToObject(g)}}f&&h.selectBookmarks(f)}})}})}(),"use strict",function(){CKEDITOR.plugins.add("mdn-youtube",{init:function(a){a.lang["mdn-youtube"]={button:gettext("Embed YouTube Video"),title:gettext("Locate a YouTube Video"),txtUrl:gettext("Paste YouTube Video URL"),txtAspect:gettext("Aspect ratio"),noCode:gettext("You must input a valid YouTube video URL."),invalidUrl:gettext("The URL you've entered doesn't appear to be valid"),defaultStr:gettext("Default")};a.addCommand("mdn-youtube",
+new CKEDITOR.dialogCommand("mdn-youtube"));a.ui.addButton("mdn-youtube",{icon:"youtube-moono",label:a.lang["mdn-youtube"].button,command:"mdn-youtube",toolbar:"insert"});CKEDITOR.dialog.add("mdn-youtube",function(){return{title:a.lang["mdn-youtube"].title,width:500,height:120,resizable:CKEDITOR.DIALOG_RESIZE_NONE,contents:[{id:"youtubePlugin",expand:true,elements:[{type:"hbox",widths:["70%","30%"],children:[{id:"txtUrl",type:"text",label:a.lang["mdn-youtube"].txtUrl,validate:function(){if(this.getValue()){if(!/https?\:\/\//.test(this.getValue())){alert(a.lang["mdn-youtube"].invalidUrl);
+return false}}else{alert(a.lang["mdn-youtube"].noCode);return false}}},{type:"select",id:"txtAspect",label:a.lang["mdn-youtube"].txtAspect,items:[["Default"],["4:3"],["16:9"]],"default":"Default"}]}]}],onOk:function(){var a="",b=this.getValueOf("youtubePlugin","txtUrl"),c=this.getValueOf("youtubePlugin","txtAspect")=="4:3"?', "4:3"':"",b=b.split("?");(b=b.length&&b[1]?jQuery.parseQuerystring(b[1]).v:"")&&(a='{{EmbedYouTube("'+b+'"'+c+")}}");this.getParentEditor().insertHtml(a)}}})}})}(),"use strict",
+function(){function a(a){var b=a.startContainer.getAscendant(k,true);b&&a.setStartAt(b,CKEDITOR.POSITION_AFTER_START);(b=a.endContainer.getAscendant(k,true))&&a.setEndAt(b,CKEDITOR.POSITION_BEFORE_END)}function e(a){var b=a.getParent();if(a.is(j))return b;if(b&&b.is(j))return b.getParent()}function b(a){var b=a.getCommand("enter");if(b){b.on("exec",function(b){if(h(a)){var c=a.getSelection().getRanges()[0];if(c.collapsed&&c.checkEndOfBlock()&&c.checkStartOfBlock()){a.execCommand("descriptionList");
+b.cancel()}}});a.on("beforeCommandExec",function(b){if(b.data.name=="enter"&&h(a)){var c=a.getSelection().getRanges()[0];if(c.collapsed&&c.checkEndOfBlock()&&!c.checkStartOfBlock())b.data.toggleDescriptionListBlock=true}});a.on("afterCommandExec",function(b){b.data.name=="enter"&&b.data.toggleDescriptionListBlock&&a.execCommand("descriptionTerm")})}}function c(a){var b=CKEDITOR.dom.walker.ignored(true),c=new CKEDITOR.dom.range(a.getDocument());c.selectNodeContents(a);a=new CKEDITOR.dom.walker(c);
+a.evaluator=function(a){return a.type==CKEDITOR.NODE_ELEMENT?a.is(CKEDITOR.dtd.$empty):b(a)};return!a.next()}function d(a){return function(b){return b.type==CKEDITOR.NODE_ELEMENT&&b.is(a)}}function i(a){return a.type==CKEDITOR.NODE_ELEMENT&&a.is(k)}function h(a){a=a.elementPath();return a.block&&a.block.is(k)}function f(a){var b={dl:1};b[a]=1;return function(c,d){var e=d.contains(b,1);e?this.setState(e.is(a)?CKEDITOR.TRISTATE_ON:CKEDITOR.TRISTATE_OFF):this.setState(CKEDITOR.TRISTATE_DISABLED)}}var k=
+{dt:1,dd:1},j={li:1,dt:1,dd:1};CKEDITOR.plugins.add("descriptionlist",{lang:"en",init:function(a){if(!a.blockless){var c=a.lang.descriptionlist,d=CKEDITOR.plugins.descriptionList;a.addCommand("descriptionList",{allowedContent:"dl dt dd",contextSensitive:true,exec:function(a){var b=a.getSelection(),c=b.getRanges()[0];this.state==CKEDITOR.TRISTATE_OFF?d.createListFromRange(a,c):d.removeListFromRange(a,c);b.selectRanges([c])},refresh:function(a,b){this.setState(b.contains("dl",1)?CKEDITOR.TRISTATE_ON:
+CKEDITOR.TRISTATE_OFF)}});a.addCommand("descriptionTerm",{contextSensitive:true,exec:function(a){var b=a.getSelection(),c=b.getRanges()[0];d.toggleListElementsTo(a,c,this.state==CKEDITOR.TRISTATE_OFF?"dt":"dd");b.selectRanges([c])},refresh:f("dt")});a.addCommand("descriptionValue",{contextSensitive:true,exec:function(a){var b=a.getSelection(),c=b.getRanges()[0];d.toggleListElementsTo(a,c,this.state==CKEDITOR.TRISTATE_OFF?"dd":"dt");b.selectRanges([c])},refresh:f("dd")});a.ui.addButton&&a.ui.addButton("DescriptionList",
+{label:c.descriptionList,command:"descriptionList",toolbar:"list,100"});a.ui.addButton&&a.ui.addButton("DescriptionTerm",{label:c.descriptionTerm,command:"descriptionTerm",toolbar:"list,110"});a.ui.addButton&&a.ui.addButton("descriptionValue",{label:c.descriptionValue,command:"descriptionValue",toolbar:"list,120"});b(a)}}});CKEDITOR.plugins.descriptionList={createListFromRange:function(a,b){var d=b.createBookmark(),f=b.createIterator(),h=[],j=[],t=true,w,u,x;if(u=(u=b.startPath().block.getPrevious(g))&&
+n(u)?u:null)t=(x=u.getLast(i))?x.is("dd"):false;for(;x=f.getNextParagraph();)h.push(x);u||(u=this.createListContainer(a,h[0]));h.length>1&&(w=h[h.length-1].getParent());f=u;x=0;for(var v=t,s;x<h.length;++x){s=h[x];(t=e(s))&&j.push(t);t=f;if(s.is(k)){s.appendTo(t);v=s.is("dd")}else{var y=s.getDocument().createElement(v?"dt":"dd");s.moveChildren(y);y.appendTo(t);s.remove();v=!v}}for(;h=j.shift();)h.getParent()&&c(h)&&h.remove();w&&(w.is("li")&&c(w))&&w.remove();j=u;if((w=j.getNext(g))&&n(w)){j.moveChildren(w,
+true);j.remove()}b.moveToBookmark(d)},removeListFromRange:function(b,d){function e(){h.is(k)?h.renameNode("p"):x.push(h.getAscendant(k));h.insertBefore(j)}var f=d.createBookmark(),g=d.createIterator(),h,i=[];for(a(d);h=g.getNextParagraph();)h.getAscendant(k,true)&&i.push(h);h=i.shift();var j=h.getAscendant("dl"),n=b.createRange(),g=[j],x=[],v;n.moveToPosition(h.getAscendant(k,true),CKEDITOR.POSITION_BEFORE_START);j=n.splitElement(j);g.push(j);for(e();h=i.shift();){v=h.getAscendant("dl");if(!v.equals(j)){g.push(v);
+n.moveToPosition(h.getAscendant(k,true),CKEDITOR.POSITION_BEFORE_START);j=n.splitElement(v);g.push(j)}e()}for(;i=x.pop();)i.remove();for(;v=g.pop();)v.getParent&&c(v)&&v.remove();d.moveToBookmark(f)},createListContainer:function(a,b){var f=a.document.createElement("dl"),g=b.getParent(),h=e(b),i;if(h){i=a.createRange();i.moveToPosition(b,CKEDITOR.POSITION_BEFORE_START);i=i.splitElement(h)}f.insertBefore(h?i:b);b.remove();h&&(c(h)?h.remove():!b.is("li")&&c(g)&&g.remove());if(i)if(c(i))i.remove();else if(!b.is("li"))(g=
+i.getFirst(d("li")))&&c(g)&&g.remove();return f},toggleListElementsTo:function(a,b,c){var e=b.createBookmark(),f=a.createRange(),a=d(c=="dt"?"dd":"dt"),g=[],h;f.setStartAt(b.startPath().contains(k),CKEDITOR.POSITION_BEFORE_START);f.setEndAt(b.endPath().contains(k),CKEDITOR.POSITION_AFTER_START);for(f=new CKEDITOR.dom.walker(f);h=f.next();)a(h)&&g.push(h);for(;h=g.pop();)h.renameNode(c);b.moveToBookmark(e)}};var g=CKEDITOR.dom.walker.ignored(true),n=d("dl")}(),CKEDITOR.plugins.add("tablesort",{init:function(a){var e=
+a.lang.tablesort;a.addCommand("tablesort",new CKEDITOR.dialogCommand("tablesort"));CKEDITOR.dialog.add("tablesort",this.path+"dialogs/sort.js");a.addMenuItems&&a.addMenuItems({tablesort:{label:e.menu,command:"tablesort",group:"table",order:2}});a.contextMenu&&a.contextMenu.addListener(function(a){return!a||a.isReadOnly()?null:a.is("table")||a.hasAscendant("table")?{tablesort:CKEDITOR.TRISTATE_OFF}:null})}}),"use strict",CKEDITOR.plugins.add("texzilla",{init:function(a){CKEDITOR.dialog.add("texzilla",
+this.path+"dialogs/texzilla.js");a.addCommand("texzilla",new CKEDITOR.dialogCommand("texzilla"));a.ui.addButton("texzilla",{label:"Insert MathML based on (La)TeX",command:"texzilla",toolbar:"insert"})}}),CKEDITOR.config.plugins="dialogui,dialog,a11yhelp,autogrow,basicstyles,bidi,blockquote,clipboard,panel,floatpanel,menu,contextmenu,dialogadvtab,elementspath,enterkey,entities,find,htmlwriter,image,indent,indentlist,button,menubutton,language,fakeobjects,link,list,liststyle,magicline,maximize,pastefromword,pastetext,removeformat,resize,scayt,sharedspace,showblocks,showborders,sourcearea,listblock,richcombo,stylescombo,tab,table,tabletools,toolbar,undo,wsc,wysiwygarea,mdn-attachment,mdn-format,mdn-sticky-toolbar,mdn-image-attachment,mdn-link-customization,mdn-link-launch,mdn-redirect,mdn-sample-finder,mdn-sampler,mdn-spell,mdn-syntaxhighlighter,mdn-system-integration,mdn-table-customization,mdn-toggle-block,mdn-wrapstyle,mdn-youtube,descriptionlist,tablesort,texzilla",
+CKEDITOR.config.skin="moono",function(){var a=function(a,b){for(var c=CKEDITOR.getUrl("plugins/"+b),a=a.split(","),d=0;d<a.length;d++)CKEDITOR.skin.icons[a[d]]={path:c,offset:-a[++d],bgsize:a[++d]}};CKEDITOR.env.hidpi?a("bold,0,,italic,24,,strike,48,,subscript,72,,superscript,96,,underline,120,,bidiltr,144,,bidirtl,168,,blockquote,192,,copy-rtl,216,,copy,240,,cut-rtl,264,,cut,288,,paste-rtl,312,,paste,336,,descriptionlist,360,,descriptionterm,384,,descriptionvalue,408,,find-rtl,432,,find,456,,replace,480,,image,504,,indent-rtl,528,,indent,552,,outdent-rtl,576,,outdent,600,,language,624,,anchor-rtl,648,,anchor,672,,link,696,,unlink,720,,bulletedlist-rtl,744,,bulletedlist,768,,numberedlist-rtl,792,,numberedlist,816,,maximize,840,,mdn-format-code,1728,auto,mdn-format-h1,1776,auto,mdn-format-h2,1824,auto,mdn-format-h3,1872,auto,mdn-format-h4,1920,auto,mdn-format-h5,1968,auto,mdn-format-pre,2016,auto,mdn-redirect,2064,auto,mdn-sample-finder-moono,2112,auto,mdn-sample-finder,2160,auto,mdn-sampler-moono,2208,auto,mdn-sampler,2256,auto,mdn-spell,2304,auto,mdn-syntaxhighlighter-moono,2352,auto,mdn-syntaxhighlighter,2400,auto,mdn-preview,2448,auto,mdn-save-edit-moono,2496,auto,mdn-save-edit,2544,auto,mdn-save,2592,auto,youtube-moono,2640,auto,youtube,2688,auto,pastefromword-rtl,1368,,pastefromword,1392,,pastetext-rtl,1416,,pastetext,1440,,removeformat,1464,,scayt,1488,,showblocks-rtl,1512,,showblocks,1536,,source-rtl,1560,,source,1584,,table,1608,,texzilla,3264,auto,redo-rtl,1656,,redo,1680,,undo-rtl,1704,,undo,1728,,spellchecker,1752,",
+"icons_hidpi.png"):a("bold,0,auto,italic,24,auto,strike,48,auto,subscript,72,auto,superscript,96,auto,underline,120,auto,bidiltr,144,auto,bidirtl,168,auto,blockquote,192,auto,copy-rtl,216,auto,copy,240,auto,cut-rtl,264,auto,cut,288,auto,paste-rtl,312,auto,paste,336,auto,descriptionlist,360,auto,descriptionterm,384,auto,descriptionvalue,408,auto,find-rtl,432,auto,find,456,auto,replace,480,auto,image,504,auto,indent-rtl,528,auto,indent,552,auto,outdent-rtl,576,auto,outdent,600,auto,language,624,auto,anchor-rtl,648,auto,anchor,672,auto,link,696,auto,unlink,720,auto,bulletedlist-rtl,744,auto,bulletedlist,768,auto,numberedlist-rtl,792,auto,numberedlist,816,auto,maximize,840,auto,mdn-format-code,864,auto,mdn-format-h1,888,auto,mdn-format-h2,912,auto,mdn-format-h3,936,auto,mdn-format-h4,960,auto,mdn-format-h5,984,auto,mdn-format-pre,1008,auto,mdn-redirect,1032,auto,mdn-sample-finder-moono,1056,auto,mdn-sample-finder,1080,auto,mdn-sampler-moono,1104,auto,mdn-sampler,1128,auto,mdn-spell,1152,auto,mdn-syntaxhighlighter-moono,1176,auto,mdn-syntaxhighlighter,1200,auto,mdn-preview,1224,auto,mdn-save-edit-moono,1248,auto,mdn-save-edit,1272,auto,mdn-save,1296,auto,youtube-moono,1320,auto,youtube,1344,auto,pastefromword-rtl,1368,auto,pastefromword,1392,auto,pastetext-rtl,1416,auto,pastetext,1440,auto,removeformat,1464,auto,scayt,1488,auto,showblocks-rtl,1512,auto,showblocks,1536,auto,source-rtl,1560,auto,source,1584,auto,table,1608,auto,texzilla,1632,auto,redo-rtl,1656,auto,redo,1680,auto,undo-rtl,1704,auto,undo,1728,auto,spellchecker,1752,auto",
+"icons.png")}()})();
\ No newline at end of file
@@ -0,0 +1,3 @@
+﻿CKEDITOR.dialog.add("mdn-redirect",function(){var c=gettext("MDN Redirect"),f=mdn.wiki.autosuggestTitleUrl,b,d;return{title:c,minWidth:350,minHeight:230,contents:[{id:"info",label:c,title:c,elements:[{id:"autoselect",type:"text",label:gettext("Document"),"default":"",setup:function(){if(!b){var a=this;b=this.getElement().getElementsByTag("input").$[0];d=jQuery(b);d.mozillaAutocomplete({minLength:1,requireValidOption:!0,_renderItemAsLink:!0,styleElement:b.parentNode,autocompleteUrl:f,onSelect:function(e){e.url&&
+a.getDialog().getContentElement("info","url").setValue(e.url)},buildRequestData:function(a){a.current_locale=1;return a}})}jQuery(b).mozillaAutocomplete("clear")},commit:function(a){a.type=this.getValue()}},{id:"url",type:"text",label:gettext("URL"),"default":""}]}],onShow:function(){this.setupContent()},onOk:function(a){var b=a.sender.getParentEditor(),c=a.sender.getContentElement("info","autoselect").getValue(),a=a.sender.getContentElement("info","url").getValue(),d=mdn.ckeditor.redirectPattern;
+b&&c&&a&&b.setData(d.replace("%(href)s",a).replace("%(title)s",c))},onFocus:function(){var a=this.getContentElement("info","autoselect");a&&a.focus()}}});
\ No newline at end of file
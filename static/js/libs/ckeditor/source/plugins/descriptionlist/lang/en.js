@@ -0,0 +1,5 @@
+CKEDITOR.plugins.setLang( 'descriptionlist', 'en', {
+	descriptionList: 'Description List',
+	descriptionTerm: 'Description Term',
+	descriptionValue: 'Description Value'
+} );
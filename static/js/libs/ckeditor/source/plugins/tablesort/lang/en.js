@@ -0,0 +1,17 @@
+CKEDITOR.plugins.setLang( 'tablesort', 'en',
+{
+	'alphanumeric' : 'Alphanumeric',
+	'asc' : 'Ascending',
+	'body' : 'Sort the BODY of the table',
+	'by' : 'Sort by',
+	'column' : 'Column',
+	'date' : 'Date',
+	'desc' : 'Descending',
+	'foot' : 'Sort the FOOT of the table',
+	'head' : 'Sort the HEAD of the table',
+	'menu' : 'Sort Table',
+	'numeric' : 'Numeric',
+	'order' : 'Sort order',
+	'title' : 'Sort Table',
+	'type' : 'Sort type'
+});
\ No newline at end of file
@@ -0,0 +1,88 @@
+
+
+(function (globals) {
+
+  var django = globals.django || (globals.django = {});
+
+  
+  django.pluralidx = function (count) { return (count == 1) ? 0 : 1; };
+  
+
+  
+  /* gettext identity library */
+
+  django.gettext = function (msgid) { return msgid; };
+  django.ngettext = function (singular, plural, count) { return (count == 1) ? singular : plural; };
+  django.gettext_noop = function (msgid) { return msgid; };
+  django.pgettext = function (context, msgid) { return msgid; };
+  django.npgettext = function (context, singular, plural, count) { return (count == 1) ? singular : plural; };
+  
+
+  django.interpolate = function (fmt, obj, named) {
+    if (named) {
+      return fmt.replace(/%\(\w+\)s/g, function(match){return String(obj[match.slice(2,-2)])});
+    } else {
+      return fmt.replace(/%s/g, function(match){return String(obj.shift())});
+    }
+  };
+
+
+  /* formatting library */
+
+  django.formats = {
+    "DATETIME_FORMAT": "Y\u5e74n\u6708j\u65e5 H:i", 
+    "DATETIME_INPUT_FORMATS": [
+      "%Y/%m/%d %H:%M", 
+      "%Y-%m-%d %H:%M", 
+      "%Y\u5e74%n\u6708%j\u65e5 %H:%M", 
+      "%Y/%m/%d %H:%M:%S", 
+      "%Y-%m-%d %H:%M:%S", 
+      "%Y\u5e74%n\u6708%j\u65e5 %H:%M:%S", 
+      "%Y/%m/%d %H:%M:%S.%f", 
+      "%Y-%m-%d %H:%M:%S.%f", 
+      "%Y\u5e74%n\u6708%j\u65e5 %H:%n:%S.%f", 
+      "%Y-%m-%d"
+    ], 
+    "DATE_FORMAT": "Y\u5e74n\u6708j\u65e5", 
+    "DATE_INPUT_FORMATS": [
+      "%Y/%m/%d", 
+      "%Y-%m-%d", 
+      "%Y\u5e74%n\u6708%j\u65e5"
+    ], 
+    "DECIMAL_SEPARATOR": ".", 
+    "FIRST_DAY_OF_WEEK": "1", 
+    "MONTH_DAY_FORMAT": "m\u6708j\u65e5", 
+    "NUMBER_GROUPING": "4", 
+    "SHORT_DATETIME_FORMAT": "Y\u5e74n\u6708j\u65e5 H:i", 
+    "SHORT_DATE_FORMAT": "Y\u5e74n\u6708j\u65e5", 
+    "THOUSAND_SEPARATOR": "", 
+    "TIME_FORMAT": "H:i", 
+    "TIME_INPUT_FORMATS": [
+      "%H:%M", 
+      "%H:%M:%S", 
+      "%H:%M:%S.%f"
+    ], 
+    "YEAR_MONTH_FORMAT": "Y\u5e74n\u6708"
+  };
+
+  django.get_format = function (format_type) {
+    var value = django.formats[format_type];
+    if (typeof(value) == 'undefined') {
+      return format_type;
+    } else {
+      return value;
+    }
+  };
+
+  /* add to global namespace */
+  globals.pluralidx = django.pluralidx;
+  globals.gettext = django.gettext;
+  globals.ngettext = django.ngettext;
+  globals.gettext_noop = django.gettext_noop;
+  globals.pgettext = django.pgettext;
+  globals.npgettext = django.npgettext;
+  globals.interpolate = django.interpolate;
+  globals.get_format = django.get_format;
+
+}(this));
+